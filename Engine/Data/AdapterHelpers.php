@@ -54,4 +54,30 @@ abstract class BaseAdapter implements LanguageAdapter
         return "// !!! THIS FILE IS AUTO-GENERATED BY {$generatorName}, DO NOT EDIT !!!\n" .
             "// Generated from: {$jsonBasename}\n\n";
     }
+
+    /**
+     * Returns a 64-bit FNV-1a hash of the wire layout (event ids, names and
+     * member types) as a hex string. Formatting changes to the JSON do not
+     * change it; adding, removing or retyping a field does. Used by the IPC
+     * handshake to check that client and engine were generated from the
+     * same structs.json.
+     */
+    protected function getSchemaHash(): string
+    {
+        $structs = $this->allStructs;
+        usort($structs, fn($a, $b) => $a["eventId"] <=> $b["eventId"]);
+
+        $lines = [];
+        foreach ($structs as $struct) {
+            $line = $struct["eventId"] . " " . $struct["enumName"];
+            foreach ($struct["members"] as $member) {
+                $line .= " " . $member["type"];
+                if (isset($member["count"])) {
+                    $line .= "*" . $member["count"];
+                }
+            }
+            $lines[] = $line;
+        }
+        return hash("fnv1a64", implode("\n", $lines));
+    }
 }
@@ -274,9 +274,8 @@ class PhpAdapter extends BaseAdapter
                             }
                         }
 
-                        $count = $repeater === "" || !ctype_digit($repeater)
-                                    ? 1
-                                    : (int) $repeater;
+                        // The pattern above leaves only digits (or nothing) here
+                        $count = $repeater === "" ? 1 : (int) $repeater;
                         $size = $sizeMap[$code] ?? 0;
                         if ($size === 0 && $code !== "@") {
                             error_log(
@@ -43,6 +43,84 @@ class PythonAdapter extends BaseAdapter
         "char" => 1,
     ];
 
+    /**
+     * Maps C-style types to little-endian NumPy dtype codes.
+     */
+    private const DTYPE_MAP = [
+        "i64" => "<i8",
+        "u64" => "<u8",
+        "i32" => "<i4",
+        "u32" => "<u4",
+        "i16" => "<i2",
+        "u16" => "<u2",
+        "i8" => "i1",
+        "u8" => "u1",
+        "f32" => "<f4",
+        "f64" => "<f8",
+    ];
+
+    /**
+     * Python struct format of the per-event header (type + timestamp + 4 bytes
+     * padding, so the payload starts 8-byte aligned).
+     */
+    private const HEADER_FORMAT = "<IQ4x";
+
+    /**
+     * Python struct format of a stream's event count (u32 + 4 bytes padding,
+     * so the first event starts 8-byte aligned).
+     */
+    private const COUNT_FORMAT = "<I4x";
+
+    /**
+     * Byte size of the per-event header.
+     */
+    private const HEADER_SIZE = 16;
+
+    /**
+     * Every event (and every string tail) is padded to this many bytes, so
+     * the engine can read each struct straight out of the buffer.
+     */
+    private const EVENT_ALIGNMENT = 8;
+
+    /**
+     * Variable-length tails of dynamic events, in wire order.
+     * Each entry is [argument name, length member]; the length member is
+     * filled in from len() of the argument, or null if the struct has none.
+     */
+    private const DYNAMIC_TAILS = [
+        "SPRITE_TEXTURE_LOAD" => [["filename", "filenameLength"]],
+        "GEOM_ADD_PACKED" => [["data", null]],
+        "TEXT_ADD" => [["fontPath", "fontPathLength"], ["text", "textLength"]],
+        "TEXT_SET_STRING" => [["text", "textLength"]],
+        "AUDIO_LOAD" => [["path", "pathLength"]],
+        "PLUGIN_LOAD" => [["path", "pathLength"]],
+        "EVENT_BATCH" => [["payloads", null]],
+    ];
+
+    /**
+     * Idempotent "set" events that CommandPacker can coalesce per
+     * (id1, id2) when built with coalesce=True.
+     * Keep in sync with CommandPacker._COALESCE_EVENTS.
+     */
+    private const COALESCE_EVENTS = [
+        "SPRITE_MOVE",
+        "SPRITE_SCALE",
+        "SPRITE_RESIZE",
+        "SPRITE_ROTATE",
+        "SPRITE_COLOR",
+        "SPRITE_SPEED",
+        "SPRITE_TEXTURE_SET",
+        "SPRITE_SET_SOURCE_RECT",
+        "SPRITE_MOVE_F32",
+        "SPRITE_SCALE_F32",
+        "SPRITE_ROTATE_F32",
+        "SPRITE_SPEED_F32",
+        "GEOM_SET_COLOR",
+        "PHYSICS_SET_VELOCITY",
+        "PHYSICS_SET_POSITION",
+        "PHYSICS_SET_ROTATION",
+    ];
+
     /**
      * Main generation method.
      */
@@ -56,10 +134,15 @@ class PythonAdapter extends BaseAdapter
             "\"\"\"\n\n";
         $output .= "import enum\n";
         $output .= "import random\n"; // --- NEW --- Added random for Id_Generate
+        $output .= "import re\n";
         $output .= "import struct\n";
         $output .= "import sys\n";
         $output .=
-            "from typing import Any, Callable, Dict, List, Optional, Tuple, Union\n\n"; // --- MODIFIED --- Added Any, Callable, random
+            "from typing import Any, Callable, Collection, Dict, Iterator, List, Optional, Tuple, Union\n\n"; // --- MODIFIED --- Added Any, Callable, random
+        $output .= "try:\n";
+        $output .= "    import numpy as np\n";
+        $output .= "except ImportError:\n";
+        $output .= "    np = None  # Optional: only the bulk (add_many) path uses it\n\n";
 
         // --- 1. Generate Events Enum ---
         $output .= "# --- Events Enum ---\n";
@@ -73,6 +156,9 @@ class PythonAdapter extends BaseAdapter
             $output .= "    {$name} = {$id}\n";
             $lastCategory = $category;
         }
+        $output .= "\n\n# Hash of the wire layout in structs.json, compared with the engine's\n";
+        $output .= "# during the IPC handshake\n";
+        $output .= "SCHEMA_HASH = 0x" . $this->getSchemaHash() . "\n";
         $output .= "# --- End Events Enum ---\n\n";
 
         // --- 2. Generate Pack Format Classes (with pre-computed formats) ---
@@ -115,21 +201,34 @@ class PythonAdapter extends BaseAdapter
         }
         $output .= "    }\n\n";
 
+        $output .=
+            "    # Pre-compiled structs, so the hot path never re-parses a format string\n";
+        $output .= $this->generateStructMaps_PYTHON();
+
         $output .=
             "    # This map holds the pre-computed keys for each event\n";
         $output .= $this->generateKeyMap_PYTHON(); //
 
         $output .= $this->getPackFormatStaticMethods_PYTHON();
+        $output .= $this->getEventViewClass_PYTHON();
+        $output .= $this->getEventRecordClass_PYTHON();
+        $output .= $this->generateEventRecordClasses_PYTHON();
         $output .= "# --- End PackFormat Class ---\n\n";
 
         $output .= "# --- CommandPacker Class ---\n";
         $output .= $this->getCommandPackerClass_PYTHON();
+        $output .= "\n\n    # --- Typed Pack Methods ---\n";
+        $output .= $this->generateTypedPackMethods_PYTHON();
         $output .= "# --- End CommandPacker Class ---\n\n";
 
         $output .= $this->getHelperFunctions_PYTHON(); // --- NEW ---
 
         file_put_contents($outputFile, $output);
         echo "Successfully generated {$outputFile}\n";
+
+        $dtypesFile = __DIR__ . "/../out/python/phrost_dtypes.py";
+        file_put_contents($dtypesFile, $this->generateDtypesModule_PYTHON());
+        echo "Successfully generated {$dtypesFile}\n";
     }
 
     /**
@@ -265,6 +364,349 @@ class PythonAdapter extends BaseAdapter
         return $totalSize;
     }
 
+    /**
+     * Rounds a byte size up to the next multiple of EVENT_ALIGNMENT.
+     */
+    private function alignSize(int $size): int
+    {
+        $alignment = self::EVENT_ALIGNMENT;
+        return intdiv($size + $alignment - 1, $alignment) * $alignment;
+    }
+
+    /**
+     * Generates the pre-compiled struct.Struct tables used by the packer and
+     * unpacker. _EVENT_STRUCT_MAP includes the event header and the trailing
+     * padding so a fixed-size event is written with a single pack_into()
+     * call; for dynamic events it covers the header plus the (padded) fixed
+     * part, and the string tail follows. _BATCH_PAYLOAD_STRUCT_MAP is the
+     * payload plus the same padding: one entry of an EVENT_BATCH.
+     */
+    private function generateStructMaps_PYTHON(): string
+    {
+        $headerFormat = self::HEADER_FORMAT;
+        $eventStructs = "";
+        $payloadStructs = "";
+        $batchPayloadStructs = "";
+
+        foreach ($this->allStructs as $struct) {
+            $enumName = $struct["enumName"];
+            $pyStructFormat = $this->generatePythonStructFormat($struct);
+            $payloadFormat = $pyStructFormat === "" ? "<" : $pyStructFormat;
+            $eventFormat = $headerFormat . substr($payloadFormat, 1);
+            $eventSize = self::HEADER_SIZE + $this->calculateStructSize($struct);
+            $padding = $this->alignSize($eventSize) - $eventSize;
+            $batchPayloadFormat = $payloadFormat;
+            if ($padding > 0) {
+                $eventFormat .= "{$padding}x";
+                $batchPayloadFormat .= "{$padding}x";
+            }
+
+            $eventStructs .= "        Events.{$enumName}.value: struct.Struct(\"{$eventFormat}\"),\n";
+            $payloadStructs .= "        Events.{$enumName}.value: struct.Struct(\"{$payloadFormat}\"),\n";
+            $batchPayloadStructs .= "        Events.{$enumName}.value: struct.Struct(\"{$batchPayloadFormat}\"),\n";
+        }
+
+        $countFormat = self::COUNT_FORMAT;
+        $output = "    _COUNT_STRUCT = struct.Struct(\"{$countFormat}\")\n";
+        $output .= "    _HEADER_STRUCT = struct.Struct(\"{$headerFormat}\")\n\n";
+        $output .= "    # Header + payload + padding, indexed by event id (used by CommandPacker)\n";
+        $output .= "    _EVENT_STRUCT_MAP: Dict[int, struct.Struct] = {\n";
+        $output .= $eventStructs;
+        $output .= "    }\n\n";
+        $output .= "    # Payload only, indexed by event id (used by unpack)\n";
+        $output .= "    _PAYLOAD_STRUCT_MAP: Dict[int, struct.Struct] = {\n";
+        $output .= $payloadStructs;
+        $output .= "    }\n\n";
+        $output .= "    # Payload + padding, indexed by event id (one entry of an EVENT_BATCH)\n";
+        $output .= "    _BATCH_PAYLOAD_STRUCT_MAP: Dict[int, struct.Struct] = {\n";
+        $output .= $batchPayloadStructs;
+        $output .= "    }\n\n";
+        return $output;
+    }
+
+    /**
+     * Gets the NumPy fields of a struct as [names, formats, offsets], with
+     * offsets starting at $offset. Padding members and u8 arrays take up
+     * space but get no field, matching the keys in _EVENT_KEY_MAP.
+     */
+    private function getDtypeFields_PYTHON(array $struct, int $offset): array
+    {
+        $names = [];
+        $formats = [];
+        $offsets = [];
+        foreach ($struct["members"] as $member) {
+            $type = $member["type"];
+            $name = $member["name"];
+
+            if (isset($member["count"]) && $type === "u8") {
+                $offset += (int) $member["count"];
+                continue;
+            }
+
+            if (str_starts_with($type, "char[")) {
+                preg_match("/\[(\d+)\]/", $type, $matches);
+                $size = (int) $matches[1];
+                $format = "S{$size}";
+            } elseif (str_starts_with($type, "u8[")) {
+                preg_match("/\[(\d+)\]/", $type, $matches);
+                $offset += (int) $matches[1];
+                continue;
+            } else {
+                $size = self::C_TYPE_SIZE_MAP[$type] ?? 0;
+                $format = self::DTYPE_MAP[$type] ?? "V{$size}";
+            }
+
+            if (!str_starts_with($name, "_padding")) {
+                $names[] = "\"{$name}\"";
+                $formats[] = "\"{$format}\"";
+                $offsets[] = $offset;
+            }
+            $offset += $size;
+        }
+        return [$names, $formats, $offsets];
+    }
+
+    /**
+     * Formats one np.dtype(...) entry of the DTYPES tables.
+     */
+    private function formatDtype_PYTHON(
+        string $enumName,
+        array $fields,
+        int $itemsize,
+    ): string {
+        [$names, $formats, $offsets] = $fields;
+        $output = "    Events.{$enumName}.value: np.dtype(\n";
+        $output .= "        {\n";
+        $output .= "            \"names\": [" . implode(", ", $names) . "],\n";
+        $output .= "            \"formats\": [" . implode(", ", $formats) . "],\n";
+        $output .= "            \"offsets\": [" . implode(", ", $offsets) . "],\n";
+        $output .= "            \"itemsize\": {$itemsize},\n";
+        $output .= "        }\n";
+        $output .= "    ),\n";
+        return $output;
+    }
+
+    /**
+     * Generates `phrost_dtypes.py`: a NumPy structured dtype for every
+     * struct, with the exact offsets, padding and little-endian types of
+     * the wire layout. DTYPES describes the payload alone (itemsize is the
+     * size in the PackFormats tuples); EVENT_DTYPES adds the event header
+     * and the trailing padding, i.e. one event as it sits in a stream.
+     */
+    private function generateDtypesModule_PYTHON(): string
+    {
+        $payloadDtypes = "";
+        $eventDtypes = "";
+        foreach ($this->allStructs as $struct) {
+            $enumName = $struct["enumName"];
+            $payloadSize = $this->calculateStructSize($struct);
+
+            $payloadDtypes .= $this->formatDtype_PYTHON(
+                $enumName,
+                $this->getDtypeFields_PYTHON($struct, 0),
+                $payloadSize,
+            );
+
+            [$names, $formats, $offsets] = $this->getDtypeFields_PYTHON(
+                $struct,
+                self::HEADER_SIZE,
+            );
+            $eventDtypes .= $this->formatDtype_PYTHON(
+                $enumName,
+                [
+                    array_merge(["\"type\"", "\"timestamp\""], $names),
+                    array_merge(["\"<u4\"", "\"<u8\""], $formats),
+                    array_merge([0, 4], $offsets),
+                ],
+                $this->alignSize(self::HEADER_SIZE + $payloadSize),
+            );
+        }
+
+        $output =
+            "\"\"\"\n" .
+            $this->getFileHeader("PythonAdapter.php") .
+            "NumPy structured dtypes for every event in structs.json.\n" .
+            "\"\"\"\n\n";
+        $output .= "from typing import Dict\n\n";
+        $output .= "import numpy as np\n\n";
+        $output .= "from phrost import Events\n\n";
+        $output .= "# Payload only, indexed by event id. itemsize is the size in the\n";
+        $output .= "# PackFormats tuples.\n";
+        $output .= "DTYPES: Dict[int, np.dtype] = {\n";
+        $output .= $payloadDtypes;
+        $output .= "}\n\n";
+        $output .= "# Header + payload + padding, indexed by event id: one event as it\n";
+        $output .= "# sits in a stream, the same layout as _EVENT_STRUCT_MAP.\n";
+        $output .= "EVENT_DTYPES: Dict[int, np.dtype] = {\n";
+        $output .= $eventDtypes;
+        $output .= "}\n";
+        return $output;
+    }
+
+    /**
+     * Generates one CommandPacker method per struct, e.g.
+     * `packer.sprite_move(id1, id2, positionX, positionY, positionZ)`.
+     * Each method writes the header and payload with a single pack_into()
+     * of its pre-compiled struct, so there's no list building or event
+     * dispatch on the hot path. Dynamic events take their tails as bytes
+     * and fill in the matching length members themselves; each tail is
+     * zero-padded to 8 bytes. A tail that is already padded (see
+     * StringCache.encode_padded) is passed with its real length, e.g.
+     * `packer.text_set_string(id1, id2, padded, textLength=length)`.
+     * Fixed-size events also get a batching branch that writes only the
+     * payload into the EVENT_BATCH that ends the stream. The event id is a
+     * plain int local (an Events attribute lookup would cost more than the
+     * pack itself) and every size comes from the pre-compiled structs.
+     */
+    private function generateTypedPackMethods_PYTHON(): string
+    {
+        $output = "";
+
+        foreach ($this->allStructs as $struct) {
+            $eventId = $struct["eventId"];
+            $enumName = $struct["enumName"];
+            $methodName = strtolower($enumName);
+            $tails = self::DYNAMIC_TAILS[$enumName] ?? [];
+            $lengthMembers = array_filter(array_column($tails, 1));
+
+            $params = ["self"];
+            $packArgs = ["self._event_stream", "offset", "event_type", "0"];
+
+            // This filter logic MUST match generatePythonStructFormat
+            foreach ($struct["members"] as $member) {
+                $name = $member["name"];
+                $type = $member["type"];
+                if (
+                    str_starts_with($name, "_padding") ||
+                    str_starts_with($type, "u8[") ||
+                    (isset($member["count"]) && $type === "u8")
+                ) {
+                    continue;
+                }
+                $packArgs[] = $name;
+                if (in_array($name, $lengthMembers, true)) {
+                    continue; // Derived from the tail below
+                }
+                // Filler members like `_unused` still take up a byte on the wire
+                $default = str_starts_with($name, "_") ? " = 0" : "";
+                $params[] = "{$name}: " . $this->getPythonTypeHint($type) . $default;
+            }
+            foreach ($tails as [$tailName]) {
+                $params[] = "{$tailName}: bytes";
+            }
+            foreach ($lengthMembers as $lengthMember) {
+                $params[] = "{$lengthMember}: int = -1";
+            }
+
+            $output .= "    def {$methodName}(" . implode(", ", $params) . "):\n";
+            $output .= "        \"\"\"Packs {$enumName}. {$struct["comment"]}\"\"\"\n";
+            $output .= "        event_type = {$eventId}  # Events.{$enumName}\n";
+
+            $sizeVars = [];
+            foreach ($tails as [$tailName, $lengthMember]) {
+                $sizeVars[] = "{$tailName}Size";
+                if ($lengthMember === null) {
+                    $lengthVar = "{$tailName}Length";
+                    $output .= "        {$lengthVar} = len({$tailName})\n";
+                } else {
+                    $lengthVar = $lengthMember;
+                    $output .= "        if {$lengthVar} < 0:\n";
+                    $output .= "            {$lengthVar} = len({$tailName})\n";
+                }
+                $output .= "        {$tailName}Size = ({$lengthVar} + 7) & ~7\n";
+            }
+
+            // Coalescing: "set" events reuse this frame's earlier slot for the
+            // entity; any other event for the entity is a barrier, and a
+            // handle event is a barrier for every entity.
+            $memberNames = array_column($struct["members"], "name");
+            $isEntityEvent = array_slice($memberNames, 0, 2) === ["id1", "id2"];
+            $isHandleEvent = array_slice($memberNames, 0, 1) === ["handle"];
+            $coalesces = in_array($enumName, self::COALESCE_EVENTS, true);
+            // Coalescing slots and batch entries hold the payload only
+            $payloadArgs = array_merge(["self._event_stream", "offset"], array_slice($packArgs, 4));
+            if ($coalesces) {
+                $slotArgs = $payloadArgs;
+                $slotArgs[1] = "slot";
+                $output .= "        index = self._coalesce_index\n";
+                $output .= "        if index is not None:\n";
+                $output .= "            slot = self._find_slot(event_type, id1, id2)\n";
+                $output .= "            if slot >= 0:\n";
+                $output .= "                PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(" . implode(", ", $slotArgs) . ")\n";
+                $output .= "                self._coalesced_count += 1\n";
+                $output .= "                return\n";
+            } elseif ($isEntityEvent) {
+                $output .= "        if self._coalesce_index is not None:\n";
+                $output .= "            self._coalesce_index.pop((id1, id2), None)\n";
+            } elseif ($isHandleEvent) {
+                $output .= "        if self._coalesce_index is not None:\n";
+                $output .= "            self._coalesce_index.clear()\n";
+            }
+
+            // Batching: events with a tail are never batched
+            $indent = "        ";
+            if (empty($tails)) {
+                $output .= "        if self._batching:\n";
+                $output .= "            offset = self._batch_offset(event_type, 1)\n";
+                $output .= "            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(" . implode(", ", $payloadArgs) . ")\n";
+                $output .= "            self._join_batch(event_type, offset, 1)\n";
+                $output .= "        else:\n";
+                $indent = "            ";
+            }
+
+            $output .= "{$indent}event = PackFormat._EVENT_STRUCT_MAP[event_type]\n";
+            $output .= "{$indent}offset = self._offset\n";
+            if (empty($tails)) {
+                $output .= "{$indent}end = offset + event.size\n";
+            } else {
+                $output .= "        tail = offset + event.size\n";
+                $output .= "        end = tail + " . implode(" + ", $sizeVars) . "\n";
+            }
+            $output .= "{$indent}if end > len(self._event_stream):\n";
+            $output .= "{$indent}    self._grow(end)\n";
+            $output .= "{$indent}event.pack_into(" . implode(", ", $packArgs) . ")\n";
+
+            $lastIndex = count($tails) - 1;
+            foreach ($tails as $index => [$tailName]) {
+                $padded = "{$tailName}.ljust({$sizeVars[$index]}, b\"\\0\")";
+                if ($index === $lastIndex) {
+                    $output .= "        self._event_stream[tail:end] = {$padded}\n";
+                } else {
+                    $output .= "        self._event_stream[tail:tail + {$sizeVars[$index]}] = {$padded}\n";
+                    $output .= "        tail += {$sizeVars[$index]}\n";
+                }
+            }
+
+            $output .= "{$indent}self._offset = end\n";
+            if ($coalesces) {
+                $output .= "        if index is not None:\n";
+                $output .= "            self._record_slot(\n";
+                $output .= "                event_type, id1, id2,\n";
+                $output .= "                self._offset - PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].size,\n";
+                $output .= "            )\n";
+            }
+            $output .= "        self._command_count += 1\n";
+            $output .= "        if self._command_count == self._next_chunk:\n";
+            $output .= "            self._chunk_reached()\n\n";
+        }
+
+        return $output;
+    }
+
+    /**
+     * Maps a structs.json member type to a Python type hint.
+     */
+    private function getPythonTypeHint(string $type): string
+    {
+        if ($type === "f32" || $type === "f64") {
+            return "float";
+        }
+        if (str_starts_with($type, "char[")) {
+            return "bytes";
+        }
+        return "int";
+    }
+
     /**
      * Generates a Python map of [eventId => [key1, key2, ...]]
      * This map is used by unpack() to correctly label payload data.
@@ -318,6 +760,56 @@ class PythonAdapter extends BaseAdapter
         // --- MODIFIED ---
         // Updated the "Generic Fixed-Size Event Handler" logic
         return <<<'PYTHON'
+            # struct codes -> NumPy dtype strings, used by get_dtype()
+            _DTYPE_CODES: Dict[str, str] = {
+                "b": "i1", "B": "u1", "h": "<i2", "H": "<u2", "i": "<i4", "I": "<u4",
+                "q": "<i8", "Q": "<u8", "f": "<f4", "d": "<f8",
+            }
+            _DTYPE_CACHE: Dict[Tuple[int, bool], Any] = {}
+
+            # Events with data after their struct. These are never sent inside
+            # an EVENT_BATCH, which only holds fixed-size payloads.
+            _VARIABLE_LENGTH_EVENTS = frozenset((
+                Events.SPRITE_TEXTURE_LOAD,
+                Events.PLUGIN_LOAD,
+                Events.AUDIO_LOAD,
+                Events.TEXT_ADD,
+                Events.TEXT_SET_STRING,
+                Events.GEOM_ADD_PACKED,
+                Events.EVENT_BATCH,
+            ))
+
+            # The strings after the struct of each variable-length event, as
+            # (name, length key) pairs in wire order. Each starts on an 8-byte
+            # boundary and is padded to one.
+            _EVENT_TAILS: Dict[int, Tuple[Tuple[str, str], ...]] = {
+                Events.SPRITE_TEXTURE_LOAD: (("filename", "filenameLength"),),
+                Events.PLUGIN_LOAD: (("path", "pathLength"),),
+                Events.AUDIO_LOAD: (("path", "pathLength"),),
+                Events.TEXT_ADD: (("fontPath", "fontPathLength"), ("text", "textLength")),
+                Events.TEXT_SET_STRING: (("text", "textLength"),),
+            }
+
+            # Length keys the dicts from unpack() have never had, left out so
+            # they keep the shape existing handlers read
+            _DICT_OMITTED_KEYS: Dict[int, Tuple[str, ...]] = {
+                Events.SPRITE_TEXTURE_LOAD: ("filenameLength",),
+            }
+
+            # The keys of unpack()'s dict for each event, in header + payload order
+            _DICT_KEY_MAP: Dict[int, Tuple[str, ...]] = {
+                event_type: ("type", "timestamp") + tuple(keys)
+                for event_type, keys in _EVENT_KEY_MAP.items()
+            }
+
+            # Just the event type from a header
+            _TYPE_STRUCT = struct.Struct("<I")
+
+            # EventView subclasses, built on first use by get_view_class()
+            _VIEW_CLASSES: Dict[int, type] = {}
+
+            # Generated EventRecord subclasses, filled in below their definitions
+            _RECORD_CLASSES: Dict[int, type] = {}
 
             @staticmethod
             def get_info(event_type_value: int) -> Optional[Tuple[str, int]]:
@@ -327,314 +819,1403 @@ class PythonAdapter extends BaseAdapter
                 return PackFormat._EVENT_FORMAT_MAP.get(event_type_value)
 
             @staticmethod
-            def unpack(events_blob: bytes) -> List[Dict[str, Any]]:
+            def get_struct(event_type_value: int) -> Optional[struct.Struct]:
                 """
-                Unpacks a binary blob of events (Assumes <I for count/type).
+                Gets the pre-compiled header + payload struct for a given event ID.
                 """
-                events = []
-                blob_length = len(events_blob)
-                if blob_length < 4:
-                    return []
+                return PackFormat._EVENT_STRUCT_MAP.get(event_type_value)
 
-                try:
-                    # PHP 'V' = unsigned 32-bit LE -> Python '<I'
-                    event_count = struct.unpack_from("<I", events_blob, 0)[0]
-                    offset = 4
-                except struct.error:
-                    print("PackFormat.unpack: Failed to unpack event count.", file=sys.stderr)
-                    return []
+            @staticmethod
+            def get_dtype(event_type_value: int, header: bool = True) -> Optional[Any]:
+                """
+                Gets a NumPy structured dtype matching the header + payload layout
+                of an event, with fields "type", "timestamp" and the keys from
+                _EVENT_KEY_MAP. With header=False it matches one padded payload
+                inside an EVENT_BATCH instead. Returns None if NumPy isn't installed.
+                """
+                if np is None:
+                    return None
+                dtype = PackFormat._DTYPE_CACHE.get((event_type_value, header))
+                if dtype is not None:
+                    return dtype
+
+                if header:
+                    event_struct = PackFormat._EVENT_STRUCT_MAP[event_type_value]
+                    names = ["type", "timestamp"] + PackFormat._EVENT_KEY_MAP[event_type_value]
+                else:
+                    event_struct = PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type_value]
+                    names = list(PackFormat._EVENT_KEY_MAP[event_type_value])
+                formats = []
+                offsets = []
+                offset = 0
+                for count, code in re.findall(r"(\d*)([a-zA-Z?])", event_struct.format[1:]):
+                    count = int(count) if count else 1
+                    if code == "x":
+                        offset += count
+                        continue
+                    field = f"S{count}" if code == "s" else PackFormat._DTYPE_CODES[code]
+                    formats.append(field)
+                    offsets.append(offset)
+                    offset += np.dtype(field).itemsize
+
+                dtype = np.dtype({
+                    "names": names,
+                    "formats": formats,
+                    "offsets": offsets,
+                    "itemsize": event_struct.size,
+                })
+                PackFormat._DTYPE_CACHE[(event_type_value, header)] = dtype
+                return dtype
+
+            @staticmethod
+            def get_view_class(event_type_value: int) -> Optional[type]:
+                """
+                Gets the EventView subclass for an event ID, building it on first
+                use: one property per key in _EVENT_KEY_MAP, each reading its field
+                with its own pre-compiled struct. Returns None for unknown event
+                types and EVENT_BATCH (whose entries are yielded as their own type).
+                """
+                view_class = PackFormat._VIEW_CLASSES.get(event_type_value)
+                if view_class is not None:
+                    return view_class
+                payload_struct = PackFormat._PAYLOAD_STRUCT_MAP.get(event_type_value)
+                if payload_struct is None or event_type_value == Events.EVENT_BATCH:
+                    return None
+
+                keys = PackFormat._EVENT_KEY_MAP[event_type_value]
+                tails = PackFormat._EVENT_TAILS.get(event_type_value, ())
+                namespace: Dict[str, Any] = {
+                    "__slots__": ("_tails",) if tails else (),
+                    "type": event_type_value,
+                    "_payload": payload_struct,
+                    "_event": struct.Struct(PackFormat._HEADER_STRUCT.format + payload_struct.format[1:]),
+                    "_keys": tuple(keys),
+                    "_dict_keys": ("type", "timestamp") + tuple(keys),
+                    "_tail_names": tuple(name for name, _ in tails),
+                }
+                key_iter = iter(keys)
+                offset = 0
+                for count, code in re.findall(r"(\d*)([a-zA-Z?])", payload_struct.format[1:]):
+                    count = int(count) if count else 1
+                    if code == "x":
+                        offset += count
+                        continue
+                    field = f"{count}s" if code == "s" else code
+                    namespace[next(key_iter)] = EventView._field(struct.Struct(f"<{offset}x{field}"))
+                    offset += struct.calcsize(f"<{field}")
+                for index, (name, _) in enumerate(tails):
+                    namespace[name] = EventView._tail(index)
+
+                view_class = type(f"{Events(event_type_value).name}_View", (EventView,), namespace)
+                PackFormat._VIEW_CLASSES[event_type_value] = view_class
+                return view_class
+
+            @staticmethod
+            def unpack_views(events_blob: Union[bytes, bytearray, memoryview], wanted: Optional[Collection[int]] = None) -> Iterator["EventView"]:
+                """
+                Yields a lazy EventView per event in a binary blob of events.
+
+                This is a single pass over a memoryview that only reads each event's
+                type (and the lengths of any string tails) to find the next one;
+                fields are decoded when they are read. Entries of an EVENT_BATCH are
+                yielded as views of their own type. Stops (with a message on stderr)
+                at the first unknown or truncated event, like unpack().
+
+                :param wanted: Event ids to yield (e.g. the types a handler
+                               checks for). Any other event is stepped over by its
+                               size from _EVENT_STRUCT_MAP without building a
+                               view; a batch of them is skipped in one step.
+                """
+                buffer = memoryview(events_blob).cast("B")
+                blob_length = len(buffer)
+                if blob_length < PackFormat._COUNT_STRUCT.size:
+                    return
+
+                event_count = PackFormat._COUNT_STRUCT.unpack_from(buffer, 0)[0]
+                offset = PackFormat._COUNT_STRUCT.size
+                header_size = PackFormat._HEADER_STRUCT.size
+                read_type = PackFormat._TYPE_STRUCT.unpack_from
+                view_classes = PackFormat._VIEW_CLASSES
+                event_structs = PackFormat._EVENT_STRUCT_MAP
+                variable_length = PackFormat._VARIABLE_LENGTH_EVENTS
+                batch_type_value = Events.EVENT_BATCH.value
 
                 for i in range(event_count):
-                    # Header: <I (type) + <Q (timestamp) = 4 + 8 = 12 bytes
-                    header_size = 12
-                    if offset + header_size > blob_length:
-                        print(f"PackFormat.unpack Loop {i}/{event_count}: Not enough data for header. Offset={offset}", file=sys.stderr)
-                        break
+                    header = offset
+                    offset += header_size
+                    if offset > blob_length:
+                        print(f"PackFormat.unpack_views Loop {i}/{event_count}: Not enough data for header. Offset={header}", file=sys.stderr)
+                        return
+
+                    event_type = read_type(buffer, header)[0]
+                    if wanted is not None and event_type not in wanted and event_type not in variable_length:
+                        # Unwanted fixed-size event: its padded size is all we need
+                        event_struct = event_structs.get(event_type)
+                        if event_struct is not None:
+                            offset = header + event_struct.size
+                            if offset > blob_length:
+                                print(f"PackFormat.unpack_views: Not enough data for {Events(event_type).name}. Stopping parse.", file=sys.stderr)
+                                return
+                            continue
+
+                    view_class = view_classes.get(event_type) or PackFormat.get_view_class(event_type)
+
+                    if view_class is not None:
+                        end = offset + view_class._payload.size
+                        if end > blob_length:
+                            print(f"PackFormat.unpack_views: Not enough data for {view_class.__name__} payload. Stopping parse.", file=sys.stderr)
+                            return
+                        view = view_class(buffer, offset, header)
+                        if view_class._tail_names:
+                            tails = []
+                            for name, length_key in PackFormat._EVENT_TAILS[event_type]:
+                                start = (end + 7) & ~7
+                                end = start + getattr(view, length_key)
+                                if end > blob_length:
+                                    print(f"PackFormat.unpack_views: Not enough data for {view_class.__name__} {name}. Stopping parse.", file=sys.stderr)
+                                    return
+                                tails.append((start, end))
+                            view._tails = tuple(tails)
+                        if wanted is None or event_type in wanted:
+                            yield view
+
+                    elif event_type == batch_type_value:
+                        # One header, then `count` padded payloads of a single
+                        # fixed-size event type
+                        end = offset + PackFormat._PAYLOAD_STRUCT_MAP[batch_type_value].size
+                        if end > blob_length:
+                            print("PackFormat.unpack_views: Not enough data for EVENT_BATCH header. Stopping parse.", file=sys.stderr)
+                            return
+                        batch_type, batch_count = PackFormat._PAYLOAD_STRUCT_MAP[batch_type_value].unpack_from(buffer, offset)
+                        entry_class = PackFormat.get_view_class(batch_type)
+                        if entry_class is None or batch_type in PackFormat._VARIABLE_LENGTH_EVENTS:
+                            print(f"PackFormat.unpack_views: EVENT_BATCH of unsupported event type {batch_type}. Stopping parse.", file=sys.stderr)
+                            return
+                        stride = PackFormat._BATCH_PAYLOAD_STRUCT_MAP[batch_type].size
+                        offset = end
+                        end = offset + stride * batch_count
+                        if end > blob_length:
+                            print(f"PackFormat.unpack_views: Not enough data for EVENT_BATCH payloads ({batch_count} x {stride}). Stopping parse.", file=sys.stderr)
+                            return
+                        if wanted is None or batch_type in wanted:
+                            entries = range(offset, end, stride) if stride else [offset] * batch_count
+                            for entry in entries:
+                                yield entry_class(buffer, entry, header)
+
+                    else:
+                        print(f"PackFormat.unpack_views: Unknown event type {event_type}. Cannot continue parsing.", file=sys.stderr)
+                        return
+
+                    # Skip the padding that ends every event on an 8-byte boundary
+                    offset = (end + 7) & ~7
+
+            @staticmethod
+            def get_record_class(event_type_value: int) -> Optional[type]:
+                """
+                Gets the generated EventRecord subclass for an event ID (e.g.
+                SpriteAddEvent for SPRITE_ADD). Returns None for unknown event
+                types and EVENT_BATCH.
+                """
+                return PackFormat._RECORD_CLASSES.get(event_type_value)
+
+            @staticmethod
+            def unpack_records(events_blob: Union[bytes, bytearray, memoryview], wanted: Optional[Collection[int]] = None) -> Iterator["EventRecord"]:
+                """
+                Yields an EventRecord per event in a binary blob of events: an
+                instance of the generated __slots__ class of its type (e.g.
+                PhysicsSyncTransformEvent), with every field decoded by a single
+                unpack_from. Records take less memory than unpack()'s dicts, their
+                fields are plain attribute reads, and unlike views they don't refer
+                back to the blob. Entries of an EVENT_BATCH are yielded as records
+                of their own type. Stops (with a message on stderr) at the first
+                unknown or truncated event, like unpack().
+
+                :param wanted: Event ids to yield; see unpack_views().
+                """
+                buffer = memoryview(events_blob).cast("B")
+                blob_length = len(buffer)
+                if blob_length < PackFormat._COUNT_STRUCT.size:
+                    return
+
+                event_count = PackFormat._COUNT_STRUCT.unpack_from(buffer, 0)[0]
+                offset = PackFormat._COUNT_STRUCT.size
+                header_size = PackFormat._HEADER_STRUCT.size
+                read_type = PackFormat._TYPE_STRUCT.unpack_from
+                record_classes = PackFormat._RECORD_CLASSES
+                batch_type_value = Events.EVENT_BATCH.value
+                batch_struct = PackFormat._PAYLOAD_STRUCT_MAP[batch_type_value]
 
-                    try:
-                        header_data = struct.unpack_from("<IQ", events_blob, offset)
-                        offset += header_size
-                        event_type, timestamp = header_data
-                        event = {"type": event_type, "timestamp": timestamp}
-                    except struct.error:
-                        print(f"PackFormat.unpack Loop {i}/{event_count}: Failed to unpack header. Offset={offset}", file=sys.stderr)
+                for i in range(event_count):
+                    header = offset
+                    if header + header_size > blob_length:
+                        print(f"PackFormat.unpack_records Loop {i}/{event_count}: Not enough data for header. Offset={header}", file=sys.stderr)
+                        return
+
+                    event_type = read_type(buffer, header)[0]
+                    record_class = record_classes.get(event_type)
+
+                    if record_class is not None:
+                        # Header, payload and padding in one go
+                        end = header + record_class._struct.size
+                        if end > blob_length:
+                            print(f"PackFormat.unpack_records: Not enough data for {record_class.__name__}. Stopping parse.", file=sys.stderr)
+                            return
+                        if record_class._tails:
+                            record = record_class(*record_class._struct.unpack_from(buffer, header))
+                            end = record._read_tails(buffer, end)
+                            if end > blob_length:
+                                print(f"PackFormat.unpack_records: Not enough data for {record_class.__name__} strings. Stopping parse.", file=sys.stderr)
+                                return
+                            if wanted is None or event_type in wanted:
+                                yield record
+                        elif wanted is None or event_type in wanted:
+                            yield record_class(*record_class._struct.unpack_from(buffer, header))
+
+                    elif event_type == batch_type_value:
+                        # One header, then `count` padded payloads of a single
+                        # fixed-size event type
+                        start = header + header_size
+                        end = start + batch_struct.size
+                        if end > blob_length:
+                            print("PackFormat.unpack_records: Not enough data for EVENT_BATCH header. Stopping parse.", file=sys.stderr)
+                            return
+                        batch_type, batch_count = batch_struct.unpack_from(buffer, start)
+                        entry_class = record_classes.get(batch_type)
+                        entry_struct = PackFormat._BATCH_PAYLOAD_STRUCT_MAP.get(batch_type)
+                        if entry_class is None or entry_class._tails or batch_type in PackFormat._VARIABLE_LENGTH_EVENTS or not entry_struct.size:
+                            print(f"PackFormat.unpack_records: EVENT_BATCH of unsupported event type {batch_type}. Stopping parse.", file=sys.stderr)
+                            return
+                        start = end
+                        end = start + entry_struct.size * batch_count
+                        if end > blob_length:
+                            print(f"PackFormat.unpack_records: Not enough data for EVENT_BATCH payloads ({batch_count} x {entry_struct.size}). Stopping parse.", file=sys.stderr)
+                            return
+                        if wanted is None or batch_type in wanted:
+                            timestamp = PackFormat._HEADER_STRUCT.unpack_from(buffer, header)[1]
+                            for values in entry_struct.iter_unpack(buffer[start:end]):
+                                yield entry_class(timestamp, *values)
+
+                    else:
+                        print(f"PackFormat.unpack_records: Unknown event type {event_type}. Cannot continue parsing.", file=sys.stderr)
+                        return
+
+                    # Skip the padding that ends every event on an 8-byte boundary
+                    offset = (end + 7) & ~7
+
+            @staticmethod
+            def unpack_columnar(events_blob: Union[bytes, bytearray, memoryview], wanted: Optional[Collection[int]] = None) -> Dict[int, Any]:
+                """
+                Decodes a binary blob of events into one NumPy structured array per
+                event type, keyed by event id, with a field per key in
+                _EVENT_KEY_MAP (e.g. arrays[Events.PHYSICS_SYNC_TRANSFORM]["positionX"]).
+
+                The blob is scanned once. Back-to-back events of one type (and every
+                EVENT_BATCH) form a run that np.frombuffer() maps without copying;
+                a type whose events are split over several runs is copied into one
+                array. The arrays may be views of the blob, so keep it alive and
+                unchanged while they are in use. Variable-length events (those with
+                string tails) are skipped; use unpack_views() for them. Stops (with
+                a message on stderr) at the first unknown or truncated event.
+
+                :param wanted: Event ids to return arrays for; runs of any other
+                               type are stepped over without being mapped.
+                """
+                if np is None:
+                    raise ImportError("PackFormat.unpack_columnar requires NumPy")
+
+                buffer = memoryview(events_blob).cast("B")
+                blob_length = len(buffer)
+                if blob_length < PackFormat._COUNT_STRUCT.size:
+                    return {}
+
+                event_count = PackFormat._COUNT_STRUCT.unpack_from(buffer, 0)[0]
+                offset = PackFormat._COUNT_STRUCT.size
+                header_size = PackFormat._HEADER_STRUCT.size
+                read_type = PackFormat._TYPE_STRUCT.unpack_from
+                batch_type_value = Events.EVENT_BATCH.value
+                batch_struct = PackFormat._PAYLOAD_STRUCT_MAP[batch_type_value]
+
+                # (event type, offset of the first record, record count, from a batch)
+                runs: List[Tuple[int, int, int, bool]] = []
+
+                i = 0
+                while i < event_count:
+                    header = offset
+                    offset += header_size
+                    if offset > blob_length:
+                        print(f"PackFormat.unpack_columnar Loop {i}/{event_count}: Not enough data for header. Offset={header}", file=sys.stderr)
                         break
 
-                    try:
-                        event_enum_val = Events(event_type)
-                    except ValueError:
-                        event_enum_val = None
+                    event_type = read_type(buffer, header)[0]
+                    if event_type == batch_type_value:
+                        end = offset + batch_struct.size
+                        if end > blob_length:
+                            print("PackFormat.unpack_columnar: Not enough data for EVENT_BATCH header. Stopping parse.", file=sys.stderr)
+                            break
+                        batch_type, batch_count = batch_struct.unpack_from(buffer, offset)
+                        payload_struct = PackFormat._BATCH_PAYLOAD_STRUCT_MAP.get(batch_type)
+                        if payload_struct is None or batch_type in PackFormat._VARIABLE_LENGTH_EVENTS:
+                            print(f"PackFormat.unpack_columnar: EVENT_BATCH of unsupported event type {batch_type}. Stopping parse.", file=sys.stderr)
+                            break
+                        start = end
+                        end = start + payload_struct.size * batch_count
+                        if end > blob_length:
+                            print(f"PackFormat.unpack_columnar: Not enough data for EVENT_BATCH payloads ({batch_count} x {payload_struct.size}). Stopping parse.", file=sys.stderr)
+                            break
+                        if batch_count:
+                            runs.append((batch_type, start, batch_count, True))
+                        i += 1
+
+                    elif event_type in PackFormat._EVENT_TAILS:
+                        # Walk past the strings; these don't fit in an array
+                        payload_struct = PackFormat._PAYLOAD_STRUCT_MAP[event_type]
+                        end = offset + payload_struct.size
+                        if end > blob_length:
+                            print(f"PackFormat.unpack_columnar: Not enough data for {Events(event_type).name} payload. Stopping parse.", file=sys.stderr)
+                            break
+                        lengths = dict(zip(PackFormat._EVENT_KEY_MAP[event_type], payload_struct.unpack_from(buffer, offset)))
+                        for _, length_key in PackFormat._EVENT_TAILS[event_type]:
+                            end = ((end + 7) & ~7) + lengths[length_key]
+                        if end > blob_length:
+                            print(f"PackFormat.unpack_columnar: Not enough data for {Events(event_type).name} strings. Stopping parse.", file=sys.stderr)
+                            break
+                        i += 1
+
+                    else:
+                        event_struct = PackFormat._EVENT_STRUCT_MAP.get(event_type)
+                        if event_struct is None:
+                            print(f"PackFormat.unpack_columnar: Unknown event type {event_type}. Cannot continue parsing.", file=sys.stderr)
+                            break
+                        # Find the whole run of back-to-back events of this type in
+                        # one step, by reading every stride-th type field at once
+                        stride = event_struct.size
+                        limit = min(event_count - i, (blob_length - header) // stride)
+                        types = np.ndarray((limit,), dtype="<u4", buffer=buffer, offset=header, strides=(stride,))
+                        different = np.flatnonzero(types != event_type)
+                        count = int(different[0]) if len(different) else limit
+                        if count == 0:
+                            print(f"PackFormat.unpack_columnar: Not enough data for {Events(event_type).name} payload. Stopping parse.", file=sys.stderr)
+                            break
+                        runs.append((event_type, header, count, False))
+                        end = header + count * stride
+                        i += count
+
+                    # Skip the padding that ends every event on an 8-byte boundary
+                    offset = (end + 7) & ~7
+
+                grouped: Dict[int, List[Any]] = {}
+                for event_type, start, count, batched in runs:
+                    if wanted is not None and event_type not in wanted:
+                        continue
+                    records = np.frombuffer(buffer, dtype=PackFormat.get_dtype(event_type, header=not batched), count=count, offset=start)
+                    if not batched:
+                        records = records[PackFormat._EVENT_KEY_MAP[event_type]]
+                    grouped.setdefault(event_type, []).append(records)
+
+                arrays: Dict[int, Any] = {}
+                for event_type, parts in grouped.items():
+                    if len(parts) == 1:
+                        arrays[event_type] = parts[0]
+                        continue
+                    merged = np.empty(sum(len(part) for part in parts), dtype=PackFormat.get_dtype(event_type, header=False))
+                    position = 0
+                    for part in parts:
+                        merged[position : position + len(part)] = part
+                        position += len(part)
+                    arrays[event_type] = merged
+                return arrays
 
-                    # --- Manual Unpacking for Variable-Length Events ---
-                    try:
-                        if event_type == Events.SPRITE_TEXTURE_LOAD.value:
-                            fmt, size = PackFormat.get_info(event_type) # ("<qqI4x", 24)
-                            if offset + size > blob_length: raise EOFError("TEXTURE_LOAD fixed part")
-
-                            unpacked = struct.unpack_from(fmt, events_blob, offset)
-                            offset += size
-                            event["id1"], event["id2"], filename_length = unpacked
-
-                            if offset + filename_length > blob_length: raise EOFError("TEXTURE_LOAD variable part")
-                            event["filename"] = events_blob[offset:offset+filename_length].decode('utf-8')
-                            offset += filename_length
-                            events.append(event)
-
-                        elif event_type == Events.PLUGIN_LOAD.value:
-                            fmt, size = PackFormat.get_info(event_type) # ("<I", 4)
-                            if offset + size > blob_length: raise EOFError("PLUGIN_LOAD fixed part")
+            @staticmethod
+            def iter_unpack(events_blob: Union[bytes, bytearray, memoryview], wanted: Optional[Collection[int]] = None) -> Iterator[Dict[str, Any]]:
+                """
+                Yields events one dict at a time, as unpack() would return them.
 
-                            path_length = struct.unpack_from(fmt, events_blob, offset)[0]
-                            offset += size
-                            event["pathLength"] = path_length
+                Decoding works on a memoryview of the frame: a fixed-size event is
+                read in place with the single unpack_from of its _EVENT_STRUCT_MAP
+                entry (header, payload and padding), never sliced out, and each
+                dict is only built when the loop asks for the next event. A loop that stops
+                early never decodes the rest, and a burst of events is never held
+                in memory all at once.
 
-                            if offset + path_length > blob_length: raise EOFError("PLUGIN_LOAD variable part")
-                            event["path"] = events_blob[offset:offset+path_length].decode('utf-8')
-                            offset += path_length
-                            events.append(event)
+                :param wanted: Event ids to yield; see unpack_views().
+                """
+                buffer = memoryview(events_blob).cast("B")
+                blob_length = len(buffer)
+                if blob_length < PackFormat._COUNT_STRUCT.size:
+                    return
 
-                        elif event_type == Events.AUDIO_LOAD.value:
-                            fmt, size = PackFormat.get_info(event_type) # ("<I", 4)
-                            if offset + size > blob_length: raise EOFError("AUDIO_LOAD fixed part")
+                event_count = PackFormat._COUNT_STRUCT.unpack_from(buffer, 0)[0]
+                offset = PackFormat._COUNT_STRUCT.size
+                header_size = PackFormat._HEADER_STRUCT.size
+                read_type = PackFormat._TYPE_STRUCT.unpack_from
+                event_structs = PackFormat._EVENT_STRUCT_MAP
+                dict_keys = PackFormat._DICT_KEY_MAP
+                tail_events = PackFormat._EVENT_TAILS
+                batch_type_value = Events.EVENT_BATCH.value
+                batch_struct = PackFormat._PAYLOAD_STRUCT_MAP[batch_type_value]
 
-                            path_length = struct.unpack_from(fmt, events_blob, offset)[0]
-                            offset += size
-                            event["pathLength"] = path_length
+                for i in range(event_count):
+                    header = offset
+                    if header + header_size > blob_length:
+                        print(
+                            f"PackFormat.iter_unpack Loop {i}/{event_count}: Not enough data for header. Offset={header}",
+                            file=sys.stderr,
+                        )
+                        return
+
+                    event_type = read_type(buffer, header)[0]
+                    event_struct = event_structs.get(event_type)
+
+                    if event_struct is None:
+                        print(
+                            f"PackFormat.iter_unpack: Unknown event type {event_type}. Cannot continue parsing.",
+                            file=sys.stderr,
+                        )
+                        return
+
+                    elif event_type in tail_events:
+                        record_class = PackFormat._RECORD_CLASSES[event_type]
+                        record = record_class(*record_class._struct.unpack_from(buffer, header))
+                        end = record._read_tails(buffer, header + record_class._struct.size)
+                        if end > blob_length:
+                            print(
+                                f"PackFormat.iter_unpack: Not enough data for {record_class.__name__} strings. Stopping parse.",
+                                file=sys.stderr,
+                            )
+                            return
+                        if wanted is None or event_type in wanted:
+                            yield record.to_dict()
+
+                    elif event_type == batch_type_value:
+                        # One header, then `count` padded payloads of a single
+                        # fixed-size event type
+                        start = header + header_size
+                        end = start + batch_struct.size
+                        if end > blob_length:
+                            print(
+                                "PackFormat.iter_unpack: Not enough data for EVENT_BATCH header. Stopping parse.",
+                                file=sys.stderr,
+                            )
+                            return
+                        batch_type, batch_count = batch_struct.unpack_from(buffer, start)
+                        entry_struct = PackFormat._BATCH_PAYLOAD_STRUCT_MAP.get(batch_type)
+                        if entry_struct is None or batch_type in PackFormat._VARIABLE_LENGTH_EVENTS:
+                            print(
+                                f"PackFormat.iter_unpack: EVENT_BATCH of unsupported event type {batch_type}. Stopping parse.",
+                                file=sys.stderr,
+                            )
+                            return
+                        start = end
+                        end = start + entry_struct.size * batch_count
+                        if end > blob_length:
+                            print(
+                                f"PackFormat.iter_unpack: Not enough data for EVENT_BATCH payloads ({batch_count} x {entry_struct.size}). Stopping parse.",
+                                file=sys.stderr,
+                            )
+                            return
+                        if wanted is None or batch_type in wanted:
+                            entry_keys = dict_keys[batch_type]
+                            prefix = (batch_type, PackFormat._HEADER_STRUCT.unpack_from(buffer, header)[1])
+                            entries = entry_struct.iter_unpack(buffer[start:end]) if entry_struct.size else [()] * batch_count
+                            for values in entries:
+                                yield dict(zip(entry_keys, prefix + values))
 
-                            if offset + path_length > blob_length: raise EOFError("AUDIO_LOAD variable part")
-                            event["path"] = events_blob[offset:offset+path_length].decode('utf-8')
-                            offset += path_length
-                            events.append(event)
+                    else:
+                        # Header, payload and padding in one go
+                        end = header + event_struct.size
+                        if end > blob_length:
+                            print(
+                                f"PackFormat.iter_unpack: Not enough data for {Events(event_type).name} payload. Stopping parse.",
+                                file=sys.stderr,
+                            )
+                            return
+                        if wanted is None or event_type in wanted:
+                            yield dict(zip(dict_keys[event_type], event_struct.unpack_from(buffer, header)))
+
+                    # Skip the padding that ends every event on an 8-byte boundary
+                    offset = (end + 7) & ~7
 
-                        elif event_type == Events.TEXT_ADD.value:
-                            fmt, size = PackFormat.get_info(event_type) # ("<qqdddBBBB4xfII4x", 64)
-                            if offset + size > blob_length: raise EOFError("TEXT_ADD fixed part")
+            @staticmethod
+            def unpack(events_blob: bytes, wanted: Optional[Collection[int]] = None) -> List[Dict[str, Any]]:
+                """
+                Unpacks a binary blob of events into one dict per event, with
+                "type", "timestamp", the keys from _EVENT_KEY_MAP and any string
+                tails (decoded), less any _DICT_OMITTED_KEYS. Collects
+                iter_unpack(); views are cheaper when only some fields are read,
+                see unpack_views().
 
-                            unpacked = struct.unpack_from(fmt, events_blob, offset)
-                            offset += size
+                :param wanted: Event ids to return; see unpack_views().
+                """
+                return list(PackFormat.iter_unpack(events_blob, wanted))
+        PYTHON;
+    }
 
-                            keys = ["id1", "id2", "positionX", "positionY", "positionZ", "r", "g", "b", "a", "fontSize", "fontPathLength", "textLength"]
-                            event.update(zip(keys, unpacked))
+    /**
+     * Returns the EventView class (lazy event views for unpack_views) as a
+     * Python code string. It follows the PackFormat class at module level.
+     */
+    private function getEventViewClass_PYTHON(): string
+    {
+        return <<<'PYTHON'
 
-                            font_path_len = event["fontPathLength"]
-                            text_len = event["textLength"]
 
-                            if offset + font_path_len > blob_length: raise EOFError("TEXT_ADD font path")
-                            event["fontPath"] = events_blob[offset:offset+font_path_len].decode('utf-8')
-                            offset += font_path_len
+        class EventView:
+            """
+            A lazy, read-only view of one event in an events blob, as yielded by
+            PackFormat.unpack_views(). Each field is an attribute that is decoded
+            from the blob when read, so events (or fields) that are never looked
+            at cost next to nothing. There is one subclass per event type, see
+            PackFormat.get_view_class().
 
-                            if offset + text_len > blob_length: raise EOFError("TEXT_ADD text")
-                            event["text"] = events_blob[offset:offset+text_len].decode('utf-8')
-                            offset += text_len
-                            events.append(event)
+            Views also answer the dict API used with unpack() (view["x"],
+            view.get("x", 0), "x" in view, keys()), and to_dict() copies every
+            field out. A view reads the blob it came from: keep the blob alive,
+            and unchanged, for as long as the view is in use.
+            """
 
-                        elif event_type == Events.TEXT_SET_STRING.value:
-                            fmt, size = PackFormat.get_info(event_type) # ("<qqI4x", 24)
-                            if offset + size > blob_length: raise EOFError("TEXT_SET_STRING fixed part")
+            __slots__ = ("_buffer", "_offset", "_header")
 
-                            unpacked = struct.unpack_from(fmt, events_blob, offset)
-                            offset += size
+            # Set on each subclass by PackFormat.get_view_class()
+            type: int = -1
+            _payload: struct.Struct = struct.Struct("<")
+            _event: struct.Struct = struct.Struct("<IQ4x")  # header + payload
+            _keys: Tuple[str, ...] = ()
+            _dict_keys: Tuple[str, ...] = ("type", "timestamp")
+            _tail_names: Tuple[str, ...] = ()
 
-                            keys = ["id1", "id2", "textLength"]
-                            event.update(zip(keys, unpacked))
+            def __init__(self, buffer: memoryview, offset: int, header: int):
+                """
+                :param buffer: The events blob.
+                :param offset: Where this event's payload starts.
+                :param header: Where its header starts (for an EVENT_BATCH entry,
+                               the batch's header, which holds the timestamp).
+                """
+                self._buffer = buffer
+                self._offset = offset
+                self._header = header
 
-                            text_len = event["textLength"]
-                            if offset + text_len > blob_length: raise EOFError("TEXT_SET_STRING text")
-                            event["text"] = events_blob[offset:offset+text_len].decode('utf-8')
-                            offset += text_len
-                            events.append(event)
+            @staticmethod
+            def _field(field_struct: struct.Struct) -> property:
+                """A property reading one field (pre-padded to its offset)."""
+                unpack_from = field_struct.unpack_from
+                return property(lambda self: unpack_from(self._buffer, self._offset)[0])
 
-                        elif event_enum_val is not None:
-                            # --- Generic Fixed-Size Event Handler ---
-                            payload_info = PackFormat.get_info(event_type)
-                            if payload_info is None:
-                                raise ValueError(f"Could not get info for known event type {event_type}")
+            @staticmethod
+            def _tail(index: int) -> property:
+                """A property decoding one string tail."""
+                def read(self) -> str:
+                    start, end = self._tails[index]
+                    return str(self._buffer[start:end], "utf-8")
+                return property(read)
+
+            @property
+            def timestamp(self) -> int:
+                return PackFormat._HEADER_STRUCT.unpack_from(self._buffer, self._header)[1]
+
+            def astuple(self) -> Tuple:
+                """Every payload field in _EVENT_KEY_MAP order, in one unpack."""
+                return self._payload.unpack_from(self._buffer, self._offset)
+
+            def to_dict(self) -> Dict[str, Any]:
+                """Copies the event out as unpack() would return it."""
+                if self._offset - self._header == PackFormat._HEADER_STRUCT.size:
+                    event = dict(zip(self._dict_keys, self._event.unpack_from(self._buffer, self._header)))
+                else:
+                    # An EVENT_BATCH entry: the header in front of it is the batch's
+                    event = {"type": self.type, "timestamp": self.timestamp}
+                    event.update(zip(self._keys, self.astuple()))
+                for name in self._tail_names:
+                    event[name] = getattr(self, name)
+                for key in PackFormat._DICT_OMITTED_KEYS.get(self.type, ()):
+                    del event[key]
+                return event
+
+            def keys(self) -> Tuple[str, ...]:
+                return ("type", "timestamp") + self._keys + self._tail_names
+
+            def __contains__(self, key: str) -> bool:
+                return key in ("type", "timestamp") or key in self._keys or key in self._tail_names
+
+            def __getitem__(self, key: str) -> Any:
+                if key not in self:
+                    raise KeyError(key)
+                return getattr(self, key)
+
+            def get(self, key: str, default: Any = None) -> Any:
+                return getattr(self, key) if key in self else default
+
+            def __repr__(self) -> str:
+                return f"{type(self).__name__}({self.to_dict()!r})"
+        PYTHON;
+    }
 
-                            payload_format, payload_size = payload_info
+    /**
+     * Returns the EventRecord base class (decoded __slots__ records for
+     * unpack_records) as a Python code string. The per-event subclasses
+     * come from generateEventRecordClasses_PYTHON().
+     */
+    private function getEventRecordClass_PYTHON(): string
+    {
+        return <<<'PYTHON'
 
-                            if offset + payload_size > blob_length:
-                                raise EOFError(f"{event_enum_val.name} payload (size {payload_size})")
 
-                            if payload_size > 0:
-                                unpacked = struct.unpack_from(payload_format, events_blob, offset)
+        class EventRecord:
+            """
+            One event decoded into plain attributes, as yielded by
+            PackFormat.unpack_records(). There is a generated subclass per
+            event type (SpriteAddEvent, PhysicsSyncTransformEvent, ...) whose
+            __slots__ are the keys from _EVENT_KEY_MAP plus any string tails,
+            so a record is a fraction of the size of unpack()'s dict and
+            record.positionX is a slot read instead of a string-keyed lookup.
 
-                                # --- MODIFIED BLOCK ---
-                                # Use the pre-computed key map instead of generic v{i} keys
-                                keys = PackFormat._EVENT_KEY_MAP.get(event_type)
-
-                                if keys is not None:
-                                    if len(keys) == len(unpacked):
-                                        payload_data = dict(zip(keys, unpacked))
-                                    else:
-                                        # Error: struct definition and key map are out of sync
-                                        print(f"PackFormat.unpack: Key/Value mismatch for {event_enum_val.name}. Keys: {len(keys)}, Vals: {len(unpacked)}", file=sys.stderr)
-                                        payload_data = {f"v{i}": val for i, val in enumerate(unpacked)}
-                                else:
-                                    # Fallback for events missing from key map (shouldn't happen)
-                                    payload_data = {f"v{i}": val for i, val in enumerate(unpacked)}
+            Records copy every field out of the blob, so they stay valid after
+            it is reused. Like views, they also answer the dict API used with
+            unpack() (record["x"], record.get("x", 0), "x" in record, keys()).
+            """
 
-                                event.update(payload_data)
-                                # --- END MODIFIED BLOCK ---
+            __slots__ = ("timestamp",)
 
-                                events.append(event)
-                            else:
-                                events.append(event) # No payload
+            # Set on each generated subclass
+            type: int = -1
+            _keys: Tuple[str, ...] = ()
+            _tails: Tuple[Tuple[str, str], ...] = ()  # (name, length key) pairs
+            _struct: struct.Struct = struct.Struct("<4xQ4x")  # timestamp + payload + padding
+            _payload: struct.Struct = struct.Struct("<")
 
-                            offset += payload_size
+            def __init__(self, timestamp: int = 0):
+                self.timestamp = timestamp
 
-                        else:
-                            print(f"PackFormat.unpack: Unknown event type {event_type}. Cannot continue parsing.", file=sys.stderr)
-                            break
+            @classmethod
+            def from_buffer(cls, buffer: Union[bytes, bytearray, memoryview], offset: int = 0) -> "EventRecord":
+                """
+                Decodes the event whose header starts at `offset`, in a single
+                unpack_from of the header, payload and padding. String tails
+                are decoded too.
+                """
+                record = cls(*cls._struct.unpack_from(buffer, offset))
+                if cls._tails:
+                    record._read_tails(buffer, offset + cls._struct.size)
+                return record
 
-                    except EOFError as e:
-                         print(f"PackFormat.unpack: Not enough data for {e}. Stopping parse.", file=sys.stderr)
-                         break
-                    except struct.error as e:
-                        print(f"PackFormat.unpack: Struct error for {event_enum_val.name if event_enum_val else event_type}: {e}", file=sys.stderr)
-                        break
-                    except Exception as e:
-                        print(f"PackFormat.unpack: General error on {event_enum_val.name if event_enum_val else event_type}: {e}", file=sys.stderr)
-                        break
+            @classmethod
+            def from_payload(cls, buffer: Union[bytes, bytearray, memoryview], offset: int, timestamp: int) -> "EventRecord":
+                """Decodes a payload that has no header of its own, e.g. an EVENT_BATCH entry."""
+                return cls(timestamp, *cls._payload.unpack_from(buffer, offset))
 
-                return events
+            def _read_tails(self, buffer: Union[bytes, bytearray, memoryview], offset: int) -> int:
+                """
+                Decodes the string tails starting at `offset` (the end of the
+                padded struct) and returns where the last one ends.
+                """
+                end = offset
+                for name, length_key in self._tails:
+                    start = (end + 7) & ~7
+                    end = start + getattr(self, length_key)
+                    setattr(self, name, str(buffer[start:end], "utf-8"))
+                return end
+
+            def astuple(self) -> Tuple:
+                """Every payload field in _EVENT_KEY_MAP order."""
+                return tuple(getattr(self, key) for key in self._keys)
+
+            def to_dict(self) -> Dict[str, Any]:
+                """Copies the event out as unpack() would return it."""
+                event = {"type": self.type, "timestamp": self.timestamp}
+                for key in self._keys:
+                    event[key] = getattr(self, key)
+                for name, _ in self._tails:
+                    event[name] = getattr(self, name)
+                for key in PackFormat._DICT_OMITTED_KEYS.get(self.type, ()):
+                    del event[key]
+                return event
+
+            def keys(self) -> Tuple[str, ...]:
+                return ("type", "timestamp") + self._keys + tuple(name for name, _ in self._tails)
+
+            def __contains__(self, key: str) -> bool:
+                return key in self.keys()
+
+            def __getitem__(self, key: str) -> Any:
+                if key not in self:
+                    raise KeyError(key)
+                return getattr(self, key)
+
+            def get(self, key: str, default: Any = None) -> Any:
+                return getattr(self, key) if key in self else default
+
+            def __eq__(self, other: object) -> bool:
+                if type(other) is not type(self):
+                    return NotImplemented
+                return self.to_dict() == other.to_dict()
+
+            __hash__ = None  # Mutable, like the dicts they replace
+
+            def __repr__(self) -> str:
+                return f"{type(self).__name__}({self.to_dict()!r})"
         PYTHON;
     }
 
+    /**
+     * Generates one EventRecord subclass per event, e.g. `SpriteAddEvent`,
+     * with __slots__ for its keys and string tails, an __init__ taking the
+     * timestamp and fields in wire order, and the struct that from_buffer()
+     * decodes it with (the event header minus the type, the payload and the
+     * trailing padding). EVENT_BATCH gets none: its entries are records of
+     * their own type. Ends by registering the classes in
+     * PackFormat._RECORD_CLASSES.
+     */
+    private function generateEventRecordClasses_PYTHON(): string
+    {
+        $output = "";
+        $registry = "";
+
+        foreach ($this->allStructs as $struct) {
+            $enumName = $struct["enumName"];
+            if ($enumName === "EVENT_BATCH") {
+                continue;
+            }
+            $className =
+                str_replace(" ", "", ucwords(strtolower(str_replace("_", " ", $enumName)))) .
+                "Event";
+
+            $keys = [];
+            $params = ["self", "timestamp: int"];
+            foreach ($struct["members"] as $member) {
+                $name = $member["name"];
+                $type = $member["type"];
+                // This filter logic MUST match generatePythonStructFormat
+                if (
+                    str_starts_with($name, "_padding") ||
+                    str_starts_with($type, "u8[") ||
+                    (isset($member["count"]) && $type === "u8")
+                ) {
+                    continue;
+                }
+                $keys[] = $name;
+                $params[] = "{$name}: " . $this->getPythonTypeHint($type);
+            }
+
+            // Only tails with a length member can be found again on the way in
+            $tails = array_values(array_filter(
+                self::DYNAMIC_TAILS[$enumName] ?? [],
+                fn($tail) => $tail[1] !== null,
+            ));
+            foreach ($tails as [$tailName]) {
+                $params[] = "{$tailName}: str = \"\"";
+            }
+
+            $payloadFormat = $this->generatePythonStructFormat($struct);
+            $payloadSize = $this->calculateStructSize($struct);
+            $recordFormat = "<4xQ4x" . substr($payloadFormat === "" ? "<" : $payloadFormat, 1);
+            $padding = $this->alignSize(self::HEADER_SIZE + $payloadSize) - self::HEADER_SIZE - $payloadSize;
+            if ($padding > 0) {
+                $recordFormat .= "{$padding}x";
+            }
+
+            $slots = array_merge($keys, array_column($tails, 0));
+            $quote = fn($name) => "\"{$name}\"";
+            $slotList = implode(", ", array_map($quote, $slots)) . (count($slots) === 1 ? "," : "");
+            $keyList = implode(", ", array_map($quote, $keys)) . (count($keys) === 1 ? "," : "");
+            $tailList = implode(", ", array_map(
+                fn($tail) => "(\"{$tail[0]}\", \"{$tail[1]}\")",
+                $tails,
+            )) . (count($tails) === 1 ? "," : "");
+
+            $output .= "\n\nclass {$className}(EventRecord):\n";
+            $output .= "    \"\"\"{$enumName}, decoded. Maps to Swift: `{$struct["name"]}`\"\"\"\n\n";
+            $output .= "    __slots__ = ({$slotList})\n";
+            $output .= "    type = Events.{$enumName}.value\n";
+            $output .= "    _keys = ({$keyList})\n";
+            if (!empty($tails)) {
+                $output .= "    _tails = ({$tailList})\n";
+            }
+            $output .= "    _struct = struct.Struct(\"{$recordFormat}\")\n";
+            $output .= "    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.{$enumName}.value]\n\n";
+            $output .= "    def __init__(" . implode(", ", $params) . "):\n";
+            $output .= "        self.timestamp = timestamp\n";
+            foreach ($slots as $slot) {
+                $output .= "        self.{$slot} = {$slot}\n";
+            }
+
+            $registry .= "    Events.{$enumName}.value: {$className},\n";
+        }
+
+        $output .= "\n\nPackFormat._RECORD_CLASSES.update({\n";
+        $output .= $registry;
+        $output .= "})\n";
+        return $output;
+    }
+
     /**
      * Returns the implementation of the CommandPacker class as a Python code string.
      */
     private function getCommandPackerClass_PYTHON(): string
     {
-        // This is unmodified, but needs to be here.
         return <<<'PYTHON'
         class CommandPacker:
 
-            def __init__(self, chunk_size: int = 0, chunk_callback: Optional[Callable] = None):
-                self._event_stream = bytearray()
+            _INITIAL_CAPACITY = 64 * 1024
+            # With a shrink policy, the buffer is only reallocated when it is
+            # at least this many times larger than recent frames needed.
+            _SHRINK_RATIO = 4
+
+            # Events with a variable-length tail, packed by hand in _pack_event
+            _DYNAMIC_EVENTS = frozenset((
+                Events.SPRITE_TEXTURE_LOAD,
+                Events.PLUGIN_LOAD,
+                Events.AUDIO_LOAD,
+                Events.TEXT_ADD,
+                Events.TEXT_SET_STRING,
+                Events.EVENT_BATCH,
+            ))
+
+            # Events that are never folded into an EVENT_BATCH
+            _UNBATCHED_EVENTS = PackFormat._VARIABLE_LENGTH_EVENTS
+
+            # EVENT_BATCH header: <IQ4x event header, then (eventType, count)
+            _BATCH_HEADER_STRUCT = PackFormat._EVENT_STRUCT_MAP[Events.EVENT_BATCH]
+            # The (eventType, count) a lone event gains when it becomes a batch
+            _BATCH_COUNT_SIZE = _BATCH_HEADER_STRUCT.size - PackFormat._HEADER_STRUCT.size
+            # The (id1, id2) that starts an entity event's payload
+            _IDS_STRUCT = struct.Struct("<qq")
+
+            # Idempotent "set" events: with coalescing on, a repeat for the
+            # same (id1, id2) in one frame overwrites the earlier event in place.
+            # Keep in sync with COALESCE_EVENTS in PythonAdapter.php.
+            _COALESCE_EVENTS = frozenset((
+                Events.SPRITE_MOVE,
+                Events.SPRITE_SCALE,
+                Events.SPRITE_RESIZE,
+                Events.SPRITE_ROTATE,
+                Events.SPRITE_COLOR,
+                Events.SPRITE_SPEED,
+                Events.SPRITE_TEXTURE_SET,
+                Events.SPRITE_SET_SOURCE_RECT,
+                Events.SPRITE_MOVE_F32,
+                Events.SPRITE_SCALE_F32,
+                Events.SPRITE_ROTATE_F32,
+                Events.SPRITE_SPEED_F32,
+                Events.GEOM_SET_COLOR,
+                Events.PHYSICS_SET_VELOCITY,
+                Events.PHYSICS_SET_POSITION,
+                Events.PHYSICS_SET_ROTATION,
+            ))
+
+            # f64 "set" events and their compact f32 variants. Both set the same
+            # property, so recording one forgets the other's slot: a later event
+            # is never merged into a slot that sits in front of its sibling.
+            _PRECISION_SIBLINGS = {
+                Events.SPRITE_MOVE: Events.SPRITE_MOVE_F32,
+                Events.SPRITE_SCALE: Events.SPRITE_SCALE_F32,
+                Events.SPRITE_ROTATE: Events.SPRITE_ROTATE_F32,
+                Events.SPRITE_SPEED: Events.SPRITE_SPEED_F32,
+                Events.SPRITE_MOVE_F32: Events.SPRITE_MOVE,
+                Events.SPRITE_SCALE_F32: Events.SPRITE_SCALE,
+                Events.SPRITE_ROTATE_F32: Events.SPRITE_ROTATE,
+                Events.SPRITE_SPEED_F32: Events.SPRITE_SPEED,
+            }
+
+            # Every other event addressed to an (id1, id2) entity (adds, removes,
+            # forces, impulses, ...). These are barriers: later "set" events for
+            # that entity are never moved in front of them.
+            _ENTITY_EVENTS = frozenset(
+                event for event in Events
+                if PackFormat._EVENT_KEY_MAP[event][:2] == ["id1", "id2"]
+            ) - _COALESCE_EVENTS
+
+            # Events addressed by an engine handle instead of (id1, id2). The
+            # packer can't tell which entity a handle belongs to, so each one
+            # is a barrier for every pending slot: the index is cleared.
+            _HANDLE_EVENTS = frozenset(
+                event for event in Events
+                if PackFormat._EVENT_KEY_MAP[event][:1] == ["handle"]
+            )
+
+            def __init__(
+                self,
+                chunk_size: int = 0,
+                chunk_callback: Optional[Callable] = None,
+                capacity: int = 0,
+                shrink_after: int = 0,
+                coalesce: bool = False,
+                batch: bool = False,
+            ):
+                """
+                :param capacity: Bytes to presize the buffer for (e.g. a previous
+                                 high-water mark).
+                :param shrink_after: If > 0, every this many reset()s the buffer is
+                                     shrunk when it has become much larger than
+                                     what those frames needed. 0 never shrinks.
+                :param coalesce: If True, repeated _COALESCE_EVENTS for the same
+                                 entity within a frame are merged (last write
+                                 wins) instead of all being sent.
+                :param batch: If True, consecutive fixed-size events of the same
+                              type are sent as one EVENT_BATCH: a single header,
+                              then the payloads back to back.
+                """
+                # Events are packed straight into a preallocated buffer with
+                # pack_into; _offset tracks how much of it is in use. The
+                # first bytes are reserved for the event count, which
+                # finalize() back-patches.
+                self._event_stream = bytearray(CommandPacker._capacity_for(capacity))
+                self._offset = PackFormat._COUNT_STRUCT.size
                 self._command_count = 0
-                self._event_buffer: List[Dict[str, Any]] = []
                 self._chunk_size = chunk_size
                 self._chunk_callback = chunk_callback
+                # Event count at which the chunk callback next fires (0 = never)
+                self._next_chunk = chunk_size
+
+                # Largest number of bytes any frame has used, and the peak
+                # over the current shrink window
+                self._high_water = 0
+                self._shrink_after = shrink_after
+                self._window_peak = 0
+                self._window_frames = 0
+
+                # (id1, id2) -> {event type: offset of this frame's event payload},
+                # or None when coalescing is off
+                self._coalesce_index: Optional[Dict[Tuple[int, int], Dict[int, int]]] = (
+                    {} if coalesce else None
+                )
+                self._coalesced_count = 0
+
+                # The run of same-type events that ends the stream: its type, where
+                # its header starts and how many events it holds (1 = a lone event
+                # with its own header, more = an EVENT_BATCH). It can only be
+                # extended while nothing else has been written after it, i.e.
+                # while _run_end == _offset.
+                self._batching = batch
+                self._run_type = -1
+                self._run_start = 0
+                self._run_count = 0
+                self._run_end = -1
+                # Events folded into a batch without a header of their own
+                self._batched_count = 0
+
+            @staticmethod
+            def _capacity_for(size: int) -> int:
+                """Smallest power-of-two capacity (>= the initial one) holding `size`."""
+                capacity = CommandPacker._INITIAL_CAPACITY
+                while capacity < size:
+                    capacity *= 2
+                return capacity
+
+            def reset(self, chunk_size: Optional[int] = None):
+                """
+                Clears the packer for a new frame but keeps its buffer, so a
+                steady-state frame never reallocates. Views returned by
+                finalize_views() must not be used after this.
+
+                :param chunk_size: Optionally change the chunk size.
+                """
+                used = self._offset
+                if used > self._high_water:
+                    self._high_water = used
+
+                if self._shrink_after > 0:
+                    if used > self._window_peak:
+                        self._window_peak = used
+                    self._window_frames += 1
+                    if self._window_frames >= self._shrink_after:
+                        target = CommandPacker._capacity_for(self._window_peak)
+                        if target * CommandPacker._SHRINK_RATIO <= len(self._event_stream):
+                            self._event_stream = bytearray(target)
+                            self._high_water = self._window_peak
+                        self._window_peak = 0
+                        self._window_frames = 0
+
+                if chunk_size is not None:
+                    self._chunk_size = chunk_size
+                self._offset = PackFormat._COUNT_STRUCT.size
+                self._command_count = 0
+                self._next_chunk = self._chunk_size
+                if self._coalesce_index is not None:
+                    self._coalesce_index.clear()
+                self._coalesced_count = 0
+                self._run_end = -1
+                self._batched_count = 0
+
+            def get_high_water_mark(self) -> int:
+                """Largest number of bytes a single frame has used so far."""
+                return max(self._high_water, self._offset)
+
+            def get_capacity(self) -> int:
+                return len(self._event_stream)
 
             def add(self, event_type: Events, data: list):
                 """
                 Adds a new event to the packer.
 
+                Kept for compatibility; prefer the typed methods
+                (e.g. packer.sprite_move(...)), which skip the list and
+                the event-type dispatch.
+
                 :param event_type: The Events enum member.
                 :param data: A list of arguments for the event, matching the
                              struct definition. For dynamic events, the final
                              arguments must be pre-encoded bytes.
                 """
-                if self._chunk_size > 0:
-                    self._event_buffer.append({"type": event_type, "data": data})
-                    if len(self._event_buffer) >= self._chunk_size:
-                        self._pack_buffered_events()
+                self._pack_event(event_type, data)
+
+            def _grow(self, needed: int):
+                """Grows the buffer (by doubling) until it can hold `needed` bytes."""
+                capacity = len(self._event_stream)
+                while capacity < needed:
+                    capacity *= 2
+                # Copy into a new buffer rather than resizing in place: a
+                # bytearray can't be resized while views from
+                # finalize_views() are still alive.
+                stream = bytearray(capacity)
+                stream[:self._offset] = memoryview(self._event_stream)[:self._offset]
+                self._event_stream = stream
+
+            def _reserve(self, size: int) -> int:
+                """
+                Makes room for `size` more bytes and returns the offset the
+                caller should write at.
+                """
+                offset = self._offset
+                needed = offset + size
+                if needed > len(self._event_stream):
+                    self._grow(needed)
+                self._offset = needed
+                return offset
+
+            def _find_slot(self, event_type: int, id1: int, id2: int) -> int:
+                """Offset of this frame's earlier `event_type` for (id1, id2), or -1."""
+                slots = self._coalesce_index.get((id1, id2))
+                if slots is None:
+                    return -1
+                return slots.get(event_type, -1)
+
+            def _record_slot(self, event_type: int, id1: int, id2: int, offset: int):
+                slots = self._coalesce_index.get((id1, id2))
+                if slots is None:
+                    self._coalesce_index[(id1, id2)] = {event_type: offset}
+                else:
+                    slots[event_type] = offset
+                    sibling = CommandPacker._PRECISION_SIBLINGS.get(event_type)
+                    if sibling is not None:
+                        slots.pop(sibling, None)
+
+            def _batch_offset(self, event_type: int, count: int) -> int:
+                """
+                Batching: makes room for `count` payloads of `event_type` and
+                returns the offset to write them at. Nothing is committed until
+                _join_batch(), so a failed pack_into() leaves the stream intact.
+                """
+                offset = self._offset
+                if offset == self._run_end and event_type == self._run_type:
+                    if self._run_count == 1:
+                        offset += CommandPacker._BATCH_COUNT_SIZE
+                elif count == 1:
+                    offset += PackFormat._HEADER_STRUCT.size
+                else:
+                    offset += CommandPacker._BATCH_HEADER_STRUCT.size
+                end = offset + PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].size * count
+                if end > len(self._event_stream):
+                    self._grow(end)
+                return offset
+
+            def _join_batch(self, event_type: int, offset: int, count: int):
+                """
+                Commits `count` payloads written at `offset` (from _batch_offset):
+                writes the header of a new run, or turns the run that ends the
+                stream into an EVENT_BATCH and updates its count.
+                """
+                stream = self._event_stream
+                stride = PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].size
+                start = self._offset
+                gap = offset - start
+                if gap == PackFormat._HEADER_STRUCT.size:
+                    # A lone event, with its own header
+                    PackFormat._HEADER_STRUCT.pack_into(stream, start, event_type, 0)
+                    self._run_type = event_type
+                    self._run_start = start
+                    self._run_count = 1
+                elif gap == CommandPacker._BATCH_HEADER_STRUCT.size:
+                    # A new batch
+                    CommandPacker._BATCH_HEADER_STRUCT.pack_into(
+                        stream, start, Events.EVENT_BATCH, 0, event_type, count
+                    )
+                    self._run_type = event_type
+                    self._run_start = start
+                    self._run_count = count
+                    self._batched_count += count - 1
                 else:
-                    self._pack_event(event_type, data)
+                    start = self._run_start
+                    shift = CommandPacker._BATCH_COUNT_SIZE
+                    if gap == shift:
+                        # The lone event becomes the first entry: move its payload
+                        # behind the batch header (and its coalescing slot with it)
+                        payload = start + PackFormat._HEADER_STRUCT.size
+                        stream[payload + shift:payload + shift + stride] = stream[payload:payload + stride]
+                        if self._coalesce_index is not None and event_type in CommandPacker._COALESCE_EVENTS:
+                            slots = self._coalesce_index.get(
+                                CommandPacker._IDS_STRUCT.unpack_from(stream, payload + shift)
+                            )
+                            if slots is not None and slots.get(event_type) == payload:
+                                slots[event_type] = payload + shift
+                    self._run_count += count
+                    self._batched_count += count
+                    CommandPacker._BATCH_HEADER_STRUCT.pack_into(
+                        stream, start, Events.EVENT_BATCH, 0, event_type, self._run_count
+                    )
+                self._offset = self._run_end = offset + stride * count
+
+            def _write_bytes(self, data: bytes):
+                """Writes a string tail, zero-padded to the next 8-byte boundary."""
+                size = (len(data) + 7) & ~7
+                offset = self._reserve(size)
+                self._event_stream[offset:offset + size] = data.ljust(size, b"\0")
 
             def _pack_event(self, event_type: Events, data: list):
-                type_value = event_type.value
-                try:
-                    # Pack header: <I (type) <Q (timestamp) = 12 bytes
-                    self._event_stream.extend(struct.pack("<IQ", type_value, 0))
-                except struct.error as e:
-                    print(f"CommandPacker ({event_type.name}): Failed to pack header: {e}", file=sys.stderr)
-                    return
+                # Events is an IntEnum, so event_type can be used directly as
+                # the map key and as the packed type value.
+                event_struct = PackFormat._EVENT_STRUCT_MAP.get(event_type)
+                start = self._offset
+                # Whether this event gets a coalescing slot once it is written
+                record = False
 
                 try:
+                    if event_struct is None:
+                        raise ValueError(f"Could not get payload info for {event_type.name}")
+
+                    index = self._coalesce_index
+                    if index is not None:
+                        if event_type in CommandPacker._COALESCE_EVENTS:
+                            slot = self._find_slot(event_type, data[0], data[1])
+                            if slot >= 0:
+                                # Last write wins: overwrite the earlier payload
+                                PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(
+                                    self._event_stream, slot, *data
+                                )
+                                self._coalesced_count += 1
+                                return
+                            record = True
+                        elif event_type in CommandPacker._ENTITY_EVENTS:
+                            index.pop((data[0], data[1]), None)
+                        elif event_type in CommandPacker._HANDLE_EVENTS:
+                            index.clear()
+
+                    if self._batching and event_type not in CommandPacker._UNBATCHED_EVENTS:
+                        # --- Batched Fixed-Size Event: payload only ---
+                        offset = self._batch_offset(event_type, 1)
+                        PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(
+                            self._event_stream, offset, *data
+                        )
+                        self._join_batch(event_type, offset, 1)
+
+                    elif event_type not in CommandPacker._DYNAMIC_EVENTS:
+                        # --- Fixed-Size Event Packing Logic ---
+                        # event_struct covers the <IQ4x header, the payload
+                        # and the padding up to the next 8-byte boundary
+                        end = start + event_struct.size
+                        if end > len(self._event_stream):
+                            self._grow(end)
+                        event_struct.pack_into(self._event_stream, start, event_type, 0, *data)
+                        self._offset = end
+
                     # --- Manual Packing for Variable-Length Events ---
-                    # These events have a (format, size) for their *header*
+                    # These events have a struct for their *header*
                     # and expect raw bytes as their final argument(s).
-
-                    if event_type == Events.SPRITE_TEXTURE_LOAD:
+                    # The header struct is padded to 8 bytes and so is
+                    # each string tail (see _write_bytes).
+                    elif event_type == Events.SPRITE_TEXTURE_LOAD:
                         # data = [id0(q), id1(q), filenameLength(I), filename_bytes(b"")]
                         if len(data) != 4: raise ValueError(f"TEXTURE_LOAD: Expected 4 args, got {len(data)}")
-                        fmt, _ = PackFormat.get_info(type_value) # ("<qqI4x", 24)
-                        self._event_stream.extend(struct.pack(fmt, data[0], data[1], data[2]))
-                        self._event_stream.extend(data[3]) # data[3] is already bytes
+                        offset = self._reserve(event_struct.size)
+                        event_struct.pack_into(self._event_stream, offset, event_type, 0, data[0], data[1], data[2])
+                        self._write_bytes(data[3]) # data[3] is already bytes
 
                     elif event_type == Events.PLUGIN_LOAD:
-                        # data = [pathLength(I), path_bytes(b"")]
-                        if len(data) != 2: raise ValueError(f"PLUGIN_LOAD: Expected 2 args, got {len(data)}")
-                        fmt, _ = PackFormat.get_info(type_value) # ("<I", 4)
-                        self._event_stream.extend(struct.pack(fmt, data[0]))
-                        self._event_stream.extend(data[1]) # data[1] is already bytes
+                        # data = [channelNo(I), pathLength(I), path_bytes(b"")]
+                        if len(data) != 3: raise ValueError(f"PLUGIN_LOAD: Expected 3 args, got {len(data)}")
+                        offset = self._reserve(event_struct.size)
+                        event_struct.pack_into(self._event_stream, offset, event_type, 0, data[0], data[1])
+                        self._write_bytes(data[2]) # data[2] is already bytes
 
                     elif event_type == Events.AUDIO_LOAD:
                         # data = [pathLength(I), path_bytes(b"")]
                         if len(data) != 2: raise ValueError(f"AUDIO_LOAD: Expected 2 args, got {len(data)}")
-                        fmt, _ = PackFormat.get_info(type_value) # ("<I", 4)
-                        self._event_stream.extend(struct.pack(fmt, data[0]))
-                        self._event_stream.extend(data[1]) # data[1] is already bytes
+                        offset = self._reserve(event_struct.size)
+                        event_struct.pack_into(self._event_stream, offset, event_type, 0, data[0])
+                        self._write_bytes(data[1]) # data[1] is already bytes
 
                     elif event_type == Events.TEXT_ADD:
                         # data = [id0(q), id1(q), ..., fontPath_bytes(b""), text_bytes(b"")]
                         if len(data) != 14: raise ValueError(f"TEXT_ADD: Expected 14 args, got {len(data)}")
-                        fmt, _ = PackFormat.get_info(type_value) # ("<qqdddBBBB4xfII4x", 64)
-                        self._event_stream.extend(struct.pack(
-                            fmt,
+                        offset = self._reserve(event_struct.size)
+                        event_struct.pack_into(
+                            self._event_stream, offset, event_type, 0,
                             data[0], data[1], data[2], data[3], data[4],  # id, pos
                             data[5], data[6], data[7], data[8],  # rgba
                             data[9], data[10], data[11]  # fontSize, fontPathLen, textLen
-                        ))
-                        self._event_stream.extend(data[12]) # fontPath_bytes
-                        self._event_stream.extend(data[13]) # text_bytes
+                        )
+                        self._write_bytes(data[12]) # fontPath_bytes
+                        self._write_bytes(data[13]) # text_bytes
 
                     elif event_type == Events.TEXT_SET_STRING:
                         # data = [id0(q), id1(q), textLength(I), text_bytes(b"")]
                         if len(data) != 4: raise ValueError(f"TEXT_SET_STRING: Expected 4 args, got {len(data)}")
-                        fmt, _ = PackFormat.get_info(type_value) # ("<qqI4x", 24)
-                        self._event_stream.extend(struct.pack(fmt, data[0], data[1], data[2]))
-                        self._event_stream.extend(data[3]) # text_bytes
+                        offset = self._reserve(event_struct.size)
+                        event_struct.pack_into(self._event_stream, offset, event_type, 0, data[0], data[1], data[2])
+                        self._write_bytes(data[3]) # text_bytes
+
+                    elif event_type == Events.EVENT_BATCH:
+                        # data = [eventType(I), count(I), payloads_bytes(b"")]
+                        # The payloads must already be padded to 8 bytes each
+                        if len(data) != 3: raise ValueError(f"EVENT_BATCH: Expected 3 args, got {len(data)}")
+                        offset = self._reserve(event_struct.size)
+                        event_struct.pack_into(self._event_stream, offset, event_type, 0, data[0], data[1])
+                        self._write_bytes(data[2]) # payloads_bytes
+
+                    if record:
+                        self._record_slot(
+                            event_type, data[0], data[1],
+                            self._offset - PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].size
+                        )
+                    self._command_count += 1
+                    if self._command_count == self._next_chunk:
+                        self._chunk_reached()
 
-                    else:
-                        # --- Fixed-Size Event Packing Logic ---
-                        payload_info = PackFormat.get_info(type_value)
-                        if payload_info is None:
-                            raise ValueError(f"Could not get payload info for {event_type.name}")
+                except (struct.error, ValueError, TypeError, IndexError) as e:
+                    # Drop any partially written event
+                    self._offset = start
+                    print(f"CommandPacker ({event_type.name}): Error during pack! {e}", file=sys.stderr)
+                    print(f"  Data: {data}", file=sys.stderr)
 
-                        fmt, size = payload_info
+            def add_many(self, event_type: Events, **columns):
+                """
+                Packs a whole run of one fixed-size event in a single step.
 
-                        if not fmt and data:
-                            raise ValueError(f"Format is empty but data was provided for {event_type.name}")
+                Each keyword is a member name from the struct (see
+                PackFormat._EVENT_KEY_MAP) and each value is a column: a NumPy
+                array, an array.array, or any sequence, all of the same length.
 
-                        if fmt:
-                            # fmt is the pre-compiled struct string (e.g., "<qqd")
-                            self._event_stream.extend(struct.pack(fmt, *data))
+                    packer.add_many(Events.SPRITE_MOVE, id1=ids1, id2=ids2,
+                                    positionX=xs, positionY=ys, positionZ=zs)
 
-                    self._command_count += 1
+                With NumPy installed the columns are copied into a structured
+                array and written with one tobytes(); otherwise each row is
+                packed with pack_into(). With coalescing on, entity events are
+                packed row by row through add() so they can be merged. With
+                batching on, the run is written as (or appended to) one
+                EVENT_BATCH.
+                """
+                try:
+                    if event_type in CommandPacker._DYNAMIC_EVENTS:
+                        raise ValueError("add_many only supports fixed-size events")
+
+                    keys = PackFormat._EVENT_KEY_MAP[event_type]
+                    if set(columns) != set(keys):
+                        raise ValueError(f"Expected columns {keys}, got {list(columns)}")
+
+                    count = len(columns[keys[0]]) if keys else 0
+                    if any(len(column) != count for column in columns.values()):
+                        raise ValueError("All columns must have the same length")
+                    if count == 0:
+                        return
+
+                    if self._coalesce_index is not None and (
+                        event_type in CommandPacker._COALESCE_EVENTS
+                        or event_type in CommandPacker._ENTITY_EVENTS
+                    ):
+                        for row in zip(*(columns[key] for key in keys)):
+                            self._pack_event(event_type, list(row))
+                        return
+                    if self._coalesce_index is not None and event_type in CommandPacker._HANDLE_EVENTS:
+                        self._coalesce_index.clear()
+
+                    if self._batching and event_type not in CommandPacker._UNBATCHED_EVENTS:
+                        # Payloads only, committed by _join_batch once all are written
+                        payload_struct = PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type]
+                        offset = self._batch_offset(event_type, count)
+                        end = offset + payload_struct.size * count
+                        if np is not None:
+                            records = np.zeros(count, dtype=PackFormat.get_dtype(event_type, header=False))
+                            for key in keys:
+                                records[key] = columns[key]
+                            self._event_stream[offset:end] = records.tobytes()
+                        else:
+                            stride = payload_struct.size
+                            rows = zip(*(columns[key] for key in keys))
+                            for i, row in enumerate(rows):
+                                payload_struct.pack_into(self._event_stream, offset + i * stride, *row)
+                        self._join_batch(event_type, offset, count)
+                    else:
+                        event_struct = PackFormat._EVENT_STRUCT_MAP[event_type]
+                        offset = self._offset
+                        end = offset + event_struct.size * count
+                        if end > len(self._event_stream):
+                            self._grow(end)
+
+                        if np is not None:
+                            records = np.zeros(count, dtype=PackFormat.get_dtype(event_type))
+                            records["type"] = event_type
+                            for key in keys:
+                                records[key] = columns[key]
+                            self._event_stream[offset:end] = records.tobytes()
+                        else:
+                            stride = event_struct.size
+                            rows = zip(*(columns[key] for key in keys))
+                            for i, row in enumerate(rows):
+                                event_struct.pack_into(self._event_stream, offset + i * stride, event_type, 0, *row)
+                        self._offset = end
 
                 except (struct.error, ValueError, TypeError) as e:
-                    print(f"CommandPacker ({event_type.name}): Error during pack! {e}", file=sys.stderr)
-                    print(f"  Data: {data}", file=sys.stderr)
-
-            def _pack_buffered_events(self):
-                if not self._event_buffer:
+                    print(f"CommandPacker ({event_type.name}): Error during add_many! {e}", file=sys.stderr)
                     return
-                for event in self._event_buffer:
-                    self._pack_event(event["type"], event["data"])
 
-                if self._chunk_callback:
-                    self._chunk_callback(len(self._event_buffer), self._command_count)
+                self._command_count += count
+                while 0 < self._next_chunk <= self._command_count:
+                    self._chunk_reached()
 
-                self._event_buffer = []
+            def _chunk_reached(self):
+                if self._chunk_callback:
+                    self._chunk_callback(self._chunk_size, self._command_count)
+                self._next_chunk += self._chunk_size
 
             def flush(self):
-                if self._event_buffer:
-                    self._pack_buffered_events()
+                # Events are packed as they are added; nothing is held back.
+                pass
 
-            def finalize(self) -> bytes:
+            def finalize_views(self) -> List[memoryview]:
+                """
+                Back-patches the event count into its reserved slot and returns
+                the finished stream as a list of memoryviews, without copying.
+                The views are only valid until the packer is written to again.
+                """
                 self.flush()
                 if self._command_count == 0:
-                    return b""
-                # Prepend count (<I) and return the full byte stream
-                return struct.pack("<I", self._command_count) + self._event_stream
+                    return []
+                # Batched events share their batch's header, so the stream holds
+                # fewer top-level events than were packed
+                PackFormat._COUNT_STRUCT.pack_into(
+                    self._event_stream, 0, self._command_count - self._batched_count
+                )
+                return [memoryview(self._event_stream)[:self._offset]]
+
+            def finalize(self) -> bytes:
+                views = self.finalize_views()
+                return views[0].tobytes() if views else b""
 
             def get_buffer_count(self) -> int:
-                return len(self._event_buffer)
+                """Events packed since the last chunk callback."""
+                if self._chunk_size <= 0:
+                    return self._command_count
+                return self._command_count - (self._next_chunk - self._chunk_size)
 
             def get_total_event_count(self) -> int:
-                return self._command_count + len(self._event_buffer)
+                return self._command_count
+
+            def get_coalesced_count(self) -> int:
+                """Events merged into an earlier one since the last reset()."""
+                return self._coalesced_count
+
+            def get_batched_count(self) -> int:
+                """Events sent inside an EVENT_BATCH without a header of their own since the last reset()."""
+                return self._batched_count
         PYTHON;
     }
 
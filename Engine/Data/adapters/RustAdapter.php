@@ -105,7 +105,9 @@ class RustAdapter extends BaseAdapter
         // Get all dynamic structs to generate pack helpers for
         $dynamicStructs = [];
         foreach ($this->allStructs as $struct) {
-            if ($struct["isDynamic"]) {
+            // EVENT_BATCH's tail is other events' payloads, not a string;
+            // its u32 members would be taken for padding below.
+            if ($struct["isDynamic"] && $struct["enumName"] !== "EVENT_BATCH") {
                 $dynamicStructs[] = $struct;
             }
         }
@@ -32,7 +32,11 @@ class SwiftAdapter extends BaseAdapter
                 "    case " . $this->snakeToCamel($enumName) . " = {$id}\n";
             $lastCategory = $category;
         }
-        $output .= "}\n";
+        $output .= "}\n\n";
+        $output .= "/// Hash of the wire layout in structs.json, compared with the client's\n";
+        $output .= "/// during the IPC handshake.\n";
+        $output .=
+            "public let PHROST_SCHEMA_HASH: UInt64 = 0x" . $this->getSchemaHash() . "\n";
         file_put_contents($outputFile, $output);
     }
 
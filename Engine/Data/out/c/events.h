@@ -24,6 +24,16 @@ typedef enum {
     EVENT_SPRITE_TEXTURE_LOAD = 8,
     EVENT_SPRITE_TEXTURE_SET = 9,
     EVENT_SPRITE_SET_SOURCE_RECT = 10,
+    EVENT_SPRITE_MOVE_F32 = 11,
+    EVENT_SPRITE_SCALE_F32 = 12,
+    EVENT_SPRITE_ROTATE_F32 = 13,
+    EVENT_SPRITE_SPEED_F32 = 14,
+    EVENT_SPRITE_BIND_HANDLE = 15,
+    EVENT_SPRITE_RELEASE_HANDLE = 16,
+    EVENT_SPRITE_MOVE_HANDLE = 17,
+    EVENT_SPRITE_SCALE_HANDLE = 18,
+    EVENT_SPRITE_ROTATE_HANDLE = 19,
+    EVENT_SPRITE_SPEED_HANDLE = 20,
     EVENT_GEOM_ADD_POINT = 50,
     EVENT_GEOM_ADD_LINE = 51,
     EVENT_GEOM_ADD_RECT = 52,
@@ -62,6 +72,11 @@ typedef enum {
     EVENT_PHYSICS_SET_VELOCITY = 504,
     EVENT_PHYSICS_SET_POSITION = 505,
     EVENT_PHYSICS_SET_ROTATION = 506,
+    EVENT_PHYSICS_BIND_HANDLE = 507,
+    EVENT_PHYSICS_RELEASE_HANDLE = 508,
+    EVENT_PHYSICS_SET_VELOCITY_HANDLE = 509,
+    EVENT_PHYSICS_SET_POSITION_HANDLE = 510,
+    EVENT_PHYSICS_SET_ROTATION_HANDLE = 511,
     EVENT_PHYSICS_COLLISION_BEGIN = 550,
     EVENT_PHYSICS_COLLISION_SEPARATE = 551,
     EVENT_PHYSICS_SYNC_TRANSFORM = 552,
@@ -84,6 +99,8 @@ typedef enum {
 
     EVENT_SCRIPT_SUBSCRIBE = 3000,
     EVENT_SCRIPT_UNSUBSCRIBE = 3001,
+
+    EVENT_EVENT_BATCH = 4000,
 } PhrostEventID;
 
 // --- Packed Struct Definitions ---
@@ -170,6 +187,12 @@ typedef struct {
     uint8_t _unused; // Padding to ensure non-zero struct size (MSVC compatibility).
 } PackedCameraStopFollowingEvent;
 
+// Header for a run of same-type fixed-size events. `count` payloads of `eventType` follow, each padded to 8 bytes, with no per-event header.
+typedef struct {
+    uint32_t eventType; // Event ID of every payload in the batch (a fixed-size event).
+    uint32_t count; // Number of payloads that follow this header.
+} PackedEventBatchHeaderEvent;
+
 // Payload for adding a single geometry line.
 typedef struct {
     int64_t id1; // Primary identifier.
@@ -310,6 +333,14 @@ typedef struct {
     double impulseY; // Impulse vector Y component.
 } PackedPhysicsApplyImpulseEvent;
 
+// Binds a dense u32 handle to a physics body for the *_HANDLE events.
+typedef struct {
+    int64_t id1; // Primary ID of the body.
+    int64_t id2; // Secondary ID of the body.
+    uint32_t handle; // Handle to bind (reuses a released handle's slot).
+    uint32_t _padding; // Padding for alignment.
+} PackedPhysicsBindHandleEvent;
+
 // Payload sent *from* engine when two bodies begin colliding.
 typedef struct {
     int64_t id1_A; // Primary ID of the first body.
@@ -318,6 +349,12 @@ typedef struct {
     int64_t id2_B; // Secondary ID of the second body.
 } PackedPhysicsCollisionEvent;
 
+// Unbinds a body handle. PHYSICS_REMOVE_BODY also drops the body's handle.
+typedef struct {
+    uint32_t handle; // Handle to release.
+    uint32_t _padding; // Padding for alignment.
+} PackedPhysicsReleaseHandleEvent;
+
 // Payload for removing a physics body.
 typedef struct {
     int64_t id1; // Primary ID of body to remove.
@@ -338,6 +375,14 @@ typedef struct {
     double positionY; // New Y position.
 } PackedPhysicsSetPositionEvent;
 
+// PHYSICS_SET_POSITION addressed by handle.
+typedef struct {
+    uint32_t handle; // Entity handle bound by PHYSICS_BIND_HANDLE.
+    uint32_t _padding; // Padding for alignment.
+    double positionX; // New X position.
+    double positionY; // New Y position.
+} PackedPhysicsSetPositionHandleEvent;
+
 // Payload to set a body's rotation.
 typedef struct {
     int64_t id1; // Primary ID of the body.
@@ -345,6 +390,13 @@ typedef struct {
     double angleInRadians; // New angle in radians.
 } PackedPhysicsSetRotationEvent;
 
+// PHYSICS_SET_ROTATION addressed by handle.
+typedef struct {
+    uint32_t handle; // Entity handle bound by PHYSICS_BIND_HANDLE.
+    uint32_t _padding; // Padding for alignment.
+    double angleInRadians; // New angle in radians.
+} PackedPhysicsSetRotationHandleEvent;
+
 // Payload to set a body's linear velocity.
 typedef struct {
     int64_t id1; // Primary ID of the body.
@@ -353,6 +405,14 @@ typedef struct {
     double velocityY; // New Y velocity.
 } PackedPhysicsSetVelocityEvent;
 
+// PHYSICS_SET_VELOCITY addressed by handle.
+typedef struct {
+    uint32_t handle; // Entity handle bound by PHYSICS_BIND_HANDLE.
+    uint32_t _padding; // Padding for alignment.
+    double velocityX; // New X velocity.
+    double velocityY; // New Y velocity.
+} PackedPhysicsSetVelocityHandleEvent;
+
 // Payload sent *from* engine to sync 2D physics state back to client.
 typedef struct {
     int64_t id1; // Primary ID of the body.
@@ -444,6 +504,14 @@ typedef struct {
     double speedY; // Initial Y speed.
 } PackedSpriteAddEvent;
 
+// Binds a dense u32 handle to a sprite for the *_HANDLE events.
+typedef struct {
+    int64_t id1; // Primary ID of the sprite.
+    int64_t id2; // Secondary ID of the sprite.
+    uint32_t handle; // Handle to bind (reuses a released handle's slot).
+    uint32_t _padding; // Padding for alignment.
+} PackedSpriteBindHandleEvent;
+
 // Payload to set a sprite's color modulation.
 typedef struct {
     int64_t id1; // Primary ID of the sprite.
@@ -464,6 +532,30 @@ typedef struct {
     double positionZ; // New Z position (depth).
 } PackedSpriteMoveEvent;
 
+// Compact SPRITE_MOVE with f32 coordinates.
+typedef struct {
+    int64_t id1; // Primary ID of the sprite.
+    int64_t id2; // Secondary ID of the sprite.
+    float positionX; // New X position.
+    float positionY; // New Y position.
+    float positionZ; // New Z position (depth).
+    uint32_t _padding; // Padding for alignment.
+} PackedSpriteMoveF32Event;
+
+// SPRITE_MOVE_F32 addressed by handle.
+typedef struct {
+    uint32_t handle; // Entity handle bound by SPRITE_BIND_HANDLE.
+    float positionX; // New X position.
+    float positionY; // New Y position.
+    float positionZ; // New Z position (depth).
+} PackedSpriteMoveHandleEvent;
+
+// Unbinds a sprite handle. SPRITE_REMOVE also drops the sprite's handle.
+typedef struct {
+    uint32_t handle; // Handle to release.
+    uint32_t _padding; // Padding for alignment.
+} PackedSpriteReleaseHandleEvent;
+
 // Payload for removing a sprite from the scene.
 typedef struct {
     int64_t id1; // Primary ID of sprite to remove.
@@ -487,6 +579,24 @@ typedef struct {
     double rotationZ; // New Z rotation (in radians).
 } PackedSpriteRotateEvent;
 
+// Compact SPRITE_ROTATE with f32 angles.
+typedef struct {
+    int64_t id1; // Primary ID of the sprite.
+    int64_t id2; // Secondary ID of the sprite.
+    float rotationX; // New X rotation (in radians).
+    float rotationY; // New Y rotation (in radians).
+    float rotationZ; // New Z rotation (in radians).
+    uint32_t _padding; // Padding for alignment.
+} PackedSpriteRotateF32Event;
+
+// SPRITE_ROTATE_F32 addressed by handle.
+typedef struct {
+    uint32_t handle; // Entity handle bound by SPRITE_BIND_HANDLE.
+    float rotationX; // New X rotation (in radians).
+    float rotationY; // New Y rotation (in radians).
+    float rotationZ; // New Z rotation (in radians).
+} PackedSpriteRotateHandleEvent;
+
 // Payload to set a sprite's scale.
 typedef struct {
     int64_t id1; // Primary ID of the sprite.
@@ -496,6 +606,24 @@ typedef struct {
     double scaleZ; // New Z scale.
 } PackedSpriteScaleEvent;
 
+// Compact SPRITE_SCALE with f32 components.
+typedef struct {
+    int64_t id1; // Primary ID of the sprite.
+    int64_t id2; // Secondary ID of the sprite.
+    float scaleX; // New X scale.
+    float scaleY; // New Y scale.
+    float scaleZ; // New Z scale.
+    uint32_t _padding; // Padding for alignment.
+} PackedSpriteScaleF32Event;
+
+// SPRITE_SCALE_F32 addressed by handle.
+typedef struct {
+    uint32_t handle; // Entity handle bound by SPRITE_BIND_HANDLE.
+    float scaleX; // New X scale.
+    float scaleY; // New Y scale.
+    float scaleZ; // New Z scale.
+} PackedSpriteScaleHandleEvent;
+
 // Sets the source rectangle (spritesheet clipping) for a sprite.
 typedef struct {
     int64_t id1; // Primary ID of the sprite.
@@ -514,6 +642,22 @@ typedef struct {
     double speedY; // New Y speed.
 } PackedSpriteSpeedEvent;
 
+// Compact SPRITE_SPEED with f32 components.
+typedef struct {
+    int64_t id1; // Primary ID of the sprite.
+    int64_t id2; // Secondary ID of the sprite.
+    float speedX; // New X speed.
+    float speedY; // New Y speed.
+} PackedSpriteSpeedF32Event;
+
+// SPRITE_SPEED_F32 addressed by handle.
+typedef struct {
+    uint32_t handle; // Entity handle bound by SPRITE_BIND_HANDLE.
+    float speedX; // New X speed.
+    float speedY; // New Y speed.
+    uint32_t _padding; // Padding for alignment.
+} PackedSpriteSpeedHandleEvent;
+
 // Payload to set a sprite's texture to an already loaded one.
 typedef struct {
     int64_t id1; // Primary ID of the sprite.
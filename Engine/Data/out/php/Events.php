@@ -19,6 +19,16 @@ enum Events: int
     case SPRITE_TEXTURE_LOAD = 8;
     case SPRITE_TEXTURE_SET = 9;
     case SPRITE_SET_SOURCE_RECT = 10;
+    case SPRITE_MOVE_F32 = 11;
+    case SPRITE_SCALE_F32 = 12;
+    case SPRITE_ROTATE_F32 = 13;
+    case SPRITE_SPEED_F32 = 14;
+    case SPRITE_BIND_HANDLE = 15;
+    case SPRITE_RELEASE_HANDLE = 16;
+    case SPRITE_MOVE_HANDLE = 17;
+    case SPRITE_SCALE_HANDLE = 18;
+    case SPRITE_ROTATE_HANDLE = 19;
+    case SPRITE_SPEED_HANDLE = 20;
     case GEOM_ADD_POINT = 50;
     case GEOM_ADD_LINE = 51;
     case GEOM_ADD_RECT = 52;
@@ -57,6 +67,11 @@ enum Events: int
     case PHYSICS_SET_VELOCITY = 504;
     case PHYSICS_SET_POSITION = 505;
     case PHYSICS_SET_ROTATION = 506;
+    case PHYSICS_BIND_HANDLE = 507;
+    case PHYSICS_RELEASE_HANDLE = 508;
+    case PHYSICS_SET_VELOCITY_HANDLE = 509;
+    case PHYSICS_SET_POSITION_HANDLE = 510;
+    case PHYSICS_SET_ROTATION_HANDLE = 511;
     case PHYSICS_COLLISION_BEGIN = 550;
     case PHYSICS_COLLISION_SEPARATE = 551;
     case PHYSICS_SYNC_TRANSFORM = 552;
@@ -79,6 +94,8 @@ enum Events: int
 
     case SCRIPT_SUBSCRIBE = 3000;
     case SCRIPT_UNSUBSCRIBE = 3001;
+
+    case EVENT_BATCH = 4000;
 }
 // --- End Events Enum ---
 
@@ -206,6 +223,100 @@ class SpritePackFormats
      */
     public const PACK_SPRITE_SET_SOURCE_RECT = "qid1/qid2/gx/gy/gw/gh";
 
+    /**
+     * Maps to Swift: `PackedSpriteMoveF32Event`
+     * - id1: i64 (Primary ID of the sprite.)
+     * - id2: i64 (Secondary ID of the sprite.)
+     * - positionX: f32 (New X position.)
+     * - positionY: f32 (New Y position.)
+     * - positionZ: f32 (New Z position (depth).)
+     * - _padding: u32 (Padding for alignment.)
+     */
+    public const PACK_SPRITE_MOVE_F32 = "qid1/qid2/gpositionX/gpositionY/gpositionZ/x4_padding";
+
+    /**
+     * Maps to Swift: `PackedSpriteScaleF32Event`
+     * - id1: i64 (Primary ID of the sprite.)
+     * - id2: i64 (Secondary ID of the sprite.)
+     * - scaleX: f32 (New X scale.)
+     * - scaleY: f32 (New Y scale.)
+     * - scaleZ: f32 (New Z scale.)
+     * - _padding: u32 (Padding for alignment.)
+     */
+    public const PACK_SPRITE_SCALE_F32 = "qid1/qid2/gscaleX/gscaleY/gscaleZ/x4_padding";
+
+    /**
+     * Maps to Swift: `PackedSpriteRotateF32Event`
+     * - id1: i64 (Primary ID of the sprite.)
+     * - id2: i64 (Secondary ID of the sprite.)
+     * - rotationX: f32 (New X rotation (in radians).)
+     * - rotationY: f32 (New Y rotation (in radians).)
+     * - rotationZ: f32 (New Z rotation (in radians).)
+     * - _padding: u32 (Padding for alignment.)
+     */
+    public const PACK_SPRITE_ROTATE_F32 = "qid1/qid2/grotationX/grotationY/grotationZ/x4_padding";
+
+    /**
+     * Maps to Swift: `PackedSpriteSpeedF32Event`
+     * - id1: i64 (Primary ID of the sprite.)
+     * - id2: i64 (Secondary ID of the sprite.)
+     * - speedX: f32 (New X speed.)
+     * - speedY: f32 (New Y speed.)
+     */
+    public const PACK_SPRITE_SPEED_F32 = "qid1/qid2/gspeedX/gspeedY";
+
+    /**
+     * Maps to Swift: `PackedSpriteBindHandleEvent`
+     * - id1: i64 (Primary ID of the sprite.)
+     * - id2: i64 (Secondary ID of the sprite.)
+     * - handle: u32 (Handle to bind (reuses a released handle's slot).)
+     * - _padding: u32 (Padding for alignment.)
+     */
+    public const PACK_SPRITE_BIND_HANDLE = "qid1/qid2/Vhandle/x4_padding";
+
+    /**
+     * Maps to Swift: `PackedSpriteReleaseHandleEvent`
+     * - handle: u32 (Handle to release.)
+     * - _padding: u32 (Padding for alignment.)
+     */
+    public const PACK_SPRITE_RELEASE_HANDLE = "Vhandle/x4_padding";
+
+    /**
+     * Maps to Swift: `PackedSpriteMoveHandleEvent`
+     * - handle: u32 (Entity handle bound by SPRITE_BIND_HANDLE.)
+     * - positionX: f32 (New X position.)
+     * - positionY: f32 (New Y position.)
+     * - positionZ: f32 (New Z position (depth).)
+     */
+    public const PACK_SPRITE_MOVE_HANDLE = "Vhandle/gpositionX/gpositionY/gpositionZ";
+
+    /**
+     * Maps to Swift: `PackedSpriteScaleHandleEvent`
+     * - handle: u32 (Entity handle bound by SPRITE_BIND_HANDLE.)
+     * - scaleX: f32 (New X scale.)
+     * - scaleY: f32 (New Y scale.)
+     * - scaleZ: f32 (New Z scale.)
+     */
+    public const PACK_SPRITE_SCALE_HANDLE = "Vhandle/gscaleX/gscaleY/gscaleZ";
+
+    /**
+     * Maps to Swift: `PackedSpriteRotateHandleEvent`
+     * - handle: u32 (Entity handle bound by SPRITE_BIND_HANDLE.)
+     * - rotationX: f32 (New X rotation (in radians).)
+     * - rotationY: f32 (New Y rotation (in radians).)
+     * - rotationZ: f32 (New Z rotation (in radians).)
+     */
+    public const PACK_SPRITE_ROTATE_HANDLE = "Vhandle/grotationX/grotationY/grotationZ";
+
+    /**
+     * Maps to Swift: `PackedSpriteSpeedHandleEvent`
+     * - handle: u32 (Entity handle bound by SPRITE_BIND_HANDLE.)
+     * - speedX: f32 (New X speed.)
+     * - speedY: f32 (New Y speed.)
+     * - _padding: u32 (Padding for alignment.)
+     */
+    public const PACK_SPRITE_SPEED_HANDLE = "Vhandle/gspeedX/gspeedY/x4_padding";
+
     /**
      * Maps to Swift: `PackedGeomAddPointEvent`
      * - id1: i64 (Primary identifier.)
@@ -551,6 +662,48 @@ class PhysicsPackFormats
      */
     public const PACK_PHYSICS_SET_ROTATION = "qid1/qid2/eangleInRadians";
 
+    /**
+     * Maps to Swift: `PackedPhysicsBindHandleEvent`
+     * - id1: i64 (Primary ID of the body.)
+     * - id2: i64 (Secondary ID of the body.)
+     * - handle: u32 (Handle to bind (reuses a released handle's slot).)
+     * - _padding: u32 (Padding for alignment.)
+     */
+    public const PACK_PHYSICS_BIND_HANDLE = "qid1/qid2/Vhandle/x4_padding";
+
+    /**
+     * Maps to Swift: `PackedPhysicsReleaseHandleEvent`
+     * - handle: u32 (Handle to release.)
+     * - _padding: u32 (Padding for alignment.)
+     */
+    public const PACK_PHYSICS_RELEASE_HANDLE = "Vhandle/x4_padding";
+
+    /**
+     * Maps to Swift: `PackedPhysicsSetVelocityHandleEvent`
+     * - handle: u32 (Entity handle bound by PHYSICS_BIND_HANDLE.)
+     * - _padding: u32 (Padding for alignment.)
+     * - velocityX: f64 (New X velocity.)
+     * - velocityY: f64 (New Y velocity.)
+     */
+    public const PACK_PHYSICS_SET_VELOCITY_HANDLE = "Vhandle/x4_padding/evelocityX/evelocityY";
+
+    /**
+     * Maps to Swift: `PackedPhysicsSetPositionHandleEvent`
+     * - handle: u32 (Entity handle bound by PHYSICS_BIND_HANDLE.)
+     * - _padding: u32 (Padding for alignment.)
+     * - positionX: f64 (New X position.)
+     * - positionY: f64 (New Y position.)
+     */
+    public const PACK_PHYSICS_SET_POSITION_HANDLE = "Vhandle/x4_padding/epositionX/epositionY";
+
+    /**
+     * Maps to Swift: `PackedPhysicsSetRotationHandleEvent`
+     * - handle: u32 (Entity handle bound by PHYSICS_BIND_HANDLE.)
+     * - _padding: u32 (Padding for alignment.)
+     * - angleInRadians: f64 (New angle in radians.)
+     */
+    public const PACK_PHYSICS_SET_ROTATION_HANDLE = "Vhandle/x4_padding/eangleInRadians";
+
     /**
      * Maps to Swift: `PackedPhysicsCollisionEvent`
      * - id1_A: i64 (Primary ID of the first body.)
@@ -693,6 +846,17 @@ class ScriptPackFormats
      */
     public const PACK_SCRIPT_UNSUBSCRIBE = "VchannelNo/x4_padding";
 }
+
+class BatchPackFormats
+{
+    /**
+     * Maps to Swift: `PackedEventBatchHeaderEvent`
+     * (Header struct)
+     * - eventType: u32 (Event ID of every payload in the batch (a fixed-size event).)
+     * - count: u32 (Number of payloads that follow this header.)
+     */
+    public const PACK_EVENT_BATCH = "VeventType/Vcount";
+}
 // --- End Pack Format Classes ---
 
 // --- PackFormat Class ---
@@ -714,6 +878,16 @@ class PackFormat
         Events::SPRITE_TEXTURE_LOAD->value => SpritePackFormats::PACK_SPRITE_TEXTURE_LOAD,
         Events::SPRITE_TEXTURE_SET->value => SpritePackFormats::PACK_SPRITE_TEXTURE_SET,
         Events::SPRITE_SET_SOURCE_RECT->value => SpritePackFormats::PACK_SPRITE_SET_SOURCE_RECT,
+        Events::SPRITE_MOVE_F32->value => SpritePackFormats::PACK_SPRITE_MOVE_F32,
+        Events::SPRITE_SCALE_F32->value => SpritePackFormats::PACK_SPRITE_SCALE_F32,
+        Events::SPRITE_ROTATE_F32->value => SpritePackFormats::PACK_SPRITE_ROTATE_F32,
+        Events::SPRITE_SPEED_F32->value => SpritePackFormats::PACK_SPRITE_SPEED_F32,
+        Events::SPRITE_BIND_HANDLE->value => SpritePackFormats::PACK_SPRITE_BIND_HANDLE,
+        Events::SPRITE_RELEASE_HANDLE->value => SpritePackFormats::PACK_SPRITE_RELEASE_HANDLE,
+        Events::SPRITE_MOVE_HANDLE->value => SpritePackFormats::PACK_SPRITE_MOVE_HANDLE,
+        Events::SPRITE_SCALE_HANDLE->value => SpritePackFormats::PACK_SPRITE_SCALE_HANDLE,
+        Events::SPRITE_ROTATE_HANDLE->value => SpritePackFormats::PACK_SPRITE_ROTATE_HANDLE,
+        Events::SPRITE_SPEED_HANDLE->value => SpritePackFormats::PACK_SPRITE_SPEED_HANDLE,
         Events::GEOM_ADD_POINT->value => SpritePackFormats::PACK_GEOM_ADD_POINT,
         Events::GEOM_ADD_LINE->value => SpritePackFormats::PACK_GEOM_ADD_LINE,
         Events::GEOM_ADD_RECT->value => SpritePackFormats::PACK_GEOM_ADD_RECT,
@@ -747,6 +921,11 @@ class PackFormat
         Events::PHYSICS_SET_VELOCITY->value => PhysicsPackFormats::PACK_PHYSICS_SET_VELOCITY,
         Events::PHYSICS_SET_POSITION->value => PhysicsPackFormats::PACK_PHYSICS_SET_POSITION,
         Events::PHYSICS_SET_ROTATION->value => PhysicsPackFormats::PACK_PHYSICS_SET_ROTATION,
+        Events::PHYSICS_BIND_HANDLE->value => PhysicsPackFormats::PACK_PHYSICS_BIND_HANDLE,
+        Events::PHYSICS_RELEASE_HANDLE->value => PhysicsPackFormats::PACK_PHYSICS_RELEASE_HANDLE,
+        Events::PHYSICS_SET_VELOCITY_HANDLE->value => PhysicsPackFormats::PACK_PHYSICS_SET_VELOCITY_HANDLE,
+        Events::PHYSICS_SET_POSITION_HANDLE->value => PhysicsPackFormats::PACK_PHYSICS_SET_POSITION_HANDLE,
+        Events::PHYSICS_SET_ROTATION_HANDLE->value => PhysicsPackFormats::PACK_PHYSICS_SET_ROTATION_HANDLE,
         Events::PHYSICS_COLLISION_BEGIN->value => PhysicsPackFormats::UNPACK_PHYSICS_COLLISION,
         Events::PHYSICS_COLLISION_SEPARATE->value => PhysicsPackFormats::UNPACK_PHYSICS_COLLISION,
         Events::PHYSICS_SYNC_TRANSFORM->value => PhysicsPackFormats::UNPACK_PHYSICS_SYNC_TRANSFORM,
@@ -766,6 +945,7 @@ class PackFormat
         Events::CAMERA_STOP_FOLLOWING->value => CameraPackFormats::PACK_CAMERA_STOP_FOLLOWING,
         Events::SCRIPT_SUBSCRIBE->value => ScriptPackFormats::PACK_SCRIPT_SUBSCRIBE,
         Events::SCRIPT_UNSUBSCRIBE->value => ScriptPackFormats::PACK_SCRIPT_UNSUBSCRIBE,
+        Events::EVENT_BATCH->value => BatchPackFormats::PACK_EVENT_BATCH,
     ];
 
     /**
@@ -822,9 +1002,8 @@ class PackFormat
                     }
                 }
 
-                $count = $repeater === "" || !ctype_digit($repeater)
-                            ? 1
-                            : (int) $repeater;
+                // The pattern above leaves only digits (or nothing) here
+                $count = $repeater === "" ? 1 : (int) $repeater;
                 $size = $sizeMap[$code] ?? 0;
                 if ($size === 0 && $code !== "@") {
                     error_log(
@@ -6,9 +6,15 @@
 
 import enum
 import random
+import re
 import struct
 import sys
-from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Collection, Dict, Iterator, List, Optional, Tuple, Union
+
+try:
+    import numpy as np
+except ImportError:
+    np = None  # Optional: only the bulk (add_many) path uses it
 
 # --- Events Enum ---
 class Events(enum.IntEnum):
@@ -23,6 +29,16 @@ class Events(enum.IntEnum):
     SPRITE_TEXTURE_LOAD = 8
     SPRITE_TEXTURE_SET = 9
     SPRITE_SET_SOURCE_RECT = 10
+    SPRITE_MOVE_F32 = 11
+    SPRITE_SCALE_F32 = 12
+    SPRITE_ROTATE_F32 = 13
+    SPRITE_SPEED_F32 = 14
+    SPRITE_BIND_HANDLE = 15
+    SPRITE_RELEASE_HANDLE = 16
+    SPRITE_MOVE_HANDLE = 17
+    SPRITE_SCALE_HANDLE = 18
+    SPRITE_ROTATE_HANDLE = 19
+    SPRITE_SPEED_HANDLE = 20
     GEOM_ADD_POINT = 50
     GEOM_ADD_LINE = 51
     GEOM_ADD_RECT = 52
@@ -61,6 +77,11 @@ class Events(enum.IntEnum):
     PHYSICS_SET_VELOCITY = 504
     PHYSICS_SET_POSITION = 505
     PHYSICS_SET_ROTATION = 506
+    PHYSICS_BIND_HANDLE = 507
+    PHYSICS_RELEASE_HANDLE = 508
+    PHYSICS_SET_VELOCITY_HANDLE = 509
+    PHYSICS_SET_POSITION_HANDLE = 510
+    PHYSICS_SET_ROTATION_HANDLE = 511
     PHYSICS_COLLISION_BEGIN = 550
     PHYSICS_COLLISION_SEPARATE = 551
     PHYSICS_SYNC_TRANSFORM = 552
@@ -83,6 +104,13 @@ class Events(enum.IntEnum):
 
     SCRIPT_SUBSCRIBE = 3000
     SCRIPT_UNSUBSCRIBE = 3001
+
+    EVENT_BATCH = 4000
+
+
+# Hash of the wire layout in structs.json, compared with the engine's
+# during the IPC handshake
+SCHEMA_HASH = 0x29069964d87e6b90
 # --- End Events Enum ---
 
 # --- Pack Format Classes ---
@@ -230,6 +258,120 @@ class SpritePackFormats:
     # Size: 32 bytes
     PACK_SPRITE_SET_SOURCE_RECT: Tuple[str, int] = ("<qqffff", 32)
 
+    """
+    Maps to Swift: `PackedSpriteMoveF32Event`
+    - id1: i64 (Primary ID of the sprite.)
+    - id2: i64 (Secondary ID of the sprite.)
+    - positionX: f32 (New X position.)
+    - positionY: f32 (New Y position.)
+    - positionZ: f32 (New Z position (depth).)
+    - _padding: u32 (Padding for alignment.)
+    """
+    # Format: <qqfff4x
+    # Size: 32 bytes
+    PACK_SPRITE_MOVE_F32: Tuple[str, int] = ("<qqfff4x", 32)
+
+    """
+    Maps to Swift: `PackedSpriteScaleF32Event`
+    - id1: i64 (Primary ID of the sprite.)
+    - id2: i64 (Secondary ID of the sprite.)
+    - scaleX: f32 (New X scale.)
+    - scaleY: f32 (New Y scale.)
+    - scaleZ: f32 (New Z scale.)
+    - _padding: u32 (Padding for alignment.)
+    """
+    # Format: <qqfff4x
+    # Size: 32 bytes
+    PACK_SPRITE_SCALE_F32: Tuple[str, int] = ("<qqfff4x", 32)
+
+    """
+    Maps to Swift: `PackedSpriteRotateF32Event`
+    - id1: i64 (Primary ID of the sprite.)
+    - id2: i64 (Secondary ID of the sprite.)
+    - rotationX: f32 (New X rotation (in radians).)
+    - rotationY: f32 (New Y rotation (in radians).)
+    - rotationZ: f32 (New Z rotation (in radians).)
+    - _padding: u32 (Padding for alignment.)
+    """
+    # Format: <qqfff4x
+    # Size: 32 bytes
+    PACK_SPRITE_ROTATE_F32: Tuple[str, int] = ("<qqfff4x", 32)
+
+    """
+    Maps to Swift: `PackedSpriteSpeedF32Event`
+    - id1: i64 (Primary ID of the sprite.)
+    - id2: i64 (Secondary ID of the sprite.)
+    - speedX: f32 (New X speed.)
+    - speedY: f32 (New Y speed.)
+    """
+    # Format: <qqff
+    # Size: 24 bytes
+    PACK_SPRITE_SPEED_F32: Tuple[str, int] = ("<qqff", 24)
+
+    """
+    Maps to Swift: `PackedSpriteBindHandleEvent`
+    - id1: i64 (Primary ID of the sprite.)
+    - id2: i64 (Secondary ID of the sprite.)
+    - handle: u32 (Handle to bind (reuses a released handle's slot).)
+    - _padding: u32 (Padding for alignment.)
+    """
+    # Format: <qqI4x
+    # Size: 24 bytes
+    PACK_SPRITE_BIND_HANDLE: Tuple[str, int] = ("<qqI4x", 24)
+
+    """
+    Maps to Swift: `PackedSpriteReleaseHandleEvent`
+    - handle: u32 (Handle to release.)
+    - _padding: u32 (Padding for alignment.)
+    """
+    # Format: <I4x
+    # Size: 8 bytes
+    PACK_SPRITE_RELEASE_HANDLE: Tuple[str, int] = ("<I4x", 8)
+
+    """
+    Maps to Swift: `PackedSpriteMoveHandleEvent`
+    - handle: u32 (Entity handle bound by SPRITE_BIND_HANDLE.)
+    - positionX: f32 (New X position.)
+    - positionY: f32 (New Y position.)
+    - positionZ: f32 (New Z position (depth).)
+    """
+    # Format: <Ifff
+    # Size: 16 bytes
+    PACK_SPRITE_MOVE_HANDLE: Tuple[str, int] = ("<Ifff", 16)
+
+    """
+    Maps to Swift: `PackedSpriteScaleHandleEvent`
+    - handle: u32 (Entity handle bound by SPRITE_BIND_HANDLE.)
+    - scaleX: f32 (New X scale.)
+    - scaleY: f32 (New Y scale.)
+    - scaleZ: f32 (New Z scale.)
+    """
+    # Format: <Ifff
+    # Size: 16 bytes
+    PACK_SPRITE_SCALE_HANDLE: Tuple[str, int] = ("<Ifff", 16)
+
+    """
+    Maps to Swift: `PackedSpriteRotateHandleEvent`
+    - handle: u32 (Entity handle bound by SPRITE_BIND_HANDLE.)
+    - rotationX: f32 (New X rotation (in radians).)
+    - rotationY: f32 (New Y rotation (in radians).)
+    - rotationZ: f32 (New Z rotation (in radians).)
+    """
+    # Format: <Ifff
+    # Size: 16 bytes
+    PACK_SPRITE_ROTATE_HANDLE: Tuple[str, int] = ("<Ifff", 16)
+
+    """
+    Maps to Swift: `PackedSpriteSpeedHandleEvent`
+    - handle: u32 (Entity handle bound by SPRITE_BIND_HANDLE.)
+    - speedX: f32 (New X speed.)
+    - speedY: f32 (New Y speed.)
+    - _padding: u32 (Padding for alignment.)
+    """
+    # Format: <Iff4x
+    # Size: 16 bytes
+    PACK_SPRITE_SPEED_HANDLE: Tuple[str, int] = ("<Iff4x", 16)
+
     """
     Maps to Swift: `PackedGeomAddPointEvent`
     - id1: i64 (Primary identifier.)
@@ -631,6 +773,58 @@ class PhysicsPackFormats:
     # Size: 24 bytes
     PACK_PHYSICS_SET_ROTATION: Tuple[str, int] = ("<qqd", 24)
 
+    """
+    Maps to Swift: `PackedPhysicsBindHandleEvent`
+    - id1: i64 (Primary ID of the body.)
+    - id2: i64 (Secondary ID of the body.)
+    - handle: u32 (Handle to bind (reuses a released handle's slot).)
+    - _padding: u32 (Padding for alignment.)
+    """
+    # Format: <qqI4x
+    # Size: 24 bytes
+    PACK_PHYSICS_BIND_HANDLE: Tuple[str, int] = ("<qqI4x", 24)
+
+    """
+    Maps to Swift: `PackedPhysicsReleaseHandleEvent`
+    - handle: u32 (Handle to release.)
+    - _padding: u32 (Padding for alignment.)
+    """
+    # Format: <I4x
+    # Size: 8 bytes
+    PACK_PHYSICS_RELEASE_HANDLE: Tuple[str, int] = ("<I4x", 8)
+
+    """
+    Maps to Swift: `PackedPhysicsSetVelocityHandleEvent`
+    - handle: u32 (Entity handle bound by PHYSICS_BIND_HANDLE.)
+    - _padding: u32 (Padding for alignment.)
+    - velocityX: f64 (New X velocity.)
+    - velocityY: f64 (New Y velocity.)
+    """
+    # Format: <I4xdd
+    # Size: 24 bytes
+    PACK_PHYSICS_SET_VELOCITY_HANDLE: Tuple[str, int] = ("<I4xdd", 24)
+
+    """
+    Maps to Swift: `PackedPhysicsSetPositionHandleEvent`
+    - handle: u32 (Entity handle bound by PHYSICS_BIND_HANDLE.)
+    - _padding: u32 (Padding for alignment.)
+    - positionX: f64 (New X position.)
+    - positionY: f64 (New Y position.)
+    """
+    # Format: <I4xdd
+    # Size: 24 bytes
+    PACK_PHYSICS_SET_POSITION_HANDLE: Tuple[str, int] = ("<I4xdd", 24)
+
+    """
+    Maps to Swift: `PackedPhysicsSetRotationHandleEvent`
+    - handle: u32 (Entity handle bound by PHYSICS_BIND_HANDLE.)
+    - _padding: u32 (Padding for alignment.)
+    - angleInRadians: f64 (New angle in radians.)
+    """
+    # Format: <I4xd
+    # Size: 16 bytes
+    PACK_PHYSICS_SET_ROTATION_HANDLE: Tuple[str, int] = ("<I4xd", 16)
+
     """
     Maps to Swift: `PackedPhysicsCollisionEvent`
     - id1_A: i64 (Primary ID of the first body.)
@@ -801,7 +995,18 @@ class ScriptPackFormats:
     """
     # Format: <I4x
     # Size: 8 bytes
-    PACK_SCRIPT_UNSUBSCRIBE: Tuple[str, int] = ("<I4x", 8)# --- End Pack Format Classes ---
+    PACK_SCRIPT_UNSUBSCRIBE: Tuple[str, int] = ("<I4x", 8)
+
+class BatchPackFormats:
+    """
+    Maps to Swift: `PackedEventBatchHeaderEvent`
+    (Header struct)
+    - eventType: u32 (Event ID of every payload in the batch (a fixed-size event).)
+    - count: u32 (Number of payloads that follow this header.)
+    """
+    # Format: <II
+    # Size: 8 bytes
+    PACK_EVENT_BATCH: Tuple[str, int] = ("<II", 8)# --- End Pack Format Classes ---
 
 # --- PackFormat Class ---
 class PackFormat:
@@ -818,6 +1023,16 @@ class PackFormat:
         Events.SPRITE_TEXTURE_LOAD.value: SpritePackFormats.PACK_SPRITE_TEXTURE_LOAD,
         Events.SPRITE_TEXTURE_SET.value: SpritePackFormats.PACK_SPRITE_TEXTURE_SET,
         Events.SPRITE_SET_SOURCE_RECT.value: SpritePackFormats.PACK_SPRITE_SET_SOURCE_RECT,
+        Events.SPRITE_MOVE_F32.value: SpritePackFormats.PACK_SPRITE_MOVE_F32,
+        Events.SPRITE_SCALE_F32.value: SpritePackFormats.PACK_SPRITE_SCALE_F32,
+        Events.SPRITE_ROTATE_F32.value: SpritePackFormats.PACK_SPRITE_ROTATE_F32,
+        Events.SPRITE_SPEED_F32.value: SpritePackFormats.PACK_SPRITE_SPEED_F32,
+        Events.SPRITE_BIND_HANDLE.value: SpritePackFormats.PACK_SPRITE_BIND_HANDLE,
+        Events.SPRITE_RELEASE_HANDLE.value: SpritePackFormats.PACK_SPRITE_RELEASE_HANDLE,
+        Events.SPRITE_MOVE_HANDLE.value: SpritePackFormats.PACK_SPRITE_MOVE_HANDLE,
+        Events.SPRITE_SCALE_HANDLE.value: SpritePackFormats.PACK_SPRITE_SCALE_HANDLE,
+        Events.SPRITE_ROTATE_HANDLE.value: SpritePackFormats.PACK_SPRITE_ROTATE_HANDLE,
+        Events.SPRITE_SPEED_HANDLE.value: SpritePackFormats.PACK_SPRITE_SPEED_HANDLE,
         Events.GEOM_ADD_POINT.value: SpritePackFormats.PACK_GEOM_ADD_POINT,
         Events.GEOM_ADD_LINE.value: SpritePackFormats.PACK_GEOM_ADD_LINE,
         Events.GEOM_ADD_RECT.value: SpritePackFormats.PACK_GEOM_ADD_RECT,
@@ -851,6 +1066,11 @@ class PackFormat:
         Events.PHYSICS_SET_VELOCITY.value: PhysicsPackFormats.PACK_PHYSICS_SET_VELOCITY,
         Events.PHYSICS_SET_POSITION.value: PhysicsPackFormats.PACK_PHYSICS_SET_POSITION,
         Events.PHYSICS_SET_ROTATION.value: PhysicsPackFormats.PACK_PHYSICS_SET_ROTATION,
+        Events.PHYSICS_BIND_HANDLE.value: PhysicsPackFormats.PACK_PHYSICS_BIND_HANDLE,
+        Events.PHYSICS_RELEASE_HANDLE.value: PhysicsPackFormats.PACK_PHYSICS_RELEASE_HANDLE,
+        Events.PHYSICS_SET_VELOCITY_HANDLE.value: PhysicsPackFormats.PACK_PHYSICS_SET_VELOCITY_HANDLE,
+        Events.PHYSICS_SET_POSITION_HANDLE.value: PhysicsPackFormats.PACK_PHYSICS_SET_POSITION_HANDLE,
+        Events.PHYSICS_SET_ROTATION_HANDLE.value: PhysicsPackFormats.PACK_PHYSICS_SET_ROTATION_HANDLE,
         Events.PHYSICS_COLLISION_BEGIN.value: PhysicsPackFormats.UNPACK_PHYSICS_COLLISION,
         Events.PHYSICS_COLLISION_SEPARATE.value: PhysicsPackFormats.UNPACK_PHYSICS_COLLISION,
         Events.PHYSICS_SYNC_TRANSFORM.value: PhysicsPackFormats.UNPACK_PHYSICS_SYNC_TRANSFORM,
@@ -870,6 +1090,260 @@ class PackFormat:
         Events.CAMERA_STOP_FOLLOWING.value: CameraPackFormats.PACK_CAMERA_STOP_FOLLOWING,
         Events.SCRIPT_SUBSCRIBE.value: ScriptPackFormats.PACK_SCRIPT_SUBSCRIBE,
         Events.SCRIPT_UNSUBSCRIBE.value: ScriptPackFormats.PACK_SCRIPT_UNSUBSCRIBE,
+        Events.EVENT_BATCH.value: BatchPackFormats.PACK_EVENT_BATCH,
+    }
+
+    # Pre-compiled structs, so the hot path never re-parses a format string
+    _COUNT_STRUCT = struct.Struct("<I4x")
+    _HEADER_STRUCT = struct.Struct("<IQ4x")
+
+    # Header + payload + padding, indexed by event id (used by CommandPacker)
+    _EVENT_STRUCT_MAP: Dict[int, struct.Struct] = {
+        Events.SPRITE_ADD.value: struct.Struct("<IQ4xqqdddddddddddBBBB4xdd"),
+        Events.SPRITE_REMOVE.value: struct.Struct("<IQ4xqq"),
+        Events.SPRITE_MOVE.value: struct.Struct("<IQ4xqqddd"),
+        Events.SPRITE_SCALE.value: struct.Struct("<IQ4xqqddd"),
+        Events.SPRITE_RESIZE.value: struct.Struct("<IQ4xqqdd"),
+        Events.SPRITE_ROTATE.value: struct.Struct("<IQ4xqqddd"),
+        Events.SPRITE_COLOR.value: struct.Struct("<IQ4xqqBBBB4x"),
+        Events.SPRITE_SPEED.value: struct.Struct("<IQ4xqqdd"),
+        Events.SPRITE_TEXTURE_LOAD.value: struct.Struct("<IQ4xqqI4x"),
+        Events.SPRITE_TEXTURE_SET.value: struct.Struct("<IQ4xqqQ"),
+        Events.SPRITE_SET_SOURCE_RECT.value: struct.Struct("<IQ4xqqffff"),
+        Events.SPRITE_MOVE_F32.value: struct.Struct("<IQ4xqqfff4x"),
+        Events.SPRITE_SCALE_F32.value: struct.Struct("<IQ4xqqfff4x"),
+        Events.SPRITE_ROTATE_F32.value: struct.Struct("<IQ4xqqfff4x"),
+        Events.SPRITE_SPEED_F32.value: struct.Struct("<IQ4xqqff"),
+        Events.SPRITE_BIND_HANDLE.value: struct.Struct("<IQ4xqqI4x"),
+        Events.SPRITE_RELEASE_HANDLE.value: struct.Struct("<IQ4xI4x"),
+        Events.SPRITE_MOVE_HANDLE.value: struct.Struct("<IQ4xIfff"),
+        Events.SPRITE_SCALE_HANDLE.value: struct.Struct("<IQ4xIfff"),
+        Events.SPRITE_ROTATE_HANDLE.value: struct.Struct("<IQ4xIfff"),
+        Events.SPRITE_SPEED_HANDLE.value: struct.Struct("<IQ4xIff4x"),
+        Events.GEOM_ADD_POINT.value: struct.Struct("<IQ4xqqdBBBBB3xff"),
+        Events.GEOM_ADD_LINE.value: struct.Struct("<IQ4xqqdBBBBB3xffff"),
+        Events.GEOM_ADD_RECT.value: struct.Struct("<IQ4xqqdBBBBB3xffff"),
+        Events.GEOM_ADD_FILL_RECT.value: struct.Struct("<IQ4xqqdBBBBB3xffff"),
+        Events.GEOM_ADD_PACKED.value: struct.Struct("<IQ4xqqdBBBBB2xII1x"),
+        Events.GEOM_REMOVE.value: struct.Struct("<IQ4xqq"),
+        Events.GEOM_SET_COLOR.value: struct.Struct("<IQ4xqqBBBB4x"),
+        Events.INPUT_KEYUP.value: struct.Struct("<IQ4xiIHBx4x"),
+        Events.INPUT_KEYDOWN.value: struct.Struct("<IQ4xiIHBx4x"),
+        Events.INPUT_MOUSEUP.value: struct.Struct("<IQ4xffBB2x4x"),
+        Events.INPUT_MOUSEDOWN.value: struct.Struct("<IQ4xffBB2x4x"),
+        Events.INPUT_MOUSEMOTION.value: struct.Struct("<IQ4xffff"),
+        Events.WINDOW_TITLE.value: struct.Struct("<IQ4x256s"),
+        Events.WINDOW_RESIZE.value: struct.Struct("<IQ4xii"),
+        Events.WINDOW_FLAGS.value: struct.Struct("<IQ4xQ"),
+        Events.TEXT_ADD.value: struct.Struct("<IQ4xqqdddBBBB4xfII4x"),
+        Events.TEXT_SET_STRING.value: struct.Struct("<IQ4xqqI4x"),
+        Events.AUDIO_LOAD.value: struct.Struct("<IQ4xI4x"),
+        Events.AUDIO_LOADED.value: struct.Struct("<IQ4xQ"),
+        Events.AUDIO_PLAY.value: struct.Struct("<IQ4xQ"),
+        Events.AUDIO_STOP_ALL.value: struct.Struct("<IQ4xB7x"),
+        Events.AUDIO_SET_MASTER_VOLUME.value: struct.Struct("<IQ4xf4x"),
+        Events.AUDIO_PAUSE.value: struct.Struct("<IQ4xQ"),
+        Events.AUDIO_STOP.value: struct.Struct("<IQ4xQ"),
+        Events.AUDIO_UNLOAD.value: struct.Struct("<IQ4xQ"),
+        Events.AUDIO_SET_VOLUME.value: struct.Struct("<IQ4xQf4x"),
+        Events.PHYSICS_ADD_BODY.value: struct.Struct("<IQ4xqqddBBB5xddddd"),
+        Events.PHYSICS_REMOVE_BODY.value: struct.Struct("<IQ4xqq"),
+        Events.PHYSICS_APPLY_FORCE.value: struct.Struct("<IQ4xqqdd"),
+        Events.PHYSICS_APPLY_IMPULSE.value: struct.Struct("<IQ4xqqdd"),
+        Events.PHYSICS_SET_VELOCITY.value: struct.Struct("<IQ4xqqdd"),
+        Events.PHYSICS_SET_POSITION.value: struct.Struct("<IQ4xqqdd"),
+        Events.PHYSICS_SET_ROTATION.value: struct.Struct("<IQ4xqqd"),
+        Events.PHYSICS_BIND_HANDLE.value: struct.Struct("<IQ4xqqI4x"),
+        Events.PHYSICS_RELEASE_HANDLE.value: struct.Struct("<IQ4xI4x"),
+        Events.PHYSICS_SET_VELOCITY_HANDLE.value: struct.Struct("<IQ4xI4xdd"),
+        Events.PHYSICS_SET_POSITION_HANDLE.value: struct.Struct("<IQ4xI4xdd"),
+        Events.PHYSICS_SET_ROTATION_HANDLE.value: struct.Struct("<IQ4xI4xd"),
+        Events.PHYSICS_COLLISION_BEGIN.value: struct.Struct("<IQ4xqqqq"),
+        Events.PHYSICS_COLLISION_SEPARATE.value: struct.Struct("<IQ4xqqqq"),
+        Events.PHYSICS_SYNC_TRANSFORM.value: struct.Struct("<IQ4xqqddddddB7x"),
+        Events.PHYSICS_SET_DEBUG_MODE.value: struct.Struct("<IQ4xB3x4x"),
+        Events.PLUGIN.value: struct.Struct("<IQ4xB7x"),
+        Events.PLUGIN_LOAD.value: struct.Struct("<IQ4xII"),
+        Events.PLUGIN_UNLOAD.value: struct.Struct("<IQ4xB7x"),
+        Events.PLUGIN_SET.value: struct.Struct("<IQ4xB7x"),
+        Events.PLUGIN_EVENT_STACKING.value: struct.Struct("<IQ4xBx6x"),
+        Events.PLUGIN_SUBSCRIBE_EVENT.value: struct.Struct("<IQ4xB3xI"),
+        Events.PLUGIN_UNSUBSCRIBE_EVENT.value: struct.Struct("<IQ4xB3xI"),
+        Events.CAMERA_SET_POSITION.value: struct.Struct("<IQ4xdd"),
+        Events.CAMERA_MOVE.value: struct.Struct("<IQ4xdd"),
+        Events.CAMERA_SET_ZOOM.value: struct.Struct("<IQ4xd"),
+        Events.CAMERA_SET_ROTATION.value: struct.Struct("<IQ4xd"),
+        Events.CAMERA_FOLLOW_ENTITY.value: struct.Struct("<IQ4xqq"),
+        Events.CAMERA_STOP_FOLLOWING.value: struct.Struct("<IQ4xB7x"),
+        Events.SCRIPT_SUBSCRIBE.value: struct.Struct("<IQ4xI4x"),
+        Events.SCRIPT_UNSUBSCRIBE.value: struct.Struct("<IQ4xI4x"),
+        Events.EVENT_BATCH.value: struct.Struct("<IQ4xII"),
+    }
+
+    # Payload only, indexed by event id (used by unpack)
+    _PAYLOAD_STRUCT_MAP: Dict[int, struct.Struct] = {
+        Events.SPRITE_ADD.value: struct.Struct("<qqdddddddddddBBBB4xdd"),
+        Events.SPRITE_REMOVE.value: struct.Struct("<qq"),
+        Events.SPRITE_MOVE.value: struct.Struct("<qqddd"),
+        Events.SPRITE_SCALE.value: struct.Struct("<qqddd"),
+        Events.SPRITE_RESIZE.value: struct.Struct("<qqdd"),
+        Events.SPRITE_ROTATE.value: struct.Struct("<qqddd"),
+        Events.SPRITE_COLOR.value: struct.Struct("<qqBBBB4x"),
+        Events.SPRITE_SPEED.value: struct.Struct("<qqdd"),
+        Events.SPRITE_TEXTURE_LOAD.value: struct.Struct("<qqI4x"),
+        Events.SPRITE_TEXTURE_SET.value: struct.Struct("<qqQ"),
+        Events.SPRITE_SET_SOURCE_RECT.value: struct.Struct("<qqffff"),
+        Events.SPRITE_MOVE_F32.value: struct.Struct("<qqfff4x"),
+        Events.SPRITE_SCALE_F32.value: struct.Struct("<qqfff4x"),
+        Events.SPRITE_ROTATE_F32.value: struct.Struct("<qqfff4x"),
+        Events.SPRITE_SPEED_F32.value: struct.Struct("<qqff"),
+        Events.SPRITE_BIND_HANDLE.value: struct.Struct("<qqI4x"),
+        Events.SPRITE_RELEASE_HANDLE.value: struct.Struct("<I4x"),
+        Events.SPRITE_MOVE_HANDLE.value: struct.Struct("<Ifff"),
+        Events.SPRITE_SCALE_HANDLE.value: struct.Struct("<Ifff"),
+        Events.SPRITE_ROTATE_HANDLE.value: struct.Struct("<Ifff"),
+        Events.SPRITE_SPEED_HANDLE.value: struct.Struct("<Iff4x"),
+        Events.GEOM_ADD_POINT.value: struct.Struct("<qqdBBBBB3xff"),
+        Events.GEOM_ADD_LINE.value: struct.Struct("<qqdBBBBB3xffff"),
+        Events.GEOM_ADD_RECT.value: struct.Struct("<qqdBBBBB3xffff"),
+        Events.GEOM_ADD_FILL_RECT.value: struct.Struct("<qqdBBBBB3xffff"),
+        Events.GEOM_ADD_PACKED.value: struct.Struct("<qqdBBBBB2xII"),
+        Events.GEOM_REMOVE.value: struct.Struct("<qq"),
+        Events.GEOM_SET_COLOR.value: struct.Struct("<qqBBBB4x"),
+        Events.INPUT_KEYUP.value: struct.Struct("<iIHBx"),
+        Events.INPUT_KEYDOWN.value: struct.Struct("<iIHBx"),
+        Events.INPUT_MOUSEUP.value: struct.Struct("<ffBB2x"),
+        Events.INPUT_MOUSEDOWN.value: struct.Struct("<ffBB2x"),
+        Events.INPUT_MOUSEMOTION.value: struct.Struct("<ffff"),
+        Events.WINDOW_TITLE.value: struct.Struct("<256s"),
+        Events.WINDOW_RESIZE.value: struct.Struct("<ii"),
+        Events.WINDOW_FLAGS.value: struct.Struct("<Q"),
+        Events.TEXT_ADD.value: struct.Struct("<qqdddBBBB4xfII4x"),
+        Events.TEXT_SET_STRING.value: struct.Struct("<qqI4x"),
+        Events.AUDIO_LOAD.value: struct.Struct("<I"),
+        Events.AUDIO_LOADED.value: struct.Struct("<Q"),
+        Events.AUDIO_PLAY.value: struct.Struct("<Q"),
+        Events.AUDIO_STOP_ALL.value: struct.Struct("<B"),
+        Events.AUDIO_SET_MASTER_VOLUME.value: struct.Struct("<f"),
+        Events.AUDIO_PAUSE.value: struct.Struct("<Q"),
+        Events.AUDIO_STOP.value: struct.Struct("<Q"),
+        Events.AUDIO_UNLOAD.value: struct.Struct("<Q"),
+        Events.AUDIO_SET_VOLUME.value: struct.Struct("<Qf4x"),
+        Events.PHYSICS_ADD_BODY.value: struct.Struct("<qqddBBB5xddddd"),
+        Events.PHYSICS_REMOVE_BODY.value: struct.Struct("<qq"),
+        Events.PHYSICS_APPLY_FORCE.value: struct.Struct("<qqdd"),
+        Events.PHYSICS_APPLY_IMPULSE.value: struct.Struct("<qqdd"),
+        Events.PHYSICS_SET_VELOCITY.value: struct.Struct("<qqdd"),
+        Events.PHYSICS_SET_POSITION.value: struct.Struct("<qqdd"),
+        Events.PHYSICS_SET_ROTATION.value: struct.Struct("<qqd"),
+        Events.PHYSICS_BIND_HANDLE.value: struct.Struct("<qqI4x"),
+        Events.PHYSICS_RELEASE_HANDLE.value: struct.Struct("<I4x"),
+        Events.PHYSICS_SET_VELOCITY_HANDLE.value: struct.Struct("<I4xdd"),
+        Events.PHYSICS_SET_POSITION_HANDLE.value: struct.Struct("<I4xdd"),
+        Events.PHYSICS_SET_ROTATION_HANDLE.value: struct.Struct("<I4xd"),
+        Events.PHYSICS_COLLISION_BEGIN.value: struct.Struct("<qqqq"),
+        Events.PHYSICS_COLLISION_SEPARATE.value: struct.Struct("<qqqq"),
+        Events.PHYSICS_SYNC_TRANSFORM.value: struct.Struct("<qqddddddB7x"),
+        Events.PHYSICS_SET_DEBUG_MODE.value: struct.Struct("<B3x"),
+        Events.PLUGIN.value: struct.Struct("<B"),
+        Events.PLUGIN_LOAD.value: struct.Struct("<II"),
+        Events.PLUGIN_UNLOAD.value: struct.Struct("<B"),
+        Events.PLUGIN_SET.value: struct.Struct("<B"),
+        Events.PLUGIN_EVENT_STACKING.value: struct.Struct("<Bx"),
+        Events.PLUGIN_SUBSCRIBE_EVENT.value: struct.Struct("<B3xI"),
+        Events.PLUGIN_UNSUBSCRIBE_EVENT.value: struct.Struct("<B3xI"),
+        Events.CAMERA_SET_POSITION.value: struct.Struct("<dd"),
+        Events.CAMERA_MOVE.value: struct.Struct("<dd"),
+        Events.CAMERA_SET_ZOOM.value: struct.Struct("<d"),
+        Events.CAMERA_SET_ROTATION.value: struct.Struct("<d"),
+        Events.CAMERA_FOLLOW_ENTITY.value: struct.Struct("<qq"),
+        Events.CAMERA_STOP_FOLLOWING.value: struct.Struct("<B"),
+        Events.SCRIPT_SUBSCRIBE.value: struct.Struct("<I4x"),
+        Events.SCRIPT_UNSUBSCRIBE.value: struct.Struct("<I4x"),
+        Events.EVENT_BATCH.value: struct.Struct("<II"),
+    }
+
+    # Payload + padding, indexed by event id (one entry of an EVENT_BATCH)
+    _BATCH_PAYLOAD_STRUCT_MAP: Dict[int, struct.Struct] = {
+        Events.SPRITE_ADD.value: struct.Struct("<qqdddddddddddBBBB4xdd"),
+        Events.SPRITE_REMOVE.value: struct.Struct("<qq"),
+        Events.SPRITE_MOVE.value: struct.Struct("<qqddd"),
+        Events.SPRITE_SCALE.value: struct.Struct("<qqddd"),
+        Events.SPRITE_RESIZE.value: struct.Struct("<qqdd"),
+        Events.SPRITE_ROTATE.value: struct.Struct("<qqddd"),
+        Events.SPRITE_COLOR.value: struct.Struct("<qqBBBB4x"),
+        Events.SPRITE_SPEED.value: struct.Struct("<qqdd"),
+        Events.SPRITE_TEXTURE_LOAD.value: struct.Struct("<qqI4x"),
+        Events.SPRITE_TEXTURE_SET.value: struct.Struct("<qqQ"),
+        Events.SPRITE_SET_SOURCE_RECT.value: struct.Struct("<qqffff"),
+        Events.SPRITE_MOVE_F32.value: struct.Struct("<qqfff4x"),
+        Events.SPRITE_SCALE_F32.value: struct.Struct("<qqfff4x"),
+        Events.SPRITE_ROTATE_F32.value: struct.Struct("<qqfff4x"),
+        Events.SPRITE_SPEED_F32.value: struct.Struct("<qqff"),
+        Events.SPRITE_BIND_HANDLE.value: struct.Struct("<qqI4x"),
+        Events.SPRITE_RELEASE_HANDLE.value: struct.Struct("<I4x"),
+        Events.SPRITE_MOVE_HANDLE.value: struct.Struct("<Ifff"),
+        Events.SPRITE_SCALE_HANDLE.value: struct.Struct("<Ifff"),
+        Events.SPRITE_ROTATE_HANDLE.value: struct.Struct("<Ifff"),
+        Events.SPRITE_SPEED_HANDLE.value: struct.Struct("<Iff4x"),
+        Events.GEOM_ADD_POINT.value: struct.Struct("<qqdBBBBB3xff"),
+        Events.GEOM_ADD_LINE.value: struct.Struct("<qqdBBBBB3xffff"),
+        Events.GEOM_ADD_RECT.value: struct.Struct("<qqdBBBBB3xffff"),
+        Events.GEOM_ADD_FILL_RECT.value: struct.Struct("<qqdBBBBB3xffff"),
+        Events.GEOM_ADD_PACKED.value: struct.Struct("<qqdBBBBB2xII1x"),
+        Events.GEOM_REMOVE.value: struct.Struct("<qq"),
+        Events.GEOM_SET_COLOR.value: struct.Struct("<qqBBBB4x"),
+        Events.INPUT_KEYUP.value: struct.Struct("<iIHBx4x"),
+        Events.INPUT_KEYDOWN.value: struct.Struct("<iIHBx4x"),
+        Events.INPUT_MOUSEUP.value: struct.Struct("<ffBB2x4x"),
+        Events.INPUT_MOUSEDOWN.value: struct.Struct("<ffBB2x4x"),
+        Events.INPUT_MOUSEMOTION.value: struct.Struct("<ffff"),
+        Events.WINDOW_TITLE.value: struct.Struct("<256s"),
+        Events.WINDOW_RESIZE.value: struct.Struct("<ii"),
+        Events.WINDOW_FLAGS.value: struct.Struct("<Q"),
+        Events.TEXT_ADD.value: struct.Struct("<qqdddBBBB4xfII4x"),
+        Events.TEXT_SET_STRING.value: struct.Struct("<qqI4x"),
+        Events.AUDIO_LOAD.value: struct.Struct("<I4x"),
+        Events.AUDIO_LOADED.value: struct.Struct("<Q"),
+        Events.AUDIO_PLAY.value: struct.Struct("<Q"),
+        Events.AUDIO_STOP_ALL.value: struct.Struct("<B7x"),
+        Events.AUDIO_SET_MASTER_VOLUME.value: struct.Struct("<f4x"),
+        Events.AUDIO_PAUSE.value: struct.Struct("<Q"),
+        Events.AUDIO_STOP.value: struct.Struct("<Q"),
+        Events.AUDIO_UNLOAD.value: struct.Struct("<Q"),
+        Events.AUDIO_SET_VOLUME.value: struct.Struct("<Qf4x"),
+        Events.PHYSICS_ADD_BODY.value: struct.Struct("<qqddBBB5xddddd"),
+        Events.PHYSICS_REMOVE_BODY.value: struct.Struct("<qq"),
+        Events.PHYSICS_APPLY_FORCE.value: struct.Struct("<qqdd"),
+        Events.PHYSICS_APPLY_IMPULSE.value: struct.Struct("<qqdd"),
+        Events.PHYSICS_SET_VELOCITY.value: struct.Struct("<qqdd"),
+        Events.PHYSICS_SET_POSITION.value: struct.Struct("<qqdd"),
+        Events.PHYSICS_SET_ROTATION.value: struct.Struct("<qqd"),
+        Events.PHYSICS_BIND_HANDLE.value: struct.Struct("<qqI4x"),
+        Events.PHYSICS_RELEASE_HANDLE.value: struct.Struct("<I4x"),
+        Events.PHYSICS_SET_VELOCITY_HANDLE.value: struct.Struct("<I4xdd"),
+        Events.PHYSICS_SET_POSITION_HANDLE.value: struct.Struct("<I4xdd"),
+        Events.PHYSICS_SET_ROTATION_HANDLE.value: struct.Struct("<I4xd"),
+        Events.PHYSICS_COLLISION_BEGIN.value: struct.Struct("<qqqq"),
+        Events.PHYSICS_COLLISION_SEPARATE.value: struct.Struct("<qqqq"),
+        Events.PHYSICS_SYNC_TRANSFORM.value: struct.Struct("<qqddddddB7x"),
+        Events.PHYSICS_SET_DEBUG_MODE.value: struct.Struct("<B3x4x"),
+        Events.PLUGIN.value: struct.Struct("<B7x"),
+        Events.PLUGIN_LOAD.value: struct.Struct("<II"),
+        Events.PLUGIN_UNLOAD.value: struct.Struct("<B7x"),
+        Events.PLUGIN_SET.value: struct.Struct("<B7x"),
+        Events.PLUGIN_EVENT_STACKING.value: struct.Struct("<Bx6x"),
+        Events.PLUGIN_SUBSCRIBE_EVENT.value: struct.Struct("<B3xI"),
+        Events.PLUGIN_UNSUBSCRIBE_EVENT.value: struct.Struct("<B3xI"),
+        Events.CAMERA_SET_POSITION.value: struct.Struct("<dd"),
+        Events.CAMERA_MOVE.value: struct.Struct("<dd"),
+        Events.CAMERA_SET_ZOOM.value: struct.Struct("<d"),
+        Events.CAMERA_SET_ROTATION.value: struct.Struct("<d"),
+        Events.CAMERA_FOLLOW_ENTITY.value: struct.Struct("<qq"),
+        Events.CAMERA_STOP_FOLLOWING.value: struct.Struct("<B7x"),
+        Events.SCRIPT_SUBSCRIBE.value: struct.Struct("<I4x"),
+        Events.SCRIPT_UNSUBSCRIBE.value: struct.Struct("<I4x"),
+        Events.EVENT_BATCH.value: struct.Struct("<II"),
     }
 
     # This map holds the pre-computed keys for each event
@@ -885,6 +1359,16 @@ class PackFormat:
         8: ['id1', 'id2', 'filenameLength'],
         9: ['id1', 'id2', 'textureId'],
         10: ['id1', 'id2', 'x', 'y', 'w', 'h'],
+        11: ['id1', 'id2', 'positionX', 'positionY', 'positionZ'],
+        12: ['id1', 'id2', 'scaleX', 'scaleY', 'scaleZ'],
+        13: ['id1', 'id2', 'rotationX', 'rotationY', 'rotationZ'],
+        14: ['id1', 'id2', 'speedX', 'speedY'],
+        15: ['id1', 'id2', 'handle'],
+        16: ['handle'],
+        17: ['handle', 'positionX', 'positionY', 'positionZ'],
+        18: ['handle', 'scaleX', 'scaleY', 'scaleZ'],
+        19: ['handle', 'rotationX', 'rotationY', 'rotationZ'],
+        20: ['handle', 'speedX', 'speedY'],
         50: ['id1', 'id2', 'z', 'r', 'g', 'b', 'a', 'isScreenSpace', 'x', 'y'],
         51: ['id1', 'id2', 'z', 'r', 'g', 'b', 'a', 'isScreenSpace', 'x1', 'y1', 'x2', 'y2'],
         52: ['id1', 'id2', 'z', 'r', 'g', 'b', 'a', 'isScreenSpace', 'x', 'y', 'w', 'h'],
@@ -918,6 +1402,11 @@ class PackFormat:
         504: ['id1', 'id2', 'velocityX', 'velocityY'],
         505: ['id1', 'id2', 'positionX', 'positionY'],
         506: ['id1', 'id2', 'angleInRadians'],
+        507: ['id1', 'id2', 'handle'],
+        508: ['handle'],
+        509: ['handle', 'velocityX', 'velocityY'],
+        510: ['handle', 'positionX', 'positionY'],
+        511: ['handle', 'angleInRadians'],
         550: ['id1_A', 'id2_A', 'id1_B', 'id2_B'],
         551: ['id1_A', 'id2_A', 'id1_B', 'id2_B'],
         552: ['id1', 'id2', 'positionX', 'positionY', 'angle', 'velocityX', 'velocityY', 'angularVelocity', 'isSleeping'],
@@ -937,8 +1426,59 @@ class PackFormat:
         2005: ['_unused'],
         3000: ['channelNo'],
         3001: ['channelNo'],
+        4000: ['eventType', 'count'],
     }
 
+    # struct codes -> NumPy dtype strings, used by get_dtype()
+    _DTYPE_CODES: Dict[str, str] = {
+        "b": "i1", "B": "u1", "h": "<i2", "H": "<u2", "i": "<i4", "I": "<u4",
+        "q": "<i8", "Q": "<u8", "f": "<f4", "d": "<f8",
+    }
+    _DTYPE_CACHE: Dict[Tuple[int, bool], Any] = {}
+
+    # Events with data after their struct. These are never sent inside
+    # an EVENT_BATCH, which only holds fixed-size payloads.
+    _VARIABLE_LENGTH_EVENTS = frozenset((
+        Events.SPRITE_TEXTURE_LOAD,
+        Events.PLUGIN_LOAD,
+        Events.AUDIO_LOAD,
+        Events.TEXT_ADD,
+        Events.TEXT_SET_STRING,
+        Events.GEOM_ADD_PACKED,
+        Events.EVENT_BATCH,
+    ))
+
+    # The strings after the struct of each variable-length event, as
+    # (name, length key) pairs in wire order. Each starts on an 8-byte
+    # boundary and is padded to one.
+    _EVENT_TAILS: Dict[int, Tuple[Tuple[str, str], ...]] = {
+        Events.SPRITE_TEXTURE_LOAD: (("filename", "filenameLength"),),
+        Events.PLUGIN_LOAD: (("path", "pathLength"),),
+        Events.AUDIO_LOAD: (("path", "pathLength"),),
+        Events.TEXT_ADD: (("fontPath", "fontPathLength"), ("text", "textLength")),
+        Events.TEXT_SET_STRING: (("text", "textLength"),),
+    }
+
+    # Length keys the dicts from unpack() have never had, left out so
+    # they keep the shape existing handlers read
+    _DICT_OMITTED_KEYS: Dict[int, Tuple[str, ...]] = {
+        Events.SPRITE_TEXTURE_LOAD: ("filenameLength",),
+    }
+
+    # The keys of unpack()'s dict for each event, in header + payload order
+    _DICT_KEY_MAP: Dict[int, Tuple[str, ...]] = {
+        event_type: ("type", "timestamp") + tuple(keys)
+        for event_type, keys in _EVENT_KEY_MAP.items()
+    }
+
+    # Just the event type from a header
+    _TYPE_STRUCT = struct.Struct("<I")
+
+    # EventView subclasses, built on first use by get_view_class()
+    _VIEW_CLASSES: Dict[int, type] = {}
+
+    # Generated EventRecord subclasses, filled in below their definitions
+    _RECORD_CLASSES: Dict[int, type] = {}
 
     @staticmethod
     def get_info(event_type_value: int) -> Optional[Tuple[str, int]]:
@@ -948,306 +1488,4441 @@ class PackFormat:
         return PackFormat._EVENT_FORMAT_MAP.get(event_type_value)
 
     @staticmethod
-    def unpack(events_blob: bytes) -> List[Dict[str, Any]]:
+    def get_struct(event_type_value: int) -> Optional[struct.Struct]:
         """
-        Unpacks a binary blob of events (Assumes <I for count/type).
+        Gets the pre-compiled header + payload struct for a given event ID.
         """
-        events = []
-        blob_length = len(events_blob)
-        if blob_length < 4:
-            return []
+        return PackFormat._EVENT_STRUCT_MAP.get(event_type_value)
 
-        try:
-            # PHP 'V' = unsigned 32-bit LE -> Python '<I'
-            event_count = struct.unpack_from("<I", events_blob, 0)[0]
-            offset = 4
-        except struct.error:
-            print("PackFormat.unpack: Failed to unpack event count.", file=sys.stderr)
-            return []
+    @staticmethod
+    def get_dtype(event_type_value: int, header: bool = True) -> Optional[Any]:
+        """
+        Gets a NumPy structured dtype matching the header + payload layout
+        of an event, with fields "type", "timestamp" and the keys from
+        _EVENT_KEY_MAP. With header=False it matches one padded payload
+        inside an EVENT_BATCH instead. Returns None if NumPy isn't installed.
+        """
+        if np is None:
+            return None
+        dtype = PackFormat._DTYPE_CACHE.get((event_type_value, header))
+        if dtype is not None:
+            return dtype
+
+        if header:
+            event_struct = PackFormat._EVENT_STRUCT_MAP[event_type_value]
+            names = ["type", "timestamp"] + PackFormat._EVENT_KEY_MAP[event_type_value]
+        else:
+            event_struct = PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type_value]
+            names = list(PackFormat._EVENT_KEY_MAP[event_type_value])
+        formats = []
+        offsets = []
+        offset = 0
+        for count, code in re.findall(r"(\d*)([a-zA-Z?])", event_struct.format[1:]):
+            count = int(count) if count else 1
+            if code == "x":
+                offset += count
+                continue
+            field = f"S{count}" if code == "s" else PackFormat._DTYPE_CODES[code]
+            formats.append(field)
+            offsets.append(offset)
+            offset += np.dtype(field).itemsize
+
+        dtype = np.dtype({
+            "names": names,
+            "formats": formats,
+            "offsets": offsets,
+            "itemsize": event_struct.size,
+        })
+        PackFormat._DTYPE_CACHE[(event_type_value, header)] = dtype
+        return dtype
+
+    @staticmethod
+    def get_view_class(event_type_value: int) -> Optional[type]:
+        """
+        Gets the EventView subclass for an event ID, building it on first
+        use: one property per key in _EVENT_KEY_MAP, each reading its field
+        with its own pre-compiled struct. Returns None for unknown event
+        types and EVENT_BATCH (whose entries are yielded as their own type).
+        """
+        view_class = PackFormat._VIEW_CLASSES.get(event_type_value)
+        if view_class is not None:
+            return view_class
+        payload_struct = PackFormat._PAYLOAD_STRUCT_MAP.get(event_type_value)
+        if payload_struct is None or event_type_value == Events.EVENT_BATCH:
+            return None
+
+        keys = PackFormat._EVENT_KEY_MAP[event_type_value]
+        tails = PackFormat._EVENT_TAILS.get(event_type_value, ())
+        namespace: Dict[str, Any] = {
+            "__slots__": ("_tails",) if tails else (),
+            "type": event_type_value,
+            "_payload": payload_struct,
+            "_event": struct.Struct(PackFormat._HEADER_STRUCT.format + payload_struct.format[1:]),
+            "_keys": tuple(keys),
+            "_dict_keys": ("type", "timestamp") + tuple(keys),
+            "_tail_names": tuple(name for name, _ in tails),
+        }
+        key_iter = iter(keys)
+        offset = 0
+        for count, code in re.findall(r"(\d*)([a-zA-Z?])", payload_struct.format[1:]):
+            count = int(count) if count else 1
+            if code == "x":
+                offset += count
+                continue
+            field = f"{count}s" if code == "s" else code
+            namespace[next(key_iter)] = EventView._field(struct.Struct(f"<{offset}x{field}"))
+            offset += struct.calcsize(f"<{field}")
+        for index, (name, _) in enumerate(tails):
+            namespace[name] = EventView._tail(index)
+
+        view_class = type(f"{Events(event_type_value).name}_View", (EventView,), namespace)
+        PackFormat._VIEW_CLASSES[event_type_value] = view_class
+        return view_class
+
+    @staticmethod
+    def unpack_views(events_blob: Union[bytes, bytearray, memoryview], wanted: Optional[Collection[int]] = None) -> Iterator["EventView"]:
+        """
+        Yields a lazy EventView per event in a binary blob of events.
+
+        This is a single pass over a memoryview that only reads each event's
+        type (and the lengths of any string tails) to find the next one;
+        fields are decoded when they are read. Entries of an EVENT_BATCH are
+        yielded as views of their own type. Stops (with a message on stderr)
+        at the first unknown or truncated event, like unpack().
+
+        :param wanted: Event ids to yield (e.g. the types a handler
+                       checks for). Any other event is stepped over by its
+                       size from _EVENT_STRUCT_MAP without building a
+                       view; a batch of them is skipped in one step.
+        """
+        buffer = memoryview(events_blob).cast("B")
+        blob_length = len(buffer)
+        if blob_length < PackFormat._COUNT_STRUCT.size:
+            return
+
+        event_count = PackFormat._COUNT_STRUCT.unpack_from(buffer, 0)[0]
+        offset = PackFormat._COUNT_STRUCT.size
+        header_size = PackFormat._HEADER_STRUCT.size
+        read_type = PackFormat._TYPE_STRUCT.unpack_from
+        view_classes = PackFormat._VIEW_CLASSES
+        event_structs = PackFormat._EVENT_STRUCT_MAP
+        variable_length = PackFormat._VARIABLE_LENGTH_EVENTS
+        batch_type_value = Events.EVENT_BATCH.value
 
         for i in range(event_count):
-            # Header: <I (type) + <Q (timestamp) = 4 + 8 = 12 bytes
-            header_size = 12
-            if offset + header_size > blob_length:
-                print(f"PackFormat.unpack Loop {i}/{event_count}: Not enough data for header. Offset={offset}", file=sys.stderr)
-                break
+            header = offset
+            offset += header_size
+            if offset > blob_length:
+                print(f"PackFormat.unpack_views Loop {i}/{event_count}: Not enough data for header. Offset={header}", file=sys.stderr)
+                return
+
+            event_type = read_type(buffer, header)[0]
+            if wanted is not None and event_type not in wanted and event_type not in variable_length:
+                # Unwanted fixed-size event: its padded size is all we need
+                event_struct = event_structs.get(event_type)
+                if event_struct is not None:
+                    offset = header + event_struct.size
+                    if offset > blob_length:
+                        print(f"PackFormat.unpack_views: Not enough data for {Events(event_type).name}. Stopping parse.", file=sys.stderr)
+                        return
+                    continue
+
+            view_class = view_classes.get(event_type) or PackFormat.get_view_class(event_type)
+
+            if view_class is not None:
+                end = offset + view_class._payload.size
+                if end > blob_length:
+                    print(f"PackFormat.unpack_views: Not enough data for {view_class.__name__} payload. Stopping parse.", file=sys.stderr)
+                    return
+                view = view_class(buffer, offset, header)
+                if view_class._tail_names:
+                    tails = []
+                    for name, length_key in PackFormat._EVENT_TAILS[event_type]:
+                        start = (end + 7) & ~7
+                        end = start + getattr(view, length_key)
+                        if end > blob_length:
+                            print(f"PackFormat.unpack_views: Not enough data for {view_class.__name__} {name}. Stopping parse.", file=sys.stderr)
+                            return
+                        tails.append((start, end))
+                    view._tails = tuple(tails)
+                if wanted is None or event_type in wanted:
+                    yield view
+
+            elif event_type == batch_type_value:
+                # One header, then `count` padded payloads of a single
+                # fixed-size event type
+                end = offset + PackFormat._PAYLOAD_STRUCT_MAP[batch_type_value].size
+                if end > blob_length:
+                    print("PackFormat.unpack_views: Not enough data for EVENT_BATCH header. Stopping parse.", file=sys.stderr)
+                    return
+                batch_type, batch_count = PackFormat._PAYLOAD_STRUCT_MAP[batch_type_value].unpack_from(buffer, offset)
+                entry_class = PackFormat.get_view_class(batch_type)
+                if entry_class is None or batch_type in PackFormat._VARIABLE_LENGTH_EVENTS:
+                    print(f"PackFormat.unpack_views: EVENT_BATCH of unsupported event type {batch_type}. Stopping parse.", file=sys.stderr)
+                    return
+                stride = PackFormat._BATCH_PAYLOAD_STRUCT_MAP[batch_type].size
+                offset = end
+                end = offset + stride * batch_count
+                if end > blob_length:
+                    print(f"PackFormat.unpack_views: Not enough data for EVENT_BATCH payloads ({batch_count} x {stride}). Stopping parse.", file=sys.stderr)
+                    return
+                if wanted is None or batch_type in wanted:
+                    entries = range(offset, end, stride) if stride else [offset] * batch_count
+                    for entry in entries:
+                        yield entry_class(buffer, entry, header)
+
+            else:
+                print(f"PackFormat.unpack_views: Unknown event type {event_type}. Cannot continue parsing.", file=sys.stderr)
+                return
+
+            # Skip the padding that ends every event on an 8-byte boundary
+            offset = (end + 7) & ~7
+
+    @staticmethod
+    def get_record_class(event_type_value: int) -> Optional[type]:
+        """
+        Gets the generated EventRecord subclass for an event ID (e.g.
+        SpriteAddEvent for SPRITE_ADD). Returns None for unknown event
+        types and EVENT_BATCH.
+        """
+        return PackFormat._RECORD_CLASSES.get(event_type_value)
+
+    @staticmethod
+    def unpack_records(events_blob: Union[bytes, bytearray, memoryview], wanted: Optional[Collection[int]] = None) -> Iterator["EventRecord"]:
+        """
+        Yields an EventRecord per event in a binary blob of events: an
+        instance of the generated __slots__ class of its type (e.g.
+        PhysicsSyncTransformEvent), with every field decoded by a single
+        unpack_from. Records take less memory than unpack()'s dicts, their
+        fields are plain attribute reads, and unlike views they don't refer
+        back to the blob. Entries of an EVENT_BATCH are yielded as records
+        of their own type. Stops (with a message on stderr) at the first
+        unknown or truncated event, like unpack().
+
+        :param wanted: Event ids to yield; see unpack_views().
+        """
+        buffer = memoryview(events_blob).cast("B")
+        blob_length = len(buffer)
+        if blob_length < PackFormat._COUNT_STRUCT.size:
+            return
+
+        event_count = PackFormat._COUNT_STRUCT.unpack_from(buffer, 0)[0]
+        offset = PackFormat._COUNT_STRUCT.size
+        header_size = PackFormat._HEADER_STRUCT.size
+        read_type = PackFormat._TYPE_STRUCT.unpack_from
+        record_classes = PackFormat._RECORD_CLASSES
+        batch_type_value = Events.EVENT_BATCH.value
+        batch_struct = PackFormat._PAYLOAD_STRUCT_MAP[batch_type_value]
 
-            try:
-                header_data = struct.unpack_from("<IQ", events_blob, offset)
-                offset += header_size
-                event_type, timestamp = header_data
-                event = {"type": event_type, "timestamp": timestamp}
-            except struct.error:
-                print(f"PackFormat.unpack Loop {i}/{event_count}: Failed to unpack header. Offset={offset}", file=sys.stderr)
+        for i in range(event_count):
+            header = offset
+            if header + header_size > blob_length:
+                print(f"PackFormat.unpack_records Loop {i}/{event_count}: Not enough data for header. Offset={header}", file=sys.stderr)
+                return
+
+            event_type = read_type(buffer, header)[0]
+            record_class = record_classes.get(event_type)
+
+            if record_class is not None:
+                # Header, payload and padding in one go
+                end = header + record_class._struct.size
+                if end > blob_length:
+                    print(f"PackFormat.unpack_records: Not enough data for {record_class.__name__}. Stopping parse.", file=sys.stderr)
+                    return
+                if record_class._tails:
+                    record = record_class(*record_class._struct.unpack_from(buffer, header))
+                    end = record._read_tails(buffer, end)
+                    if end > blob_length:
+                        print(f"PackFormat.unpack_records: Not enough data for {record_class.__name__} strings. Stopping parse.", file=sys.stderr)
+                        return
+                    if wanted is None or event_type in wanted:
+                        yield record
+                elif wanted is None or event_type in wanted:
+                    yield record_class(*record_class._struct.unpack_from(buffer, header))
+
+            elif event_type == batch_type_value:
+                # One header, then `count` padded payloads of a single
+                # fixed-size event type
+                start = header + header_size
+                end = start + batch_struct.size
+                if end > blob_length:
+                    print("PackFormat.unpack_records: Not enough data for EVENT_BATCH header. Stopping parse.", file=sys.stderr)
+                    return
+                batch_type, batch_count = batch_struct.unpack_from(buffer, start)
+                entry_class = record_classes.get(batch_type)
+                entry_struct = PackFormat._BATCH_PAYLOAD_STRUCT_MAP.get(batch_type)
+                if entry_class is None or entry_class._tails or batch_type in PackFormat._VARIABLE_LENGTH_EVENTS or not entry_struct.size:
+                    print(f"PackFormat.unpack_records: EVENT_BATCH of unsupported event type {batch_type}. Stopping parse.", file=sys.stderr)
+                    return
+                start = end
+                end = start + entry_struct.size * batch_count
+                if end > blob_length:
+                    print(f"PackFormat.unpack_records: Not enough data for EVENT_BATCH payloads ({batch_count} x {entry_struct.size}). Stopping parse.", file=sys.stderr)
+                    return
+                if wanted is None or batch_type in wanted:
+                    timestamp = PackFormat._HEADER_STRUCT.unpack_from(buffer, header)[1]
+                    for values in entry_struct.iter_unpack(buffer[start:end]):
+                        yield entry_class(timestamp, *values)
+
+            else:
+                print(f"PackFormat.unpack_records: Unknown event type {event_type}. Cannot continue parsing.", file=sys.stderr)
+                return
+
+            # Skip the padding that ends every event on an 8-byte boundary
+            offset = (end + 7) & ~7
+
+    @staticmethod
+    def unpack_columnar(events_blob: Union[bytes, bytearray, memoryview], wanted: Optional[Collection[int]] = None) -> Dict[int, Any]:
+        """
+        Decodes a binary blob of events into one NumPy structured array per
+        event type, keyed by event id, with a field per key in
+        _EVENT_KEY_MAP (e.g. arrays[Events.PHYSICS_SYNC_TRANSFORM]["positionX"]).
+
+        The blob is scanned once. Back-to-back events of one type (and every
+        EVENT_BATCH) form a run that np.frombuffer() maps without copying;
+        a type whose events are split over several runs is copied into one
+        array. The arrays may be views of the blob, so keep it alive and
+        unchanged while they are in use. Variable-length events (those with
+        string tails) are skipped; use unpack_views() for them. Stops (with
+        a message on stderr) at the first unknown or truncated event.
+
+        :param wanted: Event ids to return arrays for; runs of any other
+                       type are stepped over without being mapped.
+        """
+        if np is None:
+            raise ImportError("PackFormat.unpack_columnar requires NumPy")
+
+        buffer = memoryview(events_blob).cast("B")
+        blob_length = len(buffer)
+        if blob_length < PackFormat._COUNT_STRUCT.size:
+            return {}
+
+        event_count = PackFormat._COUNT_STRUCT.unpack_from(buffer, 0)[0]
+        offset = PackFormat._COUNT_STRUCT.size
+        header_size = PackFormat._HEADER_STRUCT.size
+        read_type = PackFormat._TYPE_STRUCT.unpack_from
+        batch_type_value = Events.EVENT_BATCH.value
+        batch_struct = PackFormat._PAYLOAD_STRUCT_MAP[batch_type_value]
+
+        # (event type, offset of the first record, record count, from a batch)
+        runs: List[Tuple[int, int, int, bool]] = []
+
+        i = 0
+        while i < event_count:
+            header = offset
+            offset += header_size
+            if offset > blob_length:
+                print(f"PackFormat.unpack_columnar Loop {i}/{event_count}: Not enough data for header. Offset={header}", file=sys.stderr)
                 break
 
-            try:
-                event_enum_val = Events(event_type)
-            except ValueError:
-                event_enum_val = None
+            event_type = read_type(buffer, header)[0]
+            if event_type == batch_type_value:
+                end = offset + batch_struct.size
+                if end > blob_length:
+                    print("PackFormat.unpack_columnar: Not enough data for EVENT_BATCH header. Stopping parse.", file=sys.stderr)
+                    break
+                batch_type, batch_count = batch_struct.unpack_from(buffer, offset)
+                payload_struct = PackFormat._BATCH_PAYLOAD_STRUCT_MAP.get(batch_type)
+                if payload_struct is None or batch_type in PackFormat._VARIABLE_LENGTH_EVENTS:
+                    print(f"PackFormat.unpack_columnar: EVENT_BATCH of unsupported event type {batch_type}. Stopping parse.", file=sys.stderr)
+                    break
+                start = end
+                end = start + payload_struct.size * batch_count
+                if end > blob_length:
+                    print(f"PackFormat.unpack_columnar: Not enough data for EVENT_BATCH payloads ({batch_count} x {payload_struct.size}). Stopping parse.", file=sys.stderr)
+                    break
+                if batch_count:
+                    runs.append((batch_type, start, batch_count, True))
+                i += 1
+
+            elif event_type in PackFormat._EVENT_TAILS:
+                # Walk past the strings; these don't fit in an array
+                payload_struct = PackFormat._PAYLOAD_STRUCT_MAP[event_type]
+                end = offset + payload_struct.size
+                if end > blob_length:
+                    print(f"PackFormat.unpack_columnar: Not enough data for {Events(event_type).name} payload. Stopping parse.", file=sys.stderr)
+                    break
+                lengths = dict(zip(PackFormat._EVENT_KEY_MAP[event_type], payload_struct.unpack_from(buffer, offset)))
+                for _, length_key in PackFormat._EVENT_TAILS[event_type]:
+                    end = ((end + 7) & ~7) + lengths[length_key]
+                if end > blob_length:
+                    print(f"PackFormat.unpack_columnar: Not enough data for {Events(event_type).name} strings. Stopping parse.", file=sys.stderr)
+                    break
+                i += 1
+
+            else:
+                event_struct = PackFormat._EVENT_STRUCT_MAP.get(event_type)
+                if event_struct is None:
+                    print(f"PackFormat.unpack_columnar: Unknown event type {event_type}. Cannot continue parsing.", file=sys.stderr)
+                    break
+                # Find the whole run of back-to-back events of this type in
+                # one step, by reading every stride-th type field at once
+                stride = event_struct.size
+                limit = min(event_count - i, (blob_length - header) // stride)
+                types = np.ndarray((limit,), dtype="<u4", buffer=buffer, offset=header, strides=(stride,))
+                different = np.flatnonzero(types != event_type)
+                count = int(different[0]) if len(different) else limit
+                if count == 0:
+                    print(f"PackFormat.unpack_columnar: Not enough data for {Events(event_type).name} payload. Stopping parse.", file=sys.stderr)
+                    break
+                runs.append((event_type, header, count, False))
+                end = header + count * stride
+                i += count
+
+            # Skip the padding that ends every event on an 8-byte boundary
+            offset = (end + 7) & ~7
+
+        grouped: Dict[int, List[Any]] = {}
+        for event_type, start, count, batched in runs:
+            if wanted is not None and event_type not in wanted:
+                continue
+            records = np.frombuffer(buffer, dtype=PackFormat.get_dtype(event_type, header=not batched), count=count, offset=start)
+            if not batched:
+                records = records[PackFormat._EVENT_KEY_MAP[event_type]]
+            grouped.setdefault(event_type, []).append(records)
+
+        arrays: Dict[int, Any] = {}
+        for event_type, parts in grouped.items():
+            if len(parts) == 1:
+                arrays[event_type] = parts[0]
+                continue
+            merged = np.empty(sum(len(part) for part in parts), dtype=PackFormat.get_dtype(event_type, header=False))
+            position = 0
+            for part in parts:
+                merged[position : position + len(part)] = part
+                position += len(part)
+            arrays[event_type] = merged
+        return arrays
+
+    @staticmethod
+    def iter_unpack(events_blob: Union[bytes, bytearray, memoryview], wanted: Optional[Collection[int]] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Yields events one dict at a time, as unpack() would return them.
+
+        Decoding works on a memoryview of the frame: a fixed-size event is
+        read in place with the single unpack_from of its _EVENT_STRUCT_MAP
+        entry (header, payload and padding), never sliced out, and each
+        dict is only built when the loop asks for the next event. A loop that stops
+        early never decodes the rest, and a burst of events is never held
+        in memory all at once.
+
+        :param wanted: Event ids to yield; see unpack_views().
+        """
+        buffer = memoryview(events_blob).cast("B")
+        blob_length = len(buffer)
+        if blob_length < PackFormat._COUNT_STRUCT.size:
+            return
+
+        event_count = PackFormat._COUNT_STRUCT.unpack_from(buffer, 0)[0]
+        offset = PackFormat._COUNT_STRUCT.size
+        header_size = PackFormat._HEADER_STRUCT.size
+        read_type = PackFormat._TYPE_STRUCT.unpack_from
+        event_structs = PackFormat._EVENT_STRUCT_MAP
+        dict_keys = PackFormat._DICT_KEY_MAP
+        tail_events = PackFormat._EVENT_TAILS
+        batch_type_value = Events.EVENT_BATCH.value
+        batch_struct = PackFormat._PAYLOAD_STRUCT_MAP[batch_type_value]
+
+        for i in range(event_count):
+            header = offset
+            if header + header_size > blob_length:
+                print(
+                    f"PackFormat.iter_unpack Loop {i}/{event_count}: Not enough data for header. Offset={header}",
+                    file=sys.stderr,
+                )
+                return
+
+            event_type = read_type(buffer, header)[0]
+            event_struct = event_structs.get(event_type)
+
+            if event_struct is None:
+                print(
+                    f"PackFormat.iter_unpack: Unknown event type {event_type}. Cannot continue parsing.",
+                    file=sys.stderr,
+                )
+                return
+
+            elif event_type in tail_events:
+                record_class = PackFormat._RECORD_CLASSES[event_type]
+                record = record_class(*record_class._struct.unpack_from(buffer, header))
+                end = record._read_tails(buffer, header + record_class._struct.size)
+                if end > blob_length:
+                    print(
+                        f"PackFormat.iter_unpack: Not enough data for {record_class.__name__} strings. Stopping parse.",
+                        file=sys.stderr,
+                    )
+                    return
+                if wanted is None or event_type in wanted:
+                    yield record.to_dict()
+
+            elif event_type == batch_type_value:
+                # One header, then `count` padded payloads of a single
+                # fixed-size event type
+                start = header + header_size
+                end = start + batch_struct.size
+                if end > blob_length:
+                    print(
+                        "PackFormat.iter_unpack: Not enough data for EVENT_BATCH header. Stopping parse.",
+                        file=sys.stderr,
+                    )
+                    return
+                batch_type, batch_count = batch_struct.unpack_from(buffer, start)
+                entry_struct = PackFormat._BATCH_PAYLOAD_STRUCT_MAP.get(batch_type)
+                if entry_struct is None or batch_type in PackFormat._VARIABLE_LENGTH_EVENTS:
+                    print(
+                        f"PackFormat.iter_unpack: EVENT_BATCH of unsupported event type {batch_type}. Stopping parse.",
+                        file=sys.stderr,
+                    )
+                    return
+                start = end
+                end = start + entry_struct.size * batch_count
+                if end > blob_length:
+                    print(
+                        f"PackFormat.iter_unpack: Not enough data for EVENT_BATCH payloads ({batch_count} x {entry_struct.size}). Stopping parse.",
+                        file=sys.stderr,
+                    )
+                    return
+                if wanted is None or batch_type in wanted:
+                    entry_keys = dict_keys[batch_type]
+                    prefix = (batch_type, PackFormat._HEADER_STRUCT.unpack_from(buffer, header)[1])
+                    entries = entry_struct.iter_unpack(buffer[start:end]) if entry_struct.size else [()] * batch_count
+                    for values in entries:
+                        yield dict(zip(entry_keys, prefix + values))
+
+            else:
+                # Header, payload and padding in one go
+                end = header + event_struct.size
+                if end > blob_length:
+                    print(
+                        f"PackFormat.iter_unpack: Not enough data for {Events(event_type).name} payload. Stopping parse.",
+                        file=sys.stderr,
+                    )
+                    return
+                if wanted is None or event_type in wanted:
+                    yield dict(zip(dict_keys[event_type], event_struct.unpack_from(buffer, header)))
+
+            # Skip the padding that ends every event on an 8-byte boundary
+            offset = (end + 7) & ~7
+
+    @staticmethod
+    def unpack(events_blob: bytes, wanted: Optional[Collection[int]] = None) -> List[Dict[str, Any]]:
+        """
+        Unpacks a binary blob of events into one dict per event, with
+        "type", "timestamp", the keys from _EVENT_KEY_MAP and any string
+        tails (decoded), less any _DICT_OMITTED_KEYS. Collects
+        iter_unpack(); views are cheaper when only some fields are read,
+        see unpack_views().
+
+        :param wanted: Event ids to return; see unpack_views().
+        """
+        return list(PackFormat.iter_unpack(events_blob, wanted))
+
+class EventView:
+    """
+    A lazy, read-only view of one event in an events blob, as yielded by
+    PackFormat.unpack_views(). Each field is an attribute that is decoded
+    from the blob when read, so events (or fields) that are never looked
+    at cost next to nothing. There is one subclass per event type, see
+    PackFormat.get_view_class().
+
+    Views also answer the dict API used with unpack() (view["x"],
+    view.get("x", 0), "x" in view, keys()), and to_dict() copies every
+    field out. A view reads the blob it came from: keep the blob alive,
+    and unchanged, for as long as the view is in use.
+    """
+
+    __slots__ = ("_buffer", "_offset", "_header")
+
+    # Set on each subclass by PackFormat.get_view_class()
+    type: int = -1
+    _payload: struct.Struct = struct.Struct("<")
+    _event: struct.Struct = struct.Struct("<IQ4x")  # header + payload
+    _keys: Tuple[str, ...] = ()
+    _dict_keys: Tuple[str, ...] = ("type", "timestamp")
+    _tail_names: Tuple[str, ...] = ()
+
+    def __init__(self, buffer: memoryview, offset: int, header: int):
+        """
+        :param buffer: The events blob.
+        :param offset: Where this event's payload starts.
+        :param header: Where its header starts (for an EVENT_BATCH entry,
+                       the batch's header, which holds the timestamp).
+        """
+        self._buffer = buffer
+        self._offset = offset
+        self._header = header
+
+    @staticmethod
+    def _field(field_struct: struct.Struct) -> property:
+        """A property reading one field (pre-padded to its offset)."""
+        unpack_from = field_struct.unpack_from
+        return property(lambda self: unpack_from(self._buffer, self._offset)[0])
+
+    @staticmethod
+    def _tail(index: int) -> property:
+        """A property decoding one string tail."""
+        def read(self) -> str:
+            start, end = self._tails[index]
+            return str(self._buffer[start:end], "utf-8")
+        return property(read)
+
+    @property
+    def timestamp(self) -> int:
+        return PackFormat._HEADER_STRUCT.unpack_from(self._buffer, self._header)[1]
+
+    def astuple(self) -> Tuple:
+        """Every payload field in _EVENT_KEY_MAP order, in one unpack."""
+        return self._payload.unpack_from(self._buffer, self._offset)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Copies the event out as unpack() would return it."""
+        if self._offset - self._header == PackFormat._HEADER_STRUCT.size:
+            event = dict(zip(self._dict_keys, self._event.unpack_from(self._buffer, self._header)))
+        else:
+            # An EVENT_BATCH entry: the header in front of it is the batch's
+            event = {"type": self.type, "timestamp": self.timestamp}
+            event.update(zip(self._keys, self.astuple()))
+        for name in self._tail_names:
+            event[name] = getattr(self, name)
+        for key in PackFormat._DICT_OMITTED_KEYS.get(self.type, ()):
+            del event[key]
+        return event
+
+    def keys(self) -> Tuple[str, ...]:
+        return ("type", "timestamp") + self._keys + self._tail_names
 
-            # --- Manual Unpacking for Variable-Length Events ---
-            try:
-                if event_type == Events.SPRITE_TEXTURE_LOAD.value:
-                    fmt, size = PackFormat.get_info(event_type) # ("<qqI4x", 24)
-                    if offset + size > blob_length: raise EOFError("TEXTURE_LOAD fixed part")
-
-                    unpacked = struct.unpack_from(fmt, events_blob, offset)
-                    offset += size
-                    event["id1"], event["id2"], filename_length = unpacked
-
-                    if offset + filename_length > blob_length: raise EOFError("TEXTURE_LOAD variable part")
-                    event["filename"] = events_blob[offset:offset+filename_length].decode('utf-8')
-                    offset += filename_length
-                    events.append(event)
-
-                elif event_type == Events.PLUGIN_LOAD.value:
-                    fmt, size = PackFormat.get_info(event_type) # ("<I", 4)
-                    if offset + size > blob_length: raise EOFError("PLUGIN_LOAD fixed part")
+    def __contains__(self, key: str) -> bool:
+        return key in ("type", "timestamp") or key in self._keys or key in self._tail_names
 
-                    path_length = struct.unpack_from(fmt, events_blob, offset)[0]
-                    offset += size
-                    event["pathLength"] = path_length
+    def __getitem__(self, key: str) -> Any:
+        if key not in self:
+            raise KeyError(key)
+        return getattr(self, key)
 
-                    if offset + path_length > blob_length: raise EOFError("PLUGIN_LOAD variable part")
-                    event["path"] = events_blob[offset:offset+path_length].decode('utf-8')
-                    offset += path_length
-                    events.append(event)
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key) if key in self else default
 
-                elif event_type == Events.AUDIO_LOAD.value:
-                    fmt, size = PackFormat.get_info(event_type) # ("<I", 4)
-                    if offset + size > blob_length: raise EOFError("AUDIO_LOAD fixed part")
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.to_dict()!r})"
 
-                    path_length = struct.unpack_from(fmt, events_blob, offset)[0]
-                    offset += size
-                    event["pathLength"] = path_length
+class EventRecord:
+    """
+    One event decoded into plain attributes, as yielded by
+    PackFormat.unpack_records(). There is a generated subclass per
+    event type (SpriteAddEvent, PhysicsSyncTransformEvent, ...) whose
+    __slots__ are the keys from _EVENT_KEY_MAP plus any string tails,
+    so a record is a fraction of the size of unpack()'s dict and
+    record.positionX is a slot read instead of a string-keyed lookup.
+
+    Records copy every field out of the blob, so they stay valid after
+    it is reused. Like views, they also answer the dict API used with
+    unpack() (record["x"], record.get("x", 0), "x" in record, keys()).
+    """
 
-                    if offset + path_length > blob_length: raise EOFError("AUDIO_LOAD variable part")
-                    event["path"] = events_blob[offset:offset+path_length].decode('utf-8')
-                    offset += path_length
-                    events.append(event)
+    __slots__ = ("timestamp",)
 
-                elif event_type == Events.TEXT_ADD.value:
-                    fmt, size = PackFormat.get_info(event_type) # ("<qqdddBBBB4xfII4x", 64)
-                    if offset + size > blob_length: raise EOFError("TEXT_ADD fixed part")
+    # Set on each generated subclass
+    type: int = -1
+    _keys: Tuple[str, ...] = ()
+    _tails: Tuple[Tuple[str, str], ...] = ()  # (name, length key) pairs
+    _struct: struct.Struct = struct.Struct("<4xQ4x")  # timestamp + payload + padding
+    _payload: struct.Struct = struct.Struct("<")
 
-                    unpacked = struct.unpack_from(fmt, events_blob, offset)
-                    offset += size
+    def __init__(self, timestamp: int = 0):
+        self.timestamp = timestamp
 
-                    keys = ["id1", "id2", "positionX", "positionY", "positionZ", "r", "g", "b", "a", "fontSize", "fontPathLength", "textLength"]
-                    event.update(zip(keys, unpacked))
+    @classmethod
+    def from_buffer(cls, buffer: Union[bytes, bytearray, memoryview], offset: int = 0) -> "EventRecord":
+        """
+        Decodes the event whose header starts at `offset`, in a single
+        unpack_from of the header, payload and padding. String tails
+        are decoded too.
+        """
+        record = cls(*cls._struct.unpack_from(buffer, offset))
+        if cls._tails:
+            record._read_tails(buffer, offset + cls._struct.size)
+        return record
 
-                    font_path_len = event["fontPathLength"]
-                    text_len = event["textLength"]
+    @classmethod
+    def from_payload(cls, buffer: Union[bytes, bytearray, memoryview], offset: int, timestamp: int) -> "EventRecord":
+        """Decodes a payload that has no header of its own, e.g. an EVENT_BATCH entry."""
+        return cls(timestamp, *cls._payload.unpack_from(buffer, offset))
 
-                    if offset + font_path_len > blob_length: raise EOFError("TEXT_ADD font path")
-                    event["fontPath"] = events_blob[offset:offset+font_path_len].decode('utf-8')
-                    offset += font_path_len
+    def _read_tails(self, buffer: Union[bytes, bytearray, memoryview], offset: int) -> int:
+        """
+        Decodes the string tails starting at `offset` (the end of the
+        padded struct) and returns where the last one ends.
+        """
+        end = offset
+        for name, length_key in self._tails:
+            start = (end + 7) & ~7
+            end = start + getattr(self, length_key)
+            setattr(self, name, str(buffer[start:end], "utf-8"))
+        return end
+
+    def astuple(self) -> Tuple:
+        """Every payload field in _EVENT_KEY_MAP order."""
+        return tuple(getattr(self, key) for key in self._keys)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Copies the event out as unpack() would return it."""
+        event = {"type": self.type, "timestamp": self.timestamp}
+        for key in self._keys:
+            event[key] = getattr(self, key)
+        for name, _ in self._tails:
+            event[name] = getattr(self, name)
+        for key in PackFormat._DICT_OMITTED_KEYS.get(self.type, ()):
+            del event[key]
+        return event
+
+    def keys(self) -> Tuple[str, ...]:
+        return ("type", "timestamp") + self._keys + tuple(name for name, _ in self._tails)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.keys()
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key) if key in self else default
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    __hash__ = None  # Mutable, like the dicts they replace
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.to_dict()!r})"
+
+class SpriteAddEvent(EventRecord):
+    """SPRITE_ADD, decoded. Maps to Swift: `PackedSpriteAddEvent`"""
+
+    __slots__ = ("id1", "id2", "positionX", "positionY", "positionZ", "scaleX", "scaleY", "scaleZ", "sizeW", "sizeH", "rotationX", "rotationY", "rotationZ", "r", "g", "b", "a", "speedX", "speedY")
+    type = Events.SPRITE_ADD.value
+    _keys = ("id1", "id2", "positionX", "positionY", "positionZ", "scaleX", "scaleY", "scaleZ", "sizeW", "sizeH", "rotationX", "rotationY", "rotationZ", "r", "g", "b", "a", "speedX", "speedY")
+    _struct = struct.Struct("<4xQ4xqqdddddddddddBBBB4xdd")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.SPRITE_ADD.value]
+
+    def __init__(self, timestamp: int, id1: int, id2: int, positionX: float, positionY: float, positionZ: float, scaleX: float, scaleY: float, scaleZ: float, sizeW: float, sizeH: float, rotationX: float, rotationY: float, rotationZ: float, r: int, g: int, b: int, a: int, speedX: float, speedY: float):
+        self.timestamp = timestamp
+        self.id1 = id1
+        self.id2 = id2
+        self.positionX = positionX
+        self.positionY = positionY
+        self.positionZ = positionZ
+        self.scaleX = scaleX
+        self.scaleY = scaleY
+        self.scaleZ = scaleZ
+        self.sizeW = sizeW
+        self.sizeH = sizeH
+        self.rotationX = rotationX
+        self.rotationY = rotationY
+        self.rotationZ = rotationZ
+        self.r = r
+        self.g = g
+        self.b = b
+        self.a = a
+        self.speedX = speedX
+        self.speedY = speedY
+
+
+class SpriteRemoveEvent(EventRecord):
+    """SPRITE_REMOVE, decoded. Maps to Swift: `PackedSpriteRemoveEvent`"""
+
+    __slots__ = ("id1", "id2")
+    type = Events.SPRITE_REMOVE.value
+    _keys = ("id1", "id2")
+    _struct = struct.Struct("<4xQ4xqq")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.SPRITE_REMOVE.value]
+
+    def __init__(self, timestamp: int, id1: int, id2: int):
+        self.timestamp = timestamp
+        self.id1 = id1
+        self.id2 = id2
+
+
+class SpriteMoveEvent(EventRecord):
+    """SPRITE_MOVE, decoded. Maps to Swift: `PackedSpriteMoveEvent`"""
+
+    __slots__ = ("id1", "id2", "positionX", "positionY", "positionZ")
+    type = Events.SPRITE_MOVE.value
+    _keys = ("id1", "id2", "positionX", "positionY", "positionZ")
+    _struct = struct.Struct("<4xQ4xqqddd")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.SPRITE_MOVE.value]
+
+    def __init__(self, timestamp: int, id1: int, id2: int, positionX: float, positionY: float, positionZ: float):
+        self.timestamp = timestamp
+        self.id1 = id1
+        self.id2 = id2
+        self.positionX = positionX
+        self.positionY = positionY
+        self.positionZ = positionZ
+
+
+class SpriteScaleEvent(EventRecord):
+    """SPRITE_SCALE, decoded. Maps to Swift: `PackedSpriteScaleEvent`"""
+
+    __slots__ = ("id1", "id2", "scaleX", "scaleY", "scaleZ")
+    type = Events.SPRITE_SCALE.value
+    _keys = ("id1", "id2", "scaleX", "scaleY", "scaleZ")
+    _struct = struct.Struct("<4xQ4xqqddd")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.SPRITE_SCALE.value]
+
+    def __init__(self, timestamp: int, id1: int, id2: int, scaleX: float, scaleY: float, scaleZ: float):
+        self.timestamp = timestamp
+        self.id1 = id1
+        self.id2 = id2
+        self.scaleX = scaleX
+        self.scaleY = scaleY
+        self.scaleZ = scaleZ
+
+
+class SpriteResizeEvent(EventRecord):
+    """SPRITE_RESIZE, decoded. Maps to Swift: `PackedSpriteResizeEvent`"""
+
+    __slots__ = ("id1", "id2", "sizeW", "sizeH")
+    type = Events.SPRITE_RESIZE.value
+    _keys = ("id1", "id2", "sizeW", "sizeH")
+    _struct = struct.Struct("<4xQ4xqqdd")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.SPRITE_RESIZE.value]
+
+    def __init__(self, timestamp: int, id1: int, id2: int, sizeW: float, sizeH: float):
+        self.timestamp = timestamp
+        self.id1 = id1
+        self.id2 = id2
+        self.sizeW = sizeW
+        self.sizeH = sizeH
+
+
+class SpriteRotateEvent(EventRecord):
+    """SPRITE_ROTATE, decoded. Maps to Swift: `PackedSpriteRotateEvent`"""
+
+    __slots__ = ("id1", "id2", "rotationX", "rotationY", "rotationZ")
+    type = Events.SPRITE_ROTATE.value
+    _keys = ("id1", "id2", "rotationX", "rotationY", "rotationZ")
+    _struct = struct.Struct("<4xQ4xqqddd")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.SPRITE_ROTATE.value]
+
+    def __init__(self, timestamp: int, id1: int, id2: int, rotationX: float, rotationY: float, rotationZ: float):
+        self.timestamp = timestamp
+        self.id1 = id1
+        self.id2 = id2
+        self.rotationX = rotationX
+        self.rotationY = rotationY
+        self.rotationZ = rotationZ
+
+
+class SpriteColorEvent(EventRecord):
+    """SPRITE_COLOR, decoded. Maps to Swift: `PackedSpriteColorEvent`"""
+
+    __slots__ = ("id1", "id2", "r", "g", "b", "a")
+    type = Events.SPRITE_COLOR.value
+    _keys = ("id1", "id2", "r", "g", "b", "a")
+    _struct = struct.Struct("<4xQ4xqqBBBB4x")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.SPRITE_COLOR.value]
+
+    def __init__(self, timestamp: int, id1: int, id2: int, r: int, g: int, b: int, a: int):
+        self.timestamp = timestamp
+        self.id1 = id1
+        self.id2 = id2
+        self.r = r
+        self.g = g
+        self.b = b
+        self.a = a
+
+
+class SpriteSpeedEvent(EventRecord):
+    """SPRITE_SPEED, decoded. Maps to Swift: `PackedSpriteSpeedEvent`"""
+
+    __slots__ = ("id1", "id2", "speedX", "speedY")
+    type = Events.SPRITE_SPEED.value
+    _keys = ("id1", "id2", "speedX", "speedY")
+    _struct = struct.Struct("<4xQ4xqqdd")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.SPRITE_SPEED.value]
+
+    def __init__(self, timestamp: int, id1: int, id2: int, speedX: float, speedY: float):
+        self.timestamp = timestamp
+        self.id1 = id1
+        self.id2 = id2
+        self.speedX = speedX
+        self.speedY = speedY
+
+
+class SpriteTextureLoadEvent(EventRecord):
+    """SPRITE_TEXTURE_LOAD, decoded. Maps to Swift: `PackedTextureLoadHeaderEvent`"""
+
+    __slots__ = ("id1", "id2", "filenameLength", "filename")
+    type = Events.SPRITE_TEXTURE_LOAD.value
+    _keys = ("id1", "id2", "filenameLength")
+    _tails = (("filename", "filenameLength"),)
+    _struct = struct.Struct("<4xQ4xqqI4x")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.SPRITE_TEXTURE_LOAD.value]
+
+    def __init__(self, timestamp: int, id1: int, id2: int, filenameLength: int, filename: str = ""):
+        self.timestamp = timestamp
+        self.id1 = id1
+        self.id2 = id2
+        self.filenameLength = filenameLength
+        self.filename = filename
+
+
+class SpriteTextureSetEvent(EventRecord):
+    """SPRITE_TEXTURE_SET, decoded. Maps to Swift: `PackedSpriteTextureSetEvent`"""
+
+    __slots__ = ("id1", "id2", "textureId")
+    type = Events.SPRITE_TEXTURE_SET.value
+    _keys = ("id1", "id2", "textureId")
+    _struct = struct.Struct("<4xQ4xqqQ")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.SPRITE_TEXTURE_SET.value]
+
+    def __init__(self, timestamp: int, id1: int, id2: int, textureId: int):
+        self.timestamp = timestamp
+        self.id1 = id1
+        self.id2 = id2
+        self.textureId = textureId
+
+
+class SpriteSetSourceRectEvent(EventRecord):
+    """SPRITE_SET_SOURCE_RECT, decoded. Maps to Swift: `PackedSpriteSetSourceRectEvent`"""
+
+    __slots__ = ("id1", "id2", "x", "y", "w", "h")
+    type = Events.SPRITE_SET_SOURCE_RECT.value
+    _keys = ("id1", "id2", "x", "y", "w", "h")
+    _struct = struct.Struct("<4xQ4xqqffff")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.SPRITE_SET_SOURCE_RECT.value]
+
+    def __init__(self, timestamp: int, id1: int, id2: int, x: float, y: float, w: float, h: float):
+        self.timestamp = timestamp
+        self.id1 = id1
+        self.id2 = id2
+        self.x = x
+        self.y = y
+        self.w = w
+        self.h = h
+
+
+class SpriteMoveF32Event(EventRecord):
+    """SPRITE_MOVE_F32, decoded. Maps to Swift: `PackedSpriteMoveF32Event`"""
+
+    __slots__ = ("id1", "id2", "positionX", "positionY", "positionZ")
+    type = Events.SPRITE_MOVE_F32.value
+    _keys = ("id1", "id2", "positionX", "positionY", "positionZ")
+    _struct = struct.Struct("<4xQ4xqqfff4x")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.SPRITE_MOVE_F32.value]
+
+    def __init__(self, timestamp: int, id1: int, id2: int, positionX: float, positionY: float, positionZ: float):
+        self.timestamp = timestamp
+        self.id1 = id1
+        self.id2 = id2
+        self.positionX = positionX
+        self.positionY = positionY
+        self.positionZ = positionZ
+
+
+class SpriteScaleF32Event(EventRecord):
+    """SPRITE_SCALE_F32, decoded. Maps to Swift: `PackedSpriteScaleF32Event`"""
+
+    __slots__ = ("id1", "id2", "scaleX", "scaleY", "scaleZ")
+    type = Events.SPRITE_SCALE_F32.value
+    _keys = ("id1", "id2", "scaleX", "scaleY", "scaleZ")
+    _struct = struct.Struct("<4xQ4xqqfff4x")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.SPRITE_SCALE_F32.value]
+
+    def __init__(self, timestamp: int, id1: int, id2: int, scaleX: float, scaleY: float, scaleZ: float):
+        self.timestamp = timestamp
+        self.id1 = id1
+        self.id2 = id2
+        self.scaleX = scaleX
+        self.scaleY = scaleY
+        self.scaleZ = scaleZ
+
+
+class SpriteRotateF32Event(EventRecord):
+    """SPRITE_ROTATE_F32, decoded. Maps to Swift: `PackedSpriteRotateF32Event`"""
+
+    __slots__ = ("id1", "id2", "rotationX", "rotationY", "rotationZ")
+    type = Events.SPRITE_ROTATE_F32.value
+    _keys = ("id1", "id2", "rotationX", "rotationY", "rotationZ")
+    _struct = struct.Struct("<4xQ4xqqfff4x")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.SPRITE_ROTATE_F32.value]
+
+    def __init__(self, timestamp: int, id1: int, id2: int, rotationX: float, rotationY: float, rotationZ: float):
+        self.timestamp = timestamp
+        self.id1 = id1
+        self.id2 = id2
+        self.rotationX = rotationX
+        self.rotationY = rotationY
+        self.rotationZ = rotationZ
+
+
+class SpriteSpeedF32Event(EventRecord):
+    """SPRITE_SPEED_F32, decoded. Maps to Swift: `PackedSpriteSpeedF32Event`"""
+
+    __slots__ = ("id1", "id2", "speedX", "speedY")
+    type = Events.SPRITE_SPEED_F32.value
+    _keys = ("id1", "id2", "speedX", "speedY")
+    _struct = struct.Struct("<4xQ4xqqff")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.SPRITE_SPEED_F32.value]
+
+    def __init__(self, timestamp: int, id1: int, id2: int, speedX: float, speedY: float):
+        self.timestamp = timestamp
+        self.id1 = id1
+        self.id2 = id2
+        self.speedX = speedX
+        self.speedY = speedY
+
+
+class SpriteBindHandleEvent(EventRecord):
+    """SPRITE_BIND_HANDLE, decoded. Maps to Swift: `PackedSpriteBindHandleEvent`"""
+
+    __slots__ = ("id1", "id2", "handle")
+    type = Events.SPRITE_BIND_HANDLE.value
+    _keys = ("id1", "id2", "handle")
+    _struct = struct.Struct("<4xQ4xqqI4x")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.SPRITE_BIND_HANDLE.value]
+
+    def __init__(self, timestamp: int, id1: int, id2: int, handle: int):
+        self.timestamp = timestamp
+        self.id1 = id1
+        self.id2 = id2
+        self.handle = handle
+
+
+class SpriteReleaseHandleEvent(EventRecord):
+    """SPRITE_RELEASE_HANDLE, decoded. Maps to Swift: `PackedSpriteReleaseHandleEvent`"""
+
+    __slots__ = ("handle",)
+    type = Events.SPRITE_RELEASE_HANDLE.value
+    _keys = ("handle",)
+    _struct = struct.Struct("<4xQ4xI4x")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.SPRITE_RELEASE_HANDLE.value]
+
+    def __init__(self, timestamp: int, handle: int):
+        self.timestamp = timestamp
+        self.handle = handle
+
+
+class SpriteMoveHandleEvent(EventRecord):
+    """SPRITE_MOVE_HANDLE, decoded. Maps to Swift: `PackedSpriteMoveHandleEvent`"""
+
+    __slots__ = ("handle", "positionX", "positionY", "positionZ")
+    type = Events.SPRITE_MOVE_HANDLE.value
+    _keys = ("handle", "positionX", "positionY", "positionZ")
+    _struct = struct.Struct("<4xQ4xIfff")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.SPRITE_MOVE_HANDLE.value]
+
+    def __init__(self, timestamp: int, handle: int, positionX: float, positionY: float, positionZ: float):
+        self.timestamp = timestamp
+        self.handle = handle
+        self.positionX = positionX
+        self.positionY = positionY
+        self.positionZ = positionZ
+
+
+class SpriteScaleHandleEvent(EventRecord):
+    """SPRITE_SCALE_HANDLE, decoded. Maps to Swift: `PackedSpriteScaleHandleEvent`"""
+
+    __slots__ = ("handle", "scaleX", "scaleY", "scaleZ")
+    type = Events.SPRITE_SCALE_HANDLE.value
+    _keys = ("handle", "scaleX", "scaleY", "scaleZ")
+    _struct = struct.Struct("<4xQ4xIfff")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.SPRITE_SCALE_HANDLE.value]
+
+    def __init__(self, timestamp: int, handle: int, scaleX: float, scaleY: float, scaleZ: float):
+        self.timestamp = timestamp
+        self.handle = handle
+        self.scaleX = scaleX
+        self.scaleY = scaleY
+        self.scaleZ = scaleZ
+
+
+class SpriteRotateHandleEvent(EventRecord):
+    """SPRITE_ROTATE_HANDLE, decoded. Maps to Swift: `PackedSpriteRotateHandleEvent`"""
+
+    __slots__ = ("handle", "rotationX", "rotationY", "rotationZ")
+    type = Events.SPRITE_ROTATE_HANDLE.value
+    _keys = ("handle", "rotationX", "rotationY", "rotationZ")
+    _struct = struct.Struct("<4xQ4xIfff")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.SPRITE_ROTATE_HANDLE.value]
+
+    def __init__(self, timestamp: int, handle: int, rotationX: float, rotationY: float, rotationZ: float):
+        self.timestamp = timestamp
+        self.handle = handle
+        self.rotationX = rotationX
+        self.rotationY = rotationY
+        self.rotationZ = rotationZ
+
+
+class SpriteSpeedHandleEvent(EventRecord):
+    """SPRITE_SPEED_HANDLE, decoded. Maps to Swift: `PackedSpriteSpeedHandleEvent`"""
+
+    __slots__ = ("handle", "speedX", "speedY")
+    type = Events.SPRITE_SPEED_HANDLE.value
+    _keys = ("handle", "speedX", "speedY")
+    _struct = struct.Struct("<4xQ4xIff4x")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.SPRITE_SPEED_HANDLE.value]
+
+    def __init__(self, timestamp: int, handle: int, speedX: float, speedY: float):
+        self.timestamp = timestamp
+        self.handle = handle
+        self.speedX = speedX
+        self.speedY = speedY
+
+
+class GeomAddPointEvent(EventRecord):
+    """GEOM_ADD_POINT, decoded. Maps to Swift: `PackedGeomAddPointEvent`"""
+
+    __slots__ = ("id1", "id2", "z", "r", "g", "b", "a", "isScreenSpace", "x", "y")
+    type = Events.GEOM_ADD_POINT.value
+    _keys = ("id1", "id2", "z", "r", "g", "b", "a", "isScreenSpace", "x", "y")
+    _struct = struct.Struct("<4xQ4xqqdBBBBB3xff")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.GEOM_ADD_POINT.value]
+
+    def __init__(self, timestamp: int, id1: int, id2: int, z: float, r: int, g: int, b: int, a: int, isScreenSpace: int, x: float, y: float):
+        self.timestamp = timestamp
+        self.id1 = id1
+        self.id2 = id2
+        self.z = z
+        self.r = r
+        self.g = g
+        self.b = b
+        self.a = a
+        self.isScreenSpace = isScreenSpace
+        self.x = x
+        self.y = y
+
+
+class GeomAddLineEvent(EventRecord):
+    """GEOM_ADD_LINE, decoded. Maps to Swift: `PackedGeomAddLineEvent`"""
+
+    __slots__ = ("id1", "id2", "z", "r", "g", "b", "a", "isScreenSpace", "x1", "y1", "x2", "y2")
+    type = Events.GEOM_ADD_LINE.value
+    _keys = ("id1", "id2", "z", "r", "g", "b", "a", "isScreenSpace", "x1", "y1", "x2", "y2")
+    _struct = struct.Struct("<4xQ4xqqdBBBBB3xffff")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.GEOM_ADD_LINE.value]
+
+    def __init__(self, timestamp: int, id1: int, id2: int, z: float, r: int, g: int, b: int, a: int, isScreenSpace: int, x1: float, y1: float, x2: float, y2: float):
+        self.timestamp = timestamp
+        self.id1 = id1
+        self.id2 = id2
+        self.z = z
+        self.r = r
+        self.g = g
+        self.b = b
+        self.a = a
+        self.isScreenSpace = isScreenSpace
+        self.x1 = x1
+        self.y1 = y1
+        self.x2 = x2
+        self.y2 = y2
+
+
+class GeomAddRectEvent(EventRecord):
+    """GEOM_ADD_RECT, decoded. Maps to Swift: `PackedGeomAddRectEvent`"""
+
+    __slots__ = ("id1", "id2", "z", "r", "g", "b", "a", "isScreenSpace", "x", "y", "w", "h")
+    type = Events.GEOM_ADD_RECT.value
+    _keys = ("id1", "id2", "z", "r", "g", "b", "a", "isScreenSpace", "x", "y", "w", "h")
+    _struct = struct.Struct("<4xQ4xqqdBBBBB3xffff")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.GEOM_ADD_RECT.value]
+
+    def __init__(self, timestamp: int, id1: int, id2: int, z: float, r: int, g: int, b: int, a: int, isScreenSpace: int, x: float, y: float, w: float, h: float):
+        self.timestamp = timestamp
+        self.id1 = id1
+        self.id2 = id2
+        self.z = z
+        self.r = r
+        self.g = g
+        self.b = b
+        self.a = a
+        self.isScreenSpace = isScreenSpace
+        self.x = x
+        self.y = y
+        self.w = w
+        self.h = h
+
+
+class GeomAddFillRectEvent(EventRecord):
+    """GEOM_ADD_FILL_RECT, decoded. Maps to Swift: `PackedGeomAddRectEvent`"""
+
+    __slots__ = ("id1", "id2", "z", "r", "g", "b", "a", "isScreenSpace", "x", "y", "w", "h")
+    type = Events.GEOM_ADD_FILL_RECT.value
+    _keys = ("id1", "id2", "z", "r", "g", "b", "a", "isScreenSpace", "x", "y", "w", "h")
+    _struct = struct.Struct("<4xQ4xqqdBBBBB3xffff")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.GEOM_ADD_FILL_RECT.value]
+
+    def __init__(self, timestamp: int, id1: int, id2: int, z: float, r: int, g: int, b: int, a: int, isScreenSpace: int, x: float, y: float, w: float, h: float):
+        self.timestamp = timestamp
+        self.id1 = id1
+        self.id2 = id2
+        self.z = z
+        self.r = r
+        self.g = g
+        self.b = b
+        self.a = a
+        self.isScreenSpace = isScreenSpace
+        self.x = x
+        self.y = y
+        self.w = w
+        self.h = h
+
+
+class GeomAddPackedEvent(EventRecord):
+    """GEOM_ADD_PACKED, decoded. Maps to Swift: `PackedGeomAddPackedHeaderEvent`"""
+
+    __slots__ = ("id1", "id2", "z", "r", "g", "b", "a", "isScreenSpace", "primitiveType", "count")
+    type = Events.GEOM_ADD_PACKED.value
+    _keys = ("id1", "id2", "z", "r", "g", "b", "a", "isScreenSpace", "primitiveType", "count")
+    _struct = struct.Struct("<4xQ4xqqdBBBBB2xII1x")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.GEOM_ADD_PACKED.value]
+
+    def __init__(self, timestamp: int, id1: int, id2: int, z: float, r: int, g: int, b: int, a: int, isScreenSpace: int, primitiveType: int, count: int):
+        self.timestamp = timestamp
+        self.id1 = id1
+        self.id2 = id2
+        self.z = z
+        self.r = r
+        self.g = g
+        self.b = b
+        self.a = a
+        self.isScreenSpace = isScreenSpace
+        self.primitiveType = primitiveType
+        self.count = count
+
+
+class GeomRemoveEvent(EventRecord):
+    """GEOM_REMOVE, decoded. Maps to Swift: `PackedGeomRemoveEvent`"""
+
+    __slots__ = ("id1", "id2")
+    type = Events.GEOM_REMOVE.value
+    _keys = ("id1", "id2")
+    _struct = struct.Struct("<4xQ4xqq")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.GEOM_REMOVE.value]
+
+    def __init__(self, timestamp: int, id1: int, id2: int):
+        self.timestamp = timestamp
+        self.id1 = id1
+        self.id2 = id2
+
+
+class GeomSetColorEvent(EventRecord):
+    """GEOM_SET_COLOR, decoded. Maps to Swift: `PackedGeomSetColorEvent`"""
+
+    __slots__ = ("id1", "id2", "r", "g", "b", "a")
+    type = Events.GEOM_SET_COLOR.value
+    _keys = ("id1", "id2", "r", "g", "b", "a")
+    _struct = struct.Struct("<4xQ4xqqBBBB4x")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.GEOM_SET_COLOR.value]
+
+    def __init__(self, timestamp: int, id1: int, id2: int, r: int, g: int, b: int, a: int):
+        self.timestamp = timestamp
+        self.id1 = id1
+        self.id2 = id2
+        self.r = r
+        self.g = g
+        self.b = b
+        self.a = a
+
+
+class InputKeyupEvent(EventRecord):
+    """INPUT_KEYUP, decoded. Maps to Swift: `PackedKeyEvent`"""
+
+    __slots__ = ("scancode", "keycode", "mod", "isRepeat")
+    type = Events.INPUT_KEYUP.value
+    _keys = ("scancode", "keycode", "mod", "isRepeat")
+    _struct = struct.Struct("<4xQ4xiIHBx4x")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.INPUT_KEYUP.value]
+
+    def __init__(self, timestamp: int, scancode: int, keycode: int, mod: int, isRepeat: int):
+        self.timestamp = timestamp
+        self.scancode = scancode
+        self.keycode = keycode
+        self.mod = mod
+        self.isRepeat = isRepeat
+
+
+class InputKeydownEvent(EventRecord):
+    """INPUT_KEYDOWN, decoded. Maps to Swift: `PackedKeyEvent`"""
+
+    __slots__ = ("scancode", "keycode", "mod", "isRepeat")
+    type = Events.INPUT_KEYDOWN.value
+    _keys = ("scancode", "keycode", "mod", "isRepeat")
+    _struct = struct.Struct("<4xQ4xiIHBx4x")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.INPUT_KEYDOWN.value]
+
+    def __init__(self, timestamp: int, scancode: int, keycode: int, mod: int, isRepeat: int):
+        self.timestamp = timestamp
+        self.scancode = scancode
+        self.keycode = keycode
+        self.mod = mod
+        self.isRepeat = isRepeat
+
+
+class InputMouseupEvent(EventRecord):
+    """INPUT_MOUSEUP, decoded. Maps to Swift: `PackedMouseButtonEvent`"""
+
+    __slots__ = ("x", "y", "button", "clicks")
+    type = Events.INPUT_MOUSEUP.value
+    _keys = ("x", "y", "button", "clicks")
+    _struct = struct.Struct("<4xQ4xffBB2x4x")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.INPUT_MOUSEUP.value]
+
+    def __init__(self, timestamp: int, x: float, y: float, button: int, clicks: int):
+        self.timestamp = timestamp
+        self.x = x
+        self.y = y
+        self.button = button
+        self.clicks = clicks
+
+
+class InputMousedownEvent(EventRecord):
+    """INPUT_MOUSEDOWN, decoded. Maps to Swift: `PackedMouseButtonEvent`"""
+
+    __slots__ = ("x", "y", "button", "clicks")
+    type = Events.INPUT_MOUSEDOWN.value
+    _keys = ("x", "y", "button", "clicks")
+    _struct = struct.Struct("<4xQ4xffBB2x4x")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.INPUT_MOUSEDOWN.value]
+
+    def __init__(self, timestamp: int, x: float, y: float, button: int, clicks: int):
+        self.timestamp = timestamp
+        self.x = x
+        self.y = y
+        self.button = button
+        self.clicks = clicks
+
+
+class InputMousemotionEvent(EventRecord):
+    """INPUT_MOUSEMOTION, decoded. Maps to Swift: `PackedMouseMotionEvent`"""
+
+    __slots__ = ("x", "y", "xrel", "yrel")
+    type = Events.INPUT_MOUSEMOTION.value
+    _keys = ("x", "y", "xrel", "yrel")
+    _struct = struct.Struct("<4xQ4xffff")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.INPUT_MOUSEMOTION.value]
+
+    def __init__(self, timestamp: int, x: float, y: float, xrel: float, yrel: float):
+        self.timestamp = timestamp
+        self.x = x
+        self.y = y
+        self.xrel = xrel
+        self.yrel = yrel
+
+
+class WindowTitleEvent(EventRecord):
+    """WINDOW_TITLE, decoded. Maps to Swift: `PackedWindowTitleEvent`"""
+
+    __slots__ = ("title",)
+    type = Events.WINDOW_TITLE.value
+    _keys = ("title",)
+    _struct = struct.Struct("<4xQ4x256s")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.WINDOW_TITLE.value]
+
+    def __init__(self, timestamp: int, title: bytes):
+        self.timestamp = timestamp
+        self.title = title
+
+
+class WindowResizeEvent(EventRecord):
+    """WINDOW_RESIZE, decoded. Maps to Swift: `PackedWindowResizeEvent`"""
+
+    __slots__ = ("w", "h")
+    type = Events.WINDOW_RESIZE.value
+    _keys = ("w", "h")
+    _struct = struct.Struct("<4xQ4xii")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.WINDOW_RESIZE.value]
+
+    def __init__(self, timestamp: int, w: int, h: int):
+        self.timestamp = timestamp
+        self.w = w
+        self.h = h
+
+
+class WindowFlagsEvent(EventRecord):
+    """WINDOW_FLAGS, decoded. Maps to Swift: `PackedWindowFlagsEvent`"""
+
+    __slots__ = ("flags",)
+    type = Events.WINDOW_FLAGS.value
+    _keys = ("flags",)
+    _struct = struct.Struct("<4xQ4xQ")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.WINDOW_FLAGS.value]
+
+    def __init__(self, timestamp: int, flags: int):
+        self.timestamp = timestamp
+        self.flags = flags
+
+
+class TextAddEvent(EventRecord):
+    """TEXT_ADD, decoded. Maps to Swift: `PackedTextAddEvent`"""
+
+    __slots__ = ("id1", "id2", "positionX", "positionY", "positionZ", "r", "g", "b", "a", "fontSize", "fontPathLength", "textLength", "fontPath", "text")
+    type = Events.TEXT_ADD.value
+    _keys = ("id1", "id2", "positionX", "positionY", "positionZ", "r", "g", "b", "a", "fontSize", "fontPathLength", "textLength")
+    _tails = (("fontPath", "fontPathLength"), ("text", "textLength"))
+    _struct = struct.Struct("<4xQ4xqqdddBBBB4xfII4x")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.TEXT_ADD.value]
+
+    def __init__(self, timestamp: int, id1: int, id2: int, positionX: float, positionY: float, positionZ: float, r: int, g: int, b: int, a: int, fontSize: float, fontPathLength: int, textLength: int, fontPath: str = "", text: str = ""):
+        self.timestamp = timestamp
+        self.id1 = id1
+        self.id2 = id2
+        self.positionX = positionX
+        self.positionY = positionY
+        self.positionZ = positionZ
+        self.r = r
+        self.g = g
+        self.b = b
+        self.a = a
+        self.fontSize = fontSize
+        self.fontPathLength = fontPathLength
+        self.textLength = textLength
+        self.fontPath = fontPath
+        self.text = text
+
+
+class TextSetStringEvent(EventRecord):
+    """TEXT_SET_STRING, decoded. Maps to Swift: `PackedTextSetStringEvent`"""
 
-                    if offset + text_len > blob_length: raise EOFError("TEXT_ADD text")
-                    event["text"] = events_blob[offset:offset+text_len].decode('utf-8')
-                    offset += text_len
-                    events.append(event)
+    __slots__ = ("id1", "id2", "textLength", "text")
+    type = Events.TEXT_SET_STRING.value
+    _keys = ("id1", "id2", "textLength")
+    _tails = (("text", "textLength"),)
+    _struct = struct.Struct("<4xQ4xqqI4x")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.TEXT_SET_STRING.value]
 
-                elif event_type == Events.TEXT_SET_STRING.value:
-                    fmt, size = PackFormat.get_info(event_type) # ("<qqI4x", 24)
-                    if offset + size > blob_length: raise EOFError("TEXT_SET_STRING fixed part")
+    def __init__(self, timestamp: int, id1: int, id2: int, textLength: int, text: str = ""):
+        self.timestamp = timestamp
+        self.id1 = id1
+        self.id2 = id2
+        self.textLength = textLength
+        self.text = text
 
-                    unpacked = struct.unpack_from(fmt, events_blob, offset)
-                    offset += size
 
-                    keys = ["id1", "id2", "textLength"]
-                    event.update(zip(keys, unpacked))
+class AudioLoadEvent(EventRecord):
+    """AUDIO_LOAD, decoded. Maps to Swift: `PackedAudioLoadEvent`"""
 
-                    text_len = event["textLength"]
-                    if offset + text_len > blob_length: raise EOFError("TEXT_SET_STRING text")
-                    event["text"] = events_blob[offset:offset+text_len].decode('utf-8')
-                    offset += text_len
-                    events.append(event)
+    __slots__ = ("pathLength", "path")
+    type = Events.AUDIO_LOAD.value
+    _keys = ("pathLength",)
+    _tails = (("path", "pathLength"),)
+    _struct = struct.Struct("<4xQ4xI4x")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.AUDIO_LOAD.value]
 
-                elif event_enum_val is not None:
-                    # --- Generic Fixed-Size Event Handler ---
-                    payload_info = PackFormat.get_info(event_type)
-                    if payload_info is None:
-                        raise ValueError(f"Could not get info for known event type {event_type}")
+    def __init__(self, timestamp: int, pathLength: int, path: str = ""):
+        self.timestamp = timestamp
+        self.pathLength = pathLength
+        self.path = path
 
-                    payload_format, payload_size = payload_info
 
-                    if offset + payload_size > blob_length:
-                        raise EOFError(f"{event_enum_val.name} payload (size {payload_size})")
+class AudioLoadedEvent(EventRecord):
+    """AUDIO_LOADED, decoded. Maps to Swift: `PackedAudioLoadedEvent`"""
 
-                    if payload_size > 0:
-                        unpacked = struct.unpack_from(payload_format, events_blob, offset)
+    __slots__ = ("audioId",)
+    type = Events.AUDIO_LOADED.value
+    _keys = ("audioId",)
+    _struct = struct.Struct("<4xQ4xQ")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.AUDIO_LOADED.value]
 
-                        # --- MODIFIED BLOCK ---
-                        # Use the pre-computed key map instead of generic v{i} keys
-                        keys = PackFormat._EVENT_KEY_MAP.get(event_type)
-
-                        if keys is not None:
-                            if len(keys) == len(unpacked):
-                                payload_data = dict(zip(keys, unpacked))
-                            else:
-                                # Error: struct definition and key map are out of sync
-                                print(f"PackFormat.unpack: Key/Value mismatch for {event_enum_val.name}. Keys: {len(keys)}, Vals: {len(unpacked)}", file=sys.stderr)
-                                payload_data = {f"v{i}": val for i, val in enumerate(unpacked)}
-                        else:
-                            # Fallback for events missing from key map (shouldn't happen)
-                            payload_data = {f"v{i}": val for i, val in enumerate(unpacked)}
+    def __init__(self, timestamp: int, audioId: int):
+        self.timestamp = timestamp
+        self.audioId = audioId
 
-                        event.update(payload_data)
-                        # --- END MODIFIED BLOCK ---
 
-                        events.append(event)
-                    else:
-                        events.append(event) # No payload
+class AudioPlayEvent(EventRecord):
+    """AUDIO_PLAY, decoded. Maps to Swift: `PackedAudioPlayEvent`"""
 
-                    offset += payload_size
+    __slots__ = ("audioId",)
+    type = Events.AUDIO_PLAY.value
+    _keys = ("audioId",)
+    _struct = struct.Struct("<4xQ4xQ")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.AUDIO_PLAY.value]
 
-                else:
-                    print(f"PackFormat.unpack: Unknown event type {event_type}. Cannot continue parsing.", file=sys.stderr)
-                    break
+    def __init__(self, timestamp: int, audioId: int):
+        self.timestamp = timestamp
+        self.audioId = audioId
 
-            except EOFError as e:
-                 print(f"PackFormat.unpack: Not enough data for {e}. Stopping parse.", file=sys.stderr)
-                 break
-            except struct.error as e:
-                print(f"PackFormat.unpack: Struct error for {event_enum_val.name if event_enum_val else event_type}: {e}", file=sys.stderr)
-                break
-            except Exception as e:
-                print(f"PackFormat.unpack: General error on {event_enum_val.name if event_enum_val else event_type}: {e}", file=sys.stderr)
-                break
 
-        return events# --- End PackFormat Class ---
+class AudioStopAllEvent(EventRecord):
+    """AUDIO_STOP_ALL, decoded. Maps to Swift: `PackedAudioStopAllEvent`"""
+
+    __slots__ = ("_unused",)
+    type = Events.AUDIO_STOP_ALL.value
+    _keys = ("_unused",)
+    _struct = struct.Struct("<4xQ4xB7x")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.AUDIO_STOP_ALL.value]
+
+    def __init__(self, timestamp: int, _unused: int):
+        self.timestamp = timestamp
+        self._unused = _unused
+
+
+class AudioSetMasterVolumeEvent(EventRecord):
+    """AUDIO_SET_MASTER_VOLUME, decoded. Maps to Swift: `PackedAudioSetMasterVolumeEvent`"""
+
+    __slots__ = ("volume",)
+    type = Events.AUDIO_SET_MASTER_VOLUME.value
+    _keys = ("volume",)
+    _struct = struct.Struct("<4xQ4xf4x")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.AUDIO_SET_MASTER_VOLUME.value]
+
+    def __init__(self, timestamp: int, volume: float):
+        self.timestamp = timestamp
+        self.volume = volume
+
+
+class AudioPauseEvent(EventRecord):
+    """AUDIO_PAUSE, decoded. Maps to Swift: `PackedAudioPauseEvent`"""
+
+    __slots__ = ("audioId",)
+    type = Events.AUDIO_PAUSE.value
+    _keys = ("audioId",)
+    _struct = struct.Struct("<4xQ4xQ")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.AUDIO_PAUSE.value]
+
+    def __init__(self, timestamp: int, audioId: int):
+        self.timestamp = timestamp
+        self.audioId = audioId
+
+
+class AudioStopEvent(EventRecord):
+    """AUDIO_STOP, decoded. Maps to Swift: `PackedAudioStopEvent`"""
+
+    __slots__ = ("audioId",)
+    type = Events.AUDIO_STOP.value
+    _keys = ("audioId",)
+    _struct = struct.Struct("<4xQ4xQ")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.AUDIO_STOP.value]
+
+    def __init__(self, timestamp: int, audioId: int):
+        self.timestamp = timestamp
+        self.audioId = audioId
+
+
+class AudioUnloadEvent(EventRecord):
+    """AUDIO_UNLOAD, decoded. Maps to Swift: `PackedAudioUnloadEvent`"""
+
+    __slots__ = ("audioId",)
+    type = Events.AUDIO_UNLOAD.value
+    _keys = ("audioId",)
+    _struct = struct.Struct("<4xQ4xQ")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.AUDIO_UNLOAD.value]
+
+    def __init__(self, timestamp: int, audioId: int):
+        self.timestamp = timestamp
+        self.audioId = audioId
+
+
+class AudioSetVolumeEvent(EventRecord):
+    """AUDIO_SET_VOLUME, decoded. Maps to Swift: `PackedAudioSetVolumeEvent`"""
+
+    __slots__ = ("audioId", "volume")
+    type = Events.AUDIO_SET_VOLUME.value
+    _keys = ("audioId", "volume")
+    _struct = struct.Struct("<4xQ4xQf4x")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.AUDIO_SET_VOLUME.value]
+
+    def __init__(self, timestamp: int, audioId: int, volume: float):
+        self.timestamp = timestamp
+        self.audioId = audioId
+        self.volume = volume
+
+
+class PhysicsAddBodyEvent(EventRecord):
+    """PHYSICS_ADD_BODY, decoded. Maps to Swift: `PackedPhysicsAddBodyEvent`"""
+
+    __slots__ = ("id1", "id2", "positionX", "positionY", "bodyType", "shapeType", "lockRotation", "mass", "friction", "elasticity", "width", "height")
+    type = Events.PHYSICS_ADD_BODY.value
+    _keys = ("id1", "id2", "positionX", "positionY", "bodyType", "shapeType", "lockRotation", "mass", "friction", "elasticity", "width", "height")
+    _struct = struct.Struct("<4xQ4xqqddBBB5xddddd")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.PHYSICS_ADD_BODY.value]
+
+    def __init__(self, timestamp: int, id1: int, id2: int, positionX: float, positionY: float, bodyType: int, shapeType: int, lockRotation: int, mass: float, friction: float, elasticity: float, width: float, height: float):
+        self.timestamp = timestamp
+        self.id1 = id1
+        self.id2 = id2
+        self.positionX = positionX
+        self.positionY = positionY
+        self.bodyType = bodyType
+        self.shapeType = shapeType
+        self.lockRotation = lockRotation
+        self.mass = mass
+        self.friction = friction
+        self.elasticity = elasticity
+        self.width = width
+        self.height = height
+
+
+class PhysicsRemoveBodyEvent(EventRecord):
+    """PHYSICS_REMOVE_BODY, decoded. Maps to Swift: `PackedPhysicsRemoveBodyEvent`"""
+
+    __slots__ = ("id1", "id2")
+    type = Events.PHYSICS_REMOVE_BODY.value
+    _keys = ("id1", "id2")
+    _struct = struct.Struct("<4xQ4xqq")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.PHYSICS_REMOVE_BODY.value]
+
+    def __init__(self, timestamp: int, id1: int, id2: int):
+        self.timestamp = timestamp
+        self.id1 = id1
+        self.id2 = id2
+
+
+class PhysicsApplyForceEvent(EventRecord):
+    """PHYSICS_APPLY_FORCE, decoded. Maps to Swift: `PackedPhysicsApplyForceEvent`"""
+
+    __slots__ = ("id1", "id2", "forceX", "forceY")
+    type = Events.PHYSICS_APPLY_FORCE.value
+    _keys = ("id1", "id2", "forceX", "forceY")
+    _struct = struct.Struct("<4xQ4xqqdd")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.PHYSICS_APPLY_FORCE.value]
+
+    def __init__(self, timestamp: int, id1: int, id2: int, forceX: float, forceY: float):
+        self.timestamp = timestamp
+        self.id1 = id1
+        self.id2 = id2
+        self.forceX = forceX
+        self.forceY = forceY
+
+
+class PhysicsApplyImpulseEvent(EventRecord):
+    """PHYSICS_APPLY_IMPULSE, decoded. Maps to Swift: `PackedPhysicsApplyImpulseEvent`"""
+
+    __slots__ = ("id1", "id2", "impulseX", "impulseY")
+    type = Events.PHYSICS_APPLY_IMPULSE.value
+    _keys = ("id1", "id2", "impulseX", "impulseY")
+    _struct = struct.Struct("<4xQ4xqqdd")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.PHYSICS_APPLY_IMPULSE.value]
+
+    def __init__(self, timestamp: int, id1: int, id2: int, impulseX: float, impulseY: float):
+        self.timestamp = timestamp
+        self.id1 = id1
+        self.id2 = id2
+        self.impulseX = impulseX
+        self.impulseY = impulseY
+
+
+class PhysicsSetVelocityEvent(EventRecord):
+    """PHYSICS_SET_VELOCITY, decoded. Maps to Swift: `PackedPhysicsSetVelocityEvent`"""
+
+    __slots__ = ("id1", "id2", "velocityX", "velocityY")
+    type = Events.PHYSICS_SET_VELOCITY.value
+    _keys = ("id1", "id2", "velocityX", "velocityY")
+    _struct = struct.Struct("<4xQ4xqqdd")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.PHYSICS_SET_VELOCITY.value]
+
+    def __init__(self, timestamp: int, id1: int, id2: int, velocityX: float, velocityY: float):
+        self.timestamp = timestamp
+        self.id1 = id1
+        self.id2 = id2
+        self.velocityX = velocityX
+        self.velocityY = velocityY
+
+
+class PhysicsSetPositionEvent(EventRecord):
+    """PHYSICS_SET_POSITION, decoded. Maps to Swift: `PackedPhysicsSetPositionEvent`"""
+
+    __slots__ = ("id1", "id2", "positionX", "positionY")
+    type = Events.PHYSICS_SET_POSITION.value
+    _keys = ("id1", "id2", "positionX", "positionY")
+    _struct = struct.Struct("<4xQ4xqqdd")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.PHYSICS_SET_POSITION.value]
+
+    def __init__(self, timestamp: int, id1: int, id2: int, positionX: float, positionY: float):
+        self.timestamp = timestamp
+        self.id1 = id1
+        self.id2 = id2
+        self.positionX = positionX
+        self.positionY = positionY
+
+
+class PhysicsSetRotationEvent(EventRecord):
+    """PHYSICS_SET_ROTATION, decoded. Maps to Swift: `PackedPhysicsSetRotationEvent`"""
+
+    __slots__ = ("id1", "id2", "angleInRadians")
+    type = Events.PHYSICS_SET_ROTATION.value
+    _keys = ("id1", "id2", "angleInRadians")
+    _struct = struct.Struct("<4xQ4xqqd")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.PHYSICS_SET_ROTATION.value]
+
+    def __init__(self, timestamp: int, id1: int, id2: int, angleInRadians: float):
+        self.timestamp = timestamp
+        self.id1 = id1
+        self.id2 = id2
+        self.angleInRadians = angleInRadians
+
+
+class PhysicsBindHandleEvent(EventRecord):
+    """PHYSICS_BIND_HANDLE, decoded. Maps to Swift: `PackedPhysicsBindHandleEvent`"""
+
+    __slots__ = ("id1", "id2", "handle")
+    type = Events.PHYSICS_BIND_HANDLE.value
+    _keys = ("id1", "id2", "handle")
+    _struct = struct.Struct("<4xQ4xqqI4x")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.PHYSICS_BIND_HANDLE.value]
+
+    def __init__(self, timestamp: int, id1: int, id2: int, handle: int):
+        self.timestamp = timestamp
+        self.id1 = id1
+        self.id2 = id2
+        self.handle = handle
+
+
+class PhysicsReleaseHandleEvent(EventRecord):
+    """PHYSICS_RELEASE_HANDLE, decoded. Maps to Swift: `PackedPhysicsReleaseHandleEvent`"""
+
+    __slots__ = ("handle",)
+    type = Events.PHYSICS_RELEASE_HANDLE.value
+    _keys = ("handle",)
+    _struct = struct.Struct("<4xQ4xI4x")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.PHYSICS_RELEASE_HANDLE.value]
+
+    def __init__(self, timestamp: int, handle: int):
+        self.timestamp = timestamp
+        self.handle = handle
+
+
+class PhysicsSetVelocityHandleEvent(EventRecord):
+    """PHYSICS_SET_VELOCITY_HANDLE, decoded. Maps to Swift: `PackedPhysicsSetVelocityHandleEvent`"""
+
+    __slots__ = ("handle", "velocityX", "velocityY")
+    type = Events.PHYSICS_SET_VELOCITY_HANDLE.value
+    _keys = ("handle", "velocityX", "velocityY")
+    _struct = struct.Struct("<4xQ4xI4xdd")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.PHYSICS_SET_VELOCITY_HANDLE.value]
+
+    def __init__(self, timestamp: int, handle: int, velocityX: float, velocityY: float):
+        self.timestamp = timestamp
+        self.handle = handle
+        self.velocityX = velocityX
+        self.velocityY = velocityY
+
+
+class PhysicsSetPositionHandleEvent(EventRecord):
+    """PHYSICS_SET_POSITION_HANDLE, decoded. Maps to Swift: `PackedPhysicsSetPositionHandleEvent`"""
+
+    __slots__ = ("handle", "positionX", "positionY")
+    type = Events.PHYSICS_SET_POSITION_HANDLE.value
+    _keys = ("handle", "positionX", "positionY")
+    _struct = struct.Struct("<4xQ4xI4xdd")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.PHYSICS_SET_POSITION_HANDLE.value]
+
+    def __init__(self, timestamp: int, handle: int, positionX: float, positionY: float):
+        self.timestamp = timestamp
+        self.handle = handle
+        self.positionX = positionX
+        self.positionY = positionY
+
+
+class PhysicsSetRotationHandleEvent(EventRecord):
+    """PHYSICS_SET_ROTATION_HANDLE, decoded. Maps to Swift: `PackedPhysicsSetRotationHandleEvent`"""
+
+    __slots__ = ("handle", "angleInRadians")
+    type = Events.PHYSICS_SET_ROTATION_HANDLE.value
+    _keys = ("handle", "angleInRadians")
+    _struct = struct.Struct("<4xQ4xI4xd")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.PHYSICS_SET_ROTATION_HANDLE.value]
+
+    def __init__(self, timestamp: int, handle: int, angleInRadians: float):
+        self.timestamp = timestamp
+        self.handle = handle
+        self.angleInRadians = angleInRadians
+
+
+class PhysicsCollisionBeginEvent(EventRecord):
+    """PHYSICS_COLLISION_BEGIN, decoded. Maps to Swift: `PackedPhysicsCollisionEvent`"""
+
+    __slots__ = ("id1_A", "id2_A", "id1_B", "id2_B")
+    type = Events.PHYSICS_COLLISION_BEGIN.value
+    _keys = ("id1_A", "id2_A", "id1_B", "id2_B")
+    _struct = struct.Struct("<4xQ4xqqqq")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.PHYSICS_COLLISION_BEGIN.value]
+
+    def __init__(self, timestamp: int, id1_A: int, id2_A: int, id1_B: int, id2_B: int):
+        self.timestamp = timestamp
+        self.id1_A = id1_A
+        self.id2_A = id2_A
+        self.id1_B = id1_B
+        self.id2_B = id2_B
+
+
+class PhysicsCollisionSeparateEvent(EventRecord):
+    """PHYSICS_COLLISION_SEPARATE, decoded. Maps to Swift: `PackedPhysicsCollisionEvent`"""
+
+    __slots__ = ("id1_A", "id2_A", "id1_B", "id2_B")
+    type = Events.PHYSICS_COLLISION_SEPARATE.value
+    _keys = ("id1_A", "id2_A", "id1_B", "id2_B")
+    _struct = struct.Struct("<4xQ4xqqqq")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.PHYSICS_COLLISION_SEPARATE.value]
+
+    def __init__(self, timestamp: int, id1_A: int, id2_A: int, id1_B: int, id2_B: int):
+        self.timestamp = timestamp
+        self.id1_A = id1_A
+        self.id2_A = id2_A
+        self.id1_B = id1_B
+        self.id2_B = id2_B
+
+
+class PhysicsSyncTransformEvent(EventRecord):
+    """PHYSICS_SYNC_TRANSFORM, decoded. Maps to Swift: `PackedPhysicsSyncTransformEvent`"""
+
+    __slots__ = ("id1", "id2", "positionX", "positionY", "angle", "velocityX", "velocityY", "angularVelocity", "isSleeping")
+    type = Events.PHYSICS_SYNC_TRANSFORM.value
+    _keys = ("id1", "id2", "positionX", "positionY", "angle", "velocityX", "velocityY", "angularVelocity", "isSleeping")
+    _struct = struct.Struct("<4xQ4xqqddddddB7x")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.PHYSICS_SYNC_TRANSFORM.value]
+
+    def __init__(self, timestamp: int, id1: int, id2: int, positionX: float, positionY: float, angle: float, velocityX: float, velocityY: float, angularVelocity: float, isSleeping: int):
+        self.timestamp = timestamp
+        self.id1 = id1
+        self.id2 = id2
+        self.positionX = positionX
+        self.positionY = positionY
+        self.angle = angle
+        self.velocityX = velocityX
+        self.velocityY = velocityY
+        self.angularVelocity = angularVelocity
+        self.isSleeping = isSleeping
+
+
+class PhysicsSetDebugModeEvent(EventRecord):
+    """PHYSICS_SET_DEBUG_MODE, decoded. Maps to Swift: `PackedPhysicsSetDebugModeEvent`"""
+
+    __slots__ = ("enabled",)
+    type = Events.PHYSICS_SET_DEBUG_MODE.value
+    _keys = ("enabled",)
+    _struct = struct.Struct("<4xQ4xB3x4x")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.PHYSICS_SET_DEBUG_MODE.value]
+
+    def __init__(self, timestamp: int, enabled: int):
+        self.timestamp = timestamp
+        self.enabled = enabled
+
+
+class PluginEvent(EventRecord):
+    """PLUGIN, decoded. Maps to Swift: `PackedPluginOnEvent`"""
+
+    __slots__ = ("eventId",)
+    type = Events.PLUGIN.value
+    _keys = ("eventId",)
+    _struct = struct.Struct("<4xQ4xB7x")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.PLUGIN.value]
+
+    def __init__(self, timestamp: int, eventId: int):
+        self.timestamp = timestamp
+        self.eventId = eventId
+
+
+class PluginLoadEvent(EventRecord):
+    """PLUGIN_LOAD, decoded. Maps to Swift: `PackedPluginLoadHeaderEvent`"""
+
+    __slots__ = ("channelNo", "pathLength", "path")
+    type = Events.PLUGIN_LOAD.value
+    _keys = ("channelNo", "pathLength")
+    _tails = (("path", "pathLength"),)
+    _struct = struct.Struct("<4xQ4xII")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.PLUGIN_LOAD.value]
+
+    def __init__(self, timestamp: int, channelNo: int, pathLength: int, path: str = ""):
+        self.timestamp = timestamp
+        self.channelNo = channelNo
+        self.pathLength = pathLength
+        self.path = path
+
+
+class PluginUnloadEvent(EventRecord):
+    """PLUGIN_UNLOAD, decoded. Maps to Swift: `PackedPluginUnloadEvent`"""
+
+    __slots__ = ("pluginId",)
+    type = Events.PLUGIN_UNLOAD.value
+    _keys = ("pluginId",)
+    _struct = struct.Struct("<4xQ4xB7x")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.PLUGIN_UNLOAD.value]
+
+    def __init__(self, timestamp: int, pluginId: int):
+        self.timestamp = timestamp
+        self.pluginId = pluginId
+
+
+class PluginSetEvent(EventRecord):
+    """PLUGIN_SET, decoded. Maps to Swift: `PackedPluginSetEvent`"""
+
+    __slots__ = ("pluginId",)
+    type = Events.PLUGIN_SET.value
+    _keys = ("pluginId",)
+    _struct = struct.Struct("<4xQ4xB7x")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.PLUGIN_SET.value]
+
+    def __init__(self, timestamp: int, pluginId: int):
+        self.timestamp = timestamp
+        self.pluginId = pluginId
+
+
+class PluginEventStackingEvent(EventRecord):
+    """PLUGIN_EVENT_STACKING, decoded. Maps to Swift: `PackedPluginEventStackingEvent`"""
+
+    __slots__ = ("eventId",)
+    type = Events.PLUGIN_EVENT_STACKING.value
+    _keys = ("eventId",)
+    _struct = struct.Struct("<4xQ4xBx6x")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.PLUGIN_EVENT_STACKING.value]
+
+    def __init__(self, timestamp: int, eventId: int):
+        self.timestamp = timestamp
+        self.eventId = eventId
+
+
+class PluginSubscribeEventEvent(EventRecord):
+    """PLUGIN_SUBSCRIBE_EVENT, decoded. Maps to Swift: `PackedPluginSubscribeEvent`"""
+
+    __slots__ = ("pluginId", "channelNo")
+    type = Events.PLUGIN_SUBSCRIBE_EVENT.value
+    _keys = ("pluginId", "channelNo")
+    _struct = struct.Struct("<4xQ4xB3xI")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.PLUGIN_SUBSCRIBE_EVENT.value]
+
+    def __init__(self, timestamp: int, pluginId: int, channelNo: int):
+        self.timestamp = timestamp
+        self.pluginId = pluginId
+        self.channelNo = channelNo
+
+
+class PluginUnsubscribeEventEvent(EventRecord):
+    """PLUGIN_UNSUBSCRIBE_EVENT, decoded. Maps to Swift: `PackedPluginUnsubscribeEvent`"""
+
+    __slots__ = ("pluginId", "channelNo")
+    type = Events.PLUGIN_UNSUBSCRIBE_EVENT.value
+    _keys = ("pluginId", "channelNo")
+    _struct = struct.Struct("<4xQ4xB3xI")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.PLUGIN_UNSUBSCRIBE_EVENT.value]
+
+    def __init__(self, timestamp: int, pluginId: int, channelNo: int):
+        self.timestamp = timestamp
+        self.pluginId = pluginId
+        self.channelNo = channelNo
+
+
+class CameraSetPositionEvent(EventRecord):
+    """CAMERA_SET_POSITION, decoded. Maps to Swift: `PackedCameraSetPositionEvent`"""
+
+    __slots__ = ("positionX", "positionY")
+    type = Events.CAMERA_SET_POSITION.value
+    _keys = ("positionX", "positionY")
+    _struct = struct.Struct("<4xQ4xdd")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.CAMERA_SET_POSITION.value]
+
+    def __init__(self, timestamp: int, positionX: float, positionY: float):
+        self.timestamp = timestamp
+        self.positionX = positionX
+        self.positionY = positionY
+
+
+class CameraMoveEvent(EventRecord):
+    """CAMERA_MOVE, decoded. Maps to Swift: `PackedCameraMoveEvent`"""
+
+    __slots__ = ("deltaX", "deltaY")
+    type = Events.CAMERA_MOVE.value
+    _keys = ("deltaX", "deltaY")
+    _struct = struct.Struct("<4xQ4xdd")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.CAMERA_MOVE.value]
+
+    def __init__(self, timestamp: int, deltaX: float, deltaY: float):
+        self.timestamp = timestamp
+        self.deltaX = deltaX
+        self.deltaY = deltaY
+
+
+class CameraSetZoomEvent(EventRecord):
+    """CAMERA_SET_ZOOM, decoded. Maps to Swift: `PackedCameraSetZoomEvent`"""
+
+    __slots__ = ("zoom",)
+    type = Events.CAMERA_SET_ZOOM.value
+    _keys = ("zoom",)
+    _struct = struct.Struct("<4xQ4xd")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.CAMERA_SET_ZOOM.value]
+
+    def __init__(self, timestamp: int, zoom: float):
+        self.timestamp = timestamp
+        self.zoom = zoom
+
+
+class CameraSetRotationEvent(EventRecord):
+    """CAMERA_SET_ROTATION, decoded. Maps to Swift: `PackedCameraSetRotationEvent`"""
+
+    __slots__ = ("angleInRadians",)
+    type = Events.CAMERA_SET_ROTATION.value
+    _keys = ("angleInRadians",)
+    _struct = struct.Struct("<4xQ4xd")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.CAMERA_SET_ROTATION.value]
+
+    def __init__(self, timestamp: int, angleInRadians: float):
+        self.timestamp = timestamp
+        self.angleInRadians = angleInRadians
+
+
+class CameraFollowEntityEvent(EventRecord):
+    """CAMERA_FOLLOW_ENTITY, decoded. Maps to Swift: `PackedCameraFollowEntityEvent`"""
+
+    __slots__ = ("id1", "id2")
+    type = Events.CAMERA_FOLLOW_ENTITY.value
+    _keys = ("id1", "id2")
+    _struct = struct.Struct("<4xQ4xqq")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.CAMERA_FOLLOW_ENTITY.value]
+
+    def __init__(self, timestamp: int, id1: int, id2: int):
+        self.timestamp = timestamp
+        self.id1 = id1
+        self.id2 = id2
+
+
+class CameraStopFollowingEvent(EventRecord):
+    """CAMERA_STOP_FOLLOWING, decoded. Maps to Swift: `PackedCameraStopFollowingEvent`"""
+
+    __slots__ = ("_unused",)
+    type = Events.CAMERA_STOP_FOLLOWING.value
+    _keys = ("_unused",)
+    _struct = struct.Struct("<4xQ4xB7x")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.CAMERA_STOP_FOLLOWING.value]
+
+    def __init__(self, timestamp: int, _unused: int):
+        self.timestamp = timestamp
+        self._unused = _unused
+
+
+class ScriptSubscribeEvent(EventRecord):
+    """SCRIPT_SUBSCRIBE, decoded. Maps to Swift: `PackedScriptSubscribeEvent`"""
+
+    __slots__ = ("channelNo",)
+    type = Events.SCRIPT_SUBSCRIBE.value
+    _keys = ("channelNo",)
+    _struct = struct.Struct("<4xQ4xI4x")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.SCRIPT_SUBSCRIBE.value]
+
+    def __init__(self, timestamp: int, channelNo: int):
+        self.timestamp = timestamp
+        self.channelNo = channelNo
+
+
+class ScriptUnsubscribeEvent(EventRecord):
+    """SCRIPT_UNSUBSCRIBE, decoded. Maps to Swift: `PackedScriptUnsubscribeEvent`"""
+
+    __slots__ = ("channelNo",)
+    type = Events.SCRIPT_UNSUBSCRIBE.value
+    _keys = ("channelNo",)
+    _struct = struct.Struct("<4xQ4xI4x")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.SCRIPT_UNSUBSCRIBE.value]
+
+    def __init__(self, timestamp: int, channelNo: int):
+        self.timestamp = timestamp
+        self.channelNo = channelNo
+
+
+PackFormat._RECORD_CLASSES.update({
+    Events.SPRITE_ADD.value: SpriteAddEvent,
+    Events.SPRITE_REMOVE.value: SpriteRemoveEvent,
+    Events.SPRITE_MOVE.value: SpriteMoveEvent,
+    Events.SPRITE_SCALE.value: SpriteScaleEvent,
+    Events.SPRITE_RESIZE.value: SpriteResizeEvent,
+    Events.SPRITE_ROTATE.value: SpriteRotateEvent,
+    Events.SPRITE_COLOR.value: SpriteColorEvent,
+    Events.SPRITE_SPEED.value: SpriteSpeedEvent,
+    Events.SPRITE_TEXTURE_LOAD.value: SpriteTextureLoadEvent,
+    Events.SPRITE_TEXTURE_SET.value: SpriteTextureSetEvent,
+    Events.SPRITE_SET_SOURCE_RECT.value: SpriteSetSourceRectEvent,
+    Events.SPRITE_MOVE_F32.value: SpriteMoveF32Event,
+    Events.SPRITE_SCALE_F32.value: SpriteScaleF32Event,
+    Events.SPRITE_ROTATE_F32.value: SpriteRotateF32Event,
+    Events.SPRITE_SPEED_F32.value: SpriteSpeedF32Event,
+    Events.SPRITE_BIND_HANDLE.value: SpriteBindHandleEvent,
+    Events.SPRITE_RELEASE_HANDLE.value: SpriteReleaseHandleEvent,
+    Events.SPRITE_MOVE_HANDLE.value: SpriteMoveHandleEvent,
+    Events.SPRITE_SCALE_HANDLE.value: SpriteScaleHandleEvent,
+    Events.SPRITE_ROTATE_HANDLE.value: SpriteRotateHandleEvent,
+    Events.SPRITE_SPEED_HANDLE.value: SpriteSpeedHandleEvent,
+    Events.GEOM_ADD_POINT.value: GeomAddPointEvent,
+    Events.GEOM_ADD_LINE.value: GeomAddLineEvent,
+    Events.GEOM_ADD_RECT.value: GeomAddRectEvent,
+    Events.GEOM_ADD_FILL_RECT.value: GeomAddFillRectEvent,
+    Events.GEOM_ADD_PACKED.value: GeomAddPackedEvent,
+    Events.GEOM_REMOVE.value: GeomRemoveEvent,
+    Events.GEOM_SET_COLOR.value: GeomSetColorEvent,
+    Events.INPUT_KEYUP.value: InputKeyupEvent,
+    Events.INPUT_KEYDOWN.value: InputKeydownEvent,
+    Events.INPUT_MOUSEUP.value: InputMouseupEvent,
+    Events.INPUT_MOUSEDOWN.value: InputMousedownEvent,
+    Events.INPUT_MOUSEMOTION.value: InputMousemotionEvent,
+    Events.WINDOW_TITLE.value: WindowTitleEvent,
+    Events.WINDOW_RESIZE.value: WindowResizeEvent,
+    Events.WINDOW_FLAGS.value: WindowFlagsEvent,
+    Events.TEXT_ADD.value: TextAddEvent,
+    Events.TEXT_SET_STRING.value: TextSetStringEvent,
+    Events.AUDIO_LOAD.value: AudioLoadEvent,
+    Events.AUDIO_LOADED.value: AudioLoadedEvent,
+    Events.AUDIO_PLAY.value: AudioPlayEvent,
+    Events.AUDIO_STOP_ALL.value: AudioStopAllEvent,
+    Events.AUDIO_SET_MASTER_VOLUME.value: AudioSetMasterVolumeEvent,
+    Events.AUDIO_PAUSE.value: AudioPauseEvent,
+    Events.AUDIO_STOP.value: AudioStopEvent,
+    Events.AUDIO_UNLOAD.value: AudioUnloadEvent,
+    Events.AUDIO_SET_VOLUME.value: AudioSetVolumeEvent,
+    Events.PHYSICS_ADD_BODY.value: PhysicsAddBodyEvent,
+    Events.PHYSICS_REMOVE_BODY.value: PhysicsRemoveBodyEvent,
+    Events.PHYSICS_APPLY_FORCE.value: PhysicsApplyForceEvent,
+    Events.PHYSICS_APPLY_IMPULSE.value: PhysicsApplyImpulseEvent,
+    Events.PHYSICS_SET_VELOCITY.value: PhysicsSetVelocityEvent,
+    Events.PHYSICS_SET_POSITION.value: PhysicsSetPositionEvent,
+    Events.PHYSICS_SET_ROTATION.value: PhysicsSetRotationEvent,
+    Events.PHYSICS_BIND_HANDLE.value: PhysicsBindHandleEvent,
+    Events.PHYSICS_RELEASE_HANDLE.value: PhysicsReleaseHandleEvent,
+    Events.PHYSICS_SET_VELOCITY_HANDLE.value: PhysicsSetVelocityHandleEvent,
+    Events.PHYSICS_SET_POSITION_HANDLE.value: PhysicsSetPositionHandleEvent,
+    Events.PHYSICS_SET_ROTATION_HANDLE.value: PhysicsSetRotationHandleEvent,
+    Events.PHYSICS_COLLISION_BEGIN.value: PhysicsCollisionBeginEvent,
+    Events.PHYSICS_COLLISION_SEPARATE.value: PhysicsCollisionSeparateEvent,
+    Events.PHYSICS_SYNC_TRANSFORM.value: PhysicsSyncTransformEvent,
+    Events.PHYSICS_SET_DEBUG_MODE.value: PhysicsSetDebugModeEvent,
+    Events.PLUGIN.value: PluginEvent,
+    Events.PLUGIN_LOAD.value: PluginLoadEvent,
+    Events.PLUGIN_UNLOAD.value: PluginUnloadEvent,
+    Events.PLUGIN_SET.value: PluginSetEvent,
+    Events.PLUGIN_EVENT_STACKING.value: PluginEventStackingEvent,
+    Events.PLUGIN_SUBSCRIBE_EVENT.value: PluginSubscribeEventEvent,
+    Events.PLUGIN_UNSUBSCRIBE_EVENT.value: PluginUnsubscribeEventEvent,
+    Events.CAMERA_SET_POSITION.value: CameraSetPositionEvent,
+    Events.CAMERA_MOVE.value: CameraMoveEvent,
+    Events.CAMERA_SET_ZOOM.value: CameraSetZoomEvent,
+    Events.CAMERA_SET_ROTATION.value: CameraSetRotationEvent,
+    Events.CAMERA_FOLLOW_ENTITY.value: CameraFollowEntityEvent,
+    Events.CAMERA_STOP_FOLLOWING.value: CameraStopFollowingEvent,
+    Events.SCRIPT_SUBSCRIBE.value: ScriptSubscribeEvent,
+    Events.SCRIPT_UNSUBSCRIBE.value: ScriptUnsubscribeEvent,
+})
+# --- End PackFormat Class ---
 
 # --- CommandPacker Class ---
 class CommandPacker:
 
-    def __init__(self, chunk_size: int = 0, chunk_callback: Optional[Callable] = None):
-        self._event_stream = bytearray()
+    _INITIAL_CAPACITY = 64 * 1024
+    # With a shrink policy, the buffer is only reallocated when it is
+    # at least this many times larger than recent frames needed.
+    _SHRINK_RATIO = 4
+
+    # Events with a variable-length tail, packed by hand in _pack_event
+    _DYNAMIC_EVENTS = frozenset((
+        Events.SPRITE_TEXTURE_LOAD,
+        Events.PLUGIN_LOAD,
+        Events.AUDIO_LOAD,
+        Events.TEXT_ADD,
+        Events.TEXT_SET_STRING,
+        Events.EVENT_BATCH,
+    ))
+
+    # Events that are never folded into an EVENT_BATCH
+    _UNBATCHED_EVENTS = PackFormat._VARIABLE_LENGTH_EVENTS
+
+    # EVENT_BATCH header: <IQ4x event header, then (eventType, count)
+    _BATCH_HEADER_STRUCT = PackFormat._EVENT_STRUCT_MAP[Events.EVENT_BATCH]
+    # The (eventType, count) a lone event gains when it becomes a batch
+    _BATCH_COUNT_SIZE = _BATCH_HEADER_STRUCT.size - PackFormat._HEADER_STRUCT.size
+    # The (id1, id2) that starts an entity event's payload
+    _IDS_STRUCT = struct.Struct("<qq")
+
+    # Idempotent "set" events: with coalescing on, a repeat for the
+    # same (id1, id2) in one frame overwrites the earlier event in place.
+    # Keep in sync with COALESCE_EVENTS in PythonAdapter.php.
+    _COALESCE_EVENTS = frozenset((
+        Events.SPRITE_MOVE,
+        Events.SPRITE_SCALE,
+        Events.SPRITE_RESIZE,
+        Events.SPRITE_ROTATE,
+        Events.SPRITE_COLOR,
+        Events.SPRITE_SPEED,
+        Events.SPRITE_TEXTURE_SET,
+        Events.SPRITE_SET_SOURCE_RECT,
+        Events.SPRITE_MOVE_F32,
+        Events.SPRITE_SCALE_F32,
+        Events.SPRITE_ROTATE_F32,
+        Events.SPRITE_SPEED_F32,
+        Events.GEOM_SET_COLOR,
+        Events.PHYSICS_SET_VELOCITY,
+        Events.PHYSICS_SET_POSITION,
+        Events.PHYSICS_SET_ROTATION,
+    ))
+
+    # f64 "set" events and their compact f32 variants. Both set the same
+    # property, so recording one forgets the other's slot: a later event
+    # is never merged into a slot that sits in front of its sibling.
+    _PRECISION_SIBLINGS = {
+        Events.SPRITE_MOVE: Events.SPRITE_MOVE_F32,
+        Events.SPRITE_SCALE: Events.SPRITE_SCALE_F32,
+        Events.SPRITE_ROTATE: Events.SPRITE_ROTATE_F32,
+        Events.SPRITE_SPEED: Events.SPRITE_SPEED_F32,
+        Events.SPRITE_MOVE_F32: Events.SPRITE_MOVE,
+        Events.SPRITE_SCALE_F32: Events.SPRITE_SCALE,
+        Events.SPRITE_ROTATE_F32: Events.SPRITE_ROTATE,
+        Events.SPRITE_SPEED_F32: Events.SPRITE_SPEED,
+    }
+
+    # Every other event addressed to an (id1, id2) entity (adds, removes,
+    # forces, impulses, ...). These are barriers: later "set" events for
+    # that entity are never moved in front of them.
+    _ENTITY_EVENTS = frozenset(
+        event for event in Events
+        if PackFormat._EVENT_KEY_MAP[event][:2] == ["id1", "id2"]
+    ) - _COALESCE_EVENTS
+
+    # Events addressed by an engine handle instead of (id1, id2). The
+    # packer can't tell which entity a handle belongs to, so each one
+    # is a barrier for every pending slot: the index is cleared.
+    _HANDLE_EVENTS = frozenset(
+        event for event in Events
+        if PackFormat._EVENT_KEY_MAP[event][:1] == ["handle"]
+    )
+
+    def __init__(
+        self,
+        chunk_size: int = 0,
+        chunk_callback: Optional[Callable] = None,
+        capacity: int = 0,
+        shrink_after: int = 0,
+        coalesce: bool = False,
+        batch: bool = False,
+    ):
+        """
+        :param capacity: Bytes to presize the buffer for (e.g. a previous
+                         high-water mark).
+        :param shrink_after: If > 0, every this many reset()s the buffer is
+                             shrunk when it has become much larger than
+                             what those frames needed. 0 never shrinks.
+        :param coalesce: If True, repeated _COALESCE_EVENTS for the same
+                         entity within a frame are merged (last write
+                         wins) instead of all being sent.
+        :param batch: If True, consecutive fixed-size events of the same
+                      type are sent as one EVENT_BATCH: a single header,
+                      then the payloads back to back.
+        """
+        # Events are packed straight into a preallocated buffer with
+        # pack_into; _offset tracks how much of it is in use. The
+        # first bytes are reserved for the event count, which
+        # finalize() back-patches.
+        self._event_stream = bytearray(CommandPacker._capacity_for(capacity))
+        self._offset = PackFormat._COUNT_STRUCT.size
         self._command_count = 0
-        self._event_buffer: List[Dict[str, Any]] = []
         self._chunk_size = chunk_size
         self._chunk_callback = chunk_callback
+        # Event count at which the chunk callback next fires (0 = never)
+        self._next_chunk = chunk_size
+
+        # Largest number of bytes any frame has used, and the peak
+        # over the current shrink window
+        self._high_water = 0
+        self._shrink_after = shrink_after
+        self._window_peak = 0
+        self._window_frames = 0
+
+        # (id1, id2) -> {event type: offset of this frame's event payload},
+        # or None when coalescing is off
+        self._coalesce_index: Optional[Dict[Tuple[int, int], Dict[int, int]]] = (
+            {} if coalesce else None
+        )
+        self._coalesced_count = 0
+
+        # The run of same-type events that ends the stream: its type, where
+        # its header starts and how many events it holds (1 = a lone event
+        # with its own header, more = an EVENT_BATCH). It can only be
+        # extended while nothing else has been written after it, i.e.
+        # while _run_end == _offset.
+        self._batching = batch
+        self._run_type = -1
+        self._run_start = 0
+        self._run_count = 0
+        self._run_end = -1
+        # Events folded into a batch without a header of their own
+        self._batched_count = 0
+
+    @staticmethod
+    def _capacity_for(size: int) -> int:
+        """Smallest power-of-two capacity (>= the initial one) holding `size`."""
+        capacity = CommandPacker._INITIAL_CAPACITY
+        while capacity < size:
+            capacity *= 2
+        return capacity
+
+    def reset(self, chunk_size: Optional[int] = None):
+        """
+        Clears the packer for a new frame but keeps its buffer, so a
+        steady-state frame never reallocates. Views returned by
+        finalize_views() must not be used after this.
+
+        :param chunk_size: Optionally change the chunk size.
+        """
+        used = self._offset
+        if used > self._high_water:
+            self._high_water = used
+
+        if self._shrink_after > 0:
+            if used > self._window_peak:
+                self._window_peak = used
+            self._window_frames += 1
+            if self._window_frames >= self._shrink_after:
+                target = CommandPacker._capacity_for(self._window_peak)
+                if target * CommandPacker._SHRINK_RATIO <= len(self._event_stream):
+                    self._event_stream = bytearray(target)
+                    self._high_water = self._window_peak
+                self._window_peak = 0
+                self._window_frames = 0
+
+        if chunk_size is not None:
+            self._chunk_size = chunk_size
+        self._offset = PackFormat._COUNT_STRUCT.size
+        self._command_count = 0
+        self._next_chunk = self._chunk_size
+        if self._coalesce_index is not None:
+            self._coalesce_index.clear()
+        self._coalesced_count = 0
+        self._run_end = -1
+        self._batched_count = 0
+
+    def get_high_water_mark(self) -> int:
+        """Largest number of bytes a single frame has used so far."""
+        return max(self._high_water, self._offset)
+
+    def get_capacity(self) -> int:
+        return len(self._event_stream)
 
     def add(self, event_type: Events, data: list):
         """
         Adds a new event to the packer.
 
+        Kept for compatibility; prefer the typed methods
+        (e.g. packer.sprite_move(...)), which skip the list and
+        the event-type dispatch.
+
         :param event_type: The Events enum member.
         :param data: A list of arguments for the event, matching the
                      struct definition. For dynamic events, the final
                      arguments must be pre-encoded bytes.
         """
-        if self._chunk_size > 0:
-            self._event_buffer.append({"type": event_type, "data": data})
-            if len(self._event_buffer) >= self._chunk_size:
-                self._pack_buffered_events()
+        self._pack_event(event_type, data)
+
+    def _grow(self, needed: int):
+        """Grows the buffer (by doubling) until it can hold `needed` bytes."""
+        capacity = len(self._event_stream)
+        while capacity < needed:
+            capacity *= 2
+        # Copy into a new buffer rather than resizing in place: a
+        # bytearray can't be resized while views from
+        # finalize_views() are still alive.
+        stream = bytearray(capacity)
+        stream[:self._offset] = memoryview(self._event_stream)[:self._offset]
+        self._event_stream = stream
+
+    def _reserve(self, size: int) -> int:
+        """
+        Makes room for `size` more bytes and returns the offset the
+        caller should write at.
+        """
+        offset = self._offset
+        needed = offset + size
+        if needed > len(self._event_stream):
+            self._grow(needed)
+        self._offset = needed
+        return offset
+
+    def _find_slot(self, event_type: int, id1: int, id2: int) -> int:
+        """Offset of this frame's earlier `event_type` for (id1, id2), or -1."""
+        slots = self._coalesce_index.get((id1, id2))
+        if slots is None:
+            return -1
+        return slots.get(event_type, -1)
+
+    def _record_slot(self, event_type: int, id1: int, id2: int, offset: int):
+        slots = self._coalesce_index.get((id1, id2))
+        if slots is None:
+            self._coalesce_index[(id1, id2)] = {event_type: offset}
+        else:
+            slots[event_type] = offset
+            sibling = CommandPacker._PRECISION_SIBLINGS.get(event_type)
+            if sibling is not None:
+                slots.pop(sibling, None)
+
+    def _batch_offset(self, event_type: int, count: int) -> int:
+        """
+        Batching: makes room for `count` payloads of `event_type` and
+        returns the offset to write them at. Nothing is committed until
+        _join_batch(), so a failed pack_into() leaves the stream intact.
+        """
+        offset = self._offset
+        if offset == self._run_end and event_type == self._run_type:
+            if self._run_count == 1:
+                offset += CommandPacker._BATCH_COUNT_SIZE
+        elif count == 1:
+            offset += PackFormat._HEADER_STRUCT.size
         else:
-            self._pack_event(event_type, data)
+            offset += CommandPacker._BATCH_HEADER_STRUCT.size
+        end = offset + PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].size * count
+        if end > len(self._event_stream):
+            self._grow(end)
+        return offset
+
+    def _join_batch(self, event_type: int, offset: int, count: int):
+        """
+        Commits `count` payloads written at `offset` (from _batch_offset):
+        writes the header of a new run, or turns the run that ends the
+        stream into an EVENT_BATCH and updates its count.
+        """
+        stream = self._event_stream
+        stride = PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].size
+        start = self._offset
+        gap = offset - start
+        if gap == PackFormat._HEADER_STRUCT.size:
+            # A lone event, with its own header
+            PackFormat._HEADER_STRUCT.pack_into(stream, start, event_type, 0)
+            self._run_type = event_type
+            self._run_start = start
+            self._run_count = 1
+        elif gap == CommandPacker._BATCH_HEADER_STRUCT.size:
+            # A new batch
+            CommandPacker._BATCH_HEADER_STRUCT.pack_into(
+                stream, start, Events.EVENT_BATCH, 0, event_type, count
+            )
+            self._run_type = event_type
+            self._run_start = start
+            self._run_count = count
+            self._batched_count += count - 1
+        else:
+            start = self._run_start
+            shift = CommandPacker._BATCH_COUNT_SIZE
+            if gap == shift:
+                # The lone event becomes the first entry: move its payload
+                # behind the batch header (and its coalescing slot with it)
+                payload = start + PackFormat._HEADER_STRUCT.size
+                stream[payload + shift:payload + shift + stride] = stream[payload:payload + stride]
+                if self._coalesce_index is not None and event_type in CommandPacker._COALESCE_EVENTS:
+                    slots = self._coalesce_index.get(
+                        CommandPacker._IDS_STRUCT.unpack_from(stream, payload + shift)
+                    )
+                    if slots is not None and slots.get(event_type) == payload:
+                        slots[event_type] = payload + shift
+            self._run_count += count
+            self._batched_count += count
+            CommandPacker._BATCH_HEADER_STRUCT.pack_into(
+                stream, start, Events.EVENT_BATCH, 0, event_type, self._run_count
+            )
+        self._offset = self._run_end = offset + stride * count
+
+    def _write_bytes(self, data: bytes):
+        """Writes a string tail, zero-padded to the next 8-byte boundary."""
+        size = (len(data) + 7) & ~7
+        offset = self._reserve(size)
+        self._event_stream[offset:offset + size] = data.ljust(size, b"\0")
 
     def _pack_event(self, event_type: Events, data: list):
-        type_value = event_type.value
-        try:
-            # Pack header: <I (type) <Q (timestamp) = 12 bytes
-            self._event_stream.extend(struct.pack("<IQ", type_value, 0))
-        except struct.error as e:
-            print(f"CommandPacker ({event_type.name}): Failed to pack header: {e}", file=sys.stderr)
-            return
+        # Events is an IntEnum, so event_type can be used directly as
+        # the map key and as the packed type value.
+        event_struct = PackFormat._EVENT_STRUCT_MAP.get(event_type)
+        start = self._offset
+        # Whether this event gets a coalescing slot once it is written
+        record = False
 
         try:
+            if event_struct is None:
+                raise ValueError(f"Could not get payload info for {event_type.name}")
+
+            index = self._coalesce_index
+            if index is not None:
+                if event_type in CommandPacker._COALESCE_EVENTS:
+                    slot = self._find_slot(event_type, data[0], data[1])
+                    if slot >= 0:
+                        # Last write wins: overwrite the earlier payload
+                        PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(
+                            self._event_stream, slot, *data
+                        )
+                        self._coalesced_count += 1
+                        return
+                    record = True
+                elif event_type in CommandPacker._ENTITY_EVENTS:
+                    index.pop((data[0], data[1]), None)
+                elif event_type in CommandPacker._HANDLE_EVENTS:
+                    index.clear()
+
+            if self._batching and event_type not in CommandPacker._UNBATCHED_EVENTS:
+                # --- Batched Fixed-Size Event: payload only ---
+                offset = self._batch_offset(event_type, 1)
+                PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(
+                    self._event_stream, offset, *data
+                )
+                self._join_batch(event_type, offset, 1)
+
+            elif event_type not in CommandPacker._DYNAMIC_EVENTS:
+                # --- Fixed-Size Event Packing Logic ---
+                # event_struct covers the <IQ4x header, the payload
+                # and the padding up to the next 8-byte boundary
+                end = start + event_struct.size
+                if end > len(self._event_stream):
+                    self._grow(end)
+                event_struct.pack_into(self._event_stream, start, event_type, 0, *data)
+                self._offset = end
+
             # --- Manual Packing for Variable-Length Events ---
-            # These events have a (format, size) for their *header*
+            # These events have a struct for their *header*
             # and expect raw bytes as their final argument(s).
-
-            if event_type == Events.SPRITE_TEXTURE_LOAD:
+            # The header struct is padded to 8 bytes and so is
+            # each string tail (see _write_bytes).
+            elif event_type == Events.SPRITE_TEXTURE_LOAD:
                 # data = [id0(q), id1(q), filenameLength(I), filename_bytes(b"")]
                 if len(data) != 4: raise ValueError(f"TEXTURE_LOAD: Expected 4 args, got {len(data)}")
-                fmt, _ = PackFormat.get_info(type_value) # ("<qqI4x", 24)
-                self._event_stream.extend(struct.pack(fmt, data[0], data[1], data[2]))
-                self._event_stream.extend(data[3]) # data[3] is already bytes
+                offset = self._reserve(event_struct.size)
+                event_struct.pack_into(self._event_stream, offset, event_type, 0, data[0], data[1], data[2])
+                self._write_bytes(data[3]) # data[3] is already bytes
 
             elif event_type == Events.PLUGIN_LOAD:
-                # data = [pathLength(I), path_bytes(b"")]
-                if len(data) != 2: raise ValueError(f"PLUGIN_LOAD: Expected 2 args, got {len(data)}")
-                fmt, _ = PackFormat.get_info(type_value) # ("<I", 4)
-                self._event_stream.extend(struct.pack(fmt, data[0]))
-                self._event_stream.extend(data[1]) # data[1] is already bytes
+                # data = [channelNo(I), pathLength(I), path_bytes(b"")]
+                if len(data) != 3: raise ValueError(f"PLUGIN_LOAD: Expected 3 args, got {len(data)}")
+                offset = self._reserve(event_struct.size)
+                event_struct.pack_into(self._event_stream, offset, event_type, 0, data[0], data[1])
+                self._write_bytes(data[2]) # data[2] is already bytes
 
             elif event_type == Events.AUDIO_LOAD:
                 # data = [pathLength(I), path_bytes(b"")]
                 if len(data) != 2: raise ValueError(f"AUDIO_LOAD: Expected 2 args, got {len(data)}")
-                fmt, _ = PackFormat.get_info(type_value) # ("<I", 4)
-                self._event_stream.extend(struct.pack(fmt, data[0]))
-                self._event_stream.extend(data[1]) # data[1] is already bytes
+                offset = self._reserve(event_struct.size)
+                event_struct.pack_into(self._event_stream, offset, event_type, 0, data[0])
+                self._write_bytes(data[1]) # data[1] is already bytes
 
             elif event_type == Events.TEXT_ADD:
                 # data = [id0(q), id1(q), ..., fontPath_bytes(b""), text_bytes(b"")]
                 if len(data) != 14: raise ValueError(f"TEXT_ADD: Expected 14 args, got {len(data)}")
-                fmt, _ = PackFormat.get_info(type_value) # ("<qqdddBBBB4xfII4x", 64)
-                self._event_stream.extend(struct.pack(
-                    fmt,
+                offset = self._reserve(event_struct.size)
+                event_struct.pack_into(
+                    self._event_stream, offset, event_type, 0,
                     data[0], data[1], data[2], data[3], data[4],  # id, pos
                     data[5], data[6], data[7], data[8],  # rgba
                     data[9], data[10], data[11]  # fontSize, fontPathLen, textLen
-                ))
-                self._event_stream.extend(data[12]) # fontPath_bytes
-                self._event_stream.extend(data[13]) # text_bytes
+                )
+                self._write_bytes(data[12]) # fontPath_bytes
+                self._write_bytes(data[13]) # text_bytes
 
             elif event_type == Events.TEXT_SET_STRING:
                 # data = [id0(q), id1(q), textLength(I), text_bytes(b"")]
                 if len(data) != 4: raise ValueError(f"TEXT_SET_STRING: Expected 4 args, got {len(data)}")
-                fmt, _ = PackFormat.get_info(type_value) # ("<qqI4x", 24)
-                self._event_stream.extend(struct.pack(fmt, data[0], data[1], data[2]))
-                self._event_stream.extend(data[3]) # text_bytes
+                offset = self._reserve(event_struct.size)
+                event_struct.pack_into(self._event_stream, offset, event_type, 0, data[0], data[1], data[2])
+                self._write_bytes(data[3]) # text_bytes
+
+            elif event_type == Events.EVENT_BATCH:
+                # data = [eventType(I), count(I), payloads_bytes(b"")]
+                # The payloads must already be padded to 8 bytes each
+                if len(data) != 3: raise ValueError(f"EVENT_BATCH: Expected 3 args, got {len(data)}")
+                offset = self._reserve(event_struct.size)
+                event_struct.pack_into(self._event_stream, offset, event_type, 0, data[0], data[1])
+                self._write_bytes(data[2]) # payloads_bytes
+
+            if record:
+                self._record_slot(
+                    event_type, data[0], data[1],
+                    self._offset - PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].size
+                )
+            self._command_count += 1
+            if self._command_count == self._next_chunk:
+                self._chunk_reached()
 
-            else:
-                # --- Fixed-Size Event Packing Logic ---
-                payload_info = PackFormat.get_info(type_value)
-                if payload_info is None:
-                    raise ValueError(f"Could not get payload info for {event_type.name}")
+        except (struct.error, ValueError, TypeError, IndexError) as e:
+            # Drop any partially written event
+            self._offset = start
+            print(f"CommandPacker ({event_type.name}): Error during pack! {e}", file=sys.stderr)
+            print(f"  Data: {data}", file=sys.stderr)
 
-                fmt, size = payload_info
+    def add_many(self, event_type: Events, **columns):
+        """
+        Packs a whole run of one fixed-size event in a single step.
 
-                if not fmt and data:
-                    raise ValueError(f"Format is empty but data was provided for {event_type.name}")
+        Each keyword is a member name from the struct (see
+        PackFormat._EVENT_KEY_MAP) and each value is a column: a NumPy
+        array, an array.array, or any sequence, all of the same length.
 
-                if fmt:
-                    # fmt is the pre-compiled struct string (e.g., "<qqd")
-                    self._event_stream.extend(struct.pack(fmt, *data))
+            packer.add_many(Events.SPRITE_MOVE, id1=ids1, id2=ids2,
+                            positionX=xs, positionY=ys, positionZ=zs)
 
-            self._command_count += 1
+        With NumPy installed the columns are copied into a structured
+        array and written with one tobytes(); otherwise each row is
+        packed with pack_into(). With coalescing on, entity events are
+        packed row by row through add() so they can be merged. With
+        batching on, the run is written as (or appended to) one
+        EVENT_BATCH.
+        """
+        try:
+            if event_type in CommandPacker._DYNAMIC_EVENTS:
+                raise ValueError("add_many only supports fixed-size events")
+
+            keys = PackFormat._EVENT_KEY_MAP[event_type]
+            if set(columns) != set(keys):
+                raise ValueError(f"Expected columns {keys}, got {list(columns)}")
+
+            count = len(columns[keys[0]]) if keys else 0
+            if any(len(column) != count for column in columns.values()):
+                raise ValueError("All columns must have the same length")
+            if count == 0:
+                return
+
+            if self._coalesce_index is not None and (
+                event_type in CommandPacker._COALESCE_EVENTS
+                or event_type in CommandPacker._ENTITY_EVENTS
+            ):
+                for row in zip(*(columns[key] for key in keys)):
+                    self._pack_event(event_type, list(row))
+                return
+            if self._coalesce_index is not None and event_type in CommandPacker._HANDLE_EVENTS:
+                self._coalesce_index.clear()
+
+            if self._batching and event_type not in CommandPacker._UNBATCHED_EVENTS:
+                # Payloads only, committed by _join_batch once all are written
+                payload_struct = PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type]
+                offset = self._batch_offset(event_type, count)
+                end = offset + payload_struct.size * count
+                if np is not None:
+                    records = np.zeros(count, dtype=PackFormat.get_dtype(event_type, header=False))
+                    for key in keys:
+                        records[key] = columns[key]
+                    self._event_stream[offset:end] = records.tobytes()
+                else:
+                    stride = payload_struct.size
+                    rows = zip(*(columns[key] for key in keys))
+                    for i, row in enumerate(rows):
+                        payload_struct.pack_into(self._event_stream, offset + i * stride, *row)
+                self._join_batch(event_type, offset, count)
+            else:
+                event_struct = PackFormat._EVENT_STRUCT_MAP[event_type]
+                offset = self._offset
+                end = offset + event_struct.size * count
+                if end > len(self._event_stream):
+                    self._grow(end)
+
+                if np is not None:
+                    records = np.zeros(count, dtype=PackFormat.get_dtype(event_type))
+                    records["type"] = event_type
+                    for key in keys:
+                        records[key] = columns[key]
+                    self._event_stream[offset:end] = records.tobytes()
+                else:
+                    stride = event_struct.size
+                    rows = zip(*(columns[key] for key in keys))
+                    for i, row in enumerate(rows):
+                        event_struct.pack_into(self._event_stream, offset + i * stride, event_type, 0, *row)
+                self._offset = end
 
         except (struct.error, ValueError, TypeError) as e:
-            print(f"CommandPacker ({event_type.name}): Error during pack! {e}", file=sys.stderr)
-            print(f"  Data: {data}", file=sys.stderr)
-
-    def _pack_buffered_events(self):
-        if not self._event_buffer:
+            print(f"CommandPacker ({event_type.name}): Error during add_many! {e}", file=sys.stderr)
             return
-        for event in self._event_buffer:
-            self._pack_event(event["type"], event["data"])
 
-        if self._chunk_callback:
-            self._chunk_callback(len(self._event_buffer), self._command_count)
+        self._command_count += count
+        while 0 < self._next_chunk <= self._command_count:
+            self._chunk_reached()
 
-        self._event_buffer = []
+    def _chunk_reached(self):
+        if self._chunk_callback:
+            self._chunk_callback(self._chunk_size, self._command_count)
+        self._next_chunk += self._chunk_size
 
     def flush(self):
-        if self._event_buffer:
-            self._pack_buffered_events()
+        # Events are packed as they are added; nothing is held back.
+        pass
 
-    def finalize(self) -> bytes:
+    def finalize_views(self) -> List[memoryview]:
+        """
+        Back-patches the event count into its reserved slot and returns
+        the finished stream as a list of memoryviews, without copying.
+        The views are only valid until the packer is written to again.
+        """
         self.flush()
         if self._command_count == 0:
-            return b""
-        # Prepend count (<I) and return the full byte stream
-        return struct.pack("<I", self._command_count) + self._event_stream
+            return []
+        # Batched events share their batch's header, so the stream holds
+        # fewer top-level events than were packed
+        PackFormat._COUNT_STRUCT.pack_into(
+            self._event_stream, 0, self._command_count - self._batched_count
+        )
+        return [memoryview(self._event_stream)[:self._offset]]
+
+    def finalize(self) -> bytes:
+        views = self.finalize_views()
+        return views[0].tobytes() if views else b""
 
     def get_buffer_count(self) -> int:
-        return len(self._event_buffer)
+        """Events packed since the last chunk callback."""
+        if self._chunk_size <= 0:
+            return self._command_count
+        return self._command_count - (self._next_chunk - self._chunk_size)
 
     def get_total_event_count(self) -> int:
-        return self._command_count + len(self._event_buffer)# --- End CommandPacker Class ---
+        return self._command_count
+
+    def get_coalesced_count(self) -> int:
+        """Events merged into an earlier one since the last reset()."""
+        return self._coalesced_count
+
+    def get_batched_count(self) -> int:
+        """Events sent inside an EVENT_BATCH without a header of their own since the last reset()."""
+        return self._batched_count
+
+    # --- Typed Pack Methods ---
+    def sprite_add(self, id1: int, id2: int, positionX: float, positionY: float, positionZ: float, scaleX: float, scaleY: float, scaleZ: float, sizeW: float, sizeH: float, rotationX: float, rotationY: float, rotationZ: float, r: int, g: int, b: int, a: int, speedX: float, speedY: float):
+        """Packs SPRITE_ADD. Payload for adding a new sprite to the scene."""
+        event_type = 0  # Events.SPRITE_ADD
+        if self._coalesce_index is not None:
+            self._coalesce_index.pop((id1, id2), None)
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(self._event_stream, offset, id1, id2, positionX, positionY, positionZ, scaleX, scaleY, scaleZ, sizeW, sizeH, rotationX, rotationY, rotationZ, r, g, b, a, speedX, speedY)
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(self._event_stream, offset, event_type, 0, id1, id2, positionX, positionY, positionZ, scaleX, scaleY, scaleZ, sizeW, sizeH, rotationX, rotationY, rotationZ, r, g, b, a, speedX, speedY)
+            self._offset = end
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def sprite_remove(self, id1: int, id2: int):
+        """Packs SPRITE_REMOVE. Payload for removing a sprite from the scene."""
+        event_type = 1  # Events.SPRITE_REMOVE
+        if self._coalesce_index is not None:
+            self._coalesce_index.pop((id1, id2), None)
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(self._event_stream, offset, id1, id2)
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(self._event_stream, offset, event_type, 0, id1, id2)
+            self._offset = end
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def sprite_move(self, id1: int, id2: int, positionX: float, positionY: float, positionZ: float):
+        """Packs SPRITE_MOVE. Payload to move a sprite to an absolute position."""
+        event_type = 2  # Events.SPRITE_MOVE
+        index = self._coalesce_index
+        if index is not None:
+            slot = self._find_slot(event_type, id1, id2)
+            if slot >= 0:
+                PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(self._event_stream, slot, id1, id2, positionX, positionY, positionZ)
+                self._coalesced_count += 1
+                return
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(self._event_stream, offset, id1, id2, positionX, positionY, positionZ)
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(self._event_stream, offset, event_type, 0, id1, id2, positionX, positionY, positionZ)
+            self._offset = end
+        if index is not None:
+            self._record_slot(
+                event_type, id1, id2,
+                self._offset - PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].size,
+            )
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def sprite_scale(self, id1: int, id2: int, scaleX: float, scaleY: float, scaleZ: float):
+        """Packs SPRITE_SCALE. Payload to set a sprite's scale."""
+        event_type = 3  # Events.SPRITE_SCALE
+        index = self._coalesce_index
+        if index is not None:
+            slot = self._find_slot(event_type, id1, id2)
+            if slot >= 0:
+                PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(self._event_stream, slot, id1, id2, scaleX, scaleY, scaleZ)
+                self._coalesced_count += 1
+                return
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(self._event_stream, offset, id1, id2, scaleX, scaleY, scaleZ)
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(self._event_stream, offset, event_type, 0, id1, id2, scaleX, scaleY, scaleZ)
+            self._offset = end
+        if index is not None:
+            self._record_slot(
+                event_type, id1, id2,
+                self._offset - PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].size,
+            )
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def sprite_resize(self, id1: int, id2: int, sizeW: float, sizeH: float):
+        """Packs SPRITE_RESIZE. Payload to set a sprite's size (width/height)."""
+        event_type = 4  # Events.SPRITE_RESIZE
+        index = self._coalesce_index
+        if index is not None:
+            slot = self._find_slot(event_type, id1, id2)
+            if slot >= 0:
+                PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(self._event_stream, slot, id1, id2, sizeW, sizeH)
+                self._coalesced_count += 1
+                return
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(self._event_stream, offset, id1, id2, sizeW, sizeH)
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(self._event_stream, offset, event_type, 0, id1, id2, sizeW, sizeH)
+            self._offset = end
+        if index is not None:
+            self._record_slot(
+                event_type, id1, id2,
+                self._offset - PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].size,
+            )
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def sprite_rotate(self, id1: int, id2: int, rotationX: float, rotationY: float, rotationZ: float):
+        """Packs SPRITE_ROTATE. Payload to set a sprite's rotation."""
+        event_type = 5  # Events.SPRITE_ROTATE
+        index = self._coalesce_index
+        if index is not None:
+            slot = self._find_slot(event_type, id1, id2)
+            if slot >= 0:
+                PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(self._event_stream, slot, id1, id2, rotationX, rotationY, rotationZ)
+                self._coalesced_count += 1
+                return
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(self._event_stream, offset, id1, id2, rotationX, rotationY, rotationZ)
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(self._event_stream, offset, event_type, 0, id1, id2, rotationX, rotationY, rotationZ)
+            self._offset = end
+        if index is not None:
+            self._record_slot(
+                event_type, id1, id2,
+                self._offset - PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].size,
+            )
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def sprite_color(self, id1: int, id2: int, r: int, g: int, b: int, a: int):
+        """Packs SPRITE_COLOR. Payload to set a sprite's color modulation."""
+        event_type = 6  # Events.SPRITE_COLOR
+        index = self._coalesce_index
+        if index is not None:
+            slot = self._find_slot(event_type, id1, id2)
+            if slot >= 0:
+                PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(self._event_stream, slot, id1, id2, r, g, b, a)
+                self._coalesced_count += 1
+                return
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(self._event_stream, offset, id1, id2, r, g, b, a)
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(self._event_stream, offset, event_type, 0, id1, id2, r, g, b, a)
+            self._offset = end
+        if index is not None:
+            self._record_slot(
+                event_type, id1, id2,
+                self._offset - PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].size,
+            )
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def sprite_speed(self, id1: int, id2: int, speedX: float, speedY: float):
+        """Packs SPRITE_SPEED. Payload to set a sprite's speed."""
+        event_type = 7  # Events.SPRITE_SPEED
+        index = self._coalesce_index
+        if index is not None:
+            slot = self._find_slot(event_type, id1, id2)
+            if slot >= 0:
+                PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(self._event_stream, slot, id1, id2, speedX, speedY)
+                self._coalesced_count += 1
+                return
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(self._event_stream, offset, id1, id2, speedX, speedY)
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(self._event_stream, offset, event_type, 0, id1, id2, speedX, speedY)
+            self._offset = end
+        if index is not None:
+            self._record_slot(
+                event_type, id1, id2,
+                self._offset - PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].size,
+            )
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def sprite_texture_load(self, id1: int, id2: int, filename: bytes, filenameLength: int = -1):
+        """Packs SPRITE_TEXTURE_LOAD. Header for loading a texture. Variable data (filename string) follows."""
+        event_type = 8  # Events.SPRITE_TEXTURE_LOAD
+        if filenameLength < 0:
+            filenameLength = len(filename)
+        filenameSize = (filenameLength + 7) & ~7
+        if self._coalesce_index is not None:
+            self._coalesce_index.pop((id1, id2), None)
+        event = PackFormat._EVENT_STRUCT_MAP[event_type]
+        offset = self._offset
+        tail = offset + event.size
+        end = tail + filenameSize
+        if end > len(self._event_stream):
+            self._grow(end)
+        event.pack_into(self._event_stream, offset, event_type, 0, id1, id2, filenameLength)
+        self._event_stream[tail:end] = filename.ljust(filenameSize, b"\0")
+        self._offset = end
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def sprite_texture_set(self, id1: int, id2: int, textureId: int):
+        """Packs SPRITE_TEXTURE_SET. Payload to set a sprite's texture to an already loaded one."""
+        event_type = 9  # Events.SPRITE_TEXTURE_SET
+        index = self._coalesce_index
+        if index is not None:
+            slot = self._find_slot(event_type, id1, id2)
+            if slot >= 0:
+                PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(self._event_stream, slot, id1, id2, textureId)
+                self._coalesced_count += 1
+                return
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(self._event_stream, offset, id1, id2, textureId)
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(self._event_stream, offset, event_type, 0, id1, id2, textureId)
+            self._offset = end
+        if index is not None:
+            self._record_slot(
+                event_type, id1, id2,
+                self._offset - PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].size,
+            )
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def sprite_set_source_rect(self, id1: int, id2: int, x: float, y: float, w: float, h: float):
+        """Packs SPRITE_SET_SOURCE_RECT. Sets the source rectangle (spritesheet clipping) for a sprite."""
+        event_type = 10  # Events.SPRITE_SET_SOURCE_RECT
+        index = self._coalesce_index
+        if index is not None:
+            slot = self._find_slot(event_type, id1, id2)
+            if slot >= 0:
+                PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(self._event_stream, slot, id1, id2, x, y, w, h)
+                self._coalesced_count += 1
+                return
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(self._event_stream, offset, id1, id2, x, y, w, h)
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(self._event_stream, offset, event_type, 0, id1, id2, x, y, w, h)
+            self._offset = end
+        if index is not None:
+            self._record_slot(
+                event_type, id1, id2,
+                self._offset - PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].size,
+            )
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def sprite_move_f32(self, id1: int, id2: int, positionX: float, positionY: float, positionZ: float):
+        """Packs SPRITE_MOVE_F32. Compact SPRITE_MOVE with f32 coordinates."""
+        event_type = 11  # Events.SPRITE_MOVE_F32
+        index = self._coalesce_index
+        if index is not None:
+            slot = self._find_slot(event_type, id1, id2)
+            if slot >= 0:
+                PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(self._event_stream, slot, id1, id2, positionX, positionY, positionZ)
+                self._coalesced_count += 1
+                return
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(self._event_stream, offset, id1, id2, positionX, positionY, positionZ)
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(self._event_stream, offset, event_type, 0, id1, id2, positionX, positionY, positionZ)
+            self._offset = end
+        if index is not None:
+            self._record_slot(
+                event_type, id1, id2,
+                self._offset - PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].size,
+            )
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def sprite_scale_f32(self, id1: int, id2: int, scaleX: float, scaleY: float, scaleZ: float):
+        """Packs SPRITE_SCALE_F32. Compact SPRITE_SCALE with f32 components."""
+        event_type = 12  # Events.SPRITE_SCALE_F32
+        index = self._coalesce_index
+        if index is not None:
+            slot = self._find_slot(event_type, id1, id2)
+            if slot >= 0:
+                PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(self._event_stream, slot, id1, id2, scaleX, scaleY, scaleZ)
+                self._coalesced_count += 1
+                return
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(self._event_stream, offset, id1, id2, scaleX, scaleY, scaleZ)
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(self._event_stream, offset, event_type, 0, id1, id2, scaleX, scaleY, scaleZ)
+            self._offset = end
+        if index is not None:
+            self._record_slot(
+                event_type, id1, id2,
+                self._offset - PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].size,
+            )
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def sprite_rotate_f32(self, id1: int, id2: int, rotationX: float, rotationY: float, rotationZ: float):
+        """Packs SPRITE_ROTATE_F32. Compact SPRITE_ROTATE with f32 angles."""
+        event_type = 13  # Events.SPRITE_ROTATE_F32
+        index = self._coalesce_index
+        if index is not None:
+            slot = self._find_slot(event_type, id1, id2)
+            if slot >= 0:
+                PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(self._event_stream, slot, id1, id2, rotationX, rotationY, rotationZ)
+                self._coalesced_count += 1
+                return
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(self._event_stream, offset, id1, id2, rotationX, rotationY, rotationZ)
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(self._event_stream, offset, event_type, 0, id1, id2, rotationX, rotationY, rotationZ)
+            self._offset = end
+        if index is not None:
+            self._record_slot(
+                event_type, id1, id2,
+                self._offset - PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].size,
+            )
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def sprite_speed_f32(self, id1: int, id2: int, speedX: float, speedY: float):
+        """Packs SPRITE_SPEED_F32. Compact SPRITE_SPEED with f32 components."""
+        event_type = 14  # Events.SPRITE_SPEED_F32
+        index = self._coalesce_index
+        if index is not None:
+            slot = self._find_slot(event_type, id1, id2)
+            if slot >= 0:
+                PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(self._event_stream, slot, id1, id2, speedX, speedY)
+                self._coalesced_count += 1
+                return
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(self._event_stream, offset, id1, id2, speedX, speedY)
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(self._event_stream, offset, event_type, 0, id1, id2, speedX, speedY)
+            self._offset = end
+        if index is not None:
+            self._record_slot(
+                event_type, id1, id2,
+                self._offset - PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].size,
+            )
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def sprite_bind_handle(self, id1: int, id2: int, handle: int):
+        """Packs SPRITE_BIND_HANDLE. Binds a dense u32 handle to a sprite for the *_HANDLE events."""
+        event_type = 15  # Events.SPRITE_BIND_HANDLE
+        if self._coalesce_index is not None:
+            self._coalesce_index.pop((id1, id2), None)
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(self._event_stream, offset, id1, id2, handle)
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(self._event_stream, offset, event_type, 0, id1, id2, handle)
+            self._offset = end
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def sprite_release_handle(self, handle: int):
+        """Packs SPRITE_RELEASE_HANDLE. Unbinds a sprite handle. SPRITE_REMOVE also drops the sprite's handle."""
+        event_type = 16  # Events.SPRITE_RELEASE_HANDLE
+        if self._coalesce_index is not None:
+            self._coalesce_index.clear()
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(self._event_stream, offset, handle)
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(self._event_stream, offset, event_type, 0, handle)
+            self._offset = end
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def sprite_move_handle(self, handle: int, positionX: float, positionY: float, positionZ: float):
+        """Packs SPRITE_MOVE_HANDLE. SPRITE_MOVE_F32 addressed by handle."""
+        event_type = 17  # Events.SPRITE_MOVE_HANDLE
+        if self._coalesce_index is not None:
+            self._coalesce_index.clear()
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(self._event_stream, offset, handle, positionX, positionY, positionZ)
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(self._event_stream, offset, event_type, 0, handle, positionX, positionY, positionZ)
+            self._offset = end
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def sprite_scale_handle(self, handle: int, scaleX: float, scaleY: float, scaleZ: float):
+        """Packs SPRITE_SCALE_HANDLE. SPRITE_SCALE_F32 addressed by handle."""
+        event_type = 18  # Events.SPRITE_SCALE_HANDLE
+        if self._coalesce_index is not None:
+            self._coalesce_index.clear()
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(self._event_stream, offset, handle, scaleX, scaleY, scaleZ)
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(self._event_stream, offset, event_type, 0, handle, scaleX, scaleY, scaleZ)
+            self._offset = end
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def sprite_rotate_handle(self, handle: int, rotationX: float, rotationY: float, rotationZ: float):
+        """Packs SPRITE_ROTATE_HANDLE. SPRITE_ROTATE_F32 addressed by handle."""
+        event_type = 19  # Events.SPRITE_ROTATE_HANDLE
+        if self._coalesce_index is not None:
+            self._coalesce_index.clear()
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(self._event_stream, offset, handle, rotationX, rotationY, rotationZ)
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(self._event_stream, offset, event_type, 0, handle, rotationX, rotationY, rotationZ)
+            self._offset = end
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def sprite_speed_handle(self, handle: int, speedX: float, speedY: float):
+        """Packs SPRITE_SPEED_HANDLE. SPRITE_SPEED_F32 addressed by handle."""
+        event_type = 20  # Events.SPRITE_SPEED_HANDLE
+        if self._coalesce_index is not None:
+            self._coalesce_index.clear()
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(self._event_stream, offset, handle, speedX, speedY)
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(self._event_stream, offset, event_type, 0, handle, speedX, speedY)
+            self._offset = end
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def geom_add_point(self, id1: int, id2: int, z: float, r: int, g: int, b: int, a: int, isScreenSpace: int, x: float, y: float):
+        """Packs GEOM_ADD_POINT. Payload for adding a single geometry point."""
+        event_type = 50  # Events.GEOM_ADD_POINT
+        if self._coalesce_index is not None:
+            self._coalesce_index.pop((id1, id2), None)
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(self._event_stream, offset, id1, id2, z, r, g, b, a, isScreenSpace, x, y)
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(self._event_stream, offset, event_type, 0, id1, id2, z, r, g, b, a, isScreenSpace, x, y)
+            self._offset = end
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def geom_add_line(self, id1: int, id2: int, z: float, r: int, g: int, b: int, a: int, isScreenSpace: int, x1: float, y1: float, x2: float, y2: float):
+        """Packs GEOM_ADD_LINE. Payload for adding a single geometry line."""
+        event_type = 51  # Events.GEOM_ADD_LINE
+        if self._coalesce_index is not None:
+            self._coalesce_index.pop((id1, id2), None)
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(self._event_stream, offset, id1, id2, z, r, g, b, a, isScreenSpace, x1, y1, x2, y2)
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(self._event_stream, offset, event_type, 0, id1, id2, z, r, g, b, a, isScreenSpace, x1, y1, x2, y2)
+            self._offset = end
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def geom_add_rect(self, id1: int, id2: int, z: float, r: int, g: int, b: int, a: int, isScreenSpace: int, x: float, y: float, w: float, h: float):
+        """Packs GEOM_ADD_RECT. Payload for adding a geometry rectangle (outline)."""
+        event_type = 52  # Events.GEOM_ADD_RECT
+        if self._coalesce_index is not None:
+            self._coalesce_index.pop((id1, id2), None)
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(self._event_stream, offset, id1, id2, z, r, g, b, a, isScreenSpace, x, y, w, h)
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(self._event_stream, offset, event_type, 0, id1, id2, z, r, g, b, a, isScreenSpace, x, y, w, h)
+            self._offset = end
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def geom_add_fill_rect(self, id1: int, id2: int, z: float, r: int, g: int, b: int, a: int, isScreenSpace: int, x: float, y: float, w: float, h: float):
+        """Packs GEOM_ADD_FILL_RECT. Payload for adding a filled geometry rectangle. Reuses PackedGeomAddRectEvent."""
+        event_type = 53  # Events.GEOM_ADD_FILL_RECT
+        if self._coalesce_index is not None:
+            self._coalesce_index.pop((id1, id2), None)
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(self._event_stream, offset, id1, id2, z, r, g, b, a, isScreenSpace, x, y, w, h)
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(self._event_stream, offset, event_type, 0, id1, id2, z, r, g, b, a, isScreenSpace, x, y, w, h)
+            self._offset = end
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def geom_add_packed(self, id1: int, id2: int, z: float, r: int, g: int, b: int, a: int, isScreenSpace: int, primitiveType: int, count: int, data: bytes):
+        """Packs GEOM_ADD_PACKED. Header for adding a batch of geometry primitives. Variable data (array of points/rects) follows."""
+        event_type = 54  # Events.GEOM_ADD_PACKED
+        dataLength = len(data)
+        dataSize = (dataLength + 7) & ~7
+        if self._coalesce_index is not None:
+            self._coalesce_index.pop((id1, id2), None)
+        event = PackFormat._EVENT_STRUCT_MAP[event_type]
+        offset = self._offset
+        tail = offset + event.size
+        end = tail + dataSize
+        if end > len(self._event_stream):
+            self._grow(end)
+        event.pack_into(self._event_stream, offset, event_type, 0, id1, id2, z, r, g, b, a, isScreenSpace, primitiveType, count)
+        self._event_stream[tail:end] = data.ljust(dataSize, b"\0")
+        self._offset = end
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def geom_remove(self, id1: int, id2: int):
+        """Packs GEOM_REMOVE. Payload for removing a geometry entity."""
+        event_type = 55  # Events.GEOM_REMOVE
+        if self._coalesce_index is not None:
+            self._coalesce_index.pop((id1, id2), None)
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(self._event_stream, offset, id1, id2)
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(self._event_stream, offset, event_type, 0, id1, id2)
+            self._offset = end
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def geom_set_color(self, id1: int, id2: int, r: int, g: int, b: int, a: int):
+        """Packs GEOM_SET_COLOR. Payload to set a geometry entity's color."""
+        event_type = 56  # Events.GEOM_SET_COLOR
+        index = self._coalesce_index
+        if index is not None:
+            slot = self._find_slot(event_type, id1, id2)
+            if slot >= 0:
+                PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(self._event_stream, slot, id1, id2, r, g, b, a)
+                self._coalesced_count += 1
+                return
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(self._event_stream, offset, id1, id2, r, g, b, a)
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(self._event_stream, offset, event_type, 0, id1, id2, r, g, b, a)
+            self._offset = end
+        if index is not None:
+            self._record_slot(
+                event_type, id1, id2,
+                self._offset - PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].size,
+            )
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def input_keyup(self, scancode: int, keycode: int, mod: int, isRepeat: int):
+        """Packs INPUT_KEYUP. Payload for a key release event."""
+        event_type = 100  # Events.INPUT_KEYUP
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(self._event_stream, offset, scancode, keycode, mod, isRepeat)
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(self._event_stream, offset, event_type, 0, scancode, keycode, mod, isRepeat)
+            self._offset = end
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def input_keydown(self, scancode: int, keycode: int, mod: int, isRepeat: int):
+        """Packs INPUT_KEYDOWN. Payload for a key press event. Reuses PackedKeyEvent."""
+        event_type = 101  # Events.INPUT_KEYDOWN
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(self._event_stream, offset, scancode, keycode, mod, isRepeat)
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(self._event_stream, offset, event_type, 0, scancode, keycode, mod, isRepeat)
+            self._offset = end
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def input_mouseup(self, x: float, y: float, button: int, clicks: int):
+        """Packs INPUT_MOUSEUP. Payload for a mouse button release event."""
+        event_type = 102  # Events.INPUT_MOUSEUP
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(self._event_stream, offset, x, y, button, clicks)
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(self._event_stream, offset, event_type, 0, x, y, button, clicks)
+            self._offset = end
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def input_mousedown(self, x: float, y: float, button: int, clicks: int):
+        """Packs INPUT_MOUSEDOWN. Payload for a mouse button press event. Reuses PackedMouseButtonEvent."""
+        event_type = 103  # Events.INPUT_MOUSEDOWN
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(self._event_stream, offset, x, y, button, clicks)
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(self._event_stream, offset, event_type, 0, x, y, button, clicks)
+            self._offset = end
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def input_mousemotion(self, x: float, y: float, xrel: float, yrel: float):
+        """Packs INPUT_MOUSEMOTION. Payload for a mouse motion event."""
+        event_type = 104  # Events.INPUT_MOUSEMOTION
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(self._event_stream, offset, x, y, xrel, yrel)
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(self._event_stream, offset, event_type, 0, x, y, xrel, yrel)
+            self._offset = end
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def window_title(self, title: bytes):
+        """Packs WINDOW_TITLE. Payload for setting the window title."""
+        event_type = 200  # Events.WINDOW_TITLE
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(self._event_stream, offset, title)
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(self._event_stream, offset, event_type, 0, title)
+            self._offset = end
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def window_resize(self, w: int, h: int):
+        """Packs WINDOW_RESIZE. Payload for a window resize event."""
+        event_type = 201  # Events.WINDOW_RESIZE
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(self._event_stream, offset, w, h)
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(self._event_stream, offset, event_type, 0, w, h)
+            self._offset = end
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def window_flags(self, flags: int):
+        """Packs WINDOW_FLAGS. Payload for setting window flags (e.g., fullscreen, borderless)."""
+        event_type = 202  # Events.WINDOW_FLAGS
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(self._event_stream, offset, flags)
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(self._event_stream, offset, event_type, 0, flags)
+            self._offset = end
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def text_add(self, id1: int, id2: int, positionX: float, positionY: float, positionZ: float, r: int, g: int, b: int, a: int, fontSize: float, fontPath: bytes, text: bytes, fontPathLength: int = -1, textLength: int = -1):
+        """Packs TEXT_ADD. Header for adding new text. Variable data (font path, text string) follows."""
+        event_type = 300  # Events.TEXT_ADD
+        if fontPathLength < 0:
+            fontPathLength = len(fontPath)
+        fontPathSize = (fontPathLength + 7) & ~7
+        if textLength < 0:
+            textLength = len(text)
+        textSize = (textLength + 7) & ~7
+        if self._coalesce_index is not None:
+            self._coalesce_index.pop((id1, id2), None)
+        event = PackFormat._EVENT_STRUCT_MAP[event_type]
+        offset = self._offset
+        tail = offset + event.size
+        end = tail + fontPathSize + textSize
+        if end > len(self._event_stream):
+            self._grow(end)
+        event.pack_into(self._event_stream, offset, event_type, 0, id1, id2, positionX, positionY, positionZ, r, g, b, a, fontSize, fontPathLength, textLength)
+        self._event_stream[tail:tail + fontPathSize] = fontPath.ljust(fontPathSize, b"\0")
+        tail += fontPathSize
+        self._event_stream[tail:end] = text.ljust(textSize, b"\0")
+        self._offset = end
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def text_set_string(self, id1: int, id2: int, text: bytes, textLength: int = -1):
+        """Packs TEXT_SET_STRING. Header for setting a text entity's string. Variable data (text string) follows."""
+        event_type = 301  # Events.TEXT_SET_STRING
+        if textLength < 0:
+            textLength = len(text)
+        textSize = (textLength + 7) & ~7
+        if self._coalesce_index is not None:
+            self._coalesce_index.pop((id1, id2), None)
+        event = PackFormat._EVENT_STRUCT_MAP[event_type]
+        offset = self._offset
+        tail = offset + event.size
+        end = tail + textSize
+        if end > len(self._event_stream):
+            self._grow(end)
+        event.pack_into(self._event_stream, offset, event_type, 0, id1, id2, textLength)
+        self._event_stream[tail:end] = text.ljust(textSize, b"\0")
+        self._offset = end
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def audio_load(self, path: bytes, pathLength: int = -1):
+        """Packs AUDIO_LOAD. Header for loading an audio file. Variable data (path string) follows."""
+        event_type = 400  # Events.AUDIO_LOAD
+        if pathLength < 0:
+            pathLength = len(path)
+        pathSize = (pathLength + 7) & ~7
+        event = PackFormat._EVENT_STRUCT_MAP[event_type]
+        offset = self._offset
+        tail = offset + event.size
+        end = tail + pathSize
+        if end > len(self._event_stream):
+            self._grow(end)
+        event.pack_into(self._event_stream, offset, event_type, 0, pathLength)
+        self._event_stream[tail:end] = path.ljust(pathSize, b"\0")
+        self._offset = end
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def audio_loaded(self, audioId: int):
+        """Packs AUDIO_LOADED. Payload sent *from* engine *to* client when audio is loaded."""
+        event_type = 401  # Events.AUDIO_LOADED
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(self._event_stream, offset, audioId)
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(self._event_stream, offset, event_type, 0, audioId)
+            self._offset = end
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def audio_play(self, audioId: int):
+        """Packs AUDIO_PLAY. Payload to play a loaded audio file."""
+        event_type = 402  # Events.AUDIO_PLAY
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(self._event_stream, offset, audioId)
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(self._event_stream, offset, event_type, 0, audioId)
+            self._offset = end
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def audio_stop_all(self, _unused: int = 0):
+        """Packs AUDIO_STOP_ALL. Stops all playing audio. This event has no payload."""
+        event_type = 403  # Events.AUDIO_STOP_ALL
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(self._event_stream, offset, _unused)
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(self._event_stream, offset, event_type, 0, _unused)
+            self._offset = end
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def audio_set_master_volume(self, volume: float):
+        """Packs AUDIO_SET_MASTER_VOLUME. Payload to set the global master volume."""
+        event_type = 404  # Events.AUDIO_SET_MASTER_VOLUME
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(self._event_stream, offset, volume)
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(self._event_stream, offset, event_type, 0, volume)
+            self._offset = end
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def audio_pause(self, audioId: int):
+        """Packs AUDIO_PAUSE. Payload to pause a specific, playing audio sound."""
+        event_type = 405  # Events.AUDIO_PAUSE
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(self._event_stream, offset, audioId)
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(self._event_stream, offset, event_type, 0, audioId)
+            self._offset = end
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def audio_stop(self, audioId: int):
+        """Packs AUDIO_STOP. Payload to stop and rewind a specific audio sound."""
+        event_type = 406  # Events.AUDIO_STOP
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(self._event_stream, offset, audioId)
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(self._event_stream, offset, event_type, 0, audioId)
+            self._offset = end
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def audio_unload(self, audioId: int):
+        """Packs AUDIO_UNLOAD. Payload to unload a specific audio sound, freeing memory."""
+        event_type = 407  # Events.AUDIO_UNLOAD
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(self._event_stream, offset, audioId)
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(self._event_stream, offset, event_type, 0, audioId)
+            self._offset = end
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def audio_set_volume(self, audioId: int, volume: float):
+        """Packs AUDIO_SET_VOLUME. Payload to set the volume of a specific audio sound."""
+        event_type = 408  # Events.AUDIO_SET_VOLUME
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(self._event_stream, offset, audioId, volume)
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(self._event_stream, offset, event_type, 0, audioId, volume)
+            self._offset = end
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def physics_add_body(self, id1: int, id2: int, positionX: float, positionY: float, bodyType: int, shapeType: int, lockRotation: int, mass: float, friction: float, elasticity: float, width: float, height: float):
+        """Packs PHYSICS_ADD_BODY. Payload for adding a new physics body to the world."""
+        event_type = 500  # Events.PHYSICS_ADD_BODY
+        if self._coalesce_index is not None:
+            self._coalesce_index.pop((id1, id2), None)
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(self._event_stream, offset, id1, id2, positionX, positionY, bodyType, shapeType, lockRotation, mass, friction, elasticity, width, height)
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(self._event_stream, offset, event_type, 0, id1, id2, positionX, positionY, bodyType, shapeType, lockRotation, mass, friction, elasticity, width, height)
+            self._offset = end
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def physics_remove_body(self, id1: int, id2: int):
+        """Packs PHYSICS_REMOVE_BODY. Payload for removing a physics body."""
+        event_type = 501  # Events.PHYSICS_REMOVE_BODY
+        if self._coalesce_index is not None:
+            self._coalesce_index.pop((id1, id2), None)
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(self._event_stream, offset, id1, id2)
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(self._event_stream, offset, event_type, 0, id1, id2)
+            self._offset = end
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def physics_apply_force(self, id1: int, id2: int, forceX: float, forceY: float):
+        """Packs PHYSICS_APPLY_FORCE. Payload to apply a continuous force to a body."""
+        event_type = 502  # Events.PHYSICS_APPLY_FORCE
+        if self._coalesce_index is not None:
+            self._coalesce_index.pop((id1, id2), None)
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(self._event_stream, offset, id1, id2, forceX, forceY)
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(self._event_stream, offset, event_type, 0, id1, id2, forceX, forceY)
+            self._offset = end
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def physics_apply_impulse(self, id1: int, id2: int, impulseX: float, impulseY: float):
+        """Packs PHYSICS_APPLY_IMPULSE. Payload to apply an instant impulse to a body."""
+        event_type = 503  # Events.PHYSICS_APPLY_IMPULSE
+        if self._coalesce_index is not None:
+            self._coalesce_index.pop((id1, id2), None)
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(self._event_stream, offset, id1, id2, impulseX, impulseY)
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(self._event_stream, offset, event_type, 0, id1, id2, impulseX, impulseY)
+            self._offset = end
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def physics_set_velocity(self, id1: int, id2: int, velocityX: float, velocityY: float):
+        """Packs PHYSICS_SET_VELOCITY. Payload to set a body's linear velocity."""
+        event_type = 504  # Events.PHYSICS_SET_VELOCITY
+        index = self._coalesce_index
+        if index is not None:
+            slot = self._find_slot(event_type, id1, id2)
+            if slot >= 0:
+                PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(self._event_stream, slot, id1, id2, velocityX, velocityY)
+                self._coalesced_count += 1
+                return
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(self._event_stream, offset, id1, id2, velocityX, velocityY)
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(self._event_stream, offset, event_type, 0, id1, id2, velocityX, velocityY)
+            self._offset = end
+        if index is not None:
+            self._record_slot(
+                event_type, id1, id2,
+                self._offset - PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].size,
+            )
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def physics_set_position(self, id1: int, id2: int, positionX: float, positionY: float):
+        """Packs PHYSICS_SET_POSITION. Payload to teleport a body to a new position."""
+        event_type = 505  # Events.PHYSICS_SET_POSITION
+        index = self._coalesce_index
+        if index is not None:
+            slot = self._find_slot(event_type, id1, id2)
+            if slot >= 0:
+                PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(self._event_stream, slot, id1, id2, positionX, positionY)
+                self._coalesced_count += 1
+                return
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(self._event_stream, offset, id1, id2, positionX, positionY)
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(self._event_stream, offset, event_type, 0, id1, id2, positionX, positionY)
+            self._offset = end
+        if index is not None:
+            self._record_slot(
+                event_type, id1, id2,
+                self._offset - PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].size,
+            )
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def physics_set_rotation(self, id1: int, id2: int, angleInRadians: float):
+        """Packs PHYSICS_SET_ROTATION. Payload to set a body's rotation."""
+        event_type = 506  # Events.PHYSICS_SET_ROTATION
+        index = self._coalesce_index
+        if index is not None:
+            slot = self._find_slot(event_type, id1, id2)
+            if slot >= 0:
+                PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(self._event_stream, slot, id1, id2, angleInRadians)
+                self._coalesced_count += 1
+                return
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(self._event_stream, offset, id1, id2, angleInRadians)
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(self._event_stream, offset, event_type, 0, id1, id2, angleInRadians)
+            self._offset = end
+        if index is not None:
+            self._record_slot(
+                event_type, id1, id2,
+                self._offset - PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].size,
+            )
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def physics_bind_handle(self, id1: int, id2: int, handle: int):
+        """Packs PHYSICS_BIND_HANDLE. Binds a dense u32 handle to a physics body for the *_HANDLE events."""
+        event_type = 507  # Events.PHYSICS_BIND_HANDLE
+        if self._coalesce_index is not None:
+            self._coalesce_index.pop((id1, id2), None)
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(self._event_stream, offset, id1, id2, handle)
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(self._event_stream, offset, event_type, 0, id1, id2, handle)
+            self._offset = end
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def physics_release_handle(self, handle: int):
+        """Packs PHYSICS_RELEASE_HANDLE. Unbinds a body handle. PHYSICS_REMOVE_BODY also drops the body's handle."""
+        event_type = 508  # Events.PHYSICS_RELEASE_HANDLE
+        if self._coalesce_index is not None:
+            self._coalesce_index.clear()
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(self._event_stream, offset, handle)
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(self._event_stream, offset, event_type, 0, handle)
+            self._offset = end
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def physics_set_velocity_handle(self, handle: int, velocityX: float, velocityY: float):
+        """Packs PHYSICS_SET_VELOCITY_HANDLE. PHYSICS_SET_VELOCITY addressed by handle."""
+        event_type = 509  # Events.PHYSICS_SET_VELOCITY_HANDLE
+        if self._coalesce_index is not None:
+            self._coalesce_index.clear()
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(self._event_stream, offset, handle, velocityX, velocityY)
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(self._event_stream, offset, event_type, 0, handle, velocityX, velocityY)
+            self._offset = end
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def physics_set_position_handle(self, handle: int, positionX: float, positionY: float):
+        """Packs PHYSICS_SET_POSITION_HANDLE. PHYSICS_SET_POSITION addressed by handle."""
+        event_type = 510  # Events.PHYSICS_SET_POSITION_HANDLE
+        if self._coalesce_index is not None:
+            self._coalesce_index.clear()
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(self._event_stream, offset, handle, positionX, positionY)
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(self._event_stream, offset, event_type, 0, handle, positionX, positionY)
+            self._offset = end
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def physics_set_rotation_handle(self, handle: int, angleInRadians: float):
+        """Packs PHYSICS_SET_ROTATION_HANDLE. PHYSICS_SET_ROTATION addressed by handle."""
+        event_type = 511  # Events.PHYSICS_SET_ROTATION_HANDLE
+        if self._coalesce_index is not None:
+            self._coalesce_index.clear()
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(self._event_stream, offset, handle, angleInRadians)
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(self._event_stream, offset, event_type, 0, handle, angleInRadians)
+            self._offset = end
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def physics_collision_begin(self, id1_A: int, id2_A: int, id1_B: int, id2_B: int):
+        """Packs PHYSICS_COLLISION_BEGIN. Payload sent *from* engine when two bodies begin colliding."""
+        event_type = 550  # Events.PHYSICS_COLLISION_BEGIN
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(self._event_stream, offset, id1_A, id2_A, id1_B, id2_B)
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(self._event_stream, offset, event_type, 0, id1_A, id2_A, id1_B, id2_B)
+            self._offset = end
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def physics_collision_separate(self, id1_A: int, id2_A: int, id1_B: int, id2_B: int):
+        """Packs PHYSICS_COLLISION_SEPARATE. Payload sent *from* engine when two bodies stop colliding. Reuses PackedPhysicsCollisionEvent."""
+        event_type = 551  # Events.PHYSICS_COLLISION_SEPARATE
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(self._event_stream, offset, id1_A, id2_A, id1_B, id2_B)
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(self._event_stream, offset, event_type, 0, id1_A, id2_A, id1_B, id2_B)
+            self._offset = end
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def physics_sync_transform(self, id1: int, id2: int, positionX: float, positionY: float, angle: float, velocityX: float, velocityY: float, angularVelocity: float, isSleeping: int):
+        """Packs PHYSICS_SYNC_TRANSFORM. Payload sent *from* engine to sync 2D physics state back to client."""
+        event_type = 552  # Events.PHYSICS_SYNC_TRANSFORM
+        if self._coalesce_index is not None:
+            self._coalesce_index.pop((id1, id2), None)
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(self._event_stream, offset, id1, id2, positionX, positionY, angle, velocityX, velocityY, angularVelocity, isSleeping)
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(self._event_stream, offset, event_type, 0, id1, id2, positionX, positionY, angle, velocityX, velocityY, angularVelocity, isSleeping)
+            self._offset = end
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def physics_set_debug_mode(self, enabled: int):
+        """Packs PHYSICS_SET_DEBUG_MODE. Payload to toggle physics debug rendering."""
+        event_type = 553  # Events.PHYSICS_SET_DEBUG_MODE
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(self._event_stream, offset, enabled)
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(self._event_stream, offset, event_type, 0, enabled)
+            self._offset = end
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def plugin(self, eventId: int):
+        """Packs PLUGIN. Payload for a generic plugin 'on' event."""
+        event_type = 1000  # Events.PLUGIN
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(self._event_stream, offset, eventId)
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(self._event_stream, offset, event_type, 0, eventId)
+            self._offset = end
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def plugin_load(self, channelNo: int, path: bytes, pathLength: int = -1):
+        """Packs PLUGIN_LOAD. Header for loading a plugin. Variable data (path string) follows."""
+        event_type = 1001  # Events.PLUGIN_LOAD
+        if pathLength < 0:
+            pathLength = len(path)
+        pathSize = (pathLength + 7) & ~7
+        event = PackFormat._EVENT_STRUCT_MAP[event_type]
+        offset = self._offset
+        tail = offset + event.size
+        end = tail + pathSize
+        if end > len(self._event_stream):
+            self._grow(end)
+        event.pack_into(self._event_stream, offset, event_type, 0, channelNo, pathLength)
+        self._event_stream[tail:end] = path.ljust(pathSize, b"\0")
+        self._offset = end
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def plugin_unload(self, pluginId: int):
+        """Packs PLUGIN_UNLOAD. Payload to unload a plugin."""
+        event_type = 1002  # Events.PLUGIN_UNLOAD
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(self._event_stream, offset, pluginId)
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(self._event_stream, offset, event_type, 0, pluginId)
+            self._offset = end
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def plugin_set(self, pluginId: int):
+        """Packs PLUGIN_SET. Payload to set the active plugin."""
+        event_type = 1003  # Events.PLUGIN_SET
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(self._event_stream, offset, pluginId)
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(self._event_stream, offset, event_type, 0, pluginId)
+            self._offset = end
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def plugin_event_stacking(self, eventId: int):
+        """Packs PLUGIN_EVENT_STACKING. Payload to enable or disable plugin event stacking."""
+        event_type = 1004  # Events.PLUGIN_EVENT_STACKING
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(self._event_stream, offset, eventId)
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(self._event_stream, offset, event_type, 0, eventId)
+            self._offset = end
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def plugin_subscribe_event(self, pluginId: int, channelNo: int):
+        """Packs PLUGIN_SUBSCRIBE_EVENT. Have events from a channel forward to this plugin"""
+        event_type = 1005  # Events.PLUGIN_SUBSCRIBE_EVENT
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(self._event_stream, offset, pluginId, channelNo)
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(self._event_stream, offset, event_type, 0, pluginId, channelNo)
+            self._offset = end
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def plugin_unsubscribe_event(self, pluginId: int, channelNo: int):
+        """Packs PLUGIN_UNSUBSCRIBE_EVENT. Have events from a channel forward to this plugin"""
+        event_type = 1006  # Events.PLUGIN_UNSUBSCRIBE_EVENT
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(self._event_stream, offset, pluginId, channelNo)
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(self._event_stream, offset, event_type, 0, pluginId, channelNo)
+            self._offset = end
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def camera_set_position(self, positionX: float, positionY: float):
+        """Packs CAMERA_SET_POSITION. Payload to set the 2D camera's absolute world position."""
+        event_type = 2000  # Events.CAMERA_SET_POSITION
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(self._event_stream, offset, positionX, positionY)
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(self._event_stream, offset, event_type, 0, positionX, positionY)
+            self._offset = end
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def camera_move(self, deltaX: float, deltaY: float):
+        """Packs CAMERA_MOVE. Payload to move the 2D camera by a relative delta."""
+        event_type = 2001  # Events.CAMERA_MOVE
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(self._event_stream, offset, deltaX, deltaY)
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(self._event_stream, offset, event_type, 0, deltaX, deltaY)
+            self._offset = end
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def camera_set_zoom(self, zoom: float):
+        """Packs CAMERA_SET_ZOOM. Payload to set the 2D camera's zoom level."""
+        event_type = 2002  # Events.CAMERA_SET_ZOOM
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(self._event_stream, offset, zoom)
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(self._event_stream, offset, event_type, 0, zoom)
+            self._offset = end
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def camera_set_rotation(self, angleInRadians: float):
+        """Packs CAMERA_SET_ROTATION. Payload to set the 2D camera's rotation."""
+        event_type = 2003  # Events.CAMERA_SET_ROTATION
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(self._event_stream, offset, angleInRadians)
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(self._event_stream, offset, event_type, 0, angleInRadians)
+            self._offset = end
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def camera_follow_entity(self, id1: int, id2: int):
+        """Packs CAMERA_FOLLOW_ENTITY. Tells the camera to start following a specific entity."""
+        event_type = 2004  # Events.CAMERA_FOLLOW_ENTITY
+        if self._coalesce_index is not None:
+            self._coalesce_index.pop((id1, id2), None)
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(self._event_stream, offset, id1, id2)
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(self._event_stream, offset, event_type, 0, id1, id2)
+            self._offset = end
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def camera_stop_following(self, _unused: int = 0):
+        """Packs CAMERA_STOP_FOLLOWING. Tells the camera to stop following any entity."""
+        event_type = 2005  # Events.CAMERA_STOP_FOLLOWING
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(self._event_stream, offset, _unused)
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(self._event_stream, offset, event_type, 0, _unused)
+            self._offset = end
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def script_subscribe(self, channelNo: int):
+        """Packs SCRIPT_SUBSCRIBE. Tells the engine to subscribe the main script (PHP) to a channel."""
+        event_type = 3000  # Events.SCRIPT_SUBSCRIBE
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(self._event_stream, offset, channelNo)
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(self._event_stream, offset, event_type, 0, channelNo)
+            self._offset = end
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def script_unsubscribe(self, channelNo: int):
+        """Packs SCRIPT_UNSUBSCRIBE. Tells the engine to unsubscribe the main script (PHP) from a channel."""
+        event_type = 3001  # Events.SCRIPT_UNSUBSCRIBE
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(self._event_stream, offset, channelNo)
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(self._event_stream, offset, event_type, 0, channelNo)
+            self._offset = end
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def event_batch(self, eventType: int, count: int, payloads: bytes):
+        """Packs EVENT_BATCH. Header for a run of same-type fixed-size events. `count` payloads of `eventType` follow, each padded to 8 bytes, with no per-event header."""
+        event_type = 4000  # Events.EVENT_BATCH
+        payloadsLength = len(payloads)
+        payloadsSize = (payloadsLength + 7) & ~7
+        event = PackFormat._EVENT_STRUCT_MAP[event_type]
+        offset = self._offset
+        tail = offset + event.size
+        end = tail + payloadsSize
+        if end > len(self._event_stream):
+            self._grow(end)
+        event.pack_into(self._event_stream, offset, event_type, 0, eventType, count)
+        self._event_stream[tail:end] = payloads.ljust(payloadsSize, b"\0")
+        self._offset = end
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+# --- End CommandPacker Class ---
 
 def Id_Generate() -> Tuple[int, int]:
     """Generates a unique ID tuple."""
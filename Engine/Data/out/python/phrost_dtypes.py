@@ -0,0 +1,1286 @@
+"""
+// !!! THIS FILE IS AUTO-GENERATED BY PythonAdapter.php, DO NOT EDIT !!!
+// Generated from: structs.json
+
+NumPy structured dtypes for every event in structs.json.
+"""
+
+from typing import Dict
+
+import numpy as np
+
+from phrost import Events
+
+# Payload only, indexed by event id. itemsize is the size in the
+# PackFormats tuples.
+DTYPES: Dict[int, np.dtype] = {
+    Events.SPRITE_ADD.value: np.dtype(
+        {
+            "names": ["id1", "id2", "positionX", "positionY", "positionZ", "scaleX", "scaleY", "scaleZ", "sizeW", "sizeH", "rotationX", "rotationY", "rotationZ", "r", "g", "b", "a", "speedX", "speedY"],
+            "formats": ["<i8", "<i8", "<f8", "<f8", "<f8", "<f8", "<f8", "<f8", "<f8", "<f8", "<f8", "<f8", "<f8", "u1", "u1", "u1", "u1", "<f8", "<f8"],
+            "offsets": [0, 8, 16, 24, 32, 40, 48, 56, 64, 72, 80, 88, 96, 104, 105, 106, 107, 112, 120],
+            "itemsize": 128,
+        }
+    ),
+    Events.SPRITE_REMOVE.value: np.dtype(
+        {
+            "names": ["id1", "id2"],
+            "formats": ["<i8", "<i8"],
+            "offsets": [0, 8],
+            "itemsize": 16,
+        }
+    ),
+    Events.SPRITE_MOVE.value: np.dtype(
+        {
+            "names": ["id1", "id2", "positionX", "positionY", "positionZ"],
+            "formats": ["<i8", "<i8", "<f8", "<f8", "<f8"],
+            "offsets": [0, 8, 16, 24, 32],
+            "itemsize": 40,
+        }
+    ),
+    Events.SPRITE_SCALE.value: np.dtype(
+        {
+            "names": ["id1", "id2", "scaleX", "scaleY", "scaleZ"],
+            "formats": ["<i8", "<i8", "<f8", "<f8", "<f8"],
+            "offsets": [0, 8, 16, 24, 32],
+            "itemsize": 40,
+        }
+    ),
+    Events.SPRITE_RESIZE.value: np.dtype(
+        {
+            "names": ["id1", "id2", "sizeW", "sizeH"],
+            "formats": ["<i8", "<i8", "<f8", "<f8"],
+            "offsets": [0, 8, 16, 24],
+            "itemsize": 32,
+        }
+    ),
+    Events.SPRITE_ROTATE.value: np.dtype(
+        {
+            "names": ["id1", "id2", "rotationX", "rotationY", "rotationZ"],
+            "formats": ["<i8", "<i8", "<f8", "<f8", "<f8"],
+            "offsets": [0, 8, 16, 24, 32],
+            "itemsize": 40,
+        }
+    ),
+    Events.SPRITE_COLOR.value: np.dtype(
+        {
+            "names": ["id1", "id2", "r", "g", "b", "a"],
+            "formats": ["<i8", "<i8", "u1", "u1", "u1", "u1"],
+            "offsets": [0, 8, 16, 17, 18, 19],
+            "itemsize": 24,
+        }
+    ),
+    Events.SPRITE_SPEED.value: np.dtype(
+        {
+            "names": ["id1", "id2", "speedX", "speedY"],
+            "formats": ["<i8", "<i8", "<f8", "<f8"],
+            "offsets": [0, 8, 16, 24],
+            "itemsize": 32,
+        }
+    ),
+    Events.SPRITE_TEXTURE_LOAD.value: np.dtype(
+        {
+            "names": ["id1", "id2", "filenameLength"],
+            "formats": ["<i8", "<i8", "<u4"],
+            "offsets": [0, 8, 16],
+            "itemsize": 24,
+        }
+    ),
+    Events.SPRITE_TEXTURE_SET.value: np.dtype(
+        {
+            "names": ["id1", "id2", "textureId"],
+            "formats": ["<i8", "<i8", "<u8"],
+            "offsets": [0, 8, 16],
+            "itemsize": 24,
+        }
+    ),
+    Events.SPRITE_SET_SOURCE_RECT.value: np.dtype(
+        {
+            "names": ["id1", "id2", "x", "y", "w", "h"],
+            "formats": ["<i8", "<i8", "<f4", "<f4", "<f4", "<f4"],
+            "offsets": [0, 8, 16, 20, 24, 28],
+            "itemsize": 32,
+        }
+    ),
+    Events.SPRITE_MOVE_F32.value: np.dtype(
+        {
+            "names": ["id1", "id2", "positionX", "positionY", "positionZ"],
+            "formats": ["<i8", "<i8", "<f4", "<f4", "<f4"],
+            "offsets": [0, 8, 16, 20, 24],
+            "itemsize": 32,
+        }
+    ),
+    Events.SPRITE_SCALE_F32.value: np.dtype(
+        {
+            "names": ["id1", "id2", "scaleX", "scaleY", "scaleZ"],
+            "formats": ["<i8", "<i8", "<f4", "<f4", "<f4"],
+            "offsets": [0, 8, 16, 20, 24],
+            "itemsize": 32,
+        }
+    ),
+    Events.SPRITE_ROTATE_F32.value: np.dtype(
+        {
+            "names": ["id1", "id2", "rotationX", "rotationY", "rotationZ"],
+            "formats": ["<i8", "<i8", "<f4", "<f4", "<f4"],
+            "offsets": [0, 8, 16, 20, 24],
+            "itemsize": 32,
+        }
+    ),
+    Events.SPRITE_SPEED_F32.value: np.dtype(
+        {
+            "names": ["id1", "id2", "speedX", "speedY"],
+            "formats": ["<i8", "<i8", "<f4", "<f4"],
+            "offsets": [0, 8, 16, 20],
+            "itemsize": 24,
+        }
+    ),
+    Events.SPRITE_BIND_HANDLE.value: np.dtype(
+        {
+            "names": ["id1", "id2", "handle"],
+            "formats": ["<i8", "<i8", "<u4"],
+            "offsets": [0, 8, 16],
+            "itemsize": 24,
+        }
+    ),
+    Events.SPRITE_RELEASE_HANDLE.value: np.dtype(
+        {
+            "names": ["handle"],
+            "formats": ["<u4"],
+            "offsets": [0],
+            "itemsize": 8,
+        }
+    ),
+    Events.SPRITE_MOVE_HANDLE.value: np.dtype(
+        {
+            "names": ["handle", "positionX", "positionY", "positionZ"],
+            "formats": ["<u4", "<f4", "<f4", "<f4"],
+            "offsets": [0, 4, 8, 12],
+            "itemsize": 16,
+        }
+    ),
+    Events.SPRITE_SCALE_HANDLE.value: np.dtype(
+        {
+            "names": ["handle", "scaleX", "scaleY", "scaleZ"],
+            "formats": ["<u4", "<f4", "<f4", "<f4"],
+            "offsets": [0, 4, 8, 12],
+            "itemsize": 16,
+        }
+    ),
+    Events.SPRITE_ROTATE_HANDLE.value: np.dtype(
+        {
+            "names": ["handle", "rotationX", "rotationY", "rotationZ"],
+            "formats": ["<u4", "<f4", "<f4", "<f4"],
+            "offsets": [0, 4, 8, 12],
+            "itemsize": 16,
+        }
+    ),
+    Events.SPRITE_SPEED_HANDLE.value: np.dtype(
+        {
+            "names": ["handle", "speedX", "speedY"],
+            "formats": ["<u4", "<f4", "<f4"],
+            "offsets": [0, 4, 8],
+            "itemsize": 16,
+        }
+    ),
+    Events.GEOM_ADD_POINT.value: np.dtype(
+        {
+            "names": ["id1", "id2", "z", "r", "g", "b", "a", "isScreenSpace", "x", "y"],
+            "formats": ["<i8", "<i8", "<f8", "u1", "u1", "u1", "u1", "u1", "<f4", "<f4"],
+            "offsets": [0, 8, 16, 24, 25, 26, 27, 28, 32, 36],
+            "itemsize": 40,
+        }
+    ),
+    Events.GEOM_ADD_LINE.value: np.dtype(
+        {
+            "names": ["id1", "id2", "z", "r", "g", "b", "a", "isScreenSpace", "x1", "y1", "x2", "y2"],
+            "formats": ["<i8", "<i8", "<f8", "u1", "u1", "u1", "u1", "u1", "<f4", "<f4", "<f4", "<f4"],
+            "offsets": [0, 8, 16, 24, 25, 26, 27, 28, 32, 36, 40, 44],
+            "itemsize": 48,
+        }
+    ),
+    Events.GEOM_ADD_RECT.value: np.dtype(
+        {
+            "names": ["id1", "id2", "z", "r", "g", "b", "a", "isScreenSpace", "x", "y", "w", "h"],
+            "formats": ["<i8", "<i8", "<f8", "u1", "u1", "u1", "u1", "u1", "<f4", "<f4", "<f4", "<f4"],
+            "offsets": [0, 8, 16, 24, 25, 26, 27, 28, 32, 36, 40, 44],
+            "itemsize": 48,
+        }
+    ),
+    Events.GEOM_ADD_FILL_RECT.value: np.dtype(
+        {
+            "names": ["id1", "id2", "z", "r", "g", "b", "a", "isScreenSpace", "x", "y", "w", "h"],
+            "formats": ["<i8", "<i8", "<f8", "u1", "u1", "u1", "u1", "u1", "<f4", "<f4", "<f4", "<f4"],
+            "offsets": [0, 8, 16, 24, 25, 26, 27, 28, 32, 36, 40, 44],
+            "itemsize": 48,
+        }
+    ),
+    Events.GEOM_ADD_PACKED.value: np.dtype(
+        {
+            "names": ["id1", "id2", "z", "r", "g", "b", "a", "isScreenSpace", "primitiveType", "count"],
+            "formats": ["<i8", "<i8", "<f8", "u1", "u1", "u1", "u1", "u1", "<u4", "<u4"],
+            "offsets": [0, 8, 16, 24, 25, 26, 27, 28, 31, 35],
+            "itemsize": 39,
+        }
+    ),
+    Events.GEOM_REMOVE.value: np.dtype(
+        {
+            "names": ["id1", "id2"],
+            "formats": ["<i8", "<i8"],
+            "offsets": [0, 8],
+            "itemsize": 16,
+        }
+    ),
+    Events.GEOM_SET_COLOR.value: np.dtype(
+        {
+            "names": ["id1", "id2", "r", "g", "b", "a"],
+            "formats": ["<i8", "<i8", "u1", "u1", "u1", "u1"],
+            "offsets": [0, 8, 16, 17, 18, 19],
+            "itemsize": 24,
+        }
+    ),
+    Events.INPUT_KEYUP.value: np.dtype(
+        {
+            "names": ["scancode", "keycode", "mod", "isRepeat"],
+            "formats": ["<i4", "<u4", "<u2", "u1"],
+            "offsets": [0, 4, 8, 10],
+            "itemsize": 12,
+        }
+    ),
+    Events.INPUT_KEYDOWN.value: np.dtype(
+        {
+            "names": ["scancode", "keycode", "mod", "isRepeat"],
+            "formats": ["<i4", "<u4", "<u2", "u1"],
+            "offsets": [0, 4, 8, 10],
+            "itemsize": 12,
+        }
+    ),
+    Events.INPUT_MOUSEUP.value: np.dtype(
+        {
+            "names": ["x", "y", "button", "clicks"],
+            "formats": ["<f4", "<f4", "u1", "u1"],
+            "offsets": [0, 4, 8, 9],
+            "itemsize": 12,
+        }
+    ),
+    Events.INPUT_MOUSEDOWN.value: np.dtype(
+        {
+            "names": ["x", "y", "button", "clicks"],
+            "formats": ["<f4", "<f4", "u1", "u1"],
+            "offsets": [0, 4, 8, 9],
+            "itemsize": 12,
+        }
+    ),
+    Events.INPUT_MOUSEMOTION.value: np.dtype(
+        {
+            "names": ["x", "y", "xrel", "yrel"],
+            "formats": ["<f4", "<f4", "<f4", "<f4"],
+            "offsets": [0, 4, 8, 12],
+            "itemsize": 16,
+        }
+    ),
+    Events.WINDOW_TITLE.value: np.dtype(
+        {
+            "names": ["title"],
+            "formats": ["S256"],
+            "offsets": [0],
+            "itemsize": 256,
+        }
+    ),
+    Events.WINDOW_RESIZE.value: np.dtype(
+        {
+            "names": ["w", "h"],
+            "formats": ["<i4", "<i4"],
+            "offsets": [0, 4],
+            "itemsize": 8,
+        }
+    ),
+    Events.WINDOW_FLAGS.value: np.dtype(
+        {
+            "names": ["flags"],
+            "formats": ["<u8"],
+            "offsets": [0],
+            "itemsize": 8,
+        }
+    ),
+    Events.TEXT_ADD.value: np.dtype(
+        {
+            "names": ["id1", "id2", "positionX", "positionY", "positionZ", "r", "g", "b", "a", "fontSize", "fontPathLength", "textLength"],
+            "formats": ["<i8", "<i8", "<f8", "<f8", "<f8", "u1", "u1", "u1", "u1", "<f4", "<u4", "<u4"],
+            "offsets": [0, 8, 16, 24, 32, 40, 41, 42, 43, 48, 52, 56],
+            "itemsize": 64,
+        }
+    ),
+    Events.TEXT_SET_STRING.value: np.dtype(
+        {
+            "names": ["id1", "id2", "textLength"],
+            "formats": ["<i8", "<i8", "<u4"],
+            "offsets": [0, 8, 16],
+            "itemsize": 24,
+        }
+    ),
+    Events.AUDIO_LOAD.value: np.dtype(
+        {
+            "names": ["pathLength"],
+            "formats": ["<u4"],
+            "offsets": [0],
+            "itemsize": 4,
+        }
+    ),
+    Events.AUDIO_LOADED.value: np.dtype(
+        {
+            "names": ["audioId"],
+            "formats": ["<u8"],
+            "offsets": [0],
+            "itemsize": 8,
+        }
+    ),
+    Events.AUDIO_PLAY.value: np.dtype(
+        {
+            "names": ["audioId"],
+            "formats": ["<u8"],
+            "offsets": [0],
+            "itemsize": 8,
+        }
+    ),
+    Events.AUDIO_STOP_ALL.value: np.dtype(
+        {
+            "names": ["_unused"],
+            "formats": ["u1"],
+            "offsets": [0],
+            "itemsize": 1,
+        }
+    ),
+    Events.AUDIO_SET_MASTER_VOLUME.value: np.dtype(
+        {
+            "names": ["volume"],
+            "formats": ["<f4"],
+            "offsets": [0],
+            "itemsize": 4,
+        }
+    ),
+    Events.AUDIO_PAUSE.value: np.dtype(
+        {
+            "names": ["audioId"],
+            "formats": ["<u8"],
+            "offsets": [0],
+            "itemsize": 8,
+        }
+    ),
+    Events.AUDIO_STOP.value: np.dtype(
+        {
+            "names": ["audioId"],
+            "formats": ["<u8"],
+            "offsets": [0],
+            "itemsize": 8,
+        }
+    ),
+    Events.AUDIO_UNLOAD.value: np.dtype(
+        {
+            "names": ["audioId"],
+            "formats": ["<u8"],
+            "offsets": [0],
+            "itemsize": 8,
+        }
+    ),
+    Events.AUDIO_SET_VOLUME.value: np.dtype(
+        {
+            "names": ["audioId", "volume"],
+            "formats": ["<u8", "<f4"],
+            "offsets": [0, 8],
+            "itemsize": 16,
+        }
+    ),
+    Events.PHYSICS_ADD_BODY.value: np.dtype(
+        {
+            "names": ["id1", "id2", "positionX", "positionY", "bodyType", "shapeType", "lockRotation", "mass", "friction", "elasticity", "width", "height"],
+            "formats": ["<i8", "<i8", "<f8", "<f8", "u1", "u1", "u1", "<f8", "<f8", "<f8", "<f8", "<f8"],
+            "offsets": [0, 8, 16, 24, 32, 33, 34, 40, 48, 56, 64, 72],
+            "itemsize": 80,
+        }
+    ),
+    Events.PHYSICS_REMOVE_BODY.value: np.dtype(
+        {
+            "names": ["id1", "id2"],
+            "formats": ["<i8", "<i8"],
+            "offsets": [0, 8],
+            "itemsize": 16,
+        }
+    ),
+    Events.PHYSICS_APPLY_FORCE.value: np.dtype(
+        {
+            "names": ["id1", "id2", "forceX", "forceY"],
+            "formats": ["<i8", "<i8", "<f8", "<f8"],
+            "offsets": [0, 8, 16, 24],
+            "itemsize": 32,
+        }
+    ),
+    Events.PHYSICS_APPLY_IMPULSE.value: np.dtype(
+        {
+            "names": ["id1", "id2", "impulseX", "impulseY"],
+            "formats": ["<i8", "<i8", "<f8", "<f8"],
+            "offsets": [0, 8, 16, 24],
+            "itemsize": 32,
+        }
+    ),
+    Events.PHYSICS_SET_VELOCITY.value: np.dtype(
+        {
+            "names": ["id1", "id2", "velocityX", "velocityY"],
+            "formats": ["<i8", "<i8", "<f8", "<f8"],
+            "offsets": [0, 8, 16, 24],
+            "itemsize": 32,
+        }
+    ),
+    Events.PHYSICS_SET_POSITION.value: np.dtype(
+        {
+            "names": ["id1", "id2", "positionX", "positionY"],
+            "formats": ["<i8", "<i8", "<f8", "<f8"],
+            "offsets": [0, 8, 16, 24],
+            "itemsize": 32,
+        }
+    ),
+    Events.PHYSICS_SET_ROTATION.value: np.dtype(
+        {
+            "names": ["id1", "id2", "angleInRadians"],
+            "formats": ["<i8", "<i8", "<f8"],
+            "offsets": [0, 8, 16],
+            "itemsize": 24,
+        }
+    ),
+    Events.PHYSICS_BIND_HANDLE.value: np.dtype(
+        {
+            "names": ["id1", "id2", "handle"],
+            "formats": ["<i8", "<i8", "<u4"],
+            "offsets": [0, 8, 16],
+            "itemsize": 24,
+        }
+    ),
+    Events.PHYSICS_RELEASE_HANDLE.value: np.dtype(
+        {
+            "names": ["handle"],
+            "formats": ["<u4"],
+            "offsets": [0],
+            "itemsize": 8,
+        }
+    ),
+    Events.PHYSICS_SET_VELOCITY_HANDLE.value: np.dtype(
+        {
+            "names": ["handle", "velocityX", "velocityY"],
+            "formats": ["<u4", "<f8", "<f8"],
+            "offsets": [0, 8, 16],
+            "itemsize": 24,
+        }
+    ),
+    Events.PHYSICS_SET_POSITION_HANDLE.value: np.dtype(
+        {
+            "names": ["handle", "positionX", "positionY"],
+            "formats": ["<u4", "<f8", "<f8"],
+            "offsets": [0, 8, 16],
+            "itemsize": 24,
+        }
+    ),
+    Events.PHYSICS_SET_ROTATION_HANDLE.value: np.dtype(
+        {
+            "names": ["handle", "angleInRadians"],
+            "formats": ["<u4", "<f8"],
+            "offsets": [0, 8],
+            "itemsize": 16,
+        }
+    ),
+    Events.PHYSICS_COLLISION_BEGIN.value: np.dtype(
+        {
+            "names": ["id1_A", "id2_A", "id1_B", "id2_B"],
+            "formats": ["<i8", "<i8", "<i8", "<i8"],
+            "offsets": [0, 8, 16, 24],
+            "itemsize": 32,
+        }
+    ),
+    Events.PHYSICS_COLLISION_SEPARATE.value: np.dtype(
+        {
+            "names": ["id1_A", "id2_A", "id1_B", "id2_B"],
+            "formats": ["<i8", "<i8", "<i8", "<i8"],
+            "offsets": [0, 8, 16, 24],
+            "itemsize": 32,
+        }
+    ),
+    Events.PHYSICS_SYNC_TRANSFORM.value: np.dtype(
+        {
+            "names": ["id1", "id2", "positionX", "positionY", "angle", "velocityX", "velocityY", "angularVelocity", "isSleeping"],
+            "formats": ["<i8", "<i8", "<f8", "<f8", "<f8", "<f8", "<f8", "<f8", "u1"],
+            "offsets": [0, 8, 16, 24, 32, 40, 48, 56, 64],
+            "itemsize": 72,
+        }
+    ),
+    Events.PHYSICS_SET_DEBUG_MODE.value: np.dtype(
+        {
+            "names": ["enabled"],
+            "formats": ["u1"],
+            "offsets": [0],
+            "itemsize": 4,
+        }
+    ),
+    Events.PLUGIN.value: np.dtype(
+        {
+            "names": ["eventId"],
+            "formats": ["u1"],
+            "offsets": [0],
+            "itemsize": 1,
+        }
+    ),
+    Events.PLUGIN_LOAD.value: np.dtype(
+        {
+            "names": ["channelNo", "pathLength"],
+            "formats": ["<u4", "<u4"],
+            "offsets": [0, 4],
+            "itemsize": 8,
+        }
+    ),
+    Events.PLUGIN_UNLOAD.value: np.dtype(
+        {
+            "names": ["pluginId"],
+            "formats": ["u1"],
+            "offsets": [0],
+            "itemsize": 1,
+        }
+    ),
+    Events.PLUGIN_SET.value: np.dtype(
+        {
+            "names": ["pluginId"],
+            "formats": ["u1"],
+            "offsets": [0],
+            "itemsize": 1,
+        }
+    ),
+    Events.PLUGIN_EVENT_STACKING.value: np.dtype(
+        {
+            "names": ["eventId"],
+            "formats": ["u1"],
+            "offsets": [0],
+            "itemsize": 2,
+        }
+    ),
+    Events.PLUGIN_SUBSCRIBE_EVENT.value: np.dtype(
+        {
+            "names": ["pluginId", "channelNo"],
+            "formats": ["u1", "<u4"],
+            "offsets": [0, 4],
+            "itemsize": 8,
+        }
+    ),
+    Events.PLUGIN_UNSUBSCRIBE_EVENT.value: np.dtype(
+        {
+            "names": ["pluginId", "channelNo"],
+            "formats": ["u1", "<u4"],
+            "offsets": [0, 4],
+            "itemsize": 8,
+        }
+    ),
+    Events.CAMERA_SET_POSITION.value: np.dtype(
+        {
+            "names": ["positionX", "positionY"],
+            "formats": ["<f8", "<f8"],
+            "offsets": [0, 8],
+            "itemsize": 16,
+        }
+    ),
+    Events.CAMERA_MOVE.value: np.dtype(
+        {
+            "names": ["deltaX", "deltaY"],
+            "formats": ["<f8", "<f8"],
+            "offsets": [0, 8],
+            "itemsize": 16,
+        }
+    ),
+    Events.CAMERA_SET_ZOOM.value: np.dtype(
+        {
+            "names": ["zoom"],
+            "formats": ["<f8"],
+            "offsets": [0],
+            "itemsize": 8,
+        }
+    ),
+    Events.CAMERA_SET_ROTATION.value: np.dtype(
+        {
+            "names": ["angleInRadians"],
+            "formats": ["<f8"],
+            "offsets": [0],
+            "itemsize": 8,
+        }
+    ),
+    Events.CAMERA_FOLLOW_ENTITY.value: np.dtype(
+        {
+            "names": ["id1", "id2"],
+            "formats": ["<i8", "<i8"],
+            "offsets": [0, 8],
+            "itemsize": 16,
+        }
+    ),
+    Events.CAMERA_STOP_FOLLOWING.value: np.dtype(
+        {
+            "names": ["_unused"],
+            "formats": ["u1"],
+            "offsets": [0],
+            "itemsize": 1,
+        }
+    ),
+    Events.SCRIPT_SUBSCRIBE.value: np.dtype(
+        {
+            "names": ["channelNo"],
+            "formats": ["<u4"],
+            "offsets": [0],
+            "itemsize": 8,
+        }
+    ),
+    Events.SCRIPT_UNSUBSCRIBE.value: np.dtype(
+        {
+            "names": ["channelNo"],
+            "formats": ["<u4"],
+            "offsets": [0],
+            "itemsize": 8,
+        }
+    ),
+    Events.EVENT_BATCH.value: np.dtype(
+        {
+            "names": ["eventType", "count"],
+            "formats": ["<u4", "<u4"],
+            "offsets": [0, 4],
+            "itemsize": 8,
+        }
+    ),
+}
+
+# Header + payload + padding, indexed by event id: one event as it
+# sits in a stream, the same layout as _EVENT_STRUCT_MAP.
+EVENT_DTYPES: Dict[int, np.dtype] = {
+    Events.SPRITE_ADD.value: np.dtype(
+        {
+            "names": ["type", "timestamp", "id1", "id2", "positionX", "positionY", "positionZ", "scaleX", "scaleY", "scaleZ", "sizeW", "sizeH", "rotationX", "rotationY", "rotationZ", "r", "g", "b", "a", "speedX", "speedY"],
+            "formats": ["<u4", "<u8", "<i8", "<i8", "<f8", "<f8", "<f8", "<f8", "<f8", "<f8", "<f8", "<f8", "<f8", "<f8", "<f8", "u1", "u1", "u1", "u1", "<f8", "<f8"],
+            "offsets": [0, 4, 16, 24, 32, 40, 48, 56, 64, 72, 80, 88, 96, 104, 112, 120, 121, 122, 123, 128, 136],
+            "itemsize": 144,
+        }
+    ),
+    Events.SPRITE_REMOVE.value: np.dtype(
+        {
+            "names": ["type", "timestamp", "id1", "id2"],
+            "formats": ["<u4", "<u8", "<i8", "<i8"],
+            "offsets": [0, 4, 16, 24],
+            "itemsize": 32,
+        }
+    ),
+    Events.SPRITE_MOVE.value: np.dtype(
+        {
+            "names": ["type", "timestamp", "id1", "id2", "positionX", "positionY", "positionZ"],
+            "formats": ["<u4", "<u8", "<i8", "<i8", "<f8", "<f8", "<f8"],
+            "offsets": [0, 4, 16, 24, 32, 40, 48],
+            "itemsize": 56,
+        }
+    ),
+    Events.SPRITE_SCALE.value: np.dtype(
+        {
+            "names": ["type", "timestamp", "id1", "id2", "scaleX", "scaleY", "scaleZ"],
+            "formats": ["<u4", "<u8", "<i8", "<i8", "<f8", "<f8", "<f8"],
+            "offsets": [0, 4, 16, 24, 32, 40, 48],
+            "itemsize": 56,
+        }
+    ),
+    Events.SPRITE_RESIZE.value: np.dtype(
+        {
+            "names": ["type", "timestamp", "id1", "id2", "sizeW", "sizeH"],
+            "formats": ["<u4", "<u8", "<i8", "<i8", "<f8", "<f8"],
+            "offsets": [0, 4, 16, 24, 32, 40],
+            "itemsize": 48,
+        }
+    ),
+    Events.SPRITE_ROTATE.value: np.dtype(
+        {
+            "names": ["type", "timestamp", "id1", "id2", "rotationX", "rotationY", "rotationZ"],
+            "formats": ["<u4", "<u8", "<i8", "<i8", "<f8", "<f8", "<f8"],
+            "offsets": [0, 4, 16, 24, 32, 40, 48],
+            "itemsize": 56,
+        }
+    ),
+    Events.SPRITE_COLOR.value: np.dtype(
+        {
+            "names": ["type", "timestamp", "id1", "id2", "r", "g", "b", "a"],
+            "formats": ["<u4", "<u8", "<i8", "<i8", "u1", "u1", "u1", "u1"],
+            "offsets": [0, 4, 16, 24, 32, 33, 34, 35],
+            "itemsize": 40,
+        }
+    ),
+    Events.SPRITE_SPEED.value: np.dtype(
+        {
+            "names": ["type", "timestamp", "id1", "id2", "speedX", "speedY"],
+            "formats": ["<u4", "<u8", "<i8", "<i8", "<f8", "<f8"],
+            "offsets": [0, 4, 16, 24, 32, 40],
+            "itemsize": 48,
+        }
+    ),
+    Events.SPRITE_TEXTURE_LOAD.value: np.dtype(
+        {
+            "names": ["type", "timestamp", "id1", "id2", "filenameLength"],
+            "formats": ["<u4", "<u8", "<i8", "<i8", "<u4"],
+            "offsets": [0, 4, 16, 24, 32],
+            "itemsize": 40,
+        }
+    ),
+    Events.SPRITE_TEXTURE_SET.value: np.dtype(
+        {
+            "names": ["type", "timestamp", "id1", "id2", "textureId"],
+            "formats": ["<u4", "<u8", "<i8", "<i8", "<u8"],
+            "offsets": [0, 4, 16, 24, 32],
+            "itemsize": 40,
+        }
+    ),
+    Events.SPRITE_SET_SOURCE_RECT.value: np.dtype(
+        {
+            "names": ["type", "timestamp", "id1", "id2", "x", "y", "w", "h"],
+            "formats": ["<u4", "<u8", "<i8", "<i8", "<f4", "<f4", "<f4", "<f4"],
+            "offsets": [0, 4, 16, 24, 32, 36, 40, 44],
+            "itemsize": 48,
+        }
+    ),
+    Events.SPRITE_MOVE_F32.value: np.dtype(
+        {
+            "names": ["type", "timestamp", "id1", "id2", "positionX", "positionY", "positionZ"],
+            "formats": ["<u4", "<u8", "<i8", "<i8", "<f4", "<f4", "<f4"],
+            "offsets": [0, 4, 16, 24, 32, 36, 40],
+            "itemsize": 48,
+        }
+    ),
+    Events.SPRITE_SCALE_F32.value: np.dtype(
+        {
+            "names": ["type", "timestamp", "id1", "id2", "scaleX", "scaleY", "scaleZ"],
+            "formats": ["<u4", "<u8", "<i8", "<i8", "<f4", "<f4", "<f4"],
+            "offsets": [0, 4, 16, 24, 32, 36, 40],
+            "itemsize": 48,
+        }
+    ),
+    Events.SPRITE_ROTATE_F32.value: np.dtype(
+        {
+            "names": ["type", "timestamp", "id1", "id2", "rotationX", "rotationY", "rotationZ"],
+            "formats": ["<u4", "<u8", "<i8", "<i8", "<f4", "<f4", "<f4"],
+            "offsets": [0, 4, 16, 24, 32, 36, 40],
+            "itemsize": 48,
+        }
+    ),
+    Events.SPRITE_SPEED_F32.value: np.dtype(
+        {
+            "names": ["type", "timestamp", "id1", "id2", "speedX", "speedY"],
+            "formats": ["<u4", "<u8", "<i8", "<i8", "<f4", "<f4"],
+            "offsets": [0, 4, 16, 24, 32, 36],
+            "itemsize": 40,
+        }
+    ),
+    Events.SPRITE_BIND_HANDLE.value: np.dtype(
+        {
+            "names": ["type", "timestamp", "id1", "id2", "handle"],
+            "formats": ["<u4", "<u8", "<i8", "<i8", "<u4"],
+            "offsets": [0, 4, 16, 24, 32],
+            "itemsize": 40,
+        }
+    ),
+    Events.SPRITE_RELEASE_HANDLE.value: np.dtype(
+        {
+            "names": ["type", "timestamp", "handle"],
+            "formats": ["<u4", "<u8", "<u4"],
+            "offsets": [0, 4, 16],
+            "itemsize": 24,
+        }
+    ),
+    Events.SPRITE_MOVE_HANDLE.value: np.dtype(
+        {
+            "names": ["type", "timestamp", "handle", "positionX", "positionY", "positionZ"],
+            "formats": ["<u4", "<u8", "<u4", "<f4", "<f4", "<f4"],
+            "offsets": [0, 4, 16, 20, 24, 28],
+            "itemsize": 32,
+        }
+    ),
+    Events.SPRITE_SCALE_HANDLE.value: np.dtype(
+        {
+            "names": ["type", "timestamp", "handle", "scaleX", "scaleY", "scaleZ"],
+            "formats": ["<u4", "<u8", "<u4", "<f4", "<f4", "<f4"],
+            "offsets": [0, 4, 16, 20, 24, 28],
+            "itemsize": 32,
+        }
+    ),
+    Events.SPRITE_ROTATE_HANDLE.value: np.dtype(
+        {
+            "names": ["type", "timestamp", "handle", "rotationX", "rotationY", "rotationZ"],
+            "formats": ["<u4", "<u8", "<u4", "<f4", "<f4", "<f4"],
+            "offsets": [0, 4, 16, 20, 24, 28],
+            "itemsize": 32,
+        }
+    ),
+    Events.SPRITE_SPEED_HANDLE.value: np.dtype(
+        {
+            "names": ["type", "timestamp", "handle", "speedX", "speedY"],
+            "formats": ["<u4", "<u8", "<u4", "<f4", "<f4"],
+            "offsets": [0, 4, 16, 20, 24],
+            "itemsize": 32,
+        }
+    ),
+    Events.GEOM_ADD_POINT.value: np.dtype(
+        {
+            "names": ["type", "timestamp", "id1", "id2", "z", "r", "g", "b", "a", "isScreenSpace", "x", "y"],
+            "formats": ["<u4", "<u8", "<i8", "<i8", "<f8", "u1", "u1", "u1", "u1", "u1", "<f4", "<f4"],
+            "offsets": [0, 4, 16, 24, 32, 40, 41, 42, 43, 44, 48, 52],
+            "itemsize": 56,
+        }
+    ),
+    Events.GEOM_ADD_LINE.value: np.dtype(
+        {
+            "names": ["type", "timestamp", "id1", "id2", "z", "r", "g", "b", "a", "isScreenSpace", "x1", "y1", "x2", "y2"],
+            "formats": ["<u4", "<u8", "<i8", "<i8", "<f8", "u1", "u1", "u1", "u1", "u1", "<f4", "<f4", "<f4", "<f4"],
+            "offsets": [0, 4, 16, 24, 32, 40, 41, 42, 43, 44, 48, 52, 56, 60],
+            "itemsize": 64,
+        }
+    ),
+    Events.GEOM_ADD_RECT.value: np.dtype(
+        {
+            "names": ["type", "timestamp", "id1", "id2", "z", "r", "g", "b", "a", "isScreenSpace", "x", "y", "w", "h"],
+            "formats": ["<u4", "<u8", "<i8", "<i8", "<f8", "u1", "u1", "u1", "u1", "u1", "<f4", "<f4", "<f4", "<f4"],
+            "offsets": [0, 4, 16, 24, 32, 40, 41, 42, 43, 44, 48, 52, 56, 60],
+            "itemsize": 64,
+        }
+    ),
+    Events.GEOM_ADD_FILL_RECT.value: np.dtype(
+        {
+            "names": ["type", "timestamp", "id1", "id2", "z", "r", "g", "b", "a", "isScreenSpace", "x", "y", "w", "h"],
+            "formats": ["<u4", "<u8", "<i8", "<i8", "<f8", "u1", "u1", "u1", "u1", "u1", "<f4", "<f4", "<f4", "<f4"],
+            "offsets": [0, 4, 16, 24, 32, 40, 41, 42, 43, 44, 48, 52, 56, 60],
+            "itemsize": 64,
+        }
+    ),
+    Events.GEOM_ADD_PACKED.value: np.dtype(
+        {
+            "names": ["type", "timestamp", "id1", "id2", "z", "r", "g", "b", "a", "isScreenSpace", "primitiveType", "count"],
+            "formats": ["<u4", "<u8", "<i8", "<i8", "<f8", "u1", "u1", "u1", "u1", "u1", "<u4", "<u4"],
+            "offsets": [0, 4, 16, 24, 32, 40, 41, 42, 43, 44, 47, 51],
+            "itemsize": 56,
+        }
+    ),
+    Events.GEOM_REMOVE.value: np.dtype(
+        {
+            "names": ["type", "timestamp", "id1", "id2"],
+            "formats": ["<u4", "<u8", "<i8", "<i8"],
+            "offsets": [0, 4, 16, 24],
+            "itemsize": 32,
+        }
+    ),
+    Events.GEOM_SET_COLOR.value: np.dtype(
+        {
+            "names": ["type", "timestamp", "id1", "id2", "r", "g", "b", "a"],
+            "formats": ["<u4", "<u8", "<i8", "<i8", "u1", "u1", "u1", "u1"],
+            "offsets": [0, 4, 16, 24, 32, 33, 34, 35],
+            "itemsize": 40,
+        }
+    ),
+    Events.INPUT_KEYUP.value: np.dtype(
+        {
+            "names": ["type", "timestamp", "scancode", "keycode", "mod", "isRepeat"],
+            "formats": ["<u4", "<u8", "<i4", "<u4", "<u2", "u1"],
+            "offsets": [0, 4, 16, 20, 24, 26],
+            "itemsize": 32,
+        }
+    ),
+    Events.INPUT_KEYDOWN.value: np.dtype(
+        {
+            "names": ["type", "timestamp", "scancode", "keycode", "mod", "isRepeat"],
+            "formats": ["<u4", "<u8", "<i4", "<u4", "<u2", "u1"],
+            "offsets": [0, 4, 16, 20, 24, 26],
+            "itemsize": 32,
+        }
+    ),
+    Events.INPUT_MOUSEUP.value: np.dtype(
+        {
+            "names": ["type", "timestamp", "x", "y", "button", "clicks"],
+            "formats": ["<u4", "<u8", "<f4", "<f4", "u1", "u1"],
+            "offsets": [0, 4, 16, 20, 24, 25],
+            "itemsize": 32,
+        }
+    ),
+    Events.INPUT_MOUSEDOWN.value: np.dtype(
+        {
+            "names": ["type", "timestamp", "x", "y", "button", "clicks"],
+            "formats": ["<u4", "<u8", "<f4", "<f4", "u1", "u1"],
+            "offsets": [0, 4, 16, 20, 24, 25],
+            "itemsize": 32,
+        }
+    ),
+    Events.INPUT_MOUSEMOTION.value: np.dtype(
+        {
+            "names": ["type", "timestamp", "x", "y", "xrel", "yrel"],
+            "formats": ["<u4", "<u8", "<f4", "<f4", "<f4", "<f4"],
+            "offsets": [0, 4, 16, 20, 24, 28],
+            "itemsize": 32,
+        }
+    ),
+    Events.WINDOW_TITLE.value: np.dtype(
+        {
+            "names": ["type", "timestamp", "title"],
+            "formats": ["<u4", "<u8", "S256"],
+            "offsets": [0, 4, 16],
+            "itemsize": 272,
+        }
+    ),
+    Events.WINDOW_RESIZE.value: np.dtype(
+        {
+            "names": ["type", "timestamp", "w", "h"],
+            "formats": ["<u4", "<u8", "<i4", "<i4"],
+            "offsets": [0, 4, 16, 20],
+            "itemsize": 24,
+        }
+    ),
+    Events.WINDOW_FLAGS.value: np.dtype(
+        {
+            "names": ["type", "timestamp", "flags"],
+            "formats": ["<u4", "<u8", "<u8"],
+            "offsets": [0, 4, 16],
+            "itemsize": 24,
+        }
+    ),
+    Events.TEXT_ADD.value: np.dtype(
+        {
+            "names": ["type", "timestamp", "id1", "id2", "positionX", "positionY", "positionZ", "r", "g", "b", "a", "fontSize", "fontPathLength", "textLength"],
+            "formats": ["<u4", "<u8", "<i8", "<i8", "<f8", "<f8", "<f8", "u1", "u1", "u1", "u1", "<f4", "<u4", "<u4"],
+            "offsets": [0, 4, 16, 24, 32, 40, 48, 56, 57, 58, 59, 64, 68, 72],
+            "itemsize": 80,
+        }
+    ),
+    Events.TEXT_SET_STRING.value: np.dtype(
+        {
+            "names": ["type", "timestamp", "id1", "id2", "textLength"],
+            "formats": ["<u4", "<u8", "<i8", "<i8", "<u4"],
+            "offsets": [0, 4, 16, 24, 32],
+            "itemsize": 40,
+        }
+    ),
+    Events.AUDIO_LOAD.value: np.dtype(
+        {
+            "names": ["type", "timestamp", "pathLength"],
+            "formats": ["<u4", "<u8", "<u4"],
+            "offsets": [0, 4, 16],
+            "itemsize": 24,
+        }
+    ),
+    Events.AUDIO_LOADED.value: np.dtype(
+        {
+            "names": ["type", "timestamp", "audioId"],
+            "formats": ["<u4", "<u8", "<u8"],
+            "offsets": [0, 4, 16],
+            "itemsize": 24,
+        }
+    ),
+    Events.AUDIO_PLAY.value: np.dtype(
+        {
+            "names": ["type", "timestamp", "audioId"],
+            "formats": ["<u4", "<u8", "<u8"],
+            "offsets": [0, 4, 16],
+            "itemsize": 24,
+        }
+    ),
+    Events.AUDIO_STOP_ALL.value: np.dtype(
+        {
+            "names": ["type", "timestamp", "_unused"],
+            "formats": ["<u4", "<u8", "u1"],
+            "offsets": [0, 4, 16],
+            "itemsize": 24,
+        }
+    ),
+    Events.AUDIO_SET_MASTER_VOLUME.value: np.dtype(
+        {
+            "names": ["type", "timestamp", "volume"],
+            "formats": ["<u4", "<u8", "<f4"],
+            "offsets": [0, 4, 16],
+            "itemsize": 24,
+        }
+    ),
+    Events.AUDIO_PAUSE.value: np.dtype(
+        {
+            "names": ["type", "timestamp", "audioId"],
+            "formats": ["<u4", "<u8", "<u8"],
+            "offsets": [0, 4, 16],
+            "itemsize": 24,
+        }
+    ),
+    Events.AUDIO_STOP.value: np.dtype(
+        {
+            "names": ["type", "timestamp", "audioId"],
+            "formats": ["<u4", "<u8", "<u8"],
+            "offsets": [0, 4, 16],
+            "itemsize": 24,
+        }
+    ),
+    Events.AUDIO_UNLOAD.value: np.dtype(
+        {
+            "names": ["type", "timestamp", "audioId"],
+            "formats": ["<u4", "<u8", "<u8"],
+            "offsets": [0, 4, 16],
+            "itemsize": 24,
+        }
+    ),
+    Events.AUDIO_SET_VOLUME.value: np.dtype(
+        {
+            "names": ["type", "timestamp", "audioId", "volume"],
+            "formats": ["<u4", "<u8", "<u8", "<f4"],
+            "offsets": [0, 4, 16, 24],
+            "itemsize": 32,
+        }
+    ),
+    Events.PHYSICS_ADD_BODY.value: np.dtype(
+        {
+            "names": ["type", "timestamp", "id1", "id2", "positionX", "positionY", "bodyType", "shapeType", "lockRotation", "mass", "friction", "elasticity", "width", "height"],
+            "formats": ["<u4", "<u8", "<i8", "<i8", "<f8", "<f8", "u1", "u1", "u1", "<f8", "<f8", "<f8", "<f8", "<f8"],
+            "offsets": [0, 4, 16, 24, 32, 40, 48, 49, 50, 56, 64, 72, 80, 88],
+            "itemsize": 96,
+        }
+    ),
+    Events.PHYSICS_REMOVE_BODY.value: np.dtype(
+        {
+            "names": ["type", "timestamp", "id1", "id2"],
+            "formats": ["<u4", "<u8", "<i8", "<i8"],
+            "offsets": [0, 4, 16, 24],
+            "itemsize": 32,
+        }
+    ),
+    Events.PHYSICS_APPLY_FORCE.value: np.dtype(
+        {
+            "names": ["type", "timestamp", "id1", "id2", "forceX", "forceY"],
+            "formats": ["<u4", "<u8", "<i8", "<i8", "<f8", "<f8"],
+            "offsets": [0, 4, 16, 24, 32, 40],
+            "itemsize": 48,
+        }
+    ),
+    Events.PHYSICS_APPLY_IMPULSE.value: np.dtype(
+        {
+            "names": ["type", "timestamp", "id1", "id2", "impulseX", "impulseY"],
+            "formats": ["<u4", "<u8", "<i8", "<i8", "<f8", "<f8"],
+            "offsets": [0, 4, 16, 24, 32, 40],
+            "itemsize": 48,
+        }
+    ),
+    Events.PHYSICS_SET_VELOCITY.value: np.dtype(
+        {
+            "names": ["type", "timestamp", "id1", "id2", "velocityX", "velocityY"],
+            "formats": ["<u4", "<u8", "<i8", "<i8", "<f8", "<f8"],
+            "offsets": [0, 4, 16, 24, 32, 40],
+            "itemsize": 48,
+        }
+    ),
+    Events.PHYSICS_SET_POSITION.value: np.dtype(
+        {
+            "names": ["type", "timestamp", "id1", "id2", "positionX", "positionY"],
+            "formats": ["<u4", "<u8", "<i8", "<i8", "<f8", "<f8"],
+            "offsets": [0, 4, 16, 24, 32, 40],
+            "itemsize": 48,
+        }
+    ),
+    Events.PHYSICS_SET_ROTATION.value: np.dtype(
+        {
+            "names": ["type", "timestamp", "id1", "id2", "angleInRadians"],
+            "formats": ["<u4", "<u8", "<i8", "<i8", "<f8"],
+            "offsets": [0, 4, 16, 24, 32],
+            "itemsize": 40,
+        }
+    ),
+    Events.PHYSICS_BIND_HANDLE.value: np.dtype(
+        {
+            "names": ["type", "timestamp", "id1", "id2", "handle"],
+            "formats": ["<u4", "<u8", "<i8", "<i8", "<u4"],
+            "offsets": [0, 4, 16, 24, 32],
+            "itemsize": 40,
+        }
+    ),
+    Events.PHYSICS_RELEASE_HANDLE.value: np.dtype(
+        {
+            "names": ["type", "timestamp", "handle"],
+            "formats": ["<u4", "<u8", "<u4"],
+            "offsets": [0, 4, 16],
+            "itemsize": 24,
+        }
+    ),
+    Events.PHYSICS_SET_VELOCITY_HANDLE.value: np.dtype(
+        {
+            "names": ["type", "timestamp", "handle", "velocityX", "velocityY"],
+            "formats": ["<u4", "<u8", "<u4", "<f8", "<f8"],
+            "offsets": [0, 4, 16, 24, 32],
+            "itemsize": 40,
+        }
+    ),
+    Events.PHYSICS_SET_POSITION_HANDLE.value: np.dtype(
+        {
+            "names": ["type", "timestamp", "handle", "positionX", "positionY"],
+            "formats": ["<u4", "<u8", "<u4", "<f8", "<f8"],
+            "offsets": [0, 4, 16, 24, 32],
+            "itemsize": 40,
+        }
+    ),
+    Events.PHYSICS_SET_ROTATION_HANDLE.value: np.dtype(
+        {
+            "names": ["type", "timestamp", "handle", "angleInRadians"],
+            "formats": ["<u4", "<u8", "<u4", "<f8"],
+            "offsets": [0, 4, 16, 24],
+            "itemsize": 32,
+        }
+    ),
+    Events.PHYSICS_COLLISION_BEGIN.value: np.dtype(
+        {
+            "names": ["type", "timestamp", "id1_A", "id2_A", "id1_B", "id2_B"],
+            "formats": ["<u4", "<u8", "<i8", "<i8", "<i8", "<i8"],
+            "offsets": [0, 4, 16, 24, 32, 40],
+            "itemsize": 48,
+        }
+    ),
+    Events.PHYSICS_COLLISION_SEPARATE.value: np.dtype(
+        {
+            "names": ["type", "timestamp", "id1_A", "id2_A", "id1_B", "id2_B"],
+            "formats": ["<u4", "<u8", "<i8", "<i8", "<i8", "<i8"],
+            "offsets": [0, 4, 16, 24, 32, 40],
+            "itemsize": 48,
+        }
+    ),
+    Events.PHYSICS_SYNC_TRANSFORM.value: np.dtype(
+        {
+            "names": ["type", "timestamp", "id1", "id2", "positionX", "positionY", "angle", "velocityX", "velocityY", "angularVelocity", "isSleeping"],
+            "formats": ["<u4", "<u8", "<i8", "<i8", "<f8", "<f8", "<f8", "<f8", "<f8", "<f8", "u1"],
+            "offsets": [0, 4, 16, 24, 32, 40, 48, 56, 64, 72, 80],
+            "itemsize": 88,
+        }
+    ),
+    Events.PHYSICS_SET_DEBUG_MODE.value: np.dtype(
+        {
+            "names": ["type", "timestamp", "enabled"],
+            "formats": ["<u4", "<u8", "u1"],
+            "offsets": [0, 4, 16],
+            "itemsize": 24,
+        }
+    ),
+    Events.PLUGIN.value: np.dtype(
+        {
+            "names": ["type", "timestamp", "eventId"],
+            "formats": ["<u4", "<u8", "u1"],
+            "offsets": [0, 4, 16],
+            "itemsize": 24,
+        }
+    ),
+    Events.PLUGIN_LOAD.value: np.dtype(
+        {
+            "names": ["type", "timestamp", "channelNo", "pathLength"],
+            "formats": ["<u4", "<u8", "<u4", "<u4"],
+            "offsets": [0, 4, 16, 20],
+            "itemsize": 24,
+        }
+    ),
+    Events.PLUGIN_UNLOAD.value: np.dtype(
+        {
+            "names": ["type", "timestamp", "pluginId"],
+            "formats": ["<u4", "<u8", "u1"],
+            "offsets": [0, 4, 16],
+            "itemsize": 24,
+        }
+    ),
+    Events.PLUGIN_SET.value: np.dtype(
+        {
+            "names": ["type", "timestamp", "pluginId"],
+            "formats": ["<u4", "<u8", "u1"],
+            "offsets": [0, 4, 16],
+            "itemsize": 24,
+        }
+    ),
+    Events.PLUGIN_EVENT_STACKING.value: np.dtype(
+        {
+            "names": ["type", "timestamp", "eventId"],
+            "formats": ["<u4", "<u8", "u1"],
+            "offsets": [0, 4, 16],
+            "itemsize": 24,
+        }
+    ),
+    Events.PLUGIN_SUBSCRIBE_EVENT.value: np.dtype(
+        {
+            "names": ["type", "timestamp", "pluginId", "channelNo"],
+            "formats": ["<u4", "<u8", "u1", "<u4"],
+            "offsets": [0, 4, 16, 20],
+            "itemsize": 24,
+        }
+    ),
+    Events.PLUGIN_UNSUBSCRIBE_EVENT.value: np.dtype(
+        {
+            "names": ["type", "timestamp", "pluginId", "channelNo"],
+            "formats": ["<u4", "<u8", "u1", "<u4"],
+            "offsets": [0, 4, 16, 20],
+            "itemsize": 24,
+        }
+    ),
+    Events.CAMERA_SET_POSITION.value: np.dtype(
+        {
+            "names": ["type", "timestamp", "positionX", "positionY"],
+            "formats": ["<u4", "<u8", "<f8", "<f8"],
+            "offsets": [0, 4, 16, 24],
+            "itemsize": 32,
+        }
+    ),
+    Events.CAMERA_MOVE.value: np.dtype(
+        {
+            "names": ["type", "timestamp", "deltaX", "deltaY"],
+            "formats": ["<u4", "<u8", "<f8", "<f8"],
+            "offsets": [0, 4, 16, 24],
+            "itemsize": 32,
+        }
+    ),
+    Events.CAMERA_SET_ZOOM.value: np.dtype(
+        {
+            "names": ["type", "timestamp", "zoom"],
+            "formats": ["<u4", "<u8", "<f8"],
+            "offsets": [0, 4, 16],
+            "itemsize": 24,
+        }
+    ),
+    Events.CAMERA_SET_ROTATION.value: np.dtype(
+        {
+            "names": ["type", "timestamp", "angleInRadians"],
+            "formats": ["<u4", "<u8", "<f8"],
+            "offsets": [0, 4, 16],
+            "itemsize": 24,
+        }
+    ),
+    Events.CAMERA_FOLLOW_ENTITY.value: np.dtype(
+        {
+            "names": ["type", "timestamp", "id1", "id2"],
+            "formats": ["<u4", "<u8", "<i8", "<i8"],
+            "offsets": [0, 4, 16, 24],
+            "itemsize": 32,
+        }
+    ),
+    Events.CAMERA_STOP_FOLLOWING.value: np.dtype(
+        {
+            "names": ["type", "timestamp", "_unused"],
+            "formats": ["<u4", "<u8", "u1"],
+            "offsets": [0, 4, 16],
+            "itemsize": 24,
+        }
+    ),
+    Events.SCRIPT_SUBSCRIBE.value: np.dtype(
+        {
+            "names": ["type", "timestamp", "channelNo"],
+            "formats": ["<u4", "<u8", "<u4"],
+            "offsets": [0, 4, 16],
+            "itemsize": 24,
+        }
+    ),
+    Events.SCRIPT_UNSUBSCRIBE.value: np.dtype(
+        {
+            "names": ["type", "timestamp", "channelNo"],
+            "formats": ["<u4", "<u8", "<u4"],
+            "offsets": [0, 4, 16],
+            "itemsize": 24,
+        }
+    ),
+    Events.EVENT_BATCH.value: np.dtype(
+        {
+            "names": ["type", "timestamp", "eventType", "count"],
+            "formats": ["<u4", "<u8", "<u4", "<u4"],
+            "offsets": [0, 4, 16, 20],
+            "itemsize": 24,
+        }
+    ),
+}
@@ -24,6 +24,16 @@ pub enum Events {
     spriteTextureLoad = 8,
     spriteTextureSet = 9,
     spriteSetSourceRect = 10,
+    spriteMoveF32 = 11,
+    spriteScaleF32 = 12,
+    spriteRotateF32 = 13,
+    spriteSpeedF32 = 14,
+    spriteBindHandle = 15,
+    spriteReleaseHandle = 16,
+    spriteMoveHandle = 17,
+    spriteScaleHandle = 18,
+    spriteRotateHandle = 19,
+    spriteSpeedHandle = 20,
     geomAddPoint = 50,
     geomAddLine = 51,
     geomAddRect = 52,
@@ -62,6 +72,11 @@ pub enum Events {
     physicsSetVelocity = 504,
     physicsSetPosition = 505,
     physicsSetRotation = 506,
+    physicsBindHandle = 507,
+    physicsReleaseHandle = 508,
+    physicsSetVelocityHandle = 509,
+    physicsSetPositionHandle = 510,
+    physicsSetRotationHandle = 511,
     physicsCollisionBegin = 550,
     physicsCollisionSeparate = 551,
     physicsSyncTransform = 552,
@@ -84,6 +99,8 @@ pub enum Events {
 
     scriptSubscribe = 3000,
     scriptUnsubscribe = 3001,
+
+    eventBatch = 4000,
 }
 
 impl Events {
@@ -100,6 +117,16 @@ impl Events {
             8 => Some(Events::spriteTextureLoad),
             9 => Some(Events::spriteTextureSet),
             10 => Some(Events::spriteSetSourceRect),
+            11 => Some(Events::spriteMoveF32),
+            12 => Some(Events::spriteScaleF32),
+            13 => Some(Events::spriteRotateF32),
+            14 => Some(Events::spriteSpeedF32),
+            15 => Some(Events::spriteBindHandle),
+            16 => Some(Events::spriteReleaseHandle),
+            17 => Some(Events::spriteMoveHandle),
+            18 => Some(Events::spriteScaleHandle),
+            19 => Some(Events::spriteRotateHandle),
+            20 => Some(Events::spriteSpeedHandle),
             50 => Some(Events::geomAddPoint),
             51 => Some(Events::geomAddLine),
             52 => Some(Events::geomAddRect),
@@ -133,6 +160,11 @@ impl Events {
             504 => Some(Events::physicsSetVelocity),
             505 => Some(Events::physicsSetPosition),
             506 => Some(Events::physicsSetRotation),
+            507 => Some(Events::physicsBindHandle),
+            508 => Some(Events::physicsReleaseHandle),
+            509 => Some(Events::physicsSetVelocityHandle),
+            510 => Some(Events::physicsSetPositionHandle),
+            511 => Some(Events::physicsSetRotationHandle),
             550 => Some(Events::physicsCollisionBegin),
             551 => Some(Events::physicsCollisionSeparate),
             552 => Some(Events::physicsSyncTransform),
@@ -152,6 +184,7 @@ impl Events {
             2005 => Some(Events::cameraStopFollowing),
             3000 => Some(Events::scriptSubscribe),
             3001 => Some(Events::scriptUnsubscribe),
+            4000 => Some(Events::eventBatch),
             _ => None,
         }
     }
@@ -269,6 +302,14 @@ pub struct PackedCameraStopFollowingEvent {
     pub _unused: u8, // Padding to ensure non-zero struct size (MSVC compatibility).
 }
 
+/// Header for a run of same-type fixed-size events. `count` payloads of `eventType` follow, each padded to 8 bytes, with no per-event header.
+#[repr(C, packed)]
+#[derive(Debug, Copy, Clone)]
+pub struct PackedEventBatchHeaderEvent {
+    pub event_type: u32, // Event ID of every payload in the batch (a fixed-size event).
+    pub count: u32, // Number of payloads that follow this header.
+}
+
 /// Payload for adding a single geometry line.
 #[repr(C, packed)]
 #[derive(Debug, Copy, Clone)]
@@ -433,6 +474,16 @@ pub struct PackedPhysicsApplyImpulseEvent {
     pub impulse_y: f64, // Impulse vector Y component.
 }
 
+/// Binds a dense u32 handle to a physics body for the *_HANDLE events.
+#[repr(C, packed)]
+#[derive(Debug, Copy, Clone)]
+pub struct PackedPhysicsBindHandleEvent {
+    pub id1: i64, // Primary ID of the body.
+    pub id2: i64, // Secondary ID of the body.
+    pub handle: u32, // Handle to bind (reuses a released handle's slot).
+    pub _padding: u32, // Padding for alignment.
+}
+
 /// Payload sent *from* engine when two bodies begin colliding.
 #[repr(C, packed)]
 #[derive(Debug, Copy, Clone)]
@@ -443,6 +494,14 @@ pub struct PackedPhysicsCollisionEvent {
     pub id2_b: i64, // Secondary ID of the second body.
 }
 
+/// Unbinds a body handle. PHYSICS_REMOVE_BODY also drops the body's handle.
+#[repr(C, packed)]
+#[derive(Debug, Copy, Clone)]
+pub struct PackedPhysicsReleaseHandleEvent {
+    pub handle: u32, // Handle to release.
+    pub _padding: u32, // Padding for alignment.
+}
+
 /// Payload for removing a physics body.
 #[repr(C, packed)]
 #[derive(Debug, Copy, Clone)]
@@ -469,6 +528,16 @@ pub struct PackedPhysicsSetPositionEvent {
     pub position_y: f64, // New Y position.
 }
 
+/// PHYSICS_SET_POSITION addressed by handle.
+#[repr(C, packed)]
+#[derive(Debug, Copy, Clone)]
+pub struct PackedPhysicsSetPositionHandleEvent {
+    pub handle: u32, // Entity handle bound by PHYSICS_BIND_HANDLE.
+    pub _padding: u32, // Padding for alignment.
+    pub position_x: f64, // New X position.
+    pub position_y: f64, // New Y position.
+}
+
 /// Payload to set a body's rotation.
 #[repr(C, packed)]
 #[derive(Debug, Copy, Clone)]
@@ -478,6 +547,15 @@ pub struct PackedPhysicsSetRotationEvent {
     pub angle_in_radians: f64, // New angle in radians.
 }
 
+/// PHYSICS_SET_ROTATION addressed by handle.
+#[repr(C, packed)]
+#[derive(Debug, Copy, Clone)]
+pub struct PackedPhysicsSetRotationHandleEvent {
+    pub handle: u32, // Entity handle bound by PHYSICS_BIND_HANDLE.
+    pub _padding: u32, // Padding for alignment.
+    pub angle_in_radians: f64, // New angle in radians.
+}
+
 /// Payload to set a body's linear velocity.
 #[repr(C, packed)]
 #[derive(Debug, Copy, Clone)]
@@ -488,6 +566,16 @@ pub struct PackedPhysicsSetVelocityEvent {
     pub velocity_y: f64, // New Y velocity.
 }
 
+/// PHYSICS_SET_VELOCITY addressed by handle.
+#[repr(C, packed)]
+#[derive(Debug, Copy, Clone)]
+pub struct PackedPhysicsSetVelocityHandleEvent {
+    pub handle: u32, // Entity handle bound by PHYSICS_BIND_HANDLE.
+    pub _padding: u32, // Padding for alignment.
+    pub velocity_x: f64, // New X velocity.
+    pub velocity_y: f64, // New Y velocity.
+}
+
 /// Payload sent *from* engine to sync 2D physics state back to client.
 #[repr(C, packed)]
 #[derive(Debug, Copy, Clone)]
@@ -601,6 +689,16 @@ pub struct PackedSpriteAddEvent {
     pub speed_y: f64, // Initial Y speed.
 }
 
+/// Binds a dense u32 handle to a sprite for the *_HANDLE events.
+#[repr(C, packed)]
+#[derive(Debug, Copy, Clone)]
+pub struct PackedSpriteBindHandleEvent {
+    pub id1: i64, // Primary ID of the sprite.
+    pub id2: i64, // Secondary ID of the sprite.
+    pub handle: u32, // Handle to bind (reuses a released handle's slot).
+    pub _padding: u32, // Padding for alignment.
+}
+
 /// Payload to set a sprite's color modulation.
 #[repr(C, packed)]
 #[derive(Debug, Copy, Clone)]
@@ -625,6 +723,36 @@ pub struct PackedSpriteMoveEvent {
     pub position_z: f64, // New Z position (depth).
 }
 
+/// Compact SPRITE_MOVE with f32 coordinates.
+#[repr(C, packed)]
+#[derive(Debug, Copy, Clone)]
+pub struct PackedSpriteMoveF32Event {
+    pub id1: i64, // Primary ID of the sprite.
+    pub id2: i64, // Secondary ID of the sprite.
+    pub position_x: f32, // New X position.
+    pub position_y: f32, // New Y position.
+    pub position_z: f32, // New Z position (depth).
+    pub _padding: u32, // Padding for alignment.
+}
+
+/// SPRITE_MOVE_F32 addressed by handle.
+#[repr(C, packed)]
+#[derive(Debug, Copy, Clone)]
+pub struct PackedSpriteMoveHandleEvent {
+    pub handle: u32, // Entity handle bound by SPRITE_BIND_HANDLE.
+    pub position_x: f32, // New X position.
+    pub position_y: f32, // New Y position.
+    pub position_z: f32, // New Z position (depth).
+}
+
+/// Unbinds a sprite handle. SPRITE_REMOVE also drops the sprite's handle.
+#[repr(C, packed)]
+#[derive(Debug, Copy, Clone)]
+pub struct PackedSpriteReleaseHandleEvent {
+    pub handle: u32, // Handle to release.
+    pub _padding: u32, // Padding for alignment.
+}
+
 /// Payload for removing a sprite from the scene.
 #[repr(C, packed)]
 #[derive(Debug, Copy, Clone)]
@@ -654,6 +782,28 @@ pub struct PackedSpriteRotateEvent {
     pub rotation_z: f64, // New Z rotation (in radians).
 }
 
+/// Compact SPRITE_ROTATE with f32 angles.
+#[repr(C, packed)]
+#[derive(Debug, Copy, Clone)]
+pub struct PackedSpriteRotateF32Event {
+    pub id1: i64, // Primary ID of the sprite.
+    pub id2: i64, // Secondary ID of the sprite.
+    pub rotation_x: f32, // New X rotation (in radians).
+    pub rotation_y: f32, // New Y rotation (in radians).
+    pub rotation_z: f32, // New Z rotation (in radians).
+    pub _padding: u32, // Padding for alignment.
+}
+
+/// SPRITE_ROTATE_F32 addressed by handle.
+#[repr(C, packed)]
+#[derive(Debug, Copy, Clone)]
+pub struct PackedSpriteRotateHandleEvent {
+    pub handle: u32, // Entity handle bound by SPRITE_BIND_HANDLE.
+    pub rotation_x: f32, // New X rotation (in radians).
+    pub rotation_y: f32, // New Y rotation (in radians).
+    pub rotation_z: f32, // New Z rotation (in radians).
+}
+
 /// Payload to set a sprite's scale.
 #[repr(C, packed)]
 #[derive(Debug, Copy, Clone)]
@@ -665,6 +815,28 @@ pub struct PackedSpriteScaleEvent {
     pub scale_z: f64, // New Z scale.
 }
 
+/// Compact SPRITE_SCALE with f32 components.
+#[repr(C, packed)]
+#[derive(Debug, Copy, Clone)]
+pub struct PackedSpriteScaleF32Event {
+    pub id1: i64, // Primary ID of the sprite.
+    pub id2: i64, // Secondary ID of the sprite.
+    pub scale_x: f32, // New X scale.
+    pub scale_y: f32, // New Y scale.
+    pub scale_z: f32, // New Z scale.
+    pub _padding: u32, // Padding for alignment.
+}
+
+/// SPRITE_SCALE_F32 addressed by handle.
+#[repr(C, packed)]
+#[derive(Debug, Copy, Clone)]
+pub struct PackedSpriteScaleHandleEvent {
+    pub handle: u32, // Entity handle bound by SPRITE_BIND_HANDLE.
+    pub scale_x: f32, // New X scale.
+    pub scale_y: f32, // New Y scale.
+    pub scale_z: f32, // New Z scale.
+}
+
 /// Sets the source rectangle (spritesheet clipping) for a sprite.
 #[repr(C, packed)]
 #[derive(Debug, Copy, Clone)]
@@ -687,6 +859,26 @@ pub struct PackedSpriteSpeedEvent {
     pub speed_y: f64, // New Y speed.
 }
 
+/// Compact SPRITE_SPEED with f32 components.
+#[repr(C, packed)]
+#[derive(Debug, Copy, Clone)]
+pub struct PackedSpriteSpeedF32Event {
+    pub id1: i64, // Primary ID of the sprite.
+    pub id2: i64, // Secondary ID of the sprite.
+    pub speed_x: f32, // New X speed.
+    pub speed_y: f32, // New Y speed.
+}
+
+/// SPRITE_SPEED_F32 addressed by handle.
+#[repr(C, packed)]
+#[derive(Debug, Copy, Clone)]
+pub struct PackedSpriteSpeedHandleEvent {
+    pub handle: u32, // Entity handle bound by SPRITE_BIND_HANDLE.
+    pub speed_x: f32, // New X speed.
+    pub speed_y: f32, // New Y speed.
+    pub _padding: u32, // Padding for alignment.
+}
+
 /// Payload to set a sprite's texture to an already loaded one.
 #[repr(C, packed)]
 #[derive(Debug, Copy, Clone)]
@@ -15,6 +15,16 @@ public enum Events: UInt32 {
     case spriteTextureLoad = 8
     case spriteTextureSet = 9
     case spriteSetSourceRect = 10
+    case spriteMoveF32 = 11
+    case spriteScaleF32 = 12
+    case spriteRotateF32 = 13
+    case spriteSpeedF32 = 14
+    case spriteBindHandle = 15
+    case spriteReleaseHandle = 16
+    case spriteMoveHandle = 17
+    case spriteScaleHandle = 18
+    case spriteRotateHandle = 19
+    case spriteSpeedHandle = 20
     case geomAddPoint = 50
     case geomAddLine = 51
     case geomAddRect = 52
@@ -53,6 +63,11 @@ public enum Events: UInt32 {
     case physicsSetVelocity = 504
     case physicsSetPosition = 505
     case physicsSetRotation = 506
+    case physicsBindHandle = 507
+    case physicsReleaseHandle = 508
+    case physicsSetVelocityHandle = 509
+    case physicsSetPositionHandle = 510
+    case physicsSetRotationHandle = 511
     case physicsCollisionBegin = 550
     case physicsCollisionSeparate = 551
     case physicsSyncTransform = 552
@@ -75,4 +90,10 @@ public enum Events: UInt32 {
 
     case scriptSubscribe = 3000
     case scriptUnsubscribe = 3001
+
+    case eventBatch = 4000
 }
+
+/// Hash of the wire layout in structs.json, compared with the client's
+/// during the IPC handshake.
+public let PHROST_SCHEMA_HASH: UInt64 = 0x29069964d87e6b90
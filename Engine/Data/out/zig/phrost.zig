@@ -15,6 +15,16 @@ pub const Events = enum(u32) {
     spriteTextureLoad = 8,
     spriteTextureSet = 9,
     spriteSetSourceRect = 10,
+    spriteMoveF32 = 11,
+    spriteScaleF32 = 12,
+    spriteRotateF32 = 13,
+    spriteSpeedF32 = 14,
+    spriteBindHandle = 15,
+    spriteReleaseHandle = 16,
+    spriteMoveHandle = 17,
+    spriteScaleHandle = 18,
+    spriteRotateHandle = 19,
+    spriteSpeedHandle = 20,
     geomAddPoint = 50,
     geomAddLine = 51,
     geomAddRect = 52,
@@ -53,6 +63,11 @@ pub const Events = enum(u32) {
     physicsSetVelocity = 504,
     physicsSetPosition = 505,
     physicsSetRotation = 506,
+    physicsBindHandle = 507,
+    physicsReleaseHandle = 508,
+    physicsSetVelocityHandle = 509,
+    physicsSetPositionHandle = 510,
+    physicsSetRotationHandle = 511,
     physicsCollisionBegin = 550,
     physicsCollisionSeparate = 551,
     physicsSyncTransform = 552,
@@ -75,6 +90,8 @@ pub const Events = enum(u32) {
 
     scriptSubscribe = 3000,
     scriptUnsubscribe = 3001,
+
+    eventBatch = 4000,
 };
 
 pub const PackedAudioLoadEvent = extern struct {
@@ -142,6 +159,11 @@ pub const PackedCameraStopFollowingEvent = extern struct {
     _unused: u8, // Padding to ensure non-zero struct size (MSVC compatibility).
 };
 
+pub const PackedEventBatchHeaderEvent = extern struct {
+    eventType: u32, // Event ID of every payload in the batch (a fixed-size event).
+    count: u32, // Number of payloads that follow this header.
+};
+
 pub const PackedGeomAddLineEvent = extern struct {
     id1: i64, // Primary identifier.
     id2: i64, // Secondary identifier.
@@ -270,6 +292,13 @@ pub const PackedPhysicsApplyImpulseEvent = extern struct {
     impulseY: f64, // Impulse vector Y component.
 };
 
+pub const PackedPhysicsBindHandleEvent = extern struct {
+    id1: i64, // Primary ID of the body.
+    id2: i64, // Secondary ID of the body.
+    handle: u32, // Handle to bind (reuses a released handle's slot).
+    _padding: u32, // Padding for alignment.
+};
+
 pub const PackedPhysicsCollisionEvent = extern struct {
     id1_A: i64, // Primary ID of the first body.
     id2_A: i64, // Secondary ID of the first body.
@@ -277,6 +306,11 @@ pub const PackedPhysicsCollisionEvent = extern struct {
     id2_B: i64, // Secondary ID of the second body.
 };
 
+pub const PackedPhysicsReleaseHandleEvent = extern struct {
+    handle: u32, // Handle to release.
+    _padding: u32, // Padding for alignment.
+};
+
 pub const PackedPhysicsRemoveBodyEvent = extern struct {
     id1: i64, // Primary ID of body to remove.
     id2: i64, // Secondary ID of body to remove.
@@ -294,12 +328,25 @@ pub const PackedPhysicsSetPositionEvent = extern struct {
     positionY: f64, // New Y position.
 };
 
+pub const PackedPhysicsSetPositionHandleEvent = extern struct {
+    handle: u32, // Entity handle bound by PHYSICS_BIND_HANDLE.
+    _padding: u32, // Padding for alignment.
+    positionX: f64, // New X position.
+    positionY: f64, // New Y position.
+};
+
 pub const PackedPhysicsSetRotationEvent = extern struct {
     id1: i64, // Primary ID of the body.
     id2: i64, // Secondary ID of the body.
     angleInRadians: f64, // New angle in radians.
 };
 
+pub const PackedPhysicsSetRotationHandleEvent = extern struct {
+    handle: u32, // Entity handle bound by PHYSICS_BIND_HANDLE.
+    _padding: u32, // Padding for alignment.
+    angleInRadians: f64, // New angle in radians.
+};
+
 pub const PackedPhysicsSetVelocityEvent = extern struct {
     id1: i64, // Primary ID of the body.
     id2: i64, // Secondary ID of the body.
@@ -307,6 +354,13 @@ pub const PackedPhysicsSetVelocityEvent = extern struct {
     velocityY: f64, // New Y velocity.
 };
 
+pub const PackedPhysicsSetVelocityHandleEvent = extern struct {
+    handle: u32, // Entity handle bound by PHYSICS_BIND_HANDLE.
+    _padding: u32, // Padding for alignment.
+    velocityX: f64, // New X velocity.
+    velocityY: f64, // New Y velocity.
+};
+
 pub const PackedPhysicsSyncTransformEvent = extern struct {
     id1: i64, // Primary ID of the body.
     id2: i64, // Secondary ID of the body.
@@ -320,22 +374,6 @@ pub const PackedPhysicsSyncTransformEvent = extern struct {
     _padding: [7]u8, // Aligns struct to 64-bit boundary.
 };
 
-pub const PackedPhysicsAddBodyEvent = extern struct {
-    id1: i64,
-    id2: i64,
-    positionX: f64,
-    positionY: f64,
-    bodyType: u8,
-    shapeType: u8,
-    lockRotation: u8,
-    _padding: [5]u8,
-    mass: f64,
-    friction: f64,
-    elasticity: f64,
-    width: f64,
-    height: f64,
-};
-
 pub const PackedPluginEventStackingEvent = extern struct {
     eventId: u8, // 1 to enable stacking, 0 to disable.
     _padding: u8, // Padding for alignment.
@@ -403,6 +441,13 @@ pub const PackedSpriteAddEvent = extern struct {
     speedY: f64, // Initial Y speed.
 };
 
+pub const PackedSpriteBindHandleEvent = extern struct {
+    id1: i64, // Primary ID of the sprite.
+    id2: i64, // Secondary ID of the sprite.
+    handle: u32, // Handle to bind (reuses a released handle's slot).
+    _padding: u32, // Padding for alignment.
+};
+
 pub const PackedSpriteColorEvent = extern struct {
     id1: i64, // Primary ID of the sprite.
     id2: i64, // Secondary ID of the sprite.
@@ -421,6 +466,27 @@ pub const PackedSpriteMoveEvent = extern struct {
     positionZ: f64, // New Z position (depth).
 };
 
+pub const PackedSpriteMoveF32Event = extern struct {
+    id1: i64, // Primary ID of the sprite.
+    id2: i64, // Secondary ID of the sprite.
+    positionX: f32, // New X position.
+    positionY: f32, // New Y position.
+    positionZ: f32, // New Z position (depth).
+    _padding: u32, // Padding for alignment.
+};
+
+pub const PackedSpriteMoveHandleEvent = extern struct {
+    handle: u32, // Entity handle bound by SPRITE_BIND_HANDLE.
+    positionX: f32, // New X position.
+    positionY: f32, // New Y position.
+    positionZ: f32, // New Z position (depth).
+};
+
+pub const PackedSpriteReleaseHandleEvent = extern struct {
+    handle: u32, // Handle to release.
+    _padding: u32, // Padding for alignment.
+};
+
 pub const PackedSpriteRemoveEvent = extern struct {
     id1: i64, // Primary ID of sprite to remove.
     id2: i64, // Secondary ID of sprite to remove.
@@ -441,6 +507,22 @@ pub const PackedSpriteRotateEvent = extern struct {
     rotationZ: f64, // New Z rotation (in radians).
 };
 
+pub const PackedSpriteRotateF32Event = extern struct {
+    id1: i64, // Primary ID of the sprite.
+    id2: i64, // Secondary ID of the sprite.
+    rotationX: f32, // New X rotation (in radians).
+    rotationY: f32, // New Y rotation (in radians).
+    rotationZ: f32, // New Z rotation (in radians).
+    _padding: u32, // Padding for alignment.
+};
+
+pub const PackedSpriteRotateHandleEvent = extern struct {
+    handle: u32, // Entity handle bound by SPRITE_BIND_HANDLE.
+    rotationX: f32, // New X rotation (in radians).
+    rotationY: f32, // New Y rotation (in radians).
+    rotationZ: f32, // New Z rotation (in radians).
+};
+
 pub const PackedSpriteScaleEvent = extern struct {
     id1: i64, // Primary ID of the sprite.
     id2: i64, // Secondary ID of the sprite.
@@ -449,6 +531,22 @@ pub const PackedSpriteScaleEvent = extern struct {
     scaleZ: f64, // New Z scale.
 };
 
+pub const PackedSpriteScaleF32Event = extern struct {
+    id1: i64, // Primary ID of the sprite.
+    id2: i64, // Secondary ID of the sprite.
+    scaleX: f32, // New X scale.
+    scaleY: f32, // New Y scale.
+    scaleZ: f32, // New Z scale.
+    _padding: u32, // Padding for alignment.
+};
+
+pub const PackedSpriteScaleHandleEvent = extern struct {
+    handle: u32, // Entity handle bound by SPRITE_BIND_HANDLE.
+    scaleX: f32, // New X scale.
+    scaleY: f32, // New Y scale.
+    scaleZ: f32, // New Z scale.
+};
+
 pub const PackedSpriteSetSourceRectEvent = extern struct {
     id1: i64, // Primary ID of the sprite.
     id2: i64, // Secondary ID of the sprite.
@@ -465,6 +563,20 @@ pub const PackedSpriteSpeedEvent = extern struct {
     speedY: f64, // New Y speed.
 };
 
+pub const PackedSpriteSpeedF32Event = extern struct {
+    id1: i64, // Primary ID of the sprite.
+    id2: i64, // Secondary ID of the sprite.
+    speedX: f32, // New X speed.
+    speedY: f32, // New Y speed.
+};
+
+pub const PackedSpriteSpeedHandleEvent = extern struct {
+    handle: u32, // Entity handle bound by SPRITE_BIND_HANDLE.
+    speedX: f32, // New X speed.
+    speedY: f32, // New Y speed.
+    _padding: u32, // Padding for alignment.
+};
+
 pub const PackedSpriteTextureSetEvent = extern struct {
     id1: i64, // Primary ID of the sprite.
     id2: i64, // Secondary ID of the sprite.
@@ -529,6 +641,16 @@ pub const event_payload_list = [_]KVPair{
     .{ "spriteTextureLoad", @sizeOf(PackedTextureLoadHeaderEvent) },
     .{ "spriteTextureSet", @sizeOf(PackedSpriteTextureSetEvent) },
     .{ "spriteSetSourceRect", @sizeOf(PackedSpriteSetSourceRectEvent) },
+    .{ "spriteMoveF32", @sizeOf(PackedSpriteMoveF32Event) },
+    .{ "spriteScaleF32", @sizeOf(PackedSpriteScaleF32Event) },
+    .{ "spriteRotateF32", @sizeOf(PackedSpriteRotateF32Event) },
+    .{ "spriteSpeedF32", @sizeOf(PackedSpriteSpeedF32Event) },
+    .{ "spriteBindHandle", @sizeOf(PackedSpriteBindHandleEvent) },
+    .{ "spriteReleaseHandle", @sizeOf(PackedSpriteReleaseHandleEvent) },
+    .{ "spriteMoveHandle", @sizeOf(PackedSpriteMoveHandleEvent) },
+    .{ "spriteScaleHandle", @sizeOf(PackedSpriteScaleHandleEvent) },
+    .{ "spriteRotateHandle", @sizeOf(PackedSpriteRotateHandleEvent) },
+    .{ "spriteSpeedHandle", @sizeOf(PackedSpriteSpeedHandleEvent) },
     .{ "geomAddPoint", @sizeOf(PackedGeomAddPointEvent) },
     .{ "geomAddLine", @sizeOf(PackedGeomAddLineEvent) },
     .{ "geomAddRect", @sizeOf(PackedGeomAddRectEvent) },
@@ -572,6 +694,11 @@ pub const event_payload_list = [_]KVPair{
     .{ "physicsSetVelocity", @sizeOf(PackedPhysicsSetVelocityEvent) },
     .{ "physicsSetPosition", @sizeOf(PackedPhysicsSetPositionEvent) },
     .{ "physicsSetRotation", @sizeOf(PackedPhysicsSetRotationEvent) },
+    .{ "physicsBindHandle", @sizeOf(PackedPhysicsBindHandleEvent) },
+    .{ "physicsReleaseHandle", @sizeOf(PackedPhysicsReleaseHandleEvent) },
+    .{ "physicsSetVelocityHandle", @sizeOf(PackedPhysicsSetVelocityHandleEvent) },
+    .{ "physicsSetPositionHandle", @sizeOf(PackedPhysicsSetPositionHandleEvent) },
+    .{ "physicsSetRotationHandle", @sizeOf(PackedPhysicsSetRotationHandleEvent) },
     .{ "physicsCollisionBegin", @sizeOf(PackedPhysicsCollisionEvent) },
     .{ "physicsCollisionSeparate", @sizeOf(PackedPhysicsCollisionEvent) },
     .{ "physicsSyncTransform", @sizeOf(PackedPhysicsSyncTransformEvent) },
@@ -597,6 +724,9 @@ pub const event_payload_list = [_]KVPair{
     // Script Events
     .{ "scriptSubscribe", @sizeOf(PackedScriptSubscribeEvent) },
     .{ "scriptUnsubscribe", @sizeOf(PackedScriptUnsubscribeEvent) },
+
+    // Batch Events
+    .{ "eventBatch", @sizeOf(PackedEventBatchHeaderEvent) },
 };
 
 pub const event_payload_sizes = std.StaticStringMap(u32).initComptime(event_payload_list);
@@ -670,8 +800,7 @@ pub const CommandPacker = struct {
 
     pub fn packTextAdd(
         self: *CommandPacker,
-        id1: i64,
-        id2: i64,
+        id1: i64, id2: i64,
         pos: [3]f64,
         color: [4]u8,
         font_size: f32,
@@ -760,4 +889,4 @@ pub fn hexdump_util(writer: anytype, slice: []const u8) anyerror!void {
         }
         try writer.writeAll("|\n");
     }
-}
+}
\ No newline at end of file
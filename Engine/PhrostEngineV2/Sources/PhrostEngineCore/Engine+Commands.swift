@@ -101,25 +101,40 @@ extension PhrostEngine {
         // ALIGNMENT FIX: Skip 4 bytes padding (PHP packs "Vx4")
         offset += 4
 
+        // Payloads left in the current EVENT_BATCH (they have no event header)
+        var batchEventType: Events = .eventBatch
+        var batchRemaining: UInt32 = 0
+
         // --- Command Loop ---
-        for i in 0..<commandCount {
+        var i: UInt32 = 0
+        commandLoop: while i < commandCount || batchRemaining > 0 {
             let loopOffsetStart = offset
+            let eventType: Events
+
+            if batchRemaining > 0 {
+                // Next payload of the current batch
+                eventType = batchEventType
+                batchRemaining -= 1
+            } else {
+                // 2. Read Event Header
+                guard let eventTypeRaw = localUnpack(label: "EventType", as: UInt32.self),
+                    let timestamp = localUnpack(label: "Timestamp", as: UInt64.self)
+                else {
+                    print("Loop \(i)/\(commandCount): FAILED to read event header. Breaking loop.")
+                    break
+                }
 
-            // 2. Read Event Header
-            guard let eventTypeRaw = localUnpack(label: "EventType", as: UInt32.self),
-                let timestamp = localUnpack(label: "Timestamp", as: UInt64.self)
-            else {
-                print("Loop \(i)/\(commandCount): FAILED to read event header. Breaking loop.")
-                break
-            }
-
-            // ALIGNMENT FIX: Skip 4 bytes padding after Timestamp (PHP packs "VQx4")
-            offset += 4
+                // ALIGNMENT FIX: Skip 4 bytes padding after Timestamp (PHP packs "VQx4")
+                offset += 4
 
-            guard let eventType = Events(rawValue: eventTypeRaw) else {
-                print(
-                    "Loop \(i)/\(commandCount): Unknown event type \(eventTypeRaw). Breaking loop.")
-                break
+                guard let headerType = Events(rawValue: eventTypeRaw) else {
+                    print(
+                        "Loop \(i)/\(commandCount): Unknown event type \(eventTypeRaw). Breaking loop."
+                    )
+                    break
+                }
+                eventType = headerType
+                i += 1
             }
 
             guard let payloadSize = eventPayloadSizes[eventType.rawValue] else {
@@ -359,6 +374,102 @@ extension PhrostEngine {
                     SpriteID(id1: event.id1, id2: event.id2), (event.x, event.y, event.w, event.h))
                 generatedEventCount &+= 1
 
+            // --- SPRITE (compact f32 variants) ---
+            case .spriteMoveF32:
+                guard
+                    let event = localUnpack(label: "SpriteMoveF32", as: PackedSpriteMoveF32Event.self)
+                else { break }
+                spriteManager.moveSprite(
+                    SpriteID(id1: event.id1, id2: event.id2),
+                    (Double(event.positionX), Double(event.positionY), Double(event.positionZ)))
+                generatedEventCount &+= 1
+
+            case .spriteScaleF32:
+                guard
+                    let event = localUnpack(
+                        label: "SpriteScaleF32", as: PackedSpriteScaleF32Event.self)
+                else { break }
+                spriteManager.scaleSprite(
+                    SpriteID(id1: event.id1, id2: event.id2),
+                    (Double(event.scaleX), Double(event.scaleY), Double(event.scaleZ)))
+                generatedEventCount &+= 1
+
+            case .spriteRotateF32:
+                guard
+                    let event = localUnpack(
+                        label: "SpriteRotateF32", as: PackedSpriteRotateF32Event.self)
+                else { break }
+                spriteManager.rotateSprite(
+                    SpriteID(id1: event.id1, id2: event.id2),
+                    (Double(event.rotationX), Double(event.rotationY), Double(event.rotationZ)))
+                generatedEventCount &+= 1
+
+            case .spriteSpeedF32:
+                guard
+                    let event = localUnpack(
+                        label: "SpriteSpeedF32", as: PackedSpriteSpeedF32Event.self)
+                else { break }
+                spriteManager.speedSprite(
+                    SpriteID(id1: event.id1, id2: event.id2),
+                    (Double(event.speedX), Double(event.speedY)))
+                generatedEventCount &+= 1
+
+            // --- SPRITE (u32 handles) ---
+            case .spriteBindHandle:
+                guard
+                    let event = localUnpack(
+                        label: "SpriteBindHandle", as: PackedSpriteBindHandleEvent.self)
+                else { break }
+                spriteManager.bindHandle(event.handle, to: SpriteID(id1: event.id1, id2: event.id2))
+                generatedEventCount &+= 1
+
+            case .spriteReleaseHandle:
+                guard
+                    let event = localUnpack(
+                        label: "SpriteReleaseHandle", as: PackedSpriteReleaseHandleEvent.self)
+                else { break }
+                spriteManager.releaseHandle(event.handle)
+                generatedEventCount &+= 1
+
+            case .spriteMoveHandle:
+                guard
+                    let event = localUnpack(
+                        label: "SpriteMoveHandle", as: PackedSpriteMoveHandleEvent.self)
+                else { break }
+                spriteManager.moveSprite(
+                    handle: event.handle,
+                    (Double(event.positionX), Double(event.positionY), Double(event.positionZ)))
+                generatedEventCount &+= 1
+
+            case .spriteScaleHandle:
+                guard
+                    let event = localUnpack(
+                        label: "SpriteScaleHandle", as: PackedSpriteScaleHandleEvent.self)
+                else { break }
+                spriteManager.scaleSprite(
+                    handle: event.handle,
+                    (Double(event.scaleX), Double(event.scaleY), Double(event.scaleZ)))
+                generatedEventCount &+= 1
+
+            case .spriteRotateHandle:
+                guard
+                    let event = localUnpack(
+                        label: "SpriteRotateHandle", as: PackedSpriteRotateHandleEvent.self)
+                else { break }
+                spriteManager.rotateSprite(
+                    handle: event.handle,
+                    (Double(event.rotationX), Double(event.rotationY), Double(event.rotationZ)))
+                generatedEventCount &+= 1
+
+            case .spriteSpeedHandle:
+                guard
+                    let event = localUnpack(
+                        label: "SpriteSpeedHandle", as: PackedSpriteSpeedHandleEvent.self)
+                else { break }
+                spriteManager.speedSprite(
+                    handle: event.handle, (Double(event.speedX), Double(event.speedY)))
+                generatedEventCount &+= 1
+
             // --- GEOMETRY ---
             case .geomAddPoint:
                 guard
@@ -571,6 +682,52 @@ extension PhrostEngine {
                     angleInRadians: event.angleInRadians)
                 generatedEventCount &+= 1
 
+            case .physicsBindHandle:
+                guard
+                    let event = localUnpack(
+                        label: "PhysBindHandle", as: PackedPhysicsBindHandleEvent.self)
+                else { break }
+                physicsManager.bindHandle(
+                    event.handle, to: SpriteID(id1: event.id1, id2: event.id2))
+                generatedEventCount &+= 1
+
+            case .physicsReleaseHandle:
+                guard
+                    let event = localUnpack(
+                        label: "PhysReleaseHandle", as: PackedPhysicsReleaseHandleEvent.self)
+                else { break }
+                physicsManager.releaseHandle(event.handle)
+                generatedEventCount &+= 1
+
+            case .physicsSetVelocityHandle:
+                guard
+                    let event = localUnpack(
+                        label: "PhysSetVelHandle", as: PackedPhysicsSetVelocityHandleEvent.self)
+                else { break }
+                physicsManager.setVelocity(
+                    handle: event.handle,
+                    velocity: cpVect(x: event.velocityX, y: event.velocityY))
+                generatedEventCount &+= 1
+
+            case .physicsSetPositionHandle:
+                guard
+                    let event = localUnpack(
+                        label: "PhysSetPosHandle", as: PackedPhysicsSetPositionHandleEvent.self)
+                else { break }
+                physicsManager.setPosition(
+                    handle: event.handle,
+                    position: cpVect(x: event.positionX, y: event.positionY))
+                generatedEventCount &+= 1
+
+            case .physicsSetRotationHandle:
+                guard
+                    let event = localUnpack(
+                        label: "PhysSetRotHandle", as: PackedPhysicsSetRotationHandleEvent.self)
+                else { break }
+                physicsManager.setRotation(
+                    handle: event.handle, angleInRadians: event.angleInRadians)
+                generatedEventCount &+= 1
+
             case .physicsCollisionBegin, .physicsCollisionSeparate, .physicsSyncTransform:
                 // Feedback, skip payload
                 offset += payloadSize
@@ -689,6 +846,28 @@ extension PhrostEngine {
             // --- INPUT (Skip) ---
             case .inputKeyup, .inputKeydown, .inputMouseup, .inputMousedown, .inputMousemotion:
                 offset += payloadSize
+
+            // --- BATCH ---
+            // The next `count` payloads are all `eventType`, without headers.
+            // Only fixed-size events can be batched.
+            case .eventBatch:
+                guard
+                    let header = localUnpack(
+                        label: "EventBatch", as: PackedEventBatchHeaderEvent.self),
+                    let payloadType = Events(rawValue: header.eventType),
+                    eventPayloadSizes[payloadType.rawValue] != nil,
+                    ![
+                        .spriteTextureLoad, .textAdd, .textSetString, .pluginLoad, .audioLoad,
+                        .geomAddPacked, .eventBatch,
+                    ].contains(payloadType)
+                else {
+                    print(
+                        "Loop \(i)/\(commandCount): Invalid EVENT_BATCH at offset \(loopOffsetStart). Breaking loop."
+                    )
+                    break commandLoop
+                }
+                batchEventType = payloadType
+                batchRemaining = header.count
             }
 
             // ALIGNMENT FIX: Align offset to next 8-byte boundary
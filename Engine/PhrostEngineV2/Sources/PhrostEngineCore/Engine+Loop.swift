@@ -87,6 +87,15 @@ extension PhrostEngine {
                 let pLen = Int(header.pathLength)
                 let pPad = (8 - (pLen % 8)) % 8
                 offset += pLen + pPad
+            } else if event == .eventBatch {
+                // Header, then `count` headerless payloads padded to 8 bytes
+                offset += payloadSize
+                let header = data.withUnsafeBytes {
+                    $0.loadSafe(
+                        fromByteOffset: startOffset + 16, as: PackedEventBatchHeaderEvent.self)
+                }
+                let itemSize = eventPayloadSizes[header.eventType] ?? 0
+                offset += Int(header.count) * ((itemSize + 7) & ~7)
             } else {
                 offset += payloadSize
             }
@@ -109,6 +109,16 @@ public final class PhrostEngine {
         Events.spriteTextureLoad.rawValue: MemoryLayout<PackedTextureLoadHeaderEvent>.size,
         Events.spriteTextureSet.rawValue: MemoryLayout<PackedSpriteTextureSetEvent>.size,
         Events.spriteSetSourceRect.rawValue: MemoryLayout<PackedSpriteSetSourceRectEvent>.size,
+        Events.spriteMoveF32.rawValue: MemoryLayout<PackedSpriteMoveF32Event>.size,
+        Events.spriteScaleF32.rawValue: MemoryLayout<PackedSpriteScaleF32Event>.size,
+        Events.spriteRotateF32.rawValue: MemoryLayout<PackedSpriteRotateF32Event>.size,
+        Events.spriteSpeedF32.rawValue: MemoryLayout<PackedSpriteSpeedF32Event>.size,
+        Events.spriteBindHandle.rawValue: MemoryLayout<PackedSpriteBindHandleEvent>.size,
+        Events.spriteReleaseHandle.rawValue: MemoryLayout<PackedSpriteReleaseHandleEvent>.size,
+        Events.spriteMoveHandle.rawValue: MemoryLayout<PackedSpriteMoveHandleEvent>.size,
+        Events.spriteScaleHandle.rawValue: MemoryLayout<PackedSpriteScaleHandleEvent>.size,
+        Events.spriteRotateHandle.rawValue: MemoryLayout<PackedSpriteRotateHandleEvent>.size,
+        Events.spriteSpeedHandle.rawValue: MemoryLayout<PackedSpriteSpeedHandleEvent>.size,
         // --- GEOMETRY ---
         Events.geomAddPoint.rawValue: MemoryLayout<PackedGeomAddPointEvent>.size,
         Events.geomAddLine.rawValue: MemoryLayout<PackedGeomAddLineEvent>.size,
@@ -148,6 +158,14 @@ public final class PhrostEngine {
         Events.physicsSetVelocity.rawValue: MemoryLayout<PackedPhysicsSetVelocityEvent>.size,
         Events.physicsSetPosition.rawValue: MemoryLayout<PackedPhysicsSetPositionEvent>.size,
         Events.physicsSetRotation.rawValue: MemoryLayout<PackedPhysicsSetRotationEvent>.size,
+        Events.physicsBindHandle.rawValue: MemoryLayout<PackedPhysicsBindHandleEvent>.size,
+        Events.physicsReleaseHandle.rawValue: MemoryLayout<PackedPhysicsReleaseHandleEvent>.size,
+        Events.physicsSetVelocityHandle.rawValue:
+            MemoryLayout<PackedPhysicsSetVelocityHandleEvent>.size,
+        Events.physicsSetPositionHandle.rawValue:
+            MemoryLayout<PackedPhysicsSetPositionHandleEvent>.size,
+        Events.physicsSetRotationHandle.rawValue:
+            MemoryLayout<PackedPhysicsSetRotationHandleEvent>.size,
         Events.physicsCollisionBegin.rawValue: MemoryLayout<PackedPhysicsCollisionEvent>.size,
         Events.physicsCollisionSeparate.rawValue: MemoryLayout<PackedPhysicsCollisionEvent>.size,
         Events.physicsSyncTransform.rawValue: MemoryLayout<PackedPhysicsSyncTransformEvent>.size,
@@ -170,6 +188,8 @@ public final class PhrostEngine {
         // --- SCRIPT ---
         Events.scriptSubscribe.rawValue: MemoryLayout<PackedScriptSubscribeEvent>.size,
         Events.scriptUnsubscribe.rawValue: MemoryLayout<PackedScriptUnsubscribeEvent>.size,
+        // --- BATCH ---
+        Events.eventBatch.rawValue: MemoryLayout<PackedEventBatchHeaderEvent>.size,
     ]
 
     // MARK: Initialization
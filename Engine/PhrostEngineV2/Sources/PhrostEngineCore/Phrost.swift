@@ -108,6 +108,8 @@ public final class Sprite: @unchecked Sendable {
     public var text: String?
     public var font: OpaquePointer?
     public var sourceRect: SDL_FRect? = nil
+    // Handle bound by SPRITE_BIND_HANDLE, if any
+    public var handle: UInt32? = nil
 
     init(
         id: SpriteID,
@@ -142,6 +144,10 @@ public final class SpriteManager: @unchecked Sendable {
     private var sprites: [SpriteID: Sprite] = [:]
     private var isSortNeeded = false
     private var renderList: [Sprite] = []
+    // Dense u32 handles (SPRITE_BIND_HANDLE), resolved by array index
+    private var handles: [Sprite?] = []
+    // Upper bound on a handle, so one bad event cannot grow the table unbounded
+    static let maxHandles = 1 << 20
 
     public init() {}
 
@@ -149,6 +155,7 @@ public final class SpriteManager: @unchecked Sendable {
         let spriteID = SpriteID(id1: spriteEvent.id1, id2: spriteEvent.id2)
 
         // --- Prevent Duplicates in RenderList ---
+        let previousHandle = sprites[spriteID]?.handle
         if sprites[spriteID] != nil {
             // If the sprite ID already exists, remove the OLD instance from the render list
             // so we don't draw it twice.
@@ -172,10 +179,18 @@ public final class SpriteManager: @unchecked Sendable {
         sprites[spriteID] = newSprite
         renderList.append(newSprite)
         isSortNeeded = true
+
+        // A re-added sprite keeps its handle
+        if let handle = previousHandle {
+            bindHandle(handle, to: spriteID)
+        }
     }
 
     public func removeSprite(id: SpriteID) {
-        if sprites.removeValue(forKey: id) != nil {
+        if let sprite = sprites.removeValue(forKey: id) {
+            if let handle = sprite.handle {
+                handles[Int(handle)] = nil
+            }
             renderList.removeAll(where: { $0.id == id })
             isSortNeeded = true
         } else {
@@ -187,6 +202,7 @@ public final class SpriteManager: @unchecked Sendable {
 
     func addRawSprite(_ sprite: Sprite) {
         // --- Prevent Duplicates in RenderList ---
+        let previousHandle = sprites[sprite.id]?.handle
         if sprites[sprite.id] != nil {
             renderList.removeAll(where: { $0.id == sprite.id })
         }
@@ -194,6 +210,46 @@ public final class SpriteManager: @unchecked Sendable {
         sprites[sprite.id] = sprite
         renderList.append(sprite)
         isSortNeeded = true
+
+        if let handle = previousHandle {
+            bindHandle(handle, to: sprite.id)
+        }
+    }
+
+    func bindHandle(_ handle: UInt32, to id: SpriteID) {
+        let index = Int(handle)
+        guard index < SpriteManager.maxHandles else {
+            print("SpriteManager Error: Handle \(handle) exceeds the handle table limit")
+            return
+        }
+        guard let sprite = sprites[id] else {
+            print(
+                "SpriteManager Error: Attempted to bind handle \(handle) to unknown sprite ID (\(id.id1), \(id.id2))"
+            )
+            return
+        }
+        if index >= handles.count {
+            handles.append(contentsOf: repeatElement(nil, count: index + 1 - handles.count))
+        }
+        if let old = sprite.handle, old != handle {
+            handles[Int(old)] = nil
+        }
+        handles[index]?.handle = nil
+        handles[index] = sprite
+        sprite.handle = handle
+    }
+
+    func releaseHandle(_ handle: UInt32) {
+        let index = Int(handle)
+        guard index < handles.count, let sprite = handles[index] else { return }
+        sprite.handle = nil
+        handles[index] = nil
+    }
+
+    @inline(__always)
+    func sprite(forHandle handle: UInt32) -> Sprite? {
+        let index = Int(handle)
+        return index < handles.count ? handles[index] : nil
     }
 
     func getSprite(for id: SpriteID) -> Sprite? {
@@ -202,13 +258,23 @@ public final class SpriteManager: @unchecked Sendable {
 
     func moveSprite(_ id: SpriteID, _ position: (Double, Double, Double)) {
         if let sprite = sprites[id] {
-            if sprite.position.z != position.2 {
-                isSortNeeded = true
-            }
-            sprite.position = Vec3(position.0, position.1, position.2)
+            move(sprite, position)
+        }
+    }
+
+    func moveSprite(handle: UInt32, _ position: (Double, Double, Double)) {
+        if let sprite = sprite(forHandle: handle) {
+            move(sprite, position)
         }
     }
 
+    private func move(_ sprite: Sprite, _ position: (Double, Double, Double)) {
+        if sprite.position.z != position.2 {
+            isSortNeeded = true
+        }
+        sprite.position = Vec3(position.0, position.1, position.2)
+    }
+
     func scaleSprite(_ id: SpriteID, _ scale: (Double, Double, Double)) {
         sprites[id]?.scale = Vec3(scale.0, scale.1, scale.2)
     }
@@ -229,6 +295,18 @@ public final class SpriteManager: @unchecked Sendable {
         sprites[id]?.speed = Vec2(speed.0, speed.1)
     }
 
+    func scaleSprite(handle: UInt32, _ scale: (Double, Double, Double)) {
+        sprite(forHandle: handle)?.scale = Vec3(scale.0, scale.1, scale.2)
+    }
+
+    func rotateSprite(handle: UInt32, _ rotate: (Double, Double, Double)) {
+        sprite(forHandle: handle)?.rotate = Vec3(rotate.0, rotate.1, rotate.2)
+    }
+
+    func speedSprite(handle: UInt32, _ speed: (Double, Double)) {
+        sprite(forHandle: handle)?.speed = Vec2(speed.0, speed.1)
+    }
+
     func getSpritesForRendering() -> [Sprite] {
         if isSortNeeded {
             renderList.sort(by: { $0.position.z < $1.position.z })
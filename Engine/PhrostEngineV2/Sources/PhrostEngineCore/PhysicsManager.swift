@@ -21,6 +21,11 @@ public final class PhysicsManager: @unchecked Sendable {
             link: PhysicsDataLink
         )] = [:]
 
+    // Dense u32 handles (PHYSICS_BIND_HANDLE), resolved by array index
+    private var bodyHandles: [(id: SpriteID, body: UnsafeMutablePointer<cpBody>)?] = []
+    // Only consulted on bind/remove, never per command
+    private var handleOfBody: [SpriteID: UInt32] = [:]
+
     private let eventsLock = NSLock()
     private var generatedEventData = Data()
     private var generatedEventCount: UInt32 = 0
@@ -225,6 +230,10 @@ public final class PhysicsManager: @unchecked Sendable {
     public func removeBody(id: SpriteID) {
         guard let link = physicsLinks.removeValue(forKey: id) else { return }
 
+        if let handle = handleOfBody.removeValue(forKey: id) {
+            bodyHandles[Int(handle)] = nil
+        }
+
         cpSpaceRemoveShape(OpaquePointer(space), OpaquePointer(link.shape))
         cpSpaceRemoveBody(OpaquePointer(space), OpaquePointer(link.body))
 
@@ -259,6 +268,58 @@ public final class PhysicsManager: @unchecked Sendable {
         cpBodySetAngle(OpaquePointer(link.body), angleInRadians)
     }
 
+    public func bindHandle(_ handle: UInt32, to id: SpriteID) {
+        let index = Int(handle)
+        guard index < SpriteManager.maxHandles else {
+            print("Physics Error: Handle \(handle) exceeds the handle table limit")
+            return
+        }
+        guard let link = physicsLinks[id] else {
+            print("Physics Error: Attempted to bind handle \(handle) to unknown body \(id)")
+            return
+        }
+        if index >= bodyHandles.count {
+            bodyHandles.append(contentsOf: repeatElement(nil, count: index + 1 - bodyHandles.count))
+        }
+        if let old = handleOfBody[id], old != handle {
+            bodyHandles[Int(old)] = nil
+        }
+        if let owner = bodyHandles[index]?.id, owner != id {
+            handleOfBody.removeValue(forKey: owner)
+        }
+        bodyHandles[index] = (id, link.body)
+        handleOfBody[id] = handle
+    }
+
+    public func releaseHandle(_ handle: UInt32) {
+        let index = Int(handle)
+        guard index < bodyHandles.count, let entry = bodyHandles[index] else { return }
+        bodyHandles[index] = nil
+        handleOfBody.removeValue(forKey: entry.id)
+    }
+
+    @inline(__always)
+    private func body(forHandle handle: UInt32) -> UnsafeMutablePointer<cpBody>? {
+        let index = Int(handle)
+        return index < bodyHandles.count ? bodyHandles[index]?.body : nil
+    }
+
+    public func setVelocity(handle: UInt32, velocity: cpVect) {
+        guard let body = body(forHandle: handle) else { return }
+        cpBodySetVelocity(OpaquePointer(body), velocity)
+    }
+
+    public func setPosition(handle: UInt32, position: cpVect) {
+        guard let body = body(forHandle: handle) else { return }
+        cpBodySetPosition(OpaquePointer(body), position)
+        cpSpaceReindexShapesForBody(OpaquePointer(space), OpaquePointer(body))
+    }
+
+    public func setRotation(handle: UInt32, angleInRadians: Double) {
+        guard let body = body(forHandle: handle) else { return }
+        cpBodySetAngle(OpaquePointer(body), angleInRadians)
+    }
+
     private func setupCollisionHandlers() {
         guard let handlerOpaque = cpSpaceAddDefaultCollisionHandler(OpaquePointer(space)) else {
             print("Physics Error: Failed to add default collision handler.")
@@ -78,6 +78,11 @@ import Foundation
     public var _unused: UInt8
 }
 
+@frozen public struct PackedEventBatchHeaderEvent: Sendable {
+    public var eventType: UInt32
+    public var count: UInt32
+}
+
 @frozen public struct PackedGeomAddLineEvent: Sendable {
     public var id1: Int64
     public var id2: Int64
@@ -206,6 +211,13 @@ import Foundation
     public var impulseY: Double
 }
 
+@frozen public struct PackedPhysicsBindHandleEvent: Sendable {
+    public var id1: Int64
+    public var id2: Int64
+    public var handle: UInt32
+    public var _padding: UInt32
+}
+
 @frozen public struct PackedPhysicsCollisionEvent: Sendable {
     public var id1_A: Int64
     public var id2_A: Int64
@@ -213,6 +225,11 @@ import Foundation
     public var id2_B: Int64
 }
 
+@frozen public struct PackedPhysicsReleaseHandleEvent: Sendable {
+    public var handle: UInt32
+    public var _padding: UInt32
+}
+
 @frozen public struct PackedPhysicsRemoveBodyEvent: Sendable {
     public var id1: Int64
     public var id2: Int64
@@ -225,12 +242,25 @@ import Foundation
     public var positionY: Double
 }
 
+@frozen public struct PackedPhysicsSetPositionHandleEvent: Sendable {
+    public var handle: UInt32
+    public var _padding: UInt32
+    public var positionX: Double
+    public var positionY: Double
+}
+
 @frozen public struct PackedPhysicsSetRotationEvent: Sendable {
     public var id1: Int64
     public var id2: Int64
     public var angleInRadians: Double
 }
 
+@frozen public struct PackedPhysicsSetRotationHandleEvent: Sendable {
+    public var handle: UInt32
+    public var _padding: UInt32
+    public var angleInRadians: Double
+}
+
 @frozen public struct PackedPhysicsSetVelocityEvent: Sendable {
     public var id1: Int64
     public var id2: Int64
@@ -238,6 +268,13 @@ import Foundation
     public var velocityY: Double
 }
 
+@frozen public struct PackedPhysicsSetVelocityHandleEvent: Sendable {
+    public var handle: UInt32
+    public var _padding: UInt32
+    public var velocityX: Double
+    public var velocityY: Double
+}
+
 @frozen public struct PackedPhysicsSyncTransformEvent: Sendable {
     public var id1: Int64
     public var id2: Int64
@@ -323,6 +360,13 @@ import Foundation
     public var speedY: Double
 }
 
+@frozen public struct PackedSpriteBindHandleEvent: Sendable {
+    public var id1: Int64
+    public var id2: Int64
+    public var handle: UInt32
+    public var _padding: UInt32
+}
+
 @frozen public struct PackedSpriteColorEvent: Sendable {
     public var id1: Int64
     public var id2: Int64
@@ -341,6 +385,27 @@ import Foundation
     public var positionZ: Double
 }
 
+@frozen public struct PackedSpriteMoveF32Event: Sendable {
+    public var id1: Int64
+    public var id2: Int64
+    public var positionX: Float
+    public var positionY: Float
+    public var positionZ: Float
+    public var _padding: UInt32
+}
+
+@frozen public struct PackedSpriteMoveHandleEvent: Sendable {
+    public var handle: UInt32
+    public var positionX: Float
+    public var positionY: Float
+    public var positionZ: Float
+}
+
+@frozen public struct PackedSpriteReleaseHandleEvent: Sendable {
+    public var handle: UInt32
+    public var _padding: UInt32
+}
+
 @frozen public struct PackedSpriteRemoveEvent: Sendable {
     public var id1: Int64
     public var id2: Int64
@@ -361,6 +426,22 @@ import Foundation
     public var rotationZ: Double
 }
 
+@frozen public struct PackedSpriteRotateF32Event: Sendable {
+    public var id1: Int64
+    public var id2: Int64
+    public var rotationX: Float
+    public var rotationY: Float
+    public var rotationZ: Float
+    public var _padding: UInt32
+}
+
+@frozen public struct PackedSpriteRotateHandleEvent: Sendable {
+    public var handle: UInt32
+    public var rotationX: Float
+    public var rotationY: Float
+    public var rotationZ: Float
+}
+
 @frozen public struct PackedSpriteScaleEvent: Sendable {
     public var id1: Int64
     public var id2: Int64
@@ -369,6 +450,22 @@ import Foundation
     public var scaleZ: Double
 }
 
+@frozen public struct PackedSpriteScaleF32Event: Sendable {
+    public var id1: Int64
+    public var id2: Int64
+    public var scaleX: Float
+    public var scaleY: Float
+    public var scaleZ: Float
+    public var _padding: UInt32
+}
+
+@frozen public struct PackedSpriteScaleHandleEvent: Sendable {
+    public var handle: UInt32
+    public var scaleX: Float
+    public var scaleY: Float
+    public var scaleZ: Float
+}
+
 @frozen public struct PackedSpriteSetSourceRectEvent: Sendable {
     public var id1: Int64
     public var id2: Int64
@@ -385,6 +482,20 @@ import Foundation
     public var speedY: Double
 }
 
+@frozen public struct PackedSpriteSpeedF32Event: Sendable {
+    public var id1: Int64
+    public var id2: Int64
+    public var speedX: Float
+    public var speedY: Float
+}
+
+@frozen public struct PackedSpriteSpeedHandleEvent: Sendable {
+    public var handle: UInt32
+    public var speedX: Float
+    public var speedY: Float
+    public var _padding: UInt32
+}
+
 @frozen public struct PackedSpriteTextureSetEvent: Sendable {
     public var id1: Int64
     public var id2: Int64
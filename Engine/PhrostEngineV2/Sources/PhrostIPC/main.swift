@@ -33,6 +33,39 @@ let DEFAULT_PIPE_NAME = "\\\\.\\pipe\\PhrostEngine"  // Windows Named Pipe
 let DEFAULT_UNIX_SOCKET = "/tmp/PhrostEngine.socket"  // Fallback for pipes on macOS/Linux
 let DEFAULT_TCP_PORT: UInt16 = 8080
 
+// --- Handshake ---
+// A client may answer the first event frame with a "hello" before its real
+// commands. The hello is shaped like a command frame with zero channels, so
+// an engine that predates the handshake simply treats it as an empty frame:
+//   [u32 channelCount = 0][4 pad][u64 magic][u32 version][u32 capabilities][u64 schemaHash]
+// We answer with a "welcome" shaped like an event frame, with the magic in
+// place of the delta-time, then read the real commands:
+//   [u32 len = 24][u64 magic][u32 version][u32 capabilities][u64 schemaHash]
+let HANDSHAKE_MAGIC: UInt64 = 0x454B_4148_5352_4850  // "PHRSHAKE"
+let HANDSHAKE_VERSION: UInt32 = 1
+let HANDSHAKE_HELLO_SIZE = 32
+
+/// Optional wire features. The welcome carries the ones both sides support.
+struct WireCapabilities: OptionSet {
+    let rawValue: UInt32
+
+    static let batch = WireCapabilities(rawValue: 1 << 0)  // EVENT_BATCH containers
+    static let f32 = WireCapabilities(rawValue: 1 << 1)  // SPRITE_*_F32 events
+    static let handles = WireCapabilities(rawValue: 1 << 2)  // u32 entity handle events
+    // Frames in mmap'd /dev/shm/phrost-<name>.{events,commands}, with a
+    // random name sent after the welcome. The socket carries only
+    // [u32 0xFFFFFFFF][...][u32 slot][u32 length] notices.
+    // Not supported here yet; Runtime/python/Phrost/StandInEngine.py serves it.
+    static let sharedMemory = WireCapabilities(rawValue: 1 << 3)
+    // Frames whose length has bit 31 set carry [u32 codec][u32 raw length]
+    // and compressed bytes (codec 1 = zlib). Not supported here yet either.
+    static let compression = WireCapabilities(rawValue: 1 << 4)
+
+    // The handle events are generated and dispatched, but not yet built and
+    // run against a client end to end, so the engine doesn't offer them.
+    static let supported: WireCapabilities = [.batch, .f32]
+}
+
 // --- Unified Connection Abstraction ---
 // This allows us to use the same loop for Pipes (HANDLE/FD) and Sockets (SOCKET/FD)
 enum ConnectionHandle {
@@ -176,6 +209,9 @@ final class IPCServer: @unchecked Sendable {
     // Current Active Client
     private var activeClient: ConnectionHandle?
 
+    // Wire features agreed with the current client (empty until it says hello)
+    private(set) var capabilities: WireCapabilities = []
+
     init(mode: Mode) {
         self.mode = mode
     }
@@ -362,6 +398,7 @@ final class IPCServer: @unchecked Sendable {
 
             stateLock.lock()
             self.activeClient = client
+            self.capabilities = []
             _state = .connected
             stateLock.unlock()
 
@@ -414,14 +451,12 @@ final class IPCServer: @unchecked Sendable {
             // Send
             if !rawWrite(handle: client, data: payload) { break }
 
-            // Read Header (4 bytes len)
-            guard let header = rawRead(handle: client, bytesToRead: 4) else { break }
-            let cmdLen = header.withUnsafeBytes { $0.load(as: UInt32.self) }
-
-            var cmdData = Data()
-            if cmdLen > 0 {
-                guard let body = rawRead(handle: client, bytesToRead: Int(cmdLen)) else { break }
-                cmdData = body
+            // Read the reply, answering a handshake first if the client opens with one
+            guard var cmdData = readCommandFrame(client: client) else { break }
+            if let welcome = answerHandshake(cmdData) {
+                if !rawWrite(handle: client, data: welcome) { break }
+                guard let reply = readCommandFrame(client: client) else { break }
+                cmdData = reply
             }
 
             // Return to Main Thread
@@ -438,6 +473,57 @@ final class IPCServer: @unchecked Sendable {
         frameCondition.unlock()
     }
 
+    private func readCommandFrame(client: ConnectionHandle) -> Data? {
+        // Read Header (4 bytes len)
+        guard let header = rawRead(handle: client, bytesToRead: 4) else { return nil }
+        let cmdLen = header.withUnsafeBytes { $0.loadUnaligned(as: UInt32.self) }
+
+        if cmdLen == 0 { return Data() }
+        return rawRead(handle: client, bytesToRead: Int(cmdLen))
+    }
+
+    /// Returns the welcome frame if `data` is a hello, or nil for ordinary commands.
+    private func answerHandshake(_ data: Data) -> Data? {
+        guard data.count >= HANDSHAKE_HELLO_SIZE else { return nil }
+
+        let (channelCount, magic, version, offered, schemaHash) = data.withUnsafeBytes {
+            (
+                $0.loadUnaligned(fromByteOffset: 0, as: UInt32.self),
+                $0.loadUnaligned(fromByteOffset: 8, as: UInt64.self),
+                $0.loadUnaligned(fromByteOffset: 16, as: UInt32.self),
+                $0.loadUnaligned(fromByteOffset: 20, as: UInt32.self),
+                $0.loadUnaligned(fromByteOffset: 24, as: UInt64.self)
+            )
+        }
+        guard channelCount == 0 && magic == HANDSHAKE_MAGIC else { return nil }
+
+        // Only enable extras when both sides agree on the layout of every event
+        var agreed: WireCapabilities = []
+        if version == HANDSHAKE_VERSION && schemaHash == PHROST_SCHEMA_HASH {
+            agreed = WireCapabilities(rawValue: offered).intersection(.supported)
+        } else {
+            let clientSchema = String(schemaHash, radix: 16)
+            print(
+                "[IPC] Handshake mismatch (version \(version), schema 0x\(clientSchema)). "
+                    + "Using the base wire format.")
+        }
+        self.capabilities = agreed
+        print("[IPC] Handshake complete. Capabilities: 0x\(String(agreed.rawValue, radix: 16))")
+
+        var welcome = Data()
+        var len: UInt32 = 24
+        var magicBytes = HANDSHAKE_MAGIC
+        var versionBytes = HANDSHAKE_VERSION
+        var capsBytes = agreed.rawValue
+        var hashBytes = PHROST_SCHEMA_HASH
+        welcome.append(Data(bytes: &len, count: 4))
+        welcome.append(Data(bytes: &magicBytes, count: 8))
+        welcome.append(Data(bytes: &versionBytes, count: 4))
+        welcome.append(Data(bytes: &capsBytes, count: 4))
+        welcome.append(Data(bytes: &hashBytes, count: 8))
+        return welcome
+    }
+
     // --- Platform Specific Setup ---
 
     private func setupListener() -> Bool {
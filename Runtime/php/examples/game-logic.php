@@ -17,6 +17,7 @@ use Phrost\Sprite;
 use Phrost\Text;
 use Phrost\Window;
 use Phrost\ChannelPacker;
+use Phrost\Channels;
 use Phrost\LiveReload;
 use Phrost\Events;
 
@@ -289,6 +290,7 @@ function Phrost_Update(int $elapsed, float $dt, string $eventsBlob = ""): string
                     };
                     $path = realpath(__DIR__ . "/" . $libExtension);
                     $packer->add(Phrost\Events::PLUGIN_LOAD, [
+                        Channels::RENDERER->value,
                         strlen($path),
                         $path,
                     ]);
@@ -315,6 +317,7 @@ function Phrost_Update(int $elapsed, float $dt, string $eventsBlob = ""): string
                     echo "Error: Could not find Rust plugin.\n";
                 } else {
                     $packer->add(Phrost\Events::PLUGIN_LOAD, [
+                        Channels::RENDERER->value,
                         strlen($path),
                         $path,
                     ]);
@@ -61,17 +61,10 @@ class CommandPacker
             // String must be aligned
             $this->eventStream .= $this->packStringAligned($data[3]);
         } elseif ($type === Events::PLUGIN_LOAD) {
-            $packedFixedPart = pack("V", $data[0]); // 4 bytes
+            // data = [channelNo, pathLength, path]. Fixed part is 8 bytes.
+            $packedFixedPart = pack("VV", $data[0], $data[1]);
             $this->eventStream .= $packedFixedPart;
-            // Pad the gap between fixed (4) and string?
-            // No, packStringAligned handles its own tail padding,
-            // but we need the START of the string to be aligned relative to struct?
-            // Ideally, the struct before it should end on boundary.
-            // V (4) is not 8-aligned.
-            // Let's pad the fixed part to 8 bytes first.
-            $this->eventStream .= str_repeat("\0", 4);
-
-            $this->eventStream .= $this->packStringAligned($data[1]);
+            $this->eventStream .= $this->packStringAligned($data[2]);
         } elseif ($type === Events::AUDIO_LOAD) {
             // Fixed part: Length(4) + Padding(4) = 8 bytes
             // This remains correct, but Swift needs to skip the 'x4'.
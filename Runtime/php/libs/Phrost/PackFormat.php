@@ -169,10 +169,8 @@ class PackFormat
                         break;
                     }
                 }
-                $count =
-                    $repeater === "" || !ctype_digit($repeater)
-                        ? 1
-                        : (int) $repeater;
+                // The pattern above leaves only digits (or nothing) here
+                $count = $repeater === "" ? 1 : (int) $repeater;
                 $size = $sizeMap[$code] ?? 0;
                 $totalSize += $count * $size;
             }
@@ -1,13 +1,9 @@
 import enum
 from typing import Dict, Optional
 
-# Imports from your existing adapter file
-try:
-    from Phrost import CommandPacker, Events
-except ImportError:
-    print(
-        "Could not import CommandPacker/Events. Please ensure Phrost.py is in the same directory."
-    )
+from ChannelPacker import ChannelPacker
+from Channels import Channels
+from StringCache import encode_padded
 
 
 class Audio:
@@ -126,26 +122,27 @@ class Audio:
 
     # --- Packing and Global Controls ---
 
-    def pack_dirty_events(self, packer: CommandPacker, clear: bool = True) -> None:
+    def pack_dirty_events(self, packer: ChannelPacker, clear: bool = True) -> None:
         """
         Checks all dirty flags and adds the corresponding events
-        to the CommandPacker.
+        to the RENDERER channel of the ChannelPacker.
         """
         if not self.dirty_flags:
             return  # Nothing to do
 
+        renderer = packer.channel(Channels.RENDERER)
+
         # Handle Unload first, as it invalidates all other commands
         if "unload" in self.dirty_flags:
-            packer.add(Events.AUDIO_UNLOAD, [self.audio_id])
+            renderer.audio_unload(self.audio_id)
             if clear:
                 self.clear_dirty_flags()
             return  # Don't pack any other commands
 
         # Handle Load (only if not loaded)
         if "load" in self.dirty_flags:
-            path_bytes = self.path.encode("utf-8")
-            path_length = len(path_bytes)
-            packer.add(Events.AUDIO_LOAD, [path_length, path_bytes])
+            path, length = encode_padded(self.path)
+            renderer.audio_load(path, pathLength=length)
 
         # Other commands only apply if the audio is loaded
         if not self.is_loaded:
@@ -156,15 +153,15 @@ class Audio:
 
         # Handle play/pause/stop (mutually exclusive)
         if "stop" in self.dirty_flags:
-            packer.add(Events.AUDIO_STOP, [self.audio_id])
+            renderer.audio_stop(self.audio_id)
         elif "pause" in self.dirty_flags:
-            packer.add(Events.AUDIO_PAUSE, [self.audio_id])
+            renderer.audio_pause(self.audio_id)
         elif "play" in self.dirty_flags:
-            packer.add(Events.AUDIO_PLAY, [self.audio_id])
+            renderer.audio_play(self.audio_id)
 
         # Handle volume
         if "volume" in self.dirty_flags:
-            packer.add(Events.AUDIO_SET_VOLUME, [self.audio_id, self.volume])
+            renderer.audio_set_volume(self.audio_id, self.volume)
 
         if clear:
             self.clear_dirty_flags()
@@ -175,14 +172,14 @@ class Audio:
     # --- Static methods for global audio controls (Immediate Mode) ---
 
     @staticmethod
-    def stopAll(packer: CommandPacker) -> None:
+    def stopAll(packer: ChannelPacker) -> None:
         """Stops all currently playing audio."""
-        packer.add(Events.AUDIO_STOP_ALL, [])
+        packer.channel(Channels.RENDERER).audio_stop_all()
 
     @staticmethod
-    def set_master_volume(packer: CommandPacker, volume: float) -> None:
+    def set_master_volume(packer: ChannelPacker, volume: float) -> None:
         """
         Sets the master volume for all audio.
         :param volume: (e.g., 0.0 to 1.0)
         """
-        packer.add(Events.AUDIO_SET_MASTER_VOLUME, [volume])
+        packer.channel(Channels.RENDERER).audio_set_master_volume(volume)
@@ -1,69 +1,9 @@
 import struct
-from enum import IntEnum
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
+from CommandPacker import CommandPacker
 from Events import Events
-
-
-class CommandPacker:
-    """
-    A stub implementation of CommandPacker, based on its implied
-    interface in ChannelPacker.
-
-    A real CommandPacker would pack individual events into a binary format.
-    This stub just tracks event count and returns a simple blob.
-    """
-
-    def __init__(self, chunk_size: int):
-        # chunk_size is 0 in the ChannelPacker, implying buffering is disabled.
-        self.chunk_size = chunk_size
-        self.events: List[tuple[Events, List[Any]]] = []
-
-    def add(self, event_type: Events, data: List[Any]):
-        """Adds an event to be packed."""
-        # A real implementation would pack this into an internal buffer.
-        self.events.append((event_type, data))
-
-    def finalize(self) -> bytes:
-        """
-        Finalizes the packet.
-
-        The PHP code implies this returns a complete binary blob for one channel,
-        which starts with its own event count.
-        """
-        event_count = len(self.events)
-
-        # Create a dummy blob: [Event Count (u32)] + [dummy data]
-        # A real implementation would serialize all events from self.events.
-        # We use '<I' for unsigned 32-bit little-endian, same as PHP's 'V'.
-        dummy_event_data = b"EVENT_STUB" * event_count
-        output = struct.pack("<I", event_count) + dummy_event_data
-
-        # Clear events for reuse
-        self.events = []
-        return output
-
-    def get_total_event_count(self) -> int:
-        """Gets the total number of buffered events."""
-        return len(self.events)
-
-
-# --- End of Stubbed Dependencies ---
-
-
-# --- Main Translation from ChannelPacker.php ---
-
-
-class Channels(IntEnum):
-    """Equivalent to the 'Channels' enum in PHP."""
-
-    RENDERER = 0
-    INPUT = 1
-    PHYSICS = 2
-    AUDIO = 3
-    GUI = 4
-    WINDOW = 5
-    SCRIPT = 6
+from HandleAllocator import HandleAllocator
 
 
 class ChannelPacker:
@@ -71,86 +11,163 @@ class ChannelPacker:
     Manages packing events into multiple "channels".
 
     This class contains multiple CommandPacker instances, one for each channel.
-    When finalized, it produces a single binary blob structured as:
+    When finalized, it produces a single binary blob structured as
+    (see Docs/BinaryPackFormat.md):
 
-    1. Channel Count (u32)
+    1. Channel Count (u32) + 4 bytes padding
     2. Index Table   [Channel ID (u32), Channel Size (u32)] * N
     3. Data Blobs    [Channel 0 Data]...[Channel N Data]
 
     Each "Channel Data" blob is the complete output from a single CommandPacker
-    (i.e., it starts with its own internal event count).
+    (i.e., it starts with its own internal event count). The engine runs the
+    RENDERER and PHYSICS channels itself; other channels go to plugins.
+
+    Use channel() to get a channel's packer and call its typed methods:
+
+        packer.channel(Channels.RENDERER).sprite_move(id1, id2, x, y, z)
     """
 
-    def __init__(self):
+    # Channel count, padded so the index table starts 8-byte aligned
+    _HEADER_STRUCT = struct.Struct("<I4x")
+    # One index table entry: channel id, channel size in bytes
+    _INDEX_STRUCT = struct.Struct("<II")
+
+    def __init__(
+        self,
+        chunk_size: int = 0,
+        shrink_after: int = 0,
+        coalesce: bool = False,
+        batch: bool = False,
+        f32: bool = False,
+        sprite_handles: Optional[HandleAllocator] = None,
+        body_handles: Optional[HandleAllocator] = None,
+    ):
         """
         Initializes the ChannelPacker.
+
+        :param chunk_size: Chunk size for each channel's CommandPacker.
+        :param shrink_after: Shrink policy for each channel's CommandPacker
+                             (see CommandPacker).
+        :param coalesce: Merge repeated "set" events per entity within a frame
+                         on every channel (see CommandPacker).
+        :param batch: Group runs of same-type events into EVENT_BATCH
+                      containers on every channel (see CommandPacker).
+        :param f32: Sprites packed into this packer send MOVE/SCALE/ROTATE/
+                    SPEED as their compact f32 variants (SPRITE_MOVE_F32, ...).
+        :param sprite_handles: If set, sprites packed into this packer are
+                               bound to a handle from it and addressed by
+                               it (see Sprite.bind_handle).
+        :param body_handles: The same for PhysicsBody.
         """
-        # Stores the individual packer for each channel.
+        self.chunk_size = chunk_size
+        self.shrink_after = shrink_after
+        self.coalesce = coalesce
+        self.batch = batch
+        # Wire features the entities pack with, normally agreed with the
+        # engine by the handshake (see PackerPool.set_capabilities)
+        self.f32 = f32
+        self.sprite_handles = sprite_handles
+        self.body_handles = body_handles
+        # Stores the individual packer for each channel, each with its own buffer.
         self.channel_packers: Dict[int, CommandPacker] = {}
 
+    def channel(self, channel_id: int) -> CommandPacker:
+        """
+        Gets the CommandPacker for a channel, creating it on first use.
+
+        Args:
+            channel_id: The channel (e.g., Channels.RENDERER).
+        """
+        packer = self.channel_packers.get(channel_id)
+        if packer is None:
+            packer = CommandPacker(
+                self.chunk_size,
+                shrink_after=self.shrink_after,
+                coalesce=self.coalesce,
+                batch=self.batch,
+            )
+            self.channel_packers[channel_id] = packer
+        return packer
+
     def add(self, channel_id: int, event_type: Events, data: List[Any]):
         """
         Adds an event to a specific channel.
 
-        If the channel doesn't exist, a new CommandPacker is created for it.
-
         Args:
             channel_id: The channel to add this event to (e.g., Channels.RENDERER.value).
             event_type: The event type (from the Events enum).
             data: The event data.
         """
-        if channel_id not in self.channel_packers:
-            # Create a new packer for this channel.
-            # We set chunk_size to 0 to disable internal buffering
-            # in CommandPacker, as ChannelPacker handles the final flush.
-            self.channel_packers[channel_id] = CommandPacker(0)
+        self.channel(channel_id).add(event_type, data)
+
+    def finalize_views(self) -> List[memoryview]:
+        """
+        Finalizes all channel packers without concatenating them.
+
+        The channel count and index table are written into one buffer sized
+        up front, and each channel's data is passed through as the view its
+        CommandPacker returned. Send the list with IPCClient.write_frame
+        (which uses sendmsg), or use finalize() if you need a single blob.
 
-        self.channel_packers[channel_id].add(event_type, data)
+        The channel packers are kept; call reset() before packing the next
+        frame so they can reuse their buffers.
+
+        Returns:
+            [header + index table, channel 0 data, ..., channel N data]
+        """
+        # Sort by channel ID to ensure a consistent order (like PHP's ksort).
+        # Channels kept from an earlier frame may have nothing to send.
+        sorted_channel_ids = [
+            channel_id
+            for channel_id in sorted(self.channel_packers.keys())
+            if self.channel_packers[channel_id].get_total_event_count() > 0
+        ]
+        channel_count = len(sorted_channel_ids)
+        if channel_count == 0:
+            return []
+
+        header_size = ChannelPacker._HEADER_STRUCT.size
+        entry_size = ChannelPacker._INDEX_STRUCT.size
+        header = bytearray(header_size + entry_size * channel_count)
+        ChannelPacker._HEADER_STRUCT.pack_into(header, 0, channel_count)
+
+        views: List[memoryview] = [memoryview(header)]
+        for i, channel_id in enumerate(sorted_channel_ids):
+            # The finalized data for this channel (starts with its own event count)
+            channel_views = self.channel_packers[channel_id].finalize_views()
+            channel_size = sum(view.nbytes for view in channel_views)
+
+            # Write this channel's index entry in place
+            ChannelPacker._INDEX_STRUCT.pack_into(
+                header, header_size + entry_size * i, channel_id, channel_size
+            )
+
+            # The data itself is not copied
+            views.extend(channel_views)
+
+        return views
 
     def finalize(self) -> bytes:
         """
         Finalizes all channel packers and combines them into a single binary blob
-        prefixed with the channel index.
+        prefixed with the channel index. The blob is built with one allocation.
 
         Returns:
             The complete binary blob as bytes.
         """
-        if not self.channel_packers:
-            return b""
-
-        # Sort by channel ID to ensure a consistent order (like PHP's ksort)
-        sorted_channel_ids = sorted(self.channel_packers.keys())
-
-        index_table = bytearray()
-        data_blobs = bytearray()
-        channel_count = len(self.channel_packers)
-
-        for channel_id in sorted_channel_ids:
-            packer = self.channel_packers[channel_id]
-
-            # Get the finalized blob for this channel (starts with its own event count)
-            channel_blob = packer.finalize()
-            channel_size = len(channel_blob)  # equiv. to PHP's strlen() on binary
-
-            # Add to the index table: [Channel ID (u32), Channel Size (u32)]
-            # '<II' is two unsigned 32-bit little-endian integers (equiv. to "VV" in PHP)
-            index_table += struct.pack("<II", channel_id, channel_size)
-
-            # Add this channel's data to the main data blob
-            data_blobs += channel_blob
-
-        # 1. Pack the total number of channels
-        # '<I' is one unsigned 32-bit little-endian integer (equiv. to "V" in PHP)
-        output = bytearray(struct.pack("<I", channel_count))
-        # 2. Append the index table
-        output += index_table
-        # 3. Append the concatenated data blobs
-        output += data_blobs
+        return b"".join(self.finalize_views())
 
-        # Clear the packers for reuse
-        self.channel_packers = {}
+    def reset(self, chunk_size: Optional[int] = None):
+        """
+        Clears every channel for the next frame. The per-channel packers
+        (and their buffers) are kept rather than thrown away.
 
-        return bytes(output)
+        :param chunk_size: Optionally change the chunk size for every channel.
+        """
+        if chunk_size is not None:
+            self.chunk_size = chunk_size
+        for packer in self.channel_packers.values():
+            packer.reset(chunk_size)
 
     def get_total_event_count(self) -> int:
         """
@@ -160,3 +177,22 @@ class ChannelPacker:
         for packer in self.channel_packers.values():
             total += packer.get_total_event_count()
         return total
+
+    def get_coalesced_count(self) -> int:
+        """
+        Gets the number of events merged away across all channels this frame.
+        """
+        total = 0
+        for packer in self.channel_packers.values():
+            total += packer.get_coalesced_count()
+        return total
+
+    def get_batched_count(self) -> int:
+        """
+        Gets the number of events packed into batches (and so sent without
+        their own header) across all channels this frame.
+        """
+        total = 0
+        for packer in self.channel_packers.values():
+            total += packer.get_batched_count()
+        return total
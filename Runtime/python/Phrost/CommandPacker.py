@@ -1,6 +1,11 @@
 import struct
 import sys
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None  # Optional: only the bulk (add_many) path uses it
 
 from Events import Events
 from PackFormat import PackFormat
@@ -8,94 +13,440 @@ from PackFormat import PackFormat
 
 # --- CommandPacker Class ---
 class CommandPacker:
-    def __init__(self, chunk_size: int = 0, chunk_callback: Optional[Callable] = None):
-        self._event_stream = bytearray()
+    _INITIAL_CAPACITY = 64 * 1024
+    # With a shrink policy, the buffer is only reallocated when it is
+    # at least this many times larger than recent frames needed.
+    _SHRINK_RATIO = 4
+
+    # Events with a variable-length tail, packed by hand in _pack_event
+    _DYNAMIC_EVENTS = frozenset(
+        (
+            Events.SPRITE_TEXTURE_LOAD,
+            Events.PLUGIN_LOAD,
+            Events.AUDIO_LOAD,
+            Events.TEXT_ADD,
+            Events.TEXT_SET_STRING,
+            Events.EVENT_BATCH,
+        )
+    )
+
+    # Events that are never folded into an EVENT_BATCH
+    _UNBATCHED_EVENTS = PackFormat._VARIABLE_LENGTH_EVENTS
+
+    # EVENT_BATCH header: <IQ4x event header, then (eventType, count)
+    _BATCH_HEADER_STRUCT = PackFormat._EVENT_STRUCT_MAP[Events.EVENT_BATCH]
+    # The (eventType, count) a lone event gains when it becomes a batch
+    _BATCH_COUNT_SIZE = _BATCH_HEADER_STRUCT.size - PackFormat._HEADER_STRUCT.size
+    # The (id1, id2) that starts an entity event's payload
+    _IDS_STRUCT = struct.Struct("<qq")
+
+    # Idempotent "set" events: with coalescing on, a repeat for the
+    # same (id1, id2) in one frame overwrites the earlier event in place.
+    # Keep in sync with COALESCE_EVENTS in PythonAdapter.php.
+    _COALESCE_EVENTS = frozenset(
+        (
+            Events.SPRITE_MOVE,
+            Events.SPRITE_SCALE,
+            Events.SPRITE_RESIZE,
+            Events.SPRITE_ROTATE,
+            Events.SPRITE_COLOR,
+            Events.SPRITE_SPEED,
+            Events.SPRITE_TEXTURE_SET,
+            Events.SPRITE_SET_SOURCE_RECT,
+            Events.SPRITE_MOVE_F32,
+            Events.SPRITE_SCALE_F32,
+            Events.SPRITE_ROTATE_F32,
+            Events.SPRITE_SPEED_F32,
+            Events.GEOM_SET_COLOR,
+            Events.PHYSICS_SET_VELOCITY,
+            Events.PHYSICS_SET_POSITION,
+            Events.PHYSICS_SET_ROTATION,
+        )
+    )
+
+    # f64 "set" events and their compact f32 variants. Both set the same
+    # property, so recording one forgets the other's slot: a later event
+    # is never merged into a slot that sits in front of its sibling.
+    _PRECISION_SIBLINGS = {
+        Events.SPRITE_MOVE: Events.SPRITE_MOVE_F32,
+        Events.SPRITE_SCALE: Events.SPRITE_SCALE_F32,
+        Events.SPRITE_ROTATE: Events.SPRITE_ROTATE_F32,
+        Events.SPRITE_SPEED: Events.SPRITE_SPEED_F32,
+        Events.SPRITE_MOVE_F32: Events.SPRITE_MOVE,
+        Events.SPRITE_SCALE_F32: Events.SPRITE_SCALE,
+        Events.SPRITE_ROTATE_F32: Events.SPRITE_ROTATE,
+        Events.SPRITE_SPEED_F32: Events.SPRITE_SPEED,
+    }
+
+    # Every other event addressed to an (id1, id2) entity (adds, removes,
+    # forces, impulses, ...). These are barriers: later "set" events for
+    # that entity are never moved in front of them.
+    _ENTITY_EVENTS = (
+        frozenset(
+            event
+            for event in Events
+            if PackFormat._EVENT_KEY_MAP[event][:2] == ["id1", "id2"]
+        )
+        - _COALESCE_EVENTS
+    )
+
+    # Events addressed by an engine handle instead of (id1, id2). The
+    # packer can't tell which entity a handle belongs to, so each one
+    # is a barrier for every pending slot: the index is cleared.
+    _HANDLE_EVENTS = frozenset(
+        event for event in Events if PackFormat._EVENT_KEY_MAP[event][:1] == ["handle"]
+    )
+
+    def __init__(
+        self,
+        chunk_size: int = 0,
+        chunk_callback: Optional[Callable] = None,
+        capacity: int = 0,
+        shrink_after: int = 0,
+        coalesce: bool = False,
+        batch: bool = False,
+    ):
+        """
+        :param capacity: Bytes to presize the buffer for (e.g. a previous
+                         high-water mark).
+        :param shrink_after: If > 0, every this many reset()s the buffer is
+                             shrunk when it has become much larger than
+                             what those frames needed. 0 never shrinks.
+        :param coalesce: If True, repeated _COALESCE_EVENTS for the same
+                         entity within a frame are merged (last write
+                         wins) instead of all being sent.
+        :param batch: If True, consecutive fixed-size events of the same
+                      type are sent as one EVENT_BATCH: a single header,
+                      then the payloads back to back.
+        """
+        # Events are packed straight into a preallocated buffer with
+        # pack_into; _offset tracks how much of it is in use. The
+        # first bytes are reserved for the event count, which
+        # finalize() back-patches.
+        self._event_stream = bytearray(CommandPacker._capacity_for(capacity))
+        self._offset = PackFormat._COUNT_STRUCT.size
         self._command_count = 0
-        self._event_buffer: List[Dict[str, Any]] = []
         self._chunk_size = chunk_size
         self._chunk_callback = chunk_callback
+        # Event count at which the chunk callback next fires (0 = never)
+        self._next_chunk = chunk_size
+
+        # Largest number of bytes any frame has used, and the peak
+        # over the current shrink window
+        self._high_water = 0
+        self._shrink_after = shrink_after
+        self._window_peak = 0
+        self._window_frames = 0
+
+        # (id1, id2) -> {event type: offset of this frame's event payload},
+        # or None when coalescing is off
+        self._coalesce_index: Optional[Dict[Tuple[int, int], Dict[int, int]]] = (
+            {} if coalesce else None
+        )
+        self._coalesced_count = 0
+
+        # The run of same-type events that ends the stream: its type, where
+        # its header starts and how many events it holds (1 = a lone event
+        # with its own header, more = an EVENT_BATCH). It can only be
+        # extended while nothing else has been written after it, i.e.
+        # while _run_end == _offset.
+        self._batching = batch
+        self._run_type = -1
+        self._run_start = 0
+        self._run_count = 0
+        self._run_end = -1
+        # Events folded into a batch without a header of their own
+        self._batched_count = 0
+
+    @staticmethod
+    def _capacity_for(size: int) -> int:
+        """Smallest power-of-two capacity (>= the initial one) holding `size`."""
+        capacity = CommandPacker._INITIAL_CAPACITY
+        while capacity < size:
+            capacity *= 2
+        return capacity
+
+    def reset(self, chunk_size: Optional[int] = None):
+        """
+        Clears the packer for a new frame but keeps its buffer, so a
+        steady-state frame never reallocates. Views returned by
+        finalize_views() must not be used after this.
+
+        :param chunk_size: Optionally change the chunk size.
+        """
+        used = self._offset
+        if used > self._high_water:
+            self._high_water = used
+
+        if self._shrink_after > 0:
+            if used > self._window_peak:
+                self._window_peak = used
+            self._window_frames += 1
+            if self._window_frames >= self._shrink_after:
+                target = CommandPacker._capacity_for(self._window_peak)
+                if target * CommandPacker._SHRINK_RATIO <= len(self._event_stream):
+                    self._event_stream = bytearray(target)
+                    self._high_water = self._window_peak
+                self._window_peak = 0
+                self._window_frames = 0
+
+        if chunk_size is not None:
+            self._chunk_size = chunk_size
+        self._offset = PackFormat._COUNT_STRUCT.size
+        self._command_count = 0
+        self._next_chunk = self._chunk_size
+        if self._coalesce_index is not None:
+            self._coalesce_index.clear()
+        self._coalesced_count = 0
+        self._run_end = -1
+        self._batched_count = 0
+
+    def get_high_water_mark(self) -> int:
+        """Largest number of bytes a single frame has used so far."""
+        return max(self._high_water, self._offset)
+
+    def get_capacity(self) -> int:
+        return len(self._event_stream)
 
     def add(self, event_type: Events, data: list):
         """
         Adds a new event to the packer.
 
+        Kept for compatibility; prefer the typed methods
+        (e.g. packer.sprite_move(...)), which skip the list and
+        the event-type dispatch.
+
         :param event_type: The Events enum member.
         :param data: A list of arguments for the event, matching the
                      struct definition. For dynamic events, the final
                      arguments must be pre-encoded bytes.
         """
-        if self._chunk_size > 0:
-            self._event_buffer.append({"type": event_type, "data": data})
-            if len(self._event_buffer) >= self._chunk_size:
-                self._pack_buffered_events()
+        self._pack_event(event_type, data)
+
+    def _grow(self, needed: int):
+        """Grows the buffer (by doubling) until it can hold `needed` bytes."""
+        capacity = len(self._event_stream)
+        while capacity < needed:
+            capacity *= 2
+        # Copy into a new buffer rather than resizing in place: a
+        # bytearray can't be resized while views from
+        # finalize_views() are still alive.
+        stream = bytearray(capacity)
+        stream[: self._offset] = memoryview(self._event_stream)[: self._offset]
+        self._event_stream = stream
+
+    def _reserve(self, size: int) -> int:
+        """
+        Makes room for `size` more bytes and returns the offset the
+        caller should write at.
+        """
+        offset = self._offset
+        needed = offset + size
+        if needed > len(self._event_stream):
+            self._grow(needed)
+        self._offset = needed
+        return offset
+
+    def _find_slot(self, event_type: int, id1: int, id2: int) -> int:
+        """Offset of this frame's earlier `event_type` for (id1, id2), or -1."""
+        slots = self._coalesce_index.get((id1, id2))
+        if slots is None:
+            return -1
+        return slots.get(event_type, -1)
+
+    def _record_slot(self, event_type: int, id1: int, id2: int, offset: int):
+        slots = self._coalesce_index.get((id1, id2))
+        if slots is None:
+            self._coalesce_index[(id1, id2)] = {event_type: offset}
         else:
-            self._pack_event(event_type, data)
+            slots[event_type] = offset
+            sibling = CommandPacker._PRECISION_SIBLINGS.get(event_type)
+            if sibling is not None:
+                slots.pop(sibling, None)
 
-    def _pack_event(self, event_type: Events, data: list):
-        type_value = event_type.value
-        try:
-            # Pack header: <I (type) <Q (timestamp) = 12 bytes
-            self._event_stream.extend(struct.pack("<IQ", type_value, 0))
-        except struct.error as e:
-            print(
-                f"CommandPacker ({event_type.name}): Failed to pack header: {e}",
-                file=sys.stderr,
+    def _batch_offset(self, event_type: int, count: int) -> int:
+        """
+        Batching: makes room for `count` payloads of `event_type` and
+        returns the offset to write them at. Nothing is committed until
+        _join_batch(), so a failed pack_into() leaves the stream intact.
+        """
+        offset = self._offset
+        if offset == self._run_end and event_type == self._run_type:
+            if self._run_count == 1:
+                offset += CommandPacker._BATCH_COUNT_SIZE
+        elif count == 1:
+            offset += PackFormat._HEADER_STRUCT.size
+        else:
+            offset += CommandPacker._BATCH_HEADER_STRUCT.size
+        end = offset + PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].size * count
+        if end > len(self._event_stream):
+            self._grow(end)
+        return offset
+
+    def _join_batch(self, event_type: int, offset: int, count: int):
+        """
+        Commits `count` payloads written at `offset` (from _batch_offset):
+        writes the header of a new run, or turns the run that ends the
+        stream into an EVENT_BATCH and updates its count.
+        """
+        stream = self._event_stream
+        stride = PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].size
+        start = self._offset
+        gap = offset - start
+        if gap == PackFormat._HEADER_STRUCT.size:
+            # A lone event, with its own header
+            PackFormat._HEADER_STRUCT.pack_into(stream, start, event_type, 0)
+            self._run_type = event_type
+            self._run_start = start
+            self._run_count = 1
+        elif gap == CommandPacker._BATCH_HEADER_STRUCT.size:
+            # A new batch
+            CommandPacker._BATCH_HEADER_STRUCT.pack_into(
+                stream, start, Events.EVENT_BATCH, 0, event_type, count
             )
-            return
+            self._run_type = event_type
+            self._run_start = start
+            self._run_count = count
+            self._batched_count += count - 1
+        else:
+            start = self._run_start
+            shift = CommandPacker._BATCH_COUNT_SIZE
+            if gap == shift:
+                # The lone event becomes the first entry: move its payload
+                # behind the batch header (and its coalescing slot with it)
+                payload = start + PackFormat._HEADER_STRUCT.size
+                stream[payload + shift : payload + shift + stride] = stream[
+                    payload : payload + stride
+                ]
+                if (
+                    self._coalesce_index is not None
+                    and event_type in CommandPacker._COALESCE_EVENTS
+                ):
+                    slots = self._coalesce_index.get(
+                        CommandPacker._IDS_STRUCT.unpack_from(stream, payload + shift)
+                    )
+                    if slots is not None and slots.get(event_type) == payload:
+                        slots[event_type] = payload + shift
+            self._run_count += count
+            self._batched_count += count
+            CommandPacker._BATCH_HEADER_STRUCT.pack_into(
+                stream, start, Events.EVENT_BATCH, 0, event_type, self._run_count
+            )
+        self._offset = self._run_end = offset + stride * count
+
+    def _write_bytes(self, data: bytes):
+        """Writes a string tail, zero-padded to the next 8-byte boundary."""
+        size = (len(data) + 7) & ~7
+        offset = self._reserve(size)
+        self._event_stream[offset : offset + size] = data.ljust(size, b"\0")
+
+    def _pack_event(self, event_type: Events, data: list):
+        # Events is an IntEnum, so event_type can be used directly as
+        # the map key and as the packed type value.
+        event_struct = PackFormat._EVENT_STRUCT_MAP.get(event_type)
+        start = self._offset
+        # Whether this event gets a coalescing slot once it is written
+        record = False
 
         try:
+            if event_struct is None:
+                raise ValueError(f"Could not get payload info for {event_type.name}")
+
+            index = self._coalesce_index
+            if index is not None:
+                if event_type in CommandPacker._COALESCE_EVENTS:
+                    slot = self._find_slot(event_type, data[0], data[1])
+                    if slot >= 0:
+                        # Last write wins: overwrite the earlier payload
+                        PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(
+                            self._event_stream, slot, *data
+                        )
+                        self._coalesced_count += 1
+                        return
+                    record = True
+                elif event_type in CommandPacker._ENTITY_EVENTS:
+                    index.pop((data[0], data[1]), None)
+                elif event_type in CommandPacker._HANDLE_EVENTS:
+                    index.clear()
+
+            if self._batching and event_type not in CommandPacker._UNBATCHED_EVENTS:
+                # --- Batched Fixed-Size Event: payload only ---
+                offset = self._batch_offset(event_type, 1)
+                PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(
+                    self._event_stream, offset, *data
+                )
+                self._join_batch(event_type, offset, 1)
+
+            elif event_type not in CommandPacker._DYNAMIC_EVENTS:
+                # --- Fixed-Size Event Packing Logic ---
+                # event_struct covers the <IQ4x header, the payload
+                # and the padding up to the next 8-byte boundary
+                end = start + event_struct.size
+                if end > len(self._event_stream):
+                    self._grow(end)
+                event_struct.pack_into(self._event_stream, start, event_type, 0, *data)
+                self._offset = end
+
             # --- Manual Packing for Variable-Length Events ---
-            # These events have a (format, size) for their *header*
+            # These events have a struct for their *header*
             # and expect raw bytes as their final argument(s).
-
-            if event_type == Events.SPRITE_TEXTURE_LOAD:
+            # The header struct is padded to 8 bytes and so is
+            # each string tail (see _write_bytes).
+            elif event_type == Events.SPRITE_TEXTURE_LOAD:
                 # data = [id0(q), id1(q), filenameLength(I), filename_bytes(b"")]
                 if len(data) != 4:
                     raise ValueError(f"TEXTURE_LOAD: Expected 4 args, got {len(data)}")
-                fmt, _ = PackFormat.get_info(type_value)  # ("<qqI4x", 24)
-                self._event_stream.extend(struct.pack(fmt, data[0], data[1], data[2]))
-                self._event_stream.extend(data[3])  # data[3] is already bytes
+                offset = self._reserve(event_struct.size)
+                event_struct.pack_into(
+                    self._event_stream, offset, event_type, 0, data[0], data[1], data[2]
+                )
+                self._write_bytes(data[3])  # data[3] is already bytes
 
             elif event_type == Events.PLUGIN_LOAD:
-                # data = [pathLength(I), path_bytes(b"")]
-                if len(data) != 2:
-                    raise ValueError(f"PLUGIN_LOAD: Expected 2 args, got {len(data)}")
-                fmt, _ = PackFormat.get_info(type_value)  # ("<I", 4)
-                self._event_stream.extend(struct.pack(fmt, data[0]))
-                self._event_stream.extend(data[1])  # data[1] is already bytes
+                # data = [channelNo(I), pathLength(I), path_bytes(b"")]
+                if len(data) != 3:
+                    raise ValueError(f"PLUGIN_LOAD: Expected 3 args, got {len(data)}")
+                offset = self._reserve(event_struct.size)
+                event_struct.pack_into(
+                    self._event_stream, offset, event_type, 0, data[0], data[1]
+                )
+                self._write_bytes(data[2])  # data[2] is already bytes
 
             elif event_type == Events.AUDIO_LOAD:
                 # data = [pathLength(I), path_bytes(b"")]
                 if len(data) != 2:
                     raise ValueError(f"AUDIO_LOAD: Expected 2 args, got {len(data)}")
-                fmt, _ = PackFormat.get_info(type_value)  # ("<I", 4)
-                self._event_stream.extend(struct.pack(fmt, data[0]))
-                self._event_stream.extend(data[1])  # data[1] is already bytes
+                offset = self._reserve(event_struct.size)
+                event_struct.pack_into(
+                    self._event_stream, offset, event_type, 0, data[0]
+                )
+                self._write_bytes(data[1])  # data[1] is already bytes
 
             elif event_type == Events.TEXT_ADD:
                 # data = [id0(q), id1(q), ..., fontPath_bytes(b""), text_bytes(b"")]
                 if len(data) != 14:
                     raise ValueError(f"TEXT_ADD: Expected 14 args, got {len(data)}")
-                fmt, _ = PackFormat.get_info(type_value)  # ("<qqdddBBBB4xfII4x", 64)
-                self._event_stream.extend(
-                    struct.pack(
-                        fmt,
-                        data[0],
-                        data[1],
-                        data[2],
-                        data[3],
-                        data[4],  # id, pos
-                        data[5],
-                        data[6],
-                        data[7],
-                        data[8],  # rgba
-                        data[9],
-                        data[10],
-                        data[11],  # fontSize, fontPathLen, textLen
-                    )
+                offset = self._reserve(event_struct.size)
+                event_struct.pack_into(
+                    self._event_stream,
+                    offset,
+                    event_type,
+                    0,
+                    data[0],
+                    data[1],
+                    data[2],
+                    data[3],
+                    data[4],  # id, pos
+                    data[5],
+                    data[6],
+                    data[7],
+                    data[8],  # rgba
+                    data[9],
+                    data[10],
+                    data[11],  # fontSize, fontPathLen, textLen
                 )
-                self._event_stream.extend(data[12])  # fontPath_bytes
-                self._event_stream.extend(data[13])  # text_bytes
+                self._write_bytes(data[12])  # fontPath_bytes
+                self._write_bytes(data[13])  # text_bytes
 
             elif event_type == Events.TEXT_SET_STRING:
                 # data = [id0(q), id1(q), textLength(I), text_bytes(b"")]
@@ -103,65 +454,2717 @@ class CommandPacker:
                     raise ValueError(
                         f"TEXT_SET_STRING: Expected 4 args, got {len(data)}"
                     )
-                fmt, _ = PackFormat.get_info(type_value)  # ("<qqI4x", 24)
-                self._event_stream.extend(struct.pack(fmt, data[0], data[1], data[2]))
-                self._event_stream.extend(data[3])  # text_bytes
-
-            else:
-                # --- Fixed-Size Event Packing Logic ---
-                payload_info = PackFormat.get_info(type_value)
-                if payload_info is None:
-                    raise ValueError(
-                        f"Could not get payload info for {event_type.name}"
-                    )
-
-                fmt, size = payload_info
-
-                if not fmt and data:
-                    raise ValueError(
-                        f"Format is empty but data was provided for {event_type.name}"
-                    )
+                offset = self._reserve(event_struct.size)
+                event_struct.pack_into(
+                    self._event_stream, offset, event_type, 0, data[0], data[1], data[2]
+                )
+                self._write_bytes(data[3])  # text_bytes
 
-                if fmt:
-                    # fmt is the pre-compiled struct string (e.g., "<qqd")
-                    self._event_stream.extend(struct.pack(fmt, *data))
+            elif event_type == Events.EVENT_BATCH:
+                # data = [eventType(I), count(I), payloads_bytes(b"")]
+                # The payloads must already be padded to 8 bytes each
+                if len(data) != 3:
+                    raise ValueError(f"EVENT_BATCH: Expected 3 args, got {len(data)}")
+                offset = self._reserve(event_struct.size)
+                event_struct.pack_into(
+                    self._event_stream, offset, event_type, 0, data[0], data[1]
+                )
+                self._write_bytes(data[2])  # payloads_bytes
 
+            if record:
+                self._record_slot(
+                    event_type,
+                    data[0],
+                    data[1],
+                    self._offset
+                    - PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].size,
+                )
             self._command_count += 1
+            if self._command_count == self._next_chunk:
+                self._chunk_reached()
 
-        except (struct.error, ValueError, TypeError) as e:
+        except (struct.error, ValueError, TypeError, IndexError) as e:
+            # Drop any partially written event
+            self._offset = start
             print(
                 f"CommandPacker ({event_type.name}): Error during pack! {e}",
                 file=sys.stderr,
             )
             print(f"  Data: {data}", file=sys.stderr)
 
-    def _pack_buffered_events(self):
-        if not self._event_buffer:
+    def add_many(self, event_type: Events, **columns):
+        """
+        Packs a whole run of one fixed-size event in a single step.
+
+        Each keyword is a member name from the struct (see
+        PackFormat._EVENT_KEY_MAP) and each value is a column: a NumPy
+        array, an array.array, or any sequence, all of the same length.
+
+            packer.add_many(Events.SPRITE_MOVE, id1=ids1, id2=ids2,
+                            positionX=xs, positionY=ys, positionZ=zs)
+
+        With NumPy installed the columns are copied into a structured
+        array and written with one tobytes(); otherwise each row is
+        packed with pack_into(). With coalescing on, entity events are
+        packed row by row through add() so they can be merged. With
+        batching on, the run is written as (or appended to) one
+        EVENT_BATCH.
+        """
+        try:
+            if event_type in CommandPacker._DYNAMIC_EVENTS:
+                raise ValueError("add_many only supports fixed-size events")
+
+            keys = PackFormat._EVENT_KEY_MAP[event_type]
+            if set(columns) != set(keys):
+                raise ValueError(f"Expected columns {keys}, got {list(columns)}")
+
+            count = len(columns[keys[0]]) if keys else 0
+            if any(len(column) != count for column in columns.values()):
+                raise ValueError("All columns must have the same length")
+            if count == 0:
+                return
+
+            if self._coalesce_index is not None and (
+                event_type in CommandPacker._COALESCE_EVENTS
+                or event_type in CommandPacker._ENTITY_EVENTS
+            ):
+                for row in zip(*(columns[key] for key in keys)):
+                    self._pack_event(event_type, list(row))
+                return
+            if (
+                self._coalesce_index is not None
+                and event_type in CommandPacker._HANDLE_EVENTS
+            ):
+                self._coalesce_index.clear()
+
+            if self._batching and event_type not in CommandPacker._UNBATCHED_EVENTS:
+                # Payloads only, committed by _join_batch once all are written
+                payload_struct = PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type]
+                offset = self._batch_offset(event_type, count)
+                end = offset + payload_struct.size * count
+                if np is not None:
+                    records = np.zeros(
+                        count, dtype=PackFormat.get_dtype(event_type, header=False)
+                    )
+                    for key in keys:
+                        records[key] = columns[key]
+                    self._event_stream[offset:end] = records.tobytes()
+                else:
+                    stride = payload_struct.size
+                    rows = zip(*(columns[key] for key in keys))
+                    for i, row in enumerate(rows):
+                        payload_struct.pack_into(
+                            self._event_stream, offset + i * stride, *row
+                        )
+                self._join_batch(event_type, offset, count)
+            else:
+                event_struct = PackFormat._EVENT_STRUCT_MAP[event_type]
+                offset = self._offset
+                end = offset + event_struct.size * count
+                if end > len(self._event_stream):
+                    self._grow(end)
+
+                if np is not None:
+                    records = np.zeros(count, dtype=PackFormat.get_dtype(event_type))
+                    records["type"] = event_type
+                    for key in keys:
+                        records[key] = columns[key]
+                    self._event_stream[offset:end] = records.tobytes()
+                else:
+                    stride = event_struct.size
+                    rows = zip(*(columns[key] for key in keys))
+                    for i, row in enumerate(rows):
+                        event_struct.pack_into(
+                            self._event_stream, offset + i * stride, event_type, 0, *row
+                        )
+                self._offset = end
+
+        except (struct.error, ValueError, TypeError) as e:
+            print(
+                f"CommandPacker ({event_type.name}): Error during add_many! {e}",
+                file=sys.stderr,
+            )
             return
-        for event in self._event_buffer:
-            self._pack_event(event["type"], event["data"])
 
-        if self._chunk_callback:
-            self._chunk_callback(len(self._event_buffer), self._command_count)
+        self._command_count += count
+        while 0 < self._next_chunk <= self._command_count:
+            self._chunk_reached()
 
-        self._event_buffer = []
+    def _chunk_reached(self):
+        if self._chunk_callback:
+            self._chunk_callback(self._chunk_size, self._command_count)
+        self._next_chunk += self._chunk_size
 
     def flush(self):
-        if self._event_buffer:
-            self._pack_buffered_events()
+        # Events are packed as they are added; nothing is held back.
+        pass
 
-    def finalize(self) -> bytes:
+    def finalize_views(self) -> List[memoryview]:
+        """
+        Back-patches the event count into its reserved slot and returns
+        the finished stream as a list of memoryviews, without copying.
+        The views are only valid until the packer is written to again.
+        """
         self.flush()
         if self._command_count == 0:
-            return b""
-        # Prepend count (<I) and return the full byte stream
-        return struct.pack("<I", self._command_count) + self._event_stream
+            return []
+        # Batched events share their batch's header, so the stream holds
+        # fewer top-level events than were packed
+        PackFormat._COUNT_STRUCT.pack_into(
+            self._event_stream, 0, self._command_count - self._batched_count
+        )
+        return [memoryview(self._event_stream)[: self._offset]]
+
+    def finalize(self) -> bytes:
+        views = self.finalize_views()
+        return views[0].tobytes() if views else b""
 
     def get_buffer_count(self) -> int:
-        return len(self._event_buffer)
+        """Events packed since the last chunk callback."""
+        if self._chunk_size <= 0:
+            return self._command_count
+        return self._command_count - (self._next_chunk - self._chunk_size)
 
     def get_total_event_count(self) -> int:
-        return self._command_count + len(self._event_buffer)
+        return self._command_count
+
+    def get_coalesced_count(self) -> int:
+        """Events merged into an earlier one since the last reset()."""
+        return self._coalesced_count
+
+    def get_batched_count(self) -> int:
+        """Events sent inside an EVENT_BATCH without a header of their own since the last reset()."""
+        return self._batched_count
+
+    # --- Typed Pack Methods ---
+    def sprite_add(
+        self,
+        id1: int,
+        id2: int,
+        positionX: float,
+        positionY: float,
+        positionZ: float,
+        scaleX: float,
+        scaleY: float,
+        scaleZ: float,
+        sizeW: float,
+        sizeH: float,
+        rotationX: float,
+        rotationY: float,
+        rotationZ: float,
+        r: int,
+        g: int,
+        b: int,
+        a: int,
+        speedX: float,
+        speedY: float,
+    ):
+        """Packs SPRITE_ADD. Payload for adding a new sprite to the scene."""
+        event_type = 0  # Events.SPRITE_ADD
+        if self._coalesce_index is not None:
+            self._coalesce_index.pop((id1, id2), None)
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(
+                self._event_stream,
+                offset,
+                id1,
+                id2,
+                positionX,
+                positionY,
+                positionZ,
+                scaleX,
+                scaleY,
+                scaleZ,
+                sizeW,
+                sizeH,
+                rotationX,
+                rotationY,
+                rotationZ,
+                r,
+                g,
+                b,
+                a,
+                speedX,
+                speedY,
+            )
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(
+                self._event_stream,
+                offset,
+                event_type,
+                0,
+                id1,
+                id2,
+                positionX,
+                positionY,
+                positionZ,
+                scaleX,
+                scaleY,
+                scaleZ,
+                sizeW,
+                sizeH,
+                rotationX,
+                rotationY,
+                rotationZ,
+                r,
+                g,
+                b,
+                a,
+                speedX,
+                speedY,
+            )
+            self._offset = end
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def sprite_remove(self, id1: int, id2: int):
+        """Packs SPRITE_REMOVE. Payload for removing a sprite from the scene."""
+        event_type = 1  # Events.SPRITE_REMOVE
+        if self._coalesce_index is not None:
+            self._coalesce_index.pop((id1, id2), None)
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(
+                self._event_stream, offset, id1, id2
+            )
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(self._event_stream, offset, event_type, 0, id1, id2)
+            self._offset = end
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def sprite_move(
+        self, id1: int, id2: int, positionX: float, positionY: float, positionZ: float
+    ):
+        """Packs SPRITE_MOVE. Payload to move a sprite to an absolute position."""
+        event_type = 2  # Events.SPRITE_MOVE
+        index = self._coalesce_index
+        if index is not None:
+            slot = self._find_slot(event_type, id1, id2)
+            if slot >= 0:
+                PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(
+                    self._event_stream, slot, id1, id2, positionX, positionY, positionZ
+                )
+                self._coalesced_count += 1
+                return
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(
+                self._event_stream, offset, id1, id2, positionX, positionY, positionZ
+            )
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(
+                self._event_stream,
+                offset,
+                event_type,
+                0,
+                id1,
+                id2,
+                positionX,
+                positionY,
+                positionZ,
+            )
+            self._offset = end
+        if index is not None:
+            self._record_slot(
+                event_type,
+                id1,
+                id2,
+                self._offset - PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].size,
+            )
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def sprite_scale(
+        self, id1: int, id2: int, scaleX: float, scaleY: float, scaleZ: float
+    ):
+        """Packs SPRITE_SCALE. Payload to set a sprite's scale."""
+        event_type = 3  # Events.SPRITE_SCALE
+        index = self._coalesce_index
+        if index is not None:
+            slot = self._find_slot(event_type, id1, id2)
+            if slot >= 0:
+                PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(
+                    self._event_stream, slot, id1, id2, scaleX, scaleY, scaleZ
+                )
+                self._coalesced_count += 1
+                return
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(
+                self._event_stream, offset, id1, id2, scaleX, scaleY, scaleZ
+            )
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(
+                self._event_stream,
+                offset,
+                event_type,
+                0,
+                id1,
+                id2,
+                scaleX,
+                scaleY,
+                scaleZ,
+            )
+            self._offset = end
+        if index is not None:
+            self._record_slot(
+                event_type,
+                id1,
+                id2,
+                self._offset - PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].size,
+            )
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def sprite_resize(self, id1: int, id2: int, sizeW: float, sizeH: float):
+        """Packs SPRITE_RESIZE. Payload to set a sprite's size (width/height)."""
+        event_type = 4  # Events.SPRITE_RESIZE
+        index = self._coalesce_index
+        if index is not None:
+            slot = self._find_slot(event_type, id1, id2)
+            if slot >= 0:
+                PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(
+                    self._event_stream, slot, id1, id2, sizeW, sizeH
+                )
+                self._coalesced_count += 1
+                return
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(
+                self._event_stream, offset, id1, id2, sizeW, sizeH
+            )
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(
+                self._event_stream, offset, event_type, 0, id1, id2, sizeW, sizeH
+            )
+            self._offset = end
+        if index is not None:
+            self._record_slot(
+                event_type,
+                id1,
+                id2,
+                self._offset - PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].size,
+            )
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def sprite_rotate(
+        self, id1: int, id2: int, rotationX: float, rotationY: float, rotationZ: float
+    ):
+        """Packs SPRITE_ROTATE. Payload to set a sprite's rotation."""
+        event_type = 5  # Events.SPRITE_ROTATE
+        index = self._coalesce_index
+        if index is not None:
+            slot = self._find_slot(event_type, id1, id2)
+            if slot >= 0:
+                PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(
+                    self._event_stream, slot, id1, id2, rotationX, rotationY, rotationZ
+                )
+                self._coalesced_count += 1
+                return
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(
+                self._event_stream, offset, id1, id2, rotationX, rotationY, rotationZ
+            )
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(
+                self._event_stream,
+                offset,
+                event_type,
+                0,
+                id1,
+                id2,
+                rotationX,
+                rotationY,
+                rotationZ,
+            )
+            self._offset = end
+        if index is not None:
+            self._record_slot(
+                event_type,
+                id1,
+                id2,
+                self._offset - PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].size,
+            )
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def sprite_color(self, id1: int, id2: int, r: int, g: int, b: int, a: int):
+        """Packs SPRITE_COLOR. Payload to set a sprite's color modulation."""
+        event_type = 6  # Events.SPRITE_COLOR
+        index = self._coalesce_index
+        if index is not None:
+            slot = self._find_slot(event_type, id1, id2)
+            if slot >= 0:
+                PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(
+                    self._event_stream, slot, id1, id2, r, g, b, a
+                )
+                self._coalesced_count += 1
+                return
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(
+                self._event_stream, offset, id1, id2, r, g, b, a
+            )
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(
+                self._event_stream, offset, event_type, 0, id1, id2, r, g, b, a
+            )
+            self._offset = end
+        if index is not None:
+            self._record_slot(
+                event_type,
+                id1,
+                id2,
+                self._offset - PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].size,
+            )
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def sprite_speed(self, id1: int, id2: int, speedX: float, speedY: float):
+        """Packs SPRITE_SPEED. Payload to set a sprite's speed."""
+        event_type = 7  # Events.SPRITE_SPEED
+        index = self._coalesce_index
+        if index is not None:
+            slot = self._find_slot(event_type, id1, id2)
+            if slot >= 0:
+                PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(
+                    self._event_stream, slot, id1, id2, speedX, speedY
+                )
+                self._coalesced_count += 1
+                return
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(
+                self._event_stream, offset, id1, id2, speedX, speedY
+            )
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(
+                self._event_stream, offset, event_type, 0, id1, id2, speedX, speedY
+            )
+            self._offset = end
+        if index is not None:
+            self._record_slot(
+                event_type,
+                id1,
+                id2,
+                self._offset - PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].size,
+            )
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def sprite_texture_load(
+        self, id1: int, id2: int, filename: bytes, filenameLength: int = -1
+    ):
+        """Packs SPRITE_TEXTURE_LOAD. Header for loading a texture. Variable data (filename string) follows."""
+        event_type = 8  # Events.SPRITE_TEXTURE_LOAD
+        if filenameLength < 0:
+            filenameLength = len(filename)
+        filenameSize = (filenameLength + 7) & ~7
+        if self._coalesce_index is not None:
+            self._coalesce_index.pop((id1, id2), None)
+        event = PackFormat._EVENT_STRUCT_MAP[event_type]
+        offset = self._offset
+        tail = offset + event.size
+        end = tail + filenameSize
+        if end > len(self._event_stream):
+            self._grow(end)
+        event.pack_into(
+            self._event_stream, offset, event_type, 0, id1, id2, filenameLength
+        )
+        self._event_stream[tail:end] = filename.ljust(filenameSize, b"\0")
+        self._offset = end
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def sprite_texture_set(self, id1: int, id2: int, textureId: int):
+        """Packs SPRITE_TEXTURE_SET. Payload to set a sprite's texture to an already loaded one."""
+        event_type = 9  # Events.SPRITE_TEXTURE_SET
+        index = self._coalesce_index
+        if index is not None:
+            slot = self._find_slot(event_type, id1, id2)
+            if slot >= 0:
+                PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(
+                    self._event_stream, slot, id1, id2, textureId
+                )
+                self._coalesced_count += 1
+                return
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(
+                self._event_stream, offset, id1, id2, textureId
+            )
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(
+                self._event_stream, offset, event_type, 0, id1, id2, textureId
+            )
+            self._offset = end
+        if index is not None:
+            self._record_slot(
+                event_type,
+                id1,
+                id2,
+                self._offset - PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].size,
+            )
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def sprite_set_source_rect(
+        self, id1: int, id2: int, x: float, y: float, w: float, h: float
+    ):
+        """Packs SPRITE_SET_SOURCE_RECT. Sets the source rectangle (spritesheet clipping) for a sprite."""
+        event_type = 10  # Events.SPRITE_SET_SOURCE_RECT
+        index = self._coalesce_index
+        if index is not None:
+            slot = self._find_slot(event_type, id1, id2)
+            if slot >= 0:
+                PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(
+                    self._event_stream, slot, id1, id2, x, y, w, h
+                )
+                self._coalesced_count += 1
+                return
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(
+                self._event_stream, offset, id1, id2, x, y, w, h
+            )
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(
+                self._event_stream, offset, event_type, 0, id1, id2, x, y, w, h
+            )
+            self._offset = end
+        if index is not None:
+            self._record_slot(
+                event_type,
+                id1,
+                id2,
+                self._offset - PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].size,
+            )
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def sprite_move_f32(
+        self, id1: int, id2: int, positionX: float, positionY: float, positionZ: float
+    ):
+        """Packs SPRITE_MOVE_F32. Compact SPRITE_MOVE with f32 coordinates."""
+        event_type = 11  # Events.SPRITE_MOVE_F32
+        index = self._coalesce_index
+        if index is not None:
+            slot = self._find_slot(event_type, id1, id2)
+            if slot >= 0:
+                PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(
+                    self._event_stream, slot, id1, id2, positionX, positionY, positionZ
+                )
+                self._coalesced_count += 1
+                return
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(
+                self._event_stream, offset, id1, id2, positionX, positionY, positionZ
+            )
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(
+                self._event_stream,
+                offset,
+                event_type,
+                0,
+                id1,
+                id2,
+                positionX,
+                positionY,
+                positionZ,
+            )
+            self._offset = end
+        if index is not None:
+            self._record_slot(
+                event_type,
+                id1,
+                id2,
+                self._offset - PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].size,
+            )
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def sprite_scale_f32(
+        self, id1: int, id2: int, scaleX: float, scaleY: float, scaleZ: float
+    ):
+        """Packs SPRITE_SCALE_F32. Compact SPRITE_SCALE with f32 components."""
+        event_type = 12  # Events.SPRITE_SCALE_F32
+        index = self._coalesce_index
+        if index is not None:
+            slot = self._find_slot(event_type, id1, id2)
+            if slot >= 0:
+                PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(
+                    self._event_stream, slot, id1, id2, scaleX, scaleY, scaleZ
+                )
+                self._coalesced_count += 1
+                return
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(
+                self._event_stream, offset, id1, id2, scaleX, scaleY, scaleZ
+            )
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(
+                self._event_stream,
+                offset,
+                event_type,
+                0,
+                id1,
+                id2,
+                scaleX,
+                scaleY,
+                scaleZ,
+            )
+            self._offset = end
+        if index is not None:
+            self._record_slot(
+                event_type,
+                id1,
+                id2,
+                self._offset - PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].size,
+            )
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def sprite_rotate_f32(
+        self, id1: int, id2: int, rotationX: float, rotationY: float, rotationZ: float
+    ):
+        """Packs SPRITE_ROTATE_F32. Compact SPRITE_ROTATE with f32 angles."""
+        event_type = 13  # Events.SPRITE_ROTATE_F32
+        index = self._coalesce_index
+        if index is not None:
+            slot = self._find_slot(event_type, id1, id2)
+            if slot >= 0:
+                PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(
+                    self._event_stream, slot, id1, id2, rotationX, rotationY, rotationZ
+                )
+                self._coalesced_count += 1
+                return
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(
+                self._event_stream, offset, id1, id2, rotationX, rotationY, rotationZ
+            )
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(
+                self._event_stream,
+                offset,
+                event_type,
+                0,
+                id1,
+                id2,
+                rotationX,
+                rotationY,
+                rotationZ,
+            )
+            self._offset = end
+        if index is not None:
+            self._record_slot(
+                event_type,
+                id1,
+                id2,
+                self._offset - PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].size,
+            )
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def sprite_speed_f32(self, id1: int, id2: int, speedX: float, speedY: float):
+        """Packs SPRITE_SPEED_F32. Compact SPRITE_SPEED with f32 components."""
+        event_type = 14  # Events.SPRITE_SPEED_F32
+        index = self._coalesce_index
+        if index is not None:
+            slot = self._find_slot(event_type, id1, id2)
+            if slot >= 0:
+                PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(
+                    self._event_stream, slot, id1, id2, speedX, speedY
+                )
+                self._coalesced_count += 1
+                return
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(
+                self._event_stream, offset, id1, id2, speedX, speedY
+            )
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(
+                self._event_stream, offset, event_type, 0, id1, id2, speedX, speedY
+            )
+            self._offset = end
+        if index is not None:
+            self._record_slot(
+                event_type,
+                id1,
+                id2,
+                self._offset - PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].size,
+            )
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def sprite_bind_handle(self, id1: int, id2: int, handle: int):
+        """Packs SPRITE_BIND_HANDLE. Binds a dense u32 handle to a sprite for the *_HANDLE events."""
+        event_type = 15  # Events.SPRITE_BIND_HANDLE
+        if self._coalesce_index is not None:
+            self._coalesce_index.pop((id1, id2), None)
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(
+                self._event_stream, offset, id1, id2, handle
+            )
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(self._event_stream, offset, event_type, 0, id1, id2, handle)
+            self._offset = end
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def sprite_release_handle(self, handle: int):
+        """Packs SPRITE_RELEASE_HANDLE. Unbinds a sprite handle. SPRITE_REMOVE also drops the sprite's handle."""
+        event_type = 16  # Events.SPRITE_RELEASE_HANDLE
+        if self._coalesce_index is not None:
+            self._coalesce_index.clear()
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(
+                self._event_stream, offset, handle
+            )
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(self._event_stream, offset, event_type, 0, handle)
+            self._offset = end
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def sprite_move_handle(
+        self, handle: int, positionX: float, positionY: float, positionZ: float
+    ):
+        """Packs SPRITE_MOVE_HANDLE. SPRITE_MOVE_F32 addressed by handle."""
+        event_type = 17  # Events.SPRITE_MOVE_HANDLE
+        if self._coalesce_index is not None:
+            self._coalesce_index.clear()
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(
+                self._event_stream, offset, handle, positionX, positionY, positionZ
+            )
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(
+                self._event_stream,
+                offset,
+                event_type,
+                0,
+                handle,
+                positionX,
+                positionY,
+                positionZ,
+            )
+            self._offset = end
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def sprite_scale_handle(
+        self, handle: int, scaleX: float, scaleY: float, scaleZ: float
+    ):
+        """Packs SPRITE_SCALE_HANDLE. SPRITE_SCALE_F32 addressed by handle."""
+        event_type = 18  # Events.SPRITE_SCALE_HANDLE
+        if self._coalesce_index is not None:
+            self._coalesce_index.clear()
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(
+                self._event_stream, offset, handle, scaleX, scaleY, scaleZ
+            )
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(
+                self._event_stream,
+                offset,
+                event_type,
+                0,
+                handle,
+                scaleX,
+                scaleY,
+                scaleZ,
+            )
+            self._offset = end
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def sprite_rotate_handle(
+        self, handle: int, rotationX: float, rotationY: float, rotationZ: float
+    ):
+        """Packs SPRITE_ROTATE_HANDLE. SPRITE_ROTATE_F32 addressed by handle."""
+        event_type = 19  # Events.SPRITE_ROTATE_HANDLE
+        if self._coalesce_index is not None:
+            self._coalesce_index.clear()
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(
+                self._event_stream, offset, handle, rotationX, rotationY, rotationZ
+            )
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(
+                self._event_stream,
+                offset,
+                event_type,
+                0,
+                handle,
+                rotationX,
+                rotationY,
+                rotationZ,
+            )
+            self._offset = end
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def sprite_speed_handle(self, handle: int, speedX: float, speedY: float):
+        """Packs SPRITE_SPEED_HANDLE. SPRITE_SPEED_F32 addressed by handle."""
+        event_type = 20  # Events.SPRITE_SPEED_HANDLE
+        if self._coalesce_index is not None:
+            self._coalesce_index.clear()
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(
+                self._event_stream, offset, handle, speedX, speedY
+            )
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(
+                self._event_stream, offset, event_type, 0, handle, speedX, speedY
+            )
+            self._offset = end
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def geom_add_point(
+        self,
+        id1: int,
+        id2: int,
+        z: float,
+        r: int,
+        g: int,
+        b: int,
+        a: int,
+        isScreenSpace: int,
+        x: float,
+        y: float,
+    ):
+        """Packs GEOM_ADD_POINT. Payload for adding a single geometry point."""
+        event_type = 50  # Events.GEOM_ADD_POINT
+        if self._coalesce_index is not None:
+            self._coalesce_index.pop((id1, id2), None)
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(
+                self._event_stream, offset, id1, id2, z, r, g, b, a, isScreenSpace, x, y
+            )
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(
+                self._event_stream,
+                offset,
+                event_type,
+                0,
+                id1,
+                id2,
+                z,
+                r,
+                g,
+                b,
+                a,
+                isScreenSpace,
+                x,
+                y,
+            )
+            self._offset = end
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def geom_add_line(
+        self,
+        id1: int,
+        id2: int,
+        z: float,
+        r: int,
+        g: int,
+        b: int,
+        a: int,
+        isScreenSpace: int,
+        x1: float,
+        y1: float,
+        x2: float,
+        y2: float,
+    ):
+        """Packs GEOM_ADD_LINE. Payload for adding a single geometry line."""
+        event_type = 51  # Events.GEOM_ADD_LINE
+        if self._coalesce_index is not None:
+            self._coalesce_index.pop((id1, id2), None)
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(
+                self._event_stream,
+                offset,
+                id1,
+                id2,
+                z,
+                r,
+                g,
+                b,
+                a,
+                isScreenSpace,
+                x1,
+                y1,
+                x2,
+                y2,
+            )
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(
+                self._event_stream,
+                offset,
+                event_type,
+                0,
+                id1,
+                id2,
+                z,
+                r,
+                g,
+                b,
+                a,
+                isScreenSpace,
+                x1,
+                y1,
+                x2,
+                y2,
+            )
+            self._offset = end
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def geom_add_rect(
+        self,
+        id1: int,
+        id2: int,
+        z: float,
+        r: int,
+        g: int,
+        b: int,
+        a: int,
+        isScreenSpace: int,
+        x: float,
+        y: float,
+        w: float,
+        h: float,
+    ):
+        """Packs GEOM_ADD_RECT. Payload for adding a geometry rectangle (outline)."""
+        event_type = 52  # Events.GEOM_ADD_RECT
+        if self._coalesce_index is not None:
+            self._coalesce_index.pop((id1, id2), None)
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(
+                self._event_stream,
+                offset,
+                id1,
+                id2,
+                z,
+                r,
+                g,
+                b,
+                a,
+                isScreenSpace,
+                x,
+                y,
+                w,
+                h,
+            )
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(
+                self._event_stream,
+                offset,
+                event_type,
+                0,
+                id1,
+                id2,
+                z,
+                r,
+                g,
+                b,
+                a,
+                isScreenSpace,
+                x,
+                y,
+                w,
+                h,
+            )
+            self._offset = end
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def geom_add_fill_rect(
+        self,
+        id1: int,
+        id2: int,
+        z: float,
+        r: int,
+        g: int,
+        b: int,
+        a: int,
+        isScreenSpace: int,
+        x: float,
+        y: float,
+        w: float,
+        h: float,
+    ):
+        """Packs GEOM_ADD_FILL_RECT. Payload for adding a filled geometry rectangle. Reuses PackedGeomAddRectEvent."""
+        event_type = 53  # Events.GEOM_ADD_FILL_RECT
+        if self._coalesce_index is not None:
+            self._coalesce_index.pop((id1, id2), None)
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(
+                self._event_stream,
+                offset,
+                id1,
+                id2,
+                z,
+                r,
+                g,
+                b,
+                a,
+                isScreenSpace,
+                x,
+                y,
+                w,
+                h,
+            )
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(
+                self._event_stream,
+                offset,
+                event_type,
+                0,
+                id1,
+                id2,
+                z,
+                r,
+                g,
+                b,
+                a,
+                isScreenSpace,
+                x,
+                y,
+                w,
+                h,
+            )
+            self._offset = end
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def geom_add_packed(
+        self,
+        id1: int,
+        id2: int,
+        z: float,
+        r: int,
+        g: int,
+        b: int,
+        a: int,
+        isScreenSpace: int,
+        primitiveType: int,
+        count: int,
+        data: bytes,
+    ):
+        """Packs GEOM_ADD_PACKED. Header for adding a batch of geometry primitives. Variable data (array of points/rects) follows."""
+        event_type = 54  # Events.GEOM_ADD_PACKED
+        dataLength = len(data)
+        dataSize = (dataLength + 7) & ~7
+        if self._coalesce_index is not None:
+            self._coalesce_index.pop((id1, id2), None)
+        event = PackFormat._EVENT_STRUCT_MAP[event_type]
+        offset = self._offset
+        tail = offset + event.size
+        end = tail + dataSize
+        if end > len(self._event_stream):
+            self._grow(end)
+        event.pack_into(
+            self._event_stream,
+            offset,
+            event_type,
+            0,
+            id1,
+            id2,
+            z,
+            r,
+            g,
+            b,
+            a,
+            isScreenSpace,
+            primitiveType,
+            count,
+        )
+        self._event_stream[tail:end] = data.ljust(dataSize, b"\0")
+        self._offset = end
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def geom_remove(self, id1: int, id2: int):
+        """Packs GEOM_REMOVE. Payload for removing a geometry entity."""
+        event_type = 55  # Events.GEOM_REMOVE
+        if self._coalesce_index is not None:
+            self._coalesce_index.pop((id1, id2), None)
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(
+                self._event_stream, offset, id1, id2
+            )
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(self._event_stream, offset, event_type, 0, id1, id2)
+            self._offset = end
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def geom_set_color(self, id1: int, id2: int, r: int, g: int, b: int, a: int):
+        """Packs GEOM_SET_COLOR. Payload to set a geometry entity's color."""
+        event_type = 56  # Events.GEOM_SET_COLOR
+        index = self._coalesce_index
+        if index is not None:
+            slot = self._find_slot(event_type, id1, id2)
+            if slot >= 0:
+                PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(
+                    self._event_stream, slot, id1, id2, r, g, b, a
+                )
+                self._coalesced_count += 1
+                return
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(
+                self._event_stream, offset, id1, id2, r, g, b, a
+            )
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(
+                self._event_stream, offset, event_type, 0, id1, id2, r, g, b, a
+            )
+            self._offset = end
+        if index is not None:
+            self._record_slot(
+                event_type,
+                id1,
+                id2,
+                self._offset - PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].size,
+            )
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def input_keyup(self, scancode: int, keycode: int, mod: int, isRepeat: int):
+        """Packs INPUT_KEYUP. Payload for a key release event."""
+        event_type = 100  # Events.INPUT_KEYUP
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(
+                self._event_stream, offset, scancode, keycode, mod, isRepeat
+            )
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(
+                self._event_stream,
+                offset,
+                event_type,
+                0,
+                scancode,
+                keycode,
+                mod,
+                isRepeat,
+            )
+            self._offset = end
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def input_keydown(self, scancode: int, keycode: int, mod: int, isRepeat: int):
+        """Packs INPUT_KEYDOWN. Payload for a key press event. Reuses PackedKeyEvent."""
+        event_type = 101  # Events.INPUT_KEYDOWN
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(
+                self._event_stream, offset, scancode, keycode, mod, isRepeat
+            )
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(
+                self._event_stream,
+                offset,
+                event_type,
+                0,
+                scancode,
+                keycode,
+                mod,
+                isRepeat,
+            )
+            self._offset = end
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def input_mouseup(self, x: float, y: float, button: int, clicks: int):
+        """Packs INPUT_MOUSEUP. Payload for a mouse button release event."""
+        event_type = 102  # Events.INPUT_MOUSEUP
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(
+                self._event_stream, offset, x, y, button, clicks
+            )
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(
+                self._event_stream, offset, event_type, 0, x, y, button, clicks
+            )
+            self._offset = end
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def input_mousedown(self, x: float, y: float, button: int, clicks: int):
+        """Packs INPUT_MOUSEDOWN. Payload for a mouse button press event. Reuses PackedMouseButtonEvent."""
+        event_type = 103  # Events.INPUT_MOUSEDOWN
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(
+                self._event_stream, offset, x, y, button, clicks
+            )
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(
+                self._event_stream, offset, event_type, 0, x, y, button, clicks
+            )
+            self._offset = end
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def input_mousemotion(self, x: float, y: float, xrel: float, yrel: float):
+        """Packs INPUT_MOUSEMOTION. Payload for a mouse motion event."""
+        event_type = 104  # Events.INPUT_MOUSEMOTION
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(
+                self._event_stream, offset, x, y, xrel, yrel
+            )
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(self._event_stream, offset, event_type, 0, x, y, xrel, yrel)
+            self._offset = end
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def window_title(self, title: bytes):
+        """Packs WINDOW_TITLE. Payload for setting the window title."""
+        event_type = 200  # Events.WINDOW_TITLE
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(
+                self._event_stream, offset, title
+            )
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(self._event_stream, offset, event_type, 0, title)
+            self._offset = end
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def window_resize(self, w: int, h: int):
+        """Packs WINDOW_RESIZE. Payload for a window resize event."""
+        event_type = 201  # Events.WINDOW_RESIZE
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(
+                self._event_stream, offset, w, h
+            )
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(self._event_stream, offset, event_type, 0, w, h)
+            self._offset = end
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def window_flags(self, flags: int):
+        """Packs WINDOW_FLAGS. Payload for setting window flags (e.g., fullscreen, borderless)."""
+        event_type = 202  # Events.WINDOW_FLAGS
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(
+                self._event_stream, offset, flags
+            )
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(self._event_stream, offset, event_type, 0, flags)
+            self._offset = end
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def text_add(
+        self,
+        id1: int,
+        id2: int,
+        positionX: float,
+        positionY: float,
+        positionZ: float,
+        r: int,
+        g: int,
+        b: int,
+        a: int,
+        fontSize: float,
+        fontPath: bytes,
+        text: bytes,
+        fontPathLength: int = -1,
+        textLength: int = -1,
+    ):
+        """Packs TEXT_ADD. Header for adding new text. Variable data (font path, text string) follows."""
+        event_type = 300  # Events.TEXT_ADD
+        if fontPathLength < 0:
+            fontPathLength = len(fontPath)
+        fontPathSize = (fontPathLength + 7) & ~7
+        if textLength < 0:
+            textLength = len(text)
+        textSize = (textLength + 7) & ~7
+        if self._coalesce_index is not None:
+            self._coalesce_index.pop((id1, id2), None)
+        event = PackFormat._EVENT_STRUCT_MAP[event_type]
+        offset = self._offset
+        tail = offset + event.size
+        end = tail + fontPathSize + textSize
+        if end > len(self._event_stream):
+            self._grow(end)
+        event.pack_into(
+            self._event_stream,
+            offset,
+            event_type,
+            0,
+            id1,
+            id2,
+            positionX,
+            positionY,
+            positionZ,
+            r,
+            g,
+            b,
+            a,
+            fontSize,
+            fontPathLength,
+            textLength,
+        )
+        self._event_stream[tail : tail + fontPathSize] = fontPath.ljust(
+            fontPathSize, b"\0"
+        )
+        tail += fontPathSize
+        self._event_stream[tail:end] = text.ljust(textSize, b"\0")
+        self._offset = end
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def text_set_string(self, id1: int, id2: int, text: bytes, textLength: int = -1):
+        """Packs TEXT_SET_STRING. Header for setting a text entity's string. Variable data (text string) follows."""
+        event_type = 301  # Events.TEXT_SET_STRING
+        if textLength < 0:
+            textLength = len(text)
+        textSize = (textLength + 7) & ~7
+        if self._coalesce_index is not None:
+            self._coalesce_index.pop((id1, id2), None)
+        event = PackFormat._EVENT_STRUCT_MAP[event_type]
+        offset = self._offset
+        tail = offset + event.size
+        end = tail + textSize
+        if end > len(self._event_stream):
+            self._grow(end)
+        event.pack_into(self._event_stream, offset, event_type, 0, id1, id2, textLength)
+        self._event_stream[tail:end] = text.ljust(textSize, b"\0")
+        self._offset = end
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def audio_load(self, path: bytes, pathLength: int = -1):
+        """Packs AUDIO_LOAD. Header for loading an audio file. Variable data (path string) follows."""
+        event_type = 400  # Events.AUDIO_LOAD
+        if pathLength < 0:
+            pathLength = len(path)
+        pathSize = (pathLength + 7) & ~7
+        event = PackFormat._EVENT_STRUCT_MAP[event_type]
+        offset = self._offset
+        tail = offset + event.size
+        end = tail + pathSize
+        if end > len(self._event_stream):
+            self._grow(end)
+        event.pack_into(self._event_stream, offset, event_type, 0, pathLength)
+        self._event_stream[tail:end] = path.ljust(pathSize, b"\0")
+        self._offset = end
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def audio_loaded(self, audioId: int):
+        """Packs AUDIO_LOADED. Payload sent *from* engine *to* client when audio is loaded."""
+        event_type = 401  # Events.AUDIO_LOADED
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(
+                self._event_stream, offset, audioId
+            )
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(self._event_stream, offset, event_type, 0, audioId)
+            self._offset = end
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def audio_play(self, audioId: int):
+        """Packs AUDIO_PLAY. Payload to play a loaded audio file."""
+        event_type = 402  # Events.AUDIO_PLAY
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(
+                self._event_stream, offset, audioId
+            )
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(self._event_stream, offset, event_type, 0, audioId)
+            self._offset = end
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def audio_stop_all(self, _unused: int = 0):
+        """Packs AUDIO_STOP_ALL. Stops all playing audio. This event has no payload."""
+        event_type = 403  # Events.AUDIO_STOP_ALL
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(
+                self._event_stream, offset, _unused
+            )
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(self._event_stream, offset, event_type, 0, _unused)
+            self._offset = end
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def audio_set_master_volume(self, volume: float):
+        """Packs AUDIO_SET_MASTER_VOLUME. Payload to set the global master volume."""
+        event_type = 404  # Events.AUDIO_SET_MASTER_VOLUME
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(
+                self._event_stream, offset, volume
+            )
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(self._event_stream, offset, event_type, 0, volume)
+            self._offset = end
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def audio_pause(self, audioId: int):
+        """Packs AUDIO_PAUSE. Payload to pause a specific, playing audio sound."""
+        event_type = 405  # Events.AUDIO_PAUSE
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(
+                self._event_stream, offset, audioId
+            )
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(self._event_stream, offset, event_type, 0, audioId)
+            self._offset = end
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def audio_stop(self, audioId: int):
+        """Packs AUDIO_STOP. Payload to stop and rewind a specific audio sound."""
+        event_type = 406  # Events.AUDIO_STOP
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(
+                self._event_stream, offset, audioId
+            )
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(self._event_stream, offset, event_type, 0, audioId)
+            self._offset = end
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def audio_unload(self, audioId: int):
+        """Packs AUDIO_UNLOAD. Payload to unload a specific audio sound, freeing memory."""
+        event_type = 407  # Events.AUDIO_UNLOAD
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(
+                self._event_stream, offset, audioId
+            )
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(self._event_stream, offset, event_type, 0, audioId)
+            self._offset = end
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def audio_set_volume(self, audioId: int, volume: float):
+        """Packs AUDIO_SET_VOLUME. Payload to set the volume of a specific audio sound."""
+        event_type = 408  # Events.AUDIO_SET_VOLUME
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(
+                self._event_stream, offset, audioId, volume
+            )
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(self._event_stream, offset, event_type, 0, audioId, volume)
+            self._offset = end
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def physics_add_body(
+        self,
+        id1: int,
+        id2: int,
+        positionX: float,
+        positionY: float,
+        bodyType: int,
+        shapeType: int,
+        lockRotation: int,
+        mass: float,
+        friction: float,
+        elasticity: float,
+        width: float,
+        height: float,
+    ):
+        """Packs PHYSICS_ADD_BODY. Payload for adding a new physics body to the world."""
+        event_type = 500  # Events.PHYSICS_ADD_BODY
+        if self._coalesce_index is not None:
+            self._coalesce_index.pop((id1, id2), None)
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(
+                self._event_stream,
+                offset,
+                id1,
+                id2,
+                positionX,
+                positionY,
+                bodyType,
+                shapeType,
+                lockRotation,
+                mass,
+                friction,
+                elasticity,
+                width,
+                height,
+            )
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(
+                self._event_stream,
+                offset,
+                event_type,
+                0,
+                id1,
+                id2,
+                positionX,
+                positionY,
+                bodyType,
+                shapeType,
+                lockRotation,
+                mass,
+                friction,
+                elasticity,
+                width,
+                height,
+            )
+            self._offset = end
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def physics_remove_body(self, id1: int, id2: int):
+        """Packs PHYSICS_REMOVE_BODY. Payload for removing a physics body."""
+        event_type = 501  # Events.PHYSICS_REMOVE_BODY
+        if self._coalesce_index is not None:
+            self._coalesce_index.pop((id1, id2), None)
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(
+                self._event_stream, offset, id1, id2
+            )
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(self._event_stream, offset, event_type, 0, id1, id2)
+            self._offset = end
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def physics_apply_force(self, id1: int, id2: int, forceX: float, forceY: float):
+        """Packs PHYSICS_APPLY_FORCE. Payload to apply a continuous force to a body."""
+        event_type = 502  # Events.PHYSICS_APPLY_FORCE
+        if self._coalesce_index is not None:
+            self._coalesce_index.pop((id1, id2), None)
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(
+                self._event_stream, offset, id1, id2, forceX, forceY
+            )
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(
+                self._event_stream, offset, event_type, 0, id1, id2, forceX, forceY
+            )
+            self._offset = end
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def physics_apply_impulse(
+        self, id1: int, id2: int, impulseX: float, impulseY: float
+    ):
+        """Packs PHYSICS_APPLY_IMPULSE. Payload to apply an instant impulse to a body."""
+        event_type = 503  # Events.PHYSICS_APPLY_IMPULSE
+        if self._coalesce_index is not None:
+            self._coalesce_index.pop((id1, id2), None)
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(
+                self._event_stream, offset, id1, id2, impulseX, impulseY
+            )
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(
+                self._event_stream, offset, event_type, 0, id1, id2, impulseX, impulseY
+            )
+            self._offset = end
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def physics_set_velocity(
+        self, id1: int, id2: int, velocityX: float, velocityY: float
+    ):
+        """Packs PHYSICS_SET_VELOCITY. Payload to set a body's linear velocity."""
+        event_type = 504  # Events.PHYSICS_SET_VELOCITY
+        index = self._coalesce_index
+        if index is not None:
+            slot = self._find_slot(event_type, id1, id2)
+            if slot >= 0:
+                PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(
+                    self._event_stream, slot, id1, id2, velocityX, velocityY
+                )
+                self._coalesced_count += 1
+                return
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(
+                self._event_stream, offset, id1, id2, velocityX, velocityY
+            )
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(
+                self._event_stream,
+                offset,
+                event_type,
+                0,
+                id1,
+                id2,
+                velocityX,
+                velocityY,
+            )
+            self._offset = end
+        if index is not None:
+            self._record_slot(
+                event_type,
+                id1,
+                id2,
+                self._offset - PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].size,
+            )
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def physics_set_position(
+        self, id1: int, id2: int, positionX: float, positionY: float
+    ):
+        """Packs PHYSICS_SET_POSITION. Payload to teleport a body to a new position."""
+        event_type = 505  # Events.PHYSICS_SET_POSITION
+        index = self._coalesce_index
+        if index is not None:
+            slot = self._find_slot(event_type, id1, id2)
+            if slot >= 0:
+                PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(
+                    self._event_stream, slot, id1, id2, positionX, positionY
+                )
+                self._coalesced_count += 1
+                return
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(
+                self._event_stream, offset, id1, id2, positionX, positionY
+            )
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(
+                self._event_stream,
+                offset,
+                event_type,
+                0,
+                id1,
+                id2,
+                positionX,
+                positionY,
+            )
+            self._offset = end
+        if index is not None:
+            self._record_slot(
+                event_type,
+                id1,
+                id2,
+                self._offset - PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].size,
+            )
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def physics_set_rotation(self, id1: int, id2: int, angleInRadians: float):
+        """Packs PHYSICS_SET_ROTATION. Payload to set a body's rotation."""
+        event_type = 506  # Events.PHYSICS_SET_ROTATION
+        index = self._coalesce_index
+        if index is not None:
+            slot = self._find_slot(event_type, id1, id2)
+            if slot >= 0:
+                PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(
+                    self._event_stream, slot, id1, id2, angleInRadians
+                )
+                self._coalesced_count += 1
+                return
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(
+                self._event_stream, offset, id1, id2, angleInRadians
+            )
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(
+                self._event_stream, offset, event_type, 0, id1, id2, angleInRadians
+            )
+            self._offset = end
+        if index is not None:
+            self._record_slot(
+                event_type,
+                id1,
+                id2,
+                self._offset - PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].size,
+            )
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def physics_bind_handle(self, id1: int, id2: int, handle: int):
+        """Packs PHYSICS_BIND_HANDLE. Binds a dense u32 handle to a physics body for the *_HANDLE events."""
+        event_type = 507  # Events.PHYSICS_BIND_HANDLE
+        if self._coalesce_index is not None:
+            self._coalesce_index.pop((id1, id2), None)
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(
+                self._event_stream, offset, id1, id2, handle
+            )
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(self._event_stream, offset, event_type, 0, id1, id2, handle)
+            self._offset = end
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def physics_release_handle(self, handle: int):
+        """Packs PHYSICS_RELEASE_HANDLE. Unbinds a body handle. PHYSICS_REMOVE_BODY also drops the body's handle."""
+        event_type = 508  # Events.PHYSICS_RELEASE_HANDLE
+        if self._coalesce_index is not None:
+            self._coalesce_index.clear()
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(
+                self._event_stream, offset, handle
+            )
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(self._event_stream, offset, event_type, 0, handle)
+            self._offset = end
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def physics_set_velocity_handle(
+        self, handle: int, velocityX: float, velocityY: float
+    ):
+        """Packs PHYSICS_SET_VELOCITY_HANDLE. PHYSICS_SET_VELOCITY addressed by handle."""
+        event_type = 509  # Events.PHYSICS_SET_VELOCITY_HANDLE
+        if self._coalesce_index is not None:
+            self._coalesce_index.clear()
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(
+                self._event_stream, offset, handle, velocityX, velocityY
+            )
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(
+                self._event_stream, offset, event_type, 0, handle, velocityX, velocityY
+            )
+            self._offset = end
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def physics_set_position_handle(
+        self, handle: int, positionX: float, positionY: float
+    ):
+        """Packs PHYSICS_SET_POSITION_HANDLE. PHYSICS_SET_POSITION addressed by handle."""
+        event_type = 510  # Events.PHYSICS_SET_POSITION_HANDLE
+        if self._coalesce_index is not None:
+            self._coalesce_index.clear()
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(
+                self._event_stream, offset, handle, positionX, positionY
+            )
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(
+                self._event_stream, offset, event_type, 0, handle, positionX, positionY
+            )
+            self._offset = end
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def physics_set_rotation_handle(self, handle: int, angleInRadians: float):
+        """Packs PHYSICS_SET_ROTATION_HANDLE. PHYSICS_SET_ROTATION addressed by handle."""
+        event_type = 511  # Events.PHYSICS_SET_ROTATION_HANDLE
+        if self._coalesce_index is not None:
+            self._coalesce_index.clear()
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(
+                self._event_stream, offset, handle, angleInRadians
+            )
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(
+                self._event_stream, offset, event_type, 0, handle, angleInRadians
+            )
+            self._offset = end
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def physics_collision_begin(self, id1_A: int, id2_A: int, id1_B: int, id2_B: int):
+        """Packs PHYSICS_COLLISION_BEGIN. Payload sent *from* engine when two bodies begin colliding."""
+        event_type = 550  # Events.PHYSICS_COLLISION_BEGIN
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(
+                self._event_stream, offset, id1_A, id2_A, id1_B, id2_B
+            )
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(
+                self._event_stream, offset, event_type, 0, id1_A, id2_A, id1_B, id2_B
+            )
+            self._offset = end
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def physics_collision_separate(
+        self, id1_A: int, id2_A: int, id1_B: int, id2_B: int
+    ):
+        """Packs PHYSICS_COLLISION_SEPARATE. Payload sent *from* engine when two bodies stop colliding. Reuses PackedPhysicsCollisionEvent."""
+        event_type = 551  # Events.PHYSICS_COLLISION_SEPARATE
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(
+                self._event_stream, offset, id1_A, id2_A, id1_B, id2_B
+            )
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(
+                self._event_stream, offset, event_type, 0, id1_A, id2_A, id1_B, id2_B
+            )
+            self._offset = end
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def physics_sync_transform(
+        self,
+        id1: int,
+        id2: int,
+        positionX: float,
+        positionY: float,
+        angle: float,
+        velocityX: float,
+        velocityY: float,
+        angularVelocity: float,
+        isSleeping: int,
+    ):
+        """Packs PHYSICS_SYNC_TRANSFORM. Payload sent *from* engine to sync 2D physics state back to client."""
+        event_type = 552  # Events.PHYSICS_SYNC_TRANSFORM
+        if self._coalesce_index is not None:
+            self._coalesce_index.pop((id1, id2), None)
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(
+                self._event_stream,
+                offset,
+                id1,
+                id2,
+                positionX,
+                positionY,
+                angle,
+                velocityX,
+                velocityY,
+                angularVelocity,
+                isSleeping,
+            )
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(
+                self._event_stream,
+                offset,
+                event_type,
+                0,
+                id1,
+                id2,
+                positionX,
+                positionY,
+                angle,
+                velocityX,
+                velocityY,
+                angularVelocity,
+                isSleeping,
+            )
+            self._offset = end
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def physics_set_debug_mode(self, enabled: int):
+        """Packs PHYSICS_SET_DEBUG_MODE. Payload to toggle physics debug rendering."""
+        event_type = 553  # Events.PHYSICS_SET_DEBUG_MODE
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(
+                self._event_stream, offset, enabled
+            )
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(self._event_stream, offset, event_type, 0, enabled)
+            self._offset = end
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def plugin(self, eventId: int):
+        """Packs PLUGIN. Payload for a generic plugin 'on' event."""
+        event_type = 1000  # Events.PLUGIN
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(
+                self._event_stream, offset, eventId
+            )
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(self._event_stream, offset, event_type, 0, eventId)
+            self._offset = end
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def plugin_load(self, channelNo: int, path: bytes, pathLength: int = -1):
+        """Packs PLUGIN_LOAD. Header for loading a plugin. Variable data (path string) follows."""
+        event_type = 1001  # Events.PLUGIN_LOAD
+        if pathLength < 0:
+            pathLength = len(path)
+        pathSize = (pathLength + 7) & ~7
+        event = PackFormat._EVENT_STRUCT_MAP[event_type]
+        offset = self._offset
+        tail = offset + event.size
+        end = tail + pathSize
+        if end > len(self._event_stream):
+            self._grow(end)
+        event.pack_into(
+            self._event_stream, offset, event_type, 0, channelNo, pathLength
+        )
+        self._event_stream[tail:end] = path.ljust(pathSize, b"\0")
+        self._offset = end
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def plugin_unload(self, pluginId: int):
+        """Packs PLUGIN_UNLOAD. Payload to unload a plugin."""
+        event_type = 1002  # Events.PLUGIN_UNLOAD
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(
+                self._event_stream, offset, pluginId
+            )
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(self._event_stream, offset, event_type, 0, pluginId)
+            self._offset = end
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def plugin_set(self, pluginId: int):
+        """Packs PLUGIN_SET. Payload to set the active plugin."""
+        event_type = 1003  # Events.PLUGIN_SET
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(
+                self._event_stream, offset, pluginId
+            )
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(self._event_stream, offset, event_type, 0, pluginId)
+            self._offset = end
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def plugin_event_stacking(self, eventId: int):
+        """Packs PLUGIN_EVENT_STACKING. Payload to enable or disable plugin event stacking."""
+        event_type = 1004  # Events.PLUGIN_EVENT_STACKING
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(
+                self._event_stream, offset, eventId
+            )
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(self._event_stream, offset, event_type, 0, eventId)
+            self._offset = end
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def plugin_subscribe_event(self, pluginId: int, channelNo: int):
+        """Packs PLUGIN_SUBSCRIBE_EVENT. Have events from a channel forward to this plugin"""
+        event_type = 1005  # Events.PLUGIN_SUBSCRIBE_EVENT
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(
+                self._event_stream, offset, pluginId, channelNo
+            )
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(
+                self._event_stream, offset, event_type, 0, pluginId, channelNo
+            )
+            self._offset = end
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def plugin_unsubscribe_event(self, pluginId: int, channelNo: int):
+        """Packs PLUGIN_UNSUBSCRIBE_EVENT. Have events from a channel forward to this plugin"""
+        event_type = 1006  # Events.PLUGIN_UNSUBSCRIBE_EVENT
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(
+                self._event_stream, offset, pluginId, channelNo
+            )
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(
+                self._event_stream, offset, event_type, 0, pluginId, channelNo
+            )
+            self._offset = end
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def camera_set_position(self, positionX: float, positionY: float):
+        """Packs CAMERA_SET_POSITION. Payload to set the 2D camera's absolute world position."""
+        event_type = 2000  # Events.CAMERA_SET_POSITION
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(
+                self._event_stream, offset, positionX, positionY
+            )
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(
+                self._event_stream, offset, event_type, 0, positionX, positionY
+            )
+            self._offset = end
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def camera_move(self, deltaX: float, deltaY: float):
+        """Packs CAMERA_MOVE. Payload to move the 2D camera by a relative delta."""
+        event_type = 2001  # Events.CAMERA_MOVE
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(
+                self._event_stream, offset, deltaX, deltaY
+            )
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(self._event_stream, offset, event_type, 0, deltaX, deltaY)
+            self._offset = end
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def camera_set_zoom(self, zoom: float):
+        """Packs CAMERA_SET_ZOOM. Payload to set the 2D camera's zoom level."""
+        event_type = 2002  # Events.CAMERA_SET_ZOOM
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(
+                self._event_stream, offset, zoom
+            )
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(self._event_stream, offset, event_type, 0, zoom)
+            self._offset = end
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def camera_set_rotation(self, angleInRadians: float):
+        """Packs CAMERA_SET_ROTATION. Payload to set the 2D camera's rotation."""
+        event_type = 2003  # Events.CAMERA_SET_ROTATION
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(
+                self._event_stream, offset, angleInRadians
+            )
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(self._event_stream, offset, event_type, 0, angleInRadians)
+            self._offset = end
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def camera_follow_entity(self, id1: int, id2: int):
+        """Packs CAMERA_FOLLOW_ENTITY. Tells the camera to start following a specific entity."""
+        event_type = 2004  # Events.CAMERA_FOLLOW_ENTITY
+        if self._coalesce_index is not None:
+            self._coalesce_index.pop((id1, id2), None)
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(
+                self._event_stream, offset, id1, id2
+            )
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(self._event_stream, offset, event_type, 0, id1, id2)
+            self._offset = end
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def camera_stop_following(self, _unused: int = 0):
+        """Packs CAMERA_STOP_FOLLOWING. Tells the camera to stop following any entity."""
+        event_type = 2005  # Events.CAMERA_STOP_FOLLOWING
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(
+                self._event_stream, offset, _unused
+            )
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(self._event_stream, offset, event_type, 0, _unused)
+            self._offset = end
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def script_subscribe(self, channelNo: int):
+        """Packs SCRIPT_SUBSCRIBE. Tells the engine to subscribe the main script (PHP) to a channel."""
+        event_type = 3000  # Events.SCRIPT_SUBSCRIBE
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(
+                self._event_stream, offset, channelNo
+            )
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(self._event_stream, offset, event_type, 0, channelNo)
+            self._offset = end
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def script_unsubscribe(self, channelNo: int):
+        """Packs SCRIPT_UNSUBSCRIBE. Tells the engine to unsubscribe the main script (PHP) from a channel."""
+        event_type = 3001  # Events.SCRIPT_UNSUBSCRIBE
+        if self._batching:
+            offset = self._batch_offset(event_type, 1)
+            PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type].pack_into(
+                self._event_stream, offset, channelNo
+            )
+            self._join_batch(event_type, offset, 1)
+        else:
+            event = PackFormat._EVENT_STRUCT_MAP[event_type]
+            offset = self._offset
+            end = offset + event.size
+            if end > len(self._event_stream):
+                self._grow(end)
+            event.pack_into(self._event_stream, offset, event_type, 0, channelNo)
+            self._offset = end
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
+
+    def event_batch(self, eventType: int, count: int, payloads: bytes):
+        """Packs EVENT_BATCH. Header for a run of same-type fixed-size events. `count` payloads of `eventType` follow, each padded to 8 bytes, with no per-event header."""
+        event_type = 4000  # Events.EVENT_BATCH
+        payloadsLength = len(payloads)
+        payloadsSize = (payloadsLength + 7) & ~7
+        event = PackFormat._EVENT_STRUCT_MAP[event_type]
+        offset = self._offset
+        tail = offset + event.size
+        end = tail + payloadsSize
+        if end > len(self._event_stream):
+            self._grow(end)
+        event.pack_into(self._event_stream, offset, event_type, 0, eventType, count)
+        self._event_stream[tail:end] = payloads.ljust(payloadsSize, b"\0")
+        self._offset = end
+        self._command_count += 1
+        if self._command_count == self._next_chunk:
+            self._chunk_reached()
 
 
 # --- End CommandPacker Class ---
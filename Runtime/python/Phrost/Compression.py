@@ -0,0 +1,215 @@
+import struct
+import sys
+import time
+import zlib
+from typing import Dict, List, Optional, Sequence, Union
+
+try:
+    import lz4.block
+except ImportError:
+    lz4 = None
+
+# Set in a frame's u32 length when its body is compressed
+COMPRESSED_FLAG = 0x80000000
+
+# [u32 codec id][u32 raw length], in front of the compressed bytes
+COMPRESSED_HEAD_STRUCT = struct.Struct("<II")
+
+# Frames smaller than this are always sent as they are
+COMPRESS_THRESHOLD = 4 * 1024
+
+# Assumed link speed in bytes/s (100 Mbit/s) when weighing the time spent
+# compressing against the time the saved bytes would take to send. zlib's
+# fastest level saves roughly 50-70 MB/s of sprite frames per second spent,
+# so on a gigabit LAN it is switched off again.
+LINK_SPEED = 12_500_000
+
+Buffer = Union[bytes, bytearray, memoryview]
+
+
+class Codec:
+    """
+    A frame compression codec. Subclass it with a unique `id` and
+    register_codec() an instance on both sides of the link.
+    """
+
+    id: int = 0
+    name: str = ""
+
+    def compress(self, data: Buffer) -> bytes:
+        raise NotImplementedError
+
+    def decompress(self, data: Buffer, raw_length: int) -> bytes:
+        """Returns the raw bytes; must not produce more than `raw_length`."""
+        raise NotImplementedError
+
+
+class ZlibCodec(Codec):
+    """zlib from the standard library, at a fast level by default."""
+
+    id = 1
+    name = "zlib"
+
+    def __init__(self, level: int = 1):
+        self.level = level
+
+    def compress(self, data: Buffer) -> bytes:
+        return zlib.compress(data, self.level)
+
+    def decompress(self, data: Buffer, raw_length: int) -> bytes:
+        # Never inflates past raw_length, whatever the data holds
+        decompressor = zlib.decompressobj()
+        raw = decompressor.decompress(data, raw_length)
+        if not decompressor.eof:
+            raise ValueError(f"stream does not end at {raw_length} bytes")
+        return raw
+
+
+class LZ4Codec(Codec):
+    """LZ4 block format, if the `lz4` package is installed."""
+
+    id = 2
+    name = "lz4"
+
+    def compress(self, data: Buffer) -> bytes:
+        return lz4.block.compress(data, store_size=False)
+
+    def decompress(self, data: Buffer, raw_length: int) -> bytes:
+        return lz4.block.decompress(data, uncompressed_size=raw_length)
+
+
+CODECS: Dict[int, Codec] = {}
+
+
+def register_codec(codec: Codec) -> None:
+    """Makes `codec` available for compressing and decompressing frames."""
+    CODECS[codec.id] = codec
+
+
+register_codec(ZlibCodec())
+if lz4 is not None:
+    register_codec(LZ4Codec())
+
+
+def decompress_frame(body: Buffer, max_length: int) -> Optional[bytes]:
+    """
+    Decompresses a frame body ([u32 codec][u32 raw length][data]). Returns
+    None, with a message on stderr, if it can't, or if its raw length is
+    over `max_length` bytes.
+    """
+    if len(body) < COMPRESSED_HEAD_STRUCT.size:
+        print("Compressed frame too small.", file=sys.stderr)
+        return None
+    codec_id, raw_length = COMPRESSED_HEAD_STRUCT.unpack_from(body)
+    if raw_length > max_length:
+        print(
+            f"Compressed frame too large: {raw_length} bytes, limit {max_length}.",
+            file=sys.stderr,
+        )
+        return None
+    codec = CODECS.get(codec_id)
+    if codec is None:
+        print(f"Unknown compression codec: {codec_id}", file=sys.stderr)
+        return None
+
+    try:
+        data = codec.decompress(
+            memoryview(body)[COMPRESSED_HEAD_STRUCT.size :], raw_length
+        )
+    except Exception as e:
+        print(f"{codec.name} decompression failed: {e}", file=sys.stderr)
+        return None
+    if len(data) != raw_length:
+        print(
+            f"Decompressed {len(data)} bytes, expected {raw_length}.",
+            file=sys.stderr,
+        )
+        return None
+    return data
+
+
+class FrameCompressor:
+    """
+    Compresses outgoing frames when it pays off.
+
+    Frames under `threshold` bytes are sent as they are, as is any frame
+    that doesn't shrink. For the rest, the time spent compressing and the
+    bytes saved are added up; every `window` compressed frames they are
+    weighed against each other at `link_speed`, and if compressing took
+    longer than sending the saved bytes would have, compression is switched
+    off. After `retry_after` frames it is tried again, in case the frames
+    (or the link) have changed.
+    """
+
+    def __init__(
+        self,
+        codec: Optional[Codec] = None,
+        threshold: int = COMPRESS_THRESHOLD,
+        link_speed: float = LINK_SPEED,
+        window: int = 60,
+        retry_after: int = 600,
+    ):
+        """
+        :param codec: A registered codec; zlib by default.
+        :param threshold: Smallest frame, in bytes, worth compressing.
+        :param link_speed: Bytes/s the link is assumed to carry.
+        :param window: Compressed frames between checks.
+        :param retry_after: Frames to wait before trying again once off.
+        """
+        self.codec: Codec = codec or CODECS[ZlibCodec.id]
+        self.threshold = threshold
+        self.link_speed = link_speed
+        self.window = window
+        self.retry_after = retry_after
+        self.enabled = True
+        # Totals for the current window
+        self.frames = 0
+        self.seconds = 0.0
+        self.bytes_saved = 0
+        self._skipped = 0
+
+    def compress(self, buffers: Sequence[Buffer]) -> Optional[List[Buffer]]:
+        """
+        Returns the compressed frame body for `buffers` (as buffers to send
+        after the flagged length), or None to send them as they are.
+        """
+        if not self.enabled:
+            self._skipped += 1
+            if self._skipped < self.retry_after:
+                return None
+            self.enabled = True
+            self._skipped = 0
+
+        raw_length = sum(memoryview(buffer).nbytes for buffer in buffers)
+        if raw_length < self.threshold:
+            return None
+
+        start = time.perf_counter()
+        data = buffers[0] if len(buffers) == 1 else b"".join(buffers)
+        compressed = self.codec.compress(data)
+        self.seconds += time.perf_counter() - start
+        saved = raw_length - len(compressed) - COMPRESSED_HEAD_STRUCT.size
+        self.bytes_saved += saved
+        self.frames += 1
+        if self.frames >= self.window:
+            self._weigh()
+
+        if saved <= 0:
+            return None
+        return [COMPRESSED_HEAD_STRUCT.pack(self.codec.id, raw_length), compressed]
+
+    def pays_off(self) -> bool:
+        """Whether the saved bytes would take longer to send than compressing took."""
+        return self.bytes_saved / self.link_speed > self.seconds
+
+    def _weigh(self) -> None:
+        if not self.pays_off():
+            self.enabled = False
+            print(
+                f"Compression off: {self.seconds * 1000:.1f} ms spent to save"
+                f" {self.bytes_saved / 1024:.0f} KB over {self.frames} frames.",
+                file=sys.stderr,
+            )
+        self.frames = 0
+        self.seconds = 0.0
+        self.bytes_saved = 0
@@ -1,4 +1,4 @@
-from enum import IntEnum
+import enum
 
 
 # --- Events Enum ---
@@ -14,6 +14,16 @@ class Events(enum.IntEnum):
     SPRITE_TEXTURE_LOAD = 8
     SPRITE_TEXTURE_SET = 9
     SPRITE_SET_SOURCE_RECT = 10
+    SPRITE_MOVE_F32 = 11
+    SPRITE_SCALE_F32 = 12
+    SPRITE_ROTATE_F32 = 13
+    SPRITE_SPEED_F32 = 14
+    SPRITE_BIND_HANDLE = 15
+    SPRITE_RELEASE_HANDLE = 16
+    SPRITE_MOVE_HANDLE = 17
+    SPRITE_SCALE_HANDLE = 18
+    SPRITE_ROTATE_HANDLE = 19
+    SPRITE_SPEED_HANDLE = 20
     GEOM_ADD_POINT = 50
     GEOM_ADD_LINE = 51
     GEOM_ADD_RECT = 52
@@ -52,6 +62,11 @@ class Events(enum.IntEnum):
     PHYSICS_SET_VELOCITY = 504
     PHYSICS_SET_POSITION = 505
     PHYSICS_SET_ROTATION = 506
+    PHYSICS_BIND_HANDLE = 507
+    PHYSICS_RELEASE_HANDLE = 508
+    PHYSICS_SET_VELOCITY_HANDLE = 509
+    PHYSICS_SET_POSITION_HANDLE = 510
+    PHYSICS_SET_ROTATION_HANDLE = 511
     PHYSICS_COLLISION_BEGIN = 550
     PHYSICS_COLLISION_SEPARATE = 551
     PHYSICS_SYNC_TRANSFORM = 552
@@ -75,5 +90,12 @@ class Events(enum.IntEnum):
     SCRIPT_SUBSCRIBE = 3000
     SCRIPT_UNSUBSCRIBE = 3001
 
+    EVENT_BATCH = 4000
+
+
+# Hash of the wire layout in structs.json, compared with the engine's
+# during the IPC handshake
+SCHEMA_HASH = 0x29069964D87E6B90
+
 
 # --- End Events Enum ---
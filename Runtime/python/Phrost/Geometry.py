@@ -7,12 +7,16 @@ from GeomType import GeomType
 # Imports from your existing adapter file
 # (Assuming it's saved as phrost_adapter.py)
 try:
-    from Phrost import CommandPacker, Events
+    from Phrost import Events
 except ImportError:
     print(
-        "Could not import CommandPacker/Events. Please ensure phrost_adapter.py is in the same directory."
+        "Could not import Events. Please ensure phrost_adapter.py is in the same directory."
     )
 
+from ChannelPacker import ChannelPacker
+from Channels import Channels
+from SentState import SentState
+
 
 class Geometry:
     """
@@ -37,6 +41,8 @@ class Geometry:
 
         self.dirty_flags: Dict[str, bool] = {}
         self.is_new: bool = is_new
+        # What the engine was last sent, so unchanged colors are skipped.
+        self.sent_state: SentState = SentState()
 
     # --- Configuration Setters (for initialization) ---
 
@@ -74,9 +80,11 @@ class Geometry:
             self.color["a"] = a
             if notify_engine:
                 self.dirty_flags["color"] = True
+            else:
+                self.sent_state.forget("color")
 
-    def remove(self, packer: CommandPacker) -> None:
-        packer.add(Events.GEOM_REMOVE, [self.id0, self.id1])
+    def remove(self, packer: ChannelPacker) -> None:
+        packer.add(Channels.RENDERER, Events.GEOM_REMOVE, [self.id0, self.id1])
 
     # --- Event Generation ---
 
@@ -96,7 +104,7 @@ class Geometry:
             *self.shape_data,  # Unpack the shape data
         ]
 
-    def pack_dirty_events(self, packer: CommandPacker) -> None:
+    def pack_dirty_events(self, packer: ChannelPacker) -> None:
         if self.is_new:
             if self.type is None:
                 print(
@@ -108,7 +116,8 @@ class Geometry:
 
             # Get the correct Event enum case from the GeomType
             event_enum = Events(self.type.value)
-            packer.add(event_enum, self._get_initial_add_data())
+            packer.add(Channels.RENDERER, event_enum, self._get_initial_add_data())
+            self.sent_state.record("color", self._color_values())
 
             self.is_new = False
             self.clear_dirty_flags()
@@ -117,8 +126,11 @@ class Geometry:
         if not self.dirty_flags:
             return
 
-        if "color" in self.dirty_flags:
+        if "color" in self.dirty_flags and self.sent_state.changed(
+            "color", self._color_values()
+        ):
             packer.add(
+                Channels.RENDERER,
                 Events.GEOM_SET_COLOR,
                 [
                     self.id0,
@@ -134,3 +146,6 @@ class Geometry:
 
     def clear_dirty_flags(self) -> None:
         self.dirty_flags = {}
+
+    def _color_values(self) -> tuple:
+        return (self.color["r"], self.color["g"], self.color["b"], self.color["a"])
@@ -0,0 +1,46 @@
+from typing import List
+
+# Matches SpriteManager.maxHandles in the engine: handles index a plain
+# array there, so they have to stay small.
+MAX_HANDLES = 1 << 20
+
+
+class HandleAllocator:
+    """
+    Hands out the dense u32 entity handles used by the *_HANDLE events.
+
+    A handle is bound once (SPRITE_BIND_HANDLE / PHYSICS_BIND_HANDLE) and
+    then replaces the two i64 ids in the compact events; the engine
+    resolves it with an array index instead of hashing (id1, id2).
+
+    Released handles go on a free list and are reused before new ones are
+    minted, so the engine's table stays as small as the number of live
+    entities.
+    """
+
+    def __init__(self):
+        self._next: int = 0
+        self._free: List[int] = []
+
+    def allocate(self) -> int:
+        """Returns a free handle, reusing released ones first."""
+        if self._free:
+            return self._free.pop()
+        handle = self._next
+        if handle >= MAX_HANDLES:
+            raise OverflowError(f"All {MAX_HANDLES} entity handles are in use")
+        self._next = handle + 1
+        return handle
+
+    def release(self, handle: int) -> None:
+        """Returns a handle to the free list."""
+        self._free.append(handle)
+
+    def reset(self) -> None:
+        """Forgets every handle, e.g. after the engine was restarted."""
+        self._next = 0
+        self._free.clear()
+
+    def __len__(self) -> int:
+        """The number of handles currently in use."""
+        return self._next - len(self._free)
@@ -0,0 +1,110 @@
+import struct
+import sys
+from typing import Dict, Optional, Union
+
+from Events import SCHEMA_HASH
+from PackerPool import PackerPool
+
+# Sent in place of the delta-time of the engine's welcome frame, so a
+# client can tell it apart from an ordinary event frame.
+HANDSHAKE_MAGIC = b"PHRSHAKE"
+HANDSHAKE_VERSION = 1
+
+# Optional wire features; must match WireCapabilities in PhrostIPC.
+CAP_BATCH = 1 << 0  # EVENT_BATCH containers
+CAP_F32 = 1 << 1  # SPRITE_*_F32 events
+CAP_HANDLES = 1 << 2  # u32 entity handle events
+CAP_ALL = CAP_BATCH | CAP_F32 | CAP_HANDLES
+# Frames passed through shared memory, the socket only signals them (see
+# SharedMemory.py). Opt-in: not part of CAP_ALL, and local links only.
+CAP_SHM = 1 << 3
+# Frames may be compressed (see Compression.py). Opt-in, TCP links only.
+CAP_COMPRESS = 1 << 4
+
+# [u32 channelCount = 0][4 pad][8s magic][u32 version][u32 capabilities][u64 schemaHash]
+# Shaped like a command frame with no channels, so an engine that predates
+# the handshake treats it as an empty frame.
+HELLO_STRUCT = struct.Struct("<I4x8sIIQ")
+# [8s magic][u32 version][u32 capabilities][u64 schemaHash], after the length
+WELCOME_STRUCT = struct.Struct("<8sIIQ")
+# Follows the welcome when CAP_SHM is agreed: the random name of the
+# engine's regions (see SharedMemory.region_paths)
+WELCOME_SHM_STRUCT = struct.Struct("<32s")
+
+
+def pack_hello(capabilities: int) -> bytes:
+    """Packs the hello frame body offering `capabilities`."""
+    return HELLO_STRUCT.pack(
+        0, HANDSHAKE_MAGIC, HANDSHAKE_VERSION, capabilities, SCHEMA_HASH
+    )
+
+
+def unpack_welcome(body: bytes) -> Optional[Dict[str, int]]:
+    """
+    Unpacks a welcome frame body (everything after the u32 length).
+    Returns None if it is not a welcome. "shm_name" is the region name
+    that follows it, or None if there is none.
+    """
+    if len(body) < WELCOME_STRUCT.size:
+        return None
+    magic, version, capabilities, schema_hash = WELCOME_STRUCT.unpack_from(body)
+    if magic != HANDSHAKE_MAGIC:
+        return None
+    shm_name = None
+    if len(body) >= WELCOME_STRUCT.size + WELCOME_SHM_STRUCT.size:
+        (name,) = WELCOME_SHM_STRUCT.unpack_from(body, WELCOME_STRUCT.size)
+        shm_name = name.decode("ascii", "replace")
+    return {
+        "version": version,
+        "capabilities": capabilities,
+        "schema_hash": schema_hash,
+        "shm_name": shm_name,
+    }
+
+
+def accepted_capabilities(welcome: Dict[str, int], offered: int) -> int:
+    """
+    The features both sides support, given the engine's welcome. An engine
+    generated from a different structs.json gets none (with a message on
+    stderr), since its optional events may not line up with ours.
+    """
+    if welcome["version"] != HANDSHAKE_VERSION or welcome["schema_hash"] != SCHEMA_HASH:
+        print(
+            f"Engine schema 0x{welcome['schema_hash']:016x} (version "
+            f"{welcome['version']}) differs from ours (0x{SCHEMA_HASH:016x}). "
+            "Regenerate both from the same structs.json; using the base wire format.",
+            file=sys.stderr,
+        )
+        return 0
+    return welcome["capabilities"] & offered
+
+
+def apply_capabilities(pool: PackerPool, offered: int, capabilities: int) -> None:
+    """
+    Switches each offered feature of the pool on or off to match the
+    engine; features that were not offered keep the pool's setting. Called
+    after every handshake, and with capabilities 0 on disconnect.
+    """
+
+    def agreed(feature: int, current: bool) -> bool:
+        return bool(capabilities & feature) if offered & feature else current
+
+    pool.set_capabilities(
+        batch=agreed(CAP_BATCH, pool.batch),
+        f32=agreed(CAP_F32, pool.f32),
+        handles=agreed(CAP_HANDLES, pool.sprite_handles is not None),
+    )
+
+
+def merge_event_frames(
+    first: Dict[str, Union[float, bytes]], second: Dict[str, Union[float, bytes]]
+) -> Dict[str, Union[float, bytes]]:
+    """
+    Joins two event frames into one, e.g. when an old engine took the hello
+    as the reply to its first frame and moved on to the next.
+    """
+    count = struct.Struct("<I4x")
+    blobs = [first["events_blob"], second["events_blob"]]
+    total = sum(count.unpack_from(blob)[0] for blob in blobs if len(blob) >= count.size)
+    events_blob = count.pack(total) + b"".join(blob[count.size :] for blob in blobs)
+    return {"dt": first["dt"] + second["dt"], "events_blob": events_blob}
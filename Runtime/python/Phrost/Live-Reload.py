@@ -113,6 +113,7 @@ class LiveReload:
                 Events.SPRITE_REMOVE,
                 [sprite.id0, sprite.id1],
             )
+            sprite.release_handle()
 
         for physics_body_id, physics_body in world.get("physicsBodies", {}).items():
             packer.add(
@@ -120,6 +121,7 @@ class LiveReload:
                 Events.PHYSICS_REMOVE_BODY,
                 [physics_body.id0, physics_body.id1],
             )
+            physics_body.release_handle()
 
         # This method uses the configurable self.save_path
         if self.save_path and os.path.isfile(self.save_path):
@@ -1,10 +1,17 @@
+import re
 import struct
 import sys
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Collection, Dict, Iterator, List, Optional, Tuple, Union
+
+try:
+    import numpy as np
+except ImportError:
+    np = None  # Optional: only the bulk (add_many) path uses it
 
 from Events import Events
 from PackFormats import (
     AudioPackFormats,
+    BatchPackFormats,
     CameraPackFormats,
     InputPackFormats,
     PhysicsPackFormats,
@@ -31,6 +38,16 @@ class PackFormat:
         Events.SPRITE_TEXTURE_LOAD.value: SpritePackFormats.PACK_SPRITE_TEXTURE_LOAD,
         Events.SPRITE_TEXTURE_SET.value: SpritePackFormats.PACK_SPRITE_TEXTURE_SET,
         Events.SPRITE_SET_SOURCE_RECT.value: SpritePackFormats.PACK_SPRITE_SET_SOURCE_RECT,
+        Events.SPRITE_MOVE_F32.value: SpritePackFormats.PACK_SPRITE_MOVE_F32,
+        Events.SPRITE_SCALE_F32.value: SpritePackFormats.PACK_SPRITE_SCALE_F32,
+        Events.SPRITE_ROTATE_F32.value: SpritePackFormats.PACK_SPRITE_ROTATE_F32,
+        Events.SPRITE_SPEED_F32.value: SpritePackFormats.PACK_SPRITE_SPEED_F32,
+        Events.SPRITE_BIND_HANDLE.value: SpritePackFormats.PACK_SPRITE_BIND_HANDLE,
+        Events.SPRITE_RELEASE_HANDLE.value: SpritePackFormats.PACK_SPRITE_RELEASE_HANDLE,
+        Events.SPRITE_MOVE_HANDLE.value: SpritePackFormats.PACK_SPRITE_MOVE_HANDLE,
+        Events.SPRITE_SCALE_HANDLE.value: SpritePackFormats.PACK_SPRITE_SCALE_HANDLE,
+        Events.SPRITE_ROTATE_HANDLE.value: SpritePackFormats.PACK_SPRITE_ROTATE_HANDLE,
+        Events.SPRITE_SPEED_HANDLE.value: SpritePackFormats.PACK_SPRITE_SPEED_HANDLE,
         Events.GEOM_ADD_POINT.value: SpritePackFormats.PACK_GEOM_ADD_POINT,
         Events.GEOM_ADD_LINE.value: SpritePackFormats.PACK_GEOM_ADD_LINE,
         Events.GEOM_ADD_RECT.value: SpritePackFormats.PACK_GEOM_ADD_RECT,
@@ -64,6 +81,11 @@ class PackFormat:
         Events.PHYSICS_SET_VELOCITY.value: PhysicsPackFormats.PACK_PHYSICS_SET_VELOCITY,
         Events.PHYSICS_SET_POSITION.value: PhysicsPackFormats.PACK_PHYSICS_SET_POSITION,
         Events.PHYSICS_SET_ROTATION.value: PhysicsPackFormats.PACK_PHYSICS_SET_ROTATION,
+        Events.PHYSICS_BIND_HANDLE.value: PhysicsPackFormats.PACK_PHYSICS_BIND_HANDLE,
+        Events.PHYSICS_RELEASE_HANDLE.value: PhysicsPackFormats.PACK_PHYSICS_RELEASE_HANDLE,
+        Events.PHYSICS_SET_VELOCITY_HANDLE.value: PhysicsPackFormats.PACK_PHYSICS_SET_VELOCITY_HANDLE,
+        Events.PHYSICS_SET_POSITION_HANDLE.value: PhysicsPackFormats.PACK_PHYSICS_SET_POSITION_HANDLE,
+        Events.PHYSICS_SET_ROTATION_HANDLE.value: PhysicsPackFormats.PACK_PHYSICS_SET_ROTATION_HANDLE,
         Events.PHYSICS_COLLISION_BEGIN.value: PhysicsPackFormats.UNPACK_PHYSICS_COLLISION,
         Events.PHYSICS_COLLISION_SEPARATE.value: PhysicsPackFormats.UNPACK_PHYSICS_COLLISION,
         Events.PHYSICS_SYNC_TRANSFORM.value: PhysicsPackFormats.UNPACK_PHYSICS_SYNC_TRANSFORM,
@@ -83,6 +105,260 @@ class PackFormat:
         Events.CAMERA_STOP_FOLLOWING.value: CameraPackFormats.PACK_CAMERA_STOP_FOLLOWING,
         Events.SCRIPT_SUBSCRIBE.value: ScriptPackFormats.PACK_SCRIPT_SUBSCRIBE,
         Events.SCRIPT_UNSUBSCRIBE.value: ScriptPackFormats.PACK_SCRIPT_UNSUBSCRIBE,
+        Events.EVENT_BATCH.value: BatchPackFormats.PACK_EVENT_BATCH,
+    }
+
+    # Pre-compiled structs, so the hot path never re-parses a format string
+    _COUNT_STRUCT = struct.Struct("<I4x")
+    _HEADER_STRUCT = struct.Struct("<IQ4x")
+
+    # Header + payload + padding, indexed by event id (used by CommandPacker)
+    _EVENT_STRUCT_MAP: Dict[int, struct.Struct] = {
+        Events.SPRITE_ADD.value: struct.Struct("<IQ4xqqdddddddddddBBBB4xdd"),
+        Events.SPRITE_REMOVE.value: struct.Struct("<IQ4xqq"),
+        Events.SPRITE_MOVE.value: struct.Struct("<IQ4xqqddd"),
+        Events.SPRITE_SCALE.value: struct.Struct("<IQ4xqqddd"),
+        Events.SPRITE_RESIZE.value: struct.Struct("<IQ4xqqdd"),
+        Events.SPRITE_ROTATE.value: struct.Struct("<IQ4xqqddd"),
+        Events.SPRITE_COLOR.value: struct.Struct("<IQ4xqqBBBB4x"),
+        Events.SPRITE_SPEED.value: struct.Struct("<IQ4xqqdd"),
+        Events.SPRITE_TEXTURE_LOAD.value: struct.Struct("<IQ4xqqI4x"),
+        Events.SPRITE_TEXTURE_SET.value: struct.Struct("<IQ4xqqQ"),
+        Events.SPRITE_SET_SOURCE_RECT.value: struct.Struct("<IQ4xqqffff"),
+        Events.SPRITE_MOVE_F32.value: struct.Struct("<IQ4xqqfff4x"),
+        Events.SPRITE_SCALE_F32.value: struct.Struct("<IQ4xqqfff4x"),
+        Events.SPRITE_ROTATE_F32.value: struct.Struct("<IQ4xqqfff4x"),
+        Events.SPRITE_SPEED_F32.value: struct.Struct("<IQ4xqqff"),
+        Events.SPRITE_BIND_HANDLE.value: struct.Struct("<IQ4xqqI4x"),
+        Events.SPRITE_RELEASE_HANDLE.value: struct.Struct("<IQ4xI4x"),
+        Events.SPRITE_MOVE_HANDLE.value: struct.Struct("<IQ4xIfff"),
+        Events.SPRITE_SCALE_HANDLE.value: struct.Struct("<IQ4xIfff"),
+        Events.SPRITE_ROTATE_HANDLE.value: struct.Struct("<IQ4xIfff"),
+        Events.SPRITE_SPEED_HANDLE.value: struct.Struct("<IQ4xIff4x"),
+        Events.GEOM_ADD_POINT.value: struct.Struct("<IQ4xqqdBBBBB3xff"),
+        Events.GEOM_ADD_LINE.value: struct.Struct("<IQ4xqqdBBBBB3xffff"),
+        Events.GEOM_ADD_RECT.value: struct.Struct("<IQ4xqqdBBBBB3xffff"),
+        Events.GEOM_ADD_FILL_RECT.value: struct.Struct("<IQ4xqqdBBBBB3xffff"),
+        Events.GEOM_ADD_PACKED.value: struct.Struct("<IQ4xqqdBBBBB2xII1x"),
+        Events.GEOM_REMOVE.value: struct.Struct("<IQ4xqq"),
+        Events.GEOM_SET_COLOR.value: struct.Struct("<IQ4xqqBBBB4x"),
+        Events.INPUT_KEYUP.value: struct.Struct("<IQ4xiIHBx4x"),
+        Events.INPUT_KEYDOWN.value: struct.Struct("<IQ4xiIHBx4x"),
+        Events.INPUT_MOUSEUP.value: struct.Struct("<IQ4xffBB2x4x"),
+        Events.INPUT_MOUSEDOWN.value: struct.Struct("<IQ4xffBB2x4x"),
+        Events.INPUT_MOUSEMOTION.value: struct.Struct("<IQ4xffff"),
+        Events.WINDOW_TITLE.value: struct.Struct("<IQ4x256s"),
+        Events.WINDOW_RESIZE.value: struct.Struct("<IQ4xii"),
+        Events.WINDOW_FLAGS.value: struct.Struct("<IQ4xQ"),
+        Events.TEXT_ADD.value: struct.Struct("<IQ4xqqdddBBBB4xfII4x"),
+        Events.TEXT_SET_STRING.value: struct.Struct("<IQ4xqqI4x"),
+        Events.AUDIO_LOAD.value: struct.Struct("<IQ4xI4x"),
+        Events.AUDIO_LOADED.value: struct.Struct("<IQ4xQ"),
+        Events.AUDIO_PLAY.value: struct.Struct("<IQ4xQ"),
+        Events.AUDIO_STOP_ALL.value: struct.Struct("<IQ4xB7x"),
+        Events.AUDIO_SET_MASTER_VOLUME.value: struct.Struct("<IQ4xf4x"),
+        Events.AUDIO_PAUSE.value: struct.Struct("<IQ4xQ"),
+        Events.AUDIO_STOP.value: struct.Struct("<IQ4xQ"),
+        Events.AUDIO_UNLOAD.value: struct.Struct("<IQ4xQ"),
+        Events.AUDIO_SET_VOLUME.value: struct.Struct("<IQ4xQf4x"),
+        Events.PHYSICS_ADD_BODY.value: struct.Struct("<IQ4xqqddBBB5xddddd"),
+        Events.PHYSICS_REMOVE_BODY.value: struct.Struct("<IQ4xqq"),
+        Events.PHYSICS_APPLY_FORCE.value: struct.Struct("<IQ4xqqdd"),
+        Events.PHYSICS_APPLY_IMPULSE.value: struct.Struct("<IQ4xqqdd"),
+        Events.PHYSICS_SET_VELOCITY.value: struct.Struct("<IQ4xqqdd"),
+        Events.PHYSICS_SET_POSITION.value: struct.Struct("<IQ4xqqdd"),
+        Events.PHYSICS_SET_ROTATION.value: struct.Struct("<IQ4xqqd"),
+        Events.PHYSICS_BIND_HANDLE.value: struct.Struct("<IQ4xqqI4x"),
+        Events.PHYSICS_RELEASE_HANDLE.value: struct.Struct("<IQ4xI4x"),
+        Events.PHYSICS_SET_VELOCITY_HANDLE.value: struct.Struct("<IQ4xI4xdd"),
+        Events.PHYSICS_SET_POSITION_HANDLE.value: struct.Struct("<IQ4xI4xdd"),
+        Events.PHYSICS_SET_ROTATION_HANDLE.value: struct.Struct("<IQ4xI4xd"),
+        Events.PHYSICS_COLLISION_BEGIN.value: struct.Struct("<IQ4xqqqq"),
+        Events.PHYSICS_COLLISION_SEPARATE.value: struct.Struct("<IQ4xqqqq"),
+        Events.PHYSICS_SYNC_TRANSFORM.value: struct.Struct("<IQ4xqqddddddB7x"),
+        Events.PHYSICS_SET_DEBUG_MODE.value: struct.Struct("<IQ4xB3x4x"),
+        Events.PLUGIN.value: struct.Struct("<IQ4xB7x"),
+        Events.PLUGIN_LOAD.value: struct.Struct("<IQ4xII"),
+        Events.PLUGIN_UNLOAD.value: struct.Struct("<IQ4xB7x"),
+        Events.PLUGIN_SET.value: struct.Struct("<IQ4xB7x"),
+        Events.PLUGIN_EVENT_STACKING.value: struct.Struct("<IQ4xBx6x"),
+        Events.PLUGIN_SUBSCRIBE_EVENT.value: struct.Struct("<IQ4xB3xI"),
+        Events.PLUGIN_UNSUBSCRIBE_EVENT.value: struct.Struct("<IQ4xB3xI"),
+        Events.CAMERA_SET_POSITION.value: struct.Struct("<IQ4xdd"),
+        Events.CAMERA_MOVE.value: struct.Struct("<IQ4xdd"),
+        Events.CAMERA_SET_ZOOM.value: struct.Struct("<IQ4xd"),
+        Events.CAMERA_SET_ROTATION.value: struct.Struct("<IQ4xd"),
+        Events.CAMERA_FOLLOW_ENTITY.value: struct.Struct("<IQ4xqq"),
+        Events.CAMERA_STOP_FOLLOWING.value: struct.Struct("<IQ4xB7x"),
+        Events.SCRIPT_SUBSCRIBE.value: struct.Struct("<IQ4xI4x"),
+        Events.SCRIPT_UNSUBSCRIBE.value: struct.Struct("<IQ4xI4x"),
+        Events.EVENT_BATCH.value: struct.Struct("<IQ4xII"),
+    }
+
+    # Payload only, indexed by event id (used by unpack)
+    _PAYLOAD_STRUCT_MAP: Dict[int, struct.Struct] = {
+        Events.SPRITE_ADD.value: struct.Struct("<qqdddddddddddBBBB4xdd"),
+        Events.SPRITE_REMOVE.value: struct.Struct("<qq"),
+        Events.SPRITE_MOVE.value: struct.Struct("<qqddd"),
+        Events.SPRITE_SCALE.value: struct.Struct("<qqddd"),
+        Events.SPRITE_RESIZE.value: struct.Struct("<qqdd"),
+        Events.SPRITE_ROTATE.value: struct.Struct("<qqddd"),
+        Events.SPRITE_COLOR.value: struct.Struct("<qqBBBB4x"),
+        Events.SPRITE_SPEED.value: struct.Struct("<qqdd"),
+        Events.SPRITE_TEXTURE_LOAD.value: struct.Struct("<qqI4x"),
+        Events.SPRITE_TEXTURE_SET.value: struct.Struct("<qqQ"),
+        Events.SPRITE_SET_SOURCE_RECT.value: struct.Struct("<qqffff"),
+        Events.SPRITE_MOVE_F32.value: struct.Struct("<qqfff4x"),
+        Events.SPRITE_SCALE_F32.value: struct.Struct("<qqfff4x"),
+        Events.SPRITE_ROTATE_F32.value: struct.Struct("<qqfff4x"),
+        Events.SPRITE_SPEED_F32.value: struct.Struct("<qqff"),
+        Events.SPRITE_BIND_HANDLE.value: struct.Struct("<qqI4x"),
+        Events.SPRITE_RELEASE_HANDLE.value: struct.Struct("<I4x"),
+        Events.SPRITE_MOVE_HANDLE.value: struct.Struct("<Ifff"),
+        Events.SPRITE_SCALE_HANDLE.value: struct.Struct("<Ifff"),
+        Events.SPRITE_ROTATE_HANDLE.value: struct.Struct("<Ifff"),
+        Events.SPRITE_SPEED_HANDLE.value: struct.Struct("<Iff4x"),
+        Events.GEOM_ADD_POINT.value: struct.Struct("<qqdBBBBB3xff"),
+        Events.GEOM_ADD_LINE.value: struct.Struct("<qqdBBBBB3xffff"),
+        Events.GEOM_ADD_RECT.value: struct.Struct("<qqdBBBBB3xffff"),
+        Events.GEOM_ADD_FILL_RECT.value: struct.Struct("<qqdBBBBB3xffff"),
+        Events.GEOM_ADD_PACKED.value: struct.Struct("<qqdBBBBB2xII"),
+        Events.GEOM_REMOVE.value: struct.Struct("<qq"),
+        Events.GEOM_SET_COLOR.value: struct.Struct("<qqBBBB4x"),
+        Events.INPUT_KEYUP.value: struct.Struct("<iIHBx"),
+        Events.INPUT_KEYDOWN.value: struct.Struct("<iIHBx"),
+        Events.INPUT_MOUSEUP.value: struct.Struct("<ffBB2x"),
+        Events.INPUT_MOUSEDOWN.value: struct.Struct("<ffBB2x"),
+        Events.INPUT_MOUSEMOTION.value: struct.Struct("<ffff"),
+        Events.WINDOW_TITLE.value: struct.Struct("<256s"),
+        Events.WINDOW_RESIZE.value: struct.Struct("<ii"),
+        Events.WINDOW_FLAGS.value: struct.Struct("<Q"),
+        Events.TEXT_ADD.value: struct.Struct("<qqdddBBBB4xfII4x"),
+        Events.TEXT_SET_STRING.value: struct.Struct("<qqI4x"),
+        Events.AUDIO_LOAD.value: struct.Struct("<I"),
+        Events.AUDIO_LOADED.value: struct.Struct("<Q"),
+        Events.AUDIO_PLAY.value: struct.Struct("<Q"),
+        Events.AUDIO_STOP_ALL.value: struct.Struct("<B"),
+        Events.AUDIO_SET_MASTER_VOLUME.value: struct.Struct("<f"),
+        Events.AUDIO_PAUSE.value: struct.Struct("<Q"),
+        Events.AUDIO_STOP.value: struct.Struct("<Q"),
+        Events.AUDIO_UNLOAD.value: struct.Struct("<Q"),
+        Events.AUDIO_SET_VOLUME.value: struct.Struct("<Qf4x"),
+        Events.PHYSICS_ADD_BODY.value: struct.Struct("<qqddBBB5xddddd"),
+        Events.PHYSICS_REMOVE_BODY.value: struct.Struct("<qq"),
+        Events.PHYSICS_APPLY_FORCE.value: struct.Struct("<qqdd"),
+        Events.PHYSICS_APPLY_IMPULSE.value: struct.Struct("<qqdd"),
+        Events.PHYSICS_SET_VELOCITY.value: struct.Struct("<qqdd"),
+        Events.PHYSICS_SET_POSITION.value: struct.Struct("<qqdd"),
+        Events.PHYSICS_SET_ROTATION.value: struct.Struct("<qqd"),
+        Events.PHYSICS_BIND_HANDLE.value: struct.Struct("<qqI4x"),
+        Events.PHYSICS_RELEASE_HANDLE.value: struct.Struct("<I4x"),
+        Events.PHYSICS_SET_VELOCITY_HANDLE.value: struct.Struct("<I4xdd"),
+        Events.PHYSICS_SET_POSITION_HANDLE.value: struct.Struct("<I4xdd"),
+        Events.PHYSICS_SET_ROTATION_HANDLE.value: struct.Struct("<I4xd"),
+        Events.PHYSICS_COLLISION_BEGIN.value: struct.Struct("<qqqq"),
+        Events.PHYSICS_COLLISION_SEPARATE.value: struct.Struct("<qqqq"),
+        Events.PHYSICS_SYNC_TRANSFORM.value: struct.Struct("<qqddddddB7x"),
+        Events.PHYSICS_SET_DEBUG_MODE.value: struct.Struct("<B3x"),
+        Events.PLUGIN.value: struct.Struct("<B"),
+        Events.PLUGIN_LOAD.value: struct.Struct("<II"),
+        Events.PLUGIN_UNLOAD.value: struct.Struct("<B"),
+        Events.PLUGIN_SET.value: struct.Struct("<B"),
+        Events.PLUGIN_EVENT_STACKING.value: struct.Struct("<Bx"),
+        Events.PLUGIN_SUBSCRIBE_EVENT.value: struct.Struct("<B3xI"),
+        Events.PLUGIN_UNSUBSCRIBE_EVENT.value: struct.Struct("<B3xI"),
+        Events.CAMERA_SET_POSITION.value: struct.Struct("<dd"),
+        Events.CAMERA_MOVE.value: struct.Struct("<dd"),
+        Events.CAMERA_SET_ZOOM.value: struct.Struct("<d"),
+        Events.CAMERA_SET_ROTATION.value: struct.Struct("<d"),
+        Events.CAMERA_FOLLOW_ENTITY.value: struct.Struct("<qq"),
+        Events.CAMERA_STOP_FOLLOWING.value: struct.Struct("<B"),
+        Events.SCRIPT_SUBSCRIBE.value: struct.Struct("<I4x"),
+        Events.SCRIPT_UNSUBSCRIBE.value: struct.Struct("<I4x"),
+        Events.EVENT_BATCH.value: struct.Struct("<II"),
+    }
+
+    # Payload + padding, indexed by event id (one entry of an EVENT_BATCH)
+    _BATCH_PAYLOAD_STRUCT_MAP: Dict[int, struct.Struct] = {
+        Events.SPRITE_ADD.value: struct.Struct("<qqdddddddddddBBBB4xdd"),
+        Events.SPRITE_REMOVE.value: struct.Struct("<qq"),
+        Events.SPRITE_MOVE.value: struct.Struct("<qqddd"),
+        Events.SPRITE_SCALE.value: struct.Struct("<qqddd"),
+        Events.SPRITE_RESIZE.value: struct.Struct("<qqdd"),
+        Events.SPRITE_ROTATE.value: struct.Struct("<qqddd"),
+        Events.SPRITE_COLOR.value: struct.Struct("<qqBBBB4x"),
+        Events.SPRITE_SPEED.value: struct.Struct("<qqdd"),
+        Events.SPRITE_TEXTURE_LOAD.value: struct.Struct("<qqI4x"),
+        Events.SPRITE_TEXTURE_SET.value: struct.Struct("<qqQ"),
+        Events.SPRITE_SET_SOURCE_RECT.value: struct.Struct("<qqffff"),
+        Events.SPRITE_MOVE_F32.value: struct.Struct("<qqfff4x"),
+        Events.SPRITE_SCALE_F32.value: struct.Struct("<qqfff4x"),
+        Events.SPRITE_ROTATE_F32.value: struct.Struct("<qqfff4x"),
+        Events.SPRITE_SPEED_F32.value: struct.Struct("<qqff"),
+        Events.SPRITE_BIND_HANDLE.value: struct.Struct("<qqI4x"),
+        Events.SPRITE_RELEASE_HANDLE.value: struct.Struct("<I4x"),
+        Events.SPRITE_MOVE_HANDLE.value: struct.Struct("<Ifff"),
+        Events.SPRITE_SCALE_HANDLE.value: struct.Struct("<Ifff"),
+        Events.SPRITE_ROTATE_HANDLE.value: struct.Struct("<Ifff"),
+        Events.SPRITE_SPEED_HANDLE.value: struct.Struct("<Iff4x"),
+        Events.GEOM_ADD_POINT.value: struct.Struct("<qqdBBBBB3xff"),
+        Events.GEOM_ADD_LINE.value: struct.Struct("<qqdBBBBB3xffff"),
+        Events.GEOM_ADD_RECT.value: struct.Struct("<qqdBBBBB3xffff"),
+        Events.GEOM_ADD_FILL_RECT.value: struct.Struct("<qqdBBBBB3xffff"),
+        Events.GEOM_ADD_PACKED.value: struct.Struct("<qqdBBBBB2xII1x"),
+        Events.GEOM_REMOVE.value: struct.Struct("<qq"),
+        Events.GEOM_SET_COLOR.value: struct.Struct("<qqBBBB4x"),
+        Events.INPUT_KEYUP.value: struct.Struct("<iIHBx4x"),
+        Events.INPUT_KEYDOWN.value: struct.Struct("<iIHBx4x"),
+        Events.INPUT_MOUSEUP.value: struct.Struct("<ffBB2x4x"),
+        Events.INPUT_MOUSEDOWN.value: struct.Struct("<ffBB2x4x"),
+        Events.INPUT_MOUSEMOTION.value: struct.Struct("<ffff"),
+        Events.WINDOW_TITLE.value: struct.Struct("<256s"),
+        Events.WINDOW_RESIZE.value: struct.Struct("<ii"),
+        Events.WINDOW_FLAGS.value: struct.Struct("<Q"),
+        Events.TEXT_ADD.value: struct.Struct("<qqdddBBBB4xfII4x"),
+        Events.TEXT_SET_STRING.value: struct.Struct("<qqI4x"),
+        Events.AUDIO_LOAD.value: struct.Struct("<I4x"),
+        Events.AUDIO_LOADED.value: struct.Struct("<Q"),
+        Events.AUDIO_PLAY.value: struct.Struct("<Q"),
+        Events.AUDIO_STOP_ALL.value: struct.Struct("<B7x"),
+        Events.AUDIO_SET_MASTER_VOLUME.value: struct.Struct("<f4x"),
+        Events.AUDIO_PAUSE.value: struct.Struct("<Q"),
+        Events.AUDIO_STOP.value: struct.Struct("<Q"),
+        Events.AUDIO_UNLOAD.value: struct.Struct("<Q"),
+        Events.AUDIO_SET_VOLUME.value: struct.Struct("<Qf4x"),
+        Events.PHYSICS_ADD_BODY.value: struct.Struct("<qqddBBB5xddddd"),
+        Events.PHYSICS_REMOVE_BODY.value: struct.Struct("<qq"),
+        Events.PHYSICS_APPLY_FORCE.value: struct.Struct("<qqdd"),
+        Events.PHYSICS_APPLY_IMPULSE.value: struct.Struct("<qqdd"),
+        Events.PHYSICS_SET_VELOCITY.value: struct.Struct("<qqdd"),
+        Events.PHYSICS_SET_POSITION.value: struct.Struct("<qqdd"),
+        Events.PHYSICS_SET_ROTATION.value: struct.Struct("<qqd"),
+        Events.PHYSICS_BIND_HANDLE.value: struct.Struct("<qqI4x"),
+        Events.PHYSICS_RELEASE_HANDLE.value: struct.Struct("<I4x"),
+        Events.PHYSICS_SET_VELOCITY_HANDLE.value: struct.Struct("<I4xdd"),
+        Events.PHYSICS_SET_POSITION_HANDLE.value: struct.Struct("<I4xdd"),
+        Events.PHYSICS_SET_ROTATION_HANDLE.value: struct.Struct("<I4xd"),
+        Events.PHYSICS_COLLISION_BEGIN.value: struct.Struct("<qqqq"),
+        Events.PHYSICS_COLLISION_SEPARATE.value: struct.Struct("<qqqq"),
+        Events.PHYSICS_SYNC_TRANSFORM.value: struct.Struct("<qqddddddB7x"),
+        Events.PHYSICS_SET_DEBUG_MODE.value: struct.Struct("<B3x4x"),
+        Events.PLUGIN.value: struct.Struct("<B7x"),
+        Events.PLUGIN_LOAD.value: struct.Struct("<II"),
+        Events.PLUGIN_UNLOAD.value: struct.Struct("<B7x"),
+        Events.PLUGIN_SET.value: struct.Struct("<B7x"),
+        Events.PLUGIN_EVENT_STACKING.value: struct.Struct("<Bx6x"),
+        Events.PLUGIN_SUBSCRIBE_EVENT.value: struct.Struct("<B3xI"),
+        Events.PLUGIN_UNSUBSCRIBE_EVENT.value: struct.Struct("<B3xI"),
+        Events.CAMERA_SET_POSITION.value: struct.Struct("<dd"),
+        Events.CAMERA_MOVE.value: struct.Struct("<dd"),
+        Events.CAMERA_SET_ZOOM.value: struct.Struct("<d"),
+        Events.CAMERA_SET_ROTATION.value: struct.Struct("<d"),
+        Events.CAMERA_FOLLOW_ENTITY.value: struct.Struct("<qq"),
+        Events.CAMERA_STOP_FOLLOWING.value: struct.Struct("<B7x"),
+        Events.SCRIPT_SUBSCRIBE.value: struct.Struct("<I4x"),
+        Events.SCRIPT_UNSUBSCRIBE.value: struct.Struct("<I4x"),
+        Events.EVENT_BATCH.value: struct.Struct("<II"),
     }
 
     # This map holds the pre-computed keys for each event
@@ -118,6 +394,16 @@ class PackFormat:
         8: ["id1", "id2", "filenameLength"],
         9: ["id1", "id2", "textureId"],
         10: ["id1", "id2", "x", "y", "w", "h"],
+        11: ["id1", "id2", "positionX", "positionY", "positionZ"],
+        12: ["id1", "id2", "scaleX", "scaleY", "scaleZ"],
+        13: ["id1", "id2", "rotationX", "rotationY", "rotationZ"],
+        14: ["id1", "id2", "speedX", "speedY"],
+        15: ["id1", "id2", "handle"],
+        16: ["handle"],
+        17: ["handle", "positionX", "positionY", "positionZ"],
+        18: ["handle", "scaleX", "scaleY", "scaleZ"],
+        19: ["handle", "rotationX", "rotationY", "rotationZ"],
+        20: ["handle", "speedX", "speedY"],
         50: ["id1", "id2", "z", "r", "g", "b", "a", "isScreenSpace", "x", "y"],
         51: [
             "id1",
@@ -201,7 +487,7 @@ class PackFormat:
         400: ["pathLength"],
         401: ["audioId"],
         402: ["audioId"],
-        403: [],
+        403: ["_unused"],
         404: ["volume"],
         405: ["audioId"],
         406: ["audioId"],
@@ -227,6 +513,11 @@ class PackFormat:
         504: ["id1", "id2", "velocityX", "velocityY"],
         505: ["id1", "id2", "positionX", "positionY"],
         506: ["id1", "id2", "angleInRadians"],
+        507: ["id1", "id2", "handle"],
+        508: ["handle"],
+        509: ["handle", "velocityX", "velocityY"],
+        510: ["handle", "positionX", "positionY"],
+        511: ["handle", "angleInRadians"],
         550: ["id1_A", "id2_A", "id1_B", "id2_B"],
         551: ["id1_A", "id2_A", "id1_B", "id2_B"],
         552: [
@@ -240,6 +531,7 @@ class PackFormat:
             "angularVelocity",
             "isSleeping",
         ],
+        553: ["enabled"],
         1000: ["eventId"],
         1001: ["channelNo", "pathLength"],
         1002: ["pluginId"],
@@ -252,11 +544,73 @@ class PackFormat:
         2002: ["zoom"],
         2003: ["angleInRadians"],
         2004: ["id1", "id2"],
-        2005: [],
+        2005: ["_unused"],
         3000: ["channelNo"],
         3001: ["channelNo"],
+        4000: ["eventType", "count"],
+    }
+
+    # struct codes -> NumPy dtype strings, used by get_dtype()
+    _DTYPE_CODES: Dict[str, str] = {
+        "b": "i1",
+        "B": "u1",
+        "h": "<i2",
+        "H": "<u2",
+        "i": "<i4",
+        "I": "<u4",
+        "q": "<i8",
+        "Q": "<u8",
+        "f": "<f4",
+        "d": "<f8",
+    }
+    _DTYPE_CACHE: Dict[Tuple[int, bool], Any] = {}
+
+    # Events with data after their struct. These are never sent inside
+    # an EVENT_BATCH, which only holds fixed-size payloads.
+    _VARIABLE_LENGTH_EVENTS = frozenset(
+        (
+            Events.SPRITE_TEXTURE_LOAD,
+            Events.PLUGIN_LOAD,
+            Events.AUDIO_LOAD,
+            Events.TEXT_ADD,
+            Events.TEXT_SET_STRING,
+            Events.GEOM_ADD_PACKED,
+            Events.EVENT_BATCH,
+        )
+    )
+
+    # The strings after the struct of each variable-length event, as
+    # (name, length key) pairs in wire order. Each starts on an 8-byte
+    # boundary and is padded to one.
+    _EVENT_TAILS: Dict[int, Tuple[Tuple[str, str], ...]] = {
+        Events.SPRITE_TEXTURE_LOAD: (("filename", "filenameLength"),),
+        Events.PLUGIN_LOAD: (("path", "pathLength"),),
+        Events.AUDIO_LOAD: (("path", "pathLength"),),
+        Events.TEXT_ADD: (("fontPath", "fontPathLength"), ("text", "textLength")),
+        Events.TEXT_SET_STRING: (("text", "textLength"),),
+    }
+
+    # Length keys the dicts from unpack() have never had, left out so
+    # they keep the shape existing handlers read
+    _DICT_OMITTED_KEYS: Dict[int, Tuple[str, ...]] = {
+        Events.SPRITE_TEXTURE_LOAD: ("filenameLength",),
+    }
+
+    # The keys of unpack()'s dict for each event, in header + payload order
+    _DICT_KEY_MAP: Dict[int, Tuple[str, ...]] = {
+        event_type: ("type", "timestamp") + tuple(keys)
+        for event_type, keys in _EVENT_KEY_MAP.items()
     }
 
+    # Just the event type from a header
+    _TYPE_STRUCT = struct.Struct("<I")
+
+    # EventView subclasses, built on first use by get_view_class()
+    _VIEW_CLASSES: Dict[int, type] = {}
+
+    # Generated EventRecord subclasses, filled in below their definitions
+    _RECORD_CLASSES: Dict[int, type] = {}
+
     @staticmethod
     def get_info(event_type_value: int) -> Optional[Tuple[str, int]]:
         """
@@ -265,243 +619,2710 @@ class PackFormat:
         return PackFormat._EVENT_FORMAT_MAP.get(event_type_value)
 
     @staticmethod
-    def unpack(events_blob: bytes) -> List[Dict[str, Any]]:
+    def get_struct(event_type_value: int) -> Optional[struct.Struct]:
+        """
+        Gets the pre-compiled header + payload struct for a given event ID.
+        """
+        return PackFormat._EVENT_STRUCT_MAP.get(event_type_value)
+
+    @staticmethod
+    def get_dtype(event_type_value: int, header: bool = True) -> Optional[Any]:
+        """
+        Gets a NumPy structured dtype matching the header + payload layout
+        of an event, with fields "type", "timestamp" and the keys from
+        _EVENT_KEY_MAP. With header=False it matches one padded payload
+        inside an EVENT_BATCH instead. Returns None if NumPy isn't installed.
+        """
+        if np is None:
+            return None
+        dtype = PackFormat._DTYPE_CACHE.get((event_type_value, header))
+        if dtype is not None:
+            return dtype
+
+        if header:
+            event_struct = PackFormat._EVENT_STRUCT_MAP[event_type_value]
+            names = ["type", "timestamp"] + PackFormat._EVENT_KEY_MAP[event_type_value]
+        else:
+            event_struct = PackFormat._BATCH_PAYLOAD_STRUCT_MAP[event_type_value]
+            names = list(PackFormat._EVENT_KEY_MAP[event_type_value])
+        formats = []
+        offsets = []
+        offset = 0
+        for count, code in re.findall(r"(\d*)([a-zA-Z?])", event_struct.format[1:]):
+            count = int(count) if count else 1
+            if code == "x":
+                offset += count
+                continue
+            field = f"S{count}" if code == "s" else PackFormat._DTYPE_CODES[code]
+            formats.append(field)
+            offsets.append(offset)
+            offset += np.dtype(field).itemsize
+
+        dtype = np.dtype(
+            {
+                "names": names,
+                "formats": formats,
+                "offsets": offsets,
+                "itemsize": event_struct.size,
+            }
+        )
+        PackFormat._DTYPE_CACHE[(event_type_value, header)] = dtype
+        return dtype
+
+    @staticmethod
+    def get_view_class(event_type_value: int) -> Optional[type]:
+        """
+        Gets the EventView subclass for an event ID, building it on first
+        use: one property per key in _EVENT_KEY_MAP, each reading its field
+        with its own pre-compiled struct. Returns None for unknown event
+        types and EVENT_BATCH (whose entries are yielded as their own type).
+        """
+        view_class = PackFormat._VIEW_CLASSES.get(event_type_value)
+        if view_class is not None:
+            return view_class
+        payload_struct = PackFormat._PAYLOAD_STRUCT_MAP.get(event_type_value)
+        if payload_struct is None or event_type_value == Events.EVENT_BATCH:
+            return None
+
+        keys = PackFormat._EVENT_KEY_MAP[event_type_value]
+        tails = PackFormat._EVENT_TAILS.get(event_type_value, ())
+        namespace: Dict[str, Any] = {
+            "__slots__": ("_tails",) if tails else (),
+            "type": event_type_value,
+            "_payload": payload_struct,
+            "_event": struct.Struct(
+                PackFormat._HEADER_STRUCT.format + payload_struct.format[1:]
+            ),
+            "_keys": tuple(keys),
+            "_dict_keys": ("type", "timestamp") + tuple(keys),
+            "_tail_names": tuple(name for name, _ in tails),
+        }
+        key_iter = iter(keys)
+        offset = 0
+        for count, code in re.findall(r"(\d*)([a-zA-Z?])", payload_struct.format[1:]):
+            count = int(count) if count else 1
+            if code == "x":
+                offset += count
+                continue
+            field = f"{count}s" if code == "s" else code
+            namespace[next(key_iter)] = EventView._field(
+                struct.Struct(f"<{offset}x{field}")
+            )
+            offset += struct.calcsize(f"<{field}")
+        for index, (name, _) in enumerate(tails):
+            namespace[name] = EventView._tail(index)
+
+        view_class = type(
+            f"{Events(event_type_value).name}_View", (EventView,), namespace
+        )
+        PackFormat._VIEW_CLASSES[event_type_value] = view_class
+        return view_class
+
+    @staticmethod
+    def unpack_views(
+        events_blob: Union[bytes, bytearray, memoryview],
+        wanted: Optional[Collection[int]] = None,
+    ) -> Iterator["EventView"]:
         """
-        Unpacks a binary blob of events (Assumes <I for count/type).
+        Yields a lazy EventView per event in a binary blob of events.
+
+        This is a single pass over a memoryview that only reads each event's
+        type (and the lengths of any string tails) to find the next one;
+        fields are decoded when they are read. Entries of an EVENT_BATCH are
+        yielded as views of their own type. Stops (with a message on stderr)
+        at the first unknown or truncated event, like unpack().
+
+        :param wanted: Event ids to yield (e.g. the types a handler
+                       checks for). Any other event is stepped over by its
+                       size from _EVENT_STRUCT_MAP without building a
+                       view; a batch of them is skipped in one step.
         """
-        events = []
-        blob_length = len(events_blob)
-        if blob_length < 4:
-            return []
-
-        try:
-            # PHP 'V' = unsigned 32-bit LE -> Python '<I'
-            event_count = struct.unpack_from("<I", events_blob, 0)[0]
-            offset = 4
-        except struct.error:
-            print("PackFormat.unpack: Failed to unpack event count.", file=sys.stderr)
-            return []
+        buffer = memoryview(events_blob).cast("B")
+        blob_length = len(buffer)
+        if blob_length < PackFormat._COUNT_STRUCT.size:
+            return
+
+        event_count = PackFormat._COUNT_STRUCT.unpack_from(buffer, 0)[0]
+        offset = PackFormat._COUNT_STRUCT.size
+        header_size = PackFormat._HEADER_STRUCT.size
+        read_type = PackFormat._TYPE_STRUCT.unpack_from
+        view_classes = PackFormat._VIEW_CLASSES
+        event_structs = PackFormat._EVENT_STRUCT_MAP
+        variable_length = PackFormat._VARIABLE_LENGTH_EVENTS
+        batch_type_value = Events.EVENT_BATCH.value
 
         for i in range(event_count):
-            # Header: <I (type) + <Q (timestamp) = 4 + 8 = 12 bytes
-            header_size = 12
-            if offset + header_size > blob_length:
+            header = offset
+            offset += header_size
+            if offset > blob_length:
                 print(
-                    f"PackFormat.unpack Loop {i}/{event_count}: Not enough data for header. Offset={offset}",
+                    f"PackFormat.unpack_views Loop {i}/{event_count}: Not enough data for header. Offset={header}",
                     file=sys.stderr,
                 )
-                break
+                return
 
-            try:
-                header_data = struct.unpack_from("<IQ", events_blob, offset)
-                offset += header_size
-                event_type, timestamp = header_data
-                event = {"type": event_type, "timestamp": timestamp}
-            except struct.error:
-                print(
-                    f"PackFormat.unpack Loop {i}/{event_count}: Failed to unpack header. Offset={offset}",
-                    file=sys.stderr,
-                )
-                break
+            event_type = read_type(buffer, header)[0]
+            if (
+                wanted is not None
+                and event_type not in wanted
+                and event_type not in variable_length
+            ):
+                # Unwanted fixed-size event: its padded size is all we need
+                event_struct = event_structs.get(event_type)
+                if event_struct is not None:
+                    offset = header + event_struct.size
+                    if offset > blob_length:
+                        print(
+                            f"PackFormat.unpack_views: Not enough data for {Events(event_type).name}. Stopping parse.",
+                            file=sys.stderr,
+                        )
+                        return
+                    continue
+
+            view_class = view_classes.get(event_type) or PackFormat.get_view_class(
+                event_type
+            )
+
+            if view_class is not None:
+                end = offset + view_class._payload.size
+                if end > blob_length:
+                    print(
+                        f"PackFormat.unpack_views: Not enough data for {view_class.__name__} payload. Stopping parse.",
+                        file=sys.stderr,
+                    )
+                    return
+                view = view_class(buffer, offset, header)
+                if view_class._tail_names:
+                    tails = []
+                    for name, length_key in PackFormat._EVENT_TAILS[event_type]:
+                        start = (end + 7) & ~7
+                        end = start + getattr(view, length_key)
+                        if end > blob_length:
+                            print(
+                                f"PackFormat.unpack_views: Not enough data for {view_class.__name__} {name}. Stopping parse.",
+                                file=sys.stderr,
+                            )
+                            return
+                        tails.append((start, end))
+                    view._tails = tuple(tails)
+                if wanted is None or event_type in wanted:
+                    yield view
 
-            try:
-                event_enum_val = Events(event_type)
-            except ValueError:
-                event_enum_val = None
-
-            # --- Manual Unpacking for Variable-Length Events ---
-            try:
-                if event_type == Events.SPRITE_TEXTURE_LOAD.value:
-                    fmt, size = PackFormat.get_info(event_type)  # ("<qqI4x", 24)
-                    if offset + size > blob_length:
-                        raise EOFError("TEXTURE_LOAD fixed part")
-
-                    unpacked = struct.unpack_from(fmt, events_blob, offset)
-                    offset += size
-                    event["id1"], event["id2"], filename_length = unpacked
-
-                    if offset + filename_length > blob_length:
-                        raise EOFError("TEXTURE_LOAD variable part")
-                    event["filename"] = events_blob[
-                        offset : offset + filename_length
-                    ].decode("utf-8")
-                    offset += filename_length
-                    events.append(event)
-
-                elif event_type == Events.PLUGIN_LOAD.value:
-                    fmt, size = PackFormat.get_info(event_type)  # ("<I", 4)
-                    if offset + size > blob_length:
-                        raise EOFError("PLUGIN_LOAD fixed part")
-
-                    path_length = struct.unpack_from(fmt, events_blob, offset)[0]
-                    offset += size
-                    event["pathLength"] = path_length
-
-                    if offset + path_length > blob_length:
-                        raise EOFError("PLUGIN_LOAD variable part")
-                    event["path"] = events_blob[offset : offset + path_length].decode(
-                        "utf-8"
+            elif event_type == batch_type_value:
+                # One header, then `count` padded payloads of a single
+                # fixed-size event type
+                end = offset + PackFormat._PAYLOAD_STRUCT_MAP[batch_type_value].size
+                if end > blob_length:
+                    print(
+                        "PackFormat.unpack_views: Not enough data for EVENT_BATCH header. Stopping parse.",
+                        file=sys.stderr,
                     )
-                    offset += path_length
-                    events.append(event)
-
-                elif event_type == Events.AUDIO_LOAD.value:
-                    fmt, size = PackFormat.get_info(event_type)  # ("<I", 4)
-                    if offset + size > blob_length:
-                        raise EOFError("AUDIO_LOAD fixed part")
-
-                    path_length = struct.unpack_from(fmt, events_blob, offset)[0]
-                    offset += size
-                    event["pathLength"] = path_length
-
-                    if offset + path_length > blob_length:
-                        raise EOFError("AUDIO_LOAD variable part")
-                    event["path"] = events_blob[offset : offset + path_length].decode(
-                        "utf-8"
+                    return
+                batch_type, batch_count = PackFormat._PAYLOAD_STRUCT_MAP[
+                    batch_type_value
+                ].unpack_from(buffer, offset)
+                entry_class = PackFormat.get_view_class(batch_type)
+                if (
+                    entry_class is None
+                    or batch_type in PackFormat._VARIABLE_LENGTH_EVENTS
+                ):
+                    print(
+                        f"PackFormat.unpack_views: EVENT_BATCH of unsupported event type {batch_type}. Stopping parse.",
+                        file=sys.stderr,
+                    )
+                    return
+                stride = PackFormat._BATCH_PAYLOAD_STRUCT_MAP[batch_type].size
+                offset = end
+                end = offset + stride * batch_count
+                if end > blob_length:
+                    print(
+                        f"PackFormat.unpack_views: Not enough data for EVENT_BATCH payloads ({batch_count} x {stride}). Stopping parse.",
+                        file=sys.stderr,
                     )
-                    offset += path_length
-                    events.append(event)
-
-                elif event_type == Events.TEXT_ADD.value:
-                    fmt, size = PackFormat.get_info(
-                        event_type
-                    )  # ("<qqdddBBBB4xfII4x", 64)
-                    if offset + size > blob_length:
-                        raise EOFError("TEXT_ADD fixed part")
-
-                    unpacked = struct.unpack_from(fmt, events_blob, offset)
-                    offset += size
-
-                    keys = [
-                        "id1",
-                        "id2",
-                        "positionX",
-                        "positionY",
-                        "positionZ",
-                        "r",
-                        "g",
-                        "b",
-                        "a",
-                        "fontSize",
-                        "fontPathLength",
-                        "textLength",
-                    ]
-                    event.update(zip(keys, unpacked))
-
-                    font_path_len = event["fontPathLength"]
-                    text_len = event["textLength"]
-
-                    if offset + font_path_len > blob_length:
-                        raise EOFError("TEXT_ADD font path")
-                    event["fontPath"] = events_blob[
-                        offset : offset + font_path_len
-                    ].decode("utf-8")
-                    offset += font_path_len
-
-                    if offset + text_len > blob_length:
-                        raise EOFError("TEXT_ADD text")
-                    event["text"] = events_blob[offset : offset + text_len].decode(
-                        "utf-8"
+                    return
+                if wanted is None or batch_type in wanted:
+                    entries = (
+                        range(offset, end, stride) if stride else [offset] * batch_count
                     )
-                    offset += text_len
-                    events.append(event)
+                    for entry in entries:
+                        yield entry_class(buffer, entry, header)
 
-                elif event_type == Events.TEXT_SET_STRING.value:
-                    fmt, size = PackFormat.get_info(event_type)  # ("<qqI4x", 24)
-                    if offset + size > blob_length:
-                        raise EOFError("TEXT_SET_STRING fixed part")
+            else:
+                print(
+                    f"PackFormat.unpack_views: Unknown event type {event_type}. Cannot continue parsing.",
+                    file=sys.stderr,
+                )
+                return
 
-                    unpacked = struct.unpack_from(fmt, events_blob, offset)
-                    offset += size
+            # Skip the padding that ends every event on an 8-byte boundary
+            offset = (end + 7) & ~7
 
-                    keys = ["id1", "id2", "textLength"]
-                    event.update(zip(keys, unpacked))
+    @staticmethod
+    def get_record_class(event_type_value: int) -> Optional[type]:
+        """
+        Gets the generated EventRecord subclass for an event ID (e.g.
+        SpriteAddEvent for SPRITE_ADD). Returns None for unknown event
+        types and EVENT_BATCH.
+        """
+        return PackFormat._RECORD_CLASSES.get(event_type_value)
 
-                    text_len = event["textLength"]
-                    if offset + text_len > blob_length:
-                        raise EOFError("TEXT_SET_STRING text")
-                    event["text"] = events_blob[offset : offset + text_len].decode(
-                        "utf-8"
-                    )
-                    offset += text_len
-                    events.append(event)
-
-                elif event_enum_val is not None:
-                    # --- Generic Fixed-Size Event Handler ---
-                    payload_info = PackFormat.get_info(event_type)
-                    if payload_info is None:
-                        raise ValueError(
-                            f"Could not get info for known event type {event_type}"
-                        )
+    @staticmethod
+    def unpack_records(
+        events_blob: Union[bytes, bytearray, memoryview],
+        wanted: Optional[Collection[int]] = None,
+    ) -> Iterator["EventRecord"]:
+        """
+        Yields an EventRecord per event in a binary blob of events: an
+        instance of the generated __slots__ class of its type (e.g.
+        PhysicsSyncTransformEvent), with every field decoded by a single
+        unpack_from. Records take less memory than unpack()'s dicts, their
+        fields are plain attribute reads, and unlike views they don't refer
+        back to the blob. Entries of an EVENT_BATCH are yielded as records
+        of their own type. Stops (with a message on stderr) at the first
+        unknown or truncated event, like unpack().
+
+        :param wanted: Event ids to yield; see unpack_views().
+        """
+        buffer = memoryview(events_blob).cast("B")
+        blob_length = len(buffer)
+        if blob_length < PackFormat._COUNT_STRUCT.size:
+            return
 
-                    payload_format, payload_size = payload_info
+        event_count = PackFormat._COUNT_STRUCT.unpack_from(buffer, 0)[0]
+        offset = PackFormat._COUNT_STRUCT.size
+        header_size = PackFormat._HEADER_STRUCT.size
+        read_type = PackFormat._TYPE_STRUCT.unpack_from
+        record_classes = PackFormat._RECORD_CLASSES
+        batch_type_value = Events.EVENT_BATCH.value
+        batch_struct = PackFormat._PAYLOAD_STRUCT_MAP[batch_type_value]
 
-                    if offset + payload_size > blob_length:
-                        raise EOFError(
-                            f"{event_enum_val.name} payload (size {payload_size})"
-                        )
+        for i in range(event_count):
+            header = offset
+            if header + header_size > blob_length:
+                print(
+                    f"PackFormat.unpack_records Loop {i}/{event_count}: Not enough data for header. Offset={header}",
+                    file=sys.stderr,
+                )
+                return
 
-                    if payload_size > 0:
-                        unpacked = struct.unpack_from(
-                            payload_format, events_blob, offset
+            event_type = read_type(buffer, header)[0]
+            record_class = record_classes.get(event_type)
+
+            if record_class is not None:
+                # Header, payload and padding in one go
+                end = header + record_class._struct.size
+                if end > blob_length:
+                    print(
+                        f"PackFormat.unpack_records: Not enough data for {record_class.__name__}. Stopping parse.",
+                        file=sys.stderr,
+                    )
+                    return
+                if record_class._tails:
+                    record = record_class(
+                        *record_class._struct.unpack_from(buffer, header)
+                    )
+                    end = record._read_tails(buffer, end)
+                    if end > blob_length:
+                        print(
+                            f"PackFormat.unpack_records: Not enough data for {record_class.__name__} strings. Stopping parse.",
+                            file=sys.stderr,
                         )
+                        return
+                    if wanted is None or event_type in wanted:
+                        yield record
+                elif wanted is None or event_type in wanted:
+                    yield record_class(
+                        *record_class._struct.unpack_from(buffer, header)
+                    )
 
-                        # --- MODIFIED BLOCK ---
-                        # Use the pre-computed key map instead of generic v{i} keys
-                        keys = PackFormat._EVENT_KEY_MAP.get(event_type)
-
-                        if keys is not None:
-                            if len(keys) == len(unpacked):
-                                payload_data = dict(zip(keys, unpacked))
-                            else:
-                                # Error: struct definition and key map are out of sync
-                                print(
-                                    f"PackFormat.unpack: Key/Value mismatch for {event_enum_val.name}. Keys: {len(keys)}, Vals: {len(unpacked)}",
-                                    file=sys.stderr,
-                                )
-                                payload_data = {
-                                    f"v{i}": val for i, val in enumerate(unpacked)
-                                }
-                        else:
-                            # Fallback for events missing from key map (shouldn't happen)
-                            payload_data = {
-                                f"v{i}": val for i, val in enumerate(unpacked)
-                            }
-
-                        event.update(payload_data)
-                        # --- END MODIFIED BLOCK ---
-
-                        events.append(event)
-                    else:
-                        events.append(event)  # No payload
-
-                    offset += payload_size
-
-                else:
+            elif event_type == batch_type_value:
+                # One header, then `count` padded payloads of a single
+                # fixed-size event type
+                start = header + header_size
+                end = start + batch_struct.size
+                if end > blob_length:
                     print(
-                        f"PackFormat.unpack: Unknown event type {event_type}. Cannot continue parsing.",
+                        "PackFormat.unpack_records: Not enough data for EVENT_BATCH header. Stopping parse.",
                         file=sys.stderr,
                     )
-                    break
+                    return
+                batch_type, batch_count = batch_struct.unpack_from(buffer, start)
+                entry_class = record_classes.get(batch_type)
+                entry_struct = PackFormat._BATCH_PAYLOAD_STRUCT_MAP.get(batch_type)
+                if (
+                    entry_class is None
+                    or entry_class._tails
+                    or batch_type in PackFormat._VARIABLE_LENGTH_EVENTS
+                    or not entry_struct.size
+                ):
+                    print(
+                        f"PackFormat.unpack_records: EVENT_BATCH of unsupported event type {batch_type}. Stopping parse.",
+                        file=sys.stderr,
+                    )
+                    return
+                start = end
+                end = start + entry_struct.size * batch_count
+                if end > blob_length:
+                    print(
+                        f"PackFormat.unpack_records: Not enough data for EVENT_BATCH payloads ({batch_count} x {entry_struct.size}). Stopping parse.",
+                        file=sys.stderr,
+                    )
+                    return
+                if wanted is None or batch_type in wanted:
+                    timestamp = PackFormat._HEADER_STRUCT.unpack_from(buffer, header)[1]
+                    for values in entry_struct.iter_unpack(buffer[start:end]):
+                        yield entry_class(timestamp, *values)
 
-            except EOFError as e:
+            else:
                 print(
-                    f"PackFormat.unpack: Not enough data for {e}. Stopping parse.",
+                    f"PackFormat.unpack_records: Unknown event type {event_type}. Cannot continue parsing.",
                     file=sys.stderr,
                 )
-                break
-            except struct.error as e:
+                return
+
+            # Skip the padding that ends every event on an 8-byte boundary
+            offset = (end + 7) & ~7
+
+    @staticmethod
+    def unpack_columnar(
+        events_blob: Union[bytes, bytearray, memoryview],
+        wanted: Optional[Collection[int]] = None,
+    ) -> Dict[int, Any]:
+        """
+        Decodes a binary blob of events into one NumPy structured array per
+        event type, keyed by event id, with a field per key in
+        _EVENT_KEY_MAP (e.g. arrays[Events.PHYSICS_SYNC_TRANSFORM]["positionX"]).
+
+        The blob is scanned once. Back-to-back events of one type (and every
+        EVENT_BATCH) form a run that np.frombuffer() maps without copying;
+        a type whose events are split over several runs is copied into one
+        array. The arrays may be views of the blob, so keep it alive and
+        unchanged while they are in use. Variable-length events (those with
+        string tails) are skipped; use unpack_views() for them. Stops (with
+        a message on stderr) at the first unknown or truncated event.
+
+        :param wanted: Event ids to return arrays for; runs of any other
+                       type are stepped over without being mapped.
+        """
+        if np is None:
+            raise ImportError("PackFormat.unpack_columnar requires NumPy")
+
+        buffer = memoryview(events_blob).cast("B")
+        blob_length = len(buffer)
+        if blob_length < PackFormat._COUNT_STRUCT.size:
+            return {}
+
+        event_count = PackFormat._COUNT_STRUCT.unpack_from(buffer, 0)[0]
+        offset = PackFormat._COUNT_STRUCT.size
+        header_size = PackFormat._HEADER_STRUCT.size
+        read_type = PackFormat._TYPE_STRUCT.unpack_from
+        batch_type_value = Events.EVENT_BATCH.value
+        batch_struct = PackFormat._PAYLOAD_STRUCT_MAP[batch_type_value]
+
+        # (event type, offset of the first record, record count, from a batch)
+        runs: List[Tuple[int, int, int, bool]] = []
+
+        i = 0
+        while i < event_count:
+            header = offset
+            offset += header_size
+            if offset > blob_length:
                 print(
-                    f"PackFormat.unpack: Struct error for {event_enum_val.name if event_enum_val else event_type}: {e}",
+                    f"PackFormat.unpack_columnar Loop {i}/{event_count}: Not enough data for header. Offset={header}",
                     file=sys.stderr,
                 )
                 break
-            except Exception as e:
+
+            event_type = read_type(buffer, header)[0]
+            if event_type == batch_type_value:
+                end = offset + batch_struct.size
+                if end > blob_length:
+                    print(
+                        "PackFormat.unpack_columnar: Not enough data for EVENT_BATCH header. Stopping parse.",
+                        file=sys.stderr,
+                    )
+                    break
+                batch_type, batch_count = batch_struct.unpack_from(buffer, offset)
+                payload_struct = PackFormat._BATCH_PAYLOAD_STRUCT_MAP.get(batch_type)
+                if (
+                    payload_struct is None
+                    or batch_type in PackFormat._VARIABLE_LENGTH_EVENTS
+                ):
+                    print(
+                        f"PackFormat.unpack_columnar: EVENT_BATCH of unsupported event type {batch_type}. Stopping parse.",
+                        file=sys.stderr,
+                    )
+                    break
+                start = end
+                end = start + payload_struct.size * batch_count
+                if end > blob_length:
+                    print(
+                        f"PackFormat.unpack_columnar: Not enough data for EVENT_BATCH payloads ({batch_count} x {payload_struct.size}). Stopping parse.",
+                        file=sys.stderr,
+                    )
+                    break
+                if batch_count:
+                    runs.append((batch_type, start, batch_count, True))
+                i += 1
+
+            elif event_type in PackFormat._EVENT_TAILS:
+                # Walk past the strings; these don't fit in an array
+                payload_struct = PackFormat._PAYLOAD_STRUCT_MAP[event_type]
+                end = offset + payload_struct.size
+                if end > blob_length:
+                    print(
+                        f"PackFormat.unpack_columnar: Not enough data for {Events(event_type).name} payload. Stopping parse.",
+                        file=sys.stderr,
+                    )
+                    break
+                lengths = dict(
+                    zip(
+                        PackFormat._EVENT_KEY_MAP[event_type],
+                        payload_struct.unpack_from(buffer, offset),
+                    )
+                )
+                for _, length_key in PackFormat._EVENT_TAILS[event_type]:
+                    end = ((end + 7) & ~7) + lengths[length_key]
+                if end > blob_length:
+                    print(
+                        f"PackFormat.unpack_columnar: Not enough data for {Events(event_type).name} strings. Stopping parse.",
+                        file=sys.stderr,
+                    )
+                    break
+                i += 1
+
+            else:
+                event_struct = PackFormat._EVENT_STRUCT_MAP.get(event_type)
+                if event_struct is None:
+                    print(
+                        f"PackFormat.unpack_columnar: Unknown event type {event_type}. Cannot continue parsing.",
+                        file=sys.stderr,
+                    )
+                    break
+                # Find the whole run of back-to-back events of this type in
+                # one step, by reading every stride-th type field at once
+                stride = event_struct.size
+                limit = min(event_count - i, (blob_length - header) // stride)
+                types = np.ndarray(
+                    (limit,),
+                    dtype="<u4",
+                    buffer=buffer,
+                    offset=header,
+                    strides=(stride,),
+                )
+                different = np.flatnonzero(types != event_type)
+                count = int(different[0]) if len(different) else limit
+                if count == 0:
+                    print(
+                        f"PackFormat.unpack_columnar: Not enough data for {Events(event_type).name} payload. Stopping parse.",
+                        file=sys.stderr,
+                    )
+                    break
+                runs.append((event_type, header, count, False))
+                end = header + count * stride
+                i += count
+
+            # Skip the padding that ends every event on an 8-byte boundary
+            offset = (end + 7) & ~7
+
+        grouped: Dict[int, List[Any]] = {}
+        for event_type, start, count, batched in runs:
+            if wanted is not None and event_type not in wanted:
+                continue
+            records = np.frombuffer(
+                buffer,
+                dtype=PackFormat.get_dtype(event_type, header=not batched),
+                count=count,
+                offset=start,
+            )
+            if not batched:
+                records = records[PackFormat._EVENT_KEY_MAP[event_type]]
+            grouped.setdefault(event_type, []).append(records)
+
+        arrays: Dict[int, Any] = {}
+        for event_type, parts in grouped.items():
+            if len(parts) == 1:
+                arrays[event_type] = parts[0]
+                continue
+            merged = np.empty(
+                sum(len(part) for part in parts),
+                dtype=PackFormat.get_dtype(event_type, header=False),
+            )
+            position = 0
+            for part in parts:
+                merged[position : position + len(part)] = part
+                position += len(part)
+            arrays[event_type] = merged
+        return arrays
+
+    @staticmethod
+    def iter_unpack(
+        events_blob: Union[bytes, bytearray, memoryview],
+        wanted: Optional[Collection[int]] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yields events one dict at a time, as unpack() would return them.
+
+        Decoding works on a memoryview of the frame: a fixed-size event is
+        read in place with the single unpack_from of its _EVENT_STRUCT_MAP
+        entry (header, payload and padding), never sliced out, and each
+        dict is only built when the loop asks for the next event. A loop that stops
+        early never decodes the rest, and a burst of events is never held
+        in memory all at once.
+
+        :param wanted: Event ids to yield; see unpack_views().
+        """
+        buffer = memoryview(events_blob).cast("B")
+        blob_length = len(buffer)
+        if blob_length < PackFormat._COUNT_STRUCT.size:
+            return
+
+        event_count = PackFormat._COUNT_STRUCT.unpack_from(buffer, 0)[0]
+        offset = PackFormat._COUNT_STRUCT.size
+        header_size = PackFormat._HEADER_STRUCT.size
+        read_type = PackFormat._TYPE_STRUCT.unpack_from
+        event_structs = PackFormat._EVENT_STRUCT_MAP
+        dict_keys = PackFormat._DICT_KEY_MAP
+        tail_events = PackFormat._EVENT_TAILS
+        batch_type_value = Events.EVENT_BATCH.value
+        batch_struct = PackFormat._PAYLOAD_STRUCT_MAP[batch_type_value]
+
+        for i in range(event_count):
+            header = offset
+            if header + header_size > blob_length:
                 print(
-                    f"PackFormat.unpack: General error on {event_enum_val.name if event_enum_val else event_type}: {e}",
+                    f"PackFormat.iter_unpack Loop {i}/{event_count}: Not enough data for header. Offset={header}",
                     file=sys.stderr,
                 )
-                break
+                return
+
+            event_type = read_type(buffer, header)[0]
+            event_struct = event_structs.get(event_type)
+
+            if event_struct is None:
+                print(
+                    f"PackFormat.iter_unpack: Unknown event type {event_type}. Cannot continue parsing.",
+                    file=sys.stderr,
+                )
+                return
+
+            elif event_type in tail_events:
+                record_class = PackFormat._RECORD_CLASSES[event_type]
+                record = record_class(*record_class._struct.unpack_from(buffer, header))
+                end = record._read_tails(buffer, header + record_class._struct.size)
+                if end > blob_length:
+                    print(
+                        f"PackFormat.iter_unpack: Not enough data for {record_class.__name__} strings. Stopping parse.",
+                        file=sys.stderr,
+                    )
+                    return
+                if wanted is None or event_type in wanted:
+                    yield record.to_dict()
+
+            elif event_type == batch_type_value:
+                # One header, then `count` padded payloads of a single
+                # fixed-size event type
+                start = header + header_size
+                end = start + batch_struct.size
+                if end > blob_length:
+                    print(
+                        "PackFormat.iter_unpack: Not enough data for EVENT_BATCH header. Stopping parse.",
+                        file=sys.stderr,
+                    )
+                    return
+                batch_type, batch_count = batch_struct.unpack_from(buffer, start)
+                entry_struct = PackFormat._BATCH_PAYLOAD_STRUCT_MAP.get(batch_type)
+                if (
+                    entry_struct is None
+                    or batch_type in PackFormat._VARIABLE_LENGTH_EVENTS
+                ):
+                    print(
+                        f"PackFormat.iter_unpack: EVENT_BATCH of unsupported event type {batch_type}. Stopping parse.",
+                        file=sys.stderr,
+                    )
+                    return
+                start = end
+                end = start + entry_struct.size * batch_count
+                if end > blob_length:
+                    print(
+                        f"PackFormat.iter_unpack: Not enough data for EVENT_BATCH payloads ({batch_count} x {entry_struct.size}). Stopping parse.",
+                        file=sys.stderr,
+                    )
+                    return
+                if wanted is None or batch_type in wanted:
+                    entry_keys = dict_keys[batch_type]
+                    prefix = (
+                        batch_type,
+                        PackFormat._HEADER_STRUCT.unpack_from(buffer, header)[1],
+                    )
+                    entries = (
+                        entry_struct.iter_unpack(buffer[start:end])
+                        if entry_struct.size
+                        else [()] * batch_count
+                    )
+                    for values in entries:
+                        yield dict(zip(entry_keys, prefix + values))
+
+            else:
+                # Header, payload and padding in one go
+                end = header + event_struct.size
+                if end > blob_length:
+                    print(
+                        f"PackFormat.iter_unpack: Not enough data for {Events(event_type).name} payload. Stopping parse.",
+                        file=sys.stderr,
+                    )
+                    return
+                if wanted is None or event_type in wanted:
+                    yield dict(
+                        zip(
+                            dict_keys[event_type],
+                            event_struct.unpack_from(buffer, header),
+                        )
+                    )
+
+            # Skip the padding that ends every event on an 8-byte boundary
+            offset = (end + 7) & ~7
+
+    @staticmethod
+    def unpack(
+        events_blob: bytes, wanted: Optional[Collection[int]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Unpacks a binary blob of events into one dict per event, with
+        "type", "timestamp", the keys from _EVENT_KEY_MAP and any string
+        tails (decoded), less any _DICT_OMITTED_KEYS. Collects
+        iter_unpack(); views are cheaper when only some fields are read,
+        see unpack_views().
+
+        :param wanted: Event ids to return; see unpack_views().
+        """
+        return list(PackFormat.iter_unpack(events_blob, wanted))
+
+
+class EventView:
+    """
+    A lazy, read-only view of one event in an events blob, as yielded by
+    PackFormat.unpack_views(). Each field is an attribute that is decoded
+    from the blob when read, so events (or fields) that are never looked
+    at cost next to nothing. There is one subclass per event type, see
+    PackFormat.get_view_class().
+
+    Views also answer the dict API used with unpack() (view["x"],
+    view.get("x", 0), "x" in view, keys()), and to_dict() copies every
+    field out. A view reads the blob it came from: keep the blob alive,
+    and unchanged, for as long as the view is in use.
+    """
+
+    __slots__ = ("_buffer", "_offset", "_header")
+
+    # Set on each subclass by PackFormat.get_view_class()
+    type: int = -1
+    _payload: struct.Struct = struct.Struct("<")
+    _event: struct.Struct = struct.Struct("<IQ4x")  # header + payload
+    _keys: Tuple[str, ...] = ()
+    _dict_keys: Tuple[str, ...] = ("type", "timestamp")
+    _tail_names: Tuple[str, ...] = ()
+
+    def __init__(self, buffer: memoryview, offset: int, header: int):
+        """
+        :param buffer: The events blob.
+        :param offset: Where this event's payload starts.
+        :param header: Where its header starts (for an EVENT_BATCH entry,
+                       the batch's header, which holds the timestamp).
+        """
+        self._buffer = buffer
+        self._offset = offset
+        self._header = header
+
+    @staticmethod
+    def _field(field_struct: struct.Struct) -> property:
+        """A property reading one field (pre-padded to its offset)."""
+        unpack_from = field_struct.unpack_from
+        return property(lambda self: unpack_from(self._buffer, self._offset)[0])
+
+    @staticmethod
+    def _tail(index: int) -> property:
+        """A property decoding one string tail."""
+
+        def read(self) -> str:
+            start, end = self._tails[index]
+            return str(self._buffer[start:end], "utf-8")
+
+        return property(read)
+
+    @property
+    def timestamp(self) -> int:
+        return PackFormat._HEADER_STRUCT.unpack_from(self._buffer, self._header)[1]
+
+    def astuple(self) -> Tuple:
+        """Every payload field in _EVENT_KEY_MAP order, in one unpack."""
+        return self._payload.unpack_from(self._buffer, self._offset)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Copies the event out as unpack() would return it."""
+        if self._offset - self._header == PackFormat._HEADER_STRUCT.size:
+            event = dict(
+                zip(
+                    self._dict_keys, self._event.unpack_from(self._buffer, self._header)
+                )
+            )
+        else:
+            # An EVENT_BATCH entry: the header in front of it is the batch's
+            event = {"type": self.type, "timestamp": self.timestamp}
+            event.update(zip(self._keys, self.astuple()))
+        for name in self._tail_names:
+            event[name] = getattr(self, name)
+        for key in PackFormat._DICT_OMITTED_KEYS.get(self.type, ()):
+            del event[key]
+        return event
+
+    def keys(self) -> Tuple[str, ...]:
+        return ("type", "timestamp") + self._keys + self._tail_names
+
+    def __contains__(self, key: str) -> bool:
+        return (
+            key in ("type", "timestamp") or key in self._keys or key in self._tail_names
+        )
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key) if key in self else default
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.to_dict()!r})"
+
+
+class EventRecord:
+    """
+    One event decoded into plain attributes, as yielded by
+    PackFormat.unpack_records(). There is a generated subclass per
+    event type (SpriteAddEvent, PhysicsSyncTransformEvent, ...) whose
+    __slots__ are the keys from _EVENT_KEY_MAP plus any string tails,
+    so a record is a fraction of the size of unpack()'s dict and
+    record.positionX is a slot read instead of a string-keyed lookup.
+
+    Records copy every field out of the blob, so they stay valid after
+    it is reused. Like views, they also answer the dict API used with
+    unpack() (record["x"], record.get("x", 0), "x" in record, keys()).
+    """
+
+    __slots__ = ("timestamp",)
+
+    # Set on each generated subclass
+    type: int = -1
+    _keys: Tuple[str, ...] = ()
+    _tails: Tuple[Tuple[str, str], ...] = ()  # (name, length key) pairs
+    _struct: struct.Struct = struct.Struct("<4xQ4x")  # timestamp + payload + padding
+    _payload: struct.Struct = struct.Struct("<")
+
+    def __init__(self, timestamp: int = 0):
+        self.timestamp = timestamp
+
+    @classmethod
+    def from_buffer(
+        cls, buffer: Union[bytes, bytearray, memoryview], offset: int = 0
+    ) -> "EventRecord":
+        """
+        Decodes the event whose header starts at `offset`, in a single
+        unpack_from of the header, payload and padding. String tails
+        are decoded too.
+        """
+        record = cls(*cls._struct.unpack_from(buffer, offset))
+        if cls._tails:
+            record._read_tails(buffer, offset + cls._struct.size)
+        return record
+
+    @classmethod
+    def from_payload(
+        cls, buffer: Union[bytes, bytearray, memoryview], offset: int, timestamp: int
+    ) -> "EventRecord":
+        """Decodes a payload that has no header of its own, e.g. an EVENT_BATCH entry."""
+        return cls(timestamp, *cls._payload.unpack_from(buffer, offset))
+
+    def _read_tails(
+        self, buffer: Union[bytes, bytearray, memoryview], offset: int
+    ) -> int:
+        """
+        Decodes the string tails starting at `offset` (the end of the
+        padded struct) and returns where the last one ends.
+        """
+        end = offset
+        for name, length_key in self._tails:
+            start = (end + 7) & ~7
+            end = start + getattr(self, length_key)
+            setattr(self, name, str(buffer[start:end], "utf-8"))
+        return end
+
+    def astuple(self) -> Tuple:
+        """Every payload field in _EVENT_KEY_MAP order."""
+        return tuple(getattr(self, key) for key in self._keys)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Copies the event out as unpack() would return it."""
+        event = {"type": self.type, "timestamp": self.timestamp}
+        for key in self._keys:
+            event[key] = getattr(self, key)
+        for name, _ in self._tails:
+            event[name] = getattr(self, name)
+        for key in PackFormat._DICT_OMITTED_KEYS.get(self.type, ()):
+            del event[key]
+        return event
+
+    def keys(self) -> Tuple[str, ...]:
+        return (
+            ("type", "timestamp") + self._keys + tuple(name for name, _ in self._tails)
+        )
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.keys()
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key) if key in self else default
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    __hash__ = None  # Mutable, like the dicts they replace
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.to_dict()!r})"
+
+
+class SpriteAddEvent(EventRecord):
+    """SPRITE_ADD, decoded. Maps to Swift: `PackedSpriteAddEvent`"""
+
+    __slots__ = (
+        "id1",
+        "id2",
+        "positionX",
+        "positionY",
+        "positionZ",
+        "scaleX",
+        "scaleY",
+        "scaleZ",
+        "sizeW",
+        "sizeH",
+        "rotationX",
+        "rotationY",
+        "rotationZ",
+        "r",
+        "g",
+        "b",
+        "a",
+        "speedX",
+        "speedY",
+    )
+    type = Events.SPRITE_ADD.value
+    _keys = (
+        "id1",
+        "id2",
+        "positionX",
+        "positionY",
+        "positionZ",
+        "scaleX",
+        "scaleY",
+        "scaleZ",
+        "sizeW",
+        "sizeH",
+        "rotationX",
+        "rotationY",
+        "rotationZ",
+        "r",
+        "g",
+        "b",
+        "a",
+        "speedX",
+        "speedY",
+    )
+    _struct = struct.Struct("<4xQ4xqqdddddddddddBBBB4xdd")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.SPRITE_ADD.value]
+
+    def __init__(
+        self,
+        timestamp: int,
+        id1: int,
+        id2: int,
+        positionX: float,
+        positionY: float,
+        positionZ: float,
+        scaleX: float,
+        scaleY: float,
+        scaleZ: float,
+        sizeW: float,
+        sizeH: float,
+        rotationX: float,
+        rotationY: float,
+        rotationZ: float,
+        r: int,
+        g: int,
+        b: int,
+        a: int,
+        speedX: float,
+        speedY: float,
+    ):
+        self.timestamp = timestamp
+        self.id1 = id1
+        self.id2 = id2
+        self.positionX = positionX
+        self.positionY = positionY
+        self.positionZ = positionZ
+        self.scaleX = scaleX
+        self.scaleY = scaleY
+        self.scaleZ = scaleZ
+        self.sizeW = sizeW
+        self.sizeH = sizeH
+        self.rotationX = rotationX
+        self.rotationY = rotationY
+        self.rotationZ = rotationZ
+        self.r = r
+        self.g = g
+        self.b = b
+        self.a = a
+        self.speedX = speedX
+        self.speedY = speedY
+
+
+class SpriteRemoveEvent(EventRecord):
+    """SPRITE_REMOVE, decoded. Maps to Swift: `PackedSpriteRemoveEvent`"""
+
+    __slots__ = ("id1", "id2")
+    type = Events.SPRITE_REMOVE.value
+    _keys = ("id1", "id2")
+    _struct = struct.Struct("<4xQ4xqq")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.SPRITE_REMOVE.value]
+
+    def __init__(self, timestamp: int, id1: int, id2: int):
+        self.timestamp = timestamp
+        self.id1 = id1
+        self.id2 = id2
+
+
+class SpriteMoveEvent(EventRecord):
+    """SPRITE_MOVE, decoded. Maps to Swift: `PackedSpriteMoveEvent`"""
+
+    __slots__ = ("id1", "id2", "positionX", "positionY", "positionZ")
+    type = Events.SPRITE_MOVE.value
+    _keys = ("id1", "id2", "positionX", "positionY", "positionZ")
+    _struct = struct.Struct("<4xQ4xqqddd")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.SPRITE_MOVE.value]
+
+    def __init__(
+        self,
+        timestamp: int,
+        id1: int,
+        id2: int,
+        positionX: float,
+        positionY: float,
+        positionZ: float,
+    ):
+        self.timestamp = timestamp
+        self.id1 = id1
+        self.id2 = id2
+        self.positionX = positionX
+        self.positionY = positionY
+        self.positionZ = positionZ
+
+
+class SpriteScaleEvent(EventRecord):
+    """SPRITE_SCALE, decoded. Maps to Swift: `PackedSpriteScaleEvent`"""
+
+    __slots__ = ("id1", "id2", "scaleX", "scaleY", "scaleZ")
+    type = Events.SPRITE_SCALE.value
+    _keys = ("id1", "id2", "scaleX", "scaleY", "scaleZ")
+    _struct = struct.Struct("<4xQ4xqqddd")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.SPRITE_SCALE.value]
+
+    def __init__(
+        self,
+        timestamp: int,
+        id1: int,
+        id2: int,
+        scaleX: float,
+        scaleY: float,
+        scaleZ: float,
+    ):
+        self.timestamp = timestamp
+        self.id1 = id1
+        self.id2 = id2
+        self.scaleX = scaleX
+        self.scaleY = scaleY
+        self.scaleZ = scaleZ
+
+
+class SpriteResizeEvent(EventRecord):
+    """SPRITE_RESIZE, decoded. Maps to Swift: `PackedSpriteResizeEvent`"""
+
+    __slots__ = ("id1", "id2", "sizeW", "sizeH")
+    type = Events.SPRITE_RESIZE.value
+    _keys = ("id1", "id2", "sizeW", "sizeH")
+    _struct = struct.Struct("<4xQ4xqqdd")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.SPRITE_RESIZE.value]
+
+    def __init__(self, timestamp: int, id1: int, id2: int, sizeW: float, sizeH: float):
+        self.timestamp = timestamp
+        self.id1 = id1
+        self.id2 = id2
+        self.sizeW = sizeW
+        self.sizeH = sizeH
+
+
+class SpriteRotateEvent(EventRecord):
+    """SPRITE_ROTATE, decoded. Maps to Swift: `PackedSpriteRotateEvent`"""
+
+    __slots__ = ("id1", "id2", "rotationX", "rotationY", "rotationZ")
+    type = Events.SPRITE_ROTATE.value
+    _keys = ("id1", "id2", "rotationX", "rotationY", "rotationZ")
+    _struct = struct.Struct("<4xQ4xqqddd")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.SPRITE_ROTATE.value]
+
+    def __init__(
+        self,
+        timestamp: int,
+        id1: int,
+        id2: int,
+        rotationX: float,
+        rotationY: float,
+        rotationZ: float,
+    ):
+        self.timestamp = timestamp
+        self.id1 = id1
+        self.id2 = id2
+        self.rotationX = rotationX
+        self.rotationY = rotationY
+        self.rotationZ = rotationZ
+
+
+class SpriteColorEvent(EventRecord):
+    """SPRITE_COLOR, decoded. Maps to Swift: `PackedSpriteColorEvent`"""
+
+    __slots__ = ("id1", "id2", "r", "g", "b", "a")
+    type = Events.SPRITE_COLOR.value
+    _keys = ("id1", "id2", "r", "g", "b", "a")
+    _struct = struct.Struct("<4xQ4xqqBBBB4x")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.SPRITE_COLOR.value]
+
+    def __init__(
+        self, timestamp: int, id1: int, id2: int, r: int, g: int, b: int, a: int
+    ):
+        self.timestamp = timestamp
+        self.id1 = id1
+        self.id2 = id2
+        self.r = r
+        self.g = g
+        self.b = b
+        self.a = a
+
+
+class SpriteSpeedEvent(EventRecord):
+    """SPRITE_SPEED, decoded. Maps to Swift: `PackedSpriteSpeedEvent`"""
+
+    __slots__ = ("id1", "id2", "speedX", "speedY")
+    type = Events.SPRITE_SPEED.value
+    _keys = ("id1", "id2", "speedX", "speedY")
+    _struct = struct.Struct("<4xQ4xqqdd")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.SPRITE_SPEED.value]
+
+    def __init__(
+        self, timestamp: int, id1: int, id2: int, speedX: float, speedY: float
+    ):
+        self.timestamp = timestamp
+        self.id1 = id1
+        self.id2 = id2
+        self.speedX = speedX
+        self.speedY = speedY
+
+
+class SpriteTextureLoadEvent(EventRecord):
+    """SPRITE_TEXTURE_LOAD, decoded. Maps to Swift: `PackedTextureLoadHeaderEvent`"""
+
+    __slots__ = ("id1", "id2", "filenameLength", "filename")
+    type = Events.SPRITE_TEXTURE_LOAD.value
+    _keys = ("id1", "id2", "filenameLength")
+    _tails = (("filename", "filenameLength"),)
+    _struct = struct.Struct("<4xQ4xqqI4x")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.SPRITE_TEXTURE_LOAD.value]
+
+    def __init__(
+        self,
+        timestamp: int,
+        id1: int,
+        id2: int,
+        filenameLength: int,
+        filename: str = "",
+    ):
+        self.timestamp = timestamp
+        self.id1 = id1
+        self.id2 = id2
+        self.filenameLength = filenameLength
+        self.filename = filename
+
+
+class SpriteTextureSetEvent(EventRecord):
+    """SPRITE_TEXTURE_SET, decoded. Maps to Swift: `PackedSpriteTextureSetEvent`"""
+
+    __slots__ = ("id1", "id2", "textureId")
+    type = Events.SPRITE_TEXTURE_SET.value
+    _keys = ("id1", "id2", "textureId")
+    _struct = struct.Struct("<4xQ4xqqQ")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.SPRITE_TEXTURE_SET.value]
+
+    def __init__(self, timestamp: int, id1: int, id2: int, textureId: int):
+        self.timestamp = timestamp
+        self.id1 = id1
+        self.id2 = id2
+        self.textureId = textureId
+
+
+class SpriteSetSourceRectEvent(EventRecord):
+    """SPRITE_SET_SOURCE_RECT, decoded. Maps to Swift: `PackedSpriteSetSourceRectEvent`"""
+
+    __slots__ = ("id1", "id2", "x", "y", "w", "h")
+    type = Events.SPRITE_SET_SOURCE_RECT.value
+    _keys = ("id1", "id2", "x", "y", "w", "h")
+    _struct = struct.Struct("<4xQ4xqqffff")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.SPRITE_SET_SOURCE_RECT.value]
+
+    def __init__(
+        self, timestamp: int, id1: int, id2: int, x: float, y: float, w: float, h: float
+    ):
+        self.timestamp = timestamp
+        self.id1 = id1
+        self.id2 = id2
+        self.x = x
+        self.y = y
+        self.w = w
+        self.h = h
+
+
+class SpriteMoveF32Event(EventRecord):
+    """SPRITE_MOVE_F32, decoded. Maps to Swift: `PackedSpriteMoveF32Event`"""
+
+    __slots__ = ("id1", "id2", "positionX", "positionY", "positionZ")
+    type = Events.SPRITE_MOVE_F32.value
+    _keys = ("id1", "id2", "positionX", "positionY", "positionZ")
+    _struct = struct.Struct("<4xQ4xqqfff4x")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.SPRITE_MOVE_F32.value]
+
+    def __init__(
+        self,
+        timestamp: int,
+        id1: int,
+        id2: int,
+        positionX: float,
+        positionY: float,
+        positionZ: float,
+    ):
+        self.timestamp = timestamp
+        self.id1 = id1
+        self.id2 = id2
+        self.positionX = positionX
+        self.positionY = positionY
+        self.positionZ = positionZ
+
+
+class SpriteScaleF32Event(EventRecord):
+    """SPRITE_SCALE_F32, decoded. Maps to Swift: `PackedSpriteScaleF32Event`"""
+
+    __slots__ = ("id1", "id2", "scaleX", "scaleY", "scaleZ")
+    type = Events.SPRITE_SCALE_F32.value
+    _keys = ("id1", "id2", "scaleX", "scaleY", "scaleZ")
+    _struct = struct.Struct("<4xQ4xqqfff4x")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.SPRITE_SCALE_F32.value]
+
+    def __init__(
+        self,
+        timestamp: int,
+        id1: int,
+        id2: int,
+        scaleX: float,
+        scaleY: float,
+        scaleZ: float,
+    ):
+        self.timestamp = timestamp
+        self.id1 = id1
+        self.id2 = id2
+        self.scaleX = scaleX
+        self.scaleY = scaleY
+        self.scaleZ = scaleZ
+
+
+class SpriteRotateF32Event(EventRecord):
+    """SPRITE_ROTATE_F32, decoded. Maps to Swift: `PackedSpriteRotateF32Event`"""
+
+    __slots__ = ("id1", "id2", "rotationX", "rotationY", "rotationZ")
+    type = Events.SPRITE_ROTATE_F32.value
+    _keys = ("id1", "id2", "rotationX", "rotationY", "rotationZ")
+    _struct = struct.Struct("<4xQ4xqqfff4x")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.SPRITE_ROTATE_F32.value]
+
+    def __init__(
+        self,
+        timestamp: int,
+        id1: int,
+        id2: int,
+        rotationX: float,
+        rotationY: float,
+        rotationZ: float,
+    ):
+        self.timestamp = timestamp
+        self.id1 = id1
+        self.id2 = id2
+        self.rotationX = rotationX
+        self.rotationY = rotationY
+        self.rotationZ = rotationZ
+
+
+class SpriteSpeedF32Event(EventRecord):
+    """SPRITE_SPEED_F32, decoded. Maps to Swift: `PackedSpriteSpeedF32Event`"""
+
+    __slots__ = ("id1", "id2", "speedX", "speedY")
+    type = Events.SPRITE_SPEED_F32.value
+    _keys = ("id1", "id2", "speedX", "speedY")
+    _struct = struct.Struct("<4xQ4xqqff")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.SPRITE_SPEED_F32.value]
+
+    def __init__(
+        self, timestamp: int, id1: int, id2: int, speedX: float, speedY: float
+    ):
+        self.timestamp = timestamp
+        self.id1 = id1
+        self.id2 = id2
+        self.speedX = speedX
+        self.speedY = speedY
+
+
+class SpriteBindHandleEvent(EventRecord):
+    """SPRITE_BIND_HANDLE, decoded. Maps to Swift: `PackedSpriteBindHandleEvent`"""
+
+    __slots__ = ("id1", "id2", "handle")
+    type = Events.SPRITE_BIND_HANDLE.value
+    _keys = ("id1", "id2", "handle")
+    _struct = struct.Struct("<4xQ4xqqI4x")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.SPRITE_BIND_HANDLE.value]
+
+    def __init__(self, timestamp: int, id1: int, id2: int, handle: int):
+        self.timestamp = timestamp
+        self.id1 = id1
+        self.id2 = id2
+        self.handle = handle
+
+
+class SpriteReleaseHandleEvent(EventRecord):
+    """SPRITE_RELEASE_HANDLE, decoded. Maps to Swift: `PackedSpriteReleaseHandleEvent`"""
+
+    __slots__ = ("handle",)
+    type = Events.SPRITE_RELEASE_HANDLE.value
+    _keys = ("handle",)
+    _struct = struct.Struct("<4xQ4xI4x")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.SPRITE_RELEASE_HANDLE.value]
+
+    def __init__(self, timestamp: int, handle: int):
+        self.timestamp = timestamp
+        self.handle = handle
+
+
+class SpriteMoveHandleEvent(EventRecord):
+    """SPRITE_MOVE_HANDLE, decoded. Maps to Swift: `PackedSpriteMoveHandleEvent`"""
+
+    __slots__ = ("handle", "positionX", "positionY", "positionZ")
+    type = Events.SPRITE_MOVE_HANDLE.value
+    _keys = ("handle", "positionX", "positionY", "positionZ")
+    _struct = struct.Struct("<4xQ4xIfff")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.SPRITE_MOVE_HANDLE.value]
+
+    def __init__(
+        self,
+        timestamp: int,
+        handle: int,
+        positionX: float,
+        positionY: float,
+        positionZ: float,
+    ):
+        self.timestamp = timestamp
+        self.handle = handle
+        self.positionX = positionX
+        self.positionY = positionY
+        self.positionZ = positionZ
+
+
+class SpriteScaleHandleEvent(EventRecord):
+    """SPRITE_SCALE_HANDLE, decoded. Maps to Swift: `PackedSpriteScaleHandleEvent`"""
+
+    __slots__ = ("handle", "scaleX", "scaleY", "scaleZ")
+    type = Events.SPRITE_SCALE_HANDLE.value
+    _keys = ("handle", "scaleX", "scaleY", "scaleZ")
+    _struct = struct.Struct("<4xQ4xIfff")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.SPRITE_SCALE_HANDLE.value]
+
+    def __init__(
+        self, timestamp: int, handle: int, scaleX: float, scaleY: float, scaleZ: float
+    ):
+        self.timestamp = timestamp
+        self.handle = handle
+        self.scaleX = scaleX
+        self.scaleY = scaleY
+        self.scaleZ = scaleZ
+
+
+class SpriteRotateHandleEvent(EventRecord):
+    """SPRITE_ROTATE_HANDLE, decoded. Maps to Swift: `PackedSpriteRotateHandleEvent`"""
+
+    __slots__ = ("handle", "rotationX", "rotationY", "rotationZ")
+    type = Events.SPRITE_ROTATE_HANDLE.value
+    _keys = ("handle", "rotationX", "rotationY", "rotationZ")
+    _struct = struct.Struct("<4xQ4xIfff")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.SPRITE_ROTATE_HANDLE.value]
+
+    def __init__(
+        self,
+        timestamp: int,
+        handle: int,
+        rotationX: float,
+        rotationY: float,
+        rotationZ: float,
+    ):
+        self.timestamp = timestamp
+        self.handle = handle
+        self.rotationX = rotationX
+        self.rotationY = rotationY
+        self.rotationZ = rotationZ
+
+
+class SpriteSpeedHandleEvent(EventRecord):
+    """SPRITE_SPEED_HANDLE, decoded. Maps to Swift: `PackedSpriteSpeedHandleEvent`"""
+
+    __slots__ = ("handle", "speedX", "speedY")
+    type = Events.SPRITE_SPEED_HANDLE.value
+    _keys = ("handle", "speedX", "speedY")
+    _struct = struct.Struct("<4xQ4xIff4x")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.SPRITE_SPEED_HANDLE.value]
+
+    def __init__(self, timestamp: int, handle: int, speedX: float, speedY: float):
+        self.timestamp = timestamp
+        self.handle = handle
+        self.speedX = speedX
+        self.speedY = speedY
+
+
+class GeomAddPointEvent(EventRecord):
+    """GEOM_ADD_POINT, decoded. Maps to Swift: `PackedGeomAddPointEvent`"""
+
+    __slots__ = ("id1", "id2", "z", "r", "g", "b", "a", "isScreenSpace", "x", "y")
+    type = Events.GEOM_ADD_POINT.value
+    _keys = ("id1", "id2", "z", "r", "g", "b", "a", "isScreenSpace", "x", "y")
+    _struct = struct.Struct("<4xQ4xqqdBBBBB3xff")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.GEOM_ADD_POINT.value]
+
+    def __init__(
+        self,
+        timestamp: int,
+        id1: int,
+        id2: int,
+        z: float,
+        r: int,
+        g: int,
+        b: int,
+        a: int,
+        isScreenSpace: int,
+        x: float,
+        y: float,
+    ):
+        self.timestamp = timestamp
+        self.id1 = id1
+        self.id2 = id2
+        self.z = z
+        self.r = r
+        self.g = g
+        self.b = b
+        self.a = a
+        self.isScreenSpace = isScreenSpace
+        self.x = x
+        self.y = y
+
+
+class GeomAddLineEvent(EventRecord):
+    """GEOM_ADD_LINE, decoded. Maps to Swift: `PackedGeomAddLineEvent`"""
+
+    __slots__ = (
+        "id1",
+        "id2",
+        "z",
+        "r",
+        "g",
+        "b",
+        "a",
+        "isScreenSpace",
+        "x1",
+        "y1",
+        "x2",
+        "y2",
+    )
+    type = Events.GEOM_ADD_LINE.value
+    _keys = (
+        "id1",
+        "id2",
+        "z",
+        "r",
+        "g",
+        "b",
+        "a",
+        "isScreenSpace",
+        "x1",
+        "y1",
+        "x2",
+        "y2",
+    )
+    _struct = struct.Struct("<4xQ4xqqdBBBBB3xffff")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.GEOM_ADD_LINE.value]
+
+    def __init__(
+        self,
+        timestamp: int,
+        id1: int,
+        id2: int,
+        z: float,
+        r: int,
+        g: int,
+        b: int,
+        a: int,
+        isScreenSpace: int,
+        x1: float,
+        y1: float,
+        x2: float,
+        y2: float,
+    ):
+        self.timestamp = timestamp
+        self.id1 = id1
+        self.id2 = id2
+        self.z = z
+        self.r = r
+        self.g = g
+        self.b = b
+        self.a = a
+        self.isScreenSpace = isScreenSpace
+        self.x1 = x1
+        self.y1 = y1
+        self.x2 = x2
+        self.y2 = y2
+
+
+class GeomAddRectEvent(EventRecord):
+    """GEOM_ADD_RECT, decoded. Maps to Swift: `PackedGeomAddRectEvent`"""
+
+    __slots__ = (
+        "id1",
+        "id2",
+        "z",
+        "r",
+        "g",
+        "b",
+        "a",
+        "isScreenSpace",
+        "x",
+        "y",
+        "w",
+        "h",
+    )
+    type = Events.GEOM_ADD_RECT.value
+    _keys = ("id1", "id2", "z", "r", "g", "b", "a", "isScreenSpace", "x", "y", "w", "h")
+    _struct = struct.Struct("<4xQ4xqqdBBBBB3xffff")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.GEOM_ADD_RECT.value]
+
+    def __init__(
+        self,
+        timestamp: int,
+        id1: int,
+        id2: int,
+        z: float,
+        r: int,
+        g: int,
+        b: int,
+        a: int,
+        isScreenSpace: int,
+        x: float,
+        y: float,
+        w: float,
+        h: float,
+    ):
+        self.timestamp = timestamp
+        self.id1 = id1
+        self.id2 = id2
+        self.z = z
+        self.r = r
+        self.g = g
+        self.b = b
+        self.a = a
+        self.isScreenSpace = isScreenSpace
+        self.x = x
+        self.y = y
+        self.w = w
+        self.h = h
+
+
+class GeomAddFillRectEvent(EventRecord):
+    """GEOM_ADD_FILL_RECT, decoded. Maps to Swift: `PackedGeomAddRectEvent`"""
+
+    __slots__ = (
+        "id1",
+        "id2",
+        "z",
+        "r",
+        "g",
+        "b",
+        "a",
+        "isScreenSpace",
+        "x",
+        "y",
+        "w",
+        "h",
+    )
+    type = Events.GEOM_ADD_FILL_RECT.value
+    _keys = ("id1", "id2", "z", "r", "g", "b", "a", "isScreenSpace", "x", "y", "w", "h")
+    _struct = struct.Struct("<4xQ4xqqdBBBBB3xffff")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.GEOM_ADD_FILL_RECT.value]
+
+    def __init__(
+        self,
+        timestamp: int,
+        id1: int,
+        id2: int,
+        z: float,
+        r: int,
+        g: int,
+        b: int,
+        a: int,
+        isScreenSpace: int,
+        x: float,
+        y: float,
+        w: float,
+        h: float,
+    ):
+        self.timestamp = timestamp
+        self.id1 = id1
+        self.id2 = id2
+        self.z = z
+        self.r = r
+        self.g = g
+        self.b = b
+        self.a = a
+        self.isScreenSpace = isScreenSpace
+        self.x = x
+        self.y = y
+        self.w = w
+        self.h = h
+
+
+class GeomAddPackedEvent(EventRecord):
+    """GEOM_ADD_PACKED, decoded. Maps to Swift: `PackedGeomAddPackedHeaderEvent`"""
+
+    __slots__ = (
+        "id1",
+        "id2",
+        "z",
+        "r",
+        "g",
+        "b",
+        "a",
+        "isScreenSpace",
+        "primitiveType",
+        "count",
+    )
+    type = Events.GEOM_ADD_PACKED.value
+    _keys = (
+        "id1",
+        "id2",
+        "z",
+        "r",
+        "g",
+        "b",
+        "a",
+        "isScreenSpace",
+        "primitiveType",
+        "count",
+    )
+    _struct = struct.Struct("<4xQ4xqqdBBBBB2xII1x")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.GEOM_ADD_PACKED.value]
+
+    def __init__(
+        self,
+        timestamp: int,
+        id1: int,
+        id2: int,
+        z: float,
+        r: int,
+        g: int,
+        b: int,
+        a: int,
+        isScreenSpace: int,
+        primitiveType: int,
+        count: int,
+    ):
+        self.timestamp = timestamp
+        self.id1 = id1
+        self.id2 = id2
+        self.z = z
+        self.r = r
+        self.g = g
+        self.b = b
+        self.a = a
+        self.isScreenSpace = isScreenSpace
+        self.primitiveType = primitiveType
+        self.count = count
+
+
+class GeomRemoveEvent(EventRecord):
+    """GEOM_REMOVE, decoded. Maps to Swift: `PackedGeomRemoveEvent`"""
+
+    __slots__ = ("id1", "id2")
+    type = Events.GEOM_REMOVE.value
+    _keys = ("id1", "id2")
+    _struct = struct.Struct("<4xQ4xqq")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.GEOM_REMOVE.value]
+
+    def __init__(self, timestamp: int, id1: int, id2: int):
+        self.timestamp = timestamp
+        self.id1 = id1
+        self.id2 = id2
+
+
+class GeomSetColorEvent(EventRecord):
+    """GEOM_SET_COLOR, decoded. Maps to Swift: `PackedGeomSetColorEvent`"""
+
+    __slots__ = ("id1", "id2", "r", "g", "b", "a")
+    type = Events.GEOM_SET_COLOR.value
+    _keys = ("id1", "id2", "r", "g", "b", "a")
+    _struct = struct.Struct("<4xQ4xqqBBBB4x")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.GEOM_SET_COLOR.value]
+
+    def __init__(
+        self, timestamp: int, id1: int, id2: int, r: int, g: int, b: int, a: int
+    ):
+        self.timestamp = timestamp
+        self.id1 = id1
+        self.id2 = id2
+        self.r = r
+        self.g = g
+        self.b = b
+        self.a = a
+
+
+class InputKeyupEvent(EventRecord):
+    """INPUT_KEYUP, decoded. Maps to Swift: `PackedKeyEvent`"""
+
+    __slots__ = ("scancode", "keycode", "mod", "isRepeat")
+    type = Events.INPUT_KEYUP.value
+    _keys = ("scancode", "keycode", "mod", "isRepeat")
+    _struct = struct.Struct("<4xQ4xiIHBx4x")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.INPUT_KEYUP.value]
+
+    def __init__(
+        self, timestamp: int, scancode: int, keycode: int, mod: int, isRepeat: int
+    ):
+        self.timestamp = timestamp
+        self.scancode = scancode
+        self.keycode = keycode
+        self.mod = mod
+        self.isRepeat = isRepeat
+
+
+class InputKeydownEvent(EventRecord):
+    """INPUT_KEYDOWN, decoded. Maps to Swift: `PackedKeyEvent`"""
+
+    __slots__ = ("scancode", "keycode", "mod", "isRepeat")
+    type = Events.INPUT_KEYDOWN.value
+    _keys = ("scancode", "keycode", "mod", "isRepeat")
+    _struct = struct.Struct("<4xQ4xiIHBx4x")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.INPUT_KEYDOWN.value]
+
+    def __init__(
+        self, timestamp: int, scancode: int, keycode: int, mod: int, isRepeat: int
+    ):
+        self.timestamp = timestamp
+        self.scancode = scancode
+        self.keycode = keycode
+        self.mod = mod
+        self.isRepeat = isRepeat
+
+
+class InputMouseupEvent(EventRecord):
+    """INPUT_MOUSEUP, decoded. Maps to Swift: `PackedMouseButtonEvent`"""
+
+    __slots__ = ("x", "y", "button", "clicks")
+    type = Events.INPUT_MOUSEUP.value
+    _keys = ("x", "y", "button", "clicks")
+    _struct = struct.Struct("<4xQ4xffBB2x4x")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.INPUT_MOUSEUP.value]
+
+    def __init__(self, timestamp: int, x: float, y: float, button: int, clicks: int):
+        self.timestamp = timestamp
+        self.x = x
+        self.y = y
+        self.button = button
+        self.clicks = clicks
+
+
+class InputMousedownEvent(EventRecord):
+    """INPUT_MOUSEDOWN, decoded. Maps to Swift: `PackedMouseButtonEvent`"""
+
+    __slots__ = ("x", "y", "button", "clicks")
+    type = Events.INPUT_MOUSEDOWN.value
+    _keys = ("x", "y", "button", "clicks")
+    _struct = struct.Struct("<4xQ4xffBB2x4x")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.INPUT_MOUSEDOWN.value]
+
+    def __init__(self, timestamp: int, x: float, y: float, button: int, clicks: int):
+        self.timestamp = timestamp
+        self.x = x
+        self.y = y
+        self.button = button
+        self.clicks = clicks
+
+
+class InputMousemotionEvent(EventRecord):
+    """INPUT_MOUSEMOTION, decoded. Maps to Swift: `PackedMouseMotionEvent`"""
+
+    __slots__ = ("x", "y", "xrel", "yrel")
+    type = Events.INPUT_MOUSEMOTION.value
+    _keys = ("x", "y", "xrel", "yrel")
+    _struct = struct.Struct("<4xQ4xffff")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.INPUT_MOUSEMOTION.value]
+
+    def __init__(self, timestamp: int, x: float, y: float, xrel: float, yrel: float):
+        self.timestamp = timestamp
+        self.x = x
+        self.y = y
+        self.xrel = xrel
+        self.yrel = yrel
+
+
+class WindowTitleEvent(EventRecord):
+    """WINDOW_TITLE, decoded. Maps to Swift: `PackedWindowTitleEvent`"""
+
+    __slots__ = ("title",)
+    type = Events.WINDOW_TITLE.value
+    _keys = ("title",)
+    _struct = struct.Struct("<4xQ4x256s")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.WINDOW_TITLE.value]
+
+    def __init__(self, timestamp: int, title: bytes):
+        self.timestamp = timestamp
+        self.title = title
+
+
+class WindowResizeEvent(EventRecord):
+    """WINDOW_RESIZE, decoded. Maps to Swift: `PackedWindowResizeEvent`"""
+
+    __slots__ = ("w", "h")
+    type = Events.WINDOW_RESIZE.value
+    _keys = ("w", "h")
+    _struct = struct.Struct("<4xQ4xii")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.WINDOW_RESIZE.value]
+
+    def __init__(self, timestamp: int, w: int, h: int):
+        self.timestamp = timestamp
+        self.w = w
+        self.h = h
+
+
+class WindowFlagsEvent(EventRecord):
+    """WINDOW_FLAGS, decoded. Maps to Swift: `PackedWindowFlagsEvent`"""
+
+    __slots__ = ("flags",)
+    type = Events.WINDOW_FLAGS.value
+    _keys = ("flags",)
+    _struct = struct.Struct("<4xQ4xQ")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.WINDOW_FLAGS.value]
+
+    def __init__(self, timestamp: int, flags: int):
+        self.timestamp = timestamp
+        self.flags = flags
+
+
+class TextAddEvent(EventRecord):
+    """TEXT_ADD, decoded. Maps to Swift: `PackedTextAddEvent`"""
+
+    __slots__ = (
+        "id1",
+        "id2",
+        "positionX",
+        "positionY",
+        "positionZ",
+        "r",
+        "g",
+        "b",
+        "a",
+        "fontSize",
+        "fontPathLength",
+        "textLength",
+        "fontPath",
+        "text",
+    )
+    type = Events.TEXT_ADD.value
+    _keys = (
+        "id1",
+        "id2",
+        "positionX",
+        "positionY",
+        "positionZ",
+        "r",
+        "g",
+        "b",
+        "a",
+        "fontSize",
+        "fontPathLength",
+        "textLength",
+    )
+    _tails = (("fontPath", "fontPathLength"), ("text", "textLength"))
+    _struct = struct.Struct("<4xQ4xqqdddBBBB4xfII4x")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.TEXT_ADD.value]
+
+    def __init__(
+        self,
+        timestamp: int,
+        id1: int,
+        id2: int,
+        positionX: float,
+        positionY: float,
+        positionZ: float,
+        r: int,
+        g: int,
+        b: int,
+        a: int,
+        fontSize: float,
+        fontPathLength: int,
+        textLength: int,
+        fontPath: str = "",
+        text: str = "",
+    ):
+        self.timestamp = timestamp
+        self.id1 = id1
+        self.id2 = id2
+        self.positionX = positionX
+        self.positionY = positionY
+        self.positionZ = positionZ
+        self.r = r
+        self.g = g
+        self.b = b
+        self.a = a
+        self.fontSize = fontSize
+        self.fontPathLength = fontPathLength
+        self.textLength = textLength
+        self.fontPath = fontPath
+        self.text = text
+
+
+class TextSetStringEvent(EventRecord):
+    """TEXT_SET_STRING, decoded. Maps to Swift: `PackedTextSetStringEvent`"""
+
+    __slots__ = ("id1", "id2", "textLength", "text")
+    type = Events.TEXT_SET_STRING.value
+    _keys = ("id1", "id2", "textLength")
+    _tails = (("text", "textLength"),)
+    _struct = struct.Struct("<4xQ4xqqI4x")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.TEXT_SET_STRING.value]
+
+    def __init__(
+        self, timestamp: int, id1: int, id2: int, textLength: int, text: str = ""
+    ):
+        self.timestamp = timestamp
+        self.id1 = id1
+        self.id2 = id2
+        self.textLength = textLength
+        self.text = text
+
+
+class AudioLoadEvent(EventRecord):
+    """AUDIO_LOAD, decoded. Maps to Swift: `PackedAudioLoadEvent`"""
+
+    __slots__ = ("pathLength", "path")
+    type = Events.AUDIO_LOAD.value
+    _keys = ("pathLength",)
+    _tails = (("path", "pathLength"),)
+    _struct = struct.Struct("<4xQ4xI4x")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.AUDIO_LOAD.value]
+
+    def __init__(self, timestamp: int, pathLength: int, path: str = ""):
+        self.timestamp = timestamp
+        self.pathLength = pathLength
+        self.path = path
+
+
+class AudioLoadedEvent(EventRecord):
+    """AUDIO_LOADED, decoded. Maps to Swift: `PackedAudioLoadedEvent`"""
+
+    __slots__ = ("audioId",)
+    type = Events.AUDIO_LOADED.value
+    _keys = ("audioId",)
+    _struct = struct.Struct("<4xQ4xQ")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.AUDIO_LOADED.value]
+
+    def __init__(self, timestamp: int, audioId: int):
+        self.timestamp = timestamp
+        self.audioId = audioId
+
+
+class AudioPlayEvent(EventRecord):
+    """AUDIO_PLAY, decoded. Maps to Swift: `PackedAudioPlayEvent`"""
+
+    __slots__ = ("audioId",)
+    type = Events.AUDIO_PLAY.value
+    _keys = ("audioId",)
+    _struct = struct.Struct("<4xQ4xQ")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.AUDIO_PLAY.value]
+
+    def __init__(self, timestamp: int, audioId: int):
+        self.timestamp = timestamp
+        self.audioId = audioId
+
+
+class AudioStopAllEvent(EventRecord):
+    """AUDIO_STOP_ALL, decoded. Maps to Swift: `PackedAudioStopAllEvent`"""
+
+    __slots__ = ("_unused",)
+    type = Events.AUDIO_STOP_ALL.value
+    _keys = ("_unused",)
+    _struct = struct.Struct("<4xQ4xB7x")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.AUDIO_STOP_ALL.value]
+
+    def __init__(self, timestamp: int, _unused: int):
+        self.timestamp = timestamp
+        self._unused = _unused
+
+
+class AudioSetMasterVolumeEvent(EventRecord):
+    """AUDIO_SET_MASTER_VOLUME, decoded. Maps to Swift: `PackedAudioSetMasterVolumeEvent`"""
+
+    __slots__ = ("volume",)
+    type = Events.AUDIO_SET_MASTER_VOLUME.value
+    _keys = ("volume",)
+    _struct = struct.Struct("<4xQ4xf4x")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.AUDIO_SET_MASTER_VOLUME.value]
+
+    def __init__(self, timestamp: int, volume: float):
+        self.timestamp = timestamp
+        self.volume = volume
+
+
+class AudioPauseEvent(EventRecord):
+    """AUDIO_PAUSE, decoded. Maps to Swift: `PackedAudioPauseEvent`"""
+
+    __slots__ = ("audioId",)
+    type = Events.AUDIO_PAUSE.value
+    _keys = ("audioId",)
+    _struct = struct.Struct("<4xQ4xQ")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.AUDIO_PAUSE.value]
+
+    def __init__(self, timestamp: int, audioId: int):
+        self.timestamp = timestamp
+        self.audioId = audioId
+
+
+class AudioStopEvent(EventRecord):
+    """AUDIO_STOP, decoded. Maps to Swift: `PackedAudioStopEvent`"""
+
+    __slots__ = ("audioId",)
+    type = Events.AUDIO_STOP.value
+    _keys = ("audioId",)
+    _struct = struct.Struct("<4xQ4xQ")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.AUDIO_STOP.value]
+
+    def __init__(self, timestamp: int, audioId: int):
+        self.timestamp = timestamp
+        self.audioId = audioId
+
+
+class AudioUnloadEvent(EventRecord):
+    """AUDIO_UNLOAD, decoded. Maps to Swift: `PackedAudioUnloadEvent`"""
+
+    __slots__ = ("audioId",)
+    type = Events.AUDIO_UNLOAD.value
+    _keys = ("audioId",)
+    _struct = struct.Struct("<4xQ4xQ")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.AUDIO_UNLOAD.value]
+
+    def __init__(self, timestamp: int, audioId: int):
+        self.timestamp = timestamp
+        self.audioId = audioId
+
+
+class AudioSetVolumeEvent(EventRecord):
+    """AUDIO_SET_VOLUME, decoded. Maps to Swift: `PackedAudioSetVolumeEvent`"""
+
+    __slots__ = ("audioId", "volume")
+    type = Events.AUDIO_SET_VOLUME.value
+    _keys = ("audioId", "volume")
+    _struct = struct.Struct("<4xQ4xQf4x")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.AUDIO_SET_VOLUME.value]
+
+    def __init__(self, timestamp: int, audioId: int, volume: float):
+        self.timestamp = timestamp
+        self.audioId = audioId
+        self.volume = volume
+
+
+class PhysicsAddBodyEvent(EventRecord):
+    """PHYSICS_ADD_BODY, decoded. Maps to Swift: `PackedPhysicsAddBodyEvent`"""
+
+    __slots__ = (
+        "id1",
+        "id2",
+        "positionX",
+        "positionY",
+        "bodyType",
+        "shapeType",
+        "lockRotation",
+        "mass",
+        "friction",
+        "elasticity",
+        "width",
+        "height",
+    )
+    type = Events.PHYSICS_ADD_BODY.value
+    _keys = (
+        "id1",
+        "id2",
+        "positionX",
+        "positionY",
+        "bodyType",
+        "shapeType",
+        "lockRotation",
+        "mass",
+        "friction",
+        "elasticity",
+        "width",
+        "height",
+    )
+    _struct = struct.Struct("<4xQ4xqqddBBB5xddddd")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.PHYSICS_ADD_BODY.value]
+
+    def __init__(
+        self,
+        timestamp: int,
+        id1: int,
+        id2: int,
+        positionX: float,
+        positionY: float,
+        bodyType: int,
+        shapeType: int,
+        lockRotation: int,
+        mass: float,
+        friction: float,
+        elasticity: float,
+        width: float,
+        height: float,
+    ):
+        self.timestamp = timestamp
+        self.id1 = id1
+        self.id2 = id2
+        self.positionX = positionX
+        self.positionY = positionY
+        self.bodyType = bodyType
+        self.shapeType = shapeType
+        self.lockRotation = lockRotation
+        self.mass = mass
+        self.friction = friction
+        self.elasticity = elasticity
+        self.width = width
+        self.height = height
+
+
+class PhysicsRemoveBodyEvent(EventRecord):
+    """PHYSICS_REMOVE_BODY, decoded. Maps to Swift: `PackedPhysicsRemoveBodyEvent`"""
+
+    __slots__ = ("id1", "id2")
+    type = Events.PHYSICS_REMOVE_BODY.value
+    _keys = ("id1", "id2")
+    _struct = struct.Struct("<4xQ4xqq")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.PHYSICS_REMOVE_BODY.value]
+
+    def __init__(self, timestamp: int, id1: int, id2: int):
+        self.timestamp = timestamp
+        self.id1 = id1
+        self.id2 = id2
+
+
+class PhysicsApplyForceEvent(EventRecord):
+    """PHYSICS_APPLY_FORCE, decoded. Maps to Swift: `PackedPhysicsApplyForceEvent`"""
+
+    __slots__ = ("id1", "id2", "forceX", "forceY")
+    type = Events.PHYSICS_APPLY_FORCE.value
+    _keys = ("id1", "id2", "forceX", "forceY")
+    _struct = struct.Struct("<4xQ4xqqdd")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.PHYSICS_APPLY_FORCE.value]
+
+    def __init__(
+        self, timestamp: int, id1: int, id2: int, forceX: float, forceY: float
+    ):
+        self.timestamp = timestamp
+        self.id1 = id1
+        self.id2 = id2
+        self.forceX = forceX
+        self.forceY = forceY
+
+
+class PhysicsApplyImpulseEvent(EventRecord):
+    """PHYSICS_APPLY_IMPULSE, decoded. Maps to Swift: `PackedPhysicsApplyImpulseEvent`"""
+
+    __slots__ = ("id1", "id2", "impulseX", "impulseY")
+    type = Events.PHYSICS_APPLY_IMPULSE.value
+    _keys = ("id1", "id2", "impulseX", "impulseY")
+    _struct = struct.Struct("<4xQ4xqqdd")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.PHYSICS_APPLY_IMPULSE.value]
+
+    def __init__(
+        self, timestamp: int, id1: int, id2: int, impulseX: float, impulseY: float
+    ):
+        self.timestamp = timestamp
+        self.id1 = id1
+        self.id2 = id2
+        self.impulseX = impulseX
+        self.impulseY = impulseY
+
+
+class PhysicsSetVelocityEvent(EventRecord):
+    """PHYSICS_SET_VELOCITY, decoded. Maps to Swift: `PackedPhysicsSetVelocityEvent`"""
+
+    __slots__ = ("id1", "id2", "velocityX", "velocityY")
+    type = Events.PHYSICS_SET_VELOCITY.value
+    _keys = ("id1", "id2", "velocityX", "velocityY")
+    _struct = struct.Struct("<4xQ4xqqdd")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.PHYSICS_SET_VELOCITY.value]
+
+    def __init__(
+        self, timestamp: int, id1: int, id2: int, velocityX: float, velocityY: float
+    ):
+        self.timestamp = timestamp
+        self.id1 = id1
+        self.id2 = id2
+        self.velocityX = velocityX
+        self.velocityY = velocityY
+
+
+class PhysicsSetPositionEvent(EventRecord):
+    """PHYSICS_SET_POSITION, decoded. Maps to Swift: `PackedPhysicsSetPositionEvent`"""
+
+    __slots__ = ("id1", "id2", "positionX", "positionY")
+    type = Events.PHYSICS_SET_POSITION.value
+    _keys = ("id1", "id2", "positionX", "positionY")
+    _struct = struct.Struct("<4xQ4xqqdd")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.PHYSICS_SET_POSITION.value]
+
+    def __init__(
+        self, timestamp: int, id1: int, id2: int, positionX: float, positionY: float
+    ):
+        self.timestamp = timestamp
+        self.id1 = id1
+        self.id2 = id2
+        self.positionX = positionX
+        self.positionY = positionY
+
+
+class PhysicsSetRotationEvent(EventRecord):
+    """PHYSICS_SET_ROTATION, decoded. Maps to Swift: `PackedPhysicsSetRotationEvent`"""
+
+    __slots__ = ("id1", "id2", "angleInRadians")
+    type = Events.PHYSICS_SET_ROTATION.value
+    _keys = ("id1", "id2", "angleInRadians")
+    _struct = struct.Struct("<4xQ4xqqd")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.PHYSICS_SET_ROTATION.value]
+
+    def __init__(self, timestamp: int, id1: int, id2: int, angleInRadians: float):
+        self.timestamp = timestamp
+        self.id1 = id1
+        self.id2 = id2
+        self.angleInRadians = angleInRadians
+
+
+class PhysicsBindHandleEvent(EventRecord):
+    """PHYSICS_BIND_HANDLE, decoded. Maps to Swift: `PackedPhysicsBindHandleEvent`"""
+
+    __slots__ = ("id1", "id2", "handle")
+    type = Events.PHYSICS_BIND_HANDLE.value
+    _keys = ("id1", "id2", "handle")
+    _struct = struct.Struct("<4xQ4xqqI4x")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.PHYSICS_BIND_HANDLE.value]
+
+    def __init__(self, timestamp: int, id1: int, id2: int, handle: int):
+        self.timestamp = timestamp
+        self.id1 = id1
+        self.id2 = id2
+        self.handle = handle
+
+
+class PhysicsReleaseHandleEvent(EventRecord):
+    """PHYSICS_RELEASE_HANDLE, decoded. Maps to Swift: `PackedPhysicsReleaseHandleEvent`"""
+
+    __slots__ = ("handle",)
+    type = Events.PHYSICS_RELEASE_HANDLE.value
+    _keys = ("handle",)
+    _struct = struct.Struct("<4xQ4xI4x")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.PHYSICS_RELEASE_HANDLE.value]
+
+    def __init__(self, timestamp: int, handle: int):
+        self.timestamp = timestamp
+        self.handle = handle
+
+
+class PhysicsSetVelocityHandleEvent(EventRecord):
+    """PHYSICS_SET_VELOCITY_HANDLE, decoded. Maps to Swift: `PackedPhysicsSetVelocityHandleEvent`"""
+
+    __slots__ = ("handle", "velocityX", "velocityY")
+    type = Events.PHYSICS_SET_VELOCITY_HANDLE.value
+    _keys = ("handle", "velocityX", "velocityY")
+    _struct = struct.Struct("<4xQ4xI4xdd")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.PHYSICS_SET_VELOCITY_HANDLE.value]
+
+    def __init__(self, timestamp: int, handle: int, velocityX: float, velocityY: float):
+        self.timestamp = timestamp
+        self.handle = handle
+        self.velocityX = velocityX
+        self.velocityY = velocityY
+
+
+class PhysicsSetPositionHandleEvent(EventRecord):
+    """PHYSICS_SET_POSITION_HANDLE, decoded. Maps to Swift: `PackedPhysicsSetPositionHandleEvent`"""
+
+    __slots__ = ("handle", "positionX", "positionY")
+    type = Events.PHYSICS_SET_POSITION_HANDLE.value
+    _keys = ("handle", "positionX", "positionY")
+    _struct = struct.Struct("<4xQ4xI4xdd")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.PHYSICS_SET_POSITION_HANDLE.value]
+
+    def __init__(self, timestamp: int, handle: int, positionX: float, positionY: float):
+        self.timestamp = timestamp
+        self.handle = handle
+        self.positionX = positionX
+        self.positionY = positionY
+
+
+class PhysicsSetRotationHandleEvent(EventRecord):
+    """PHYSICS_SET_ROTATION_HANDLE, decoded. Maps to Swift: `PackedPhysicsSetRotationHandleEvent`"""
+
+    __slots__ = ("handle", "angleInRadians")
+    type = Events.PHYSICS_SET_ROTATION_HANDLE.value
+    _keys = ("handle", "angleInRadians")
+    _struct = struct.Struct("<4xQ4xI4xd")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.PHYSICS_SET_ROTATION_HANDLE.value]
+
+    def __init__(self, timestamp: int, handle: int, angleInRadians: float):
+        self.timestamp = timestamp
+        self.handle = handle
+        self.angleInRadians = angleInRadians
+
+
+class PhysicsCollisionBeginEvent(EventRecord):
+    """PHYSICS_COLLISION_BEGIN, decoded. Maps to Swift: `PackedPhysicsCollisionEvent`"""
+
+    __slots__ = ("id1_A", "id2_A", "id1_B", "id2_B")
+    type = Events.PHYSICS_COLLISION_BEGIN.value
+    _keys = ("id1_A", "id2_A", "id1_B", "id2_B")
+    _struct = struct.Struct("<4xQ4xqqqq")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.PHYSICS_COLLISION_BEGIN.value]
+
+    def __init__(self, timestamp: int, id1_A: int, id2_A: int, id1_B: int, id2_B: int):
+        self.timestamp = timestamp
+        self.id1_A = id1_A
+        self.id2_A = id2_A
+        self.id1_B = id1_B
+        self.id2_B = id2_B
+
+
+class PhysicsCollisionSeparateEvent(EventRecord):
+    """PHYSICS_COLLISION_SEPARATE, decoded. Maps to Swift: `PackedPhysicsCollisionEvent`"""
+
+    __slots__ = ("id1_A", "id2_A", "id1_B", "id2_B")
+    type = Events.PHYSICS_COLLISION_SEPARATE.value
+    _keys = ("id1_A", "id2_A", "id1_B", "id2_B")
+    _struct = struct.Struct("<4xQ4xqqqq")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.PHYSICS_COLLISION_SEPARATE.value]
+
+    def __init__(self, timestamp: int, id1_A: int, id2_A: int, id1_B: int, id2_B: int):
+        self.timestamp = timestamp
+        self.id1_A = id1_A
+        self.id2_A = id2_A
+        self.id1_B = id1_B
+        self.id2_B = id2_B
+
+
+class PhysicsSyncTransformEvent(EventRecord):
+    """PHYSICS_SYNC_TRANSFORM, decoded. Maps to Swift: `PackedPhysicsSyncTransformEvent`"""
+
+    __slots__ = (
+        "id1",
+        "id2",
+        "positionX",
+        "positionY",
+        "angle",
+        "velocityX",
+        "velocityY",
+        "angularVelocity",
+        "isSleeping",
+    )
+    type = Events.PHYSICS_SYNC_TRANSFORM.value
+    _keys = (
+        "id1",
+        "id2",
+        "positionX",
+        "positionY",
+        "angle",
+        "velocityX",
+        "velocityY",
+        "angularVelocity",
+        "isSleeping",
+    )
+    _struct = struct.Struct("<4xQ4xqqddddddB7x")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.PHYSICS_SYNC_TRANSFORM.value]
+
+    def __init__(
+        self,
+        timestamp: int,
+        id1: int,
+        id2: int,
+        positionX: float,
+        positionY: float,
+        angle: float,
+        velocityX: float,
+        velocityY: float,
+        angularVelocity: float,
+        isSleeping: int,
+    ):
+        self.timestamp = timestamp
+        self.id1 = id1
+        self.id2 = id2
+        self.positionX = positionX
+        self.positionY = positionY
+        self.angle = angle
+        self.velocityX = velocityX
+        self.velocityY = velocityY
+        self.angularVelocity = angularVelocity
+        self.isSleeping = isSleeping
+
+
+class PhysicsSetDebugModeEvent(EventRecord):
+    """PHYSICS_SET_DEBUG_MODE, decoded. Maps to Swift: `PackedPhysicsSetDebugModeEvent`"""
+
+    __slots__ = ("enabled",)
+    type = Events.PHYSICS_SET_DEBUG_MODE.value
+    _keys = ("enabled",)
+    _struct = struct.Struct("<4xQ4xB3x4x")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.PHYSICS_SET_DEBUG_MODE.value]
+
+    def __init__(self, timestamp: int, enabled: int):
+        self.timestamp = timestamp
+        self.enabled = enabled
+
+
+class PluginEvent(EventRecord):
+    """PLUGIN, decoded. Maps to Swift: `PackedPluginOnEvent`"""
+
+    __slots__ = ("eventId",)
+    type = Events.PLUGIN.value
+    _keys = ("eventId",)
+    _struct = struct.Struct("<4xQ4xB7x")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.PLUGIN.value]
+
+    def __init__(self, timestamp: int, eventId: int):
+        self.timestamp = timestamp
+        self.eventId = eventId
+
+
+class PluginLoadEvent(EventRecord):
+    """PLUGIN_LOAD, decoded. Maps to Swift: `PackedPluginLoadHeaderEvent`"""
+
+    __slots__ = ("channelNo", "pathLength", "path")
+    type = Events.PLUGIN_LOAD.value
+    _keys = ("channelNo", "pathLength")
+    _tails = (("path", "pathLength"),)
+    _struct = struct.Struct("<4xQ4xII")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.PLUGIN_LOAD.value]
+
+    def __init__(self, timestamp: int, channelNo: int, pathLength: int, path: str = ""):
+        self.timestamp = timestamp
+        self.channelNo = channelNo
+        self.pathLength = pathLength
+        self.path = path
+
+
+class PluginUnloadEvent(EventRecord):
+    """PLUGIN_UNLOAD, decoded. Maps to Swift: `PackedPluginUnloadEvent`"""
+
+    __slots__ = ("pluginId",)
+    type = Events.PLUGIN_UNLOAD.value
+    _keys = ("pluginId",)
+    _struct = struct.Struct("<4xQ4xB7x")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.PLUGIN_UNLOAD.value]
+
+    def __init__(self, timestamp: int, pluginId: int):
+        self.timestamp = timestamp
+        self.pluginId = pluginId
+
+
+class PluginSetEvent(EventRecord):
+    """PLUGIN_SET, decoded. Maps to Swift: `PackedPluginSetEvent`"""
+
+    __slots__ = ("pluginId",)
+    type = Events.PLUGIN_SET.value
+    _keys = ("pluginId",)
+    _struct = struct.Struct("<4xQ4xB7x")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.PLUGIN_SET.value]
+
+    def __init__(self, timestamp: int, pluginId: int):
+        self.timestamp = timestamp
+        self.pluginId = pluginId
+
+
+class PluginEventStackingEvent(EventRecord):
+    """PLUGIN_EVENT_STACKING, decoded. Maps to Swift: `PackedPluginEventStackingEvent`"""
+
+    __slots__ = ("eventId",)
+    type = Events.PLUGIN_EVENT_STACKING.value
+    _keys = ("eventId",)
+    _struct = struct.Struct("<4xQ4xBx6x")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.PLUGIN_EVENT_STACKING.value]
+
+    def __init__(self, timestamp: int, eventId: int):
+        self.timestamp = timestamp
+        self.eventId = eventId
+
+
+class PluginSubscribeEventEvent(EventRecord):
+    """PLUGIN_SUBSCRIBE_EVENT, decoded. Maps to Swift: `PackedPluginSubscribeEvent`"""
+
+    __slots__ = ("pluginId", "channelNo")
+    type = Events.PLUGIN_SUBSCRIBE_EVENT.value
+    _keys = ("pluginId", "channelNo")
+    _struct = struct.Struct("<4xQ4xB3xI")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.PLUGIN_SUBSCRIBE_EVENT.value]
+
+    def __init__(self, timestamp: int, pluginId: int, channelNo: int):
+        self.timestamp = timestamp
+        self.pluginId = pluginId
+        self.channelNo = channelNo
+
+
+class PluginUnsubscribeEventEvent(EventRecord):
+    """PLUGIN_UNSUBSCRIBE_EVENT, decoded. Maps to Swift: `PackedPluginUnsubscribeEvent`"""
+
+    __slots__ = ("pluginId", "channelNo")
+    type = Events.PLUGIN_UNSUBSCRIBE_EVENT.value
+    _keys = ("pluginId", "channelNo")
+    _struct = struct.Struct("<4xQ4xB3xI")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.PLUGIN_UNSUBSCRIBE_EVENT.value]
+
+    def __init__(self, timestamp: int, pluginId: int, channelNo: int):
+        self.timestamp = timestamp
+        self.pluginId = pluginId
+        self.channelNo = channelNo
+
+
+class CameraSetPositionEvent(EventRecord):
+    """CAMERA_SET_POSITION, decoded. Maps to Swift: `PackedCameraSetPositionEvent`"""
+
+    __slots__ = ("positionX", "positionY")
+    type = Events.CAMERA_SET_POSITION.value
+    _keys = ("positionX", "positionY")
+    _struct = struct.Struct("<4xQ4xdd")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.CAMERA_SET_POSITION.value]
+
+    def __init__(self, timestamp: int, positionX: float, positionY: float):
+        self.timestamp = timestamp
+        self.positionX = positionX
+        self.positionY = positionY
+
+
+class CameraMoveEvent(EventRecord):
+    """CAMERA_MOVE, decoded. Maps to Swift: `PackedCameraMoveEvent`"""
+
+    __slots__ = ("deltaX", "deltaY")
+    type = Events.CAMERA_MOVE.value
+    _keys = ("deltaX", "deltaY")
+    _struct = struct.Struct("<4xQ4xdd")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.CAMERA_MOVE.value]
+
+    def __init__(self, timestamp: int, deltaX: float, deltaY: float):
+        self.timestamp = timestamp
+        self.deltaX = deltaX
+        self.deltaY = deltaY
+
+
+class CameraSetZoomEvent(EventRecord):
+    """CAMERA_SET_ZOOM, decoded. Maps to Swift: `PackedCameraSetZoomEvent`"""
+
+    __slots__ = ("zoom",)
+    type = Events.CAMERA_SET_ZOOM.value
+    _keys = ("zoom",)
+    _struct = struct.Struct("<4xQ4xd")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.CAMERA_SET_ZOOM.value]
+
+    def __init__(self, timestamp: int, zoom: float):
+        self.timestamp = timestamp
+        self.zoom = zoom
+
+
+class CameraSetRotationEvent(EventRecord):
+    """CAMERA_SET_ROTATION, decoded. Maps to Swift: `PackedCameraSetRotationEvent`"""
+
+    __slots__ = ("angleInRadians",)
+    type = Events.CAMERA_SET_ROTATION.value
+    _keys = ("angleInRadians",)
+    _struct = struct.Struct("<4xQ4xd")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.CAMERA_SET_ROTATION.value]
+
+    def __init__(self, timestamp: int, angleInRadians: float):
+        self.timestamp = timestamp
+        self.angleInRadians = angleInRadians
+
+
+class CameraFollowEntityEvent(EventRecord):
+    """CAMERA_FOLLOW_ENTITY, decoded. Maps to Swift: `PackedCameraFollowEntityEvent`"""
+
+    __slots__ = ("id1", "id2")
+    type = Events.CAMERA_FOLLOW_ENTITY.value
+    _keys = ("id1", "id2")
+    _struct = struct.Struct("<4xQ4xqq")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.CAMERA_FOLLOW_ENTITY.value]
+
+    def __init__(self, timestamp: int, id1: int, id2: int):
+        self.timestamp = timestamp
+        self.id1 = id1
+        self.id2 = id2
+
+
+class CameraStopFollowingEvent(EventRecord):
+    """CAMERA_STOP_FOLLOWING, decoded. Maps to Swift: `PackedCameraStopFollowingEvent`"""
+
+    __slots__ = ("_unused",)
+    type = Events.CAMERA_STOP_FOLLOWING.value
+    _keys = ("_unused",)
+    _struct = struct.Struct("<4xQ4xB7x")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.CAMERA_STOP_FOLLOWING.value]
+
+    def __init__(self, timestamp: int, _unused: int):
+        self.timestamp = timestamp
+        self._unused = _unused
+
+
+class ScriptSubscribeEvent(EventRecord):
+    """SCRIPT_SUBSCRIBE, decoded. Maps to Swift: `PackedScriptSubscribeEvent`"""
+
+    __slots__ = ("channelNo",)
+    type = Events.SCRIPT_SUBSCRIBE.value
+    _keys = ("channelNo",)
+    _struct = struct.Struct("<4xQ4xI4x")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.SCRIPT_SUBSCRIBE.value]
+
+    def __init__(self, timestamp: int, channelNo: int):
+        self.timestamp = timestamp
+        self.channelNo = channelNo
+
+
+class ScriptUnsubscribeEvent(EventRecord):
+    """SCRIPT_UNSUBSCRIBE, decoded. Maps to Swift: `PackedScriptUnsubscribeEvent`"""
+
+    __slots__ = ("channelNo",)
+    type = Events.SCRIPT_UNSUBSCRIBE.value
+    _keys = ("channelNo",)
+    _struct = struct.Struct("<4xQ4xI4x")
+    _payload = PackFormat._PAYLOAD_STRUCT_MAP[Events.SCRIPT_UNSUBSCRIBE.value]
+
+    def __init__(self, timestamp: int, channelNo: int):
+        self.timestamp = timestamp
+        self.channelNo = channelNo
+
+
+PackFormat._RECORD_CLASSES.update(
+    {
+        Events.SPRITE_ADD.value: SpriteAddEvent,
+        Events.SPRITE_REMOVE.value: SpriteRemoveEvent,
+        Events.SPRITE_MOVE.value: SpriteMoveEvent,
+        Events.SPRITE_SCALE.value: SpriteScaleEvent,
+        Events.SPRITE_RESIZE.value: SpriteResizeEvent,
+        Events.SPRITE_ROTATE.value: SpriteRotateEvent,
+        Events.SPRITE_COLOR.value: SpriteColorEvent,
+        Events.SPRITE_SPEED.value: SpriteSpeedEvent,
+        Events.SPRITE_TEXTURE_LOAD.value: SpriteTextureLoadEvent,
+        Events.SPRITE_TEXTURE_SET.value: SpriteTextureSetEvent,
+        Events.SPRITE_SET_SOURCE_RECT.value: SpriteSetSourceRectEvent,
+        Events.SPRITE_MOVE_F32.value: SpriteMoveF32Event,
+        Events.SPRITE_SCALE_F32.value: SpriteScaleF32Event,
+        Events.SPRITE_ROTATE_F32.value: SpriteRotateF32Event,
+        Events.SPRITE_SPEED_F32.value: SpriteSpeedF32Event,
+        Events.SPRITE_BIND_HANDLE.value: SpriteBindHandleEvent,
+        Events.SPRITE_RELEASE_HANDLE.value: SpriteReleaseHandleEvent,
+        Events.SPRITE_MOVE_HANDLE.value: SpriteMoveHandleEvent,
+        Events.SPRITE_SCALE_HANDLE.value: SpriteScaleHandleEvent,
+        Events.SPRITE_ROTATE_HANDLE.value: SpriteRotateHandleEvent,
+        Events.SPRITE_SPEED_HANDLE.value: SpriteSpeedHandleEvent,
+        Events.GEOM_ADD_POINT.value: GeomAddPointEvent,
+        Events.GEOM_ADD_LINE.value: GeomAddLineEvent,
+        Events.GEOM_ADD_RECT.value: GeomAddRectEvent,
+        Events.GEOM_ADD_FILL_RECT.value: GeomAddFillRectEvent,
+        Events.GEOM_ADD_PACKED.value: GeomAddPackedEvent,
+        Events.GEOM_REMOVE.value: GeomRemoveEvent,
+        Events.GEOM_SET_COLOR.value: GeomSetColorEvent,
+        Events.INPUT_KEYUP.value: InputKeyupEvent,
+        Events.INPUT_KEYDOWN.value: InputKeydownEvent,
+        Events.INPUT_MOUSEUP.value: InputMouseupEvent,
+        Events.INPUT_MOUSEDOWN.value: InputMousedownEvent,
+        Events.INPUT_MOUSEMOTION.value: InputMousemotionEvent,
+        Events.WINDOW_TITLE.value: WindowTitleEvent,
+        Events.WINDOW_RESIZE.value: WindowResizeEvent,
+        Events.WINDOW_FLAGS.value: WindowFlagsEvent,
+        Events.TEXT_ADD.value: TextAddEvent,
+        Events.TEXT_SET_STRING.value: TextSetStringEvent,
+        Events.AUDIO_LOAD.value: AudioLoadEvent,
+        Events.AUDIO_LOADED.value: AudioLoadedEvent,
+        Events.AUDIO_PLAY.value: AudioPlayEvent,
+        Events.AUDIO_STOP_ALL.value: AudioStopAllEvent,
+        Events.AUDIO_SET_MASTER_VOLUME.value: AudioSetMasterVolumeEvent,
+        Events.AUDIO_PAUSE.value: AudioPauseEvent,
+        Events.AUDIO_STOP.value: AudioStopEvent,
+        Events.AUDIO_UNLOAD.value: AudioUnloadEvent,
+        Events.AUDIO_SET_VOLUME.value: AudioSetVolumeEvent,
+        Events.PHYSICS_ADD_BODY.value: PhysicsAddBodyEvent,
+        Events.PHYSICS_REMOVE_BODY.value: PhysicsRemoveBodyEvent,
+        Events.PHYSICS_APPLY_FORCE.value: PhysicsApplyForceEvent,
+        Events.PHYSICS_APPLY_IMPULSE.value: PhysicsApplyImpulseEvent,
+        Events.PHYSICS_SET_VELOCITY.value: PhysicsSetVelocityEvent,
+        Events.PHYSICS_SET_POSITION.value: PhysicsSetPositionEvent,
+        Events.PHYSICS_SET_ROTATION.value: PhysicsSetRotationEvent,
+        Events.PHYSICS_BIND_HANDLE.value: PhysicsBindHandleEvent,
+        Events.PHYSICS_RELEASE_HANDLE.value: PhysicsReleaseHandleEvent,
+        Events.PHYSICS_SET_VELOCITY_HANDLE.value: PhysicsSetVelocityHandleEvent,
+        Events.PHYSICS_SET_POSITION_HANDLE.value: PhysicsSetPositionHandleEvent,
+        Events.PHYSICS_SET_ROTATION_HANDLE.value: PhysicsSetRotationHandleEvent,
+        Events.PHYSICS_COLLISION_BEGIN.value: PhysicsCollisionBeginEvent,
+        Events.PHYSICS_COLLISION_SEPARATE.value: PhysicsCollisionSeparateEvent,
+        Events.PHYSICS_SYNC_TRANSFORM.value: PhysicsSyncTransformEvent,
+        Events.PHYSICS_SET_DEBUG_MODE.value: PhysicsSetDebugModeEvent,
+        Events.PLUGIN.value: PluginEvent,
+        Events.PLUGIN_LOAD.value: PluginLoadEvent,
+        Events.PLUGIN_UNLOAD.value: PluginUnloadEvent,
+        Events.PLUGIN_SET.value: PluginSetEvent,
+        Events.PLUGIN_EVENT_STACKING.value: PluginEventStackingEvent,
+        Events.PLUGIN_SUBSCRIBE_EVENT.value: PluginSubscribeEventEvent,
+        Events.PLUGIN_UNSUBSCRIBE_EVENT.value: PluginUnsubscribeEventEvent,
+        Events.CAMERA_SET_POSITION.value: CameraSetPositionEvent,
+        Events.CAMERA_MOVE.value: CameraMoveEvent,
+        Events.CAMERA_SET_ZOOM.value: CameraSetZoomEvent,
+        Events.CAMERA_SET_ROTATION.value: CameraSetRotationEvent,
+        Events.CAMERA_FOLLOW_ENTITY.value: CameraFollowEntityEvent,
+        Events.CAMERA_STOP_FOLLOWING.value: CameraStopFollowingEvent,
+        Events.SCRIPT_SUBSCRIBE.value: ScriptSubscribeEvent,
+        Events.SCRIPT_UNSUBSCRIBE.value: ScriptUnsubscribeEvent,
+    }
+)
+
 
-        return events
-        # --- End PackFormat Class ---
+# --- End PackFormat Class ---
@@ -147,6 +147,120 @@ class SpritePackFormats:
     # Size: 32 bytes
     PACK_SPRITE_SET_SOURCE_RECT: Tuple[str, int] = ("<qqffff", 32)
 
+    """
+    Maps to Swift: `PackedSpriteMoveF32Event`
+    - id1: i64 (Primary ID of the sprite.)
+    - id2: i64 (Secondary ID of the sprite.)
+    - positionX: f32 (New X position.)
+    - positionY: f32 (New Y position.)
+    - positionZ: f32 (New Z position (depth).)
+    - _padding: u32 (Padding for alignment.)
+    """
+    # Format: <qqfff4x
+    # Size: 32 bytes
+    PACK_SPRITE_MOVE_F32: Tuple[str, int] = ("<qqfff4x", 32)
+
+    """
+    Maps to Swift: `PackedSpriteScaleF32Event`
+    - id1: i64 (Primary ID of the sprite.)
+    - id2: i64 (Secondary ID of the sprite.)
+    - scaleX: f32 (New X scale.)
+    - scaleY: f32 (New Y scale.)
+    - scaleZ: f32 (New Z scale.)
+    - _padding: u32 (Padding for alignment.)
+    """
+    # Format: <qqfff4x
+    # Size: 32 bytes
+    PACK_SPRITE_SCALE_F32: Tuple[str, int] = ("<qqfff4x", 32)
+
+    """
+    Maps to Swift: `PackedSpriteRotateF32Event`
+    - id1: i64 (Primary ID of the sprite.)
+    - id2: i64 (Secondary ID of the sprite.)
+    - rotationX: f32 (New X rotation (in radians).)
+    - rotationY: f32 (New Y rotation (in radians).)
+    - rotationZ: f32 (New Z rotation (in radians).)
+    - _padding: u32 (Padding for alignment.)
+    """
+    # Format: <qqfff4x
+    # Size: 32 bytes
+    PACK_SPRITE_ROTATE_F32: Tuple[str, int] = ("<qqfff4x", 32)
+
+    """
+    Maps to Swift: `PackedSpriteSpeedF32Event`
+    - id1: i64 (Primary ID of the sprite.)
+    - id2: i64 (Secondary ID of the sprite.)
+    - speedX: f32 (New X speed.)
+    - speedY: f32 (New Y speed.)
+    """
+    # Format: <qqff
+    # Size: 24 bytes
+    PACK_SPRITE_SPEED_F32: Tuple[str, int] = ("<qqff", 24)
+
+    """
+    Maps to Swift: `PackedSpriteBindHandleEvent`
+    - id1: i64 (Primary ID of the sprite.)
+    - id2: i64 (Secondary ID of the sprite.)
+    - handle: u32 (Handle to bind (reuses a released handle's slot).)
+    - _padding: u32 (Padding for alignment.)
+    """
+    # Format: <qqI4x
+    # Size: 24 bytes
+    PACK_SPRITE_BIND_HANDLE: Tuple[str, int] = ("<qqI4x", 24)
+
+    """
+    Maps to Swift: `PackedSpriteReleaseHandleEvent`
+    - handle: u32 (Handle to release.)
+    - _padding: u32 (Padding for alignment.)
+    """
+    # Format: <I4x
+    # Size: 8 bytes
+    PACK_SPRITE_RELEASE_HANDLE: Tuple[str, int] = ("<I4x", 8)
+
+    """
+    Maps to Swift: `PackedSpriteMoveHandleEvent`
+    - handle: u32 (Entity handle bound by SPRITE_BIND_HANDLE.)
+    - positionX: f32 (New X position.)
+    - positionY: f32 (New Y position.)
+    - positionZ: f32 (New Z position (depth).)
+    """
+    # Format: <Ifff
+    # Size: 16 bytes
+    PACK_SPRITE_MOVE_HANDLE: Tuple[str, int] = ("<Ifff", 16)
+
+    """
+    Maps to Swift: `PackedSpriteScaleHandleEvent`
+    - handle: u32 (Entity handle bound by SPRITE_BIND_HANDLE.)
+    - scaleX: f32 (New X scale.)
+    - scaleY: f32 (New Y scale.)
+    - scaleZ: f32 (New Z scale.)
+    """
+    # Format: <Ifff
+    # Size: 16 bytes
+    PACK_SPRITE_SCALE_HANDLE: Tuple[str, int] = ("<Ifff", 16)
+
+    """
+    Maps to Swift: `PackedSpriteRotateHandleEvent`
+    - handle: u32 (Entity handle bound by SPRITE_BIND_HANDLE.)
+    - rotationX: f32 (New X rotation (in radians).)
+    - rotationY: f32 (New Y rotation (in radians).)
+    - rotationZ: f32 (New Z rotation (in radians).)
+    """
+    # Format: <Ifff
+    # Size: 16 bytes
+    PACK_SPRITE_ROTATE_HANDLE: Tuple[str, int] = ("<Ifff", 16)
+
+    """
+    Maps to Swift: `PackedSpriteSpeedHandleEvent`
+    - handle: u32 (Entity handle bound by SPRITE_BIND_HANDLE.)
+    - speedX: f32 (New X speed.)
+    - speedY: f32 (New Y speed.)
+    - _padding: u32 (Padding for alignment.)
+    """
+    # Format: <Iff4x
+    # Size: 16 bytes
+    PACK_SPRITE_SPEED_HANDLE: Tuple[str, int] = ("<Iff4x", 16)
+
     """
     Maps to Swift: `PackedGeomAddPointEvent`
     - id1: i64 (Primary identifier.)
@@ -558,6 +672,58 @@ class PhysicsPackFormats:
     # Size: 24 bytes
     PACK_PHYSICS_SET_ROTATION: Tuple[str, int] = ("<qqd", 24)
 
+    """
+    Maps to Swift: `PackedPhysicsBindHandleEvent`
+    - id1: i64 (Primary ID of the body.)
+    - id2: i64 (Secondary ID of the body.)
+    - handle: u32 (Handle to bind (reuses a released handle's slot).)
+    - _padding: u32 (Padding for alignment.)
+    """
+    # Format: <qqI4x
+    # Size: 24 bytes
+    PACK_PHYSICS_BIND_HANDLE: Tuple[str, int] = ("<qqI4x", 24)
+
+    """
+    Maps to Swift: `PackedPhysicsReleaseHandleEvent`
+    - handle: u32 (Handle to release.)
+    - _padding: u32 (Padding for alignment.)
+    """
+    # Format: <I4x
+    # Size: 8 bytes
+    PACK_PHYSICS_RELEASE_HANDLE: Tuple[str, int] = ("<I4x", 8)
+
+    """
+    Maps to Swift: `PackedPhysicsSetVelocityHandleEvent`
+    - handle: u32 (Entity handle bound by PHYSICS_BIND_HANDLE.)
+    - _padding: u32 (Padding for alignment.)
+    - velocityX: f64 (New X velocity.)
+    - velocityY: f64 (New Y velocity.)
+    """
+    # Format: <I4xdd
+    # Size: 24 bytes
+    PACK_PHYSICS_SET_VELOCITY_HANDLE: Tuple[str, int] = ("<I4xdd", 24)
+
+    """
+    Maps to Swift: `PackedPhysicsSetPositionHandleEvent`
+    - handle: u32 (Entity handle bound by PHYSICS_BIND_HANDLE.)
+    - _padding: u32 (Padding for alignment.)
+    - positionX: f64 (New X position.)
+    - positionY: f64 (New Y position.)
+    """
+    # Format: <I4xdd
+    # Size: 24 bytes
+    PACK_PHYSICS_SET_POSITION_HANDLE: Tuple[str, int] = ("<I4xdd", 24)
+
+    """
+    Maps to Swift: `PackedPhysicsSetRotationHandleEvent`
+    - handle: u32 (Entity handle bound by PHYSICS_BIND_HANDLE.)
+    - _padding: u32 (Padding for alignment.)
+    - angleInRadians: f64 (New angle in radians.)
+    """
+    # Format: <I4xd
+    # Size: 16 bytes
+    PACK_PHYSICS_SET_ROTATION_HANDLE: Tuple[str, int] = ("<I4xd", 16)
+
     """
     Maps to Swift: `PackedPhysicsCollisionEvent`
     - id1_A: i64 (Primary ID of the first body.)
@@ -734,7 +900,20 @@ class ScriptPackFormats:
     """
     # Format: <I4x
     # Size: 8 bytes
-    PACK_SCRIPT_UNSUBSCRIBE: Tuple[str, int] = (
-        "<I4x",
-        8,
-    )  # --- End Pack Format Classes ---
+    PACK_SCRIPT_UNSUBSCRIBE: Tuple[str, int] = ("<I4x", 8)
+
+
+class BatchPackFormats:
+    """
+    Maps to Swift: `PackedEventBatchHeaderEvent`
+    (Header struct)
+    - eventType: u32 (Event ID of every payload in the batch (a fixed-size event).)
+    - count: u32 (Number of payloads that follow this header.)
+    """
+
+    # Format: <II
+    # Size: 8 bytes
+    PACK_EVENT_BATCH: Tuple[str, int] = ("<II", 8)
+
+
+# --- End Pack Format Classes ---
@@ -0,0 +1,100 @@
+from typing import Dict, Optional, Set
+
+from ChannelPacker import ChannelPacker
+from CommandPacker import CommandPacker
+from HandleAllocator import HandleAllocator
+
+
+class PackerPool:
+    """
+    Per-frame packers that are reused across frames.
+
+    IPCClient.run calls begin_frame() before every update and passes the
+    pool to the update callback. The first time a packer is requested in a
+    frame it is reset() rather than recreated, so its buffer stays at the
+    size the busiest frame needed and steady-state frames never reallocate.
+    """
+
+    def __init__(
+        self, shrink_after: int = 0, coalesce: bool = False, batch: bool = False
+    ):
+        """
+        :param shrink_after: Passed to each CommandPacker; if > 0, buffers
+                             shrink back after this many quieter frames.
+        :param coalesce: Passed to each CommandPacker; merges repeated
+                         "set" events per entity within a frame.
+        :param batch: Passed to each CommandPacker; groups runs of
+                      same-type events into EVENT_BATCH containers.
+        """
+        self.shrink_after = shrink_after
+        self.coalesce = coalesce
+        self.batch = batch
+        # Passed to each ChannelPacker; set by set_capabilities()
+        self.f32 = False
+        self.sprite_handles: Optional[HandleAllocator] = None
+        self.body_handles: Optional[HandleAllocator] = None
+        self.command_packers: Dict[str, CommandPacker] = {}
+        self.channel_packers: Dict[str, ChannelPacker] = {}
+        # Packers that still hold last frame's data
+        self._stale: Set[str] = set()
+        self._stale_channels: Set[str] = set()
+
+    def set_capabilities(self, batch: bool, f32: bool, handles: bool) -> None:
+        """
+        Switches the wire features every packer from this pool uses, e.g.
+        to the ones agreed by a handshake. Pooled packers are dropped so
+        they are recreated with them. Handles come from a new allocator
+        each time, so entities bound on an earlier connection bind again.
+        """
+        self.batch = batch
+        self.f32 = f32
+        self.sprite_handles = HandleAllocator() if handles else None
+        self.body_handles = HandleAllocator() if handles else None
+        self.command_packers.clear()
+        self.channel_packers.clear()
+        self._stale.clear()
+        self._stale_channels.clear()
+
+    def begin_frame(self) -> None:
+        """Marks every pooled packer as due for a reset."""
+        self._stale = set(self.command_packers)
+        self._stale_channels = set(self.channel_packers)
+
+    def command_packer(
+        self, name: str = "default", chunk_size: int = 0
+    ) -> CommandPacker:
+        """Returns this frame's CommandPacker for `name`, reset and ready to use."""
+        packer = self.command_packers.get(name)
+        if packer is None:
+            packer = CommandPacker(
+                chunk_size,
+                shrink_after=self.shrink_after,
+                coalesce=self.coalesce,
+                batch=self.batch,
+            )
+            self.command_packers[name] = packer
+        elif name in self._stale:
+            packer.reset(chunk_size)
+        self._stale.discard(name)
+        return packer
+
+    def channel_packer(
+        self, name: str = "default", chunk_size: int = 0
+    ) -> ChannelPacker:
+        """Returns this frame's ChannelPacker for `name`, reset and ready to use."""
+        packer = self.channel_packers.get(name)
+        if packer is None:
+            packer = ChannelPacker(
+                chunk_size,
+                shrink_after=self.shrink_after,
+                coalesce=self.coalesce,
+                batch=self.batch,
+                f32=self.f32,
+                sprite_handles=self.sprite_handles,
+                body_handles=self.body_handles,
+            )
+            self.channel_packers[name] = packer
+        elif name in self._stale_channels:
+            packer.reset(chunk_size)
+        self._stale_channels.discard(name)
+        return packer
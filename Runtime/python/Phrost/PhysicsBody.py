@@ -1,14 +1,9 @@
 import enum
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
-# Imports from your existing adapter file
-# (Assuming it's saved as phrost_adapter.py)
-try:
-    from Phrost import CommandPacker, Events
-except ImportError:
-    print(
-        "Could not import CommandPacker/Events. Please ensure phrost_adapter.py is in the same directory."
-    )
+from ChannelPacker import ChannelPacker
+from Channels import Channels
+from HandleAllocator import HandleAllocator
 
 
 class PhysicsBody:
@@ -18,6 +13,9 @@ class PhysicsBody:
     This class tracks the *desired* state (e.g., "set velocity to X")
     and sends commands to the physics engine. It does not track the
     simulated state (which is handled by PHYSICS_SYNC_TRANSFORM events).
+    Position, velocity and rotation are all simulated, so the values here
+    are not what the engine has: every setter call with notify_engine is
+    sent, even with the value set before (e.g. a stop after gravity acted).
     """
 
     def __init__(self, id0: int, id1: int, is_new: bool = True):
@@ -32,6 +30,7 @@ class PhysicsBody:
         # --- Configuration (set at creation) ---
         self.body_type: int = 0  # 0=dynamic, 1=static, 2=kinematic
         self.shape_type: int = 0  # 0=box, 1=circle
+        self.lock_rotation: int = 0  # 1 = body never rotates
         self.mass: float = 1.0
         self.friction: float = 0.5
         self.elasticity: float = 0.5
@@ -40,6 +39,22 @@ class PhysicsBody:
 
         self.dirty_flags: Dict[str, bool] = {}
         self.is_new: bool = is_new
+        # Bound by bind_handle() when the packer has handles on; _handles
+        # is the packer's allocator it came from.
+        self.handle: Optional[int] = None
+        self._handles: Optional[HandleAllocator] = None
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # See Sprite.__getstate__: the allocator is not pickled
+        state = self.__dict__.copy()
+        state["handle"] = None
+        state["_handles"] = None
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        state.setdefault("handle", None)
+        state.setdefault("_handles", None)
+        self.__dict__.update(state)
 
     # --- Configuration Setters (for initialization) ---
 
@@ -50,6 +65,7 @@ class PhysicsBody:
         mass: float,
         friction: float,
         elasticity: float,
+        lock_rotation: int = 0,
     ) -> None:
         """Set the core physics properties."""
         self.body_type = body_type
@@ -57,6 +73,7 @@ class PhysicsBody:
         self.mass = mass
         self.friction = friction
         self.elasticity = elasticity
+        self.lock_rotation = lock_rotation
 
     def set_shape(self, width: float, height: float) -> None:
         """
@@ -70,45 +87,69 @@ class PhysicsBody:
     # --- State Setters (with Dirty Tracking) ---
 
     def set_position(self, x: float, y: float, notify_engine: bool = True) -> None:
-        if self.position["x"] != x or self.position["y"] != y:
-            self.position["x"] = x
-            self.position["y"] = y
-            if notify_engine:
-                self.dirty_flags["position"] = True
+        self.position["x"] = x
+        self.position["y"] = y
+        if notify_engine:
+            self.dirty_flags["position"] = True
 
     def set_velocity(self, x: float, y: float, notify_engine: bool = True) -> None:
-        if self.velocity["x"] != x or self.velocity["y"] != y:
-            self.velocity["x"] = x
-            self.velocity["y"] = y
-            if notify_engine:
-                self.dirty_flags["velocity"] = True
+        self.velocity["x"] = x
+        self.velocity["y"] = y
+        if notify_engine:
+            self.dirty_flags["velocity"] = True
 
     def set_rotation(self, angle_in_radians: float, notify_engine: bool = True) -> None:
-        if self.rotation != angle_in_radians:
-            self.rotation = angle_in_radians
-            if notify_engine:
-                self.dirty_flags["rotation"] = True
+        self.rotation = angle_in_radians
+        if notify_engine:
+            self.dirty_flags["rotation"] = True
 
     # --- Immediate Event Methods (No Dirty Flags) ---
 
     def apply_force(
-        self, packer: CommandPacker, force_x: float, force_y: float
+        self, packer: ChannelPacker, force_x: float, force_y: float
     ) -> None:
-        packer.add(
-            Events.PHYSICS_APPLY_FORCE,
-            [self.id0, self.id1, force_x, force_y],
+        packer.channel(Channels.PHYSICS).physics_apply_force(
+            self.id0, self.id1, force_x, force_y
         )
 
     def apply_impulse(
-        self, packer: CommandPacker, impulse_x: float, impulse_y: float
+        self, packer: ChannelPacker, impulse_x: float, impulse_y: float
     ) -> None:
-        packer.add(
-            Events.PHYSICS_APPLY_IMPULSE,
-            [self.id0, self.id1, impulse_x, impulse_y],
+        packer.channel(Channels.PHYSICS).physics_apply_impulse(
+            self.id0, self.id1, impulse_x, impulse_y
         )
 
-    def remove(self, packer: CommandPacker) -> None:
-        packer.add(Events.PHYSICS_REMOVE_BODY, [self.id0, self.id1])
+    def remove(self, packer: ChannelPacker) -> None:
+        packer.channel(Channels.PHYSICS).physics_remove_body(self.id0, self.id1)
+        self.release_handle()
+
+    def release_handle(self) -> None:
+        """
+        Returns the handle to the free list without telling the engine
+        (PHYSICS_REMOVE_BODY already drops it there).
+        """
+        if self.handle is not None:
+            if self._handles is not None:
+                self._handles.release(self.handle)
+            self.handle = None
+            self._handles = None
+
+    def bind_handle(self, packer: ChannelPacker) -> Optional[int]:
+        """
+        Returns the handle to address the body by, or None when the packer
+        has handles off (see ChannelPacker.body_handles), binding a new one
+        first if needed (see Sprite.bind_handle).
+        """
+        handles = packer.body_handles
+        if handles is None:
+            return None
+        if self.handle is None or self._handles is not handles:
+            self._handles = handles
+            self.handle = handles.allocate()
+            packer.channel(Channels.PHYSICS).physics_bind_handle(
+                self.id0, self.id1, self.handle
+            )
+        return self.handle
 
     def _get_initial_add_data(self) -> List[Any]:
         return [
@@ -118,7 +159,8 @@ class PhysicsBody:
             self.position["y"],
             self.body_type,
             self.shape_type,
-            # 6 bytes padding are handled by the CommandPacker's struct format
+            self.lock_rotation,
+            # 5 bytes padding are handled by the CommandPacker's struct format
             self.mass,
             self.friction,
             self.elasticity,
@@ -126,17 +168,19 @@ class PhysicsBody:
             self.height,
         ]
 
-    def pack_dirty_events(self, packer: CommandPacker) -> None:
+    def pack_dirty_events(self, packer: ChannelPacker) -> None:
+        physics = packer.channel(Channels.PHYSICS)
+
         if self.is_new:
             # Send the full ADD_BODY event
-            packer.add(Events.PHYSICS_ADD_BODY, self._get_initial_add_data())
+            physics.physics_add_body(*self._get_initial_add_data())
+            self.bind_handle(packer)
 
             # If velocity was set before creation, send it immediately after.
             # This is common for projectiles.
             if self.velocity["x"] != 0.0 or self.velocity["y"] != 0.0:
-                packer.add(
-                    Events.PHYSICS_SET_VELOCITY,
-                    [self.id0, self.id1, self.velocity["x"], self.velocity["y"]],
+                physics.physics_set_velocity(
+                    self.id0, self.id1, self.velocity["x"], self.velocity["y"]
                 )
 
             self.is_new = False
@@ -146,23 +190,26 @@ class PhysicsBody:
         if not self.dirty_flags:
             return
 
+        handle = self.bind_handle(packer)
+        if handle is not None:
+            target = (handle,)
+            set_position = physics.physics_set_position_handle
+            set_velocity = physics.physics_set_velocity_handle
+            set_rotation = physics.physics_set_rotation_handle
+        else:
+            target = (self.id0, self.id1)
+            set_position = physics.physics_set_position
+            set_velocity = physics.physics_set_velocity
+            set_rotation = physics.physics_set_rotation
+
         if "position" in self.dirty_flags:
-            packer.add(
-                Events.PHYSICS_SET_POSITION,
-                [self.id0, self.id1, self.position["x"], self.position["y"]],
-            )
+            set_position(*target, self.position["x"], self.position["y"])
 
         if "velocity" in self.dirty_flags:
-            packer.add(
-                Events.PHYSICS_SET_VELOCITY,
-                [self.id0, self.id1, self.velocity["x"], self.velocity["y"]],
-            )
+            set_velocity(*target, self.velocity["x"], self.velocity["y"])
 
         if "rotation" in self.dirty_flags:
-            packer.add(
-                Events.PHYSICS_SET_ROTATION,
-                [self.id0, self.id1, self.rotation],
-            )
+            set_rotation(*target, self.rotation)
 
         self.clear_dirty_flags()
 
@@ -0,0 +1,64 @@
+from typing import Dict, Optional, Tuple
+
+
+class SentState:
+    """
+    The values an entity last sent to the engine, one tuple per property
+    ("position", "color", ...).
+
+    Dirty flags only say that a setter ran; an entity can be recolored and
+    recolored back, or rescaled by a hair, before the next pack.
+    pack_dirty_events() asks changed() before packing each event, so an
+    event is only emitted when the packed value actually differs from what
+    the engine already has. A scene of static sprites costs nothing.
+
+    Only values that nothing but the client changes belong here. Properties
+    the engine simulates (a sprite's position and speed, everything on a
+    physics body) are never recorded, and a setter called with
+    notify_engine=False (a value the engine reported) forgets its key.
+
+    Float fields are compared with `epsilon` (0.0 means exact); ints and
+    strings are always compared exactly.
+    """
+
+    def __init__(self, epsilon: float = 0.0):
+        self.epsilon = epsilon
+        self.values: Dict[str, Tuple] = {}
+
+    def changed(self, key: str, values: Tuple) -> bool:
+        """
+        Returns True if `values` differ from what was last sent for `key`,
+        and records them as sent. Returns False (recording nothing) if the
+        engine already has them.
+        """
+        last = self.values.get(key)
+        if last is not None and len(last) == len(values):
+            epsilon = self.epsilon
+            for old, new in zip(last, values):
+                if old == new:
+                    continue
+                if (
+                    epsilon > 0.0
+                    and isinstance(new, float)
+                    and abs(new - old) <= epsilon
+                ):
+                    continue
+                break
+            else:
+                return False
+        self.values[key] = values
+        return True
+
+    def record(self, key: str, values: Tuple) -> None:
+        """Records values sent outside of changed() (e.g., by an ADD event)."""
+        self.values[key] = values
+
+    def forget(self, key: Optional[str] = None) -> None:
+        """
+        Forgets one property (or all of them), so it is sent again on the
+        next pack. Use after the engine has lost state, e.g. on a restart.
+        """
+        if key is None:
+            self.values.clear()
+        else:
+            self.values.pop(key, None)
@@ -0,0 +1,152 @@
+import mmap
+import os
+import re
+import secrets
+import stat
+import struct
+import tempfile
+from typing import Optional, Sequence, Tuple, Union
+
+# tmpfs on Linux; elsewhere a file in the temp dir, which the page cache
+# shares between the two processes just the same
+SHM_DIR = "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+
+# Region names are random hex, sent to the client in the engine's welcome.
+# A fixed name could be created (or symlinked) ahead of the engine by any
+# local user; a random one can't be guessed, and the files are only ever
+# created new (O_EXCL) and opened without following links.
+REGION_NAME_LENGTH = 32
+_REGION_NAME = re.compile(f"[0-9a-f]{{{REGION_NAME_LENGTH}}}")
+_NOFOLLOW = getattr(os, "O_NOFOLLOW", 0)
+
+# Bytes per slot. Each direction has two, used alternately.
+SHM_SLOT_SIZE = 32 * 1024 * 1024
+
+# Sent in place of a frame's length: the frame is in shared memory
+SHM_FRAME = 0xFFFFFFFF
+
+# Engine -> client: [u32 SHM_FRAME][f64 dt][u32 slot][u32 length]
+# The first 12 bytes are read as an ordinary frame head, then this:
+EVENTS_NOTICE_TAIL_STRUCT = struct.Struct("<II")
+EVENTS_NOTICE_STRUCT = struct.Struct("<LdII")
+# Client -> engine: [u32 SHM_FRAME][u32 slot][u32 length]
+COMMANDS_NOTICE_STRUCT = struct.Struct("<LII")
+
+
+def new_region_name() -> str:
+    """A fresh random name for the engine's pair of regions."""
+    return secrets.token_hex(REGION_NAME_LENGTH // 2)
+
+
+def region_paths(name: str) -> Tuple[str, str]:
+    """
+    The (events, commands) region files for a region name, e.g.
+    /dev/shm/phrost-<name>.events and /dev/shm/phrost-<name>.commands.
+    Raises ValueError for anything but a name from new_region_name().
+    """
+    if not _REGION_NAME.fullmatch(name):
+        raise ValueError(f"invalid shared memory region name {name!r}")
+    return (
+        os.path.join(SHM_DIR, f"phrost-{name}.events"),
+        os.path.join(SHM_DIR, f"phrost-{name}.commands"),
+    )
+
+
+class SharedRegion:
+    """
+    One direction of the shared-memory transport: a file mapped into both
+    processes and split into two slots that take turns. The writer fills
+    the next slot and sends its number and length over the socket; the
+    reader gets a memoryview of the slot, with no copy through the kernel.
+    While one slot is written, whatever the reader still holds of the
+    previous frame (in the other slot) stays intact.
+
+    The engine creates both regions before it sends its welcome; the
+    client maps them once CAP_SHM is agreed, by the name in the welcome.
+    """
+
+    def __init__(self, path: str, slot_size: int = SHM_SLOT_SIZE, create: bool = False):
+        """
+        :param path: The region file.
+        :param slot_size: Bytes per slot, when creating the file. When
+                          mapping an existing one it is taken from the
+                          file's size.
+        :param create: Create the file, which must not exist yet, rather
+                       than map an existing one.
+        :raises OSError: If the file exists when creating it, or when
+                         mapping it is a symlink, not a regular file or
+                         not owned by this user.
+        """
+        self.path = path
+        if create:
+            fd = os.open(path, os.O_RDWR | os.O_CREAT | os.O_EXCL | _NOFOLLOW, 0o600)
+        else:
+            fd = os.open(path, os.O_RDWR | _NOFOLLOW)
+        try:
+            if create:
+                os.ftruncate(fd, 2 * slot_size)
+            info = os.fstat(fd)
+            if not stat.S_ISREG(info.st_mode) or (
+                hasattr(os, "geteuid") and info.st_uid != os.geteuid()
+            ):
+                raise PermissionError(f"{path} is not a region of this user")
+            size = info.st_size
+            self._map = mmap.mmap(fd, size)
+        except OSError:
+            if create:
+                os.unlink(path)
+            raise
+        finally:
+            os.close(fd)
+        self.slot_size: int = size // 2
+        self._view = memoryview(self._map)
+        self._next_slot = 0
+
+    def slot(self, index: int) -> memoryview:
+        """A view of one slot."""
+        start = (index & 1) * self.slot_size
+        return self._view[start : start + self.slot_size]
+
+    def write(
+        self, buffers: Sequence[Union[bytes, bytearray, memoryview]]
+    ) -> Optional[Tuple[int, int]]:
+        """
+        Copies `buffers` back to back into the next slot. Returns (slot,
+        length) to send to the reader, or None if they don't fit (send the
+        frame inline instead).
+        """
+        total = sum(memoryview(buffer).nbytes for buffer in buffers)
+        if total > self.slot_size:
+            return None
+
+        index = self._next_slot
+        self._next_slot ^= 1
+        offset = index * self.slot_size
+        for buffer in buffers:
+            size = memoryview(buffer).nbytes
+            self._view[offset : offset + size] = memoryview(buffer).cast("B")
+            offset += size
+        return index, total
+
+    def read(self, index: int, length: int) -> Optional[memoryview]:
+        """A view of the frame in slot `index`, or None if `length` is too big."""
+        if length > self.slot_size:
+            return None
+        return self.slot(index)[:length]
+
+    def close(self, unlink: bool = False) -> None:
+        """
+        Unmaps the region, and deletes its file with unlink=True. If views of
+        it are still alive, the mapping is left for them and goes away with
+        the last one.
+        """
+        self._view.release()
+        try:
+            self._map.close()
+        except BufferError:
+            pass
+        if unlink:
+            try:
+                os.unlink(self.path)
+            except FileNotFoundError:
+                pass
@@ -2,10 +2,16 @@ from typing import Any, Dict, List, Optional
 
 from ChannelPacker import ChannelPacker
 from Channels import Channels
-from Events import Events
+from HandleAllocator import HandleAllocator
+from SentState import SentState
+from StringCache import encode_padded
 
 
 class Sprite:
+    # Float changes at or below this are not re-sent (0.0 = exact compare).
+    # Set it on the class, or on an instance; it is read at each pack.
+    SEND_EPSILON: float = 0.0
+
     def __init__(self, id0: int, id1: int, is_new: bool = True):
         self.id0: int = id0
         self.id1: int = id1
@@ -27,6 +33,27 @@ class Sprite:
         self.dirty_flags: Dict[str, bool] = {}
         # Flag to track if this sprite was just created.
         self.is_new: bool = is_new
+        # What the engine was last sent, so unchanged values are skipped.
+        # Position and speed are left out: the engine moves sprites by their
+        # speed and bounces them, so what it was sent goes stale.
+        self.sent_state: SentState = SentState()
+        # Bound by bind_handle() when the packer has handles on; _handles
+        # is the packer's allocator it came from.
+        self.handle: Optional[int] = None
+        self._handles: Optional[HandleAllocator] = None
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # The handle belongs to the connection's allocator, which is not
+        # pickled, so a restored sprite binds a fresh one when it is used.
+        state = self.__dict__.copy()
+        state["handle"] = None
+        state["_handles"] = None
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        state.setdefault("handle", None)
+        state.setdefault("_handles", None)
+        self.__dict__.update(state)
 
     def update(self, dt: float) -> None:
         if self.speed["x"] == 0.0 and self.speed["y"] == 0.0:
@@ -57,6 +84,8 @@ class Sprite:
             self.size["height"] = height
             if notify_engine:
                 self.dirty_flags["size"] = True
+            else:
+                self.sent_state.forget("size")
 
     def set_color(
         self, r: int, g: int, b: int, a: int, notify_engine: bool = True
@@ -73,12 +102,16 @@ class Sprite:
             self.color["a"] = a
             if notify_engine:
                 self.dirty_flags["color"] = True
+            else:
+                self.sent_state.forget("color")
 
     def set_texture_path(self, path: str, notify_engine: bool = True) -> None:
         if self.texture_path != path:
             self.texture_path = path
             if notify_engine:
                 self.dirty_flags["texture"] = True
+            else:
+                self.sent_state.forget("texture")
 
     def set_rotate(
         self, x: float, y: float, z: float, notify_engine: bool = True
@@ -89,6 +122,8 @@ class Sprite:
             self.rotate["z"] = z
             if notify_engine:
                 self.dirty_flags["rotate"] = True
+            else:
+                self.sent_state.forget("rotate")
 
     def set_speed(self, x: float, y: float, notify_engine: bool = True) -> None:
         if self.speed["x"] != x or self.speed["y"] != y:
@@ -106,6 +141,8 @@ class Sprite:
             self.scale["z"] = z
             if notify_engine:
                 self.dirty_flags["scale"] = True
+            else:
+                self.sent_state.forget("scale")
 
     def set_flip(self, is_flipped: bool, notify_engine: bool = True) -> None:
         """
@@ -135,6 +172,8 @@ class Sprite:
             self.source_rect = new_rect
             if notify_engine:
                 self.dirty_flags["source_rect"] = True
+            else:
+                self.sent_state.forget("source_rect")
 
     def set_texture_id(self, texture_id: int) -> None:
         self.texture_id = texture_id
@@ -189,49 +228,58 @@ class Sprite:
             self.speed["y"],
         ]
 
-    # --- THIS METHOD IS NOW CORRECTED ---
     def pack_dirty_events(self, packer: ChannelPacker, clear=True) -> None:
         """
         Checks all dirty flags and adds the corresponding events
-        to the ChannelPacker.
+        to the RENDERER channel of the ChannelPacker.
         """
-        # --- All 'packer.add' calls now include the Channel ID ---
-        RENDER_CHANNEL = Channels.RENDERER.value
+        renderer = packer.channel(Channels.RENDERER)
 
         if self.is_new:
             # Send the full SPRITE_ADD event
-            packer.add(RENDER_CHANNEL, Events.SPRITE_ADD, self.get_initial_add_data())
+            renderer.sprite_add(
+                self.id0,
+                self.id1,
+                self.position["x"],
+                self.position["y"],
+                self.position["z"],
+                self.scale["x"],
+                self.scale["y"],
+                self.scale["z"],
+                self.size["width"],
+                self.size["height"],
+                self.rotate["x"],
+                self.rotate["y"],
+                self.rotate["z"],
+                self.color["r"],
+                self.color["g"],
+                self.color["b"],
+                self.color["a"],
+                self.speed["x"],
+                self.speed["y"],
+            )
 
             # Also send the texture load event if a texture was set
             if self.texture_path is not None:
-                filename_bytes = self.texture_path.encode("utf-8")
-                filename_length = len(filename_bytes)
-                packer.add(
-                    RENDER_CHANNEL,
-                    Events.SPRITE_TEXTURE_LOAD,
-                    [
-                        self.id0,
-                        self.id1,
-                        filename_length,
-                        filename_bytes,  # Pass bytes
-                    ],
+                filename, length = encode_padded(self.texture_path)
+                renderer.sprite_texture_load(
+                    self.id0, self.id1, filename, filenameLength=length
                 )
 
             # Also send source rect if it was set during initialization
             if self.source_rect is not None:
-                packer.add(
-                    RENDER_CHANNEL,
-                    Events.SPRITE_SET_SOURCE_RECT,
-                    [
-                        self.id0,
-                        self.id1,
-                        self.source_rect["x"],
-                        self.source_rect["y"],
-                        self.source_rect["w"],
-                        self.source_rect["h"],
-                    ],
+                renderer.sprite_set_source_rect(
+                    self.id0,
+                    self.id1,
+                    self.source_rect["x"],
+                    self.source_rect["y"],
+                    self.source_rect["w"],
+                    self.source_rect["h"],
                 )
 
+            self._record_sent_state()
+            self.bind_handle(packer)
+
             # Mark as no longer new and clear all other flags
             self.is_new = False
             self.clear_dirty_flags()
@@ -241,111 +289,89 @@ class Sprite:
         if not self.dirty_flags:
             return  # Nothing to do
 
+        sent = self.sent_state
+        sent.epsilon = self.SEND_EPSILON
+        handle = self.bind_handle(packer)
+        if handle is not None:
+            target = (handle,)
+            move, scale = renderer.sprite_move_handle, renderer.sprite_scale_handle
+            rotate, speed = renderer.sprite_rotate_handle, renderer.sprite_speed_handle
+        elif packer.f32:
+            target = (self.id0, self.id1)
+            move, scale = renderer.sprite_move_f32, renderer.sprite_scale_f32
+            rotate, speed = renderer.sprite_rotate_f32, renderer.sprite_speed_f32
+        else:
+            target = (self.id0, self.id1)
+            move, scale = renderer.sprite_move, renderer.sprite_scale
+            rotate, speed = renderer.sprite_rotate, renderer.sprite_speed
+
         if "position" in self.dirty_flags:
-            packer.add(
-                RENDER_CHANNEL,
-                Events.SPRITE_MOVE,
-                [
-                    self.id0,
-                    self.id1,
-                    self.position["x"],
-                    self.position["y"],
-                    self.position["z"],
-                ],
+            move(
+                *target,
+                self.position["x"],
+                self.position["y"],
+                self.position["z"],
             )
 
-        if "scale" in self.dirty_flags:
-            packer.add(
-                RENDER_CHANNEL,
-                Events.SPRITE_SCALE,
-                [
-                    self.id0,
-                    self.id1,
-                    self.scale["x"],
-                    self.scale["y"],
-                    self.scale["z"],
-                ],
+        if "scale" in self.dirty_flags and sent.changed(
+            "scale", (self.scale["x"], self.scale["y"], self.scale["z"])
+        ):
+            scale(
+                *target,
+                self.scale["x"],
+                self.scale["y"],
+                self.scale["z"],
             )
 
-        if "size" in self.dirty_flags:
-            packer.add(
-                RENDER_CHANNEL,
-                Events.SPRITE_RESIZE,
-                [
-                    self.id0,
-                    self.id1,
-                    self.size["width"],
-                    self.size["height"],
-                ],
+        if "size" in self.dirty_flags and sent.changed(
+            "size", (self.size["width"], self.size["height"])
+        ):
+            renderer.sprite_resize(
+                self.id0, self.id1, self.size["width"], self.size["height"]
             )
 
-        if "rotate" in self.dirty_flags:
-            packer.add(
-                RENDER_CHANNEL,
-                Events.SPRITE_ROTATE,
-                [
-                    self.id0,
-                    self.id1,
-                    self.rotate["x"],
-                    self.rotate["y"],
-                    self.rotate["z"],
-                ],
+        if "rotate" in self.dirty_flags and sent.changed(
+            "rotate", (self.rotate["x"], self.rotate["y"], self.rotate["z"])
+        ):
+            rotate(
+                *target,
+                self.rotate["x"],
+                self.rotate["y"],
+                self.rotate["z"],
             )
 
-        if "color" in self.dirty_flags:
-            packer.add(
-                RENDER_CHANNEL,
-                Events.SPRITE_COLOR,
-                [
-                    self.id0,
-                    self.id1,
-                    self.color["r"],
-                    self.color["g"],
-                    self.color["b"],
-                    self.color["a"],
-                ],
+        if "color" in self.dirty_flags and sent.changed("color", self._color_values()):
+            renderer.sprite_color(
+                self.id0,
+                self.id1,
+                self.color["r"],
+                self.color["g"],
+                self.color["b"],
+                self.color["a"],
             )
 
         if "speed" in self.dirty_flags:
-            packer.add(
-                RENDER_CHANNEL,
-                Events.SPRITE_SPEED,
-                [
-                    self.id0,
-                    self.id1,
-                    self.speed["x"],
-                    self.speed["y"],
-                ],
-            )
+            speed(*target, self.speed["x"], self.speed["y"])
 
-        if "texture" in self.dirty_flags:
-            filename = self.texture_path or ""
-            filename_bytes = filename.encode("utf-8")
-            filename_length = len(filename_bytes)
-            packer.add(
-                RENDER_CHANNEL,
-                Events.SPRITE_TEXTURE_LOAD,
-                [
-                    self.id0,
-                    self.id1,
-                    filename_length,
-                    filename_bytes,  # Pass bytes
-                ],
+        if "texture" in self.dirty_flags and sent.changed(
+            "texture", (self.texture_path,)
+        ):
+            filename, length = encode_padded(self.texture_path or "")
+            renderer.sprite_texture_load(
+                self.id0, self.id1, filename, filenameLength=length
             )
 
         if "source_rect" in self.dirty_flags:
-            if self.source_rect is not None:
-                packer.add(
-                    RENDER_CHANNEL,
-                    Events.SPRITE_SET_SOURCE_RECT,
-                    [
-                        self.id0,
-                        self.id1,
-                        self.source_rect["x"],
-                        self.source_rect["y"],
-                        self.source_rect["w"],
-                        self.source_rect["h"],
-                    ],
+            if self.source_rect is not None and sent.changed(
+                "source_rect", tuple(self.source_rect.values())
+            ):
+                renderer.sprite_set_source_rect(
+                    self.id0,
+                    self.id1,
+                    self.source_rect["x"],
+                    self.source_rect["y"],
+                    self.source_rect["w"],
+                    self.source_rect["h"],
                 )
 
         if clear:
@@ -353,3 +379,63 @@ class Sprite:
 
     def clear_dirty_flags(self) -> None:
         self.dirty_flags = {}
+
+    def remove(self, packer: ChannelPacker) -> None:
+        """Removes the sprite; the engine drops its handle along with it."""
+        packer.channel(Channels.RENDERER).sprite_remove(self.id0, self.id1)
+        self.release_handle()
+
+    def bind_handle(self, packer: ChannelPacker) -> Optional[int]:
+        """
+        Returns the handle to address the sprite by, or None when the
+        packer has handles off (see ChannelPacker.sprite_handles). Handle
+        events always carry f32 values. A sprite without a handle from
+        the packer's allocator (a new one, one restored by Phrost_Wake, or
+        one bound on an earlier connection) is bound to a new handle
+        first; the engine moves a re-bound handle off its previous owner.
+        """
+        handles = packer.sprite_handles
+        if handles is None:
+            return None
+        if self.handle is None or self._handles is not handles:
+            self._handles = handles
+            self.handle = handles.allocate()
+            packer.channel(Channels.RENDERER).sprite_bind_handle(
+                self.id0, self.id1, self.handle
+            )
+        return self.handle
+
+    def release_handle(self) -> None:
+        """
+        Returns the handle to the free list without telling the engine.
+        Use after the sprite was removed by other means (e.g. a raw
+        SPRITE_REMOVE); a live sprite should go through remove().
+        """
+        if self.handle is not None:
+            if self._handles is not None:
+                self._handles.release(self.handle)
+            self.handle = None
+            self._handles = None
+
+    def take_position_change(self) -> bool:
+        """
+        Pops the "position" dirty flag and returns True if it was set.
+        For callers that pack SPRITE_MOVE themselves, e.g. with add_many().
+        """
+        return self.dirty_flags.pop("position", False)
+
+    def _color_values(self) -> tuple:
+        return (self.color["r"], self.color["g"], self.color["b"], self.color["a"])
+
+    def _record_sent_state(self) -> None:
+        """Records everything the ADD event carried as sent."""
+        sent = self.sent_state
+        sent.forget()
+        sent.record("scale", (self.scale["x"], self.scale["y"], self.scale["z"]))
+        sent.record("size", (self.size["width"], self.size["height"]))
+        sent.record("rotate", (self.rotate["x"], self.rotate["y"], self.rotate["z"]))
+        sent.record("color", self._color_values())
+        if self.texture_path is not None:
+            sent.record("texture", (self.texture_path,))
+        if self.source_rect is not None:
+            sent.record("source_rect", tuple(self.source_rect.values()))
@@ -0,0 +1,280 @@
+import os
+import socket
+import struct
+import sys
+from typing import Optional
+
+from Compression import COMPRESSED_FLAG, FrameCompressor, decompress_frame
+from Events import SCHEMA_HASH
+from Handshake import (
+    CAP_ALL,
+    CAP_COMPRESS,
+    CAP_SHM,
+    HANDSHAKE_MAGIC,
+    HANDSHAKE_VERSION,
+    HELLO_STRUCT,
+    WELCOME_SHM_STRUCT,
+    WELCOME_STRUCT,
+)
+from SharedMemory import (
+    COMMANDS_NOTICE_STRUCT,
+    EVENTS_NOTICE_STRUCT,
+    SHM_FRAME,
+    SHM_SLOT_SIZE,
+    SharedRegion,
+    new_region_name,
+    region_paths,
+)
+from ipc_client import MAX_FRAME_SIZE
+
+# [u32 length][f64 dt] in front of every event frame
+FRAME_HEAD_STRUCT = struct.Struct("<Ld")
+
+# An event frame with no events: [u32 count = 0][4 pad]
+EMPTY_EVENTS = struct.pack("<I4x", 0)
+
+
+class StandInEngine:
+    """
+    A pure-Python stand-in for PhrostIPC's side of the UNIX socket (or of
+    TCP, as with `--mode sockets`), for testing and benchmarking clients
+    without the Swift engine.
+
+    It speaks the same frame protocol: each serve_frame() sends one event
+    frame and returns the client's commands. A hello in reply to the first
+    frame is answered with a welcome, as the engine does, and may agree
+    features the engine itself doesn't support yet:
+
+    - CAP_SHM (UNIX socket only): a pair of regions under a new random
+      name is created before the welcome, which carries the name. Frames
+      in both directions then go through them, the socket carrying only
+      the notices.
+    - CAP_COMPRESS (TCP only): compressed commands are decompressed, and
+      event frames are compressed by `compressor` when it pays off.
+
+        engine = StandInEngine("/tmp/Test.socket")
+        engine.accept()  # while an IPCClient(path=...) connects
+        commands = engine.serve_frame(events_blob)
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        capabilities: int = CAP_ALL | CAP_SHM | CAP_COMPRESS,
+        slot_size: int = SHM_SLOT_SIZE,
+        host: Optional[str] = None,
+        port: int = 0,
+        compressor: Optional[FrameCompressor] = None,
+        handshake: bool = True,
+    ):
+        """
+        :param path: The UNIX socket to listen on.
+        :param capabilities: The wire features to agree to when offered.
+        :param slot_size: Bytes per shared-memory slot.
+        :param host: Listen on TCP host:port instead of `path`; port 0
+                     picks a free one, found in self.port.
+        :param compressor: Compresses event frames once CAP_COMPRESS is
+                           agreed; a default FrameCompressor if not given.
+        :param handshake: False acts like an engine that predates the
+                          handshake: a hello is returned as an ordinary
+                          (empty) command frame.
+        """
+        self.path: Optional[str] = path
+        self.host: Optional[str] = host
+        # Shared memory needs the UNIX socket's path, compression a TCP link
+        self.supported: int = capabilities & ~(CAP_SHM if host else CAP_COMPRESS)
+        self.slot_size: int = slot_size
+        self.handshake: bool = handshake
+        self.compressor: FrameCompressor = compressor or FrameCompressor()
+        # Features agreed with the current client
+        self.capabilities: int = 0
+        self.client: Optional[socket.socket] = None
+        self._events_region: Optional[SharedRegion] = None
+        self._commands_region: Optional[SharedRegion] = None
+
+        if host is not None:
+            self.server = socket.create_server((host, port))
+            self.port: int = self.server.getsockname()[1]
+        else:
+            if os.path.exists(path):
+                os.unlink(path)
+            self.server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self.server.bind(path)
+            self.server.listen(1)
+
+    def accept(self):
+        """Waits for a client to connect."""
+        self.client, _ = self.server.accept()
+        if self.host is not None:
+            # As PhrostIPC does on its side of a TCP link
+            self.client.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.capabilities = 0
+        self._remove_regions()
+
+    def close(self):
+        """Closes the sockets and removes the socket and region files."""
+        self._remove_regions()
+        if self.client is not None:
+            self.client.close()
+            self.client = None
+        self.server.close()
+        if self.path is not None and os.path.exists(self.path):
+            os.unlink(self.path)
+
+    def serve_frame(
+        self, events_blob=EMPTY_EVENTS, dt: float = 1 / 60
+    ) -> Optional[memoryview]:
+        """
+        Sends one event frame and returns the client's command frame, or
+        None if it disconnected. The commands may view a shared region, so
+        they are only valid until the next serve_frame().
+        """
+        if not self._send_events(events_blob, dt):
+            return None
+        commands = self._read_commands()
+        if commands is not None and self.handshake and self._answer_hello(commands):
+            commands = self._read_commands()
+        return commands
+
+    def _send_events(self, events_blob, dt: float) -> bool:
+        try:
+            if self._events_region is not None:
+                placed = self._events_region.write([events_blob])
+                if placed is not None:
+                    self.client.sendall(
+                        EVENTS_NOTICE_STRUCT.pack(SHM_FRAME, dt, *placed)
+                    )
+                    return True
+            buffers = [events_blob]
+            flag = 0
+            if self.capabilities & CAP_COMPRESS:
+                compressed = self.compressor.compress(buffers)
+                if compressed is not None:
+                    buffers = compressed
+                    flag = COMPRESSED_FLAG
+            length = 8 + sum(memoryview(buffer).nbytes for buffer in buffers)
+            head = FRAME_HEAD_STRUCT.pack(length | flag, dt)
+            self.client.sendall(head)
+            for buffer in buffers:
+                self.client.sendall(buffer)
+            return True
+        except ConnectionError:
+            # The client hung up (EPIPE/ECONNRESET): a normal disconnect
+            return False
+        except OSError as e:
+            print(f"send failed: {e}", file=sys.stderr)
+            return False
+
+    def _read_commands(self) -> Optional[memoryview]:
+        length = self._read_exactly(4)
+        if length is None:
+            return None
+        length = struct.unpack("<L", length)[0]
+        if length == SHM_FRAME and self._commands_region is not None:
+            notice = self._read_exactly(COMMANDS_NOTICE_STRUCT.size - 4)
+            if notice is None:
+                return None
+            slot, length = struct.unpack("<II", notice)
+            return self._commands_region.read(slot, length)
+
+        compressed = bool(length & COMPRESSED_FLAG) and bool(
+            self.capabilities & CAP_COMPRESS
+        )
+        if compressed:
+            length &= ~COMPRESSED_FLAG
+        if length > MAX_FRAME_SIZE:
+            print(f"Command frame length 0x{length:08x} refused.", file=sys.stderr)
+            return None
+        commands = self._read_exactly(length)
+        if commands is not None and compressed:
+            commands = decompress_frame(commands, MAX_FRAME_SIZE)
+        return memoryview(commands) if commands is not None else None
+
+    def _remove_regions(self):
+        """Unmaps and deletes the previous client's regions, if any."""
+        for region in (self._events_region, self._commands_region):
+            if region is not None:
+                region.close(unlink=True)
+        self._events_region = None
+        self._commands_region = None
+
+    def _answer_hello(self, commands: memoryview) -> bool:
+        """Sends the welcome if `commands` is a hello, like PhrostIPC."""
+        if commands.nbytes < HELLO_STRUCT.size:
+            return False
+        channels, magic, version, offered, schema_hash = HELLO_STRUCT.unpack_from(
+            commands
+        )
+        if channels != 0 or magic != HANDSHAKE_MAGIC:
+            return False
+
+        agreed = 0
+        if version == HANDSHAKE_VERSION and schema_hash == SCHEMA_HASH:
+            agreed = offered & self.supported
+        welcome = WELCOME_STRUCT.pack(
+            HANDSHAKE_MAGIC, HANDSHAKE_VERSION, agreed, SCHEMA_HASH
+        )
+        self._remove_regions()
+        if agreed & CAP_SHM:
+            name = new_region_name()
+            events_path, commands_path = region_paths(name)
+            self._events_region = SharedRegion(events_path, self.slot_size, create=True)
+            self._commands_region = SharedRegion(
+                commands_path, self.slot_size, create=True
+            )
+            welcome += WELCOME_SHM_STRUCT.pack(name.encode("ascii"))
+        self.capabilities = agreed
+
+        self.client.sendall(struct.pack("<L", len(welcome)) + welcome)
+        return True
+
+    def _read_exactly(self, length: int) -> Optional[bytearray]:
+        buffer = bytearray(length)
+        view = memoryview(buffer)
+        filled = 0
+        try:
+            while filled < length:
+                received = self.client.recv_into(view[filled:])
+                if not received:
+                    return None
+                filled += received
+        except ConnectionError:
+            return None
+        except OSError as e:
+            print(f"recv failed: {e}", file=sys.stderr)
+            return None
+        return buffer
+
+
+def main():
+    """
+    Serves empty event frames at the engine's socket path until the
+    client leaves, e.g. to run a game's logic without the engine:
+
+        python Phrost/StandInEngine.py [socket_path]
+    """
+    path = sys.argv[1] if len(sys.argv) > 1 else "/tmp/PhrostEngine.socket"
+    engine = StandInEngine(path)
+    print(f"Stand-in engine listening on {path}...")
+    try:
+        engine.accept()
+        frames = 0
+        command_bytes = 0
+        while True:
+            commands = engine.serve_frame()
+            if commands is None:
+                break
+            frames += 1
+            command_bytes += commands.nbytes
+            if frames % 60 == 0:
+                print(
+                    f"{frames} frames, {command_bytes} command bytes"
+                    f" (capabilities 0x{engine.capabilities:x})"
+                )
+        print("Client disconnected.")
+    finally:
+        engine.close()
+
+
+if __name__ == "__main__":
+    main()
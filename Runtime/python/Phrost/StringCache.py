@@ -0,0 +1,36 @@
+import functools
+from typing import Tuple
+
+# Number of distinct strings kept encoded; the least recently used
+# strings are dropped first.
+MAX_STRINGS = 1024
+
+
+@functools.lru_cache(maxsize=MAX_STRINGS)
+def encode_padded(value: str) -> Tuple[bytes, int]:
+    """
+    Encodes a string the way the engine expects a string tail: UTF-8,
+    zero-padded to the next 8-byte boundary.
+
+    Results are interned, so a string shared by many events (a texture
+    path used by a thousand sprites, an unchanged text label) is only
+    encoded once. Pass both values to the typed pack methods:
+
+        filename, length = encode_padded(path)
+        renderer.sprite_texture_load(id1, id2, filename, filenameLength=length)
+
+    Returns:
+        (padded bytes, length of the encoded string without padding)
+    """
+    data = value.encode("utf-8")
+    return data.ljust((len(data) + 7) & ~7, b"\0"), len(data)
+
+
+def cache_info():
+    """Hit/miss statistics for the intern table (functools.lru_cache)."""
+    return encode_padded.cache_info()
+
+
+def cache_clear() -> None:
+    """Drops every interned string."""
+    encode_padded.cache_clear()
@@ -1,27 +1,12 @@
-import enum
 import sys
 from typing import Any, List
 
 # Import from other converted files
 from Sprite import Sprite
 
-# Imports from your existing adapter file
-# (Assuming it's saved as phrost_adapter.py)
-try:
-    from Phrost import CommandPacker, Events
-except ImportError:
-    print(
-        "Could not import CommandPacker/Events. Please ensure phrost_adapter.py is in the same directory."
-    )
-
-    # Define dummy classes for the script to be syntactically valid
-    class CommandPacker:
-        def add(self, event_type, data):
-            pass
-
-    class Events(enum.IntEnum):
-        TEXT_ADD = 300
-        TEXT_SET_STRING = 301
+from ChannelPacker import ChannelPacker
+from Channels import Channels
+from StringCache import encode_padded
 
 
 class Text(Sprite):
@@ -50,6 +35,8 @@ class Text(Sprite):
             self.text_string = text
             if notify_engine:
                 self.dirty_flags["text"] = True
+            else:
+                self.sent_state.forget("text")
 
     def set_font(self, font_path: str, font_size: float) -> None:
         """
@@ -70,8 +57,8 @@ class Text(Sprite):
         position = self.get_position()
         color = self.get_color()
 
-        font_path_bytes = self.font_path.encode("utf-8")
-        text_bytes = self.text_string.encode("utf-8")
+        font_path_bytes, font_path_length = encode_padded(self.font_path)
+        text_bytes, text_length = encode_padded(self.text_string)
 
         return [
             self.id0,
@@ -84,13 +71,13 @@ class Text(Sprite):
             color["b"],
             color["a"],
             self.font_size,
-            len(font_path_bytes),  # fontPathLength
-            len(text_bytes),  # textLength
+            font_path_length,  # fontPathLength
+            text_length,  # textLength
             font_path_bytes,  # fontPath bytes
             text_bytes,  # text bytes
         ]
 
-    def pack_dirty_events(self, packer: CommandPacker) -> None:
+    def pack_dirty_events(self, packer: ChannelPacker) -> None:
         """
         Overrides the parent pack_dirty_events.
 
@@ -98,6 +85,8 @@ class Text(Sprite):
         If existing, it calls the parent's packer (to handle move, color, etc.)
         and then packs its own text-specific updates.
         """
+        renderer = packer.channel(Channels.RENDERER)
+
         if self.is_new_text:
             if not self.font_path:
                 print(
@@ -107,7 +96,31 @@ class Text(Sprite):
                 return
 
             # Send the full TEXT_ADD event
-            packer.add(Events.TEXT_ADD, self.get_initial_add_data())
+            position = self.get_position()
+            color = self.get_color()
+            font_path, font_path_length = encode_padded(self.font_path)
+            text, text_length = encode_padded(self.text_string)
+            renderer.text_add(
+                self.id0,
+                self.id1,
+                position["x"],
+                position["y"],
+                position["z"],
+                color["r"],
+                color["g"],
+                color["b"],
+                color["a"],
+                self.font_size,
+                font_path,
+                text,
+                fontPathLength=font_path_length,
+                textLength=text_length,
+            )
+
+            sent = self.sent_state
+            sent.forget()
+            sent.record("color", self._color_values())
+            sent.record("text", (self.text_string,))
 
             # Mark as no longer new and clear all other flags
             self.is_new_text = False
@@ -120,19 +133,11 @@ class Text(Sprite):
         super().pack_dirty_events(packer, clear=False)
 
         # Pack text-specific events
-        if "text" in self.dirty_flags:
-            text_bytes = self.text_string.encode("utf-8")
-            text_length = len(text_bytes)
-
-            packer.add(
-                Events.TEXT_SET_STRING,
-                [
-                    self.id0,
-                    self.id1,
-                    text_length,
-                    text_bytes,  # Pass bytes
-                ],
-            )
+        if "text" in self.dirty_flags and self.sent_state.changed(
+            "text", (self.text_string,)
+        ):
+            text, length = encode_padded(self.text_string)
+            renderer.text_set_string(self.id0, self.id1, text, textLength=length)
 
         # Clear all flags *again* to catch any child-specific flags.
         # This is safe even if parent already cleared some.
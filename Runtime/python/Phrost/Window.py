@@ -4,14 +4,8 @@ from typing import Any, Dict
 # Import from other converted files
 from WindowFlags import WindowFlags
 
-# Imports from your existing adapter file
-# (Assuming it's saved as phrost_adapter.py)
-try:
-    from Phrost import CommandPacker, Events
-except ImportError:
-    print(
-        "Could not import CommandPacker/Events. Please ensure phrost_adapter.py is in the same directory."
-    )
+from ChannelPacker import ChannelPacker
+from Channels import Channels
 
 
 class Window:
@@ -185,27 +179,15 @@ class Window:
 
     # --- Event Generation ---
 
-    def pack_dirty_events(self, packer: CommandPacker) -> None:
+    def pack_dirty_events(self, packer: ChannelPacker) -> None:
         # The packer's <256s format for WINDOW_TITLE requires bytes
+        renderer = packer.channel(Channels.RENDERER)
 
         if self.is_new:
             # Send all initial state
-            title_bytes = self.title.encode("utf-8")
-            packer.add(Events.WINDOW_TITLE, [title_bytes])
-
-            packer.add(
-                Events.WINDOW_RESIZE,
-                [
-                    self.size["width"],
-                    self.size["height"],
-                ],
-            )
-            packer.add(
-                Events.WINDOW_FLAGS,
-                [
-                    self._calculate_flags_bitmask(),
-                ],
-            )
+            renderer.window_title(self.title.encode("utf-8"))
+            renderer.window_resize(self.size["width"], self.size["height"])
+            renderer.window_flags(self._calculate_flags_bitmask())
 
             self.is_new = False
             self.clear_dirty_flags()
@@ -215,25 +197,13 @@ class Window:
             return  # Nothing to do
 
         if "title" in self.dirty_flags:
-            title_bytes = self.title.encode("utf-8")
-            packer.add(Events.WINDOW_TITLE, [title_bytes])
+            renderer.window_title(self.title.encode("utf-8"))
 
         if "resize" in self.dirty_flags:
-            packer.add(
-                Events.WINDOW_RESIZE,
-                [
-                    self.size["width"],
-                    self.size["height"],
-                ],
-            )
+            renderer.window_resize(self.size["width"], self.size["height"])
 
         if "flags" in self.dirty_flags:
-            packer.add(
-                Events.WINDOW_FLAGS,
-                [
-                    self._calculate_flags_bitmask(),
-                ],
-            )
+            renderer.window_flags(self._calculate_flags_bitmask())
 
         self.clear_dirty_flags()
 
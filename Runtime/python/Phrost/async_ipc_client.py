@@ -0,0 +1,353 @@
+import asyncio
+import inspect
+import os
+import socket
+import struct
+import sys
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Union
+
+from Compression import COMPRESSED_FLAG, FrameCompressor, decompress_frame
+from Handshake import (
+    CAP_COMPRESS,
+    CAP_SHM,
+    HANDSHAKE_MAGIC,
+    accepted_capabilities,
+    apply_capabilities,
+    merge_event_frames,
+    pack_hello,
+    unpack_welcome,
+)
+from PackerPool import PackerPool
+from ipc_client import (
+    DEFAULT_TCP_PORT,
+    MAX_FRAME_SIZE,
+    TCP_BUFFER_SIZE,
+    UNIX_SOCKET_PATH,
+    tune_tcp_socket,
+)
+
+# [u32 length][f64 dt] in front of every inbound frame's events
+FRAME_HEAD_STRUCT = struct.Struct("<Ld")
+
+UpdateResult = Union[bytes, List[memoryview], bool]
+
+
+class AsyncIPCClient:
+    """
+    Phrost IPC Client (Python, asyncio)
+
+    The same frame protocol, handshake and PackerPool as IPCClient, over
+    asyncio streams: the engine's UNIX socket, or TCP when a host is given
+    (the engine's sockets mode, and the only option on Windows).
+
+    The update callback may be an `async def`. While the client waits for
+    the engine's next frame, the event loop runs any other tasks the game
+    started (file or network I/O, asyncio.to_thread() work), so they
+    overlap the engine round-trip instead of adding to it:
+
+        client = AsyncIPCClient()
+        await client.connect()
+        await client.run(Phrost_Update)
+    """
+
+    def __init__(
+        self,
+        features: int = 0,
+        host: Optional[str] = None,
+        port: int = DEFAULT_TCP_PORT,
+        buffer_size: int = TCP_BUFFER_SIZE,
+        keepalive: Optional[int] = None,
+        path: str = UNIX_SOCKET_PATH,
+        compressor: Optional[FrameCompressor] = None,
+    ):
+        """
+        :param features: Optional wire features (Handshake.CAP_*) to offer
+                         the engine on connect; see IPCClient.
+        :param host: Connect over TCP to host:port instead of the UNIX
+                     socket at `path`. buffer_size and keepalive tune the
+                     TCP socket as for IPCClient.
+        :param compressor: Used once CAP_COMPRESS is agreed; see IPCClient.
+        """
+        self.features: int = features
+        self.host: Optional[str] = host
+        self.port: int = port
+        self.buffer_size: int = buffer_size
+        self.keepalive: Optional[int] = keepalive
+        self.path: str = path
+        self.compressor: FrameCompressor = compressor or FrameCompressor()
+        self.reader: Optional[asyncio.StreamReader] = None
+        self.writer: Optional[asyncio.StreamWriter] = None
+        self.is_connected: bool = False
+        # Packers reused across frames, handed to the update callback
+        self.pool: PackerPool = PackerPool()
+        # Features agreed with the engine by handshake()
+        self.capabilities: int = 0
+        # A frame read during the handshake, handed to the first update
+        self._pending_frame: Optional[Dict[str, Union[float, bytes]]] = None
+
+    async def connect(self):
+        """Connects to the Swift IPC server."""
+        if self.is_connected:
+            return
+
+        try:
+            if self.host is not None:
+                print(f"Attempting to connect to {self.host}:{self.port}...")
+                sock = await self._connect_tcp()
+                self.reader, self.writer = await asyncio.open_connection(sock=sock)
+            elif os.name == "nt":
+                raise Exception(
+                    "AsyncIPCClient needs the engine's TCP host on Windows"
+                    " (asyncio has no named pipe client)."
+                )
+            else:
+                print(f"Attempting to connect to UNIX socket: {self.path}...")
+                self.reader, self.writer = await asyncio.open_unix_connection(self.path)
+
+            self.is_connected = True
+            if self.features:
+                await self.handshake()
+            print("Connected! Entering game loop...")
+
+        except (FileNotFoundError, ConnectionRefusedError) as e:
+            raise Exception(
+                f"Connection failed. Is the Swift server running?\nError: {e}"
+            )
+
+    async def _connect_tcp(self) -> socket.socket:
+        """
+        Connects to self.host:self.port like IPCClient._connect_tcp(),
+        tuning the socket before it connects.
+        """
+        loop = asyncio.get_running_loop()
+        error: Optional[OSError] = None
+        for family, kind, proto, _, address in await loop.getaddrinfo(
+            self.host, self.port, type=socket.SOCK_STREAM
+        ):
+            sock = socket.socket(family, kind, proto)
+            try:
+                sock.setblocking(False)
+                tune_tcp_socket(sock, self.buffer_size, self.keepalive)
+                await loop.sock_connect(sock, address)
+                return sock
+            except OSError as e:
+                sock.close()
+                error = e
+        raise error or ConnectionRefusedError(f"No address for {self.host}")
+
+    async def disconnect(self):
+        """Disconnects from the server."""
+        if not self.is_connected or not self.writer:
+            return
+
+        try:
+            self.writer.close()
+            await self.writer.wait_closed()
+        except Exception as e:
+            print(f"Error during disconnect: {e}", file=sys.stderr)
+        finally:
+            self.reader = None
+            self.writer = None
+            self.is_connected = False
+            # Back to the base wire format until the next handshake
+            if self.features:
+                apply_capabilities(self.pool, self.features, 0)
+            self.capabilities = 0
+            self._pending_frame = None
+            print("Disconnected.")
+
+    async def handshake(self) -> int:
+        """
+        Offers self.features to the engine and switches on the ones both
+        sides support. Returns the agreed capability bits. Works like
+        IPCClient.handshake(), including with engines that predate it.
+        CAP_SHM is never offered: only IPCClient maps the shared regions.
+        CAP_COMPRESS is only offered over TCP.
+        """
+        offered = self.features & ~CAP_SHM
+        if self.host is None:
+            offered &= ~CAP_COMPRESS
+        if not await self.write_frame(pack_hello(offered)):
+            raise Exception("Handshake failed: could not send hello.")
+
+        first = await self.read_frame()
+        head = await self._read_frame_head()
+        if first is None or head is None:
+            raise Exception("Handshake failed: connection closed.")
+
+        total_length, dt_data = head
+        capabilities = 0
+        if dt_data == HANDSHAKE_MAGIC:
+            rest = await self._read_exactly(total_length - len(dt_data))
+            welcome = unpack_welcome(dt_data + rest) if rest is not None else None
+            if welcome is None:
+                raise Exception("Handshake failed: malformed welcome.")
+            capabilities = accepted_capabilities(welcome, offered)
+            self._pending_frame = first
+        else:
+            second = await self._read_frame_body(total_length, dt_data)
+            if second is None:
+                raise Exception("Handshake failed: connection closed.")
+            self._pending_frame = merge_event_frames(first, second)
+            print("Engine has no handshake; using the base wire format.")
+
+        self.capabilities = capabilities
+        apply_capabilities(self.pool, offered, capabilities)
+        print(f"Wire capabilities: 0x{capabilities:x}")
+        return capabilities
+
+    async def run(
+        self,
+        update_callback: Callable[
+            [int, float, bytes, PackerPool],
+            Union[UpdateResult, Awaitable[UpdateResult]],
+        ],
+    ):
+        """
+        Runs the main game loop, calling (and, for an `async def`,
+        awaiting) the update callback each frame. Takes and returns the same
+        values as the callback of IPCClient.run().
+        """
+        if not self.is_connected:
+            raise Exception("Cannot run: Not connected.")
+
+        elapsed = 0
+        try:
+            while True:
+                # 1. Read frame data from Swift; other tasks run meanwhile
+                frame_data = self._pending_frame or await self.read_frame()
+                self._pending_frame = None
+                if frame_data is None:
+                    print("Pipe broken (read failed). Exiting loop.")
+                    break
+
+                # 2. Call the user's game logic function
+                self.pool.begin_frame()
+                command_blob = update_callback(
+                    elapsed, frame_data["dt"], frame_data["events_blob"], self.pool
+                )
+                if inspect.isawaitable(command_blob):
+                    command_blob = await command_blob
+
+                if command_blob is False:
+                    print("[Python Logic] Game logic signaled graceful quit.")
+                    break
+
+                # 3. Write commands back to Swift
+                if not await self.write_frame(command_blob):
+                    print("Pipe broken (write failed). Exiting loop.")
+                    break
+
+                elapsed += 1
+        except Exception as e:
+            print(f"An error occurred during the loop: {e}", file=sys.stderr)
+            import traceback
+
+            traceback.print_exc()
+
+    async def read_frame(self) -> Optional[Dict[str, Union[float, bytes]]]:
+        """
+        Reads one full "frame" of data from the Swift server.
+        Format: [4-byte length][8-byte double dt][event_blob]
+        """
+        head = await self._read_frame_head()
+        if head is None:
+            return None
+        return await self._read_frame_body(*head)
+
+    async def _read_frame_head(self) -> Optional[Tuple[int, bytes]]:
+        """Reads a frame's length and its raw 8-byte dt (or handshake magic)."""
+        head = await self._read_exactly(FRAME_HEAD_STRUCT.size)
+        if head is None:
+            return None
+
+        # '<L' = unsigned long, little-endian (matches PHP 'V')
+        total_length = FRAME_HEAD_STRUCT.unpack_from(head)[0]
+        if total_length < 8:
+            print(
+                f"Payload too small: {total_length} bytes, expected >= 8.",
+                file=sys.stderr,
+            )
+            return None
+        # As IPCClient, without shared memory: SHM_FRAME is always refused
+        length = total_length
+        if self.capabilities & CAP_COMPRESS:
+            length &= ~COMPRESSED_FLAG
+        if length > MAX_FRAME_SIZE:
+            print(
+                f"Frame length 0x{total_length:08x} is over {MAX_FRAME_SIZE} bytes"
+                " (or uses a feature that wasn't agreed).",
+                file=sys.stderr,
+            )
+            return None
+
+        return total_length, head[4:]
+
+    async def _read_frame_body(
+        self, total_length: int, dt_data: bytes
+    ) -> Optional[Dict[str, Union[float, bytes]]]:
+        """Reads the rest of a frame whose head was read by _read_frame_head()."""
+        dt = struct.unpack("<d", dt_data)[0]
+
+        # With CAP_COMPRESS: [u32 codec][u32 raw length][data] follows dt
+        compressed = bool(total_length & COMPRESSED_FLAG) and bool(
+            self.capabilities & CAP_COMPRESS
+        )
+        if compressed:
+            total_length &= ~COMPRESSED_FLAG
+
+        events_blob = await self._read_exactly(total_length - 8)
+        if events_blob is None:
+            print("Failed to read event payload.", file=sys.stderr)
+            return None
+        if compressed:
+            events_blob = decompress_frame(events_blob, MAX_FRAME_SIZE)
+            if events_blob is None:
+                return None
+
+        return {"dt": dt, "events_blob": events_blob}
+
+    async def _read_exactly(self, length: int) -> Optional[bytes]:
+        """Reads exactly 'length' bytes, or returns None if the link closed."""
+        try:
+            return await self.reader.readexactly(length)
+        except asyncio.IncompleteReadError as e:
+            print(
+                f"Pipe closed (read {len(e.partial)} of {length} bytes).",
+                file=sys.stderr,
+            )
+            return None
+        except (ConnectionError, OSError) as e:
+            print(f"read failed: {e}", file=sys.stderr)
+            return None
+
+    async def write_frame(self, command_blob: Union[bytes, List[Any]]) -> bool:
+        """
+        Writes one full "frame" of commands to the Swift server.
+        Format: [4-byte length][command_blob]
+
+        command_blob may be a single bytes-like object or a list of buffers
+        (e.g. from finalize_views()). The transport may keep whatever it
+        can't send right away, and the pool's packers are reused next
+        frame, so the frame is written as one joined copy. With
+        CAP_COMPRESS it may be compressed first, as by IPCClient.
+        """
+        try:
+            if isinstance(command_blob, (bytes, bytearray, memoryview)):
+                buffers = [command_blob]
+            else:
+                buffers = list(command_blob)
+            flag = 0
+            if self.capabilities & CAP_COMPRESS:
+                compressed = self.compressor.compress(buffers)
+                if compressed is not None:
+                    buffers = compressed
+                    flag = COMPRESSED_FLAG
+            cmd_len = sum(memoryview(buffer).nbytes for buffer in buffers)
+            # '<L' = unsigned long, little-endian (matches PHP 'V')
+            self.writer.write(b"".join([struct.pack("<L", cmd_len | flag)] + buffers))
+            await self.writer.drain()
+            return True
+        except (ConnectionError, OSError) as e:
+            print(f"write_frame failed: {e}", file=sys.stderr)
+            return False
@@ -2,7 +2,83 @@ import os
 import socket
 import struct
 import sys
-from typing import Callable, Optional, Dict, Union
+from typing import Callable, Optional, Dict, List, Sequence, Tuple, Union
+
+from Compression import COMPRESSED_FLAG, FrameCompressor, decompress_frame
+from Handshake import (
+    CAP_COMPRESS,
+    CAP_SHM,
+    HANDSHAKE_MAGIC,
+    accepted_capabilities,
+    apply_capabilities,
+    merge_event_frames,
+    pack_hello,
+    unpack_welcome,
+)
+from PackerPool import PackerPool
+from SharedMemory import (
+    COMMANDS_NOTICE_STRUCT,
+    EVENTS_NOTICE_TAIL_STRUCT,
+    SHM_FRAME,
+    SharedRegion,
+    region_paths,
+)
+
+# Max buffers per sendmsg() call (POSIX guarantees at least 16, Linux/macOS allow 1024)
+IOV_MAX = 1024
+
+# [u32 length][f64 dt] in front of every inbound frame's events, read in one call
+FRAME_HEAD_STRUCT = struct.Struct("<Ld")
+
+# Starting size of the receive buffer; it grows to fit the largest frame
+INITIAL_RECV_SIZE = 64 * 1024
+
+# Largest inbound frame, in bytes (raw, and after decompression). A longer
+# length is refused rather than allocated: that includes SHM_FRAME and
+# COMPRESSED_FLAG when the feature wasn't agreed.
+MAX_FRAME_SIZE = 256 * 1024 * 1024
+
+# Where PhrostIPC listens on macOS/Linux
+UNIX_SOCKET_PATH = "/tmp/PhrostEngine.socket"
+
+# PhrostIPC's port in `--mode sockets` unless given `--port`
+DEFAULT_TCP_PORT = 8080
+
+# SO_SNDBUF / SO_RCVBUF for TCP links, the size of the engine's pipe buffers
+TCP_BUFFER_SIZE = 1024 * 1024
+
+
+def tune_tcp_socket(
+    sock: socket.socket,
+    buffer_size: int = TCP_BUFFER_SIZE,
+    keepalive: Optional[int] = None,
+) -> None:
+    """
+    Sets up a TCP socket for the frame protocol. Call it before connect():
+    the receive window is sized from SO_RCVBUF during the TCP handshake.
+
+    - TCP_NODELAY, so each frame goes out as soon as it is written instead
+      of waiting for the previous one to be acknowledged (Nagle).
+    - Send and receive buffers of `buffer_size` bytes (0 keeps the OS
+      defaults), so a large frame is not throttled by a small window.
+    - With `keepalive` (seconds), keep-alive probes after that long idle,
+      so a remote engine that went away is noticed instead of hanging.
+    """
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    if buffer_size:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, buffer_size)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, buffer_size)
+    if keepalive:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        if hasattr(socket, "TCP_KEEPIDLE"):  # Linux, recent Windows
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, keepalive)
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, keepalive)
+        elif hasattr(socket, "TCP_KEEPALIVE"):  # macOS
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPALIVE, keepalive)
+        elif hasattr(socket, "SIO_KEEPALIVE_VALS"):  # Older Windows
+            sock.ioctl(
+                socket.SIO_KEEPALIVE_VALS, (1, keepalive * 1000, keepalive * 1000)
+            )
 
 
 class IPCClient:
@@ -10,13 +86,67 @@ class IPCClient:
     Phrost IPC Client (Python)
 
     This class handles all the low-level, cross-platform socket/pipe
-    communication with the Swift IPC server.
+    communication with the Swift IPC server: the UNIX socket (macOS/Linux)
+    or named pipe (Windows) by default, or TCP when the engine runs with
+    `--mode sockets`, possibly on another machine.
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        features: int = 0,
+        host: Optional[str] = None,
+        port: int = DEFAULT_TCP_PORT,
+        buffer_size: int = TCP_BUFFER_SIZE,
+        keepalive: Optional[int] = None,
+        path: str = UNIX_SOCKET_PATH,
+        compressor: Optional[FrameCompressor] = None,
+    ):
+        """
+        :param features: Optional wire features (Handshake.CAP_*) to offer
+                         the engine on connect. The ones it accepts are
+                         switched on in self.pool, the rest off, until
+                         disconnect(). 0 (the default: none of them has
+                         been run against the Swift engine end to end
+                         yet) skips the handshake and leaves the pool as
+                         it is. Add CAP_SHM to pass frames through shared
+                         memory (local links only), or CAP_COMPRESS to
+                         compress them (TCP links only).
+        :param host: Connect over TCP to host:port instead of the local
+                     socket/pipe.
+        :param buffer_size: TCP send/receive buffer size, see tune_tcp_socket().
+        :param keepalive: TCP keep-alive idle time in seconds (None: off).
+        :param path: The engine's UNIX socket (macOS/Linux).
+        :param compressor: Codec, threshold and cost model for outgoing
+                           frames once CAP_COMPRESS is agreed; a default
+                           FrameCompressor (zlib) if not given.
+        """
         self.is_windows: bool = os.name == "nt"
+        self.path: str = path
+        self.host: Optional[str] = host
+        self.port: int = port
+        self.buffer_size: int = buffer_size
+        self.keepalive: Optional[int] = keepalive
         self.pipe: Optional[Union[socket.socket, "file"]] = None
+        # True for the Windows named pipe, which is a file rather than a socket
+        self.pipe_is_file: bool = False
         self.is_connected: bool = False
+        # Packers reused across frames, handed to the update callback
+        self.pool: PackerPool = PackerPool()
+        self.features: int = features
+        # Features agreed with the engine by handshake()
+        self.capabilities: int = 0
+        # A frame read during the handshake, handed to the first update
+        self._pending_frame: Optional[Dict[str, Union[float, bytes]]] = None
+        # Frame heads and event payloads are received into these, in place
+        self._head = bytearray(FRAME_HEAD_STRUCT.size)
+        self._head_view = memoryview(self._head)
+        self._recv_view = memoryview(bytearray(INITIAL_RECV_SIZE))
+        # With CAP_SHM: frames are passed in these, see SharedMemory.py
+        self._events_region: Optional[SharedRegion] = None
+        self._commands_region: Optional[SharedRegion] = None
+        self._notice = bytearray(EVENTS_NOTICE_TAIL_STRUCT.size)
+        self._notice_view = memoryview(self._notice)
+        self.compressor: FrameCompressor = compressor or FrameCompressor()
 
     def connect(self):
         """Connects to the Swift IPC server."""
@@ -24,36 +154,64 @@ class IPCClient:
             return
 
         try:
-            if self.is_windows:
+            if self.host is not None:
+                # --- TCP Connection (PhrostIPC --mode sockets) ---
+                print(f"Attempting to connect to {self.host}:{self.port}...")
+                self.pipe = self._connect_tcp()
+
+            elif self.is_windows:
                 # --- Windows Connection (Named Pipe) ---
                 pipe_path = r"\\.\pipe\PhrostEngine"
                 print(f"Attempting to connect to Windows pipe: {pipe_path}...")
 
                 # 'r+b' is critical for binary read/write
                 self.pipe = open(pipe_path, "r+b")
+                self.pipe_is_file = True
                 # Windows pipes are blocking by default, similar to stream_set_blocking
 
             else:
                 # --- macOS/Linux Connection (UNIX Domain Socket) ---
-                pipe_path = "/tmp/PhrostEngine.socket"
-                print(f"Attempting to connect to UNIX socket: {pipe_path}...")
+                print(f"Attempting to connect to UNIX socket: {self.path}...")
 
                 self.pipe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
-                self.pipe.connect(pipe_path)
+                self.pipe.connect(self.path)
                 # Sockets are blocking by default, similar to socket_set_block
 
             self.is_connected = True
+            if self.features:
+                self.handshake()
             print("Connected! Entering game loop...")
             print("Blocking now...")
 
         except (FileNotFoundError, ConnectionRefusedError) as e:
             server_name = "PhrostIPC.exe" if self.is_windows else "Swift server"
+            if self.host is not None:
+                server_name += f" (--mode sockets --port {self.port})"
             raise Exception(
                 f"Connection failed. Is the {server_name} running?\nError: {e}"
             )
         except Exception as e:
             raise Exception(f"An unexpected error occurred: {e}")
 
+    def _connect_tcp(self) -> socket.socket:
+        """
+        Connects to self.host:self.port, trying each address it resolves to
+        (e.g. IPv6 then IPv4 for "localhost"), with the socket tuned first.
+        """
+        error: Optional[OSError] = None
+        for family, kind, proto, _, address in socket.getaddrinfo(
+            self.host, self.port, type=socket.SOCK_STREAM
+        ):
+            sock = socket.socket(family, kind, proto)
+            try:
+                tune_tcp_socket(sock, self.buffer_size, self.keepalive)
+                sock.connect(address)
+                return sock
+            except OSError as e:
+                sock.close()
+                error = e
+        raise error or ConnectionRefusedError(f"No address for {self.host}")
+
     def disconnect(self):
         """Disconnects from the server."""
         if not self.is_connected or not self.pipe:
@@ -64,17 +222,110 @@ class IPCClient:
         except Exception as e:
             print(f"Error during disconnect: {e}", file=sys.stderr)
         finally:
+            self._detach_shared_memory()
             self.pipe = None
+            self.pipe_is_file = False
             self.is_connected = False
+            # Back to the base wire format until the next handshake
+            if self.features:
+                apply_capabilities(self.pool, self.features, 0)
+            self.capabilities = 0
+            self._pending_frame = None
             print("Disconnected.")
 
-    def run(self, update_callback: Callable[[int, float, bytes], Union[bytes, bool]]):
+    def handshake(self) -> int:
+        """
+        Offers self.features to the engine and switches on the ones both
+        sides support. Returns the agreed capability bits.
+
+        The engine always sends a frame first. The hello goes out as the
+        reply to it; a current engine answers with a welcome and then waits
+        for the real reply. An engine without handshake support takes the
+        hello as an empty reply and sends its next frame, which is merged
+        with the first so no events are lost, and nothing is switched on.
+
+        CAP_SHM is only offered over the local socket/pipe; once agreed,
+        the regions named in the welcome are mapped before the next frame.
+        CAP_COMPRESS is only offered over TCP.
+        """
+        offered = self.features
+        if self.host is not None:
+            offered &= ~CAP_SHM
+        else:
+            offered &= ~CAP_COMPRESS
+        if not self.write_frame(pack_hello(offered)):
+            raise Exception("Handshake failed: could not send hello.")
+
+        first = self.read_frame()
+        if first is None:
+            raise Exception("Handshake failed: connection closed.")
+        # Keep it: the next read reuses the receive buffer
+        first["events_blob"] = bytes(first["events_blob"])
+        head = self._read_frame_head()
+        if head is None:
+            raise Exception("Handshake failed: connection closed.")
+
+        total_length, dt = head
+        dt_data = bytes(self._head[4:])
+        capabilities = 0
+        if dt_data == HANDSHAKE_MAGIC:
+            rest = self.read_all(total_length - len(dt_data))
+            welcome = unpack_welcome(dt_data + rest) if rest is not None else None
+            if welcome is None:
+                raise Exception("Handshake failed: malformed welcome.")
+            capabilities = accepted_capabilities(welcome, offered)
+            self._pending_frame = first
+        else:
+            second = self._read_frame_body(total_length, dt)
+            if second is None:
+                raise Exception("Handshake failed: connection closed.")
+            self._pending_frame = merge_event_frames(first, second)
+            print("Engine has no handshake; using the base wire format.")
+
+        self.capabilities = capabilities
+        apply_capabilities(self.pool, offered, capabilities)
+        if capabilities & CAP_SHM:
+            self._attach_shared_memory(welcome["shm_name"])
+        print(f"Wire capabilities: 0x{capabilities:x}")
+        return capabilities
+
+    def _attach_shared_memory(self, name: Optional[str]):
+        """Maps the regions the engine created for CAP_SHM, named in its welcome."""
+        try:
+            events_path, commands_path = region_paths(name or "")
+            self._events_region = SharedRegion(events_path)
+            self._commands_region = SharedRegion(commands_path)
+        except (OSError, ValueError) as e:
+            self._detach_shared_memory()
+            raise Exception(f"Handshake failed: cannot map shared memory: {e}")
+
+    def _detach_shared_memory(self):
+        """Unmaps the CAP_SHM regions, if any. The engine removes the files."""
+        for region in (self._events_region, self._commands_region):
+            if region is not None:
+                region.close()
+        self._events_region = None
+        self._commands_region = None
+
+    def run(
+        self,
+        update_callback: Callable[
+            [int, float, bytes, PackerPool], Union[bytes, List[memoryview], bool]
+        ],
+    ):
         """
         Runs the main game loop, calling the update callback each frame.
 
         :param update_callback: The user's game logic function.
-            Accepts: (elapsed: int, dt: float, events_blob: bytes)
-            Returns: (command_blob: bytes) or False to quit.
+            Accepts: (elapsed: int, dt: float, events_blob: memoryview,
+                      pool: PackerPool)
+            events_blob views the client's receive buffer (or, with
+            CAP_SHM, the shared region), which a later frame is read into:
+            copy it (bytes(events_blob)) to keep it.
+            Returns: (command_blob: bytes), a list of buffers from a
+            packer's finalize_views(), or False to quit.
+            Packers taken from the pool are reset at the start of the next
+            frame, after the previous frame has been written.
         """
         if not self.is_connected:
             raise Exception("Cannot run: Not connected.")
@@ -82,15 +333,18 @@ class IPCClient:
         elapsed = 0
         try:
             while True:
-                # 1. Read frame data from Swift
-                frame_data = self.read_frame()
+                # 1. Read frame data from Swift (the first may have
+                # arrived during the handshake)
+                frame_data = self._pending_frame or self.read_frame()
+                self._pending_frame = None
                 if frame_data is None:
                     print("Pipe broken (read failed). Exiting loop.")
                     break
 
                 # 2. Call the user's game logic function
+                self.pool.begin_frame()
                 command_blob = update_callback(
-                    elapsed, frame_data["dt"], frame_data["events_blob"]
+                    elapsed, frame_data["dt"], frame_data["events_blob"], self.pool
                 )
 
                 if command_blob is False:
@@ -109,61 +363,132 @@ class IPCClient:
 
             traceback.print_exc()
 
-    def read_frame(self) -> Optional[Dict[str, Union[float, bytes]]]:
+    def read_frame(self) -> Optional[Dict[str, Union[float, memoryview]]]:
         """
         Reads one full "frame" of data from the Swift server.
         Format: [4-byte length][8-byte double dt][event_blob]
+
+        The events are received straight into a buffer that is reused for
+        every frame, so "events_blob" is a memoryview that stays valid only
+        until the next read_frame().
+
+        With CAP_SHM, a frame may instead be left in the events region, the
+        socket carrying only [u32 SHM_FRAME][f64 dt][u32 slot][u32 length];
+        "events_blob" then views the region itself.
         """
-        # 1. Read Length Header (4 bytes, unsigned long, little-endian)
-        len_header = self.read_all(4)
-        if len_header is None:
+        head = self._read_frame_head()
+        if head is None:
             return None
+        return self._read_frame_body(*head)
 
-        try:
-            # '<L' = unsigned long, little-endian (matches PHP 'V')
-            total_length = struct.unpack("<L", len_header)[0]
-        except struct.error:
-            print("Failed to unpack header.", file=sys.stderr)
+    def _read_frame_head(self) -> Optional[Tuple[int, float]]:
+        """
+        Reads a frame's length and dt with a single read into self._head.
+        The raw dt bytes (the magic of a handshake welcome) stay there.
+        """
+        if not self._read_into(self._head_view):
             return None
 
-        # 2. Read Payload (dt + events)
+        # '<L' = unsigned long, little-endian (matches PHP 'V'), then the double
+        total_length, dt = FRAME_HEAD_STRUCT.unpack_from(self._head)
         if total_length < 8:
             print(
                 f"Payload too small: {total_length} bytes, expected >= 8.",
                 file=sys.stderr,
             )
             return None
-
-        # Read DT (8 bytes, double)
-        dt_data = self.read_all(8)
-        if dt_data is None:
-            print("Failed to read delta-time.", file=sys.stderr)
+        if total_length == SHM_FRAME and self._events_region is not None:
+            return total_length, dt
+        length = total_length
+        if self.capabilities & CAP_COMPRESS:
+            length &= ~COMPRESSED_FLAG
+        if length > MAX_FRAME_SIZE:
+            print(
+                f"Frame length 0x{total_length:08x} is over {MAX_FRAME_SIZE} bytes"
+                " (or uses a feature that wasn't agreed).",
+                file=sys.stderr,
+            )
             return None
 
-        # 'd' = double (matches PHP 'd')
-        dt = struct.unpack("d", dt_data)[0]
+        return total_length, dt
 
-        # Read Events (Remaining bytes)
-        event_payload_length = total_length - 8
-        events_blob = b""
-        if event_payload_length > 0:
-            events_blob = self.read_all(event_payload_length)
+    def _read_frame_body(
+        self, total_length: int, dt: float
+    ) -> Optional[Dict[str, Union[float, memoryview]]]:
+        """Reads the rest of a frame whose head was read by _read_frame_head()."""
+        if total_length == SHM_FRAME and self._events_region is not None:
+            if not self._read_into(self._notice_view):
+                return None
+            slot, length = EVENTS_NOTICE_TAIL_STRUCT.unpack_from(self._notice)
+            events_blob = self._events_region.read(slot, length)
             if events_blob is None:
-                print("Failed to read event payload.", file=sys.stderr)
+                print(f"Shared frame too large: {length} bytes.", file=sys.stderr)
+                return None
+            return {"dt": dt, "events_blob": events_blob}
+
+        # With CAP_COMPRESS: [u32 codec][u32 raw length][data] follows dt
+        compressed = bool(total_length & COMPRESSED_FLAG) and bool(
+            self.capabilities & CAP_COMPRESS
+        )
+        if compressed:
+            total_length &= ~COMPRESSED_FLAG
+
+        event_payload_length = total_length - 8
+        if event_payload_length > self._recv_view.nbytes:
+            # A fresh buffer rather than a resize: views of the old one may
+            # still be alive
+            size = max(event_payload_length, 2 * self._recv_view.nbytes)
+            self._recv_view = memoryview(bytearray(size))
+
+        events_blob = self._recv_view[:event_payload_length]
+        if not self._read_into(events_blob):
+            print("Failed to read event payload.", file=sys.stderr)
+            return None
+
+        if compressed:
+            events = decompress_frame(events_blob, MAX_FRAME_SIZE)
+            if events is None:
                 return None
+            events_blob = memoryview(events)
 
         return {"dt": dt, "events_blob": events_blob}
 
-    def write_frame(self, command_blob: bytes) -> bool:
+    def write_frame(self, command_blob: Union[bytes, Sequence[memoryview]]) -> bool:
         """
         Writes one full "frame" of commands to the Swift server.
         Format: [4-byte length][command_blob]
+
+        command_blob may be a single bytes-like object or a list of buffers
+        (e.g. from finalize_views()); a list is sent as-is without joining.
+
+        With CAP_SHM the buffers are copied into the commands region and
+        only [u32 SHM_FRAME][u32 slot][u32 length] is sent. A frame too
+        large for a slot goes inline as usual.
+
+        With CAP_COMPRESS, self.compressor may compress the frame, which is
+        then sent as [4-byte length | COMPRESSED_FLAG][u32 codec]
+        [u32 raw length][compressed command_blob].
         """
         try:
-            cmd_len = len(command_blob)
+            if isinstance(command_blob, (bytes, bytearray, memoryview)):
+                buffers = [command_blob]
+            else:
+                buffers = list(command_blob)
+            if self._commands_region is not None:
+                placed = self._commands_region.write(buffers)
+                if placed is not None:
+                    return self.write_all(
+                        COMMANDS_NOTICE_STRUCT.pack(SHM_FRAME, *placed)
+                    )
+            flag = 0
+            if self.capabilities & CAP_COMPRESS:
+                compressed = self.compressor.compress(buffers)
+                if compressed is not None:
+                    buffers = compressed
+                    flag = COMPRESSED_FLAG
+            cmd_len = sum(memoryview(buffer).nbytes for buffer in buffers)
             # '<L' = unsigned long, little-endian (matches PHP 'V')
-            out_data = struct.pack("<L", cmd_len) + command_blob
-            return self.write_all(out_data)
+            return self.write_buffers([struct.pack("<L", cmd_len | flag)] + buffers)
         except Exception as e:
             print(f"write_frame failed: {e}", file=sys.stderr)
             return False
@@ -173,33 +498,70 @@ class IPCClient:
         if length == 0:
             return b""
 
-        buffer = bytearray()
-        bytes_remaining = length
+        buffer = bytearray(length)
+        if not self._read_into(memoryview(buffer)):
+            return None
+        return bytes(buffer)
+
+    def _read_into(self, view: memoryview) -> bool:
+        """
+        Fills `view` from the pipe with recv_into() (readinto() on Windows),
+        so the data lands in place without a bytes object per chunk.
+        """
+        filled = 0
+        length = view.nbytes
         try:
-            while bytes_remaining > 0:
-                if self.is_windows:
-                    data = self.pipe.read(bytes_remaining)
+            while filled < length:
+                if self.pipe_is_file:
+                    received = self.pipe.readinto(view[filled:])
                 else:
-                    data = self.pipe.recv(bytes_remaining)
+                    received = self.pipe.recv_into(view[filled:])
 
-                if not data:
+                if not received:
                     print(
-                        f"Pipe closed (read 0 bytes). Bytes remaining: {bytes_remaining}",
+                        f"Pipe closed (read 0 bytes). Bytes remaining: {length - filled}",
                         file=sys.stderr,
                     )
-                    return None
+                    return False
 
-                buffer.extend(data)
-                bytes_remaining -= len(data)
-            return bytes(buffer)
+                filled += received
+            return True
         except (IOError, socket.error) as e:
             print(f"read_all failed: {e}", file=sys.stderr)
-            return None
+            return False
+
+    def write_buffers(self, buffers: List[Union[bytes, memoryview]]) -> bool:
+        """
+        Writes several buffers back to back. On sockets this is a single
+        scatter-gather sendmsg() (writev) per call, so the buffers are
+        never joined in Python.
+        """
+        if self.pipe_is_file or not hasattr(self.pipe, "sendmsg"):
+            return all(self.write_all(buffer) for buffer in buffers)
+
+        views = [memoryview(buffer) for buffer in buffers if len(buffer)]
+        try:
+            while views:
+                sent = self.pipe.sendmsg(views[:IOV_MAX])
+                if sent == 0:
+                    print("sendmsg returned 0 bytes.", file=sys.stderr)
+                    return False
+
+                # Drop what was fully sent, and trim a partially sent buffer
+                while views and sent >= views[0].nbytes:
+                    sent -= views[0].nbytes
+                    views.pop(0)
+                if sent:
+                    views[0] = views[0][sent:]
+            return True
+        except (IOError, socket.error) as e:
+            print(f"write_buffers failed: {e}", file=sys.stderr)
+            return False
 
     def write_all(self, data: bytes) -> bool:
         """Unified write function. Writes all data."""
         try:
-            if self.is_windows:
+            if self.pipe_is_file:
                 # For Windows pipes opened as files, we loop the write
                 # just like your PHP code to ensure all data is sent.
                 total_written = 0
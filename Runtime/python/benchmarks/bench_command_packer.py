@@ -0,0 +1,191 @@
+"""
+Micro-benchmark for CommandPacker.
+
+Packs N SPRITE_MOVE events (the bunnymark hot path) and compares the current
+packer (the generic add() shim, the typed sprite_move() method and the
+columnar add_many()) against the previous struct.pack() +
+bytearray.extend() packer. add_many() is timed from prebuilt array.array
+columns.
+
+A second table compares bytes per frame with and without batching
+(CommandPacker(batch=True), one EVENT_BATCH header for the whole run).
+
+Usage: python benchmarks/bench_command_packer.py [count ...]
+"""
+
+import array
+import os
+import struct
+import sys
+import timeit
+
+# --- Add the Phrost subdirectory to the Python path ---
+script_dir = os.path.dirname(os.path.abspath(__file__))
+phrost_dir = os.path.join(os.path.dirname(script_dir), "Phrost")
+
+if phrost_dir not in sys.path:
+    sys.path.insert(0, phrost_dir)
+# --- End of path setup ---
+
+from CommandPacker import CommandPacker
+from Events import Events
+from PackFormat import PackFormat
+
+REPEAT = 5
+
+
+class LegacyCommandPacker:
+    """
+    The previous packer, trimmed to the fixed-size path: every event re-parses
+    its format string with struct.pack() and extends a growing bytearray.
+    It writes the current 8-byte-aligned layout so outputs can be compared.
+    """
+
+    _MANUAL_EVENTS = (
+        Events.SPRITE_TEXTURE_LOAD,
+        Events.PLUGIN_LOAD,
+        Events.AUDIO_LOAD,
+        Events.TEXT_ADD,
+        Events.TEXT_SET_STRING,
+    )
+
+    def __init__(self):
+        self._event_stream = bytearray()
+        self._command_count = 0
+
+    def add(self, event_type: Events, data: list):
+        self._pack_event(event_type, data)
+
+    def _pack_event(self, event_type: Events, data: list):
+        type_value = event_type.value
+        self._event_stream.extend(struct.pack("<IQ4x", type_value, 0))
+        for manual in LegacyCommandPacker._MANUAL_EVENTS:
+            if event_type == manual:
+                raise NotImplementedError(manual.name)
+        fmt, size = PackFormat.get_info(type_value)
+        self._event_stream.extend(struct.pack(fmt, *data))
+        padding = (8 - len(self._event_stream) % 8) % 8
+        self._event_stream.extend(bytes(padding))
+        self._command_count += 1
+
+    def finalize(self) -> bytes:
+        return struct.pack("<I4x", self._command_count) + self._event_stream
+
+
+def legacy_pack(rows):
+    packer = LegacyCommandPacker()
+    for row in rows:
+        packer.add(Events.SPRITE_MOVE, row)
+    return packer.finalize()
+
+
+def current_pack(rows):
+    packer = CommandPacker()
+    for row in rows:
+        packer.add(Events.SPRITE_MOVE, row)
+    return packer.finalize()
+
+
+def typed_pack(rows):
+    packer = CommandPacker()
+    for id1, id2, x, y, z in rows:
+        packer.sprite_move(id1, id2, x, y, z)
+    return packer.finalize()
+
+
+def bulk_pack(columns):
+    packer = CommandPacker()
+    packer.add_many(Events.SPRITE_MOVE, **columns)
+    return packer.finalize()
+
+
+def batched_typed_pack(rows):
+    packer = CommandPacker(batch=True)
+    for id1, id2, x, y, z in rows:
+        packer.sprite_move(id1, id2, x, y, z)
+    return packer.finalize()
+
+
+def batched_bulk_pack(columns):
+    packer = CommandPacker(batch=True)
+    packer.add_many(Events.SPRITE_MOVE, **columns)
+    return packer.finalize()
+
+
+def strip_timestamps(events):
+    return [{k: v for k, v in event.items() if k != "timestamp"} for event in events]
+
+
+def to_columns(rows):
+    id1, id2, x, y, z = zip(*rows)
+    return {
+        "id1": array.array("q", id1),
+        "id2": array.array("q", id2),
+        "positionX": array.array("d", x),
+        "positionY": array.array("d", y),
+        "positionZ": array.array("d", z),
+    }
+
+
+def best_of(func, rows):
+    return min(timeit.repeat(lambda: func(rows), number=1, repeat=REPEAT))
+
+
+def main(counts):
+    print(
+        f"{'events':>8} {'legacy ms':>10} {'add() ms':>9} {'typed ms':>9}"
+        f" {'bulk ms':>8} {'speedup':>8}"
+    )
+    for count in counts:
+        rows = [[i, i + 1, float(i), float(i) * 0.5, 0.0] for i in range(count)]
+
+        columns = to_columns(rows)
+
+        expected = legacy_pack(rows)
+        if (
+            current_pack(rows) != expected
+            or typed_pack(rows) != expected
+            or bulk_pack(columns) != expected
+        ):
+            print(f"Output mismatch at {count} events!", file=sys.stderr)
+            sys.exit(1)
+
+        legacy = best_of(legacy_pack, rows)
+        current = best_of(current_pack, rows)
+        typed = best_of(typed_pack, rows)
+        bulk = best_of(bulk_pack, columns)
+        print(
+            f"{count:>8} {legacy * 1000:>10.2f} {current * 1000:>9.2f}"
+            f" {typed * 1000:>9.2f} {bulk * 1000:>8.2f} {legacy / bulk:>7.2f}x"
+        )
+
+    print()
+    print(
+        f"{'events':>8} {'bytes':>10} {'batched':>10} {'saved':>7}"
+        f" {'typed ms':>9} {'bulk ms':>8}"
+    )
+    for count in counts:
+        rows = [[i, i + 1, float(i), float(i) * 0.5, 0.0] for i in range(count)]
+        columns = to_columns(rows)
+
+        plain = typed_pack(rows)
+        batched = batched_typed_pack(rows)
+        expected = strip_timestamps(PackFormat.unpack(plain))
+        if (
+            batched_bulk_pack(columns) != batched
+            or strip_timestamps(PackFormat.unpack(batched)) != expected
+        ):
+            print(f"Batched output mismatch at {count} events!", file=sys.stderr)
+            sys.exit(1)
+
+        typed = best_of(batched_typed_pack, rows)
+        bulk = best_of(batched_bulk_pack, columns)
+        saved = 1 - len(batched) / len(plain)
+        print(
+            f"{count:>8} {len(plain):>10} {len(batched):>10} {saved:>6.1%}"
+            f" {typed * 1000:>9.2f} {bulk * 1000:>8.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [1_000, 10_000, 50_000])
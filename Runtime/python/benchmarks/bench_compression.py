@@ -0,0 +1,83 @@
+"""
+What compressing a frame costs and saves, per registered codec.
+
+Builds a command frame of N SPRITE_MOVE events (the bunnymark hot path),
+unbatched and batched, and compresses it with each codec in
+Compression.CODECS (zlib, plus LZ4 if the lz4 package is installed). Every
+frame is checked to decompress to the original.
+
+"break-even MB/s" is the bytes saved per second spent compressing: on a
+link slower than that, compressing gets the frame across sooner. This is
+the weighing FrameCompressor does with its `link_speed`; the last two
+columns say which way it comes out at its default (100 Mbit/s) and on a
+gigabit link.
+
+Usage: python benchmarks/bench_compression.py [count ...]
+"""
+
+import os
+import sys
+import timeit
+
+# --- Add the Phrost subdirectory to the Python path ---
+script_dir = os.path.dirname(os.path.abspath(__file__))
+phrost_dir = os.path.join(os.path.dirname(script_dir), "Phrost")
+
+if phrost_dir not in sys.path:
+    sys.path.insert(0, phrost_dir)
+# --- End of path setup ---
+
+from CommandPacker import CommandPacker
+from Compression import CODECS, LINK_SPEED
+
+GIGABIT = 125_000_000
+
+REPEAT = 5
+
+
+def sprite_frame(count, batch):
+    """One frame of bunnies moving across an 800x600 window."""
+    packer = CommandPacker(batch=batch)
+    for i in range(count):
+        x = (i * 37.1) % 800
+        y = (i * 13.7 + x * 0.25) % 600
+        packer.sprite_move(i, 0, x, y, 0.0)
+    return packer.finalize()
+
+
+def best_of(func):
+    return min(timeit.repeat(func, number=1, repeat=REPEAT))
+
+
+def main(counts):
+    print(
+        f"{'events':>8} {'batch':>6} {'codec':>6} {'raw KB':>8} {'packed KB':>10}"
+        f" {'ratio':>6} {'comp ms':>8} {'decomp ms':>10} {'break-even MB/s':>16}"
+        f" {'100 Mbit':>8} {'1 Gbit':>7}"
+    )
+    for count in counts:
+        for batch in (False, True):
+            frame = sprite_frame(count, batch)
+            for codec in CODECS.values():
+                packed = codec.compress(frame)
+                if codec.decompress(packed, len(frame)) != frame:
+                    print(f"{codec.name}: round trip mismatch!", file=sys.stderr)
+                    sys.exit(1)
+
+                compress = best_of(lambda: codec.compress(frame))
+                decompress = best_of(lambda: codec.decompress(packed, len(frame)))
+                saved = len(frame) - len(packed)
+                break_even = saved / compress
+                default = "on" if break_even > LINK_SPEED else "off"
+                gigabit = "on" if break_even > GIGABIT else "off"
+                print(
+                    f"{count:>8} {str(batch):>6} {codec.name:>6}"
+                    f" {len(frame) / 1024:>8.1f} {len(packed) / 1024:>10.1f}"
+                    f" {len(frame) / len(packed):>5.1f}x {compress * 1000:>8.2f}"
+                    f" {decompress * 1000:>10.2f} {break_even / 1e6:>16.0f}"
+                    f" {default:>8} {gigabit:>7}"
+                )
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [1_000, 10_000, 50_000])
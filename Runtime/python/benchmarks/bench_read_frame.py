@@ -0,0 +1,108 @@
+"""
+Micro-benchmark for reading inbound frames off the socket.
+
+A writer thread sends N frames of a given size over a socketpair; they are
+read back with the previous read_frame() (recv() per chunk into a fresh
+bytearray, copied out with bytes(), three reads per frame) and with the
+current one (recv_into() a reusable buffer, one read for length + dt, the
+events handed out as a memoryview). "peak KB" is the largest allocation
+seen by tracemalloc while reading, i.e. what each frame costs on the heap.
+
+Usage: python benchmarks/bench_read_frame.py [frame_kb ...]
+"""
+
+import os
+import socket
+import struct
+import sys
+import threading
+import time
+import tracemalloc
+
+# --- Add the Phrost subdirectory to the Python path ---
+script_dir = os.path.dirname(os.path.abspath(__file__))
+phrost_dir = os.path.join(os.path.dirname(script_dir), "Phrost")
+
+if phrost_dir not in sys.path:
+    sys.path.insert(0, phrost_dir)
+# --- End of path setup ---
+
+from ipc_client import IPCClient
+
+FRAMES = 200
+
+
+def legacy_read_all(pipe, length):
+    """The previous read_all(): recv() per chunk, extend, copy out."""
+    buffer = bytearray()
+    bytes_remaining = length
+    while bytes_remaining > 0:
+        data = pipe.recv(bytes_remaining)
+        if not data:
+            return None
+        buffer.extend(data)
+        bytes_remaining -= len(data)
+    return bytes(buffer)
+
+
+def legacy_read_frame(pipe):
+    """The previous read_frame(): length, dt and events read separately."""
+    total_length = struct.unpack("<L", legacy_read_all(pipe, 4))[0]
+    dt = struct.unpack("d", legacy_read_all(pipe, 8))[0]
+    return {"dt": dt, "events_blob": legacy_read_all(pipe, total_length - 8)}
+
+
+def send_frames(sock, payload, count):
+    frame = struct.pack("<Ld", 8 + len(payload), 1 / 60) + payload
+    for _ in range(count):
+        sock.sendall(frame)
+
+
+def measure(read, payload):
+    """Returns (seconds, tracemalloc peak) for reading FRAMES frames."""
+    reader, writer = socket.socketpair()
+    client = IPCClient(features=0)
+    client.pipe = reader
+    client.is_connected = True
+    sender = threading.Thread(target=send_frames, args=(writer, payload, FRAMES))
+    sender.start()
+
+    # The first frame sizes the receive buffer; time the steady state
+    read(client)
+    tracemalloc.start()
+    start = time.perf_counter()
+    for _ in range(FRAMES - 1):
+        frame = read(client)
+        if frame is None or len(frame["events_blob"]) != len(payload):
+            print("Short read!", file=sys.stderr)
+            sys.exit(1)
+        del frame
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    sender.join()
+    reader.close()
+    writer.close()
+    return elapsed, peak
+
+
+def main(sizes_kb):
+    print(
+        f"{'frame KB':>9} {'legacy ms':>10} {'legacy peak KB':>15}"
+        f" {'recv_into ms':>13} {'peak KB':>8}"
+    )
+    for size_kb in sizes_kb:
+        payload = os.urandom(size_kb * 1024)
+        legacy, legacy_peak = measure(
+            lambda client: legacy_read_frame(client.pipe), payload
+        )
+        current, peak = measure(IPCClient.read_frame, payload)
+        print(
+            f"{size_kb:>9} {legacy * 1000:>10.2f} {legacy_peak / 1024:>15.1f}"
+            f" {current * 1000:>13.2f} {peak / 1024:>8.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [4, 64, 1024])
@@ -0,0 +1,116 @@
+"""
+Round-trip time of large frames over the UNIX socket vs. shared memory.
+
+A StandInEngine thread sends a frame of events of the given size and reads
+back the client's commands, of the same size, like PhrostIPC each tick.
+The client is an IPCClient offering CAP_SHM or not:
+
+- socket: both frames go through the socket, i.e. copied into and out of
+          the kernel on each side
+- shm:    both frames are written into the mmap'd regions
+          (/dev/shm/<socket name>.events / .commands), the socket carrying
+          only the 12-20 byte notices
+
+The first frames' bytes are checked on arrival on both sides, so a wrong
+slot or length fails the run rather than showing up as a fast time; the
+timed frames after them are not (comparing megabytes costs more than
+moving them).
+
+Usage: python benchmarks/bench_shared_memory.py [frame_kb ...]
+"""
+
+import os
+import struct
+import sys
+import tempfile
+import threading
+import time
+
+# --- Add the Phrost subdirectory to the Python path ---
+script_dir = os.path.dirname(os.path.abspath(__file__))
+phrost_dir = os.path.join(os.path.dirname(script_dir), "Phrost")
+
+if phrost_dir not in sys.path:
+    sys.path.insert(0, phrost_dir)
+# --- End of path setup ---
+
+from Handshake import CAP_BATCH, CAP_SHM
+from ipc_client import IPCClient
+from StandInEngine import StandInEngine
+
+FRAMES = 100
+# Frames checked byte for byte (both slots, and one reused) before timing
+CHECKED = 3
+SOCKET_PATH = os.path.join(tempfile.gettempdir(), "PhrostBench.socket")
+
+
+def frame_blobs(size):
+    """
+    Two event blobs (count header + filler) for alternate frames, so data
+    left over from the previous frame doesn't pass the check.
+    """
+    return [struct.pack("<I4x", 0) + bytes([seed]) * size for seed in (1, 2)]
+
+
+def serve(engine, blobs, mismatches):
+    engine.accept()
+    for frame in range(CHECKED + FRAMES):
+        blob = blobs[frame % 2]
+        commands = engine.serve_frame(blob)
+        if commands is None:
+            break
+        if frame < CHECKED and bytes(commands) != blob:
+            mismatches.append(("commands", frame))
+
+
+def round_trips(features, size):
+    """Mean seconds per frame read + command write, after the checked frames."""
+    engine = StandInEngine(SOCKET_PATH, slot_size=2 * size + 64)
+    blobs = frame_blobs(size)
+    mismatches = []
+    thread = threading.Thread(target=serve, args=(engine, blobs, mismatches))
+    thread.start()
+
+    client = IPCClient(features=features, path=SOCKET_PATH)
+    client.connect()
+    for frame in range(CHECKED + FRAMES):
+        if frame == CHECKED:
+            start = time.perf_counter()
+        frame_data = client._pending_frame or client.read_frame()
+        client._pending_frame = None
+        if frame_data is None:
+            print("Link closed early!", file=sys.stderr)
+            sys.exit(1)
+        if frame < CHECKED and bytes(frame_data["events_blob"]) != blobs[frame % 2]:
+            mismatches.append(("events", frame))
+        # Echo the events as commands, straight from the buffer they came in
+        client.write_frame([frame_data["events_blob"]])
+    elapsed = (time.perf_counter() - start) / FRAMES
+
+    capabilities = client.capabilities
+    client.disconnect()
+    thread.join()
+    engine.close()
+    if mismatches:
+        print(f"Frames differ: {mismatches[:5]}", file=sys.stderr)
+        sys.exit(1)
+    if bool(capabilities & CAP_SHM) != bool(features & CAP_SHM):
+        print("Shared memory was not agreed!", file=sys.stderr)
+        sys.exit(1)
+    return elapsed
+
+
+def main(sizes_kb):
+    print(f"{'frame KB':>9} {'socket ms':>10} {'shm ms':>8} {'speedup':>8}")
+    for size_kb in sizes_kb:
+        size = size_kb * 1024
+        socket_time = round_trips(CAP_BATCH, size)
+        shm_time = round_trips(CAP_BATCH | CAP_SHM, size)
+        print(
+            f"{size_kb:>9} {socket_time * 1000:>10.3f} {shm_time * 1000:>8.3f}"
+            f" {socket_time / shm_time:>7.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [64, 1024, 4096, 16384])
@@ -0,0 +1,155 @@
+"""
+Round-trip latency of one frame between IPCClient and a stand-in engine.
+
+A thread plays the engine: it sends a frame of events of the given size,
+waits for the client's command frame, and repeats, like PhrostIPC does
+each tick. The client reads each frame and answers with a 1 KB command
+frame. Per frame size, the mean round trip is reported for:
+
+- unix:      a UNIX socketpair (the default local link)
+- tcp:       127.0.0.1 via IPCClient(host=...), i.e. TCP_NODELAY and
+             1 MB send/receive buffers from tune_tcp_socket()
+- tcp plain: the same TCP link with an untuned client socket (Nagle on,
+             OS default buffers)
+
+Loopback hides network latency, so this measures the per-frame cost of
+each link; over a real network the kernel-side differences grow with the
+round-trip time.
+
+Usage: python benchmarks/bench_tcp_roundtrip.py [frame_kb ...]
+"""
+
+import os
+import socket
+import struct
+import sys
+import threading
+import time
+
+# --- Add the Phrost subdirectory to the Python path ---
+script_dir = os.path.dirname(os.path.abspath(__file__))
+phrost_dir = os.path.join(os.path.dirname(script_dir), "Phrost")
+
+if phrost_dir not in sys.path:
+    sys.path.insert(0, phrost_dir)
+# --- End of path setup ---
+
+from ipc_client import IPCClient
+
+FRAMES = 300
+COMMANDS = b"\0" * 1024
+
+
+def read_exactly(sock, view):
+    filled = 0
+    while filled < len(view):
+        received = sock.recv_into(view[filled:])
+        if not received:
+            return False
+        filled += received
+    return True
+
+
+def stand_in_engine(sock, payload, frames):
+    """Sends `frames` event frames, reading the reply to each."""
+    frame = struct.pack("<Ld", 8 + len(payload), 1 / 60) + payload
+    length = bytearray(4)
+    reply = memoryview(bytearray(len(COMMANDS)))
+    try:
+        for _ in range(frames):
+            sock.sendall(frame)
+            if not read_exactly(sock, memoryview(length)):
+                return
+            if not read_exactly(sock, reply[: struct.unpack("<L", length)[0]]):
+                return
+    except ConnectionError:
+        # The client hung up early; round_trips() reports it
+        return
+    finally:
+        sock.close()
+
+
+def listen_tcp():
+    server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    server.bind(("127.0.0.1", 0))
+    server.listen(1)
+    return server
+
+
+def accept_engine(server, payload):
+    """Accepts one client and serves it from a thread, like PhrostIPC."""
+
+    def serve():
+        sock, _ = server.accept()
+        # The engine disables Nagle on its side of a TCP link
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        stand_in_engine(sock, payload, FRAMES)
+
+    thread = threading.Thread(target=serve)
+    thread.start()
+    return thread
+
+
+def round_trips(client):
+    """Mean seconds per frame read + command write, after a warm-up frame."""
+    client.read_frame()
+    client.write_frame(COMMANDS)
+    start = time.perf_counter()
+    for _ in range(FRAMES - 1):
+        if client.read_frame() is None or not client.write_frame(COMMANDS):
+            print("Link closed early!", file=sys.stderr)
+            sys.exit(1)
+    return (time.perf_counter() - start) / (FRAMES - 1)
+
+
+def unix_link(payload):
+    engine, sock = socket.socketpair()
+    thread = threading.Thread(target=stand_in_engine, args=(engine, payload, FRAMES))
+    thread.start()
+    client = IPCClient(features=0)
+    client.pipe = sock
+    client.is_connected = True
+    elapsed = round_trips(client)
+    thread.join()
+    sock.close()
+    return elapsed
+
+
+def tcp_link(payload):
+    server = listen_tcp()
+    thread = accept_engine(server, payload)
+    client = IPCClient(features=0, host="127.0.0.1", port=server.getsockname()[1])
+    client.connect()
+    elapsed = round_trips(client)
+    thread.join()
+    client.disconnect()
+    server.close()
+    return elapsed
+
+
+def plain_tcp_link(payload):
+    server = listen_tcp()
+    thread = accept_engine(server, payload)
+    client = IPCClient(features=0)
+    client.pipe = socket.create_connection(server.getsockname())
+    client.is_connected = True
+    elapsed = round_trips(client)
+    thread.join()
+    client.pipe.close()
+    server.close()
+    return elapsed
+
+
+def main(sizes_kb):
+    print(f"{'frame KB':>9} {'unix us':>9} {'tcp us':>9} {'tcp plain us':>13}")
+    for size_kb in sizes_kb:
+        payload = os.urandom(size_kb * 1024)
+        unix = unix_link(payload)
+        tcp = tcp_link(payload)
+        plain = plain_tcp_link(payload)
+        print(f"{size_kb:>9} {unix * 1e6:>9.1f} {tcp * 1e6:>9.1f} {plain * 1e6:>13.1f}")
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [1, 16, 256, 1024, 4096])
@@ -0,0 +1,153 @@
+"""
+Micro-benchmark for decoding inbound events.
+
+Decodes a frame of N PHYSICS_SYNC_TRANSFORM events (what the engine sends
+back for every body each frame) with the previous dict-per-event unpack(),
+the current unpack() (a direct loop over a memoryview), and
+unpack_views(), both reading a single field and reading every field with
+astuple(). "records ms" is unpack_records(), which decodes each event into
+its generated __slots__ class. "skip ms" is unpack_views() asked only for INPUT_MOUSEMOTION,
+so every sync event is stepped over undecoded. With NumPy installed,
+unpack_columnar() (one structured array per event type) is timed too.
+
+Usage: python benchmarks/bench_unpack.py [count ...]
+"""
+
+import os
+import struct
+import sys
+import timeit
+
+# --- Add the Phrost subdirectory to the Python path ---
+script_dir = os.path.dirname(os.path.abspath(__file__))
+phrost_dir = os.path.join(os.path.dirname(script_dir), "Phrost")
+
+if phrost_dir not in sys.path:
+    sys.path.insert(0, phrost_dir)
+# --- End of path setup ---
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from CommandPacker import CommandPacker
+from Events import Events
+from PackFormat import PackFormat
+
+REPEAT = 5
+
+
+def legacy_unpack(events_blob):
+    """
+    The previous unpack(), trimmed to the fixed-size path: a dict per
+    event, an Events() lookup to validate the type and a try/except
+    around each stage.
+    """
+    events = []
+    blob_length = len(events_blob)
+    event_count = PackFormat._COUNT_STRUCT.unpack_from(events_blob, 0)[0]
+    offset = PackFormat._COUNT_STRUCT.size
+    header_size = PackFormat._HEADER_STRUCT.size
+    for i in range(event_count):
+        if offset + header_size > blob_length:
+            break
+        try:
+            event_type, timestamp = PackFormat._HEADER_STRUCT.unpack_from(
+                events_blob, offset
+            )
+            offset += header_size
+            event = {"type": event_type, "timestamp": timestamp}
+        except struct.error:
+            break
+        try:
+            event_enum_val = Events(event_type)
+        except ValueError:
+            event_enum_val = None
+        try:
+            if event_enum_val is None:
+                break
+            payload_struct = PackFormat._PAYLOAD_STRUCT_MAP[event_type]
+            if offset + payload_struct.size > blob_length:
+                raise EOFError(event_enum_val.name)
+            unpacked = payload_struct.unpack_from(events_blob, offset)
+            event.update(zip(PackFormat._EVENT_KEY_MAP[event_type], unpacked))
+            events.append(event)
+            offset += payload_struct.size
+        except (EOFError, struct.error):
+            break
+        offset = (offset + 7) & ~7
+    return events
+
+
+def views_one_field(events_blob):
+    return [view.positionX for view in PackFormat.unpack_views(events_blob)]
+
+
+def views_all_fields(events_blob):
+    return [view.astuple() for view in PackFormat.unpack_views(events_blob)]
+
+
+def records(events_blob):
+    return list(PackFormat.unpack_records(events_blob))
+
+
+def views_skipping(events_blob):
+    return list(PackFormat.unpack_views(events_blob, {Events.INPUT_MOUSEMOTION}))
+
+
+def build_frame(count):
+    packer = CommandPacker()
+    for i in range(count):
+        packer.physics_sync_transform(
+            i, i + 1, float(i), float(i) * 0.5, 0.25, 1.0, -1.0, 0.0, i & 1
+        )
+    return bytes(packer.finalize())
+
+
+def best_of(func, blob):
+    return min(timeit.repeat(lambda: func(blob), number=1, repeat=REPEAT))
+
+
+def main(counts):
+    print(
+        f"{'events':>8} {'legacy ms':>10} {'dicts ms':>9} {'1 field ms':>11}"
+        f" {'all ms':>7} {'records ms':>11} {'skip ms':>8} {'columnar ms':>12}"
+        f" {'speedup':>8}"
+    )
+    for count in counts:
+        blob = build_frame(count)
+
+        if PackFormat.unpack(blob) != legacy_unpack(blob):
+            print(f"Output mismatch at {count} events!", file=sys.stderr)
+            sys.exit(1)
+        if [record.to_dict() for record in records(blob)] != legacy_unpack(blob):
+            print(f"Record mismatch at {count} events!", file=sys.stderr)
+            sys.exit(1)
+
+        legacy = best_of(legacy_unpack, blob)
+        dicts = best_of(PackFormat.unpack, blob)
+        one = best_of(views_one_field, blob)
+        every = best_of(views_all_fields, blob)
+        decoded = best_of(records, blob)
+        skip = best_of(views_skipping, blob)
+        if np is not None:
+            columns = PackFormat.unpack_columnar(blob)[Events.PHYSICS_SYNC_TRANSFORM]
+            if columns["positionX"].tolist() != views_one_field(blob):
+                print(f"Columnar mismatch at {count} events!", file=sys.stderr)
+                sys.exit(1)
+            fastest = best_of(PackFormat.unpack_columnar, blob)
+            columnar = f"{fastest * 1000:>12.2f}"
+        else:
+            columnar = f"{'n/a':>12}"
+            fastest = one
+        print(
+            f"{count:>8} {legacy * 1000:>10.2f} {dicts * 1000:>9.2f}"
+            f" {one * 1000:>11.2f} {every * 1000:>7.2f} {decoded * 1000:>11.2f}"
+            f" {skip * 1000:>8.2f} {columnar}"
+            f" {legacy / fastest:>7.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [1_000, 10_000, 50_000])
@@ -17,7 +17,7 @@ if phrost_dir not in sys.path:
 # --- End of fix ---
 
 from game_logic import Phrost_Sleep, Phrost_Update, Phrost_Wake
-from ipc_client import IPCClient
+from ipc_client import DEFAULT_TCP_PORT, IPCClient
 
 # --- Configuration ---
 # (Error reporting is on by default in Python)
@@ -26,7 +26,13 @@ from ipc_client import IPCClient
 # --- Application Entry Point ---
 gc.disable()
 
-client = IPCClient()
+# Set PHROST_HOST (and PHROST_PORT, default 8080) to reach an engine started
+# with `--mode sockets`, e.g. on another machine; unset, the local
+# socket/pipe is used.
+client = IPCClient(
+    host=os.environ.get("PHROST_HOST"),
+    port=int(os.environ.get("PHROST_PORT", DEFAULT_TCP_PORT)),
+)
 SAVE_FILE = os.path.join(os.path.dirname(__file__), "save.data")
 
 
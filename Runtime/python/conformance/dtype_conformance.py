@@ -0,0 +1,112 @@
+"""
+Conformance check between the generated NumPy dtypes (Phrost/Dtypes.py)
+and the struct formats the packer and unpacker use.
+
+For every event in structs.json:
+
+- DTYPES[id].itemsize must equal the size in its PackFormats tuple, and
+  EVENT_DTYPES[id].itemsize the size of its _EVENT_STRUCT_MAP struct.
+- The field names must be the keys in _EVENT_KEY_MAP (plus "type" and
+  "timestamp" for EVENT_DTYPES).
+- An event packed with the struct and read back through the dtype must give
+  the same values, which checks every offset and type.
+
+Requires NumPy.
+
+Usage: python conformance/dtype_conformance.py
+"""
+
+import os
+import re
+import sys
+
+# --- Add the Phrost subdirectory to the Python path ---
+script_dir = os.path.dirname(os.path.abspath(__file__))
+phrost_dir = os.path.join(os.path.dirname(script_dir), "Phrost")
+
+if phrost_dir not in sys.path:
+    sys.path.insert(0, phrost_dir)
+# --- End of path setup ---
+
+import numpy as np
+
+from Dtypes import DTYPES, EVENT_DTYPES
+from Events import Events
+from PackFormat import PackFormat
+
+TIMESTAMP = 0x0102030405060708
+
+
+def sample_values(struct_format):
+    """One distinct, exactly representable value per field of a format."""
+    values = []
+    for count, code in re.findall(r"(\d*)([a-zA-Z?])", struct_format[1:]):
+        if code == "x":
+            continue
+        index = len(values) + 1
+        if code == "s":
+            values.append(b"field%d" % index)
+        elif code in "fd":
+            values.append(index + 0.5)
+        else:
+            values.append(index)
+    return values
+
+
+def check_event(event):
+    """Returns a list of problems with the dtypes of one event."""
+    problems = []
+    event_type = event.value
+    keys = PackFormat._EVENT_KEY_MAP[event_type]
+    payload_struct = PackFormat._PAYLOAD_STRUCT_MAP[event_type]
+    event_struct = PackFormat._EVENT_STRUCT_MAP[event_type]
+    payload_dtype = DTYPES[event_type]
+    event_dtype = EVENT_DTYPES[event_type]
+
+    size = PackFormat._EVENT_FORMAT_MAP[event_type][1]
+    if payload_dtype.itemsize != size:
+        problems.append(f"DTYPES itemsize {payload_dtype.itemsize}, expected {size}")
+    if event_dtype.itemsize != event_struct.size:
+        problems.append(
+            f"EVENT_DTYPES itemsize {event_dtype.itemsize},"
+            f" expected {event_struct.size}"
+        )
+    if list(payload_dtype.names or ()) != keys:
+        problems.append(f"DTYPES fields {payload_dtype.names}, expected {keys}")
+    if list(event_dtype.names) != ["type", "timestamp"] + keys:
+        problems.append(f"EVENT_DTYPES fields {event_dtype.names}")
+    if problems:
+        return problems
+
+    values = sample_values(payload_struct.format)
+    if keys:
+        record = np.frombuffer(payload_struct.pack(*values), payload_dtype)[0]
+        if list(record.tolist()) != values:
+            problems.append(f"DTYPES reads {record.tolist()}, expected {values}")
+
+    values = [event_type, TIMESTAMP] + values
+    record = np.frombuffer(event_struct.pack(*values), event_dtype)[0]
+    if list(record.tolist()) != values:
+        problems.append(f"EVENT_DTYPES reads {record.tolist()}, expected {values}")
+    return problems
+
+
+def main() -> int:
+    failed = False
+    for event in Events:
+        if event.value not in DTYPES or event.value not in EVENT_DTYPES:
+            print(f"{event.name}: no generated dtype", file=sys.stderr)
+            failed = True
+            continue
+        for problem in check_event(event):
+            print(f"{event.name}: {problem}", file=sys.stderr)
+            failed = True
+
+    if failed:
+        return 1
+    print(f"OK: {len(DTYPES)} events, dtypes match the struct formats")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,84 @@
+"""
+Conformance check between the runtime modules in Phrost/ and the code
+Engine/Data/generate.php writes to Engine/Data/out/python.
+
+The runtime keeps black-formatted copies of the generated classes, one
+module per class family. Every top-level class, function or assignment in
+those modules that the generated output also defines must be the same code,
+compared as ASTs so formatting does not matter. A copy that was edited by
+hand, or not refreshed after the adapter changed, is reported by name.
+
+Usage: python conformance/generated_conformance.py
+"""
+
+import ast
+import os
+import sys
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+runtime_dir = os.path.dirname(script_dir)
+phrost_dir = os.path.join(runtime_dir, "Phrost")
+out_dir = os.path.join(
+    os.path.dirname(os.path.dirname(runtime_dir)), "Engine", "Data", "out", "python"
+)
+
+# Runtime module -> generated file it is copied from.
+COPIES = {
+    "CommandPacker.py": "phrost.py",
+    "Events.py": "phrost.py",
+    "PackFormat.py": "phrost.py",
+    "PackFormats.py": "phrost.py",
+    "Dtypes.py": "phrost_dtypes.py",
+}
+
+
+def definitions(path):
+    """Maps each top-level class, function and assigned name to its AST dump."""
+    with open(path, encoding="utf-8") as f:
+        tree = ast.parse(f.read(), path)
+    found = {}
+    for node in tree.body:
+        if isinstance(node, (ast.ClassDef, ast.FunctionDef)):
+            found[node.name] = ast.dump(node)
+        elif isinstance(node, ast.AnnAssign) and isinstance(node.target, ast.Name):
+            found[node.target.id] = ast.dump(node)
+        elif isinstance(node, ast.Assign):
+            for target in node.targets:
+                if isinstance(target, ast.Name):
+                    found[target.id] = ast.dump(node)
+    return found
+
+
+def check_copy(module, generated):
+    """Returns (problems, number of definitions compared) for one module."""
+    runtime = definitions(os.path.join(phrost_dir, module))
+    source = definitions(os.path.join(out_dir, generated))
+    shared = [name for name in runtime if name in source]
+    problems = [
+        f"{module}: {name} differs from {generated}"
+        for name in shared
+        if runtime[name] != source[name]
+    ]
+    if not shared:
+        problems.append(f"{module}: defines nothing from {generated}")
+    return problems, len(shared)
+
+
+def main() -> int:
+    failed = False
+    compared = 0
+    for module, generated in COPIES.items():
+        problems, count = check_copy(module, generated)
+        compared += count
+        for problem in problems:
+            print(problem, file=sys.stderr)
+            failed = True
+
+    if failed:
+        return 1
+    print(f"OK: {compared} definitions match the generated output")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
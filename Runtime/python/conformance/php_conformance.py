@@ -0,0 +1,207 @@
+"""
+Byte-for-byte conformance check between the Python CommandPacker and the PHP
+runtime's packer (Runtime/php/libs/Phrost/CommandPacker.php).
+
+Every event the PHP runtime defines is packed by both sides and the
+finalized streams are compared: the fixed-size events once, the string-tail
+events with tails of several lengths. The Python side is checked through
+add(), the typed methods and add_many(); the reference is the output of the
+PHP CommandPacker itself, so a `php` binary must be on the PATH.
+
+GEOM_ADD_PACKED is sent with a count of 0: neither add() nor the PHP packer
+writes its geometry tail, only the typed geom_add_packed() does.
+
+Events added to structs.json after the PHP runtime was last synced (the f32
+and handle variants, EVENT_BATCH) have no PHP packer to compare against and
+are listed, not checked.
+
+Usage: python conformance/php_conformance.py
+"""
+
+import base64
+import os
+import re
+import shutil
+import subprocess
+import sys
+
+# --- Add the Phrost subdirectory to the Python path ---
+script_dir = os.path.dirname(os.path.abspath(__file__))
+phrost_dir = os.path.join(os.path.dirname(script_dir), "Phrost")
+
+if phrost_dir not in sys.path:
+    sys.path.insert(0, phrost_dir)
+# --- End of path setup ---
+
+from CommandPacker import CommandPacker
+from Events import Events
+from PackFormat import PackFormat
+
+PHP_LIBS = os.path.realpath(
+    os.path.join(script_dir, "..", "..", "php", "libs", "Phrost")
+)
+
+# Tails of 0, 3, 8 and 24 bytes: no padding, padding, and exact multiples
+STRINGS = (b"", b"abc", b"12345678", b"/assets/wabbit_alpha.png")
+
+
+def dynamic_cases():
+    """(event, add() data, typed method args) for the events with string tails."""
+    cases = []
+    for s in STRINGS:
+        cases.append(
+            (Events.SPRITE_TEXTURE_LOAD, [7, 8, len(s), s], [7, 8, s]),
+        )
+        cases.append((Events.AUDIO_LOAD, [len(s), s], [s]))
+        cases.append((Events.PLUGIN_LOAD, [3, len(s), s], [3, s]))
+        cases.append((Events.TEXT_SET_STRING, [7, 8, len(s), s], [7, 8, s]))
+        font = b"Roboto-Regular.ttf"
+        fixed = [7, 8, 1.5, 2.5, 3.5, 10, 20, 30, 40, 24.0]
+        cases.append(
+            (
+                Events.TEXT_ADD,
+                fixed + [len(font), len(s), font, s],
+                fixed + [font, s],
+            )
+        )
+    return cases
+
+
+def load_php_formats():
+    """Reads {event id: descriptive PHP format} from the PHP runtime."""
+    with open(os.path.join(PHP_LIBS, "Events.php")) as f:
+        consts = dict(re.findall(r'const (\w+) = "([^"]*)";', f.read()))
+    with open(os.path.join(PHP_LIBS, "PackFormat.php")) as f:
+        entries = re.findall(r"Events::(\w+)->value\s*=>\s*\w+::(\w+)", f.read())
+    return {Events[event].value: consts[const] for event, const in entries}
+
+
+def fixed_cases(php_formats):
+    """
+    One (event, add() data, typed method args) case per fixed-size event,
+    with values derived from its format.
+    """
+    cases = []
+    for event in Events:
+        if event in CommandPacker._DYNAMIC_EVENTS:
+            continue
+        if event.value not in php_formats:
+            continue
+        event_struct = PackFormat._PAYLOAD_STRUCT_MAP.get(event)
+        if event_struct is None:
+            continue
+        data = []
+        for i, (count, code) in enumerate(
+            re.findall(r"(\d*)([a-zA-Z?])", event_struct.format[1:])
+        ):
+            if code == "x":
+                continue
+            if code == "s":
+                data.append(b"Phrost")
+            elif code in "fd":
+                data.append((i + 1) * 1.25)
+            else:
+                data.append(i + 1)
+        if event == Events.GEOM_ADD_PACKED:
+            data[-1] = 0  # count: no geometry follows
+            cases.append((event, data, data + [b""]))
+        else:
+            cases.append((event, data, data))
+    return cases
+
+
+def php_literal(value) -> str:
+    if isinstance(value, bytes):
+        return f'base64_decode("{base64.b64encode(value).decode()}")'
+    return repr(value)
+
+
+def php_stream(php, cases) -> bytes:
+    """Runs the real PHP CommandPacker over the cases."""
+    lines = ["<?php"]
+    for name in ("Events.php", "PackFormat.php", "CommandPacker.php"):
+        lines.append(f"require {php_literal(os.path.join(PHP_LIBS, name).encode())};")
+    lines.append("$packer = new \\Phrost\\CommandPacker();")
+    for event, data, _ in cases:
+        args = ", ".join(php_literal(value) for value in data)
+        lines.append(f"$packer->add(\\Phrost\\Events::from({event.value}), [{args}]);")
+    lines.append("echo bin2hex($packer->finalize());")
+    result = subprocess.run(
+        [php], input="\n".join(lines), capture_output=True, text=True, check=True
+    )
+    return bytes.fromhex(result.stdout.strip())
+
+
+def python_streams(cases):
+    """The same cases packed through add(), the typed methods and add_many()."""
+    via_add = CommandPacker()
+    via_typed = CommandPacker()
+    via_many = CommandPacker()
+    for event, data, typed_args in cases:
+        via_add.add(event, data)
+        getattr(via_typed, event.name.lower())(*typed_args)
+        if event in CommandPacker._DYNAMIC_EVENTS:
+            via_many.add(event, data)
+        else:
+            keys = PackFormat._EVENT_KEY_MAP[event]
+            via_many.add_many(event, **{key: [value] for key, value in zip(keys, data)})
+    return {
+        "add()": via_add.finalize(),
+        "typed": via_typed.finalize(),
+        "add_many()": via_many.finalize(),
+    }
+
+
+def first_difference(a: bytes, b: bytes) -> int:
+    for i, (x, y) in enumerate(zip(a, b)):
+        if x != y:
+            return i
+    return min(len(a), len(b))
+
+
+def main() -> int:
+    php = shutil.which("php")
+    if php is None:
+        print("php not found on the PATH", file=sys.stderr)
+        return 1
+
+    php_formats = load_php_formats()
+    cases = fixed_cases(php_formats) + dynamic_cases()
+    source = "PHP CommandPacker"
+    try:
+        expected = php_stream(php, cases)
+    except subprocess.CalledProcessError as e:
+        print(f"php failed:\n{e.stdout}{e.stderr}", file=sys.stderr)
+        return 1
+
+    failed = False
+    for name, actual in python_streams(cases).items():
+        if actual != expected:
+            offset = first_difference(actual, expected)
+            print(
+                f"{name}: differs from the {source} at byte {offset}"
+                f" ({len(actual)} vs {len(expected)} bytes)",
+                file=sys.stderr,
+            )
+            failed = True
+
+    events = PackFormat.unpack(expected)
+    if len(events) != len(cases):
+        print(
+            f"unpack: got {len(events)} of {len(cases)} events back",
+            file=sys.stderr,
+        )
+        failed = True
+
+    python_only = [event.name for event in Events if event.value not in php_formats]
+    if python_only:
+        print(f"Not in the PHP runtime: {', '.join(python_only)}")
+
+    if failed:
+        return 1
+    print(f"OK: {len(cases)} events, {len(expected)} bytes match the {source}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
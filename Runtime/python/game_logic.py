@@ -3,12 +3,13 @@ Python translation of the Phrost game logic.
 This file contains *only* your game's state and logic.
 """
 
+import array
 import os
 import pickle  # The Python equivalent of serialize/unserialize
 import platform
 import random
 import sys
-from typing import Union
+from typing import List, Optional, Union
 
 # --- FIX: Add script's directory and subdirectories to the Python path ---
 script_dir = os.path.dirname(os.path.abspath(__file__))
@@ -26,14 +27,17 @@ if phrost_dir not in sys.path:
 # --- Includes & Imports ---
 # Import all the stub classes and functions
 from Audio import Audio
+from ChannelPacker import ChannelPacker
+from Channels import Channels
 from Keycode import Keycode
+from PackerPool import PackerPool
 from Sprite import Sprite
+from StringCache import encode_padded
 from Text import Text
 from Window import Window
 
 # Import from the main Phrost.py module
 from Phrost import (
-    CommandPacker,
     Events,
     Id_Generate,
     PackFormat,
@@ -88,13 +92,29 @@ WORLD = {
 }
 
 # Pack initial window setup
-initial_packer = CommandPacker()
+initial_packer = ChannelPacker()
 WORLD["window"].set_resizable(True)
 WORLD["window"].pack_dirty_events(initial_packer)
 WORLD["__initial_packer"] = initial_packer
 
 # --- End Global State ---
 
+# Inbound event types Phrost_Update() acts on; everything else is skipped
+# while decoding
+HANDLED_EVENTS = frozenset(
+    (
+        Events.INPUT_MOUSEMOTION,
+        Events.INPUT_MOUSEDOWN,
+        Events.WINDOW_RESIZE,
+        Events.INPUT_KEYDOWN,
+        Events.SPRITE_TEXTURE_SET,
+        Events.SPRITE_ADD,
+        Events.SPRITE_MOVE,
+        Events.SPRITE_SPEED,
+        Events.AUDIO_LOADED,
+    )
+)
+
 
 def Phrost_Sleep() -> bytes:
     """
@@ -115,10 +135,13 @@ def Phrost_Wake(data: bytes):
 
 
 def Phrost_Update(
-    elapsed: int, dt: float, events_blob: bytes = b""
-) -> Union[bytes, bool]:
+    elapsed: int, dt: float, events_blob: bytes = b"", pool: Optional[PackerPool] = None
+) -> Union[bytes, List[memoryview], bool]:
     """
     This is the main game loop function.
+
+    `pool` (passed by IPCClient.run) hands out packers that keep their
+    buffers between frames.
     """
     global WORLD
 
@@ -141,13 +164,18 @@ def Phrost_Update(
         WORLD["smoothed_fps"] = 1.0 / average_dt
 
     max_sprite = 50000
-    events = PackFormat.unpack(events_blob)
+    # Lazy views: fields are only decoded when the loop below reads them,
+    # and events it has no branch for are skipped without being decoded
+    events = PackFormat.unpack_views(events_blob, HANDLED_EVENTS)
 
     # --- Packer Setup ---
     if "__initial_packer" in WORLD:
         packer = WORLD.pop("__initial_packer")  # Use it only once
+    elif pool is not None:
+        packer = pool.channel_packer(chunk_size=WORLD["chunkSize"])
     else:
-        packer = CommandPacker(WORLD["chunkSize"])
+        packer = ChannelPacker(WORLD["chunkSize"])
+    renderer = packer.channel(Channels.RENDERER)
 
     # --- Initial Asset Loading ---
     if not WORLD["assetsLoaded"]:
@@ -209,9 +237,7 @@ def Phrost_Update(
                 WORLD["eventStacking"] = not WORLD["eventStacking"]
                 stack_str = "ON" if WORLD["eventStacking"] else "OFF"
                 print(f"Turning PLUGIN_EVENT_STACKING {stack_str}")
-                packer.add(
-                    Events.PLUGIN_EVENT_STACKING, [1 if WORLD["eventStacking"] else 0]
-                )
+                renderer.plugin_event_stacking(1 if WORLD["eventStacking"] else 0)
 
             # --- Audio Controls ---
             elif (
@@ -244,8 +270,10 @@ def Phrost_Update(
                             BASE_DIR, "..", "Plugins", "zig-plugin", "zig-out", lib_ext
                         )
                     )
-                    path_bytes = path.encode("utf-8")
-                    packer.add(Events.PLUGIN_LOAD, [len(path_bytes), path_bytes])
+                    path_bytes, path_length = encode_padded(path)
+                    renderer.plugin_load(
+                        Channels.RENDERER, path_bytes, pathLength=path_length
+                    )
                     WORLD["pluginLoaded"] = True
 
             elif keycode == Keycode.R:  # 'R' for Rust
@@ -277,13 +305,15 @@ def Phrost_Update(
                         f"Error: Could not find Rust plugin at {path}", file=sys.stderr
                     )
                 else:
-                    path_bytes = path.encode("utf-8")
-                    packer.add(Events.PLUGIN_LOAD, [len(path_bytes), path_bytes])
+                    path_bytes, path_length = encode_padded(path)
+                    renderer.plugin_load(
+                        Channels.RENDERER, path_bytes, pathLength=path_length
+                    )
                     WORLD["pluginLoaded"] = True
                     WORLD["pluginOn"] = True
 
             elif keycode == Keycode.M:
-                packer.add(Events.PLUGIN_UNLOAD, [1])
+                renderer.plugin_unload(1)
                 WORLD["pluginOn"] = False
 
             # --- Debug Keys ---
@@ -350,6 +380,19 @@ def Phrost_Update(
         hotspot_offset_x = 16
         hotspot_offset_y = 16
 
+        # SPRITE_MOVE (or SPRITE_MOVE_F32) columns, packed in one add_many()
+        # call after the loop
+        move_id1 = array.array("q")
+        move_id2 = array.array("q")
+        move_x = array.array("d")
+        move_y = array.array("d")
+        move_z = array.array("d")
+        # SPRITE_MOVE_HANDLE columns, for sprites bound to a handle
+        handle_move = array.array("I")
+        handle_x = array.array("d")
+        handle_y = array.array("d")
+        handle_z = array.array("d")
+
         for sprite in WORLD["sprites"].values():
             sprite.update(dt)  # Internal position update
             pos = sprite.get_position()
@@ -385,10 +428,38 @@ def Phrost_Update(
                     new_pos_x, new_pos_y, pos["z"], notify_engine=False
                 )  # No need to re-pack
 
-            # Manually set dirty=True to pack updates
-            sprite.is_dirty = True
+            # Queue the move for the bulk pack, then pack anything else dirty
+            if sprite.take_position_change():
+                handle = sprite.bind_handle(packer)
+                if handle is not None:
+                    handle_move.append(handle)
+                    handle_x.append(sprite.position["x"])
+                    handle_y.append(sprite.position["y"])
+                    handle_z.append(sprite.position["z"])
+                else:
+                    move_id1.append(sprite.id0)
+                    move_id2.append(sprite.id1)
+                    move_x.append(sprite.position["x"])
+                    move_y.append(sprite.position["y"])
+                    move_z.append(sprite.position["z"])
             sprite.pack_dirty_events(packer)
 
+        renderer.add_many(
+            Events.SPRITE_MOVE_F32 if packer.f32 else Events.SPRITE_MOVE,
+            id1=move_id1,
+            id2=move_id2,
+            positionX=move_x,
+            positionY=move_y,
+            positionZ=move_z,
+        )
+        renderer.add_many(
+            Events.SPRITE_MOVE_HANDLE,
+            handle=handle_move,
+            positionX=handle_x,
+            positionY=handle_y,
+            positionZ=handle_z,
+        )
+
     # --- Add Sprites Loop ---
     if not WORLD["pluginOn"]:
         if add_sprites and WORLD["spritesCount"] < max_sprite:
@@ -419,4 +490,5 @@ def Phrost_Update(
             WORLD["spritesCount"] += 1000
 
     # --- Finalize & Return ---
-    return packer.finalize()
+    # Views over the packer's buffer; IPCClient sends them without a copy
+    return packer.finalize_views()
@@ -0,0 +1,14 @@
+"""Puts the Phrost modules and the conformance scripts on the import path."""
+
+import os
+import sys
+
+tests_dir = os.path.dirname(os.path.abspath(__file__))
+runtime_dir = os.path.dirname(tests_dir)
+
+for path in (
+    os.path.join(runtime_dir, "Phrost"),
+    os.path.join(runtime_dir, "conformance"),
+):
+    if path not in sys.path:
+        sys.path.insert(0, path)
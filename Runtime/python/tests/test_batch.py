@@ -0,0 +1,59 @@
+"""Batched streams unpack to the same events as unbatched ones."""
+
+from CommandPacker import CommandPacker
+from Events import Events
+from PackFormat import PackFormat
+
+
+def pack_frame(packer):
+    """A frame mixing runs, lone events and string tails."""
+    for i in range(3):
+        packer.sprite_move(i, 0, i + 0.5, 2.0, 3.0)
+    packer.sprite_texture_load(1, 0, b"/assets/wabbit_alpha.png")
+    packer.sprite_move(9, 0, 1.0, 2.0, 3.0)
+    packer.add_many(
+        Events.SPRITE_MOVE,
+        id1=[10, 11],
+        id2=[0, 0],
+        positionX=[1.0, 2.0],
+        positionY=[3.0, 4.0],
+        positionZ=[5.0, 6.0],
+    )
+    packer.sprite_scale(1, 0, 2.0, 2.0, 1.0)
+    packer.add(Events.SPRITE_SCALE, [2, 0, 3.0, 3.0, 1.0])
+    packer.window_title(b"Phrost".ljust(256, b"\0"))
+    return packer.finalize()
+
+
+def test_batch_round_trip():
+    plain = pack_frame(CommandPacker())
+    packer = CommandPacker(batch=True)
+    batched = pack_frame(packer)
+
+    assert len(batched) < len(plain)
+    assert PackFormat.unpack(batched) == PackFormat.unpack(plain)
+    assert list(PackFormat.iter_unpack(batched)) == list(PackFormat.iter_unpack(plain))
+    # Three moves become one batch, then a lone move grows into a batch
+    # of three with add_many(), and the two scales share one header
+    assert packer.get_batched_count() == 2 + 2 + 1
+    assert packer.get_total_event_count() == 10
+
+
+def test_batch_header_layout():
+    packer = CommandPacker(batch=True)
+    packer.sprite_move(1, 0, 1.0, 2.0, 3.0)
+    packer.sprite_move(2, 0, 4.0, 5.0, 6.0)
+    stream = packer.finalize()
+
+    (count,) = PackFormat._COUNT_STRUCT.unpack_from(stream, 0)
+    header = CommandPacker._BATCH_HEADER_STRUCT.unpack_from(
+        stream, PackFormat._COUNT_STRUCT.size
+    )
+    payload = PackFormat._BATCH_PAYLOAD_STRUCT_MAP[Events.SPRITE_MOVE]
+    assert count == 1
+    assert header == (Events.EVENT_BATCH, 0, Events.SPRITE_MOVE, 2)
+    assert len(stream) == (
+        PackFormat._COUNT_STRUCT.size
+        + CommandPacker._BATCH_HEADER_STRUCT.size
+        + 2 * payload.size
+    )
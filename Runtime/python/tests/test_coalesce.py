@@ -0,0 +1,83 @@
+"""Coalescing merges repeated "set" events without reordering barriers."""
+
+import pytest
+
+from CommandPacker import CommandPacker
+from Events import Events
+from PackFormat import PackFormat
+
+MODES = [{"coalesce": True}, {"coalesce": True, "batch": True}]
+
+
+def unpacked(packer):
+    return [
+        (Events(event["type"]).name, event.get("id1", event.get("handle")))
+        for event in PackFormat.unpack(packer.finalize())
+    ]
+
+
+@pytest.mark.parametrize("mode", MODES, ids=["coalesce", "coalesce+batch"])
+def test_last_write_wins(mode):
+    packer = CommandPacker(**mode)
+    packer.sprite_move(1, 0, 1.0, 2.0, 3.0)
+    packer.sprite_move(2, 0, 1.0, 2.0, 3.0)
+    packer.sprite_move(1, 0, 4.0, 5.0, 6.0)
+
+    events = PackFormat.unpack(packer.finalize())
+    assert [(e["id1"], e["positionX"]) for e in events] == [(1, 4.0), (2, 1.0)]
+    assert packer.get_coalesced_count() == 1
+
+
+@pytest.mark.parametrize("mode", MODES, ids=["coalesce", "coalesce+batch"])
+def test_entity_event_is_a_barrier(mode):
+    packer = CommandPacker(**mode)
+    packer.sprite_move(1, 0, 1.0, 2.0, 3.0)
+    packer.sprite_remove(1, 0)
+    packer.sprite_move(1, 0, 4.0, 5.0, 6.0)
+
+    assert unpacked(packer) == [
+        ("SPRITE_MOVE", 1),
+        ("SPRITE_REMOVE", 1),
+        ("SPRITE_MOVE", 1),
+    ]
+
+
+@pytest.mark.parametrize("mode", MODES, ids=["coalesce", "coalesce+batch"])
+@pytest.mark.parametrize("path", ["typed", "add", "add_many"])
+def test_handle_event_is_a_barrier(mode, path):
+    packer = CommandPacker(**mode)
+    packer.sprite_bind_handle(1, 0, 7)
+    packer.sprite_move(1, 0, 1.0, 2.0, 3.0)
+    if path == "typed":
+        packer.sprite_move_handle(7, 9.0, 9.0, 9.0)
+    elif path == "add":
+        packer.add(Events.SPRITE_MOVE_HANDLE, [7, 9.0, 9.0, 9.0])
+    else:
+        packer.add_many(
+            Events.SPRITE_MOVE_HANDLE,
+            handle=[7],
+            positionX=[9.0],
+            positionY=[9.0],
+            positionZ=[9.0],
+        )
+    packer.sprite_move(1, 0, 4.0, 5.0, 6.0)
+
+    # The last id-based move must stay behind the handle move, not be
+    # merged into the first one
+    assert unpacked(packer) == [
+        ("SPRITE_BIND_HANDLE", 1),
+        ("SPRITE_MOVE", 1),
+        ("SPRITE_MOVE_HANDLE", 7),
+        ("SPRITE_MOVE", 1),
+    ]
+    assert packer.get_coalesced_count() == 0
+
+
+def test_reset_forgets_slots():
+    packer = CommandPacker(coalesce=True)
+    packer.sprite_move(1, 0, 1.0, 2.0, 3.0)
+    packer.reset()
+    packer.sprite_move(1, 0, 4.0, 5.0, 6.0)
+
+    events = PackFormat.unpack(packer.finalize())
+    assert [(e["id1"], e["positionX"]) for e in events] == [(1, 4.0)]
@@ -0,0 +1,141 @@
+"""Compressed frames round-trip with each codec, and bad lengths are refused."""
+
+import asyncio
+import socket
+import struct
+import threading
+import zlib
+
+import pytest
+
+from async_ipc_client import AsyncIPCClient
+from Compression import (
+    CODECS,
+    COMPRESSED_FLAG,
+    COMPRESSED_HEAD_STRUCT,
+    FrameCompressor,
+    LZ4Codec,
+    ZlibCodec,
+    decompress_frame,
+)
+from Handshake import CAP_COMPRESS
+from ipc_client import MAX_FRAME_SIZE, IPCClient
+from SharedMemory import SHM_FRAME
+from StandInEngine import StandInEngine
+
+FRAME = struct.pack("<I4x", 0) + bytes(range(64)) * 256
+
+
+@pytest.mark.parametrize("codec_id", [ZlibCodec.id, LZ4Codec.id])
+def test_codec_round_trip(codec_id):
+    if codec_id == LZ4Codec.id:
+        pytest.importorskip("lz4")
+    codec = CODECS[codec_id]
+    compressed = codec.compress(FRAME)
+
+    assert len(compressed) < len(FRAME)
+    body = COMPRESSED_HEAD_STRUCT.pack(codec_id, len(FRAME)) + compressed
+    assert decompress_frame(body, MAX_FRAME_SIZE) == FRAME
+
+
+@pytest.mark.parametrize("codec_id", [ZlibCodec.id, LZ4Codec.id])
+def test_frames_compressed_both_ways(codec_id):
+    if codec_id == LZ4Codec.id:
+        pytest.importorskip("lz4")
+    engine = StandInEngine(
+        host="127.0.0.1", compressor=FrameCompressor(CODECS[codec_id], threshold=0)
+    )
+    commands = []
+
+    def loop():
+        engine.accept()
+        for _ in range(3):
+            echoed = engine.serve_frame(FRAME)
+            if echoed is None:
+                return
+            commands.append(bytes(echoed))
+        engine.serve_frame()
+
+    thread = threading.Thread(target=loop, daemon=True)
+    thread.start()
+    compressor = FrameCompressor(CODECS[codec_id], threshold=0)
+    client = IPCClient(
+        features=CAP_COMPRESS,
+        host="127.0.0.1",
+        port=engine.port,
+        compressor=compressor,
+    )
+    client.connect()
+    assert client.capabilities == CAP_COMPRESS
+    for _ in range(3):
+        frame = client._pending_frame or client.read_frame()
+        client._pending_frame = None
+        assert bytes(frame["events_blob"]) == FRAME
+        client.write_frame(FRAME)
+    client.disconnect()
+    thread.join(timeout=5)
+    engine.close()
+
+    assert commands == [FRAME] * 3
+    assert compressor.bytes_saved > 0 and engine.compressor.bytes_saved > 0
+
+
+def test_decompress_refuses_oversized_frames(capsys):
+    body = COMPRESSED_HEAD_STRUCT.pack(ZlibCodec.id, 1024) + zlib.compress(FRAME)
+    assert decompress_frame(body, 512) is None
+    assert "too large" in capsys.readouterr().err
+
+    # Claims 1 KB but inflates to more: stopped at 1 KB, then refused
+    assert decompress_frame(body, MAX_FRAME_SIZE) is None
+    assert "zlib decompression failed" in capsys.readouterr().err
+
+
+@pytest.fixture
+def sends_head(tmp_path):
+    """A server on a UNIX socket that sends one frame head, then waits."""
+    path = str(tmp_path / "raw.socket")
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(path)
+    server.listen(1)
+    peers = []
+
+    def start(length):
+        def send():
+            peer, _ = server.accept()
+            peers.append(peer)
+            peer.sendall(struct.pack("<Ld", length, 0.0))
+
+        threading.Thread(target=send, daemon=True).start()
+        return path
+
+    yield start
+    for peer in peers:
+        peer.close()
+    server.close()
+
+
+@pytest.mark.parametrize(
+    "length", [SHM_FRAME, COMPRESSED_FLAG | 64, MAX_FRAME_SIZE + 1]
+)
+def test_unagreed_lengths_are_refused(sends_head, capsys, length):
+    client = IPCClient(path=sends_head(length))
+    client.connect()
+
+    assert client.read_frame() is None
+    assert "wasn't agreed" in capsys.readouterr().err
+    client.disconnect()
+
+
+@pytest.mark.parametrize(
+    "length", [SHM_FRAME, COMPRESSED_FLAG | 64, MAX_FRAME_SIZE + 1]
+)
+def test_unagreed_lengths_are_refused_async(sends_head, capsys, length):
+    async def read():
+        client = AsyncIPCClient(path=sends_head(length))
+        await client.connect()
+        frame = await client.read_frame()
+        await client.disconnect()
+        return frame
+
+    assert asyncio.run(read()) is None
+    assert "wasn't agreed" in capsys.readouterr().err
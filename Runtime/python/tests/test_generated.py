@@ -0,0 +1,47 @@
+"""The generated code is reproducible and the runtime copies match it."""
+
+import filecmp
+import os
+import shutil
+import subprocess
+
+import pytest
+
+import generated_conformance
+
+data_dir = os.path.join(
+    os.path.dirname(os.path.dirname(generated_conformance.runtime_dir)),
+    "Engine",
+    "Data",
+)
+
+
+@pytest.mark.parametrize("module", sorted(generated_conformance.COPIES))
+def test_runtime_copy_matches_generated(module):
+    problems, count = generated_conformance.check_copy(
+        module, generated_conformance.COPIES[module]
+    )
+    assert problems == []
+    assert count > 0
+
+
+def test_generate_php_reproduces_out(tmp_path):
+    php = shutil.which("php")
+    if php is None:
+        pytest.skip("php is not installed")
+
+    for name in ("generate.php", "LanguageAdapter.php", "AdapterHelpers.php"):
+        shutil.copy(os.path.join(data_dir, name), tmp_path)
+    shutil.copy(os.path.join(data_dir, "structs.json"), tmp_path)
+    shutil.copytree(os.path.join(data_dir, "adapters"), tmp_path / "adapters")
+    subprocess.run(
+        [php, str(tmp_path / "generate.php")], check=True, capture_output=True
+    )
+
+    out_dir = os.path.join(data_dir, "out")
+    for language in sorted(os.listdir(tmp_path / "out")):
+        for name in sorted(os.listdir(tmp_path / "out" / language)):
+            generated = tmp_path / "out" / language / name
+            assert filecmp.cmp(
+                generated, os.path.join(out_dir, language, name), shallow=False
+            ), f"out/{language}/{name} is not what generate.php writes"
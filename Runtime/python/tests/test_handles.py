@@ -0,0 +1,124 @@
+"""Entity handles stay unique when sprites are restored by Phrost_Wake."""
+
+import pickle
+
+from ChannelPacker import ChannelPacker
+from Channels import Channels
+from Events import Events
+from HandleAllocator import HandleAllocator
+from PackFormat import PackFormat
+from Sprite import Sprite
+
+
+class FakeRenderer:
+    """The engine's bindHandle: a handle moves off its previous owner."""
+
+    def __init__(self):
+        self.owner = {}
+        self.positions = {}
+
+    def run(self, packer):
+        stream = packer.channel(Channels.RENDERER).finalize()
+        for event in PackFormat.unpack(stream):
+            kind = event["type"]
+            if kind == Events.SPRITE_BIND_HANDLE:
+                ids = (event["id1"], event["id2"])
+                for handle, owner in list(self.owner.items()):
+                    if owner == ids:
+                        del self.owner[handle]
+                self.owner[event["handle"]] = ids
+            elif kind == Events.SPRITE_MOVE_HANDLE:
+                ids = self.owner[event["handle"]]
+                self.positions[ids] = event["positionX"]
+            elif kind in (Events.SPRITE_ADD, Events.SPRITE_MOVE):
+                self.positions[(event["id1"], event["id2"])] = event["positionX"]
+
+
+def spawn(world, first_id, count):
+    for i in range(first_id, first_id + count):
+        sprite = Sprite(i, 0)
+        sprite.set_position(float(i), 0.0, 0.0)
+        world[i] = sprite
+
+
+def frame(world, engine, handles):
+    packer = ChannelPacker(sprite_handles=handles)
+    for sprite in world.values():
+        sprite.pack_dirty_events(packer)
+    if engine is not None:
+        engine.run(packer)
+    return packer
+
+
+def move_all(world, offset):
+    for i, sprite in world.items():
+        sprite.set_position(i + offset, 0.0, 0.0)
+
+
+def test_sleep_wake_spawn_has_no_collisions():
+    engine = FakeRenderer()
+    handles = HandleAllocator()
+    world = {}
+    spawn(world, 0, 4)
+    frame(world, engine, handles)
+    move_all(world, 0.5)
+    frame(world, engine, handles)
+
+    data = pickle.dumps(world)
+    # A new logic process: a new connection, and a new allocator
+    handles = HandleAllocator()
+    world = pickle.loads(data)
+    assert all(sprite.handle is None for sprite in world.values())
+
+    spawn(world, 10, 4)
+    move_all(world, 0.25)
+    frame(world, engine, handles)
+
+    bound = [sprite.handle for sprite in world.values()]
+    assert len(set(bound)) == len(bound)
+    assert {engine.owner[sprite.handle] for sprite in world.values()} == set(
+        (i, 0) for i in world
+    )
+    # Every move, restored or new, reached the sprite it was meant for
+    for i in world:
+        assert engine.positions[(i, 0)] == i + 0.25
+
+
+def test_without_handles_sprites_use_ids():
+    world = {}
+    spawn(world, 0, 2)
+    frame(world, None, HandleAllocator())
+
+    world = pickle.loads(pickle.dumps(world))
+    move_all(world, 0.5)
+    packer = frame(world, None, None)
+
+    events = PackFormat.unpack(packer.channel(Channels.RENDERER).finalize())
+    assert [event["type"] for event in events] == [Events.SPRITE_MOVE] * 2
+
+
+def test_new_allocator_rebinds():
+    engine = FakeRenderer()
+    world = {}
+    spawn(world, 0, 2)
+    frame(world, engine, HandleAllocator())
+
+    # Reconnected: the pool hands out a new allocator
+    move_all(world, 0.5)
+    frame(world, engine, HandleAllocator())
+    assert sorted(engine.owner) == [0, 1]
+    assert engine.positions == {(0, 0): 0.5, (1, 0): 1.5}
+
+
+def test_remove_returns_the_handle():
+    handles = HandleAllocator()
+    world = {}
+    spawn(world, 0, 2)
+    frame(world, None, handles)
+    assert len(handles) == 2
+
+    world.pop(0).remove(ChannelPacker())
+    assert len(handles) == 1
+    spawn(world, 5, 1)
+    frame(world, None, handles)
+    assert sorted(sprite.handle for sprite in world.values()) == [0, 1]
@@ -0,0 +1,114 @@
+"""The handshake switches features on per client, and falls back cleanly."""
+
+import threading
+
+import pytest
+
+from CommandPacker import CommandPacker
+from Handshake import CAP_ALL, CAP_BATCH
+from ipc_client import IPCClient
+from PackFormat import PackFormat
+from StandInEngine import StandInEngine
+
+
+def event_frame(x):
+    packer = CommandPacker()
+    packer.sprite_move(1, 0, x, 0.0, 0.0)
+    return packer.finalize()
+
+
+@pytest.fixture
+def serve(tmp_path):
+    """Starts a stand-in engine that sends `frames`, then empty frames."""
+    started = []
+
+    def start(frames=(), **options):
+        path = str(tmp_path / f"engine{len(started)}.socket")
+        engine = StandInEngine(path, **options)
+
+        def loop():
+            engine.accept()
+            for blob in frames:
+                if engine.serve_frame(blob) is None:
+                    return
+            while engine.serve_frame() is not None:
+                pass
+
+        thread = threading.Thread(target=loop, daemon=True)
+        thread.start()
+        started.append((engine, thread))
+        return path
+
+    yield start
+    for engine, thread in started:
+        thread.join(timeout=5)
+        engine.close()
+
+
+def assert_base_format(pool):
+    assert not pool.batch
+    assert not pool.f32
+    assert pool.sprite_handles is None
+    assert pool.body_handles is None
+    packer = pool.channel_packer()
+    assert not packer.f32 and packer.sprite_handles is None
+
+
+def test_default_offers_nothing(serve):
+    client = IPCClient(path=serve())
+    client.connect()
+    assert client.capabilities == 0
+    assert_base_format(client.pool)
+    client.disconnect()
+
+
+def test_agreed_features_reach_the_pool_and_reset(serve):
+    client = IPCClient(features=CAP_ALL, path=serve())
+    client.connect()
+    assert client.capabilities == CAP_ALL
+    pool = client.pool
+    assert pool.batch and pool.f32
+    assert pool.sprite_handles is not None and pool.body_handles is not None
+    packer = pool.channel_packer()
+    assert packer.batch and packer.f32
+    assert packer.sprite_handles is pool.sprite_handles
+
+    client.disconnect()
+    assert client.capabilities == 0
+    assert_base_format(pool)
+
+
+def test_engine_agrees_a_subset(serve):
+    client = IPCClient(features=CAP_ALL, path=serve(capabilities=CAP_BATCH))
+    client.connect()
+    assert client.capabilities == CAP_BATCH
+    assert client.pool.batch
+    assert not client.pool.f32 and client.pool.sprite_handles is None
+    client.disconnect()
+
+
+def test_old_engine_falls_back_without_losing_events(serve):
+    path = serve([event_frame(1.0), event_frame(2.0)], handshake=False)
+    client = IPCClient(features=CAP_ALL, path=path)
+    client.connect()
+    assert client.capabilities == 0
+    assert_base_format(client.pool)
+
+    # The hello was taken as a reply, so the two frames are merged
+    events = PackFormat.unpack(client._pending_frame["events_blob"])
+    assert [event["positionX"] for event in events] == [1.0, 2.0]
+    client.disconnect()
+
+
+def test_reconnect_to_old_engine_switches_features_off(serve):
+    client = IPCClient(features=CAP_ALL, path=serve())
+    client.connect()
+    handles = client.pool.sprite_handles
+    assert handles is not None
+    client.disconnect()
+
+    client.path = serve(handshake=False)
+    client.connect()
+    assert client.capabilities == 0
+    assert_base_format(client.pool)
+    client.disconnect()
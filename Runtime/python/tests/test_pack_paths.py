@@ -0,0 +1,76 @@
+"""add(), the typed methods and add_many() write the same bytes."""
+
+import pytest
+
+import CommandPacker as command_packer_module
+from CommandPacker import CommandPacker
+from dtype_conformance import sample_values
+from Events import Events
+from PackFormat import PackFormat
+
+FIXED_EVENTS = [
+    event
+    for event in Events
+    if event not in CommandPacker._DYNAMIC_EVENTS
+    and event not in PackFormat._VARIABLE_LENGTH_EVENTS
+]
+MODES = [{}, {"batch": True}, {"coalesce": True}]
+ROWS = 3
+
+
+def rows_for(event):
+    """ROWS distinct rows of sample values, each for a different entity."""
+    values = sample_values(PackFormat._PAYLOAD_STRUCT_MAP[event].format)
+    rows = []
+    for i in range(ROWS):
+        row = list(values)
+        if PackFormat._EVENT_KEY_MAP[event][:1] == ["id1"]:
+            row[0] = 100 + i
+        rows.append(row)
+    return rows
+
+
+def pack_with_add(event, rows, mode):
+    packer = CommandPacker(**mode)
+    for row in rows:
+        packer.add(event, row)
+    return packer.finalize()
+
+
+def pack_with_method(event, rows, mode):
+    packer = CommandPacker(**mode)
+    method = getattr(packer, event.name.lower())
+    for row in rows:
+        method(*row)
+    return packer.finalize()
+
+
+def pack_with_add_many(event, rows, mode):
+    packer = CommandPacker(**mode)
+    keys = PackFormat._EVENT_KEY_MAP[event]
+    if not keys:
+        for _ in rows:
+            packer.add_many(event)
+    else:
+        columns = dict(zip(keys, (list(column) for column in zip(*rows))))
+        packer.add_many(event, **columns)
+    return packer.finalize()
+
+
+@pytest.mark.parametrize("mode", MODES, ids=["plain", "batch", "coalesce"])
+@pytest.mark.parametrize("event", FIXED_EVENTS, ids=lambda event: event.name)
+def test_pack_paths_agree(event, mode):
+    rows = rows_for(event)
+    expected = pack_with_add(event, rows, mode)
+    assert expected
+    assert pack_with_method(event, rows, mode) == expected
+    if PackFormat._EVENT_KEY_MAP[event]:
+        assert pack_with_add_many(event, rows, mode) == expected
+
+
+@pytest.mark.parametrize("mode", MODES[:2], ids=["plain", "batch"])
+def test_add_many_without_numpy(monkeypatch, mode):
+    rows = rows_for(Events.SPRITE_MOVE)
+    expected = pack_with_add_many(Events.SPRITE_MOVE, rows, mode)
+    monkeypatch.setattr(command_packer_module, "np", None)
+    assert pack_with_add_many(Events.SPRITE_MOVE, rows, mode) == expected
@@ -0,0 +1,13 @@
+"""The Python packer writes the same bytes as the PHP runtime's packer."""
+
+import shutil
+
+import pytest
+
+import php_conformance
+
+
+def test_matches_php_packer():
+    if shutil.which("php") is None:
+        pytest.skip("php is not installed")
+    assert php_conformance.main() == 0
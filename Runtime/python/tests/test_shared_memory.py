@@ -0,0 +1,92 @@
+"""Shared-memory regions are created new under a random name, and mapped safely."""
+
+import os
+import stat
+import threading
+
+import pytest
+
+import SharedMemory
+from Handshake import CAP_SHM
+from ipc_client import IPCClient
+from SharedMemory import SharedRegion, new_region_name, region_paths
+from StandInEngine import StandInEngine
+
+
+@pytest.fixture
+def shm_dir(tmp_path, monkeypatch):
+    directory = tmp_path / "shm"
+    directory.mkdir()
+    monkeypatch.setattr(SharedMemory, "SHM_DIR", str(directory))
+    return directory
+
+
+def test_region_names_are_random_and_checked():
+    assert new_region_name() != new_region_name()
+    events_path, commands_path = region_paths(new_region_name())
+    assert events_path.endswith(".events") and commands_path.endswith(".commands")
+    for name in ("", "PhrostEngine", "../" + "0" * 29, "A" * 32):
+        with pytest.raises(ValueError):
+            region_paths(name)
+
+
+def test_create_never_reuses_a_file(shm_dir):
+    target = shm_dir / "victim"
+    target.write_bytes(b"keep")
+    events_path, _ = region_paths(new_region_name())
+    os.symlink(target, events_path)
+
+    with pytest.raises(FileExistsError):
+        SharedRegion(events_path, 64, create=True)
+    assert target.read_bytes() == b"keep"
+
+
+def test_map_refuses_a_symlink(shm_dir):
+    region = SharedRegion(str(shm_dir / "region"), 64, create=True)
+    link = shm_dir / "link"
+    os.symlink(region.path, link)
+
+    with pytest.raises(OSError):
+        SharedRegion(str(link))
+    region.close(unlink=True)
+
+
+def test_frames_pass_through_private_regions(shm_dir, tmp_path):
+    path = str(tmp_path / "engine.socket")
+    engine = StandInEngine(path, slot_size=4096)
+    blobs = [bytes(8) + bytes([seed]) * 100 for seed in (1, 2, 3)]
+    commands = []
+    regions = []
+
+    def loop():
+        engine.accept()
+        for blob in blobs:
+            echoed = engine.serve_frame(blob)
+            if echoed is None:
+                return
+            commands.append(bytes(echoed))
+            regions.append(sorted(os.listdir(shm_dir)))
+        engine.serve_frame()
+
+    thread = threading.Thread(target=loop, daemon=True)
+    thread.start()
+    client = IPCClient(features=CAP_SHM, path=path)
+    client.connect()
+    assert client.capabilities == CAP_SHM
+    for blob in blobs:
+        frame = client._pending_frame or client.read_frame()
+        client._pending_frame = None
+        assert bytes(frame["events_blob"]) == blob
+        client.write_frame([frame["events_blob"]])
+    client.disconnect()
+    thread.join(timeout=5)
+
+    assert commands == blobs
+    (files,) = set(map(tuple, regions))
+    assert len(files) == 2 and not any("engine" in name for name in files)
+    for name in files:
+        info = os.lstat(shm_dir / name)
+        assert stat.S_ISREG(info.st_mode) and stat.S_IMODE(info.st_mode) == 0o600
+
+    engine.close()
+    assert os.listdir(shm_dir) == []
@@ -0,0 +1,67 @@
+"""unpack() returns the same dicts as every other way of decoding a frame."""
+
+from CommandPacker import CommandPacker
+from Events import Events
+from PackFormat import PackFormat
+
+
+def pack_frame(packer):
+    """A frame with string tails, a batch and plain fixed-size events."""
+    packer.sprite_texture_load(1, 0, b"/assets/wabbit_alpha.png")
+    packer.sprite_move(1, 0, 1.0, 2.0, 3.0)
+    packer.sprite_move(2, 0, 4.0, 5.0, 6.0)
+    packer.text_add(3, 0, 0.0, 0.0, 0.0, 255, 255, 255, 255, 16.0, b"font.ttf", b"hi")
+    packer.text_set_string(3, 0, b"bye")
+    packer.sprite_scale(1, 0, 2.0, 2.0, 1.0)
+    return packer.finalize()
+
+
+def test_texture_load_keeps_its_dict_shape():
+    (event,) = PackFormat.unpack(
+        pack_frame(CommandPacker()), {Events.SPRITE_TEXTURE_LOAD}
+    )
+
+    assert event == {
+        "type": Events.SPRITE_TEXTURE_LOAD.value,
+        "timestamp": event["timestamp"],
+        "id1": 1,
+        "id2": 0,
+        "filename": "/assets/wabbit_alpha.png",
+    }
+
+
+def test_text_events_keep_their_lengths():
+    events = PackFormat.unpack(pack_frame(CommandPacker()))
+
+    assert events[3]["fontPathLength"] == 8 and events[3]["text"] == "hi"
+    assert events[4]["textLength"] == 3 and events[4]["text"] == "bye"
+
+
+def test_unpack_matches_views_and_records():
+    for packer in (CommandPacker(), CommandPacker(batch=True)):
+        stream = pack_frame(packer)
+        events = PackFormat.unpack(stream)
+
+        assert len(events) == 6
+        assert events == [view.to_dict() for view in PackFormat.unpack_views(stream)]
+        assert events == [
+            record.to_dict() for record in PackFormat.unpack_records(stream)
+        ]
+
+
+def test_unpack_filters_wanted():
+    stream = pack_frame(CommandPacker(batch=True))
+
+    moves = PackFormat.unpack(stream, {Events.SPRITE_MOVE})
+
+    assert [event["id1"] for event in moves] == [1, 2]
+    assert {event["type"] for event in moves} == {Events.SPRITE_MOVE.value}
+
+
+def test_unpack_stops_at_a_truncated_event(capsys):
+    stream = pack_frame(CommandPacker())
+
+    events = PackFormat.unpack(stream[:-8])
+
+    assert len(events) == 5
+    assert "Not enough data" in capsys.readouterr().err